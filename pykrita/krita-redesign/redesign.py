@@ -20,6 +20,12 @@ from .nuTools.nttoolbox import ntToolBox
 from .nuTools.nttooloptions import ntToolOptions
 from . import variables
 from PyQt5.QtWidgets import QMessageBox
+
+try:
+    from startup_timer import mark as startup_mark
+except ImportError:
+    def startup_mark(plugin, phase=None):
+        pass
     
 class Redesign(Extension):
 
@@ -35,6 +41,7 @@ class Redesign(Extension):
         super().__init__(parent)
 
     def setup(self):
+        startup_mark("krita-redesign")
         if Application.readSetting("Redesign", "usesFlatTheme", "true") == "true":
             self.usesFlatTheme = True
 
@@ -50,7 +57,10 @@ class Redesign(Extension):
         if Application.readSetting("Redesign", "usesNuToolOptions", "true") == "true":
             self.usesNuToolOptions = True
 
+        startup_mark("krita-redesign", "setup")
+
     def createActions(self, window):
+        startup_mark("krita-redesign")
         actions = []
 
         actions.append(window.createAction("toolbarBorder", "Borderless Toolbars", ""))
@@ -86,7 +96,10 @@ class Redesign(Extension):
         actions[3].toggled.connect(self.nuToolboxToggled)
         actions[4].toggled.connect(self.nuToolOptionsToggled)
 
+        startup_mark("krita-redesign", "createActions")
+
         variables.buildFlatTheme()
+        startup_mark("krita-redesign", "buildFlatTheme")
 
         if (self.usesNuToolOptions and
             Application.readSetting("", "ToolOptionsInDocker", "false") == "true"):
@@ -94,8 +107,10 @@ class Redesign(Extension):
 
         if self.usesNuToolbox: 
             self.ntTB = ntToolBox(window)
+        startup_mark("krita-redesign", "nuTools")
 
         self.rebuildStyleSheet(window.qwindow())
+        startup_mark("krita-redesign", "rebuildStyleSheet")
 
         #self.nuToolOptionsToggled(self.usesNuToolOptions)
         #self.nuToolOptionsToggled(self.usesNuToolOptions)
@@ -22,6 +22,14 @@ import random
 import os
 import time
 import sys
+import struct
+import array
+import bisect
+import hashlib
+import html
+import zipfile
+import json
+import ast
 # Krita Modules
 from krita import *
 # PyQt5 Modules
@@ -50,12 +58,20 @@ from .pigment_o_modulo import (
     Panel_IMG,
     Channel_Linear,
     Channel_Interval,
+    History_Model,
     Clicks,
     Mixer_Linear,
     Dialog_UI,
     Dialog_CR,
+    Thread_Range,
     )
 from .pigment_o_extension import PigmentO_Extension
+from .pigment_o_profiler import profiler, Profiled
+try:
+    from startup_timer import mark as Startup_Mark
+except ImportError:
+    def Startup_Mark(plugin, phase = None):
+        pass
 
 #//
 #\\ Global Variables ###########################################################
@@ -65,6 +81,9 @@ DOCKER_NAME = "Pigment.O"
 check_timer = 30  # 1000 = 1 SECOND (Zero will Disable checks)
 # Pigment.O Version Date
 pigment_o_version = "2022_04_20"
+# Settings
+settings_format = 1 # Layout of the settings blob
+settings_delay = 1000 # Milliseconds without changes before saving
 
 # Color Space Constants
 k_AAA = 255
@@ -302,6 +321,79 @@ half = 0.5
 unit = 1
 two = 2
 max_val = 16777215
+# Panel Fields
+field_grid = 64 # Samples per side of the panel fields before smooth scaling
+field_draft = 16 # Samples per side of the panel fields while dragging
+field_limit = 360 # Cached field images
+gam_ring_step = 10 # Degrees between GAM hue ring samples (divisor of 360)
+gam_ring_draft = 30 # Degrees between GAM hue ring samples while dragging
+hexagon_limit = 1000 # Cached UVD hexagon geometries by depth
+# Selection
+selection_band = 256 # Projection rows read per band
+# History
+history_limit = 200 # Colors kept in the history
+# Profiler
+profiler_refresh = 1000 # Milliseconds between profiler statistics updates
+# Quality
+quality_delay = 250 # Milliseconds without a held mouse button before a drag is refined
+# Display LUT
+display_lut_size = 17 # Samples per side of the display conversion cube
+display_lut_chunk = 256 # Samples converted by Krita per build step
+display_lut_format = 1 # Layout of the cached display LUT files
+# OK Spaces
+ok_cusp_steps = 360 # Hues sampled for the OKHSV and OKHSL gamut cusp table
+ok_gray = 1e-6 # OK chroma and lightness distance treated as achromatic
+ok_ab = 0.4 # OKLAB a and b reach at the ends of their channels
+ok_c = 0.4 # OKLCH chroma at the end of its channel
+# Luma Lock
+luma_lock_steps = 360 # Hues sampled for the locked luma offsets (multiple of 6)
+# Swatches
+swatch_limit = 1000 # Swatches generated per palette
+swatch_hues = 40 # Hues of the RAMP palette
+swatch_columns = 16 # Columns of the exported Krita palettes
+# Harmony Rules
+# Per rule and active slot, the delta divisor (None keeps the delta) and the five nodes as
+# (origin, offset, delta steps, loop, channels) where the origin "A" is the live angle, "O" the
+# 3rd node angle, "O1" the 3rd node angle plus one turn and "H" the 3rd node angle as it is.
+# Channels "LIVE" is the active color, "EDIT" keeps the node channels while editing and "SPACE"
+# takes the channels of the active color.
+harmony_rules = {
+    "Monochromatic" : {
+        1 : [None, [("A", 0, 0, False, "LIVE"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "EDIT")]],
+        2 : [None, [("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "LIVE"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "EDIT")]],
+        3 : [None, [("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "LIVE"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "EDIT")]],
+        4 : [None, [("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "LIVE"), ("A", 0, 0, False, "EDIT")]],
+        5 : [None, [("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "LIVE")]],
+        },
+    "Complemantary" : {
+        1 : [None, [("A", 0, 0, False, "LIVE"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "EDIT"), ("A", 0.5, 0, True, "EDIT"), ("A", 0.5, 0, True, "EDIT")]],
+        2 : [None, [("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "LIVE"), ("A", 0, 0, False, "EDIT"), ("A", 0.5, 0, True, "EDIT"), ("A", 0.5, 0, True, "EDIT")]],
+        3 : [None, [("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "LIVE"), ("A", 0.5, 0, True, "EDIT"), ("A", 0.5, 0, True, "EDIT")]],
+        4 : [None, [("A", 0.5, 0, True, "EDIT"), ("A", 0.5, 0, True, "EDIT"), ("A", 0.5, 0, True, "EDIT"), ("A", 0, 0, False, "LIVE"), ("A", 0, 0, False, "EDIT")]],
+        5 : [None, [("A", 0.5, 0, True, "EDIT"), ("A", 0.5, 0, True, "EDIT"), ("A", 0.5, 0, True, "EDIT"), ("A", 0, 0, False, "EDIT"), ("A", 0, 0, False, "LIVE")]],
+        },
+    "Analogous" : {
+        1 : [2, [("O", 0, -2, True, "SPACE"), ("O", 0, -1, True, "EDIT"), ("H", 0, 0, False, "EDIT"), ("O", 0, 1, True, "EDIT"), ("O", 0, 2, True, "EDIT")]],
+        2 : [1, [("O", 0, -2, True, "EDIT"), ("O", 0, -1, True, "SPACE"), ("H", 0, 0, False, "EDIT"), ("O", 0, 1, True, "EDIT"), ("O", 0, 2, True, "EDIT")]],
+        3 : [None, [("A", 0, -2, True, "EDIT"), ("A", 0, -1, True, "EDIT"), ("A", 0, 0, False, "LIVE"), ("A", 0, 1, True, "EDIT"), ("A", 0, 2, True, "EDIT")]],
+        4 : [1, [("O", 0, -2, True, "EDIT"), ("O", 0, -1, True, "EDIT"), ("H", 0, 0, False, "EDIT"), ("O", 0, 1, True, "SPACE"), ("O", 0, 2, True, "EDIT")]],
+        5 : [2, [("O", 0, -2, True, "EDIT"), ("O", 0, -1, True, "EDIT"), ("H", 0, 0, False, "EDIT"), ("O", 0, 1, True, "EDIT"), ("O", 0, 2, True, "SPACE")]],
+        },
+    "Split Complemantary" : {
+        1 : [1, [("O1", 0, -1, True, "SPACE"), ("O1", 0, -1, True, "EDIT"), ("H", 0, 0, False, "EDIT"), ("O1", 0, 1, True, "EDIT"), ("O1", 0, 1, True, "EDIT")]],
+        2 : [1, [("O1", 0, -1, True, "EDIT"), ("O1", 0, -1, True, "SPACE"), ("H", 0, 0, False, "EDIT"), ("O1", 0, 1, True, "EDIT"), ("O1", 0, 1, True, "EDIT")]],
+        3 : [None, [("A", 0, -1, True, "EDIT"), ("A", 0, -1, True, "EDIT"), ("A", 0, 0, False, "SPACE"), ("A", 0, 1, True, "EDIT"), ("A", 0, 1, True, "EDIT")]],
+        4 : [1, [("O1", 0, -1, True, "EDIT"), ("O1", 0, -1, True, "EDIT"), ("H", 0, 0, False, "EDIT"), ("O1", 0, 1, True, "SPACE"), ("O1", 0, 1, True, "EDIT")]],
+        5 : [1, [("O1", 0, -1, True, "EDIT"), ("O1", 0, -1, True, "EDIT"), ("H", 0, 0, False, "EDIT"), ("O1", 0, 1, True, "EDIT"), ("O1", 0, 1, True, "SPACE")]],
+        },
+    "Double Split Complemantary" : {
+        1 : [1, [("O", 0, -1, True, "SPACE"), ("O", -0.5, 1, True, "EDIT"), ("H", 0, 0, False, "EDIT"), ("O", 0.5, -1, True, "EDIT"), ("O", 0, 1, True, "EDIT")]],
+        2 : [1, [("O", 0.5, 1, True, "SPACE"), ("O", 0, -1, True, "EDIT"), ("H", 0, 0, False, "EDIT"), ("O", 0, 1, True, "EDIT"), ("O", 0.5, -1, True, "EDIT")]],
+        3 : [None, [("A", 0, -1, True, "EDIT"), ("A", 0.5, 1, True, "EDIT"), ("A", 0, 0, False, "SPACE"), ("A", -0.5, -1, True, "EDIT"), ("A", 0, 1, True, "EDIT")]],
+        4 : [1, [("O", -0.5, 1, True, "SPACE"), ("O", 0, -1, True, "EDIT"), ("H", 0, 0, False, "EDIT"), ("O", 0, 1, True, "EDIT"), ("O", -0.5, -1, True, "EDIT")]],
+        5 : [1, [("O", 0, -1, True, "SPACE"), ("O", -0.5, 1, True, "EDIT"), ("H", 0, 0, False, "EDIT"), ("O", 0.5, -1, True, "EDIT"), ("O", 0, 1, True, "EDIT")]],
+        },
+    }
 
 #//
 
@@ -317,30 +409,51 @@ class PigmentO_Docker(DockWidget):
         super(PigmentO_Docker, self).__init__()
 
         # Construct
+        Startup_Mark("pigment_o")
         self.Variables()
+        Startup_Mark("pigment_o", "Variables")
         self.User_Interface()
+        Startup_Mark("pigment_o", "User_Interface")
         self.Connects()
+        Startup_Mark("pigment_o", "Connects")
         self.Menu_Shrink()
+        Startup_Mark("pigment_o", "Menu_Shrink")
 
         # Modules and Connections
         self.Header()
+        Startup_Mark("pigment_o", "Header")
         self.Harmonys()
+        Startup_Mark("pigment_o", "Harmonys")
         self.Color_ofthe_Day()
+        Startup_Mark("pigment_o", "Color_ofthe_Day")
         self.Panels()
+        Startup_Mark("pigment_o", "Panels")
         self.Gamut()
+        Startup_Mark("pigment_o", "Gamut")
         self.Dots()
+        Startup_Mark("pigment_o", "Dots")
         self.Object()
+        Startup_Mark("pigment_o", "Object")
         self.Images()
+        Startup_Mark("pigment_o", "Images")
         self.Channels()
+        Startup_Mark("pigment_o", "Channels")
         self.Palette()
+        Startup_Mark("pigment_o", "Palette")
         self.Mixers()
+        Startup_Mark("pigment_o", "Mixers")
         self.History()
+        Startup_Mark("pigment_o", "History")
         self.Style()
+        Startup_Mark("pigment_o", "Style")
         self.Extension()
+        Startup_Mark("pigment_o", "Extension")
         self.Pulse()
+        Startup_Mark("pigment_o", "Pulse")
 
         # Settings
         self.Version_Settings()
+        Startup_Mark("pigment_o", "Version_Settings")
 
     def Variables(self):
         # State
@@ -392,6 +505,50 @@ class PigmentO_Docker(DockWidget):
         # Interface
         self.harmony_status = 0
         self.harmony_slot = zero
+        # Harmony Influenced by Kelvin (RGB, each slot is a view of one buffer)
+        self.har_kelvin = array.array("d", bytes(8 * 15))
+        view = memoryview(self.har_kelvin)
+        self.har_k1, self.har_k2, self.har_k3, self.har_k4, self.har_k5 = [view[i*3:i*3+3] for i in range(0, 5)]
+        # Display LUT
+        self.lut = None
+        self.lut_key = None
+        self.lut_build = None
+        self.lut_index = zero
+        self.lut_timer = None
+        # OKHSV and OKHSL Cusp Table
+        self.ok_cusp_table = None
+        # OKLCH, OKHSV and OKHSL Hue
+        self.angle_ok = 0
+        # Swatches
+        self.swatch_mode = "COTD"
+        self.swatch_colors = []
+        self.swatch_display = []
+        self.swatch_key = None
+        self.swatch_serial = 0
+        self.swatch_dirty = False
+        self.img_palette = []
+        # Luma Lock Offsets
+        self.luma_lock_key = None
+        self.luma_lock_aaa = 0
+        self.luma_lock_offsets = None
+        # Panel Field Cache
+        self.field_cache = {}
+        # Hue Ring Cache
+        self.ring_key = None
+        self.ring_colors = None
+        # Gamut Ring Cache
+        self.gam_ring_step = gam_ring_step
+        self.gam_ring_key = None
+        self.gam_ring = None
+        # Hexagon Geometry Cache
+        self.hexagon_d = None
+        self.hexagon_cache = {}
+        self.hexagon_red = {}
+        self.hexagon_axis = {}
+        self.uvd_points_key = None
+        self.ard_points_key = None
+        # Gamut Masks
+        self.gamut_masks = {}
     def User_Interface(self):
         # Operating System
         self.OS = str(QSysInfo.kernelType()) # WINDOWS=winnt & LINUX=linux
@@ -430,13 +587,16 @@ class PigmentO_Docker(DockWidget):
         self.dialog.har_rule.currentTextChanged.connect(self.HARMONY_Rule)
         self.dialog.har_edit.toggled.connect(self.HARMONY_Edit)
 
-        self.dialog.cotd_date.clicked.connect(self.Color_ofthe_Day)
+        self.dialog.cotd_date.clicked.connect(self.SWA_COTD)
+        self.dialog.swa_mode.currentTextChanged.connect(self.SWA_Mode)
+        self.dialog.swa_export.clicked.connect(self.SWA_Export)
 
         self.dialog.pan_index.currentTextChanged.connect(self.Menu_PANEL)
         self.dialog.hue_secondary.currentTextChanged.connect(self.Menu_Hue_Secondary)
         self.dialog.gam_space.currentTextChanged.connect(self.GAM_Space)
         self.dialog.gam_shape.currentTextChanged.connect(self.GAM_Shape)
         self.dialog.gam_reset.clicked.connect(self.GAM_Reset)
+        self.dialog.gam_ring.valueChanged.connect(self.GAM_Ring_Step)
         self.dialog.dot_interpolation.currentTextChanged.connect(self.DOT_Interpolation)
         self.dialog.dot_resolution.currentTextChanged.connect(self.DOT_Resolution)
         self.dialog.dot_set.toggled.connect(self.DOT_SET)
@@ -463,6 +623,10 @@ class PigmentO_Docker(DockWidget):
         self.dialog.hlab.toggled.connect(self.Menu_HLAB)
         self.dialog.lab.toggled.connect(self.Menu_LAB)
         self.dialog.lch.toggled.connect(self.Menu_LCH)
+        self.dialog.oklab.toggled.connect(self.Menu_OKLAB)
+        self.dialog.oklch.toggled.connect(self.Menu_OKLCH)
+        self.dialog.okhsv.toggled.connect(self.Menu_OKHSV)
+        self.dialog.okhsl.toggled.connect(self.Menu_OKHSL)
         # Dialog 4
         self.dialog.display_values.toggled.connect(self.Menu_Display_Value)
         self.dialog.display_hex.toggled.connect(self.Menu_Display_Hex)
@@ -487,6 +651,10 @@ class PigmentO_Docker(DockWidget):
         # Dialog 8
         self.dialog.release.toggled.connect(self.Menu_Release)
         self.dialog.inaccurate.toggled.connect(self.Menu_Inaccurate)
+        self.dialog.sel_range.toggled.connect(self.Menu_Selection_Range)
+        self.dialog.sel_fuzziness.valueChanged.connect(self.Menu_Selection_Fuzziness)
+        self.dialog.profiler.toggled.connect(self.Menu_Profiler)
+        self.dialog.profiler_record.toggled.connect(self.Menu_Profiler_Record)
         # Dialog 9
         self.dialog.zzz.clicked.connect(self.Menu_COPYRIGHT)
 
@@ -548,6 +716,7 @@ class PigmentO_Docker(DockWidget):
     def Panels(self):
         # Panel SWA
         self.panel_swa = Panel_SWA(self.layout.panel_swa)
+        self.panel_swa.SIGNAL_APPLY.connect(self.SWA_Apply)
 
         # Panel UVD
         self.panel_uvd = Panel_UVD(self.layout.panel_uvd)
@@ -584,6 +753,14 @@ class PigmentO_Docker(DockWidget):
         self.panel_hcy.SIGNAL_HCY_4_VALUE.connect(self.Signal_HCY_4)
         self.panel_hcy.SIGNAL_HCY_4_RELEASE.connect(self.Pigment_Release)
         self.panel_hcy.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        self.panel_okhsv = Panel_HCY_4(self.layout.panel_okhsv)
+        self.panel_okhsv.SIGNAL_HCY_4_VALUE.connect(self.Signal_OKHSV_4)
+        self.panel_okhsv.SIGNAL_HCY_4_RELEASE.connect(self.Pigment_Release)
+        self.panel_okhsv.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        self.panel_okhsl = Panel_HCY_4(self.layout.panel_okhsl)
+        self.panel_okhsl.SIGNAL_HCY_4_VALUE.connect(self.Signal_OKHSL_4)
+        self.panel_okhsl.SIGNAL_HCY_4_RELEASE.connect(self.Pigment_Release)
+        self.panel_okhsl.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
 
         # Panel HUE Circle
         self.panel_hue_circle = Panel_HUE_Circle(self.layout.panel_hue_circle)
@@ -618,6 +795,8 @@ class PigmentO_Docker(DockWidget):
         self.panel_gam_polygon.SIGNAL_GAM_P_VALUE.connect(self.Signal_GAM_Polygon)
         self.panel_gam_polygon.SIGNAL_GAM_P_RELEASE.connect(self.Pigment_Release)
         self.panel_gam_polygon.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        # Krita Gamut Masks
+        self.GAM_Masks()
     def Dots(self):
         self.panel_dots = Panel_DOT(self.layout.panel_dot_mix)
         self.panel_dots.SIGNAL_DOT_COLOR.connect(self.Signal_DOT_Color)
@@ -799,6 +978,7 @@ class PigmentO_Docker(DockWidget):
         self.panel_img.SIGNAL_IMG_RELEASE.connect(self.Pigment_Release)
         self.panel_img.SIGNAL_SCAN_VAL.connect(self.Signal_Scan_Value)
         self.panel_img.SIGNAL_SCAN_MAX.connect(self.Pigment_Scan_Maximum)
+        self.panel_img.SIGNAL_IMG_PALETTE.connect(self.Signal_IMG_Palette)
     def Channels(self):
         #\\ Hex ################################################################
         self.layout.hex_string.returnPressed.connect(self.HEX_Code)
@@ -859,6 +1039,18 @@ class PigmentO_Docker(DockWidget):
         self.layout.lch_1_value.setMinimum(0)
         self.layout.lch_2_value.setMinimum(0)
         self.layout.lch_3_value.setMinimum(0)
+        self.layout.oklab_1_value.setMinimum(0)
+        self.layout.oklab_2_value.setMinimum(0)
+        self.layout.oklab_3_value.setMinimum(0)
+        self.layout.oklch_1_value.setMinimum(0)
+        self.layout.oklch_2_value.setMinimum(0)
+        self.layout.oklch_3_value.setMinimum(0)
+        self.layout.okhsv_1_value.setMinimum(0)
+        self.layout.okhsv_2_value.setMinimum(0)
+        self.layout.okhsv_3_value.setMinimum(0)
+        self.layout.okhsl_1_value.setMinimum(0)
+        self.layout.okhsl_2_value.setMinimum(0)
+        self.layout.okhsl_3_value.setMinimum(0)
 
         # Channels Range Maximum
         self.layout.aaa_1_value.setMaximum(k_AAA)
@@ -914,6 +1106,18 @@ class PigmentO_Docker(DockWidget):
         self.layout.lch_1_value.setMaximum(k_LCH)
         self.layout.lch_2_value.setMaximum(k_LCH)
         self.layout.lch_3_value.setMaximum(k_LCH)
+        self.layout.oklab_1_value.setMaximum(k_LLL)
+        self.layout.oklab_2_value.setMaximum(k_AB)
+        self.layout.oklab_3_value.setMaximum(k_AB)
+        self.layout.oklch_1_value.setMaximum(k_LLL)
+        self.layout.oklch_2_value.setMaximum(k_SVL)
+        self.layout.oklch_3_value.setMaximum(k_HUE)
+        self.layout.okhsv_1_value.setMaximum(k_HUE)
+        self.layout.okhsv_2_value.setMaximum(k_SVL)
+        self.layout.okhsv_3_value.setMaximum(k_SVL)
+        self.layout.okhsl_1_value.setMaximum(k_HUE)
+        self.layout.okhsl_2_value.setMaximum(k_SVL)
+        self.layout.okhsl_3_value.setMaximum(k_SVL)
 
         #//
         #\\ Modules ############################################################
@@ -971,6 +1175,18 @@ class PigmentO_Docker(DockWidget):
         self.lch_1_slider = Channel_Linear(self.layout.lch_1_slider)
         self.lch_2_slider = Channel_Linear(self.layout.lch_2_slider)
         self.lch_3_slider = Channel_Linear(self.layout.lch_3_slider)
+        self.oklab_1_slider = Channel_Linear(self.layout.oklab_1_slider)
+        self.oklab_2_slider = Channel_Linear(self.layout.oklab_2_slider)
+        self.oklab_3_slider = Channel_Linear(self.layout.oklab_3_slider)
+        self.oklch_1_slider = Channel_Linear(self.layout.oklch_1_slider)
+        self.oklch_2_slider = Channel_Linear(self.layout.oklch_2_slider)
+        self.oklch_3_slider = Channel_Linear(self.layout.oklch_3_slider)
+        self.okhsv_1_slider = Channel_Linear(self.layout.okhsv_1_slider)
+        self.okhsv_2_slider = Channel_Linear(self.layout.okhsv_2_slider)
+        self.okhsv_3_slider = Channel_Linear(self.layout.okhsv_3_slider)
+        self.okhsl_1_slider = Channel_Linear(self.layout.okhsl_1_slider)
+        self.okhsl_2_slider = Channel_Linear(self.layout.okhsl_2_slider)
+        self.okhsl_3_slider = Channel_Linear(self.layout.okhsl_3_slider)
 
         # Cursor
         self.CHANNEL_Setup("DIAMOND_1")
@@ -1349,6 +1565,118 @@ class PigmentO_Docker(DockWidget):
         self.layout.lab_3_value.valueChanged.connect(self.Pigment_LAB_3_Value_Modify)
         self.layout.lab_3_value.editingFinished.connect(self.Pigment_LAB_3_Value_Release)
 
+        # Channel Lightness
+        self.oklab_1_slider.SIGNAL_HALF.connect(self.Pigment_OKLAB_1_Half)
+        self.oklab_1_slider.SIGNAL_MINUS.connect(self.Pigment_OKLAB_1_Minus)
+        self.oklab_1_slider.SIGNAL_PLUS.connect(self.Pigment_OKLAB_1_Plus)
+        self.oklab_1_slider.SIGNAL_VALUE.connect(self.Pigment_OKLAB_1_Slider_Modify)
+        self.oklab_1_slider.SIGNAL_RELEASE.connect(self.Pigment_OKLAB_1_Slider_Release)
+        self.oklab_1_slider.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        self.layout.oklab_1_value.valueChanged.connect(self.Pigment_OKLAB_1_Value_Modify)
+        self.layout.oklab_1_value.editingFinished.connect(self.Pigment_OKLAB_1_Value_Release)
+        # Channel A
+        self.oklab_2_slider.SIGNAL_HALF.connect(self.Pigment_OKLAB_2_Half)
+        self.oklab_2_slider.SIGNAL_MINUS.connect(self.Pigment_OKLAB_2_Minus)
+        self.oklab_2_slider.SIGNAL_PLUS.connect(self.Pigment_OKLAB_2_Plus)
+        self.oklab_2_slider.SIGNAL_VALUE.connect(self.Pigment_OKLAB_2_Slider_Modify)
+        self.oklab_2_slider.SIGNAL_RELEASE.connect(self.Pigment_OKLAB_2_Slider_Release)
+        self.oklab_2_slider.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        self.layout.oklab_2_value.valueChanged.connect(self.Pigment_OKLAB_2_Value_Modify)
+        self.layout.oklab_2_value.editingFinished.connect(self.Pigment_OKLAB_2_Value_Release)
+        # Channel B
+        self.oklab_3_slider.SIGNAL_HALF.connect(self.Pigment_OKLAB_3_Half)
+        self.oklab_3_slider.SIGNAL_MINUS.connect(self.Pigment_OKLAB_3_Minus)
+        self.oklab_3_slider.SIGNAL_PLUS.connect(self.Pigment_OKLAB_3_Plus)
+        self.oklab_3_slider.SIGNAL_VALUE.connect(self.Pigment_OKLAB_3_Slider_Modify)
+        self.oklab_3_slider.SIGNAL_RELEASE.connect(self.Pigment_OKLAB_3_Slider_Release)
+        self.oklab_3_slider.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        self.layout.oklab_3_value.valueChanged.connect(self.Pigment_OKLAB_3_Value_Modify)
+        self.layout.oklab_3_value.editingFinished.connect(self.Pigment_OKLAB_3_Value_Release)
+
+        # Channel Lightness
+        self.oklch_1_slider.SIGNAL_HALF.connect(self.Pigment_OKLCH_1_Half)
+        self.oklch_1_slider.SIGNAL_MINUS.connect(self.Pigment_OKLCH_1_Minus)
+        self.oklch_1_slider.SIGNAL_PLUS.connect(self.Pigment_OKLCH_1_Plus)
+        self.oklch_1_slider.SIGNAL_VALUE.connect(self.Pigment_OKLCH_1_Slider_Modify)
+        self.oklch_1_slider.SIGNAL_RELEASE.connect(self.Pigment_OKLCH_1_Slider_Release)
+        self.oklch_1_slider.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        self.layout.oklch_1_value.valueChanged.connect(self.Pigment_OKLCH_1_Value_Modify)
+        self.layout.oklch_1_value.editingFinished.connect(self.Pigment_OKLCH_1_Value_Release)
+        # Channel Chroma
+        self.oklch_2_slider.SIGNAL_HALF.connect(self.Pigment_OKLCH_2_Half)
+        self.oklch_2_slider.SIGNAL_MINUS.connect(self.Pigment_OKLCH_2_Minus)
+        self.oklch_2_slider.SIGNAL_PLUS.connect(self.Pigment_OKLCH_2_Plus)
+        self.oklch_2_slider.SIGNAL_VALUE.connect(self.Pigment_OKLCH_2_Slider_Modify)
+        self.oklch_2_slider.SIGNAL_RELEASE.connect(self.Pigment_OKLCH_2_Slider_Release)
+        self.oklch_2_slider.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        self.layout.oklch_2_value.valueChanged.connect(self.Pigment_OKLCH_2_Value_Modify)
+        self.layout.oklch_2_value.editingFinished.connect(self.Pigment_OKLCH_2_Value_Release)
+        # Channel Hue
+        self.oklch_3_slider.SIGNAL_HALF.connect(self.Pigment_OKLCH_3_Half)
+        self.oklch_3_slider.SIGNAL_MINUS.connect(self.Pigment_OKLCH_3_Minus)
+        self.oklch_3_slider.SIGNAL_PLUS.connect(self.Pigment_OKLCH_3_Plus)
+        self.oklch_3_slider.SIGNAL_VALUE.connect(self.Pigment_OKLCH_3_Slider_Modify)
+        self.oklch_3_slider.SIGNAL_RELEASE.connect(self.Pigment_OKLCH_3_Slider_Release)
+        self.oklch_3_slider.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        self.layout.oklch_3_value.valueChanged.connect(self.Pigment_OKLCH_3_Value_Modify)
+        self.layout.oklch_3_value.editingFinished.connect(self.Pigment_OKLCH_3_Value_Release)
+
+        # Channel Hue
+        self.okhsv_1_slider.SIGNAL_HALF.connect(self.Pigment_OKHSV_1_Half)
+        self.okhsv_1_slider.SIGNAL_MINUS.connect(self.Pigment_OKHSV_1_Minus)
+        self.okhsv_1_slider.SIGNAL_PLUS.connect(self.Pigment_OKHSV_1_Plus)
+        self.okhsv_1_slider.SIGNAL_VALUE.connect(self.Pigment_OKHSV_1_Slider_Modify)
+        self.okhsv_1_slider.SIGNAL_RELEASE.connect(self.Pigment_OKHSV_1_Slider_Release)
+        self.okhsv_1_slider.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        self.layout.okhsv_1_value.valueChanged.connect(self.Pigment_OKHSV_1_Value_Modify)
+        self.layout.okhsv_1_value.editingFinished.connect(self.Pigment_OKHSV_1_Value_Release)
+        # Channel Saturation
+        self.okhsv_2_slider.SIGNAL_HALF.connect(self.Pigment_OKHSV_2_Half)
+        self.okhsv_2_slider.SIGNAL_MINUS.connect(self.Pigment_OKHSV_2_Minus)
+        self.okhsv_2_slider.SIGNAL_PLUS.connect(self.Pigment_OKHSV_2_Plus)
+        self.okhsv_2_slider.SIGNAL_VALUE.connect(self.Pigment_OKHSV_2_Slider_Modify)
+        self.okhsv_2_slider.SIGNAL_RELEASE.connect(self.Pigment_OKHSV_2_Slider_Release)
+        self.okhsv_2_slider.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        self.layout.okhsv_2_value.valueChanged.connect(self.Pigment_OKHSV_2_Value_Modify)
+        self.layout.okhsv_2_value.editingFinished.connect(self.Pigment_OKHSV_2_Value_Release)
+        # Channel Value
+        self.okhsv_3_slider.SIGNAL_HALF.connect(self.Pigment_OKHSV_3_Half)
+        self.okhsv_3_slider.SIGNAL_MINUS.connect(self.Pigment_OKHSV_3_Minus)
+        self.okhsv_3_slider.SIGNAL_PLUS.connect(self.Pigment_OKHSV_3_Plus)
+        self.okhsv_3_slider.SIGNAL_VALUE.connect(self.Pigment_OKHSV_3_Slider_Modify)
+        self.okhsv_3_slider.SIGNAL_RELEASE.connect(self.Pigment_OKHSV_3_Slider_Release)
+        self.okhsv_3_slider.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        self.layout.okhsv_3_value.valueChanged.connect(self.Pigment_OKHSV_3_Value_Modify)
+        self.layout.okhsv_3_value.editingFinished.connect(self.Pigment_OKHSV_3_Value_Release)
+
+        # Channel Hue
+        self.okhsl_1_slider.SIGNAL_HALF.connect(self.Pigment_OKHSL_1_Half)
+        self.okhsl_1_slider.SIGNAL_MINUS.connect(self.Pigment_OKHSL_1_Minus)
+        self.okhsl_1_slider.SIGNAL_PLUS.connect(self.Pigment_OKHSL_1_Plus)
+        self.okhsl_1_slider.SIGNAL_VALUE.connect(self.Pigment_OKHSL_1_Slider_Modify)
+        self.okhsl_1_slider.SIGNAL_RELEASE.connect(self.Pigment_OKHSL_1_Slider_Release)
+        self.okhsl_1_slider.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        self.layout.okhsl_1_value.valueChanged.connect(self.Pigment_OKHSL_1_Value_Modify)
+        self.layout.okhsl_1_value.editingFinished.connect(self.Pigment_OKHSL_1_Value_Release)
+        # Channel Saturation
+        self.okhsl_2_slider.SIGNAL_HALF.connect(self.Pigment_OKHSL_2_Half)
+        self.okhsl_2_slider.SIGNAL_MINUS.connect(self.Pigment_OKHSL_2_Minus)
+        self.okhsl_2_slider.SIGNAL_PLUS.connect(self.Pigment_OKHSL_2_Plus)
+        self.okhsl_2_slider.SIGNAL_VALUE.connect(self.Pigment_OKHSL_2_Slider_Modify)
+        self.okhsl_2_slider.SIGNAL_RELEASE.connect(self.Pigment_OKHSL_2_Slider_Release)
+        self.okhsl_2_slider.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        self.layout.okhsl_2_value.valueChanged.connect(self.Pigment_OKHSL_2_Value_Modify)
+        self.layout.okhsl_2_value.editingFinished.connect(self.Pigment_OKHSL_2_Value_Release)
+        # Channel Lightness
+        self.okhsl_3_slider.SIGNAL_HALF.connect(self.Pigment_OKHSL_3_Half)
+        self.okhsl_3_slider.SIGNAL_MINUS.connect(self.Pigment_OKHSL_3_Minus)
+        self.okhsl_3_slider.SIGNAL_PLUS.connect(self.Pigment_OKHSL_3_Plus)
+        self.okhsl_3_slider.SIGNAL_VALUE.connect(self.Pigment_OKHSL_3_Slider_Modify)
+        self.okhsl_3_slider.SIGNAL_RELEASE.connect(self.Pigment_OKHSL_3_Slider_Release)
+        self.okhsl_3_slider.SIGNAL_ZOOM.connect(self.Signal_Panel_Zoom)
+        self.layout.okhsl_3_value.valueChanged.connect(self.Pigment_OKHSL_3_Value_Modify)
+        self.layout.okhsl_3_value.editingFinished.connect(self.Pigment_OKHSL_3_Value_Release)
+
         #//
     def Palette(self):
         # Palette Colors
@@ -1449,6 +1777,30 @@ class PigmentO_Docker(DockWidget):
         self.mixer_hcy_r1 = Clicks(self.layout.hcy_r1)
         self.mixer_hcy_r2 = Clicks(self.layout.hcy_r2)
         self.mixer_hcy_r3 = Clicks(self.layout.hcy_r3)
+        self.mixer_oklab_l1 = Clicks(self.layout.oklab_l1)
+        self.mixer_oklab_l2 = Clicks(self.layout.oklab_l2)
+        self.mixer_oklab_l3 = Clicks(self.layout.oklab_l3)
+        self.mixer_oklab_r1 = Clicks(self.layout.oklab_r1)
+        self.mixer_oklab_r2 = Clicks(self.layout.oklab_r2)
+        self.mixer_oklab_r3 = Clicks(self.layout.oklab_r3)
+        self.mixer_oklch_l1 = Clicks(self.layout.oklch_l1)
+        self.mixer_oklch_l2 = Clicks(self.layout.oklch_l2)
+        self.mixer_oklch_l3 = Clicks(self.layout.oklch_l3)
+        self.mixer_oklch_r1 = Clicks(self.layout.oklch_r1)
+        self.mixer_oklch_r2 = Clicks(self.layout.oklch_r2)
+        self.mixer_oklch_r3 = Clicks(self.layout.oklch_r3)
+        self.mixer_okhsv_l1 = Clicks(self.layout.okhsv_l1)
+        self.mixer_okhsv_l2 = Clicks(self.layout.okhsv_l2)
+        self.mixer_okhsv_l3 = Clicks(self.layout.okhsv_l3)
+        self.mixer_okhsv_r1 = Clicks(self.layout.okhsv_r1)
+        self.mixer_okhsv_r2 = Clicks(self.layout.okhsv_r2)
+        self.mixer_okhsv_r3 = Clicks(self.layout.okhsv_r3)
+        self.mixer_okhsl_l1 = Clicks(self.layout.okhsl_l1)
+        self.mixer_okhsl_l2 = Clicks(self.layout.okhsl_l2)
+        self.mixer_okhsl_l3 = Clicks(self.layout.okhsl_l3)
+        self.mixer_okhsl_r1 = Clicks(self.layout.okhsl_r1)
+        self.mixer_okhsl_r2 = Clicks(self.layout.okhsl_r2)
+        self.mixer_okhsl_r3 = Clicks(self.layout.okhsl_r3)
 
         # TTS connection
         self.mixer_tts.SIGNAL_APPLY.connect(self.Mixer_TTS_APPLY)
@@ -1607,6 +1959,82 @@ class PigmentO_Docker(DockWidget):
         self.mixer_hcy_r2.SIGNAL_CLEAN.connect(self.Mixer_HCY_R2_CLEAN)
         self.mixer_hcy_l3.SIGNAL_CLEAN.connect(self.Mixer_HCY_L3_CLEAN)
         self.mixer_hcy_r3.SIGNAL_CLEAN.connect(self.Mixer_HCY_R3_CLEAN)
+        # OKLAB connection
+        self.mixer_oklab_l1.SIGNAL_APPLY.connect(self.Mixer_OKLAB_L1_APPLY)
+        self.mixer_oklab_r1.SIGNAL_APPLY.connect(self.Mixer_OKLAB_R1_APPLY)
+        self.mixer_oklab_l2.SIGNAL_APPLY.connect(self.Mixer_OKLAB_L2_APPLY)
+        self.mixer_oklab_r2.SIGNAL_APPLY.connect(self.Mixer_OKLAB_R2_APPLY)
+        self.mixer_oklab_l3.SIGNAL_APPLY.connect(self.Mixer_OKLAB_L3_APPLY)
+        self.mixer_oklab_r3.SIGNAL_APPLY.connect(self.Mixer_OKLAB_R3_APPLY)
+        self.mixer_oklab_l1.SIGNAL_SAVE.connect(self.Mixer_OKLAB_L1_SAVE)
+        self.mixer_oklab_r1.SIGNAL_SAVE.connect(self.Mixer_OKLAB_R1_SAVE)
+        self.mixer_oklab_l2.SIGNAL_SAVE.connect(self.Mixer_OKLAB_L2_SAVE)
+        self.mixer_oklab_r2.SIGNAL_SAVE.connect(self.Mixer_OKLAB_R2_SAVE)
+        self.mixer_oklab_l3.SIGNAL_SAVE.connect(self.Mixer_OKLAB_L3_SAVE)
+        self.mixer_oklab_r3.SIGNAL_SAVE.connect(self.Mixer_OKLAB_R3_SAVE)
+        self.mixer_oklab_l1.SIGNAL_CLEAN.connect(self.Mixer_OKLAB_L1_CLEAN)
+        self.mixer_oklab_r1.SIGNAL_CLEAN.connect(self.Mixer_OKLAB_R1_CLEAN)
+        self.mixer_oklab_l2.SIGNAL_CLEAN.connect(self.Mixer_OKLAB_L2_CLEAN)
+        self.mixer_oklab_r2.SIGNAL_CLEAN.connect(self.Mixer_OKLAB_R2_CLEAN)
+        self.mixer_oklab_l3.SIGNAL_CLEAN.connect(self.Mixer_OKLAB_L3_CLEAN)
+        self.mixer_oklab_r3.SIGNAL_CLEAN.connect(self.Mixer_OKLAB_R3_CLEAN)
+        # OKLCH connection
+        self.mixer_oklch_l1.SIGNAL_APPLY.connect(self.Mixer_OKLCH_L1_APPLY)
+        self.mixer_oklch_r1.SIGNAL_APPLY.connect(self.Mixer_OKLCH_R1_APPLY)
+        self.mixer_oklch_l2.SIGNAL_APPLY.connect(self.Mixer_OKLCH_L2_APPLY)
+        self.mixer_oklch_r2.SIGNAL_APPLY.connect(self.Mixer_OKLCH_R2_APPLY)
+        self.mixer_oklch_l3.SIGNAL_APPLY.connect(self.Mixer_OKLCH_L3_APPLY)
+        self.mixer_oklch_r3.SIGNAL_APPLY.connect(self.Mixer_OKLCH_R3_APPLY)
+        self.mixer_oklch_l1.SIGNAL_SAVE.connect(self.Mixer_OKLCH_L1_SAVE)
+        self.mixer_oklch_r1.SIGNAL_SAVE.connect(self.Mixer_OKLCH_R1_SAVE)
+        self.mixer_oklch_l2.SIGNAL_SAVE.connect(self.Mixer_OKLCH_L2_SAVE)
+        self.mixer_oklch_r2.SIGNAL_SAVE.connect(self.Mixer_OKLCH_R2_SAVE)
+        self.mixer_oklch_l3.SIGNAL_SAVE.connect(self.Mixer_OKLCH_L3_SAVE)
+        self.mixer_oklch_r3.SIGNAL_SAVE.connect(self.Mixer_OKLCH_R3_SAVE)
+        self.mixer_oklch_l1.SIGNAL_CLEAN.connect(self.Mixer_OKLCH_L1_CLEAN)
+        self.mixer_oklch_r1.SIGNAL_CLEAN.connect(self.Mixer_OKLCH_R1_CLEAN)
+        self.mixer_oklch_l2.SIGNAL_CLEAN.connect(self.Mixer_OKLCH_L2_CLEAN)
+        self.mixer_oklch_r2.SIGNAL_CLEAN.connect(self.Mixer_OKLCH_R2_CLEAN)
+        self.mixer_oklch_l3.SIGNAL_CLEAN.connect(self.Mixer_OKLCH_L3_CLEAN)
+        self.mixer_oklch_r3.SIGNAL_CLEAN.connect(self.Mixer_OKLCH_R3_CLEAN)
+        # OKHSV connection
+        self.mixer_okhsv_l1.SIGNAL_APPLY.connect(self.Mixer_OKHSV_L1_APPLY)
+        self.mixer_okhsv_r1.SIGNAL_APPLY.connect(self.Mixer_OKHSV_R1_APPLY)
+        self.mixer_okhsv_l2.SIGNAL_APPLY.connect(self.Mixer_OKHSV_L2_APPLY)
+        self.mixer_okhsv_r2.SIGNAL_APPLY.connect(self.Mixer_OKHSV_R2_APPLY)
+        self.mixer_okhsv_l3.SIGNAL_APPLY.connect(self.Mixer_OKHSV_L3_APPLY)
+        self.mixer_okhsv_r3.SIGNAL_APPLY.connect(self.Mixer_OKHSV_R3_APPLY)
+        self.mixer_okhsv_l1.SIGNAL_SAVE.connect(self.Mixer_OKHSV_L1_SAVE)
+        self.mixer_okhsv_r1.SIGNAL_SAVE.connect(self.Mixer_OKHSV_R1_SAVE)
+        self.mixer_okhsv_l2.SIGNAL_SAVE.connect(self.Mixer_OKHSV_L2_SAVE)
+        self.mixer_okhsv_r2.SIGNAL_SAVE.connect(self.Mixer_OKHSV_R2_SAVE)
+        self.mixer_okhsv_l3.SIGNAL_SAVE.connect(self.Mixer_OKHSV_L3_SAVE)
+        self.mixer_okhsv_r3.SIGNAL_SAVE.connect(self.Mixer_OKHSV_R3_SAVE)
+        self.mixer_okhsv_l1.SIGNAL_CLEAN.connect(self.Mixer_OKHSV_L1_CLEAN)
+        self.mixer_okhsv_r1.SIGNAL_CLEAN.connect(self.Mixer_OKHSV_R1_CLEAN)
+        self.mixer_okhsv_l2.SIGNAL_CLEAN.connect(self.Mixer_OKHSV_L2_CLEAN)
+        self.mixer_okhsv_r2.SIGNAL_CLEAN.connect(self.Mixer_OKHSV_R2_CLEAN)
+        self.mixer_okhsv_l3.SIGNAL_CLEAN.connect(self.Mixer_OKHSV_L3_CLEAN)
+        self.mixer_okhsv_r3.SIGNAL_CLEAN.connect(self.Mixer_OKHSV_R3_CLEAN)
+        # OKHSL connection
+        self.mixer_okhsl_l1.SIGNAL_APPLY.connect(self.Mixer_OKHSL_L1_APPLY)
+        self.mixer_okhsl_r1.SIGNAL_APPLY.connect(self.Mixer_OKHSL_R1_APPLY)
+        self.mixer_okhsl_l2.SIGNAL_APPLY.connect(self.Mixer_OKHSL_L2_APPLY)
+        self.mixer_okhsl_r2.SIGNAL_APPLY.connect(self.Mixer_OKHSL_R2_APPLY)
+        self.mixer_okhsl_l3.SIGNAL_APPLY.connect(self.Mixer_OKHSL_L3_APPLY)
+        self.mixer_okhsl_r3.SIGNAL_APPLY.connect(self.Mixer_OKHSL_R3_APPLY)
+        self.mixer_okhsl_l1.SIGNAL_SAVE.connect(self.Mixer_OKHSL_L1_SAVE)
+        self.mixer_okhsl_r1.SIGNAL_SAVE.connect(self.Mixer_OKHSL_R1_SAVE)
+        self.mixer_okhsl_l2.SIGNAL_SAVE.connect(self.Mixer_OKHSL_L2_SAVE)
+        self.mixer_okhsl_r2.SIGNAL_SAVE.connect(self.Mixer_OKHSL_R2_SAVE)
+        self.mixer_okhsl_l3.SIGNAL_SAVE.connect(self.Mixer_OKHSL_L3_SAVE)
+        self.mixer_okhsl_r3.SIGNAL_SAVE.connect(self.Mixer_OKHSL_R3_SAVE)
+        self.mixer_okhsl_l1.SIGNAL_CLEAN.connect(self.Mixer_OKHSL_L1_CLEAN)
+        self.mixer_okhsl_r1.SIGNAL_CLEAN.connect(self.Mixer_OKHSL_R1_CLEAN)
+        self.mixer_okhsl_l2.SIGNAL_CLEAN.connect(self.Mixer_OKHSL_L2_CLEAN)
+        self.mixer_okhsl_r2.SIGNAL_CLEAN.connect(self.Mixer_OKHSL_R2_CLEAN)
+        self.mixer_okhsl_l3.SIGNAL_CLEAN.connect(self.Mixer_OKHSL_L3_CLEAN)
+        self.mixer_okhsl_r3.SIGNAL_CLEAN.connect(self.Mixer_OKHSL_R3_CLEAN)
 
         #//
         #\\ Module Mixer Gradients #############################################
@@ -1658,6 +2086,21 @@ class PigmentO_Docker(DockWidget):
         self.mixer_lch_g1 = Mixer_Linear(self.layout.lch_g1)
         self.mixer_lch_g2 = Mixer_Linear(self.layout.lch_g2)
         self.mixer_lch_g3 = Mixer_Linear(self.layout.lch_g3)
+        self.mixer_oklab_g1 = Mixer_Linear(self.layout.oklab_g1)
+        self.mixer_oklab_g2 = Mixer_Linear(self.layout.oklab_g2)
+        self.mixer_oklab_g3 = Mixer_Linear(self.layout.oklab_g3)
+        self.mixer_oklch_g1 = Mixer_Linear(self.layout.oklch_g1)
+        self.mixer_oklch_g2 = Mixer_Linear(self.layout.oklch_g2)
+        self.mixer_oklch_g3 = Mixer_Linear(self.layout.oklch_g3)
+        self.mixer_okhsv_g1 = Mixer_Linear(self.layout.okhsv_g1)
+        self.mixer_okhsv_g2 = Mixer_Linear(self.layout.okhsv_g2)
+        self.mixer_okhsv_g3 = Mixer_Linear(self.layout.okhsv_g3)
+        self.mixer_okhsl_g1 = Mixer_Linear(self.layout.okhsl_g1)
+        self.mixer_okhsl_g2 = Mixer_Linear(self.layout.okhsl_g2)
+        self.mixer_okhsl_g3 = Mixer_Linear(self.layout.okhsl_g3)
+        # Gradient of each mixer and the gradient it displays
+        self.mixer_cache = {}
+        self.mixer_shown = {}
 
         # Mixer Gradient Connect
         self.mixer_tint.SIGNAL_MIXER_VALUE.connect(self.Mixer_Tint)
@@ -1690,6 +2133,19 @@ class PigmentO_Docker(DockWidget):
         self.mixer_hcy_g2.SIGNAL_MIXER_VALUE.connect(self.Mixer_HCY_G2)
         self.mixer_hcy_g3.SIGNAL_MIXER_VALUE.connect(self.Mixer_HCY_G3)
 
+        self.mixer_oklab_g1.SIGNAL_MIXER_VALUE.connect(self.Mixer_OKLAB_G1)
+        self.mixer_oklab_g2.SIGNAL_MIXER_VALUE.connect(self.Mixer_OKLAB_G2)
+        self.mixer_oklab_g3.SIGNAL_MIXER_VALUE.connect(self.Mixer_OKLAB_G3)
+        self.mixer_oklch_g1.SIGNAL_MIXER_VALUE.connect(self.Mixer_OKLCH_G1)
+        self.mixer_oklch_g2.SIGNAL_MIXER_VALUE.connect(self.Mixer_OKLCH_G2)
+        self.mixer_oklch_g3.SIGNAL_MIXER_VALUE.connect(self.Mixer_OKLCH_G3)
+        self.mixer_okhsv_g1.SIGNAL_MIXER_VALUE.connect(self.Mixer_OKHSV_G1)
+        self.mixer_okhsv_g2.SIGNAL_MIXER_VALUE.connect(self.Mixer_OKHSV_G2)
+        self.mixer_okhsv_g3.SIGNAL_MIXER_VALUE.connect(self.Mixer_OKHSV_G3)
+        self.mixer_okhsl_g1.SIGNAL_MIXER_VALUE.connect(self.Mixer_OKHSL_G1)
+        self.mixer_okhsl_g2.SIGNAL_MIXER_VALUE.connect(self.Mixer_OKHSL_G2)
+        self.mixer_okhsl_g3.SIGNAL_MIXER_VALUE.connect(self.Mixer_OKHSL_G3)
+
         # Previous Selected Mixer Sliders
         self.mixer_tint.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
         self.mixer_tone.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
@@ -1721,8 +2177,24 @@ class PigmentO_Docker(DockWidget):
         self.mixer_hcy_g2.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
         self.mixer_hcy_g3.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
 
+        self.mixer_oklab_g1.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
+        self.mixer_oklab_g2.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
+        self.mixer_oklab_g3.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
+        self.mixer_oklch_g1.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
+        self.mixer_oklch_g2.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
+        self.mixer_oklch_g3.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
+        self.mixer_okhsv_g1.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
+        self.mixer_okhsv_g2.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
+        self.mixer_okhsv_g3.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
+        self.mixer_okhsl_g1.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
+        self.mixer_okhsl_g2.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
+        self.mixer_okhsl_g3.SIGNAL_MIXER_RELEASE.connect(self.Pigment_Release)
+
         #//
     def History(self):
+        self.history_model = History_Model(history_limit)
+        self.history_loaded = False
+        self.layout.color_history.setModel(self.history_model)
         self.layout.color_history.clicked.connect(self.History_APPLY)
     def Style(self):
         # Size
@@ -1802,6 +2274,18 @@ class PigmentO_Docker(DockWidget):
         self.layout.lch_1_tick.setStyleSheet(p10)
         self.layout.lch_2_tick.setStyleSheet(p10)
         self.layout.lch_3_tick.setStyleSheet(p10)
+        self.layout.oklab_1_tick.setStyleSheet(p10)
+        self.layout.oklab_2_tick.setStyleSheet(p10)
+        self.layout.oklab_3_tick.setStyleSheet(p10)
+        self.layout.oklch_1_tick.setStyleSheet(p10)
+        self.layout.oklch_2_tick.setStyleSheet(p10)
+        self.layout.oklch_3_tick.setStyleSheet(p6)
+        self.layout.okhsv_1_tick.setStyleSheet(p6)
+        self.layout.okhsv_2_tick.setStyleSheet(p10)
+        self.layout.okhsv_3_tick.setStyleSheet(p10)
+        self.layout.okhsl_1_tick.setStyleSheet(p6)
+        self.layout.okhsl_2_tick.setStyleSheet(p10)
+        self.layout.okhsl_3_tick.setStyleSheet(p10)
 
         # Icons
         self.layout.cmyk_4_lock.setIcon(Krita.instance().icon('docker_lock_a'))
@@ -1841,6 +2325,19 @@ class PigmentO_Docker(DockWidget):
             self.Krita_TIMER()
             # Stop Timer so it does NOT work without the Docker Present
             self.timer.stop()
+        # Profiler statistics refresh
+        self.profiler_timer = QtCore.QTimer(self)
+        self.profiler_timer.timeout.connect(self.Profiler_Statistics)
+        # Refine a drag that ended without a release signal
+        self.quality_timer = QtCore.QTimer(self)
+        self.quality_timer.setSingleShot(True)
+        self.quality_timer.setInterval(quality_delay)
+        self.quality_timer.timeout.connect(self.Quality_Timeout)
+        # Display LUT build steps
+        self.lut_timer = QtCore.QTimer(self)
+        self.lut_timer.setSingleShot(True)
+        self.lut_timer.setInterval(zero)
+        self.lut_timer.timeout.connect(self.Display_LUT_Step)
 
     #//
     #\\ Menu Displays ##########################################################
@@ -1938,6 +2435,7 @@ class PigmentO_Docker(DockWidget):
         if (self.harmony_menu == True and self.harmony_rule == "Double Split Complemantary"):
             self.harmony_status = 5
         self.Harmony_Refresh()
+        self.SWA_Dirty()
         self.Pigment_Display()
         self.Ratio()
     def HARMONY_Edit(self):
@@ -1978,6 +2476,10 @@ class PigmentO_Docker(DockWidget):
             self.layout.panel_hsl.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         if (panel == True and self.panel_active == "HCY"):
             self.layout.panel_hcy.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        if (panel == True and self.panel_active == "OKHSV"):
+            self.layout.panel_okhsv.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        if (panel == True and self.panel_active == "OKHSL"):
+            self.layout.panel_okhsl.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         if (panel == True and self.panel_active == "HUE"):
             self.layout.panel_hue.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         if (panel == True and self.panel_active == "GAM"):
@@ -1996,6 +2498,10 @@ class PigmentO_Docker(DockWidget):
         if self.panel_active == "SWA":
             self.dialog.cotd_date.setEnabled(True)
             self.dialog.cotd_date.setMaximumWidth(max_val)
+            self.dialog.swa_mode.setEnabled(True)
+            self.dialog.swa_mode.setMaximumWidth(max_val)
+            self.dialog.swa_export.setEnabled(True)
+            self.dialog.swa_export.setMaximumWidth(max_val)
         if self.panel_active == "HUE":
             self.dialog.hue_secondary.setEnabled(True)
             self.dialog.hue_secondary.setMaximumWidth(max_val)
@@ -2006,6 +2512,8 @@ class PigmentO_Docker(DockWidget):
             self.dialog.gam_shape.setMaximumWidth(max_val)
             self.dialog.gam_reset.setEnabled(True)
             self.dialog.gam_reset.setMaximumWidth(max_val)
+            self.dialog.gam_ring.setEnabled(True)
+            self.dialog.gam_ring.setMaximumWidth(max_val)
         if self.panel_active == "DOT":
             self.dialog.dot_interpolation.setEnabled(True)
             self.dialog.dot_interpolation.setMaximumWidth(max_val)
@@ -2043,10 +2551,16 @@ class PigmentO_Docker(DockWidget):
         self.layout.panel_hsv.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.layout.panel_hsl.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.layout.panel_hcy.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.layout.panel_okhsv.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.layout.panel_okhsl.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         # SWA
         self.layout.panel_swa.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.dialog.cotd_date.setEnabled(False)
         self.dialog.cotd_date.setMaximumWidth(zero)
+        self.dialog.swa_mode.setEnabled(False)
+        self.dialog.swa_mode.setMaximumWidth(zero)
+        self.dialog.swa_export.setEnabled(False)
+        self.dialog.swa_export.setMaximumWidth(zero)
         # HUE
         self.layout.panel_hue.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.dialog.hue_secondary.setEnabled(False)
@@ -2059,6 +2573,8 @@ class PigmentO_Docker(DockWidget):
         self.dialog.gam_shape.setMaximumWidth(zero)
         self.dialog.gam_reset.setEnabled(False)
         self.dialog.gam_reset.setMaximumWidth(zero)
+        self.dialog.gam_ring.setEnabled(False)
+        self.dialog.gam_ring.setMaximumWidth(zero)
         # DOT
         self.layout.panel_dot_mix.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.dialog.dot_interpolation.setEnabled(False)
@@ -2142,10 +2658,34 @@ class PigmentO_Docker(DockWidget):
             self.gamut_shape = "P2_S1" # 1Polygon 1Sides
         if gamut == "3 Pies":
             self.gamut_shape = "P3_S3" # 3Polygon 3Sides
+        if gamut in self.gamut_masks:
+            self.gamut_shape = "KGM" # Krita Gamut Mask
+            self.panel_gam_polygon.Update_KGM(self.gamut_masks[gamut])
+        self.SWA_Dirty()
         self.Update_Panel_GAM_Circle()
         self.Update_Panel_GAM_Polygon(self.P1_S1, self.P1_S3, self.P1_S4, self.P2_S1, self.P3_S3)
         self.panel_gam_circle.update()
         self.panel_gam_polygon.update()
+    def GAM_Masks(self):
+        # Gamut Masks of the Resource Folder
+        folder = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "gamutmasks"))
+        try:
+            files = sorted(os.listdir(folder))
+        except:
+            files = []
+        for file in files:
+            if file.lower().endswith(".kgm"):
+                name = os.path.splitext(file)[0].replace("_", " ")
+                self.gamut_masks[name] = os.path.join(folder, file)
+                self.dialog.gam_shape.addItem(name)
+    def GAM_Ring_Step(self):
+        # Snap to the nearest lower divisor of 360 so the ring closes on Red
+        step = self.dialog.gam_ring.value()
+        while 360 % step != 0:
+            step -= 1
+        self.gam_ring_step = step
+        self.Update_Panel_GAM_Polygon(self.P1_S1, self.P1_S3, self.P1_S4, self.P2_S1, self.P3_S3)
+        self.panel_gam_polygon.update()
     def GAM_Reset(self):
         # Variables Reset
         self.P1_S1 = [
@@ -2232,6 +2772,8 @@ class PigmentO_Docker(DockWidget):
             index = 4
         if self.gamut_shape == "P3_S3":
             index = 5
+        if self.gamut_shape == "KGM":
+            index = self.dialog.gam_shape.currentIndex()
         self.dialog.gam_shape.setCurrentIndex(index)
         self.Update_Panel_GAM_Circle()
         self.Update_Panel_GAM_Polygon(self.P1_S1, self.P1_S3, self.P1_S4, self.P2_S1, self.P3_S3)
@@ -2555,6 +3097,10 @@ class PigmentO_Docker(DockWidget):
         self.Menu_HLAB()
         self.Menu_LAB()
         self.Menu_LCH()
+        self.Menu_OKLAB()
+        self.Menu_OKLCH()
+        self.Menu_OKHSV()
+        self.Menu_OKHSL()
         try:
             self.Pigment_Display()
         except:
@@ -2794,6 +3340,58 @@ class PigmentO_Docker(DockWidget):
             self.layout.lch_2_value.setMaximumWidth(self.ui_70)
             self.layout.lch_3_value.setMinimumWidth(self.ui_70)
             self.layout.lch_3_value.setMaximumWidth(self.ui_70)
+            # OKLAB
+            self.layout.oklab_1_label.setMinimumWidth(self.ui_15)
+            self.layout.oklab_1_label.setMaximumWidth(self.ui_15)
+            self.layout.oklab_2_label.setMinimumWidth(self.ui_15)
+            self.layout.oklab_2_label.setMaximumWidth(self.ui_15)
+            self.layout.oklab_3_label.setMinimumWidth(self.ui_15)
+            self.layout.oklab_3_label.setMaximumWidth(self.ui_15)
+            self.layout.oklab_1_value.setMinimumWidth(self.ui_70)
+            self.layout.oklab_1_value.setMaximumWidth(self.ui_70)
+            self.layout.oklab_2_value.setMinimumWidth(self.ui_70)
+            self.layout.oklab_2_value.setMaximumWidth(self.ui_70)
+            self.layout.oklab_3_value.setMinimumWidth(self.ui_70)
+            self.layout.oklab_3_value.setMaximumWidth(self.ui_70)
+            # OKLCH
+            self.layout.oklch_1_label.setMinimumWidth(self.ui_15)
+            self.layout.oklch_1_label.setMaximumWidth(self.ui_15)
+            self.layout.oklch_2_label.setMinimumWidth(self.ui_15)
+            self.layout.oklch_2_label.setMaximumWidth(self.ui_15)
+            self.layout.oklch_3_label.setMinimumWidth(self.ui_15)
+            self.layout.oklch_3_label.setMaximumWidth(self.ui_15)
+            self.layout.oklch_1_value.setMinimumWidth(self.ui_70)
+            self.layout.oklch_1_value.setMaximumWidth(self.ui_70)
+            self.layout.oklch_2_value.setMinimumWidth(self.ui_70)
+            self.layout.oklch_2_value.setMaximumWidth(self.ui_70)
+            self.layout.oklch_3_value.setMinimumWidth(self.ui_70)
+            self.layout.oklch_3_value.setMaximumWidth(self.ui_70)
+            # OKHSV
+            self.layout.okhsv_1_label.setMinimumWidth(self.ui_15)
+            self.layout.okhsv_1_label.setMaximumWidth(self.ui_15)
+            self.layout.okhsv_2_label.setMinimumWidth(self.ui_15)
+            self.layout.okhsv_2_label.setMaximumWidth(self.ui_15)
+            self.layout.okhsv_3_label.setMinimumWidth(self.ui_15)
+            self.layout.okhsv_3_label.setMaximumWidth(self.ui_15)
+            self.layout.okhsv_1_value.setMinimumWidth(self.ui_70)
+            self.layout.okhsv_1_value.setMaximumWidth(self.ui_70)
+            self.layout.okhsv_2_value.setMinimumWidth(self.ui_70)
+            self.layout.okhsv_2_value.setMaximumWidth(self.ui_70)
+            self.layout.okhsv_3_value.setMinimumWidth(self.ui_70)
+            self.layout.okhsv_3_value.setMaximumWidth(self.ui_70)
+            # OKHSL
+            self.layout.okhsl_1_label.setMinimumWidth(self.ui_15)
+            self.layout.okhsl_1_label.setMaximumWidth(self.ui_15)
+            self.layout.okhsl_2_label.setMinimumWidth(self.ui_15)
+            self.layout.okhsl_2_label.setMaximumWidth(self.ui_15)
+            self.layout.okhsl_3_label.setMinimumWidth(self.ui_15)
+            self.layout.okhsl_3_label.setMaximumWidth(self.ui_15)
+            self.layout.okhsl_1_value.setMinimumWidth(self.ui_70)
+            self.layout.okhsl_1_value.setMaximumWidth(self.ui_70)
+            self.layout.okhsl_2_value.setMinimumWidth(self.ui_70)
+            self.layout.okhsl_2_value.setMaximumWidth(self.ui_70)
+            self.layout.okhsl_3_value.setMinimumWidth(self.ui_70)
+            self.layout.okhsl_3_value.setMaximumWidth(self.ui_70)
         else:
             # AAA
             self.layout.aaa_1_label.setMinimumWidth(zero)
@@ -3027,6 +3625,58 @@ class PigmentO_Docker(DockWidget):
             self.layout.lch_2_value.setMaximumWidth(zero)
             self.layout.lch_3_value.setMinimumWidth(zero)
             self.layout.lch_3_value.setMaximumWidth(zero)
+            # OKLAB
+            self.layout.oklab_1_label.setMinimumWidth(zero)
+            self.layout.oklab_1_label.setMaximumWidth(zero)
+            self.layout.oklab_2_label.setMinimumWidth(zero)
+            self.layout.oklab_2_label.setMaximumWidth(zero)
+            self.layout.oklab_3_label.setMinimumWidth(zero)
+            self.layout.oklab_3_label.setMaximumWidth(zero)
+            self.layout.oklab_1_value.setMinimumWidth(zero)
+            self.layout.oklab_1_value.setMaximumWidth(zero)
+            self.layout.oklab_2_value.setMinimumWidth(zero)
+            self.layout.oklab_2_value.setMaximumWidth(zero)
+            self.layout.oklab_3_value.setMinimumWidth(zero)
+            self.layout.oklab_3_value.setMaximumWidth(zero)
+            # OKLCH
+            self.layout.oklch_1_label.setMinimumWidth(zero)
+            self.layout.oklch_1_label.setMaximumWidth(zero)
+            self.layout.oklch_2_label.setMinimumWidth(zero)
+            self.layout.oklch_2_label.setMaximumWidth(zero)
+            self.layout.oklch_3_label.setMinimumWidth(zero)
+            self.layout.oklch_3_label.setMaximumWidth(zero)
+            self.layout.oklch_1_value.setMinimumWidth(zero)
+            self.layout.oklch_1_value.setMaximumWidth(zero)
+            self.layout.oklch_2_value.setMinimumWidth(zero)
+            self.layout.oklch_2_value.setMaximumWidth(zero)
+            self.layout.oklch_3_value.setMinimumWidth(zero)
+            self.layout.oklch_3_value.setMaximumWidth(zero)
+            # OKHSV
+            self.layout.okhsv_1_label.setMinimumWidth(zero)
+            self.layout.okhsv_1_label.setMaximumWidth(zero)
+            self.layout.okhsv_2_label.setMinimumWidth(zero)
+            self.layout.okhsv_2_label.setMaximumWidth(zero)
+            self.layout.okhsv_3_label.setMinimumWidth(zero)
+            self.layout.okhsv_3_label.setMaximumWidth(zero)
+            self.layout.okhsv_1_value.setMinimumWidth(zero)
+            self.layout.okhsv_1_value.setMaximumWidth(zero)
+            self.layout.okhsv_2_value.setMinimumWidth(zero)
+            self.layout.okhsv_2_value.setMaximumWidth(zero)
+            self.layout.okhsv_3_value.setMinimumWidth(zero)
+            self.layout.okhsv_3_value.setMaximumWidth(zero)
+            # OKHSL
+            self.layout.okhsl_1_label.setMinimumWidth(zero)
+            self.layout.okhsl_1_label.setMaximumWidth(zero)
+            self.layout.okhsl_2_label.setMinimumWidth(zero)
+            self.layout.okhsl_2_label.setMaximumWidth(zero)
+            self.layout.okhsl_3_label.setMinimumWidth(zero)
+            self.layout.okhsl_3_label.setMaximumWidth(zero)
+            self.layout.okhsl_1_value.setMinimumWidth(zero)
+            self.layout.okhsl_1_value.setMaximumWidth(zero)
+            self.layout.okhsl_2_value.setMinimumWidth(zero)
+            self.layout.okhsl_2_value.setMaximumWidth(zero)
+            self.layout.okhsl_3_value.setMinimumWidth(zero)
+            self.layout.okhsl_3_value.setMaximumWidth(zero)
         self.Adjust_Spacing()
         self.Ratio_Channels()
         self.menu_update = 5
@@ -3079,6 +3729,10 @@ class PigmentO_Docker(DockWidget):
         self.chan_hlab = self.dialog.hlab.isChecked()
         self.chan_lab = self.dialog.lab.isChecked()
         self.chan_lch = self.dialog.lch.isChecked()
+        self.chan_oklab = self.dialog.oklab.isChecked()
+        self.chan_oklch = self.dialog.oklch.isChecked()
+        self.chan_okhsv = self.dialog.okhsv.isChecked()
+        self.chan_okhsl = self.dialog.okhsl.isChecked()
 
         # Adjust Spacing for the Channels
         chan_true = (self.chan_aaa == True
@@ -3098,7 +3752,11 @@ class PigmentO_Docker(DockWidget):
             or self.chan_luv == True
             or self.chan_hlab == True
             or self.chan_lab == True
-            or self.chan_lch == True)
+            or self.chan_lch == True
+            or self.chan_oklab == True
+            or self.chan_oklch == True
+            or self.chan_okhsv == True
+            or self.chan_okhsl == True)
         chan_false = (self.chan_aaa == False
             and self.chan_rgb == False
             and self.chan_cmy == False
@@ -3116,7 +3774,11 @@ class PigmentO_Docker(DockWidget):
             and self.chan_luv == False
             and self.chan_hlab == False
             and self.chan_lab == False
-            and self.chan_lch == False)
+            and self.chan_lch == False
+            and self.chan_oklab == False
+            and self.chan_oklch == False
+            and self.chan_okhsv == False
+            and self.chan_okhsl == False)
 
         # Compensate Absence of Panel with vertical_spacer
         if self.dialog.pan.isChecked() == False:
@@ -3175,6 +3837,18 @@ class PigmentO_Docker(DockWidget):
         self.lch_1_slider.Setup("LCH1", "4", set)
         self.lch_2_slider.Setup("LCH2", "4", set)
         self.lch_3_slider.Setup("LCH3", "4", set)
+        self.oklab_1_slider.Setup("OKLAB1", "4", set)
+        self.oklab_2_slider.Setup("OKLAB2", "4", set)
+        self.oklab_3_slider.Setup("OKLAB3", "4", set)
+        self.oklch_1_slider.Setup("OKLCH1", "4", set)
+        self.oklch_2_slider.Setup("OKLCH2", "4", set)
+        self.oklch_3_slider.Setup("OKLCH3", "4", set)
+        self.okhsv_1_slider.Setup("OKHSV1", "4", set)
+        self.okhsv_2_slider.Setup("OKHSV2", "4", set)
+        self.okhsv_3_slider.Setup("OKHSV3", "4", set)
+        self.okhsl_1_slider.Setup("OKHSL1", "4", set)
+        self.okhsl_2_slider.Setup("OKHSL2", "4", set)
+        self.okhsl_3_slider.Setup("OKHSL3", "4", set)
         self.update()
     # Color Spaces
     def Menu_AAA(self):
@@ -4144,6 +4818,226 @@ class PigmentO_Docker(DockWidget):
             self.Pigment_Display()
         except:
             pass
+    def Menu_OKLAB(self):
+        font = self.dialog.oklab.font()
+        if (self.chan == True and self.dialog.oklab.isChecked()):
+            font.setBold(True)
+            self.chan_oklab = True
+            mini = self.ui_10
+            maxi = self.ui_20
+            tick = unit
+            horz = zero
+            vert = unit
+        else:
+            font.setBold(False)
+            self.chan_oklab = False
+            mini = zero
+            maxi = zero
+            tick = zero
+            horz = unit
+            vert = zero
+        # 1
+        self.layout.oklab_1_label.setMinimumHeight(mini)
+        self.layout.oklab_1_label.setMaximumHeight(maxi)
+        self.layout.oklab_1_slider.setMinimumHeight(mini)
+        self.layout.oklab_1_slider.setMaximumHeight(maxi)
+        self.layout.oklab_1_value.setMinimumHeight(mini)
+        self.layout.oklab_1_value.setMaximumHeight(maxi)
+        self.layout.oklab_1_tick.setMinimumHeight(tick)
+        self.layout.oklab_1_tick.setMaximumHeight(tick)
+        # 2
+        self.layout.oklab_2_label.setMinimumHeight(mini)
+        self.layout.oklab_2_label.setMaximumHeight(maxi)
+        self.layout.oklab_2_slider.setMinimumHeight(mini)
+        self.layout.oklab_2_slider.setMaximumHeight(maxi)
+        self.layout.oklab_2_value.setMinimumHeight(mini)
+        self.layout.oklab_2_value.setMaximumHeight(maxi)
+        self.layout.oklab_2_tick.setMinimumHeight(tick)
+        self.layout.oklab_2_tick.setMaximumHeight(tick)
+        # 3
+        self.layout.oklab_3_label.setMinimumHeight(mini)
+        self.layout.oklab_3_label.setMaximumHeight(maxi)
+        self.layout.oklab_3_slider.setMinimumHeight(mini)
+        self.layout.oklab_3_slider.setMaximumHeight(maxi)
+        self.layout.oklab_3_value.setMinimumHeight(mini)
+        self.layout.oklab_3_value.setMaximumHeight(maxi)
+        self.layout.oklab_3_tick.setMinimumHeight(tick)
+        self.layout.oklab_3_tick.setMaximumHeight(tick)
+        # layout
+        self.layout.channels_oklab.setContentsMargins(horz,vert,horz,vert)
+        self.layout.channels_oklab.setVerticalSpacing(vert)
+        # menu
+        self.dialog.oklab.setFont(font)
+        self.Adjust_Spacing()
+        try:
+            self.Pigment_Display()
+        except:
+            pass
+    def Menu_OKLCH(self):
+        font = self.dialog.oklch.font()
+        if (self.chan == True and self.dialog.oklch.isChecked()):
+            font.setBold(True)
+            self.chan_oklch = True
+            mini = self.ui_10
+            maxi = self.ui_20
+            tick = unit
+            horz = zero
+            vert = unit
+        else:
+            font.setBold(False)
+            self.chan_oklch = False
+            mini = zero
+            maxi = zero
+            tick = zero
+            horz = unit
+            vert = zero
+        # 1
+        self.layout.oklch_1_label.setMinimumHeight(mini)
+        self.layout.oklch_1_label.setMaximumHeight(maxi)
+        self.layout.oklch_1_slider.setMinimumHeight(mini)
+        self.layout.oklch_1_slider.setMaximumHeight(maxi)
+        self.layout.oklch_1_value.setMinimumHeight(mini)
+        self.layout.oklch_1_value.setMaximumHeight(maxi)
+        self.layout.oklch_1_tick.setMinimumHeight(tick)
+        self.layout.oklch_1_tick.setMaximumHeight(tick)
+        # 2
+        self.layout.oklch_2_label.setMinimumHeight(mini)
+        self.layout.oklch_2_label.setMaximumHeight(maxi)
+        self.layout.oklch_2_slider.setMinimumHeight(mini)
+        self.layout.oklch_2_slider.setMaximumHeight(maxi)
+        self.layout.oklch_2_value.setMinimumHeight(mini)
+        self.layout.oklch_2_value.setMaximumHeight(maxi)
+        self.layout.oklch_2_tick.setMinimumHeight(tick)
+        self.layout.oklch_2_tick.setMaximumHeight(tick)
+        # 3
+        self.layout.oklch_3_label.setMinimumHeight(mini)
+        self.layout.oklch_3_label.setMaximumHeight(maxi)
+        self.layout.oklch_3_slider.setMinimumHeight(mini)
+        self.layout.oklch_3_slider.setMaximumHeight(maxi)
+        self.layout.oklch_3_value.setMinimumHeight(mini)
+        self.layout.oklch_3_value.setMaximumHeight(maxi)
+        self.layout.oklch_3_tick.setMinimumHeight(tick)
+        self.layout.oklch_3_tick.setMaximumHeight(tick)
+        # layout
+        self.layout.channels_oklch.setContentsMargins(horz,vert,horz,vert)
+        self.layout.channels_oklch.setVerticalSpacing(vert)
+        # menu
+        self.dialog.oklch.setFont(font)
+        self.Adjust_Spacing()
+        try:
+            self.Pigment_Display()
+        except:
+            pass
+    def Menu_OKHSV(self):
+        font = self.dialog.okhsv.font()
+        if (self.chan == True and self.dialog.okhsv.isChecked()):
+            font.setBold(True)
+            self.chan_okhsv = True
+            mini = self.ui_10
+            maxi = self.ui_20
+            tick = unit
+            horz = zero
+            vert = unit
+        else:
+            font.setBold(False)
+            self.chan_okhsv = False
+            mini = zero
+            maxi = zero
+            tick = zero
+            horz = unit
+            vert = zero
+        # 1
+        self.layout.okhsv_1_label.setMinimumHeight(mini)
+        self.layout.okhsv_1_label.setMaximumHeight(maxi)
+        self.layout.okhsv_1_slider.setMinimumHeight(mini)
+        self.layout.okhsv_1_slider.setMaximumHeight(maxi)
+        self.layout.okhsv_1_value.setMinimumHeight(mini)
+        self.layout.okhsv_1_value.setMaximumHeight(maxi)
+        self.layout.okhsv_1_tick.setMinimumHeight(tick)
+        self.layout.okhsv_1_tick.setMaximumHeight(tick)
+        # 2
+        self.layout.okhsv_2_label.setMinimumHeight(mini)
+        self.layout.okhsv_2_label.setMaximumHeight(maxi)
+        self.layout.okhsv_2_slider.setMinimumHeight(mini)
+        self.layout.okhsv_2_slider.setMaximumHeight(maxi)
+        self.layout.okhsv_2_value.setMinimumHeight(mini)
+        self.layout.okhsv_2_value.setMaximumHeight(maxi)
+        self.layout.okhsv_2_tick.setMinimumHeight(tick)
+        self.layout.okhsv_2_tick.setMaximumHeight(tick)
+        # 3
+        self.layout.okhsv_3_label.setMinimumHeight(mini)
+        self.layout.okhsv_3_label.setMaximumHeight(maxi)
+        self.layout.okhsv_3_slider.setMinimumHeight(mini)
+        self.layout.okhsv_3_slider.setMaximumHeight(maxi)
+        self.layout.okhsv_3_value.setMinimumHeight(mini)
+        self.layout.okhsv_3_value.setMaximumHeight(maxi)
+        self.layout.okhsv_3_tick.setMinimumHeight(tick)
+        self.layout.okhsv_3_tick.setMaximumHeight(tick)
+        # layout
+        self.layout.channels_okhsv.setContentsMargins(horz,vert,horz,vert)
+        self.layout.channels_okhsv.setVerticalSpacing(vert)
+        # menu
+        self.dialog.okhsv.setFont(font)
+        self.Adjust_Spacing()
+        try:
+            self.Pigment_Display()
+        except:
+            pass
+    def Menu_OKHSL(self):
+        font = self.dialog.okhsl.font()
+        if (self.chan == True and self.dialog.okhsl.isChecked()):
+            font.setBold(True)
+            self.chan_okhsl = True
+            mini = self.ui_10
+            maxi = self.ui_20
+            tick = unit
+            horz = zero
+            vert = unit
+        else:
+            font.setBold(False)
+            self.chan_okhsl = False
+            mini = zero
+            maxi = zero
+            tick = zero
+            horz = unit
+            vert = zero
+        # 1
+        self.layout.okhsl_1_label.setMinimumHeight(mini)
+        self.layout.okhsl_1_label.setMaximumHeight(maxi)
+        self.layout.okhsl_1_slider.setMinimumHeight(mini)
+        self.layout.okhsl_1_slider.setMaximumHeight(maxi)
+        self.layout.okhsl_1_value.setMinimumHeight(mini)
+        self.layout.okhsl_1_value.setMaximumHeight(maxi)
+        self.layout.okhsl_1_tick.setMinimumHeight(tick)
+        self.layout.okhsl_1_tick.setMaximumHeight(tick)
+        # 2
+        self.layout.okhsl_2_label.setMinimumHeight(mini)
+        self.layout.okhsl_2_label.setMaximumHeight(maxi)
+        self.layout.okhsl_2_slider.setMinimumHeight(mini)
+        self.layout.okhsl_2_slider.setMaximumHeight(maxi)
+        self.layout.okhsl_2_value.setMinimumHeight(mini)
+        self.layout.okhsl_2_value.setMaximumHeight(maxi)
+        self.layout.okhsl_2_tick.setMinimumHeight(tick)
+        self.layout.okhsl_2_tick.setMaximumHeight(tick)
+        # 3
+        self.layout.okhsl_3_label.setMinimumHeight(mini)
+        self.layout.okhsl_3_label.setMaximumHeight(maxi)
+        self.layout.okhsl_3_slider.setMinimumHeight(mini)
+        self.layout.okhsl_3_slider.setMaximumHeight(maxi)
+        self.layout.okhsl_3_value.setMinimumHeight(mini)
+        self.layout.okhsl_3_value.setMaximumHeight(maxi)
+        self.layout.okhsl_3_tick.setMinimumHeight(tick)
+        self.layout.okhsl_3_tick.setMaximumHeight(tick)
+        # layout
+        self.layout.channels_okhsl.setContentsMargins(horz,vert,horz,vert)
+        self.layout.channels_okhsl.setVerticalSpacing(vert)
+        # menu
+        self.dialog.okhsl.setFont(font)
+        self.Adjust_Spacing()
+        try:
+            self.Pigment_Display()
+        except:
+            pass
 
     # Palette
     def Menu_COR(self):
@@ -4531,6 +5425,90 @@ class PigmentO_Docker(DockWidget):
             self.layout.lch_g3.setMaximumHeight(self.ui_15)
             self.layout.mixer_lch.setContentsMargins(zero, unit, zero, unit)
             self.layout.mixer_lch.setVerticalSpacing(unit)
+        if (self.menu_mix == True and self.menu_mix_index == "OKLAB"):
+            self.layout.oklab_l1.setMinimumHeight(self.ui_15)
+            self.layout.oklab_l1.setMaximumHeight(self.ui_15)
+            self.layout.oklab_l2.setMinimumHeight(self.ui_15)
+            self.layout.oklab_l2.setMaximumHeight(self.ui_15)
+            self.layout.oklab_l3.setMinimumHeight(self.ui_15)
+            self.layout.oklab_l3.setMaximumHeight(self.ui_15)
+            self.layout.oklab_r1.setMinimumHeight(self.ui_15)
+            self.layout.oklab_r1.setMaximumHeight(self.ui_15)
+            self.layout.oklab_r2.setMinimumHeight(self.ui_15)
+            self.layout.oklab_r2.setMaximumHeight(self.ui_15)
+            self.layout.oklab_r3.setMinimumHeight(self.ui_15)
+            self.layout.oklab_r3.setMaximumHeight(self.ui_15)
+            self.layout.oklab_g1.setMinimumHeight(self.ui_15)
+            self.layout.oklab_g1.setMaximumHeight(self.ui_15)
+            self.layout.oklab_g2.setMinimumHeight(self.ui_15)
+            self.layout.oklab_g2.setMaximumHeight(self.ui_15)
+            self.layout.oklab_g3.setMinimumHeight(self.ui_15)
+            self.layout.oklab_g3.setMaximumHeight(self.ui_15)
+            self.layout.mixer_oklab.setContentsMargins(zero, unit, zero, unit)
+            self.layout.mixer_oklab.setVerticalSpacing(unit)
+        if (self.menu_mix == True and self.menu_mix_index == "OKLCH"):
+            self.layout.oklch_l1.setMinimumHeight(self.ui_15)
+            self.layout.oklch_l1.setMaximumHeight(self.ui_15)
+            self.layout.oklch_l2.setMinimumHeight(self.ui_15)
+            self.layout.oklch_l2.setMaximumHeight(self.ui_15)
+            self.layout.oklch_l3.setMinimumHeight(self.ui_15)
+            self.layout.oklch_l3.setMaximumHeight(self.ui_15)
+            self.layout.oklch_r1.setMinimumHeight(self.ui_15)
+            self.layout.oklch_r1.setMaximumHeight(self.ui_15)
+            self.layout.oklch_r2.setMinimumHeight(self.ui_15)
+            self.layout.oklch_r2.setMaximumHeight(self.ui_15)
+            self.layout.oklch_r3.setMinimumHeight(self.ui_15)
+            self.layout.oklch_r3.setMaximumHeight(self.ui_15)
+            self.layout.oklch_g1.setMinimumHeight(self.ui_15)
+            self.layout.oklch_g1.setMaximumHeight(self.ui_15)
+            self.layout.oklch_g2.setMinimumHeight(self.ui_15)
+            self.layout.oklch_g2.setMaximumHeight(self.ui_15)
+            self.layout.oklch_g3.setMinimumHeight(self.ui_15)
+            self.layout.oklch_g3.setMaximumHeight(self.ui_15)
+            self.layout.mixer_oklch.setContentsMargins(zero, unit, zero, unit)
+            self.layout.mixer_oklch.setVerticalSpacing(unit)
+        if (self.menu_mix == True and self.menu_mix_index == "OKHSV"):
+            self.layout.okhsv_l1.setMinimumHeight(self.ui_15)
+            self.layout.okhsv_l1.setMaximumHeight(self.ui_15)
+            self.layout.okhsv_l2.setMinimumHeight(self.ui_15)
+            self.layout.okhsv_l2.setMaximumHeight(self.ui_15)
+            self.layout.okhsv_l3.setMinimumHeight(self.ui_15)
+            self.layout.okhsv_l3.setMaximumHeight(self.ui_15)
+            self.layout.okhsv_r1.setMinimumHeight(self.ui_15)
+            self.layout.okhsv_r1.setMaximumHeight(self.ui_15)
+            self.layout.okhsv_r2.setMinimumHeight(self.ui_15)
+            self.layout.okhsv_r2.setMaximumHeight(self.ui_15)
+            self.layout.okhsv_r3.setMinimumHeight(self.ui_15)
+            self.layout.okhsv_r3.setMaximumHeight(self.ui_15)
+            self.layout.okhsv_g1.setMinimumHeight(self.ui_15)
+            self.layout.okhsv_g1.setMaximumHeight(self.ui_15)
+            self.layout.okhsv_g2.setMinimumHeight(self.ui_15)
+            self.layout.okhsv_g2.setMaximumHeight(self.ui_15)
+            self.layout.okhsv_g3.setMinimumHeight(self.ui_15)
+            self.layout.okhsv_g3.setMaximumHeight(self.ui_15)
+            self.layout.mixer_okhsv.setContentsMargins(zero, unit, zero, unit)
+            self.layout.mixer_okhsv.setVerticalSpacing(unit)
+        if (self.menu_mix == True and self.menu_mix_index == "OKHSL"):
+            self.layout.okhsl_l1.setMinimumHeight(self.ui_15)
+            self.layout.okhsl_l1.setMaximumHeight(self.ui_15)
+            self.layout.okhsl_l2.setMinimumHeight(self.ui_15)
+            self.layout.okhsl_l2.setMaximumHeight(self.ui_15)
+            self.layout.okhsl_l3.setMinimumHeight(self.ui_15)
+            self.layout.okhsl_l3.setMaximumHeight(self.ui_15)
+            self.layout.okhsl_r1.setMinimumHeight(self.ui_15)
+            self.layout.okhsl_r1.setMaximumHeight(self.ui_15)
+            self.layout.okhsl_r2.setMinimumHeight(self.ui_15)
+            self.layout.okhsl_r2.setMaximumHeight(self.ui_15)
+            self.layout.okhsl_r3.setMinimumHeight(self.ui_15)
+            self.layout.okhsl_r3.setMaximumHeight(self.ui_15)
+            self.layout.okhsl_g1.setMinimumHeight(self.ui_15)
+            self.layout.okhsl_g1.setMaximumHeight(self.ui_15)
+            self.layout.okhsl_g2.setMinimumHeight(self.ui_15)
+            self.layout.okhsl_g2.setMaximumHeight(self.ui_15)
+            self.layout.okhsl_g3.setMinimumHeight(self.ui_15)
+            self.layout.okhsl_g3.setMaximumHeight(self.ui_15)
+            self.layout.mixer_okhsl.setContentsMargins(zero, unit, zero, unit)
+            self.layout.mixer_okhsl.setVerticalSpacing(unit)
 
         self.dialog.mix.setFont(font)
         self.menu_update = 5
@@ -4849,6 +5827,90 @@ class PigmentO_Docker(DockWidget):
         self.layout.lch_g3.setMaximumHeight(zero)
         self.layout.mixer_lch.setContentsMargins(zero, zero, zero, zero)
         self.layout.mixer_lch.setVerticalSpacing(zero)
+        # Mix OKLAB
+        self.layout.oklab_l1.setMinimumHeight(zero)
+        self.layout.oklab_l1.setMaximumHeight(zero)
+        self.layout.oklab_l2.setMinimumHeight(zero)
+        self.layout.oklab_l2.setMaximumHeight(zero)
+        self.layout.oklab_l3.setMinimumHeight(zero)
+        self.layout.oklab_l3.setMaximumHeight(zero)
+        self.layout.oklab_r1.setMinimumHeight(zero)
+        self.layout.oklab_r1.setMaximumHeight(zero)
+        self.layout.oklab_r2.setMinimumHeight(zero)
+        self.layout.oklab_r2.setMaximumHeight(zero)
+        self.layout.oklab_r3.setMinimumHeight(zero)
+        self.layout.oklab_r3.setMaximumHeight(zero)
+        self.layout.oklab_g1.setMinimumHeight(zero)
+        self.layout.oklab_g1.setMaximumHeight(zero)
+        self.layout.oklab_g2.setMinimumHeight(zero)
+        self.layout.oklab_g2.setMaximumHeight(zero)
+        self.layout.oklab_g3.setMinimumHeight(zero)
+        self.layout.oklab_g3.setMaximumHeight(zero)
+        self.layout.mixer_oklab.setContentsMargins(zero, zero, zero, zero)
+        self.layout.mixer_oklab.setVerticalSpacing(zero)
+        # Mix OKLCH
+        self.layout.oklch_l1.setMinimumHeight(zero)
+        self.layout.oklch_l1.setMaximumHeight(zero)
+        self.layout.oklch_l2.setMinimumHeight(zero)
+        self.layout.oklch_l2.setMaximumHeight(zero)
+        self.layout.oklch_l3.setMinimumHeight(zero)
+        self.layout.oklch_l3.setMaximumHeight(zero)
+        self.layout.oklch_r1.setMinimumHeight(zero)
+        self.layout.oklch_r1.setMaximumHeight(zero)
+        self.layout.oklch_r2.setMinimumHeight(zero)
+        self.layout.oklch_r2.setMaximumHeight(zero)
+        self.layout.oklch_r3.setMinimumHeight(zero)
+        self.layout.oklch_r3.setMaximumHeight(zero)
+        self.layout.oklch_g1.setMinimumHeight(zero)
+        self.layout.oklch_g1.setMaximumHeight(zero)
+        self.layout.oklch_g2.setMinimumHeight(zero)
+        self.layout.oklch_g2.setMaximumHeight(zero)
+        self.layout.oklch_g3.setMinimumHeight(zero)
+        self.layout.oklch_g3.setMaximumHeight(zero)
+        self.layout.mixer_oklch.setContentsMargins(zero, zero, zero, zero)
+        self.layout.mixer_oklch.setVerticalSpacing(zero)
+        # Mix OKHSV
+        self.layout.okhsv_l1.setMinimumHeight(zero)
+        self.layout.okhsv_l1.setMaximumHeight(zero)
+        self.layout.okhsv_l2.setMinimumHeight(zero)
+        self.layout.okhsv_l2.setMaximumHeight(zero)
+        self.layout.okhsv_l3.setMinimumHeight(zero)
+        self.layout.okhsv_l3.setMaximumHeight(zero)
+        self.layout.okhsv_r1.setMinimumHeight(zero)
+        self.layout.okhsv_r1.setMaximumHeight(zero)
+        self.layout.okhsv_r2.setMinimumHeight(zero)
+        self.layout.okhsv_r2.setMaximumHeight(zero)
+        self.layout.okhsv_r3.setMinimumHeight(zero)
+        self.layout.okhsv_r3.setMaximumHeight(zero)
+        self.layout.okhsv_g1.setMinimumHeight(zero)
+        self.layout.okhsv_g1.setMaximumHeight(zero)
+        self.layout.okhsv_g2.setMinimumHeight(zero)
+        self.layout.okhsv_g2.setMaximumHeight(zero)
+        self.layout.okhsv_g3.setMinimumHeight(zero)
+        self.layout.okhsv_g3.setMaximumHeight(zero)
+        self.layout.mixer_okhsv.setContentsMargins(zero, zero, zero, zero)
+        self.layout.mixer_okhsv.setVerticalSpacing(zero)
+        # Mix OKHSL
+        self.layout.okhsl_l1.setMinimumHeight(zero)
+        self.layout.okhsl_l1.setMaximumHeight(zero)
+        self.layout.okhsl_l2.setMinimumHeight(zero)
+        self.layout.okhsl_l2.setMaximumHeight(zero)
+        self.layout.okhsl_l3.setMinimumHeight(zero)
+        self.layout.okhsl_l3.setMaximumHeight(zero)
+        self.layout.okhsl_r1.setMinimumHeight(zero)
+        self.layout.okhsl_r1.setMaximumHeight(zero)
+        self.layout.okhsl_r2.setMinimumHeight(zero)
+        self.layout.okhsl_r2.setMaximumHeight(zero)
+        self.layout.okhsl_r3.setMinimumHeight(zero)
+        self.layout.okhsl_r3.setMaximumHeight(zero)
+        self.layout.okhsl_g1.setMinimumHeight(zero)
+        self.layout.okhsl_g1.setMaximumHeight(zero)
+        self.layout.okhsl_g2.setMinimumHeight(zero)
+        self.layout.okhsl_g2.setMaximumHeight(zero)
+        self.layout.okhsl_g3.setMinimumHeight(zero)
+        self.layout.okhsl_g3.setMaximumHeight(zero)
+        self.layout.mixer_okhsl.setContentsMargins(zero, zero, zero, zero)
+        self.layout.mixer_okhsl.setVerticalSpacing(zero)
 
     # History
     def Menu_HISTORY(self):
@@ -4856,6 +5918,7 @@ class PigmentO_Docker(DockWidget):
         if self.dialog.his.isChecked():
             font.setBold(True)
             self.dialog.his.setText("[HISTORY]")
+            self.History_Load()
             self.layout.color_history.setMinimumHeight(self.ui_15)
             self.layout.color_history.setMaximumHeight(self.ui_30)
             self.layout.color_history_layout.setContentsMargins(zero, unit, zero, unit)
@@ -4911,6 +5974,7 @@ class PigmentO_Docker(DockWidget):
             # Update
             self.aaa_1_slider.Update(self.aaa_1, self.channel_width)
             self.aaa_1_slider.update()
+        self.Mixer_Reset()
     def Menu_XYZ_Conversion(self):
         # from http://www.brucelindbloom.com/
         matrix = self.dialog.xyz_matrix.currentText()
@@ -5179,6 +6243,7 @@ class PigmentO_Docker(DockWidget):
             self.ref_x = 0.95047
             self.ref_y = 1.00
             self.ref_z = 1.08883
+        self.Mixer_Reset()
         self.update()
     def Wheel_Space(self):
         self.harmony_space = self.dialog.wheel_space.currentText() # Text
@@ -5190,9 +6255,36 @@ class PigmentO_Docker(DockWidget):
         self.performance_release = self.dialog.release.isChecked()
     def Menu_Inaccurate(self):
         self.performance_inaccurate = self.dialog.inaccurate.isChecked()
+        self.Quality_Update()
         self.Pigment_Sync()
         self.Pigment_Display()
         self.Mixer_Display()
+    # Selection
+    def Menu_Selection_Range(self):
+        self.selection_range = self.dialog.sel_range.isChecked()
+    def Menu_Selection_Fuzziness(self):
+        self.selection_fuzziness = self.dialog.sel_fuzziness.value() / 100
+    # Profiler
+    def Menu_Profiler(self):
+        profiler.Set_Active(self.dialog.profiler.isChecked())
+        if profiler.active == True:
+            self.dialog.profiler_stats.setMinimumHeight(150)
+            self.dialog.profiler_stats.setMaximumHeight(150)
+            self.profiler_timer.start(profiler_refresh)
+            self.Profiler_Statistics()
+        else:
+            self.dialog.profiler_stats.setMinimumHeight(zero)
+            self.dialog.profiler_stats.setMaximumHeight(zero)
+            self.profiler_timer.stop()
+    def Menu_Profiler_Record(self):
+        if self.dialog.profiler_record.isChecked() == True:
+            profiler.Session_Start()
+        else:
+            path = QFileDialog.getSaveFileName(self, "Save cProfile Session", os.path.join(QDir.homePath(), "pigment_o.prof"), "Profile (*.prof)")[0]
+            profiler.Session_Stop(path)
+    def Profiler_Statistics(self):
+        if self.dialog.isVisible() == True:
+            self.dialog.profiler_stats.setPlainText(profiler.Statistics())
 
     # Dockers
     def Menu_FILL(self):
@@ -5215,6 +6307,7 @@ class PigmentO_Docker(DockWidget):
             self.Selection_APPLY()
         else:
             self.layout.selection.setIcon(Krita.instance().icon('local-selection-inactive'))
+            self.Selection_Cancel()
             Krita.instance().action('deselect').trigger()
     def Menu_DOCKER(self):
         self.dialog.show()
@@ -5248,6 +6341,10 @@ class PigmentO_Docker(DockWidget):
         self.Menu_HLAB()
         self.Menu_LAB()
         self.Menu_LCH()
+        self.Menu_OKLAB()
+        self.Menu_OKLCH()
+        self.Menu_OKHSV()
+        self.Menu_OKHSL()
     def Menu_Height_Zero(self):
         # HAR
         self.layout.color_1.setMinimumHeight(self.ui_30)
@@ -5276,6 +6373,8 @@ class PigmentO_Docker(DockWidget):
         self.layout.panel_hsv.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.layout.panel_hsl.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.layout.panel_hcy.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.layout.panel_okhsv.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.layout.panel_okhsl.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.layout.panel_hue.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.dialog.hue_secondary.setEnabled(False)
         # DOT
@@ -5718,6 +6817,90 @@ class PigmentO_Docker(DockWidget):
         self.layout.lch_g3.setMaximumHeight(zero)
         self.layout.mixer_lch.setContentsMargins(zero, zero, zero, zero)
         self.layout.mixer_lch.setVerticalSpacing(zero)
+        # Mix OKLAB
+        self.layout.oklab_l1.setMinimumHeight(zero)
+        self.layout.oklab_l1.setMaximumHeight(zero)
+        self.layout.oklab_l2.setMinimumHeight(zero)
+        self.layout.oklab_l2.setMaximumHeight(zero)
+        self.layout.oklab_l3.setMinimumHeight(zero)
+        self.layout.oklab_l3.setMaximumHeight(zero)
+        self.layout.oklab_r1.setMinimumHeight(zero)
+        self.layout.oklab_r1.setMaximumHeight(zero)
+        self.layout.oklab_r2.setMinimumHeight(zero)
+        self.layout.oklab_r2.setMaximumHeight(zero)
+        self.layout.oklab_r3.setMinimumHeight(zero)
+        self.layout.oklab_r3.setMaximumHeight(zero)
+        self.layout.oklab_g1.setMinimumHeight(zero)
+        self.layout.oklab_g1.setMaximumHeight(zero)
+        self.layout.oklab_g2.setMinimumHeight(zero)
+        self.layout.oklab_g2.setMaximumHeight(zero)
+        self.layout.oklab_g3.setMinimumHeight(zero)
+        self.layout.oklab_g3.setMaximumHeight(zero)
+        self.layout.mixer_oklab.setContentsMargins(zero, zero, zero, zero)
+        self.layout.mixer_oklab.setVerticalSpacing(zero)
+        # Mix OKLCH
+        self.layout.oklch_l1.setMinimumHeight(zero)
+        self.layout.oklch_l1.setMaximumHeight(zero)
+        self.layout.oklch_l2.setMinimumHeight(zero)
+        self.layout.oklch_l2.setMaximumHeight(zero)
+        self.layout.oklch_l3.setMinimumHeight(zero)
+        self.layout.oklch_l3.setMaximumHeight(zero)
+        self.layout.oklch_r1.setMinimumHeight(zero)
+        self.layout.oklch_r1.setMaximumHeight(zero)
+        self.layout.oklch_r2.setMinimumHeight(zero)
+        self.layout.oklch_r2.setMaximumHeight(zero)
+        self.layout.oklch_r3.setMinimumHeight(zero)
+        self.layout.oklch_r3.setMaximumHeight(zero)
+        self.layout.oklch_g1.setMinimumHeight(zero)
+        self.layout.oklch_g1.setMaximumHeight(zero)
+        self.layout.oklch_g2.setMinimumHeight(zero)
+        self.layout.oklch_g2.setMaximumHeight(zero)
+        self.layout.oklch_g3.setMinimumHeight(zero)
+        self.layout.oklch_g3.setMaximumHeight(zero)
+        self.layout.mixer_oklch.setContentsMargins(zero, zero, zero, zero)
+        self.layout.mixer_oklch.setVerticalSpacing(zero)
+        # Mix OKHSV
+        self.layout.okhsv_l1.setMinimumHeight(zero)
+        self.layout.okhsv_l1.setMaximumHeight(zero)
+        self.layout.okhsv_l2.setMinimumHeight(zero)
+        self.layout.okhsv_l2.setMaximumHeight(zero)
+        self.layout.okhsv_l3.setMinimumHeight(zero)
+        self.layout.okhsv_l3.setMaximumHeight(zero)
+        self.layout.okhsv_r1.setMinimumHeight(zero)
+        self.layout.okhsv_r1.setMaximumHeight(zero)
+        self.layout.okhsv_r2.setMinimumHeight(zero)
+        self.layout.okhsv_r2.setMaximumHeight(zero)
+        self.layout.okhsv_r3.setMinimumHeight(zero)
+        self.layout.okhsv_r3.setMaximumHeight(zero)
+        self.layout.okhsv_g1.setMinimumHeight(zero)
+        self.layout.okhsv_g1.setMaximumHeight(zero)
+        self.layout.okhsv_g2.setMinimumHeight(zero)
+        self.layout.okhsv_g2.setMaximumHeight(zero)
+        self.layout.okhsv_g3.setMinimumHeight(zero)
+        self.layout.okhsv_g3.setMaximumHeight(zero)
+        self.layout.mixer_okhsv.setContentsMargins(zero, zero, zero, zero)
+        self.layout.mixer_okhsv.setVerticalSpacing(zero)
+        # Mix OKHSL
+        self.layout.okhsl_l1.setMinimumHeight(zero)
+        self.layout.okhsl_l1.setMaximumHeight(zero)
+        self.layout.okhsl_l2.setMinimumHeight(zero)
+        self.layout.okhsl_l2.setMaximumHeight(zero)
+        self.layout.okhsl_l3.setMinimumHeight(zero)
+        self.layout.okhsl_l3.setMaximumHeight(zero)
+        self.layout.okhsl_r1.setMinimumHeight(zero)
+        self.layout.okhsl_r1.setMaximumHeight(zero)
+        self.layout.okhsl_r2.setMinimumHeight(zero)
+        self.layout.okhsl_r2.setMaximumHeight(zero)
+        self.layout.okhsl_r3.setMinimumHeight(zero)
+        self.layout.okhsl_r3.setMaximumHeight(zero)
+        self.layout.okhsl_g1.setMinimumHeight(zero)
+        self.layout.okhsl_g1.setMaximumHeight(zero)
+        self.layout.okhsl_g2.setMinimumHeight(zero)
+        self.layout.okhsl_g2.setMaximumHeight(zero)
+        self.layout.okhsl_g3.setMinimumHeight(zero)
+        self.layout.okhsl_g3.setMaximumHeight(zero)
+        self.layout.mixer_okhsl.setContentsMargins(zero, zero, zero, zero)
+        self.layout.mixer_okhsl.setVerticalSpacing(zero)
 
         # History
         self.layout.color_history.setMinimumHeight(zero)
@@ -5729,271 +6912,457 @@ class PigmentO_Docker(DockWidget):
     # RGB Display of the given Color ###########################################
     def convert(self, d_cm, d_cd, d_cp, src, val):
         # Verification
-        if self.performance_inaccurate == False: # Accurate display of colors
-            # Source Color
-            if src == "AAA":
-                if (d_cm == "A" or d_cm == "GRAYA"):
-                    aaa = [val[0]]
-                if d_cm == "RGBA":
-                    rgb = [val[0], val[0], val[0]]
-                if d_cm == "CMYKA":
-                    cmyk = self.rgb_to_cmyk( val[0], val[0], val[0] )
-                if d_cm == "YCbCrA":
-                    yuv = self.rgb_to_yuv( val[0], val[0], val[0] )
-                if d_cm == "XYZA":
-                    xyz = self.rgb_to_xyz( val[0], val[0], val[0] )
-                if d_cm == "LABA":
-                    lab = self.rgb_to_lab( val[0], val[0], val[0] )
-            if src == "RGB":
-                if (d_cm == "A" or d_cm == "GRAYA"):
-                    aaa = self.rgb_to_aaa(val[0], val[1], val[2])
-                if d_cm == "RGBA":
-                    rgb = [val[0], val[1], val[2]]
-                if d_cm == "CMYKA":
-                    cmyk = self.rgb_to_cmyk(val[0], val[1], val[2])
-                if d_cm == "YCbCrA":
-                    yuv = self.rgb_to_yuv(val[0], val[1], val[2])
-                if d_cm == "XYZA":
-                    xyz = self.rgb_to_xyz(val[0], val[1], val[2])
-                if d_cm == "LABA":
-                    lab = self.rgb_to_lab(val[0], val[1], val[2])
-            if src == "CMY":
-                if (d_cm == "A" or d_cm == "GRAYA"):
-                    aaa = self.rgb_to_aaa( *self.cmy_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "RGBA":
-                    rgb = self.cmy_to_rgb(val[0], val[1], val[2])
-                if d_cm == "CMYKA":
-                    cmyk = self.rgb_to_cmyk( *self.cmy_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "YCbCrA":
-                    yuv = self.rgb_to_yuv( *self.cmy_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "XYZA":
-                    xyz = self.rgb_to_xyz( *self.cmy_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "LABA":
-                    lab = self.rgb_to_lab( *self.cmy_to_rgb(val[0], val[1], val[2]) )
-            if src == "CMYK":
-                if (d_cm == "A" or d_cm == "GRAYA"):
-                    aaa = self.rgb_to_aaa( *self.cmyk_to_rgb(val[0], val[1], val[2], val[3]) )
-                if d_cm == "RGBA":
-                    rgb = self.cmyk_to_rgb(val[0], val[1], val[2], val[3])
-                if d_cm == "CMYKA":
-                    cmyk = [val[0], val[1], val[2], val[3]]
-                if d_cm == "YCbCrA":
-                    yuv = self.rgb_to_yuv( *self.cmyk_to_rgb(val[0], val[1], val[2], val[3]) )
-                if d_cm == "XYZA":
-                    xyz = self.rgb_to_xyz( *self.cmyk_to_rgb(val[0], val[1], val[2], val[3]) )
-                if d_cm == "LABA":
-                    lab = self.rgb_to_lab( *self.cmyk_to_rgb(val[0], val[1], val[2], val[3]) )
-            if src == "RYB":
-                if (d_cm == "A" or d_cm == "GRAYA"):
-                    aaa = self.rgb_to_aaa( *self.ryb_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "RGBA":
-                    rgb = self.ryb_to_rgb(val[0], val[1], val[2])
-                if d_cm == "CMYKA":
-                    cmyk = self.rgb_to_cmyk( *self.ryb_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "YCbCrA":
-                    yuv = self.rgb_to_yuv( *self.ryb_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "XYZA":
-                    xyz = self.rgb_to_xyz( *self.ryb_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "LABA":
-                    lab = self.rgb_to_lab( *self.ryb_to_rgb(val[0], val[1], val[2]) )
-            if src == "YUV":
-                if (d_cm == "A" or d_cm == "GRAYA"):
-                    aaa = self.rgb_to_aaa( *self.yuv_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "RGBA":
-                    rgb = self.yuv_to_rgb(val[0], val[1], val[2])
-                if d_cm == "CMYKA":
-                    cmyk = self.rgb_to_cmyk( *self.yuv_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "YCbCrA":
-                    yuv = [val[0], val[1], val[2]]
-                if d_cm == "XYZA":
-                    xyz = self.rgb_to_xyz( *self.yuv_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "LABA":
-                    lab = self.rgb_to_lab( *self.yuv_to_rgb(val[0], val[1], val[2]) )
-            if src == "ARD":
-                if (d_cm == "A" or d_cm == "GRAYA"):
-                    aaa = self.rgb_to_aaa( *self.ard_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "RGBA":
-                    rgb = self.ard_to_rgb(val[0], val[1], val[2])
-                if d_cm == "CMYKA":
-                    cmyk = self.rgb_to_cmyk( *self.ard_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "YCbCrA":
-                    yuv = self.rgb_to_yuv( *self.ard_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "XYZA":
-                    xyz = self.rgb_to_xyz( *self.ard_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "LABA":
-                    lab = self.rgb_to_lab( *self.ard_to_rgb(val[0], val[1], val[2]) )
-            if src == "HSV":
-                if (d_cm == "A" or d_cm == "GRAYA"):
-                    aaa = self.rgb_to_aaa( *self.hsv_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "RGBA":
-                    rgb = self.hsv_to_rgb(val[0], val[1], val[2])
-                if d_cm == "CMYKA":
-                    cmyk = self.rgb_to_cmyk( *self.hsv_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "YCbCrA":
-                    yuv = self.rgb_to_yuv( *self.hsv_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "XYZA":
-                    xyz = self.rgb_to_xyz( *self.hsv_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "LABA":
-                    lab = self.rgb_to_lab( *self.hsv_to_rgb(val[0], val[1], val[2]) )
-            if src == "HSL":
-                if (d_cm == "A" or d_cm == "GRAYA"):
-                    aaa = self.rgb_to_aaa( *self.hsl_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "RGBA":
-                    rgb = self.hsl_to_rgb(val[0], val[1], val[2])
-                if d_cm == "CMYKA":
-                    cmyk = self.rgb_to_cmyk( *self.hsl_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "YCbCrA":
-                    yuv = self.rgb_to_yuv( *self.hsl_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "XYZA":
-                    xyz = self.rgb_to_xyz( *self.hsl_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "LABA":
-                    lab = self.rgb_to_lab( *self.hsl_to_rgb(val[0], val[1], val[2]) )
-            if src == "HCY":
-                if (d_cm == "A" or d_cm == "GRAYA"):
-                    aaa = self.rgb_to_aaa( *self.hcy_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "RGBA":
-                    rgb = self.hcy_to_rgb(val[0], val[1], val[2])
-                if d_cm == "CMYKA":
-                    cmyk = self.rgb_to_cmyk( *self.hcy_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "YCbCrA":
-                    yuv = self.rgb_to_yuv( *self.hcy_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "XYZA":
-                    xyz = self.rgb_to_xyz( *self.hcy_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "LABA":
-                    lab = self.rgb_to_lab( *self.hcy_to_rgb(val[0], val[1], val[2]) )
-            if src == "XYZ":
-                if (d_cm == "A" or d_cm == "GRAYA"):
-                    aaa = self.rgb_to_aaa( *self.xyz_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "RGBA":
-                    rgb = self.xyz_to_rgb(val[0], val[1], val[2])
-                if d_cm == "CMYKA":
-                    cmyk = self.rgb_to_cmyk( *self.xyz_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "YCbCrA":
-                    yuv = self.rgb_to_yuv( *self.xyz_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "XYZA":
-                    xyz = [val[0], val[1], val[2]]
-                if d_cm == "LABA":
-                    lab = self.xyz_to_lab(val[0], val[1], val[2])
-            if src == "XYY":
-                if (d_cm == "A" or d_cm == "GRAYA"):
-                    aaa = self.rgb_to_aaa( *self.xyz_to_rgb( *self.xyy_to_xyz(val[0], val[1], val[2]) ) )
-                if d_cm == "RGBA":
-                    rgb = self.xyz_to_rgb( *self.xyy_to_xyz(val[0], val[1], val[2]) )
-                if d_cm == "CMYKA":
-                    cmyk = self.rgb_to_cmyk( *self.xyz_to_rgb( *self.xyy_to_xyz(val[0], val[1], val[2]) ) )
-                if d_cm == "YCbCrA":
-                    yuv = self.rgb_to_yuv( *self.xyz_to_rgb( *self.xyy_to_xyz(val[0], val[1], val[2]) ) )
-                if d_cm == "XYZA":
-                    xyz = self.xyy_to_xyz(val[0], val[1], val[2])
-                if d_cm == "LABA":
-                    lab = self.xyz_to_lab( *self.xyy_to_xyz(val[0], val[1], val[2]) )
-            if src == "LAB":
-                if (d_cm == "A" or d_cm == "GRAYA"):
-                    aaa = self.rgb_to_aaa( *self.lab_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "RGBA":
-                    rgb = self.lab_to_rgb(val[0], val[1], val[2])
-                if d_cm == "CMYKA":
-                    cmyk = self.rgb_to_cmyk( *self.lab_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "YCbCrA":
-                    yuv = self.rgb_to_yuv( *self.lab_to_rgb(val[0], val[1], val[2]) )
-                if d_cm == "XYZA":
-                    xyz = self.lab_to_xyz(val[0], val[1], val[2])
-                if d_cm == "LABA":
-                    lab = [val[0], val[1], val[2]]
-            # Apply Components to Document
-            if ((self.canvas() is not None) and (self.canvas().view() is not None)):
-                mc = ManagedColor(d_cm, d_cd, d_cp)
-                if (d_cm == "A" or d_cm == "GRAYA"):
-                    mc.setComponents([aaa[0], 1.0])
-                if d_cm == "RGBA":
-                    if (d_cd == "U8" or d_cd == "U16"):
-                        mc.setComponents([rgb[2], rgb[1], rgb[0], 1.0])
-                    if (d_cd == "F16" or d_cd == "F32"):
-                        mc.setComponents([rgb[0], rgb[1], rgb[2], 1.0])
-                if d_cm == "CMYKA":
-                    mc.setComponents([cmyk[0], cmyk[1], cmyk[2], cmyk[3], 1.0])
-                if d_cm == "YCbCrA":
-                    mc.setComponents([yuv[0], yuv[1], yuv[2], 1.0])
-                if d_cm == "XYZA":
-                    mc.setComponents([xyz[0], xyz[1], xyz[2], 1.0])
-                if d_cm == "LABA":
-                    mc.setComponents([lab[0], lab[1], lab[2], 1.0])
-                av = Krita.instance().activeWindow().activeView()
-                cfc = mc.colorForCanvas(av.canvas())
-                r = cfc.redF()
-                g = cfc.greenF()
-                b = cfc.blueF()
-            else:
-                r = rgb[0]
-                g = rgb[1]
-                b = rgb[2]
+        if self.quality == "FINE": # Accurate display of colors
+            if (d_cm == "CMYKA" or d_cd in ("F16", "F32")):
+                # Black generation and values above 1 are lost in an RGB cube
+                return self.convert_canvas(d_cm, d_cd, d_cp, src, val)
+            lut = self.Display_LUT(d_cm, d_cd, d_cp)
+            if (lut is None or (src in ("XYZ", "XYY", "LAB") and d_cm in ("XYZA", "LABA"))):
+                # Per sample conversion while the LUT builds or when RGB would clip the Source
+                return self.convert_canvas(d_cm, d_cd, d_cp, src, val)
+            return self.Display_LUT_Sample(lut, self.convert_rgb(src, val))
         else: # Inaccurate display of colors but faster
-            if src == "AAA":
-                r = val[0]
-                g = val[0]
-                b = val[0]
-            if src == "RGB":
-                r = val[0]
-                g = val[1]
-                b = val[2]
-            if src == "CMY":
+            return self.convert_rgb(src, val)
+    def convert_canvas(self, d_cm, d_cd, d_cp, src, val):
+        # Source Color
+        if src == "AAA":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = [val[0]]
+            if d_cm == "RGBA":
+                rgb = [val[0], val[0], val[0]]
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( val[0], val[0], val[0] )
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( val[0], val[0], val[0] )
+            if d_cm == "XYZA":
+                xyz = self.rgb_to_xyz( val[0], val[0], val[0] )
+            if d_cm == "LABA":
+                lab = self.rgb_to_lab( val[0], val[0], val[0] )
+        if src == "RGB":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa(val[0], val[1], val[2])
+            if d_cm == "RGBA":
+                rgb = [val[0], val[1], val[2]]
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk(val[0], val[1], val[2])
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv(val[0], val[1], val[2])
+            if d_cm == "XYZA":
+                xyz = self.rgb_to_xyz(val[0], val[1], val[2])
+            if d_cm == "LABA":
+                lab = self.rgb_to_lab(val[0], val[1], val[2])
+        if src == "CMY":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.cmy_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "RGBA":
                 rgb = self.cmy_to_rgb(val[0], val[1], val[2])
-                r = rgb[0]
-                g = rgb[1]
-                b = rgb[2]
-            if src == "CMYK":
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( *self.cmy_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( *self.cmy_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "XYZA":
+                xyz = self.rgb_to_xyz( *self.cmy_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "LABA":
+                lab = self.rgb_to_lab( *self.cmy_to_rgb(val[0], val[1], val[2]) )
+        if src == "CMYK":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.cmyk_to_rgb(val[0], val[1], val[2], val[3]) )
+            if d_cm == "RGBA":
                 rgb = self.cmyk_to_rgb(val[0], val[1], val[2], val[3])
-                r = rgb[0]
-                g = rgb[1]
-                b = rgb[2]
-            if src == "RYB":
+            if d_cm == "CMYKA":
+                cmyk = [val[0], val[1], val[2], val[3]]
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( *self.cmyk_to_rgb(val[0], val[1], val[2], val[3]) )
+            if d_cm == "XYZA":
+                xyz = self.rgb_to_xyz( *self.cmyk_to_rgb(val[0], val[1], val[2], val[3]) )
+            if d_cm == "LABA":
+                lab = self.rgb_to_lab( *self.cmyk_to_rgb(val[0], val[1], val[2], val[3]) )
+        if src == "RYB":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.ryb_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "RGBA":
                 rgb = self.ryb_to_rgb(val[0], val[1], val[2])
-                r = rgb[0]
-                g = rgb[1]
-                b = rgb[2]
-            if src == "YUV":
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( *self.ryb_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( *self.ryb_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "XYZA":
+                xyz = self.rgb_to_xyz( *self.ryb_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "LABA":
+                lab = self.rgb_to_lab( *self.ryb_to_rgb(val[0], val[1], val[2]) )
+        if src == "YUV":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.yuv_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "RGBA":
                 rgb = self.yuv_to_rgb(val[0], val[1], val[2])
-                r = rgb[0]
-                g = rgb[1]
-                b = rgb[2]
-            if src == "ARD":
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( *self.yuv_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "YCbCrA":
+                yuv = [val[0], val[1], val[2]]
+            if d_cm == "XYZA":
+                xyz = self.rgb_to_xyz( *self.yuv_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "LABA":
+                lab = self.rgb_to_lab( *self.yuv_to_rgb(val[0], val[1], val[2]) )
+        if src == "ARD":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.ard_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "RGBA":
                 rgb = self.ard_to_rgb(val[0], val[1], val[2])
-                r = rgb[0]
-                g = rgb[1]
-                b = rgb[2]
-            if src == "HSV":
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( *self.ard_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( *self.ard_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "XYZA":
+                xyz = self.rgb_to_xyz( *self.ard_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "LABA":
+                lab = self.rgb_to_lab( *self.ard_to_rgb(val[0], val[1], val[2]) )
+        if src == "HSV":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.hsv_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "RGBA":
                 rgb = self.hsv_to_rgb(val[0], val[1], val[2])
-                r = rgb[0]
-                g = rgb[1]
-                b = rgb[2]
-            if src == "HSL":
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( *self.hsv_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( *self.hsv_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "XYZA":
+                xyz = self.rgb_to_xyz( *self.hsv_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "LABA":
+                lab = self.rgb_to_lab( *self.hsv_to_rgb(val[0], val[1], val[2]) )
+        if src == "HSL":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.hsl_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "RGBA":
                 rgb = self.hsl_to_rgb(val[0], val[1], val[2])
-                r = rgb[0]
-                g = rgb[1]
-                b = rgb[2]
-            if src == "HCY":
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( *self.hsl_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( *self.hsl_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "XYZA":
+                xyz = self.rgb_to_xyz( *self.hsl_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "LABA":
+                lab = self.rgb_to_lab( *self.hsl_to_rgb(val[0], val[1], val[2]) )
+        if src == "HCY":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.hcy_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "RGBA":
                 rgb = self.hcy_to_rgb(val[0], val[1], val[2])
-                r = rgb[0]
-                g = rgb[1]
-                b = rgb[2]
-            if src == "XYZ":
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( *self.hcy_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( *self.hcy_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "XYZA":
+                xyz = self.rgb_to_xyz( *self.hcy_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "LABA":
+                lab = self.rgb_to_lab( *self.hcy_to_rgb(val[0], val[1], val[2]) )
+        if src == "OKLAB":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.oklab_channels_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "RGBA":
+                rgb = self.oklab_channels_to_rgb(val[0], val[1], val[2])
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( *self.oklab_channels_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( *self.oklab_channels_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "XYZA":
+                xyz = self.rgb_to_xyz( *self.oklab_channels_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "LABA":
+                lab = self.rgb_to_lab( *self.oklab_channels_to_rgb(val[0], val[1], val[2]) )
+        if src == "OKLCH":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.oklch_channels_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "RGBA":
+                rgb = self.oklch_channels_to_rgb(val[0], val[1], val[2])
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( *self.oklch_channels_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( *self.oklch_channels_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "XYZA":
+                xyz = self.rgb_to_xyz( *self.oklch_channels_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "LABA":
+                lab = self.rgb_to_lab( *self.oklch_channels_to_rgb(val[0], val[1], val[2]) )
+        if src == "OKHSV":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.okhsv_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "RGBA":
+                rgb = self.okhsv_to_rgb(val[0], val[1], val[2])
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( *self.okhsv_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( *self.okhsv_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "XYZA":
+                xyz = self.rgb_to_xyz( *self.okhsv_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "LABA":
+                lab = self.rgb_to_lab( *self.okhsv_to_rgb(val[0], val[1], val[2]) )
+        if src == "OKHSL":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.okhsl_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "RGBA":
+                rgb = self.okhsl_to_rgb(val[0], val[1], val[2])
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( *self.okhsl_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( *self.okhsl_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "XYZA":
+                xyz = self.rgb_to_xyz( *self.okhsl_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "LABA":
+                lab = self.rgb_to_lab( *self.okhsl_to_rgb(val[0], val[1], val[2]) )
+        if src == "XYZ":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.xyz_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "RGBA":
                 rgb = self.xyz_to_rgb(val[0], val[1], val[2])
-                r = rgb[0]
-                g = rgb[1]
-                b = rgb[2]
-            if src == "XYY":
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( *self.xyz_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( *self.xyz_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "XYZA":
+                xyz = [val[0], val[1], val[2]]
+            if d_cm == "LABA":
+                lab = self.xyz_to_lab(val[0], val[1], val[2])
+        if src == "XYY":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.xyz_to_rgb( *self.xyy_to_xyz(val[0], val[1], val[2]) ) )
+            if d_cm == "RGBA":
                 rgb = self.xyz_to_rgb( *self.xyy_to_xyz(val[0], val[1], val[2]) )
-                r = rgb[0]
-                g = rgb[1]
-                b = rgb[2]
-            if src == "LAB":
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( *self.xyz_to_rgb( *self.xyy_to_xyz(val[0], val[1], val[2]) ) )
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( *self.xyz_to_rgb( *self.xyy_to_xyz(val[0], val[1], val[2]) ) )
+            if d_cm == "XYZA":
+                xyz = self.xyy_to_xyz(val[0], val[1], val[2])
+            if d_cm == "LABA":
+                lab = self.xyz_to_lab( *self.xyy_to_xyz(val[0], val[1], val[2]) )
+        if src == "LAB":
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                aaa = self.rgb_to_aaa( *self.lab_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "RGBA":
                 rgb = self.lab_to_rgb(val[0], val[1], val[2])
-                r = rgb[0]
-                g = rgb[1]
-                b = rgb[2]
+            if d_cm == "CMYKA":
+                cmyk = self.rgb_to_cmyk( *self.lab_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "YCbCrA":
+                yuv = self.rgb_to_yuv( *self.lab_to_rgb(val[0], val[1], val[2]) )
+            if d_cm == "XYZA":
+                xyz = self.lab_to_xyz(val[0], val[1], val[2])
+            if d_cm == "LABA":
+                lab = [val[0], val[1], val[2]]
+        # Apply Components to Document
+        if ((self.canvas() is not None) and (self.canvas().view() is not None)):
+            mc = ManagedColor(d_cm, d_cd, d_cp)
+            if (d_cm == "A" or d_cm == "GRAYA"):
+                mc.setComponents([aaa[0], 1.0])
+            if d_cm == "RGBA":
+                if (d_cd == "U8" or d_cd == "U16"):
+                    mc.setComponents([rgb[2], rgb[1], rgb[0], 1.0])
+                if (d_cd == "F16" or d_cd == "F32"):
+                    mc.setComponents([rgb[0], rgb[1], rgb[2], 1.0])
+            if d_cm == "CMYKA":
+                mc.setComponents([cmyk[0], cmyk[1], cmyk[2], cmyk[3], 1.0])
+            if d_cm == "YCbCrA":
+                mc.setComponents([yuv[0], yuv[1], yuv[2], 1.0])
+            if d_cm == "XYZA":
+                mc.setComponents([xyz[0], xyz[1], xyz[2], 1.0])
+            if d_cm == "LABA":
+                mc.setComponents([lab[0], lab[1], lab[2], 1.0])
+            av = Krita.instance().activeWindow().activeView()
+            cfc = mc.colorForCanvas(av.canvas())
+            r = cfc.redF()
+            g = cfc.greenF()
+            b = cfc.blueF()
+        else:
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        return [r, g, b]
+    def convert_rgb(self, src, val):
+        if src == "AAA":
+            r = val[0]
+            g = val[0]
+            b = val[0]
+        if src == "RGB":
+            r = val[0]
+            g = val[1]
+            b = val[2]
+        if src == "CMY":
+            rgb = self.cmy_to_rgb(val[0], val[1], val[2])
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        if src == "CMYK":
+            rgb = self.cmyk_to_rgb(val[0], val[1], val[2], val[3])
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        if src == "RYB":
+            rgb = self.ryb_to_rgb(val[0], val[1], val[2])
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        if src == "YUV":
+            rgb = self.yuv_to_rgb(val[0], val[1], val[2])
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        if src == "ARD":
+            rgb = self.ard_to_rgb(val[0], val[1], val[2])
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        if src == "HSV":
+            rgb = self.hsv_to_rgb(val[0], val[1], val[2])
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        if src == "HSL":
+            rgb = self.hsl_to_rgb(val[0], val[1], val[2])
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        if src == "HCY":
+            rgb = self.hcy_to_rgb(val[0], val[1], val[2])
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        if src == "OKLAB":
+            rgb = self.oklab_channels_to_rgb(val[0], val[1], val[2])
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        if src == "OKLCH":
+            rgb = self.oklch_channels_to_rgb(val[0], val[1], val[2])
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        if src == "OKHSV":
+            rgb = self.okhsv_to_rgb(val[0], val[1], val[2])
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        if src == "OKHSL":
+            rgb = self.okhsl_to_rgb(val[0], val[1], val[2])
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        if src == "XYZ":
+            rgb = self.xyz_to_rgb(val[0], val[1], val[2])
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        if src == "XYY":
+            rgb = self.xyz_to_rgb( *self.xyy_to_xyz(val[0], val[1], val[2]) )
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
+        if src == "LAB":
+            rgb = self.lab_to_rgb(val[0], val[1], val[2])
+            r = rgb[0]
+            g = rgb[1]
+            b = rgb[2]
         return [r, g, b]
 
 
+    # Display LUT ##############################################################
+    def Display_LUT(self, d_cm, d_cd, d_cp):
+        # Cube of the Krita canvas conversion of the Document, None while it builds
+        key = (d_cm, d_cd, d_cp)
+        if key == self.lut_key:
+            return self.lut
+        if (self.lut_timer is None or (self.canvas() is None) or (self.canvas().view() is None)):
+            return None
+        self.lut = None
+        self.lut_key = key
+        self.lut_build = None
+        self.lut_timer.stop()
+        path = self.Display_LUT_Path(d_cm, d_cd, d_cp)
+        lut = self.Display_LUT_Load(path)
+        if lut is not None:
+            self.lut = lut
+        else:
+            self.lut_build = [path, array.array("f", bytes(12 * display_lut_size**3))]
+            self.lut_index = zero
+            self.lut_timer.start()
+        return self.lut
+    def Display_LUT_Path(self, d_cm, d_cd, d_cp):
+        # Profile contents are not exposed, so a few probe conversions stand in for them
+        probes = []
+        for rgb in ([0, 0, 0], [1, 1, 1], [1, 0, 0], [0, 1, 0], [0, 0, 1], [0.5, 0.5, 0.5], [0.2, 0.6, 0.9]):
+            probes.extend([round(value, 4) for value in self.convert_canvas(d_cm, d_cd, d_cp, "RGB", rgb)])
+        name = "".join([c if c.isalnum() else "_" for c in d_cp])[:48]
+        digest = hashlib.sha1(repr((display_lut_format, display_lut_size, d_cm, d_cd, d_cp, probes)).encode("utf-8")).hexdigest()
+        folder = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.CacheLocation)
+        return os.path.join(folder, "pigment_o", "lut_{0}_{1}_{2}_{3}.bin".format(d_cm, d_cd, name, digest[:16]))
+    def Display_LUT_Load(self, path):
+        lut = array.array("f")
+        try:
+            with open(path, "rb") as file:
+                lut.fromfile(file, 3 * display_lut_size**3)
+        except (OSError, EOFError):
+            return None
+        return lut
+    def Display_LUT_Save(self, path, lut):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                lut.tofile(file)
+        except OSError:
+            pass
+    def Display_LUT_Step(self):
+        # Krita conversions run on the main thread, a chunk of samples per step
+        if (self.lut_build is None or self.lut_key is None):
+            return
+        if ((self.canvas() is None) or (self.canvas().view() is None)):
+            # Resumes on the next conversion with a canvas
+            self.lut_key = None
+            self.lut_build = None
+            return
+        d_cm, d_cd, d_cp = self.lut_key
+        path, lut = self.lut_build
+        n = display_lut_size
+        s = 1 / (n - 1)
+        total = n**3
+        end = min(self.lut_index + display_lut_chunk, total)
+        for i in range(self.lut_index, end):
+            rgb = self.convert_canvas(d_cm, d_cd, d_cp, "RGB", [(i // (n * n)) * s, ((i // n) % n) * s, (i % n) * s])
+            lut[i * 3] = rgb[0]
+            lut[i * 3 + 1] = rgb[1]
+            lut[i * 3 + 2] = rgb[2]
+        self.lut_index = end
+        if end < total:
+            self.lut_timer.start()
+        else:
+            self.lut = lut
+            self.lut_build = None
+            self.Display_LUT_Save(path, lut)
+    def Display_LUT_Sample(self, lut, rgb):
+        # Trilinear interpolation of the cube
+        n = display_lut_size
+        m = n - 1
+        cell = []
+        for value in rgb:
+            x = min(max(value, 0), 1) * m
+            i = min(int(x), m - 1)
+            cell.append((i, x - i))
+        (ri, rf), (gi, gf), (bi, bf) = cell
+        i000 = ((ri * n + gi) * n + bi) * 3
+        i001 = i000 + 3
+        i010 = i000 + n * 3
+        i011 = i010 + 3
+        i100 = i000 + n * n * 3
+        i101 = i100 + 3
+        i110 = i100 + n * 3
+        i111 = i110 + 3
+        out = []
+        for c in range(3):
+            c00 = lut[i000 + c] + (lut[i001 + c] - lut[i000 + c]) * bf
+            c01 = lut[i010 + c] + (lut[i011 + c] - lut[i010 + c]) * bf
+            c10 = lut[i100 + c] + (lut[i101 + c] - lut[i100 + c]) * bf
+            c11 = lut[i110 + c] + (lut[i111 + c] - lut[i110 + c]) * bf
+            c0 = c00 + (c01 - c00) * gf
+            c1 = c10 + (c11 - c10) * gf
+            out.append(c0 + (c1 - c0) * rf)
+        return out
+
+
     # Gray Contrast ############################################################
     def gc(self, r, g, b):
         value = self.rgb_to_aaa(r, g, b)[0]
@@ -6238,6 +7607,16 @@ class PigmentO_Docker(DockWidget):
             b = 1
         return [r, g, b]
     def uvd_hexagon_origins(self, d):
+        # Geometry of this Depth already in place
+        if d == self.hexagon_d:
+            return
+        self.hexagon_d = d
+        geometry = self.hexagon_cache.get(d)
+        if geometry is not None:
+            (self.O1, self.O2, self.O3, self.O4, self.O5, self.O6,
+            self.OCC, self.O12, self.O23, self.O34, self.O45, self.O56, self.O61,
+            self.REDAXIS, self.hexagon_red, self.hexagon_axis) = geometry
+            return
         # Values
         w1 = 0.8660253882408142
         h1 = 0.5000000596046448
@@ -6292,6 +7671,20 @@ class PigmentO_Docker(DockWidget):
         self.O61 = [self.O6[0] + ((self.O1[0] - self.O6[0]) / 2), self.O6[1] + ((self.O1[1] - self.O6[1]) / 2)]
         # Angle to Red Axis as Origin
         self.REDAXIS = self.Math_2D_Points_Lines_Angle(10, 0, 0, 0, self.O45[0], self.O45[1])
+        # Angles of every Point to the Red Axis and to the +U Axis
+        self.hexagon_red = {}
+        self.hexagon_axis = {}
+        for name in ("O1", "O2", "O3", "O4", "O5", "O6", "O12", "O23", "O34", "O45", "O56", "O61"):
+            point = getattr(self, name)
+            self.hexagon_red[name] = self.Math_2D_Points_Lines_Angle(point[0], point[1], 0, 0, self.O45[0], self.O45[1])
+            self.hexagon_axis[name] = self.Math_2D_Points_Lines_Angle(point[0], point[1], 0, 0, 1, 0)
+        # Cache
+        if len(self.hexagon_cache) >= hexagon_limit:
+            del self.hexagon_cache[next(iter(self.hexagon_cache))]
+        self.hexagon_cache[d] = (
+            self.O1, self.O2, self.O3, self.O4, self.O5, self.O6,
+            self.OCC, self.O12, self.O23, self.O34, self.O45, self.O56, self.O61,
+            self.REDAXIS, self.hexagon_red, self.hexagon_axis)
     def uvd_to_ard(self, u, v, d):
         # Update Origin Points
         self.uvd_hexagon_origins(d)
@@ -6315,8 +7708,8 @@ class PigmentO_Docker(DockWidget):
         elif (diagonal > 0 and diagonal <= 1):
             # Angles according to O45(RED) as Origin
             AR = 0 # RED
-            AG = self.Math_2D_Points_Lines_Angle(self.O23[0], self.O23[1], 0, 0, self.O45[0], self.O45[1]) # GREEN
-            AB = self.Math_2D_Points_Lines_Angle(self.O61[0], self.O61[1], 0, 0, self.O45[0], self.O45[1]) # BLUE
+            AG = self.hexagon_red["O23"] # GREEN
+            AB = self.hexagon_red["O61"] # BLUE
             # Certain
             if arc == AR:
                 total = self.Math_2D_Points_Distance(0, 0, self.O45[0], self.O45[1])
@@ -6336,12 +7729,12 @@ class PigmentO_Docker(DockWidget):
                 total = self.Math_2D_Points_Distance(0, 0, inter[0], inter[1])
         elif (diagonal > 1 and diagonal < 2):
             # Angles according to O45(RED) as Origin
-            A1 = self.Math_2D_Points_Lines_Angle(self.O1[0], self.O1[1], 0, 0, self.O45[0], self.O45[1]) # O1
-            A2 = self.Math_2D_Points_Lines_Angle(self.O2[0], self.O2[1], 0, 0, self.O45[0], self.O45[1]) # O2
-            A3 = self.Math_2D_Points_Lines_Angle(self.O3[0], self.O3[1], 0, 0, self.O45[0], self.O45[1]) # O3
-            A4 = self.Math_2D_Points_Lines_Angle(self.O4[0], self.O4[1], 0, 0, self.O45[0], self.O45[1]) # O4
-            A5 = self.Math_2D_Points_Lines_Angle(self.O5[0], self.O5[1], 0, 0, self.O45[0], self.O45[1]) # O5
-            A6 = self.Math_2D_Points_Lines_Angle(self.O6[0], self.O6[1], 0, 0, self.O45[0], self.O45[1]) # O6
+            A1 = self.hexagon_red["O1"] # O1
+            A2 = self.hexagon_red["O2"] # O2
+            A3 = self.hexagon_red["O3"] # O3
+            A4 = self.hexagon_red["O4"] # O4
+            A5 = self.hexagon_red["O5"] # O5
+            A6 = self.hexagon_red["O6"] # O6
             # Certain
             if arc == A1:
                 total = self.Math_2D_Points_Distance(0, 0, self.O1[0], self.O1[1])
@@ -6376,9 +7769,9 @@ class PigmentO_Docker(DockWidget):
                 total = self.Math_2D_Points_Distance(0, 0, inter[0], inter[1])
         elif (diagonal >= 2 and diagonal < 3):
             # Angles according to O45(RED) as Origin
-            AY = self.Math_2D_Points_Lines_Angle(self.O34[0], self.O34[1], 0, 0, self.O45[0], self.O45[1]) # YELLOW
-            AC = self.Math_2D_Points_Lines_Angle(self.O12[0], self.O12[1], 0, 0, self.O45[0], self.O45[1]) # CYAN
-            AM = self.Math_2D_Points_Lines_Angle(self.O56[0], self.O56[1], 0, 0, self.O45[0], self.O45[1]) # MAGENTA
+            AY = self.hexagon_red["O34"] # YELLOW
+            AC = self.hexagon_red["O12"] # CYAN
+            AM = self.hexagon_red["O56"] # MAGENTA
             # Certain
             if arc == AY:
                 total = self.Math_2D_Points_Distance(0, 0, self.O34[0], self.O34[1])
@@ -6436,9 +7829,9 @@ class PigmentO_Docker(DockWidget):
             total = 1
         elif (diagonal > 0 and diagonal <= 1):
             # Angles according to +U(UVD) as Origin
-            AR = self.Math_2D_Points_Lines_Angle(self.O45[0], self.O45[1], 0, 0, 1, 0) # RED
-            AG = self.Math_2D_Points_Lines_Angle(self.O23[0], self.O23[1], 0, 0, 1, 0) # GREEN
-            AB = self.Math_2D_Points_Lines_Angle(self.O61[0], self.O61[1], 0, 0, 1, 0) # BLUE
+            AR = self.hexagon_axis["O45"] # RED
+            AG = self.hexagon_axis["O23"] # GREEN
+            AB = self.hexagon_axis["O61"] # BLUE
             # Certain
             if arc == AR: # RED
                 total = self.Math_2D_Points_Distance(0, 0, self.O45[0], self.O45[1])
@@ -6458,12 +7851,12 @@ class PigmentO_Docker(DockWidget):
                 total = self.Math_2D_Points_Distance(0, 0, inter[0], inter[1])
         elif (diagonal > 1 and diagonal < 2):
             # Angles according to +U(UVD) as Origin
-            A1 = self.Math_2D_Points_Lines_Angle(self.O1[0], self.O1[1], 0, 0, 1, 0) # P1
-            A2 = self.Math_2D_Points_Lines_Angle(self.O2[0], self.O2[1], 0, 0, 1, 0) # P2
-            A3 = self.Math_2D_Points_Lines_Angle(self.O3[0], self.O3[1], 0, 0, 1, 0) # P3
-            A4 = self.Math_2D_Points_Lines_Angle(self.O4[0], self.O4[1], 0, 0, 1, 0) # P4
-            A5 = self.Math_2D_Points_Lines_Angle(self.O5[0], self.O5[1], 0, 0, 1, 0) # P5
-            A6 = self.Math_2D_Points_Lines_Angle(self.O6[0], self.O6[1], 0, 0, 1, 0) # P6
+            A1 = self.hexagon_axis["O1"] # P1
+            A2 = self.hexagon_axis["O2"] # P2
+            A3 = self.hexagon_axis["O3"] # P3
+            A4 = self.hexagon_axis["O4"] # P4
+            A5 = self.hexagon_axis["O5"] # P5
+            A6 = self.hexagon_axis["O6"] # P6
             # Certain
             if arc == A1:
                 total = self.Math_2D_Points_Distance(0, 0, self.O1[0], self.O1[1])
@@ -6507,9 +7900,9 @@ class PigmentO_Docker(DockWidget):
                     total = self.Math_2D_Points_Distance(0, 0, inter[0], inter[1])
         elif (diagonal >= 2 and diagonal < 3):
             # Angles according to +U(UVD) as Origin
-            AY = self.Math_2D_Points_Lines_Angle(self.O34[0], self.O34[1], 0, 0, 1, 0) # YELLOW
-            AC = self.Math_2D_Points_Lines_Angle(self.O12[0], self.O12[1], 0, 0, 1, 0) # CYAN
-            AM = self.Math_2D_Points_Lines_Angle(self.O56[0], self.O56[1], 0, 0, 1, 0) # MAGENTA
+            AY = self.hexagon_axis["O34"] # YELLOW
+            AC = self.hexagon_axis["O12"] # CYAN
+            AM = self.hexagon_axis["O56"] # MAGENTA
             # Certain
             if arc == AY:
                 total = self.Math_2D_Points_Distance(0, 0, self.O34[0], self.O34[1])
@@ -7363,197 +8756,422 @@ class PigmentO_Docker(DockWidget):
         lab = self.lch_to_lab(x, y, z)
         xyz = self.lab_to_xyz(lab[0], lab[1], lab[2])
         return [xyz[0], xyz[1], xyz[2]]
+    # OKLAB
+    def rgb_to_oklab(self, r, g, b):
+        # OKLAB is defined on Linear sRGB
+        if self.d_cd == "U8":
+            lsl = self.srgb_to_lrgb(r, g, b)
+            r = lsl[0]
+            g = lsl[1]
+            b = lsl[2]
+        l = 0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b
+        m = 0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b
+        s = 0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b
+        l = math.copysign(abs(l) ** (1 / 3), l)
+        m = math.copysign(abs(m) ** (1 / 3), m)
+        s = math.copysign(abs(s) ** (1 / 3), s)
+        ol = 0.2104542553 * l + 0.7936177850 * m - 0.0040720468 * s
+        oa = 1.9779984951 * l - 2.4285922050 * m + 0.4505937099 * s
+        ob = 0.0259040371 * l + 0.7827717662 * m - 0.8086757660 * s
+        return [ol, oa, ob]
+    def oklab_to_rgb(self, ol, oa, ob):
+        r, g, b = self.oklab_to_lrgb(ol, oa, ob)
+        # In case Krita is in Gamma Format
+        if self.d_cd == "U8":
+            lsl = self.lrgb_to_srgb(r, g, b)
+            r = lsl[0]
+            g = lsl[1]
+            b = lsl[2]
+        return [r, g, b]
+    def oklab_to_lrgb(self, ol, oa, ob):
+        l = ol + 0.3963377774 * oa + 0.2158037573 * ob
+        m = ol - 0.1055613458 * oa - 0.0638541728 * ob
+        s = ol - 0.0894841775 * oa - 1.2914855480 * ob
+        l = l * l * l
+        m = m * m * m
+        s = s * s * s
+        r = 4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s
+        g = -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s
+        b = -0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s
+        return [r, g, b]
+    # OKLCH
+    def oklab_to_oklch(self, ol, oa, ob):
+        c = math.sqrt(oa * oa + ob * ob)
+        if c < ok_gray:
+            h = self.angle_ok
+        else:
+            h = (math.atan2(ob, oa) / (2 * math.pi)) % 1
+        return [ol, c, h]
+    def oklch_to_oklab(self, ol, c, h):
+        oa = c * math.cos(2 * math.pi * h)
+        ob = c * math.sin(2 * math.pi * h)
+        return [ol, oa, ob]
+    def rgb_to_oklch(self, r, g, b):
+        return self.oklab_to_oklch( *self.rgb_to_oklab(r, g, b) )
+    def oklch_to_rgb(self, ol, c, h):
+        return self.oklab_to_rgb( *self.oklch_to_oklab(ol, c, h) )
+    # OKHSV and OKHSL
+    def ok_toe(self, x):
+        k1 = 0.206
+        k2 = 0.03
+        k3 = (1 + k1) / (1 + k2)
+        return 0.5 * (k3 * x - k1 + math.sqrt((k3 * x - k1) ** 2 + 4 * k2 * k3 * x))
+    def ok_toe_inv(self, x):
+        k1 = 0.206
+        k2 = 0.03
+        k3 = (1 + k1) / (1 + k2)
+        return (x * x + k1 * x) / (k3 * (x + k2))
+    def ok_max_saturation(self, a, b):
+        # Saturation of the sRGB edge for the hue (a, b), polynomial guess and one Halley step
+        if -1.88170328 * a - 0.80936493 * b > 1: # Red
+            k0, k1, k2, k3, k4 = 1.19086277, 1.76576728, 0.59662641, 0.75515197, 0.56771245
+            wl, wm, ws = 4.0767416621, -3.3077115913, 0.2309699292
+        elif 1.81444104 * a - 1.19445276 * b > 1: # Green
+            k0, k1, k2, k3, k4 = 0.73956515, -0.45954404, 0.08285427, 0.12541070, 0.14503204
+            wl, wm, ws = -1.2684380046, 2.6097574011, -0.3413193965
+        else: # Blue
+            k0, k1, k2, k3, k4 = 1.35733652, -0.00915799, -1.15130210, -0.50559606, 0.00692167
+            wl, wm, ws = -0.0041960863, -0.7034186147, 1.7076147010
+        sat = k0 + k1 * a + k2 * b + k3 * a * a + k4 * a * b
+        k_l = 0.3963377774 * a + 0.2158037573 * b
+        k_m = -0.1055613458 * a - 0.0638541728 * b
+        k_s = -0.0894841775 * a - 1.2914855480 * b
+        l_ = 1 + sat * k_l
+        m_ = 1 + sat * k_m
+        s_ = 1 + sat * k_s
+        f = wl * l_ * l_ * l_ + wm * m_ * m_ * m_ + ws * s_ * s_ * s_
+        f1 = 3 * (wl * k_l * l_ * l_ + wm * k_m * m_ * m_ + ws * k_s * s_ * s_)
+        f2 = 6 * (wl * k_l * k_l * l_ + wm * k_m * k_m * m_ + ws * k_s * k_s * s_)
+        return sat - f * f1 / (f1 * f1 - 0.5 * f * f2)
+    def ok_cusp_search(self, a, b):
+        sat = self.ok_max_saturation(a, b)
+        rgb = self.oklab_to_lrgb(1, sat * a, sat * b)
+        l_cusp = (1 / max(rgb)) ** (1 / 3)
+        return [l_cusp, l_cusp * sat]
+    def ok_cusp(self, h):
+        # Cusp of the sRGB gamut read from the per hue table
+        if self.ok_cusp_table is None:
+            # Primaries and secondaries are nodes so the corners of the cusp line stay sharp
+            hues = [i / ok_cusp_steps for i in range(ok_cusp_steps)]
+            for rgb in ([1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 1, 1], [0, 0, 1], [1, 0, 1]):
+                hues.append(self.rgb_to_oklch(rgb[0], rgb[1], rgb[2])[2])
+            hues.sort()
+            cusps = []
+            for hue in hues:
+                cusps.append(self.ok_cusp_search(math.cos(2 * math.pi * hue), math.sin(2 * math.pi * hue)))
+            hues.append(hues[0] + 1)
+            cusps.append(cusps[0])
+            self.ok_cusp_table = [hues, cusps]
+        hues, cusps = self.ok_cusp_table
+        h = h % 1
+        i = bisect.bisect_right(hues, h) - 1
+        f = (h - hues[i]) / (hues[i + 1] - hues[i])
+        c0 = cusps[i]
+        c1 = cusps[i + 1]
+        return [c0[0] + (c1[0] - c0[0]) * f, c0[1] + (c1[1] - c0[1]) * f]
+    def ok_gamut_intersection(self, a, b, l1, c1, l0, cusp):
+        # Distance along the line (l0, 0) to (l1, c1) until the sRGB gamut edge
+        if ((l1 - l0) * cusp[1] - (cusp[0] - l0) * c1) <= 0:
+            t = cusp[1] * l0 / (c1 * cusp[0] + cusp[1] * (l0 - l1))
+        else:
+            t = cusp[1] * (l0 - 1) / (c1 * (cusp[0] - 1) + cusp[1] * (l0 - l1))
+            # Halley step towards the edge of the upper half
+            dl = l1 - l0
+            dc = c1
+            k_l = 0.3963377774 * a + 0.2158037573 * b
+            k_m = -0.1055613458 * a - 0.0638541728 * b
+            k_s = -0.0894841775 * a - 1.2914855480 * b
+            l_dt = dl + dc * k_l
+            m_dt = dl + dc * k_m
+            s_dt = dl + dc * k_s
+            lum = l0 * (1 - t) + t * l1
+            chroma = t * c1
+            l_ = lum + chroma * k_l
+            m_ = lum + chroma * k_m
+            s_ = lum + chroma * k_s
+            l = l_ * l_ * l_
+            m = m_ * m_ * m_
+            s = s_ * s_ * s_
+            ldt = 3 * l_dt * l_ * l_
+            mdt = 3 * m_dt * m_ * m_
+            sdt = 3 * s_dt * s_ * s_
+            ldt2 = 6 * l_dt * l_dt * l_
+            mdt2 = 6 * m_dt * m_dt * m_
+            sdt2 = 6 * s_dt * s_dt * s_
+            step = float("inf")
+            for wl, wm, ws in (
+                (4.0767416621, -3.3077115913, 0.2309699292),
+                (-1.2684380046, 2.6097574011, -0.3413193965),
+                (-0.0041960863, -0.7034186147, 1.7076147010),
+                ):
+                f = wl * l + wm * m + ws * s - 1
+                f1 = wl * ldt + wm * mdt + ws * sdt
+                f2 = wl * ldt2 + wm * mdt2 + ws * sdt2
+                u = f1 / (f1 * f1 - 0.5 * f * f2)
+                if u >= 0:
+                    step = min(step, -f * u)
+            t += step
+        return t
+    def ok_cs(self, lum, a, b, cusp):
+        # Chroma at zero, mid and max saturation for OKHSL
+        c_max = self.ok_gamut_intersection(a, b, lum, 1, lum, cusp)
+        s_max = cusp[1] / cusp[0]
+        t_max = cusp[1] / (1 - cusp[0])
+        k = c_max / min(lum * s_max, (1 - lum) * t_max)
+        s_mid = 0.11516993 + 1 / (7.44778970 + 4.15901240 * b + a * (-2.19557347 + 1.75198401 * b + a * (-2.13704948 - 10.02301043 * b + a * (-4.24894561 + 5.38770819 * b + 4.69891013 * a))))
+        t_mid = 0.11239642 + 1 / (1.61320320 - 0.68124379 * b + a * (0.40370612 + 0.90148123 * b + a * (-0.27087943 + 0.61223990 * b + a * (0.00299215 - 0.45399568 * b - 0.14661872 * a))))
+        c_a = lum * s_mid
+        c_b = (1 - lum) * t_mid
+        c_mid = 0.9 * k * math.sqrt(math.sqrt(1 / (1 / (c_a ** 4) + 1 / (c_b ** 4))))
+        c_a = lum * 0.4
+        c_b = (1 - lum) * 0.8
+        c_0 = math.sqrt(1 / (1 / (c_a * c_a) + 1 / (c_b * c_b)))
+        return [c_0, c_mid, c_max]
+    def rgb_to_okhsv(self, r, g, b):
+        ol, oa, ob = self.rgb_to_oklab(r, g, b)
+        c = math.sqrt(oa * oa + ob * ob)
+        if ol <= 0:
+            return [self.angle_ok, 0, 0]
+        if c < ok_gray:
+            return [self.angle_ok, 0, min(self.ok_toe(ol), 1)]
+        h = (math.atan2(ob, oa) / (2 * math.pi)) % 1
+        a_ = oa / c
+        b_ = ob / c
+        cusp = self.ok_cusp(h)
+        s_max = cusp[1] / cusp[0]
+        t_max = cusp[1] / (1 - cusp[0])
+        s_0 = 0.5
+        k = 1 - s_0 / s_max
+        t = t_max / (c + ol * t_max)
+        l_v = t * ol
+        c_v = t * c
+        l_vt = self.ok_toe_inv(l_v)
+        c_vt = c_v * l_vt / l_v
+        rgb_scale = self.oklab_to_lrgb(l_vt, a_ * c_vt, b_ * c_vt)
+        scale_l = (1 / max(rgb_scale[0], rgb_scale[1], rgb_scale[2], 0)) ** (1 / 3)
+        ol = ol / scale_l
+        ol_toe = self.ok_toe(ol)
+        v = ol_toe / l_v
+        s = (s_0 + t_max) * c_v / ((t_max * s_0) + t_max * k * c_v)
+        return [h, min(max(s, 0), 1), min(max(v, 0), 1)]
+    def okhsv_to_rgb(self, h, s, v):
+        if v <= 0:
+            return self.oklab_to_rgb(0, 0, 0)
+        a_ = math.cos(2 * math.pi * h)
+        b_ = math.sin(2 * math.pi * h)
+        cusp = self.ok_cusp(h)
+        s_max = cusp[1] / cusp[0]
+        t_max = cusp[1] / (1 - cusp[0])
+        s_0 = 0.5
+        k = 1 - s_0 / s_max
+        l_v = 1 - s * s_0 / (s_0 + t_max - t_max * k * s)
+        c_v = s * t_max * s_0 / (s_0 + t_max - t_max * k * s)
+        ol = v * l_v
+        c = v * c_v
+        l_vt = self.ok_toe_inv(l_v)
+        c_vt = c_v * l_vt / l_v
+        ol_new = self.ok_toe_inv(ol)
+        c = c * ol_new / ol
+        ol = ol_new
+        rgb_scale = self.oklab_to_lrgb(l_vt, a_ * c_vt, b_ * c_vt)
+        scale_l = (1 / max(rgb_scale[0], rgb_scale[1], rgb_scale[2], 0)) ** (1 / 3)
+        return self.ok_clip( *self.oklab_to_lrgb(ol * scale_l, c * scale_l * a_, c * scale_l * b_) )
+    def rgb_to_okhsl(self, r, g, b):
+        ol, oa, ob = self.rgb_to_oklab(r, g, b)
+        c = math.sqrt(oa * oa + ob * ob)
+        if (ol <= 0 or ol >= 1 - ok_gray or c < ok_gray):
+            return [self.angle_ok, 0, min(max(self.ok_toe(max(ol, 0)), 0), 1)]
+        h = (math.atan2(ob, oa) / (2 * math.pi)) % 1
+        a_ = oa / c
+        b_ = ob / c
+        c_0, c_mid, c_max = self.ok_cs(ol, a_, b_, self.ok_cusp(h))
+        mid = 0.8
+        mid_inv = 1.25
+        if c < c_mid:
+            k_1 = mid * c_0
+            k_2 = 1 - k_1 / c_mid
+            t = c / (k_1 + k_2 * c)
+            s = t * mid
+        else:
+            k_0 = c_mid
+            k_1 = (1 - mid) * c_mid * c_mid * mid_inv * mid_inv / c_0
+            k_2 = 1 - k_1 / (c_max - c_mid)
+            t = (c - k_0) / (k_1 + k_2 * (c - k_0))
+            s = mid + (1 - mid) * t
+        return [h, min(max(s, 0), 1), min(max(self.ok_toe(ol), 0), 1)]
+    def okhsl_to_rgb(self, h, s, l):
+        if l >= 1:
+            return self.oklab_to_rgb(1, 0, 0)
+        if l <= 0:
+            return self.oklab_to_rgb(0, 0, 0)
+        a_ = math.cos(2 * math.pi * h)
+        b_ = math.sin(2 * math.pi * h)
+        ol = self.ok_toe_inv(l)
+        c_0, c_mid, c_max = self.ok_cs(ol, a_, b_, self.ok_cusp(h))
+        mid = 0.8
+        mid_inv = 1.25
+        if s < mid:
+            t = mid_inv * s
+            k_1 = mid * c_0
+            k_2 = 1 - k_1 / c_mid
+            c = t * k_1 / (1 - k_2 * t)
+        else:
+            t = (s - mid) / (1 - mid)
+            k_0 = c_mid
+            k_1 = (1 - mid) * c_mid * c_mid * mid_inv * mid_inv / c_0
+            k_2 = 1 - k_1 / (c_max - c_mid)
+            c = k_0 + t * k_1 / (1 - k_2 * t)
+        return self.ok_clip( *self.oklab_to_lrgb(ol, c * a_, c * b_) )
+    def okhsv_to_rgb_batch(self, colors):
+        # Same as okhsv_to_rgb with the hue terms solved once per hue and the gamut scale once per hue and saturation
+        s_0 = 0.5
+        hues = {}
+        scales = {}
+        rgb = []
+        for h, s, v in colors:
+            if v <= 0:
+                rgb.append(self.oklab_to_rgb(0, 0, 0))
+                continue
+            try:
+                a_, b_, t_max, k = hues[h]
+            except KeyError:
+                a_ = math.cos(2 * math.pi * h)
+                b_ = math.sin(2 * math.pi * h)
+                cusp = self.ok_cusp(h)
+                s_max = cusp[1] / cusp[0]
+                t_max = cusp[1] / (1 - cusp[0])
+                k = 1 - s_0 / s_max
+                hues[h] = [a_, b_, t_max, k]
+            try:
+                l_v, c_v, scale_l = scales[h, s]
+            except KeyError:
+                l_v = 1 - s * s_0 / (s_0 + t_max - t_max * k * s)
+                c_v = s * t_max * s_0 / (s_0 + t_max - t_max * k * s)
+                l_vt = self.ok_toe_inv(l_v)
+                c_vt = c_v * l_vt / l_v
+                rgb_scale = self.oklab_to_lrgb(l_vt, a_ * c_vt, b_ * c_vt)
+                scale_l = (1 / max(rgb_scale[0], rgb_scale[1], rgb_scale[2], 0)) ** (1 / 3)
+                scales[h, s] = [l_v, c_v, scale_l]
+            ol = v * l_v
+            c = v * c_v
+            ol_new = self.ok_toe_inv(ol)
+            c = c * ol_new / ol
+            ol = ol_new
+            rgb.append(self.ok_clip( *self.oklab_to_lrgb(ol * scale_l, c * scale_l * a_, c * scale_l * b_) ))
+        return rgb
+    def okhsl_to_rgb_batch(self, colors):
+        # Same as okhsl_to_rgb with the hue terms solved once per hue and the chroma limits once per hue and lightness
+        mid = 0.8
+        mid_inv = 1.25
+        hues = {}
+        limits = {}
+        rgb = []
+        for h, s, l in colors:
+            if l >= 1:
+                rgb.append(self.oklab_to_rgb(1, 0, 0))
+                continue
+            if l <= 0:
+                rgb.append(self.oklab_to_rgb(0, 0, 0))
+                continue
+            try:
+                a_, b_, cusp = hues[h]
+            except KeyError:
+                a_ = math.cos(2 * math.pi * h)
+                b_ = math.sin(2 * math.pi * h)
+                cusp = self.ok_cusp(h)
+                hues[h] = [a_, b_, cusp]
+            try:
+                ol, c_0, c_mid, c_max = limits[h, l]
+            except KeyError:
+                ol = self.ok_toe_inv(l)
+                c_0, c_mid, c_max = self.ok_cs(ol, a_, b_, cusp)
+                limits[h, l] = [ol, c_0, c_mid, c_max]
+            if s < mid:
+                t = mid_inv * s
+                k_1 = mid * c_0
+                k_2 = 1 - k_1 / c_mid
+                c = t * k_1 / (1 - k_2 * t)
+            else:
+                t = (s - mid) / (1 - mid)
+                k_0 = c_mid
+                k_1 = (1 - mid) * c_mid * c_mid * mid_inv * mid_inv / c_0
+                k_2 = 1 - k_1 / (c_max - c_mid)
+                c = k_0 + t * k_1 / (1 - k_2 * t)
+            rgb.append(self.ok_clip( *self.oklab_to_lrgb(ol, c * a_, c * b_) ))
+        return rgb
+    def ok_clip(self, r, g, b):
+        # Linear sRGB inside the gamut to the Document
+        r = min(max(r, 0), 1)
+        g = min(max(g, 0), 1)
+        b = min(max(b, 0), 1)
+        if self.d_cd == "U8":
+            return self.lrgb_to_srgb(r, g, b)
+        return [r, g, b]
+    def rgb_to_oklab_channels(self, r, g, b):
+        # OKLAB with a and b centered on 0.5
+        ol, oa, ob = self.rgb_to_oklab(r, g, b)
+        ch1 = min(max(ol, 0), 1)
+        ch2 = min(max(0.5 + 0.5 * oa / ok_ab, 0), 1)
+        ch3 = min(max(0.5 + 0.5 * ob / ok_ab, 0), 1)
+        return [ch1, ch2, ch3]
+    def oklab_channels_to_rgb(self, ch1, ch2, ch3):
+        return self.ok_clip( *self.oklab_to_lrgb(ch1, (ch2 - 0.5) * 2 * ok_ab, (ch3 - 0.5) * 2 * ok_ab) )
+    def rgb_to_oklch_channels(self, r, g, b):
+        # OKLCH with chroma scaled by its reach
+        ol, c, h = self.rgb_to_oklch(r, g, b)
+        return [min(max(ol, 0), 1), min(c / ok_c, 1), h]
+    def oklch_channels_to_rgb(self, ch1, ch2, ch3):
+        return self.ok_clip( *self.oklab_to_lrgb( *self.oklch_to_oklab(ch1, ch2 * ok_c, ch3) ) )
 
 
     # Luminosity Locks
-    def luma_lock_ard(self, hi, si, xi):
-        # Lock Values
-        hl = self.luma_lock_value[0]
-        sl = self.luma_lock_value[1]
-        xl = self.luma_lock_value[2]
-        rl, gl, bl = self.ard_to_rgb(hl, sl, xl)
-        aaa_l = self.rgb_to_aaa(rl, gl, bl)[0]
-        # Input Values
-        ri, gi, bi = self.ard_to_rgb(hi, sl, xl)
-        aaa_i = self.rgb_to_aaa(ri, gi, bi)[0]
-        # Create the Perceptual Grey of the Input Color
-        dri = ri - aaa_i
-        dgi = gi - aaa_i
-        dbi = bi - aaa_i
+    def luma_lock_solve(self, space, hi, xi):
+        to_rgb = getattr(self, space.lower() + "_to_rgb")
+        # Lock Values and their Offsets from the Perceptual Gray per Hue (built once per Lock)
+        key = (space, tuple(self.luma_lock_value), self.d_cd, self.luma_r, self.luma_b, self.gamma_l, self.gamma_y)
+        if self.luma_lock_key != key:
+            hl, sl, xl = self.luma_lock_value
+            offsets = array.array("d")
+            for i in range(luma_lock_steps + 1):
+                ri, gi, bi = to_rgb(i / luma_lock_steps, sl, xl)
+                aaa_i = self.rgb_to_aaa(ri, gi, bi)[0]
+                offsets.extend((ri - aaa_i, gi - aaa_i, bi - aaa_i))
+            self.luma_lock_key = key
+            self.luma_lock_aaa = self.rgb_to_aaa( *to_rgb(hl, sl, xl) )[0]
+            self.luma_lock_offsets = offsets
+        aaa_l = self.luma_lock_aaa
+        offsets = self.luma_lock_offsets
+        # Input Offsets by Hue Interpolation
+        x = (hi % 1) * luma_lock_steps
+        i = int(x)
+        if i >= luma_lock_steps:
+            i = luma_lock_steps - 1
+        f = x - i
+        i0 = i * 3
+        i1 = i0 + 3
         # Shift the Color to the correct level of Perceptual Gray (First Solve)
-        r = aaa_l + dri
-        g = aaa_l + dgi
-        b = aaa_l + dbi
-        # Full Saturation State Descrimination
-        sat = self.rgb_to_ard(r, g, b)[1]
-        if sat >= 1:
-            # HSV variation with maximum saturation
-            rs, gs, bs = self.ard_to_rgb(hi, 1, xi)
+        r = aaa_l + offsets[i0] + (offsets[i1] - offsets[i0]) * f
+        g = aaa_l + offsets[i0 + 1] + (offsets[i1 + 1] - offsets[i0 + 1]) * f
+        b = aaa_l + offsets[i0 + 2] + (offsets[i1 + 2] - offsets[i0 + 2]) * f
+        # Full Saturation State Descrimination (the shift left the gamut, HSV only clips below)
+        if (min(r, g, b) <= 0 or (space != "HSV" and max(r, g, b) >= 1)):
+            # Variation with maximum saturation
+            rs, gs, bs = to_rgb(hi, 1, xi)
             aaa_s = self.rgb_to_aaa(rs, gs, bs)[0]
-            # Create the Perceptual Grey of the Saturated Color
-            drs = rs - aaa_s
-            dgs = gs - aaa_s
-            dbs = bs - aaa_s
             # Shift the Color to the correct level of Perceptual Gray (Second Solve)
-            r = aaa_l + drs
-            g = aaa_l + dgs
-            b = aaa_l + dbs
+            r = aaa_l + rs - aaa_s
+            g = aaa_l + gs - aaa_s
+            b = aaa_l + bs - aaa_s
         # Correct Excess Values
-        if r<=0:
-            r=0
-        if r>=1:
-            r=1
-        if g<=0:
-            g=0
-        if g>=1:
-            g=1
-        if b<=0:
-            b=0
-        if b>=1:
-            b=1
-        # Return Color Vector
-        return [r, g, b]
+        return [min(max(r, 0), 1), min(max(g, 0), 1), min(max(b, 0), 1)]
+    def luma_lock_ard(self, hi, si, xi):
+        return self.luma_lock_solve("ARD", hi, xi)
     def luma_lock_hsv(self, hi, si, xi):
-        # Lock Values
-        hl = self.luma_lock_value[0]
-        sl = self.luma_lock_value[1]
-        xl = self.luma_lock_value[2]
-        rl, gl, bl = self.hsv_to_rgb(hl, sl, xl)
-        aaa_l = self.rgb_to_aaa(rl, gl, bl)[0]
-        # Input Values
-        ri, gi, bi = self.hsv_to_rgb(hi, sl, xl)
-        aaa_i = self.rgb_to_aaa(ri, gi, bi)[0]
-        # Create the Perceptual Grey of the Input Color
-        dri = ri - aaa_i
-        dgi = gi - aaa_i
-        dbi = bi - aaa_i
-        # Shift the Color to the correct level of Perceptual Gray (First Solve)
-        r = aaa_l + dri
-        g = aaa_l + dgi
-        b = aaa_l + dbi
-        # Full Saturation State Descrimination
-        sat = self.rgb_to_hsv(r, g, b)[1]
-        if sat >= 1:
-            # HSV variation with maximum saturation
-            rs, gs, bs = self.hsv_to_rgb(hi, 1, xi)
-            aaa_s = self.rgb_to_aaa(rs, gs, bs)[0]
-            # Create the Perceptual Grey of the Saturated Color
-            drs = rs - aaa_s
-            dgs = gs - aaa_s
-            dbs = bs - aaa_s
-            # Shift the Color to the correct level of Perceptual Gray (Second Solve)
-            r = aaa_l + drs
-            g = aaa_l + dgs
-            b = aaa_l + dbs
-        # Correct Excess Values
-        if r<=0:
-            r=0
-        if r>=1:
-            r=1
-        if g<=0:
-            g=0
-        if g>=1:
-            g=1
-        if b<=0:
-            b=0
-        if b>=1:
-            b=1
-        # Return Color Vector
-        return [r, g, b]
+        return self.luma_lock_solve("HSV", hi, xi)
     def luma_lock_hsl(self, hi, si, xi):
-        # Lock Values
-        hl = self.luma_lock_value[0]
-        sl = self.luma_lock_value[1]
-        xl = self.luma_lock_value[2]
-        rl, gl, bl = self.hsl_to_rgb(hl, sl, xl)
-        aaa_l = self.rgb_to_aaa(rl, gl, bl)[0]
-        # Input Values
-        ri, gi, bi = self.hsl_to_rgb(hi, sl, xl)
-        aaa_i = self.rgb_to_aaa(ri, gi, bi)[0]
-        # Create the Perceptual Grey of the Input Color
-        dri = ri - aaa_i
-        dgi = gi - aaa_i
-        dbi = bi - aaa_i
-        # Shift the Color to the correct level of Perceptual Gray (First Solve)
-        r = aaa_l + dri
-        g = aaa_l + dgi
-        b = aaa_l + dbi
-        # Full Saturation State Descrimination
-        sat = self.rgb_to_hsl(r, g, b)[1]
-        if sat >= 1:
-            # HSL variation with maximum saturation
-            rs, gs, bs = self.hsl_to_rgb(hi, 1, xi)
-            aaa_s = self.rgb_to_aaa(rs, gs, bs)[0]
-            # Create the Perceptual Grey of the Saturated Color
-            drs = rs - aaa_s
-            dgs = gs - aaa_s
-            dbs = bs - aaa_s
-            # Shift the Color to the correct level of Perceptual Gray (Second Solve)
-            r = aaa_l + drs
-            g = aaa_l + dgs
-            b = aaa_l + dbs
-        # Correct Excess Values
-        if r<=0:
-            r=0
-        if r>=1:
-            r=1
-        if g<=0:
-            g=0
-        if g>=1:
-            g=1
-        if b<=0:
-            b=0
-        if b>=1:
-            b=1
-        # Return Color Vector
-        return [r, g, b]
+        return self.luma_lock_solve("HSL", hi, xi)
     def luma_lock_hcy(self, hi, si, xi):
-        # Lock Values
-        hl = self.luma_lock_value[0]
-        sl = self.luma_lock_value[1]
-        xl = self.luma_lock_value[2]
-        rl, gl, bl = self.hcy_to_rgb(hl, sl, xl)
-        aaa_l = self.rgb_to_aaa(rl, gl, bl)[0]
-        # Input Values
-        ri, gi, bi = self.hcy_to_rgb(hi, sl, xl)
-        aaa_i = self.rgb_to_aaa(ri, gi, bi)[0]
-        # Create the Perceptual Grey of the Input Color
-        dri = ri - aaa_i
-        dgi = gi - aaa_i
-        dbi = bi - aaa_i
-        # Shift the Color to the correct level of Perceptual Gray (First Solve)
-        r = aaa_l + dri
-        g = aaa_l + dgi
-        b = aaa_l + dbi
-        # Full Saturation State Descrimination
-        sat = self.rgb_to_hcy(r, g, b)[1]
-        if sat >= 1:
-            # HSL variation with maximum saturation
-            rs, gs, bs = self.hcy_to_rgb(hi, 1, xi)
-            aaa_s = self.rgb_to_aaa(rs, gs, bs)[0]
-            # Create the Perceptual Grey of the Saturated Color
-            drs = rs - aaa_s
-            dgs = gs - aaa_s
-            dbs = bs - aaa_s
-            # Shift the Color to the correct level of Perceptual Gray (Second Solve)
-            r = aaa_l + drs
-            g = aaa_l + dgs
-            b = aaa_l + dbs
-        # Correct Excess Values
-        if r<=0:
-            r=0
-        if r>=1:
-            r=1
-        if g<=0:
-            g=0
-        if g>=1:
-            g=1
-        if b<=0:
-            b=0
-        if b>=1:
-            b=1
-        # Return Color Vector
-        return [r, g, b]
+        return self.luma_lock_solve("HCY", hi, xi)
 
     #//
     #\\ Trignometry ############################################################
@@ -7618,6 +9236,7 @@ class PigmentO_Docker(DockWidget):
         except:
             pass
 
+    @Profiled
     def Krita_2_Pigment(self):
         # Check Theme
         krita_value = QApplication.palette().color(QPalette.Window).value()
@@ -7819,6 +9438,7 @@ class PigmentO_Docker(DockWidget):
                 pass
         else:
             self.node = None
+    @Profiled
     def Pigment_2_Krita(self, release):
         # Operating System case sensitive Hold Color until the controler is Released for Linux Users
         check_release = self.performance_release == False or (self.performance_release == True and release == True)
@@ -7958,7 +9578,7 @@ class PigmentO_Docker(DockWidget):
                         fg_color.setComponents(fg_comp)
                         fg_display = fg_color.colorForCanvas(Krita.instance().activeWindow().activeView().canvas())
                         # Display Colors
-                        if self.performance_inaccurate == True:
+                        if self.quality == "DRAFT":
                             self.disp_1 = self.rgb_1
                             self.disp_2 = self.rgb_2
                             self.disp_3 = self.rgb_3
@@ -7981,7 +9601,7 @@ class PigmentO_Docker(DockWidget):
                         bg_color.setComponents(bg_comp)
                         bg_display = bg_color.colorForCanvas(Krita.instance().activeWindow().activeView().canvas())
                         # Display Colors
-                        if self.performance_inaccurate == True:
+                        if self.quality == "DRAFT":
                             self.disp_bg1 = self.rgb_bg1
                             self.disp_bg2 = self.rgb_bg2
                             self.disp_bg3 = self.rgb_bg3
@@ -8438,8 +10058,23 @@ class PigmentO_Docker(DockWidget):
         if mode == "LAB":
             rgb = self.lab_to_rgb(val1, val2, val3)
             hue = self.rgb_to_hue(rgb[0], rgb[1], rgb[2])
+        if mode == "OKLAB":
+            rgb = self.oklab_channels_to_rgb(val1, val2, val3)
+            hue = self.rgb_to_hue(rgb[0], rgb[1], rgb[2])
+        if mode == "OKLCH":
+            rgb = self.oklch_channels_to_rgb(val1, val2, val3)
+            hue = self.rgb_to_hue(rgb[0], rgb[1], rgb[2])
+        if mode == "OKHSV":
+            rgb = self.okhsv_to_rgb(val1, val2, val3)
+            hue = self.rgb_to_hue(rgb[0], rgb[1], rgb[2])
+        if mode == "OKHSL":
+            rgb = self.okhsl_to_rgb(val1, val2, val3)
+            hue = self.rgb_to_hue(rgb[0], rgb[1], rgb[2])
         self.angle_live = hue[0]
+    @Profiled
     def Color_APPLY(self, mode, val1, val2, val3, val4):
+        # Draft Quality while Dragging
+        self.Quality_Drag()
         #\\ Convert to RGB+XYZ
         if (mode == "AAA" or mode == "A" or mode == "GRAYA"):
             aaa = [val1]
@@ -8514,6 +10149,26 @@ class PigmentO_Docker(DockWidget):
             lab = [val1, val2, val3]
             xyz = self.lab_to_xyz(lab[0], lab[1], lab[2])
             rgb = self.lab_to_rgb(lab[0], lab[1], lab[2])
+
+        if mode == "OKLAB":
+            oklab = [val1, val2, val3]
+            rgb = self.oklab_channels_to_rgb(oklab[0], oklab[1], oklab[2])
+            xyz = self.rgb_to_xyz(rgb[0], rgb[1], rgb[2])
+        if mode == "OKLCH":
+            oklch = [val1, val2, val3]
+            rgb = self.oklch_channels_to_rgb(oklch[0], oklch[1], oklch[2])
+            xyz = self.rgb_to_xyz(rgb[0], rgb[1], rgb[2])
+            self.angle_ok = val3
+        if mode == "OKHSV":
+            okhsv = [val1, val2, val3]
+            rgb = self.okhsv_to_rgb(okhsv[0], okhsv[1], okhsv[2])
+            xyz = self.rgb_to_xyz(rgb[0], rgb[1], rgb[2])
+            self.angle_ok = val1
+        if mode == "OKHSL":
+            okhsl = [val1, val2, val3]
+            rgb = self.okhsl_to_rgb(okhsl[0], okhsl[1], okhsl[2])
+            xyz = self.rgb_to_xyz(rgb[0], rgb[1], rgb[2])
+            self.angle_ok = val1
         #//
         #\\ Convert RGB+XYZ into Other
         if mode != "AAA":
@@ -8567,6 +10222,29 @@ class PigmentO_Docker(DockWidget):
             xyy = self.xyz_to_xyy(xyz[0], xyz[1], xyz[2])
         if (mode != "LAB" and mode != "LABA"):
             lab = self.xyz_to_lab(xyz[0], xyz[1], xyz[2])
+
+        if mode != "OKLAB":
+            oklab = self.rgb_to_oklab_channels(rgb[0], rgb[1], rgb[2])
+        if mode != "OKLCH":
+            conv = self.rgb_to_oklch_channels(rgb[0], rgb[1], rgb[2])
+            if (mode == "OKHSV" or mode == "OKHSL"):
+                oklch = [conv[0], conv[1], self.angle_ok]
+            else:
+                oklch = [conv[0], conv[1], conv[2]]
+        if mode != "OKHSV":
+            conv = self.rgb_to_okhsv(rgb[0], rgb[1], rgb[2])
+            if (mode == "OKLCH" or mode == "OKHSL"):
+                okhsv = [self.angle_ok, conv[1], conv[2]]
+            else:
+                okhsv = [conv[0], conv[1], conv[2]]
+        if mode != "OKHSL":
+            conv = self.rgb_to_okhsl(rgb[0], rgb[1], rgb[2])
+            if (mode == "OKLCH" or mode == "OKHSV"):
+                okhsl = [self.angle_ok, conv[1], conv[2]]
+            else:
+                okhsl = [conv[0], conv[1], conv[2]]
+        if (mode != "OKLCH" and mode != "OKHSV" and mode != "OKHSL"):
+            self.angle_ok = oklch[2]
         #//
         #\\ Variables
         # Alpha
@@ -8632,6 +10310,23 @@ class PigmentO_Docker(DockWidget):
         self.lab_2 = lab[1]
         self.lab_3 = lab[2]
 
+        # OKLAB
+        self.oklab_1 = oklab[0]
+        self.oklab_2 = oklab[1]
+        self.oklab_3 = oklab[2]
+        # OKLCH
+        self.oklch_1 = oklch[0]
+        self.oklch_2 = oklch[1]
+        self.oklch_3 = oklch[2]
+        # OKHSV
+        self.okhsv_1 = okhsv[0]
+        self.okhsv_2 = okhsv[1]
+        self.okhsv_3 = okhsv[2]
+        # OKHSL
+        self.okhsl_1 = okhsl[0]
+        self.okhsl_2 = okhsl[1]
+        self.okhsl_3 = okhsl[2]
+
         # RGB Kelvin
         self.rgb_k1 = self.rgb_1 * self.kkk_r
         self.rgb_k2 = self.rgb_2 * self.kkk_g
@@ -8784,6 +10479,18 @@ class PigmentO_Docker(DockWidget):
         if space_in == "LAB":
             xyz = self.lab_to_xyz(input[0], input[1], input[2])
             rgb = self.xyz_to_rgb(xyz[0], xyz[1], xyz[2])
+        if space_in == "OKLAB":
+            rgb = self.oklab_to_rgb(input[0], input[1], input[2])
+            xyz = self.rgb_to_xyz(rgb[0], rgb[1], rgb[2])
+        if space_in == "OKLCH":
+            rgb = self.oklch_to_rgb(input[0], input[1], input[2])
+            xyz = self.rgb_to_xyz(rgb[0], rgb[1], rgb[2])
+        if space_in == "OKHSV":
+            rgb = self.okhsv_to_rgb(input[0], input[1], input[2])
+            xyz = self.rgb_to_xyz(rgb[0], rgb[1], rgb[2])
+        if space_in == "OKHSL":
+            rgb = self.okhsl_to_rgb(input[0], input[1], input[2])
+            xyz = self.rgb_to_xyz(rgb[0], rgb[1], rgb[2])
 
         # Output
         if space_out == "AAA":
@@ -8812,6 +10519,14 @@ class PigmentO_Docker(DockWidget):
             output = self.xyz_to_xyy(xyz[0], xyz[1], xyz[2])
         if space_out == "LAB":
             output = self.xyz_to_lab(xyz[0], xyz[1], xyz[2])
+        if space_out == "OKLAB":
+            output = self.rgb_to_oklab(rgb[0], rgb[1], rgb[2])
+        if space_out == "OKLCH":
+            output = self.rgb_to_oklch(rgb[0], rgb[1], rgb[2])
+        if space_out == "OKHSV":
+            output = self.rgb_to_okhsv(rgb[0], rgb[1], rgb[2])
+        if space_out == "OKHSL":
+            output = self.rgb_to_okhsl(rgb[0], rgb[1], rgb[2])
 
         # Return Output
         return output
@@ -8837,7 +10552,11 @@ class PigmentO_Docker(DockWidget):
             d = cor1[3] + (d3 * factor)
             # Output
             output = [a, b, c, d]
-        elif (space == "ARD" or space == "HSV" or space == "HSL" or space == "HCY"):
+        elif space == "OKLCH":
+            # Hue is the last channel
+            hcl = self.Color_INTERPOLATE("HSV", factor, [cor1[2], cor1[1], cor1[0]], [cor2[2], cor2[1], cor2[0]])
+            output = [hcl[2], hcl[1], hcl[0]]
+        elif (space == "ARD" or space == "HSV" or space == "HSL" or space == "HCY" or space == "OKHSV" or space == "OKHSL"):
             # Hue
             cor1 = [cor1[0], cor1[1], cor1[2]]
             cor2 = [cor2[0], cor2[1], cor2[2]]
@@ -8903,6 +10622,89 @@ class PigmentO_Docker(DockWidget):
         """
         Harmony Value = ["HSL", rgb_1, rgb_2, rgb_3, hsl_1, hsl_2, hsl_3]
         """
+        # Harmony Index
+        self.harmony_rule = self.dialog.har_rule.currentText()
+        if self.harmony_space == "ARD":
+            channel_2, channel_3, convert = self.ard_2, self.ard_3, self.ard_to_rgb
+        if self.harmony_space == "HSV":
+            channel_2, channel_3, convert = self.hsv_2, self.hsv_3, self.hsv_to_rgb
+        if self.harmony_space == "HSL":
+            channel_2, channel_3, convert = self.hsl_2, self.hsl_3, self.hsl_to_rgb
+        if self.harmony_space == "HCY":
+            channel_2, channel_3, convert = self.hcy_2, self.hcy_3, self.hcy_to_rgb
+        # Nothing changed since the last harmony
+        if self.Harmony_Key(channel_2, channel_3) == self.harmony_key:
+            return
+
+        # Do Calculations in the active color wheel
+        anchor = self.har_3[4]
+        if self.wheel == "CMY":
+            angulus = self.angle_live
+            origin = anchor
+            origin_1 = anchor + 1
+        if self.wheel == "RYB":
+            angulus = self.hcmy_to_hryb(self.angle_live)
+            origin = self.hcmy_to_hryb(anchor)
+            origin_1 = self.hcmy_to_hryb(anchor + 1)
+        span, nodes = harmony_rules[self.harmony_rule][self.harmony_slot]
+
+        # Delta
+        if span is not None:
+            value1 = angulus # A
+            value2 = origin # O
+            value3 = value1 + 1
+            value4 = value2 + 1
+            if value1 <= value2:
+                delta1 = value2 - value1
+                delta2 = value3 - value2
+            if value1 > value2:
+                delta1 = value1 - value2
+                delta2 = value4 - value1
+            self.harmony_delta = min(delta1, delta2) / span
+
+        # Node angles from the rule vectors
+        harmony = [self.har_1, self.har_2, self.har_3, self.har_4, self.har_5]
+        origins = {"A" : angulus, "O" : origin, "O1" : origin_1}
+        batch = []
+        for i in range(0, len(nodes)):
+            base, offset, steps, loop, channels = nodes[i]
+            if base == "H":
+                angle = anchor
+            else:
+                angle = origins[base]
+                if offset != 0:
+                    angle = angle + offset
+                if steps != 0:
+                    angle = angle + (steps * self.harmony_delta)
+                if loop == True:
+                    angle = self.Math_1D_Loop(angle)
+                if self.wheel == "RYB":
+                    angle = self.hryb_to_hcmy(angle)
+            if channels == "LIVE":
+                harmony[i] = [self.harmony_space, self.rgb_1, self.rgb_2, self.rgb_3, angle, channel_2, channel_3]
+            elif (channels == "EDIT" and self.harmony_edit == True):
+                batch.append([i, angle, harmony[i][5], harmony[i][6]])
+            else:
+                batch.append([i, angle, channel_2, channel_3])
+        # Convert the harmony colors in one pass
+        for i, value1, value2, value3 in batch:
+            rgb = convert(value1, value2, value3)
+            harmony[i] = [self.harmony_space, rgb[0], rgb[1], rgb[2], value1, value2, value3]
+        self.har_1, self.har_2, self.har_3, self.har_4, self.har_5 = harmony
+
+        # Harmony Influenced by Kalvin
+        self.har_kelvin[0:15] = array.array("d", [v for har in harmony for v in (har[1] * self.kkk_r, har[2] * self.kkk_g, har[3] * self.kkk_b)])
+        self.harmony_key = self.Harmony_Key(channel_2, channel_3)
+    def Harmony_Key(self, channel_2, channel_3):
+        # Every input of the harmony, its own nodes included
+        return (
+            self.angle_live, self.wheel, self.harmony_rule, self.harmony_slot, self.harmony_space, self.harmony_edit, self.harmony_delta,
+            channel_2, channel_3, self.rgb_1, self.rgb_2, self.rgb_3, self.kkk_r, self.kkk_g, self.kkk_b,
+            tuple(self.har_1), tuple(self.har_2), tuple(self.har_3), tuple(self.har_4), tuple(self.har_5),
+            )
+    def Color_Harmony_Span(self, span):
+        # Span
+        self.harmony_span = span
         # Do Calculations in the active color wheel
         if self.wheel == "CMY":
             angulus = self.angle_live
@@ -8911,4043 +10713,11 @@ class PigmentO_Docker(DockWidget):
 
         # Harmony Index
         self.harmony_rule = self.dialog.har_rule.currentText()
-        if self.harmony_rule == "Monochromatic":
-            if self.harmony_slot == 1: # Rotating Node
-                # Shared Angle
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                # 1
-                if self.harmony_space == "ARD":
-                    self.har_1 = ["ARD", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.ard_2, self.ard_3]
-                if self.harmony_space == "HSV":
-                    self.har_1 = ["HSV", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsv_2, self.hsv_3]
-                if self.harmony_space == "HSL":
-                    self.har_1 = ["HSL", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsl_2, self.hsl_3]
-                if self.harmony_space == "HCY":
-                    self.har_1 = ["HCY", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hcy_2, self.hcy_3]
-                # 2
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 2: # Rotating Node
-                # Shared Angle
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                # 1
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.harmony_space == "ARD":
-                    self.har_2 = ["ARD", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.ard_2, self.ard_3]
-                if self.harmony_space == "HSV":
-                    self.har_2 = ["HSV", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsv_2, self.hsv_3]
-                if self.harmony_space == "HSL":
-                    self.har_2 = ["HSL", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsl_2, self.hsl_3]
-                if self.harmony_space == "HCY":
-                    self.har_2 = ["HCY", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hcy_2, self.hcy_3]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 3: # Rotating Node Major
-                # Shared Angle
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                # 1
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    self.har_3 = ["ARD", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.ard_2, self.ard_3]
-                if self.harmony_space == "HSV":
-                    self.har_3 = ["HSV", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsv_2, self.hsv_3]
-                if self.harmony_space == "HSL":
-                    self.har_3 = ["HSL", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsl_2, self.hsl_3]
-                if self.harmony_space == "HCY":
-                    self.har_3 = ["HCY", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hcy_2, self.hcy_3]
-                # 4
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 4: # Rotating Node
-                # Shared Angle
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                # 1
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.harmony_space == "ARD":
-                    self.har_4 = ["ARD", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.ard_2, self.ard_3]
-                if self.harmony_space == "HSV":
-                    self.har_4 = ["HSV", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsv_2, self.hsv_3]
-                if self.harmony_space == "HSL":
-                    self.har_4 = ["HSL", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsl_2, self.hsl_3]
-                if self.harmony_space == "HCY":
-                    self.har_4 = ["HCY", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hcy_2, self.hcy_3]
-                # 5
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 5: # Rotating Node
-                # Shared Angle
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                # 1
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.harmony_space == "ARD":
-                    self.har_5 = ["ARD", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.ard_2, self.ard_3]
-                if self.harmony_space == "HSV":
-                    self.har_5 = ["HSV", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsv_2, self.hsv_3]
-                if self.harmony_space == "HSL":
-                    self.har_5 = ["HSL", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsl_2, self.hsl_3]
-                if self.harmony_space == "HCY":
-                    self.har_5 = ["HCY", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hcy_2, self.hcy_3]
-        if self.harmony_rule == "Complemantary":
-            if self.harmony_slot == 1: # Rotating Node
-                # 1
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    self.har_1 = ["ARD", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.ard_2, self.ard_3]
-                if self.harmony_space == "HSV":
-                    self.har_1 = ["HSV", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsv_2, self.hsv_3]
-                if self.harmony_space == "HSL":
-                    self.har_1 = ["HSL", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsl_2, self.hsl_3]
-                if self.harmony_space == "HCY":
-                    self.har_1 = ["HCY", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hcy_2, self.hcy_3]
-                # 2
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = angulus + 0.5
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus + 0.5
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = angulus + 0.5
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus + 0.5
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 2: # Rotating Node
-                # 1
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    self.har_2 = ["ARD", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.ard_2, self.ard_3]
-                if self.harmony_space == "HSV":
-                    self.har_2 = ["HSV", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsv_2, self.hsv_3]
-                if self.harmony_space == "HSL":
-                    self.har_2 = ["HSL", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsl_2, self.hsl_3]
-                if self.harmony_space == "HCY":
-                    self.har_2 = ["HCY", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hcy_2, self.hcy_3]
-                # 3
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = angulus + 0.5
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus + 0.5
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = angulus + 0.5
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus + 0.5
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 3: # Rotating Node Major
-                # 1
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    self.har_3 = ["ARD", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.ard_2, self.ard_3]
-                if self.harmony_space == "HSV":
-                    self.har_3 = ["HSV", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsv_2, self.hsv_3]
-                if self.harmony_space == "HSL":
-                    self.har_3 = ["HSL", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsl_2, self.hsl_3]
-                if self.harmony_space == "HCY":
-                    self.har_3 = ["HCY", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hcy_2, self.hcy_3]
-                # 4
-                if self.wheel == "CMY":
-                    angle = angulus + 0.5
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus + 0.5
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = angulus + 0.5
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus + 0.5
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 4: # Rotating Node
-                # 1
-                if self.wheel == "CMY":
-                    angle = angulus + 0.5
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus + 0.5
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = angulus + 0.5
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus + 0.5
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.wheel == "CMY":
-                    angle = angulus + 0.5
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus + 0.5
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    self.har_4 = ["ARD", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.ard_2, self.ard_3]
-                if self.harmony_space == "HSV":
-                    self.har_4 = ["HSV", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsv_2, self.hsv_3]
-                if self.harmony_space == "HSL":
-                    self.har_4 = ["HSL", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsl_2, self.hsl_3]
-                if self.harmony_space == "HCY":
-                    self.har_4 = ["HCY", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hcy_2, self.hcy_3]
-                # 5
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 5: # Rotating Node Major
-                # 1
-                if self.wheel == "CMY":
-                    angle = angulus + 0.5
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus + 0.5
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = angulus + 0.5
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus + 0.5
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.wheel == "CMY":
-                    angle = angulus + 0.5
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus + 0.5
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    self.har_5 = ["ARD", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.ard_2, self.ard_3]
-                if self.harmony_space == "HSV":
-                    self.har_5 = ["HSV", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsv_2, self.hsv_3]
-                if self.harmony_space == "HSL":
-                    self.har_5 = ["HSL", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hsl_2, self.hsl_3]
-                if self.harmony_space == "HCY":
-                    self.har_5 = ["HCY", self.rgb_1, self.rgb_2, self.rgb_3, angle, self.hcy_2, self.hcy_3]
-        if self.harmony_rule == "Analogous":
-            if self.harmony_slot == 1:
-                # Delta
-                value1 = angulus # A
-                if self.wheel == "CMY":
-                    value2 = self.har_3[4] # O
-                if self.wheel == "RYB":
-                    value2 = self.hcmy_to_hryb(self.har_3[4]) # O
-                value3 = value1 + 1
-                value4 = value2 + 1
-                if value1 <= value2:
-                    delta1 = value2 - value1
-                    delta2 = value3 - value2
-                if value1 > value2:
-                    delta1 = value1 - value2
-                    delta2 = value4 - value1
-                if delta1 <= delta2:
-                    self.harmony_delta = delta1 / 2
-                if delta1 > delta2:
-                    self.harmony_delta = delta2 / 2
-                # 1
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - (2 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - (2 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [self.har_3[4], self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [self.har_3[4], self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [self.har_3[4], self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [self.har_3[4], self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + (2 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + (2 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 2:
-                # Delta
-                value1 = angulus # A
-                if self.wheel == "CMY":
-                    value2 = self.har_3[4] # O
-                if self.wheel == "RYB":
-                    value2 = self.hcmy_to_hryb(self.har_3[4]) # O
-                value3 = value1 + 1
-                value4 = value2 + 1
-                if value1 <= value2:
-                    delta1 = value2 - value1
-                    delta2 = value3 - value2
-                if value1 > value2:
-                    delta1 = value1 - value2
-                    delta2 = value4 - value1
-                if delta1 <= delta2:
-                    self.harmony_delta = delta1
-                if delta1 > delta2:
-                    self.harmony_delta = delta2
-                # 1
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - (2 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - (2 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit:
-                        ard = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [self.har_3[4], self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit:
-                        hsv = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [self.har_3[4], self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit:
-                        hsl = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [self.har_3[4], self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit:
-                        hcy = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [self.har_3[4], self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + (2 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + (2 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 3: # Rotating Node Major
-                # 1
-                angle = angulus - (2*self.harmony_delta)
-                angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angle)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                angle = angulus - (1*self.harmony_delta)
-                angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angle)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.wheel == "CMY":
-                        self.har_3 = ["ARD", self.rgb_1, self.rgb_2, self.rgb_3, angulus, self.ard_2, self.ard_3]
-                    if self.wheel == "RYB":
-                        ard = [self.hryb_to_hcmy(angulus), self.ard_2, self.ard_3]
-                        rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                        self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.wheel == "CMY":
-                        self.har_3 = ["HSV", self.rgb_1, self.rgb_2, self.rgb_3, angulus, self.hsv_2, self.hsv_3]
-                    if self.wheel == "RYB":
-                        hsv = [self.hryb_to_hcmy(angulus), self.hsv_2, self.hsv_3]
-                        rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                        self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.wheel == "CMY":
-                        self.har_3 = ["HSL", self.rgb_1, self.rgb_2, self.rgb_3, angulus, self.hsl_2, self.hsl_3]
-                    if self.wheel == "RYB":
-                        hsl = [self.hryb_to_hcmy(angulus), self.hsl_2, self.hsl_3]
-                        rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                        self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.wheel == "CMY":
-                        self.har_3 = ["HCY", self.rgb_1, self.rgb_2, self.rgb_3, angulus, self.hcy_2, self.hcy_3]
-                    if self.wheel == "RYB":
-                        hcy = [self.hryb_to_hcmy(angulus), self.hcy_2, self.hcy_3]
-                        rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                        self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                #4
-                angle = angulus + (1*self.harmony_delta)
-                angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angle)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                angle = angulus + (2*self.harmony_delta)
-                angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angle)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 4:
-                # Delta
-                value1 = angulus # A
-                if self.wheel == "CMY":
-                    value2 = self.har_3[4] # O
-                if self.wheel == "RYB":
-                    value2 = self.hcmy_to_hryb(self.har_3[4]) # O
-                value3 = value1 + 1
-                value4 = value2 + 1
-                if value1 <= value2:
-                    delta1 = value2 - value1
-                    delta2 = value3 - value2
-                if value1 > value2:
-                    delta1 = value1 - value2
-                    delta2 = value4 - value1
-                if delta1 <= delta2:
-                    self.harmony_delta = delta1
-                if delta1 > delta2:
-                    self.harmony_delta = delta2
-                # 1
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - (2 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - (2 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [self.har_3[4], self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [self.har_3[4], self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [self.har_3[4], self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [self.har_3[4], self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + (2 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + (2 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 5:
-                # Delta
-                value1 = angulus # A
-                if self.wheel == "CMY":
-                    value2 = self.har_3[4] # O
-                if self.wheel == "RYB":
-                    value2 = self.hcmy_to_hryb(self.har_3[4]) # O
-                value3 = value1 + 1
-                value4 = value2 + 1
-                if value1 <= value2:
-                    delta1 = value2 - value1
-                    delta2 = value3 - value2
-                if value1 > value2:
-                    delta1 = value1 - value2
-                    delta2 = value4 - value1
-                if delta1 <= delta2:
-                    self.harmony_delta = delta1 / 2
-                if delta1 > delta2:
-                    self.harmony_delta = delta2 / 2
-                # 1
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - (2 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - (2 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [self.har_3[4], self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [self.har_3[4], self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [self.har_3[4], self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [self.har_3[4], self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + (2 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + (2 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-        if self.harmony_rule == "Split Complemantary":
-            if self.harmony_slot == 1:
-                # Delta
-                value1 = angulus # A
-                if self.wheel == "CMY":
-                    value2 = self.har_3[4] # O
-                if self.wheel == "RYB":
-                    value2 = self.hcmy_to_hryb(self.har_3[4]) # O
-                value3 = value1 + 1
-                value4 = value2 + 1
-                if value1 <= value2:
-                    delta1 = value2 - value1
-                    delta2 = value3 - value2
-                if value1 > value2:
-                    delta1 = value1 - value2
-                    delta2 = value4 - value1
-                if delta1 <= delta2:
-                    self.harmony_delta = delta1
-                if delta1 > delta2:
-                    self.harmony_delta = delta2
-                # 1
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [self.har_3[4], self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [self.har_3[4], self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [self.har_3[4], self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [self.har_3[4], self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 2:
-                # Delta
-                value1 = angulus # A
-                if self.wheel == "CMY":
-                    value2 = self.har_3[4] # O
-                if self.wheel == "RYB":
-                    value2 = self.hcmy_to_hryb(self.har_3[4]) # O
-                value3 = value1 + 1
-                value4 = value2 + 1
-                if value1 <= value2:
-                    delta1 = value2 - value1
-                    delta2 = value3 - value2
-                if value1 > value2:
-                    delta1 = value1 - value2
-                    delta2 = value4 - value1
-                if delta1 <= delta2:
-                    self.harmony_delta = delta1
-                if delta1 > delta2:
-                    self.harmony_delta = delta2
-                # 1
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit:
-                        ard = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [self.har_3[4], self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit:
-                        hsv = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [self.har_3[4], self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit:
-                        hsl = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [self.har_3[4], self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit:
-                        hcy = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [self.har_3[4], self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 3: # Rotating Node Major
-                # 1
-                angle = self.Math_1D_Loop(angulus - (1*self.harmony_delta))
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angle)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                angle = self.Math_1D_Loop(angulus - (1*self.harmony_delta))
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angle)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                angle = self.Math_1D_Loop(angulus + (1*self.harmony_delta))
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angle)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                angle = self.Math_1D_Loop(angulus + (1*self.harmony_delta))
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angle)
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 4:
-                # Delta
-                value1 = angulus # A
-                if self.wheel == "CMY":
-                    value2 = self.har_3[4] # O
-                if self.wheel == "RYB":
-                    value2 = self.hcmy_to_hryb(self.har_3[4]) # O
-                value3 = value1 + 1
-                value4 = value2 + 1
-                if value1 <= value2:
-                    delta1 = value2 - value1
-                    delta2 = value3 - value2
-                if value1 > value2:
-                    delta1 = value1 - value2
-                    delta2 = value4 - value1
-                if delta1 <= delta2:
-                    self.harmony_delta = delta1
-                if delta1 > delta2:
-                    self.harmony_delta = delta2
-                # 1
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [self.har_3[4], self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [self.har_3[4], self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [self.har_3[4], self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [self.har_3[4], self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 5:
-                # Delta
-                value1 = angulus # A
-                if self.wheel == "CMY":
-                    value2 = self.har_3[4] # O
-                if self.wheel == "RYB":
-                    value2 = self.hcmy_to_hryb(self.har_3[4]) # O
-                value3 = value1 + 1
-                value4 = value2 + 1
-                if value1 <= value2:
-                    delta1 = value2 - value1
-                    delta2 = value3 - value2
-                if value1 > value2:
-                    delta1 = value1 - value2
-                    delta2 = value4 - value1
-                if delta1 <= delta2:
-                    self.harmony_delta = delta1
-                if delta1 > delta2:
-                    self.harmony_delta = delta2
-                # 1
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [self.har_3[4], self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [self.har_3[4], self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [self.har_3[4], self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [self.har_3[4], self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 1 + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4] + 1) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-        if self.harmony_rule == "Double Split Complemantary":
-            if self.harmony_slot == 1:
-                # Delta
-                value1 = angulus # A
-                if self.wheel == "CMY":
-                    value2 = self.har_3[4] # O
-                if self.wheel == "RYB":
-                    value2 = self.hcmy_to_hryb(self.har_3[4]) # O
-                value3 = value1 + 1
-                value4 = value2 + 1
-                if value1 <= value2:
-                    delta1 = value2 - value1
-                    delta2 = value3 - value2
-                if value1 > value2:
-                    delta1 = value1 - value2
-                    delta2 = value4 - value1
-                if delta1 <= delta2:
-                    self.harmony_delta = delta1
-                if delta1 > delta2:
-                    self.harmony_delta = delta2
-                # 1
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - 0.5 + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - 0.5 + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [self.har_3[4], self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [self.har_3[4], self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [self.har_3[4], self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [self.har_3[4], self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 0.5 - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + 0.5 - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 2:
-                # Delta
-                value1 = angulus # A
-                if self.wheel == "CMY":
-                    value2 = self.har_3[4] # O
-                if self.wheel == "RYB":
-                    value2 = self.hcmy_to_hryb(self.har_3[4]) # O
-                value3 = value1 + 1
-                value4 = value2 + 1
-                if value1 <= value2:
-                    delta1 = value2 - value1
-                    delta2 = value3 - value2
-                if value1 > value2:
-                    delta1 = value1 - value2
-                    delta2 = value4 - value1
-                if delta1 <= delta2:
-                    self.harmony_delta = delta1
-                if delta1 > delta2:
-                    self.harmony_delta = delta2
-                # 1
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 0.5 + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + 0.5 + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [self.har_3[4], self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [self.har_3[4], self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [self.har_3[4], self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [self.har_3[4], self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 0.5 - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + 0.5 - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 3: # Rotating Node Major
-                # 1
-                if self.wheel == "CMY":
-                    angle = angulus - (1*self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus - (1*self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = angulus + 0.5 + (1*self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus + 0.5 + (1*self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                angle = angulus
-                if self.wheel == "RYB":
-                    angle = self.hryb_to_hcmy(angulus)
-                if self.harmony_space == "ARD":
-                    ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = angulus - 0.5 - (1*self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus - 0.5 - (1*self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = angulus + (1*self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = angulus + (1*self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 4:
-                # Delta
-                value1 = angulus # A
-                if self.wheel == "CMY":
-                    value2 = self.har_3[4] # O
-                if self.wheel == "RYB":
-                    value2 = self.hcmy_to_hryb(self.har_3[4]) # O
-                value3 = value1 + 1
-                value4 = value2 + 1
-                if value1 <= value2:
-                    delta1 = value2 - value1
-                    delta2 = value3 - value2
-                if value1 > value2:
-                    delta1 = value1 - value2
-                    delta2 = value4 - value1
-                if delta1 <= delta2:
-                    self.harmony_delta = delta1
-                if delta1 > delta2:
-                    self.harmony_delta = delta2
-                # 1
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - 0.5 + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - 0.5 + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [self.har_3[4], self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [self.har_3[4], self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [self.har_3[4], self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [self.har_3[4], self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - 0.5 - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - 0.5 - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-            if self.harmony_slot == 5:
-                # Delta
-                value1 = angulus # A
-                if self.wheel == "CMY":
-                    value2 = self.har_3[4] # O
-                if self.wheel == "RYB":
-                    value2 = self.hcmy_to_hryb(self.har_3[4]) # O
-                value3 = value1 + 1
-                value4 = value2 + 1
-                if value1 <= value2:
-                    delta1 = value2 - value1
-                    delta2 = value3 - value2
-                if value1 > value2:
-                    delta1 = value1 - value2
-                    delta2 = value4 - value1
-                if delta1 <= delta2:
-                    self.harmony_delta = delta1
-                if delta1 > delta2:
-                    self.harmony_delta = delta2
-                # 1
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_1 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_1 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_1 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_1[5], self.har_1[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_1 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 2
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] - 0.5 + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) - 0.5 + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_2 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_2 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_2 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_2[5], self.har_2[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_2 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 3
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        ard = [self.har_3[4], self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_3 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsv = [self.har_3[4], self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_3 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hsl = [self.har_3[4], self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_3 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [self.har_3[4], self.har_3[5], self.har_3[6]]
-                    else:
-                        hcy = [self.har_3[4], self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_3 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 4
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + 0.5 - (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + 0.5 - (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_4 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_4 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_4 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_4[5], self.har_4[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_4 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-                # 5
-                if self.wheel == "CMY":
-                    angle = self.har_3[4] + (1 * self.harmony_delta)
-                    angle = self.Math_1D_Loop(angle)
-                if self.wheel == "RYB":
-                    angle = self.hcmy_to_hryb(self.har_3[4]) + (1 * self.harmony_delta)
-                    angle = self.hryb_to_hcmy(self.Math_1D_Loop(angle))
-                if self.harmony_space == "ARD":
-                    if self.harmony_edit == True:
-                        ard = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        ard = [angle, self.ard_2, self.ard_3]
-                    rgb = self.ard_to_rgb(ard[0], ard[1], ard[2])
-                    self.har_5 = ["ARD", rgb[0], rgb[1], rgb[2], ard[0], ard[1], ard[2]]
-                if self.harmony_space == "HSV":
-                    if self.harmony_edit == True:
-                        hsv = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsv = [angle, self.hsv_2, self.hsv_3]
-                    rgb = self.hsv_to_rgb(hsv[0], hsv[1], hsv[2])
-                    self.har_5 = ["HSV", rgb[0], rgb[1], rgb[2], hsv[0], hsv[1], hsv[2]]
-                if self.harmony_space == "HSL":
-                    if self.harmony_edit == True:
-                        hsl = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hsl = [angle, self.hsl_2, self.hsl_3]
-                    rgb = self.hsl_to_rgb(hsl[0], hsl[1], hsl[2])
-                    self.har_5 = ["HSL", rgb[0], rgb[1], rgb[2], hsl[0], hsl[1], hsl[2]]
-                if self.harmony_space == "HCY":
-                    if self.harmony_edit == True:
-                        hcy = [angle, self.har_5[5], self.har_5[6]]
-                    else:
-                        hcy = [angle, self.hcy_2, self.hcy_3]
-                    rgb = self.hcy_to_rgb(hcy[0], hcy[1], hcy[2])
-                    self.har_5 = ["HCY", rgb[0], rgb[1], rgb[2], hcy[0], hcy[1], hcy[2]]
-
-        # Harmony Influenced by Kalvin
-        self.har_k1 = [self.har_1[1] * self.kkk_r, self.har_1[2] * self.kkk_g, self.har_1[3] * self.kkk_b]
-        self.har_k2 = [self.har_2[1] * self.kkk_r, self.har_2[2] * self.kkk_g, self.har_2[3] * self.kkk_b]
-        self.har_k3 = [self.har_3[1] * self.kkk_r, self.har_3[2] * self.kkk_g, self.har_3[3] * self.kkk_b]
-        self.har_k4 = [self.har_4[1] * self.kkk_r, self.har_4[2] * self.kkk_g, self.har_4[3] * self.kkk_b]
-        self.har_k5 = [self.har_5[1] * self.kkk_r, self.har_5[2] * self.kkk_g, self.har_5[3] * self.kkk_b]
-    def Color_Harmony_Span(self, span):
-        # Span
-        self.harmony_span = span
-        # Do Calculations in the active color wheel
-        if self.wheel == "CMY":
-            angulus = self.angle_live
-        if self.wheel == "RYB":
-            angulus = self.hcmy_to_hryb(self.angle_live)
-
-        # Harmony Index
-        self.harmony_rule = self.dialog.har_rule.currentText()
-        if self.harmony_rule == "Analogous":
-            if self.harmony_slot == 1:
-                pass
-            if self.harmony_slot == 2:
-                pass
+        if self.harmony_rule == "Analogous":
+            if self.harmony_slot == 1:
+                pass
+            if self.harmony_slot == 2:
+                pass
             if self.harmony_slot == 3: # Rotating Node Major
                 pass
             if self.harmony_slot == 4:
@@ -13037,6 +10807,22 @@ class PigmentO_Docker(DockWidget):
         self.layout.lch_1_value.clearFocus()
         self.layout.lch_2_value.clearFocus()
         self.layout.lch_3_value.clearFocus()
+        # OKLAB
+        self.layout.oklab_1_value.clearFocus()
+        self.layout.oklab_2_value.clearFocus()
+        self.layout.oklab_3_value.clearFocus()
+        # OKLCH
+        self.layout.oklch_1_value.clearFocus()
+        self.layout.oklch_2_value.clearFocus()
+        self.layout.oklch_3_value.clearFocus()
+        # OKHSV
+        self.layout.okhsv_1_value.clearFocus()
+        self.layout.okhsv_2_value.clearFocus()
+        self.layout.okhsv_3_value.clearFocus()
+        # OKHSL
+        self.layout.okhsl_1_value.clearFocus()
+        self.layout.okhsl_2_value.clearFocus()
+        self.layout.okhsl_3_value.clearFocus()
 
     #//
     #\\ Sync Channels ##########################################################
@@ -13165,6 +10951,34 @@ class PigmentO_Docker(DockWidget):
         # self.layout.lch_1_value.blockSignals(boolean)
         # self.layout.lch_2_value.blockSignals(boolean)
         # self.layout.lch_3_value.blockSignals(boolean)
+        # OKLAB
+        self.layout.oklab_1_slider.blockSignals(boolean)
+        self.layout.oklab_2_slider.blockSignals(boolean)
+        self.layout.oklab_3_slider.blockSignals(boolean)
+        self.layout.oklab_1_value.blockSignals(boolean)
+        self.layout.oklab_2_value.blockSignals(boolean)
+        self.layout.oklab_3_value.blockSignals(boolean)
+        # OKLCH
+        self.layout.oklch_1_slider.blockSignals(boolean)
+        self.layout.oklch_2_slider.blockSignals(boolean)
+        self.layout.oklch_3_slider.blockSignals(boolean)
+        self.layout.oklch_1_value.blockSignals(boolean)
+        self.layout.oklch_2_value.blockSignals(boolean)
+        self.layout.oklch_3_value.blockSignals(boolean)
+        # OKHSV
+        self.layout.okhsv_1_slider.blockSignals(boolean)
+        self.layout.okhsv_2_slider.blockSignals(boolean)
+        self.layout.okhsv_3_slider.blockSignals(boolean)
+        self.layout.okhsv_1_value.blockSignals(boolean)
+        self.layout.okhsv_2_value.blockSignals(boolean)
+        self.layout.okhsv_3_value.blockSignals(boolean)
+        # OKHSL
+        self.layout.okhsl_1_slider.blockSignals(boolean)
+        self.layout.okhsl_2_slider.blockSignals(boolean)
+        self.layout.okhsl_3_slider.blockSignals(boolean)
+        self.layout.okhsl_1_value.blockSignals(boolean)
+        self.layout.okhsl_2_value.blockSignals(boolean)
+        self.layout.okhsl_3_value.blockSignals(boolean)
     def Signal_Send_Channels(self):
         # AAA
         self.aaa_1_slider.Update(self.aaa_1, self.channel_width)
@@ -13281,6 +11095,34 @@ class PigmentO_Docker(DockWidget):
         # self.layout.lch_1_value.setValue(self.lch_1 * k_LCH)
         # self.layout.lch_2_value.setValue(self.lch_2 * k_LCH)
         # self.layout.lch_3_value.setValue(self.lch_3 * k_LCH)
+        # OKLAB
+        self.oklab_1_slider.Update(self.oklab_1, self.channel_width)
+        self.oklab_2_slider.Update(self.oklab_2, self.channel_width)
+        self.oklab_3_slider.Update(self.oklab_3, self.channel_width)
+        self.layout.oklab_1_value.setValue(self.oklab_1 * k_LLL)
+        self.layout.oklab_2_value.setValue(self.oklab_2 * k_AB)
+        self.layout.oklab_3_value.setValue(self.oklab_3 * k_AB)
+        # OKLCH
+        self.oklch_1_slider.Update(self.oklch_1, self.channel_width)
+        self.oklch_2_slider.Update(self.oklch_2, self.channel_width)
+        self.oklch_3_slider.Update(self.oklch_3, self.channel_width)
+        self.layout.oklch_1_value.setValue(self.oklch_1 * k_LLL)
+        self.layout.oklch_2_value.setValue(self.oklch_2 * k_SVL)
+        self.layout.oklch_3_value.setValue(self.oklch_3 * k_HUE)
+        # OKHSV
+        self.okhsv_1_slider.Update(self.okhsv_1, self.channel_width)
+        self.okhsv_2_slider.Update(self.okhsv_2, self.channel_width)
+        self.okhsv_3_slider.Update(self.okhsv_3, self.channel_width)
+        self.layout.okhsv_1_value.setValue(self.okhsv_1 * k_HUE)
+        self.layout.okhsv_2_value.setValue(self.okhsv_2 * k_SVL)
+        self.layout.okhsv_3_value.setValue(self.okhsv_3 * k_SVL)
+        # OKHSL
+        self.okhsl_1_slider.Update(self.okhsl_1, self.channel_width)
+        self.okhsl_2_slider.Update(self.okhsl_2, self.channel_width)
+        self.okhsl_3_slider.Update(self.okhsl_3, self.channel_width)
+        self.layout.okhsl_1_value.setValue(self.okhsl_1 * k_HUE)
+        self.layout.okhsl_2_value.setValue(self.okhsl_2 * k_SVL)
+        self.layout.okhsl_3_value.setValue(self.okhsl_3 * k_SVL)
     def Signal_Send_Panels(self):
         if self.panel_active == "SWA":
             self.Update_Panel_SWA()
@@ -13303,6 +11145,12 @@ class PigmentO_Docker(DockWidget):
         if self.panel_active == "HCY":
             self.Update_Panel_HCY()
             self.panel_hcy.update()
+        if self.panel_active == "OKHSV":
+            self.Update_Panel_OKHSV()
+            self.panel_okhsv.update()
+        if self.panel_active == "OKHSL":
+            self.Update_Panel_OKHSL()
+            self.panel_okhsl.update()
         if self.panel_active == "HUE":
             self.Update_Panel_HUE()
             # Update Main
@@ -13366,21 +11214,18 @@ class PigmentO_Docker(DockWidget):
             )
     # SWA Update
     def Update_Panel_SWA(self):
+        if (self.swatch_serial == 0 or self.swatch_dirty == True):
+            self.SWA_Generate()
+        # Display Colors (converted again only for a new Palette, Document or quality)
+        swatch_key = (self.swatch_serial, self.d_cm, self.d_cd, self.d_cp, self.quality)
+        if self.swatch_key != swatch_key:
+            self.swatch_key = swatch_key
+            self.swatch_display = [self.convert(self.d_cm, self.d_cd, self.d_cp, "RGB", cor) for cor in self.swatch_colors]
         self.panel_swa.Update_Panel(
-            self.cotd_1,
-            self.cotd_2,
-            self.cotd_3,
-            self.cotd_4,
-            self.cotd_5,
-            self.HEX_6string(self.cotd_1[0], self.cotd_1[1], self.cotd_1[2]),
-            self.HEX_6string(self.cotd_2[0], self.cotd_2[1], self.cotd_2[2]),
-            self.HEX_6string(self.cotd_3[0], self.cotd_3[1], self.cotd_3[2]),
-            self.HEX_6string(self.cotd_4[0], self.cotd_4[1], self.cotd_4[2]),
-            self.HEX_6string(self.cotd_5[0], self.cotd_5[1], self.cotd_5[2]),
+            self.swatch_display,
             self.layout.panel_swa.width(),
             self.layout.panel_swa.height(),
             )
-    # UVD Update
     def Update_Panel_UVD(self):
         # UVD points of interest
         self.Hexagon_Points_UVD()
@@ -13395,11 +11240,16 @@ class PigmentO_Docker(DockWidget):
             self.zoom
             )
     def Hexagon_Points_UVD(self):
-        # Calculate Original Points
-        self.uvd_hexagon_origins(self.uvd_3)
         # Panel Dimensions
         self.uvd_width = self.layout.panel_uvd.width()
         self.uvd_height = self.layout.panel_uvd.height()
+        # Scaled Points only change with Depth and Size
+        key = (self.uvd_3, self.uvd_width, self.uvd_height)
+        if key == self.uvd_points_key:
+            return
+        self.uvd_points_key = key
+        # Calculate Original Points
+        self.uvd_hexagon_origins(self.uvd_3)
         w2 = self.uvd_width * 0.5
         h2 = self.uvd_height * 0.5
         if w2 >= h2:
@@ -13481,6 +11331,11 @@ class PigmentO_Docker(DockWidget):
         if hue >= 360:
             value = 60
         vertex = 1 - (round(value) / 180)
+        # Triangle only changes with its Vertex and Depth
+        key = (vertex, self.ard_3)
+        if key == self.ard_points_key:
+            return
+        self.ard_points_key = key
         # Triangle
         self.T1 = [0, 0]
         self.T2 = [0 , 1]
@@ -13531,73 +11386,104 @@ class PigmentO_Docker(DockWidget):
     def Update_Panel_HCY(self):
         self.panel_hcy.Update_Panel(
             [self.angle_live, self.hcy_2, self.hcy_3],
-            # self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hue_to_rgb(self.angle_live)),
-            # self.rgb_to_aaa(*self.hue_to_rgb(self.angle_live))[0],
-
-            self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.angle_live, 1, 1.0)),
-            self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.angle_live, 1, 0.9)),
-            self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.angle_live, 1, 0.8)),
-            self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.angle_live, 1, 0.7)),
-            self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.angle_live, 1, 0.6)),
-            self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.angle_live, 1, 0.5)),
-            self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.angle_live, 1, 0.4)),
-            self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.angle_live, 1, 0.3)),
-            self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.angle_live, 1, 0.2)),
-            self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.angle_live, 1, 0.1)),
-            self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.angle_live, 1, 0.0)),
-
+            self.Field_QImage("HCY", self.angle_live),
             self.harmony_render,
             self.harmony_edit,
-            # self.rgb_to_hcy(self.har_1[1], self.har_1[2], self.har_1[3]),
-            # self.rgb_to_hcy(self.har_2[1], self.har_2[2], self.har_2[3]),
-            # self.rgb_to_hcy(self.har_3[1], self.har_3[2], self.har_3[3]),
-            # self.rgb_to_hcy(self.har_4[1], self.har_4[2], self.har_4[3]),
-            # self.rgb_to_hcy(self.har_5[1], self.har_5[2], self.har_5[3]),
-
             self.layout.panel_hcy.width(),
             self.layout.panel_hcy.height(),
             self.HEX_6string( *self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [self.rgb_1, self.rgb_2, self.rgb_3])),
             self.zoom)
-
-
-        ########################################################################
-        # width = 100
-        # height = 100
-        # pixelData = "b'"
-        # for ih in range(height):
-        #     for iw in range(width):
-        #         rgb = self.hcy_to_rgb(self.angle_live, iw/width, (1-ih)/height)
-        #
-        #         a = str(hex(int(rgb[0]*255)))[2:4].zfill(2)
-        #         b = str(hex(int(rgb[1]*255)))[2:4].zfill(2)
-        #         c = str(hex(int(rgb[2]*255)))[2:4].zfill(2)
-                # pixelData = pixelData + "\x" + a + "\x" + b + "\x" + c
-
-        # q_image = QImage(pixelData, width, height, QImage.Format_RGBA8888)
-        # self.panel_hcy.Update_Panel()
-
-        # pass
+    def Update_Panel_OKHSV(self):
+        self.panel_okhsv.Update_Panel(
+            [self.angle_ok, self.okhsv_2, self.okhsv_3],
+            self.Field_QImage("OKHSV", self.angle_ok),
+            self.harmony_render,
+            self.harmony_edit,
+            self.layout.panel_okhsv.width(),
+            self.layout.panel_okhsv.height(),
+            self.HEX_6string( *self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [self.rgb_1, self.rgb_2, self.rgb_3])),
+            self.zoom)
+    def Update_Panel_OKHSL(self):
+        self.panel_okhsl.Update_Panel(
+            [self.angle_ok, self.okhsl_2, self.okhsl_3],
+            self.Field_QImage("OKHSL", self.angle_ok),
+            self.harmony_render,
+            self.harmony_edit,
+            self.layout.panel_okhsl.width(),
+            self.layout.panel_okhsl.height(),
+            self.HEX_6string( *self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [self.rgb_1, self.rgb_2, self.rgb_3])),
+            self.zoom)
+    def Field_QImage(self, space, hue):
+        # Field Key
+        key = (
+            space, round(hue, 4),
+            self.d_cm, self.d_cd, self.d_cp,
+            self.luma_r, self.luma_b, self.gamma_y,
+            self.quality,
+            )
+        try:
+            return self.field_cache[key]
+        except KeyError:
+            pass
+        # Sample Field on a reduced Grid (X = chroma or saturation, Y = luma)
+        if self.quality == "DRAFT":
+            side = field_draft
+        else:
+            side = field_grid
+        step = 1 / (side - 1)
+        grid = []
+        for y in range(side):
+            luma = 1 - (y * step)
+            for x in range(side):
+                grid.append([hue, x * step, luma])
+        # Space to RGB (the OK spaces share their hue terms across the whole Field)
+        if space == "HCY":
+            field = [self.hcy_to_rgb(h, c, y) for h, c, y in grid]
+        if space == "HSY":
+            field = [self.hsy_to_rgb(h, s, y) for h, s, y in grid]
+        if space == "OKHSV":
+            field = self.okhsv_to_rgb_batch(grid)
+        if space == "OKHSL":
+            field = self.okhsl_to_rgb_batch(grid)
+        pixels = bytearray(side * side * 3)
+        index = 0
+        for color in field:
+            rgb = self.convert(self.d_cm, self.d_cd, self.d_cp, "RGB", color)
+            for channel in rgb:
+                channel = int(channel * 255 + 0.5)
+                if channel < 0:
+                    channel = 0
+                elif channel > 255:
+                    channel = 255
+                pixels[index] = channel
+                index += 1
+        # Upload Field (copy detaches the QImage from the Python buffer)
+        qimage = QImage(bytes(pixels), side, side, side * 3, QImage.Format_RGB888).copy()
+        # Cache Field
+        if len(self.field_cache) >= field_limit:
+            del self.field_cache[next(iter(self.field_cache))]
+        self.field_cache[key] = qimage
+        return qimage
     # HUE Update
     def Update_Panel_HUE(self):
         # Hue of Color
         hue = self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hue_to_rgb(self.angle_live))
-        # Hue Circle Colors
-        if self.hue_shine == True:
-            red = [1, 0, 0]
-            mag = [1, 0, 1]
-            blu = [0, 0, 1]
-            cya = [0, 1, 1]
-            gre = [0, 1, 0]
-            yel = [1, 1, 0]
-            ora = [1, 0.5, 0]
-        else:
-            red = self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [1, 0, 0])
-            mag = self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [1, 0, 1])
-            blu = self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [0, 0, 1])
-            cya = self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [0, 1, 1])
-            gre = self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [0, 1, 0])
-            yel = self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [1, 1, 0])
-            ora = self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [1, 0.5, 0])
+        # Hue Circle Colors (converted again only when the Document or Shine changes)
+        ring_key = (self.hue_shine, self.d_cm, self.d_cd, self.d_cp, self.quality)
+        if self.ring_key != ring_key:
+            self.ring_key = ring_key
+            if self.hue_shine == True:
+                self.ring_colors = [[1, 0, 0], [1, 0, 1], [0, 0, 1], [0, 1, 1], [0, 1, 0], [1, 1, 0], [1, 0.5, 0]]
+            else:
+                self.ring_colors = [
+                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [1, 0, 0]), # Red
+                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [1, 0, 1]), # Magenta
+                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [0, 0, 1]), # Blue
+                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [0, 1, 1]), # Cyan
+                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [0, 1, 0]), # Green
+                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [1, 1, 0]), # Yellow
+                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [1, 0.5, 0]), # Orange
+                    ]
         # Hex String Ample
         hex = self.HEX_6string( *self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [self.rgb_1, self.rgb_2, self.rgb_3]))
         # Angles
@@ -13732,7 +11618,7 @@ class PigmentO_Docker(DockWidget):
                 self.layout.panel_hue_circle.height(),
                 self.gray_natural,
                 self.gray_contrast)
-        self.panel_hue_circle.Update_Ring(red, mag, blu, cya, gre, yel, ora)
+        self.panel_hue_circle.Update_Ring(*self.ring_colors)
     # Gamut Update
     def Update_Panel_GAM_Circle(self):
         # Update Circle for Angle
@@ -13752,449 +11638,80 @@ class PigmentO_Docker(DockWidget):
         # Polygon List Build
         panel_gam_polygon_width = self.layout.panel_gam_polygon.width()
         panel_gam_polygon_height = self.layout.panel_gam_polygon.height()
-        # Update Circle of Colors and Polygon
+        # Angle on the Wheel
         if self.wheel == "CMY":
-            if self.gamut_space == "ARD":
-                self.panel_gam_polygon.Update_Panel(
-                    self.angle_live,
-                    self.ard_2,
-                    self.wheel,
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(0/360, 0, self.ard_3) ), # Gray
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(0/360, 1, self.ard_3) ), # Red
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(10/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(20/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(30/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(40/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(50/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(60/360, 1, self.ard_3) ), # Yellow
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(70/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(80/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(90/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(100/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(110/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(120/360, 1, self.ard_3) ), # Green
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(130/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(140/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(150/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(160/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(170/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(180/360, 1, self.ard_3) ), # Cyan
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(190/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(200/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(210/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(220/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(230/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(240/360, 1, self.ard_3) ), # Blue
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(250/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(260/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(270/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(280/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(290/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(300/360, 1, self.ard_3) ), # Magenta
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(310/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(320/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(330/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(340/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(350/360, 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(360/360, 1, self.ard_3) ), # Red
-                    self.gamut_shape,
-                    P1_S1,
-                    P1_S3,
-                    P1_S4,
-                    P2_S1,
-                    P3_S3,
-                    panel_gam_polygon_width,
-                    panel_gam_polygon_height,
-                    self.gray_natural,
-                    self.gray_contrast,
-                    self.HEX_6string( *self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [self.rgb_1, self.rgb_2, self.rgb_3])),
-                    self.zoom)
-            if self.gamut_space == "HSV":
-                self.panel_gam_polygon.Update_Panel(
-                    self.angle_live,
-                    self.hsv_2,
-                    self.wheel,
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(0/360, 0, self.hsv_3) ), # Gray
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(0/360, 1, self.hsv_3) ), # Red
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(10/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(20/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(30/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(40/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(50/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(60/360, 1, self.hsv_3) ), # Yellow
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(70/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(80/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(90/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(100/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(110/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(120/360, 1, self.hsv_3) ), # Green
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(130/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(140/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(150/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(160/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(170/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(180/360, 1, self.hsv_3) ), # Cyan
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(190/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(200/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(210/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(220/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(230/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(240/360, 1, self.hsv_3) ), # Blue
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(250/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(260/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(270/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(280/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(290/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(300/360, 1, self.hsv_3) ), # Magenta
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(310/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(320/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(330/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(340/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(350/360, 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(360/360, 1, self.hsv_3) ), # Red
-                    self.gamut_shape,
-                    P1_S1,
-                    P1_S3,
-                    P1_S4,
-                    P2_S1,
-                    P3_S3,
-                    panel_gam_polygon_width,
-                    panel_gam_polygon_height,
-                    self.gray_natural,
-                    self.gray_contrast,
-                    self.HEX_6string( *self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [self.rgb_1, self.rgb_2, self.rgb_3])),
-                    self.zoom)
-            if self.gamut_space == "HSL":
-                self.panel_gam_polygon.Update_Panel(
-                    self.angle_live,
-                    self.hsl_2,
-                    self.wheel,
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(0/360, 0, self.hsl_3) ), # Gray
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(0/360, 1, self.hsl_3) ), # Red
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(10/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(20/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(30/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(40/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(50/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(60/360, 1, self.hsl_3) ), # Yellow
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(70/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(80/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(90/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(100/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(110/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(120/360, 1, self.hsl_3) ), # Green
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(130/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(140/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(150/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(160/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(170/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(180/360, 1, self.hsl_3) ), # Cyan
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(190/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(200/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(210/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(220/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(230/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(240/360, 1, self.hsl_3) ), # Blue
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(250/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(260/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(270/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(280/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(290/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(300/360, 1, self.hsl_3) ), # Magenta
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(310/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(320/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(330/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(340/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(350/360, 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(360/360, 1, self.hsl_3) ), # Red
-                    self.gamut_shape,
-                    P1_S1,
-                    P1_S3,
-                    P1_S4,
-                    P2_S1,
-                    P3_S3,
-                    panel_gam_polygon_width,
-                    panel_gam_polygon_height,
-                    self.gray_natural,
-                    self.gray_contrast,
-                    self.HEX_6string( *self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [self.rgb_1, self.rgb_2, self.rgb_3])),
-                    self.zoom)
-            if self.gamut_space == "HCY":
-                self.panel_gam_polygon.Update_Panel(
-                    self.angle_live,
-                    self.hcy_2,
-                    self.wheel,
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(0/360, 0, self.hcy_3) ), # Gray
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(0/360, 1, self.hcy_3) ), # Red
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(10/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(20/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(30/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(40/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(50/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(60/360, 1, self.hcy_3) ), # Yellow
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(70/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(80/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(90/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(100/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(110/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(120/360, 1, self.hcy_3) ), # Green
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(130/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(140/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(150/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(160/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(170/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(180/360, 1, self.hcy_3) ), # Cyan
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(190/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(200/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(210/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(220/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(230/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(240/360, 1, self.hcy_3) ), # Blue
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(250/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(260/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(270/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(280/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(290/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(300/360, 1, self.hcy_3) ), # Magenta
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(310/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(320/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(330/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(340/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(350/360, 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(360/360, 1, self.hcy_3) ), # Red
-                    self.gamut_shape,
-                    P1_S1,
-                    P1_S3,
-                    P1_S4,
-                    P2_S1,
-                    P3_S3,
-                    panel_gam_polygon_width,
-                    panel_gam_polygon_height,
-                    self.gray_natural,
-                    self.gray_contrast,
-                    self.HEX_6string( *self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [self.rgb_1, self.rgb_2, self.rgb_3])),
-                    self.zoom)
+            angle = self.angle_live
         if self.wheel == "RYB":
-            if self.gamut_space == "ARD":
-                self.panel_gam_polygon.Update_Panel(
-                    self.hcmy_to_hryb(self.angle_live),
-                    self.ard_2,
-                    self.wheel,
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(0/360), 0, self.ard_3) ), # Gray
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(0/360), 1, self.ard_3) ), # Red
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(10/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(20/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(30/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(40/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(50/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(60/360), 1, self.ard_3) ), # Yellow
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(70/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(80/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(90/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(100/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(110/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(120/360), 1, self.ard_3) ), # Green
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(130/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(140/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(150/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(160/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(170/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(180/360), 1, self.ard_3) ), # Cyan
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(190/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(200/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(210/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(220/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(230/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(240/360), 1, self.ard_3) ), # Blue
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(250/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(260/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(270/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(280/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(290/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(300/360), 1, self.ard_3) ), # Magenta
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(310/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(320/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(330/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(340/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(350/360), 1, self.ard_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.ard_to_rgb(self.hryb_to_hcmy(360/360), 1, self.ard_3) ), # Red
-                    self.gamut_shape,
-                    P1_S1,
-                    P1_S3,
-                    P1_S4,
-                    P2_S1,
-                    P3_S3,
-                    panel_gam_polygon_width,
-                    panel_gam_polygon_height,
-                    self.gray_natural,
-                    self.gray_contrast,
-                    self.HEX_6string( *self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [self.rgb_1, self.rgb_2, self.rgb_3])),
-                    self.zoom)
-            if self.gamut_space == "HSV":
-                self.panel_gam_polygon.Update_Panel(
-                    self.hcmy_to_hryb(self.angle_live),
-                    self.hsv_2,
-                    self.wheel,
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(0/360), 0, self.hsv_3) ), # Gray
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(0/360), 1, self.hsv_3) ), # Red
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(10/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(20/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(30/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(40/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(50/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(60/360), 1, self.hsv_3) ), # Yellow
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(70/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(80/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(90/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(100/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(110/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(120/360), 1, self.hsv_3) ), # Green
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(130/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(140/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(150/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(160/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(170/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(180/360), 1, self.hsv_3) ), # Cyan
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(190/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(200/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(210/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(220/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(230/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(240/360), 1, self.hsv_3) ), # Blue
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(250/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(260/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(270/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(280/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(290/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(300/360), 1, self.hsv_3) ), # Magenta
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(310/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(320/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(330/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(340/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(350/360), 1, self.hsv_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsv_to_rgb(self.hryb_to_hcmy(360/360), 1, self.hsv_3) ), # Red
-                    self.gamut_shape,
-                    P1_S1,
-                    P1_S3,
-                    P1_S4,
-                    P2_S1,
-                    P3_S3,
-                    panel_gam_polygon_width,
-                    panel_gam_polygon_height,
-                    self.gray_natural,
-                    self.gray_contrast,
-                    self.HEX_6string( *self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [self.rgb_1, self.rgb_2, self.rgb_3])),
-                    self.zoom)
-            if self.gamut_space == "HSL":
-                self.panel_gam_polygon.Update_Panel(
-                    self.hcmy_to_hryb(self.angle_live),
-                    self.hsl_2,
-                    self.wheel,
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(0/360), 0, self.hsl_3) ), # Gray
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(0/360), 1, self.hsl_3) ), # Red
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(10/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(20/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(30/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(40/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(50/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(60/360), 1, self.hsl_3) ), # Yellow
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(70/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(80/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(90/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(100/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(110/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(120/360), 1, self.hsl_3) ), # Green
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(130/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(140/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(150/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(160/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(170/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(180/360), 1, self.hsl_3) ), # Cyan
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(190/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(200/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(210/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(220/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(230/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(240/360), 1, self.hsl_3) ), # Blue
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(250/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(260/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(270/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(280/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(290/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(300/360), 1, self.hsl_3) ), # Magenta
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(310/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(320/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(330/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(340/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(350/360), 1, self.hsl_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hsl_to_rgb(self.hryb_to_hcmy(360/360), 1, self.hsl_3) ), # Red
-                    self.gamut_shape,
-                    P1_S1,
-                    P1_S3,
-                    P1_S4,
-                    P2_S1,
-                    P3_S3,
-                    panel_gam_polygon_width,
-                    panel_gam_polygon_height,
-                    self.gray_natural,
-                    self.gray_contrast,
-                    self.HEX_6string( *self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [self.rgb_1, self.rgb_2, self.rgb_3])),
-                    self.zoom)
-            if self.gamut_space == "HCY":
-                self.panel_gam_polygon.Update_Panel(
-                    self.hcmy_to_hryb(self.angle_live),
-                    self.hcy_2,
-                    self.wheel,
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(0/360), 0, self.hcy_3) ), # Gray
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(0/360), 1, self.hcy_3) ), # Red
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(10/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(20/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(30/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(40/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(50/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(60/360), 1, self.hcy_3) ), # Yellow
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(70/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(80/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(90/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(100/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(110/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(120/360), 1, self.hcy_3) ), # Green
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(130/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(140/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(150/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(160/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(170/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(180/360), 1, self.hcy_3) ), # Cyan
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(190/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(200/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(210/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(220/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(230/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(240/360), 1, self.hcy_3) ), # Blue
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(250/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(260/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(270/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(280/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(290/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(300/360), 1, self.hcy_3) ), # Magenta
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(310/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(320/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(330/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(340/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(350/360), 1, self.hcy_3) ),
-                    self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", self.hcy_to_rgb(self.hryb_to_hcmy(360/360), 1, self.hcy_3) ), # Red
-                    self.gamut_shape,
-                    P1_S1,
-                    P1_S3,
-                    P1_S4,
-                    P2_S1,
-                    P3_S3,
-                    panel_gam_polygon_width,
-                    panel_gam_polygon_height,
-                    self.gray_natural,
-                    self.gray_contrast,
-                    self.HEX_6string( *self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [self.rgb_1, self.rgb_2, self.rgb_3])),
-                    self.zoom)
+            angle = self.hcmy_to_hryb(self.angle_live)
+        # Radius and Third Component of the Gamut Space
+        if self.gamut_space == "ARD":
+            radius = self.ard_2
+            value = self.ard_3
+        if self.gamut_space == "HSV":
+            radius = self.hsv_2
+            value = self.hsv_3
+        if self.gamut_space == "HSL":
+            radius = self.hsl_2
+            value = self.hsl_3
+        if self.gamut_space == "HCY":
+            radius = self.hcy_2
+            value = self.hcy_3
+        # Hue Ring Samples
+        gray, ring = self.GAM_Ring(self.gamut_space, self.wheel, value)
+        # Update Circle of Colors and Polygon
+        self.panel_gam_polygon.Update_Panel(
+            angle,
+            radius,
+            self.wheel,
+            gray,
+            ring,
+            self.gamut_shape,
+            P1_S1,
+            P1_S3,
+            P1_S4,
+            P2_S1,
+            P3_S3,
+            panel_gam_polygon_width,
+            panel_gam_polygon_height,
+            self.gray_natural,
+            self.gray_contrast,
+            self.HEX_6string( *self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", [self.rgb_1, self.rgb_2, self.rgb_3])),
+            self.zoom)
+    def GAM_Ring(self, gamut_space, wheel, value):
+        # Third Component quantized to the Channel resolution
+        value = round(value * k_SVL) / k_SVL
+        key = (
+            gamut_space, wheel, value, self.gam_ring_step,
+            self.d_cm, self.d_cd, self.d_cp,
+            self.luma_r, self.luma_b, self.gamma_y,
+            self.quality,
+            )
+        if self.gam_ring_key == key:
+            return self.gam_ring
+        # Space to RGB
+        if gamut_space == "ARD":
+            to_rgb = self.ard_to_rgb
+        if gamut_space == "HSV":
+            to_rgb = self.hsv_to_rgb
+        if gamut_space == "HSL":
+            to_rgb = self.hsl_to_rgb
+        if gamut_space == "HCY":
+            to_rgb = self.hcy_to_rgb
+        # Hue Samples from Red to Red
+        if self.quality == "DRAFT":
+            count = int(360 / gam_ring_draft)
+        else:
+            count = int(360 / self.gam_ring_step)
+        hues = [i / count for i in range(0, count + 1)]
+        if wheel == "RYB":
+            hues = [self.hryb_to_hcmy(h) for h in hues]
+        # Batch Conversion
+        gray = self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", to_rgb(hues[0], 0, value) )
+        ring = [self.convert( self.d_cm, self.d_cd, self.d_cp, "RGB", to_rgb(h, 1, value) ) for h in hues]
+        # Memory
+        self.gam_ring_key = key
+        self.gam_ring = (gray, ring)
+        return self.gam_ring
     # DOT Update
     def Update_Panel_DOT(self):
         # Create Empty Matrix to Fill after
@@ -14291,6 +11808,7 @@ class PigmentO_Docker(DockWidget):
 
     #//
     #\\ Display ################################################################
+    @Profiled
     def Pigment_Display(self):
         # Color Display
         self.Update_Color_Header_1()
@@ -14309,12 +11827,17 @@ class PigmentO_Docker(DockWidget):
 
         # Harmony
         if self.harmony_rule != 0:
-            self.layout.harmony_1.setStyleSheet(str("QWidget { background-color: rgb(%f, %f, %f); }" % (self.har_1[1]*255, self.har_1[2]*255, self.har_1[3]*255)))
-            self.layout.harmony_2.setStyleSheet(str("QWidget { background-color: rgb(%f, %f, %f); }" % (self.har_2[1]*255, self.har_2[2]*255, self.har_2[3]*255)))
-            self.layout.harmony_3.setStyleSheet(str("QWidget { background-color: rgb(%f, %f, %f); }" % (self.har_3[1]*255, self.har_3[2]*255, self.har_3[3]*255)))
-            self.layout.harmony_4.setStyleSheet(str("QWidget { background-color: rgb(%f, %f, %f); }" % (self.har_4[1]*255, self.har_4[2]*255, self.har_4[3]*255)))
-            self.layout.harmony_5.setStyleSheet(str("QWidget { background-color: rgb(%f, %f, %f); }" % (self.har_5[1]*255, self.har_5[2]*255, self.har_5[3]*255)))
-            self.layout.color_harmonys.setStyleSheet(str("QWidget { background-color: %s; }" % (self.gray_natural)))
+            harmony = [self.har_1, self.har_2, self.har_3, self.har_4, self.har_5]
+            swatches = [self.layout.harmony_1, self.layout.harmony_2, self.layout.harmony_3, self.layout.harmony_4, self.layout.harmony_5]
+            for i in range(0, len(swatches)):
+                style = str("QWidget { background-color: rgb(%f, %f, %f); }" % (harmony[i][1]*255, harmony[i][2]*255, harmony[i][3]*255))
+                if style != self.harmony_styles[i]:
+                    swatches[i].setStyleSheet(style)
+                    self.harmony_styles[i] = style
+            style = str("QWidget { background-color: %s; }" % (self.gray_natural))
+            if style != self.harmony_styles[5]:
+                self.layout.color_harmonys.setStyleSheet(style)
+                self.harmony_styles[5] = style
 
         # Color Language
         hex = str( self.Pigment_2_HEX() )
@@ -14536,7 +12059,62 @@ class PigmentO_Docker(DockWidget):
             self.lab_1_slider.update()
             self.lab_2_slider.update()
             self.lab_3_slider.update()
+        # OKLAB
+        if self.chan_oklab == True:
+            oklab1_grade = self.Gradient_OKLAB([0, self.oklab_2, self.oklab_3], [1, self.oklab_2, self.oklab_3])
+            oklab2_grade = self.Gradient_OKLAB([self.oklab_1, 0, self.oklab_3], [self.oklab_1, 1, self.oklab_3])
+            oklab3_grade = self.Gradient_OKLAB([self.oklab_1, self.oklab_2, 0], [self.oklab_1, self.oklab_2, 1])
+            self.oklab_1_slider.Colors(oklab1_grade)
+            self.oklab_2_slider.Colors(oklab2_grade)
+            self.oklab_3_slider.Colors(oklab3_grade)
+            self.oklab_1_slider.update()
+            self.oklab_2_slider.update()
+            self.oklab_3_slider.update()
+        # OKLCH
+        if self.chan_oklch == True:
+            oklch1_grade = self.Gradient_OKLCH([0, self.oklch_2, self.oklch_3], [1, self.oklch_2, self.oklch_3])
+            oklch2_grade = self.Gradient_OKLCH([self.oklch_1, 0, self.oklch_3], [self.oklch_1, 1, self.oklch_3])
+            if self.hue_shine == True:
+                oklch3_grade = self.Gradient_OKHSV([0, 1, 1], [1, 1, 1])
+            else:
+                oklch3_grade = self.Gradient_OKLCH([self.oklch_1, self.oklch_2, 0], [self.oklch_1, self.oklch_2, 1])
+            self.oklch_1_slider.Colors(oklch1_grade)
+            self.oklch_2_slider.Colors(oklch2_grade)
+            self.oklch_3_slider.Colors(oklch3_grade)
+            self.oklch_1_slider.update()
+            self.oklch_2_slider.update()
+            self.oklch_3_slider.update()
+        # OKHSV
+        if self.chan_okhsv == True:
+            if self.hue_shine == True:
+                okhsv1_grade = self.Gradient_OKHSV([0, 1, 1], [1, 1, 1])
+            else:
+                okhsv1_grade = self.Gradient_OKHSV([0, self.okhsv_2, self.okhsv_3], [1, self.okhsv_2, self.okhsv_3])
+            okhsv2_grade = self.Gradient_OKHSV([self.okhsv_1, 0, self.okhsv_3], [self.okhsv_1, 1, self.okhsv_3])
+            okhsv3_grade = self.Gradient_OKHSV([self.okhsv_1, self.okhsv_2, 0], [self.okhsv_1, self.okhsv_2, 1])
+            self.okhsv_1_slider.Colors(okhsv1_grade)
+            self.okhsv_2_slider.Colors(okhsv2_grade)
+            self.okhsv_3_slider.Colors(okhsv3_grade)
+            self.okhsv_1_slider.update()
+            self.okhsv_2_slider.update()
+            self.okhsv_3_slider.update()
+        # OKHSL
+        if self.chan_okhsl == True:
+            if self.hue_shine == True:
+                okhsl1_grade = self.Gradient_OKHSV([0, 1, 1], [1, 1, 1])
+            else:
+                okhsl1_grade = self.Gradient_OKHSL([0, self.okhsl_2, self.okhsl_3], [1, self.okhsl_2, self.okhsl_3])
+            okhsl2_grade = self.Gradient_OKHSL([self.okhsl_1, 0, self.okhsl_3], [self.okhsl_1, 1, self.okhsl_3])
+            okhsl3_grade = self.Gradient_OKHSL([self.okhsl_1, self.okhsl_2, 0], [self.okhsl_1, self.okhsl_2, 1])
+            self.okhsl_1_slider.Colors(okhsl1_grade)
+            self.okhsl_2_slider.Colors(okhsl2_grade)
+            self.okhsl_3_slider.Colors(okhsl3_grade)
+            self.okhsl_1_slider.update()
+            self.okhsl_2_slider.update()
+            self.okhsl_3_slider.update()
     def Pigment_Release(self):
+        # Full Quality after a Drag
+        self.Quality_Release()
         # Apply color for users with Realease ON
         self.Pigment_2_Krita(True)
         # Dusplay Release Color and Luma Lock
@@ -14560,332 +12138,123 @@ class PigmentO_Docker(DockWidget):
         self.P1_S4 = self.P1_S4_r
         self.P2_S1 = self.P2_S1_r
         self.P3_S3 = self.P3_S3_r
+        # Swatches
+        self.SWA_Dirty()
         # Update the Widget
         self.Ratio()
-        # Unblock Signals
-        self.Signal_Block(False)
-        # History
-        self.History_List(self.rgb_1, self.rgb_2, self.rgb_3)
-        # Label Clean
-        self.layout.label.setText("")
-    def Mixer_Display(self):
-        # Update Variables
-        self.menu_mix = self.dialog.mix.isChecked()
-        self.menu_mix_index = self.dialog.mix_index.currentText()
-
-        # Mixer TTS
-        if (self.menu_mix == True and self.menu_mix_index == "TTS"):
-            if self.color_tts[0] == True:
-                input_tint = [self.color_tts[1], self.color_tts[2], self.color_tts[3]]
-                mix_tint = self.Gradient_RGB(input_tint, self.color_white)
-                mix_tone = self.Gradient_RGB(input_tint, self.gray_tts)
-                mix_shade = self.Gradient_RGB(input_tint, self.color_black)
-                self.mixer_tint.Colors(True, mix_tint)
-                self.mixer_tone.Colors(True, mix_tone)
-                self.mixer_shade.Colors(True, mix_shade)
-                self.mixer_tint.update()
-                self.mixer_tone.update()
-                self.mixer_shade.update()
-        else:
-            self.spacer_tint = 0
-            self.spacer_tone = 0
-            self.spacer_shade = 0
-            self.mixer_tint.Colors(False, 0)
-            self.mixer_tone.Colors(False, 0)
-            self.mixer_shade.Colors(False, 0)
-            self.layout.tint.setStyleSheet(self.bg_alpha)
-            self.layout.tone.setStyleSheet(self.bg_alpha)
-            self.layout.shade.setStyleSheet(self.bg_alpha)
-
-        # Mixer RGB
-        if (self.menu_mix == True and self.menu_mix_index == "RGB"):
-            if (self.color_rgb_l1[0] == True or self.color_rgb_r1[0] == True):
-                input_rgb_l1 = [self.color_rgb_l1[1], self.color_rgb_l1[2], self.color_rgb_l1[3]]
-                input_rgb_r1 = [self.color_rgb_r1[1], self.color_rgb_r1[2], self.color_rgb_r1[3]]
-                mix_rgb_g1 = self.Gradient_RGB(input_rgb_l1, input_rgb_r1)
-                self.mixer_rgb_g1.Colors(True, mix_rgb_g1)
-                self.mixer_rgb_g1.update()
-            else:
-                self.spacer_rgb_g1 = 0
-                self.mixer_rgb_g1.Colors(False, 0)
-                self.mixer_rgb_g1.update()
-            if (self.color_rgb_l2[0] == True or self.color_rgb_r2[0] == True):
-                input_rgb_l2 = [self.color_rgb_l2[1], self.color_rgb_l2[2], self.color_rgb_l2[3]]
-                input_rgb_r2 = [self.color_rgb_r2[1], self.color_rgb_r2[2], self.color_rgb_r2[3]]
-                mix_rgb_g2 = self.Gradient_RGB(input_rgb_l2, input_rgb_r2)
-                self.mixer_rgb_g2.Colors(True, mix_rgb_g2)
-                self.mixer_rgb_g2.update()
-            else:
-                self.spacer_rgb_g2 = 0
-                self.mixer_rgb_g2.Colors(False, 0)
-                self.mixer_rgb_g2.update()
-            if (self.color_rgb_l3[0] == True or self.color_rgb_r3[0] == True):
-                input_rgb_l3 = [self.color_rgb_l3[1], self.color_rgb_l3[2], self.color_rgb_l3[3]]
-                input_rgb_r3 = [self.color_rgb_r3[1], self.color_rgb_r3[2], self.color_rgb_r3[3]]
-                mix_rgb_g3 = self.Gradient_RGB(input_rgb_l3, input_rgb_r3)
-                self.mixer_rgb_g3.Colors(True, mix_rgb_g3)
-                self.mixer_rgb_g3.update()
-            else:
-                self.spacer_rgb_g3 = 0
-                self.mixer_rgb_g3.Colors(False, 0)
-                self.mixer_rgb_g3.update()
-        else:
-            self.layout.rgb_g1.setStyleSheet(self.bg_alpha)
-            self.layout.rgb_g2.setStyleSheet(self.bg_alpha)
-            self.layout.rgb_g3.setStyleSheet(self.bg_alpha)
-        # Mixer CMYK
-        if (self.menu_mix == True and self.menu_mix_index == "CMYK"):
-            if (self.color_cmyk_l1[0] == True or self.color_cmyk_r1[0] == True):
-                input_cmyk_l1 = [self.color_cmyk_l1[1], self.color_cmyk_l1[2], self.color_cmyk_l1[3], self.color_cmyk_l1[4]]
-                input_cmyk_r1 = [self.color_cmyk_r1[1], self.color_cmyk_r1[2], self.color_cmyk_r1[3], self.color_cmyk_r1[4]]
-                mix_cmyk_g1 = self.Gradient_CMYK(input_cmyk_l1, input_cmyk_r1)
-                self.mixer_cmyk_g1.Colors(True, mix_cmyk_g1)
-                self.mixer_cmyk_g1.update()
-            else:
-                self.spacer_cmyk_g1 = 0
-                self.mixer_cmyk_g1.Colors(False, 0)
-                self.mixer_cmyk_g1.update()
-            if (self.color_cmyk_l2[0] == True or self.color_cmyk_r2[0] == True):
-                input_cmyk_l2 = [self.color_cmyk_l2[1], self.color_cmyk_l2[2], self.color_cmyk_l2[3], self.color_cmyk_l2[4]]
-                input_cmyk_r2 = [self.color_cmyk_r2[1], self.color_cmyk_r2[2], self.color_cmyk_r2[3], self.color_cmyk_r2[4]]
-                mix_cmyk_g2 = self.Gradient_CMYK(input_cmyk_l2, input_cmyk_r2)
-                self.mixer_cmyk_g2.Colors(True, mix_cmyk_g2)
-                self.mixer_cmyk_g2.update()
-            else:
-                self.spacer_cmyk_g2 = 0
-                self.mixer_cmyk_g2.Colors(False, 0)
-                self.mixer_cmyk_g2.update()
-            if (self.color_cmyk_l3[0] == True or self.color_cmyk_r3[0] == True):
-                input_cmyk_l3 = [self.color_cmyk_l3[1], self.color_cmyk_l3[2], self.color_cmyk_l3[3], self.color_cmyk_l3[4]]
-                input_cmyk_r3 = [self.color_cmyk_r3[1], self.color_cmyk_r3[2], self.color_cmyk_r3[3], self.color_cmyk_r3[4]]
-                mix_cmyk_g3 = self.Gradient_CMYK(input_cmyk_l3, input_cmyk_r3)
-                self.mixer_cmyk_g3.Colors(True, mix_cmyk_g3)
-                self.mixer_cmyk_g3.update()
-            else:
-                self.spacer_cmyk_g3 = 0
-                self.mixer_cmyk_g3.Colors(False, 0)
-                self.mixer_cmyk_g3.update()
-        else:
-            self.layout.cmyk_g1.setStyleSheet(self.bg_alpha)
-            self.layout.cmyk_g2.setStyleSheet(self.bg_alpha)
-            self.layout.cmyk_g3.setStyleSheet(self.bg_alpha)
-        # Mixer RYB
-        if (self.menu_mix == True and self.menu_mix_index == "RYB"):
-            if (self.color_ryb_l1[0] == True or self.color_ryb_r1[0] == True):
-                input_ryb_l1 = [self.color_ryb_l1[1], self.color_ryb_l1[2], self.color_ryb_l1[3]]
-                input_ryb_r1 = [self.color_ryb_r1[1], self.color_ryb_r1[2], self.color_ryb_r1[3]]
-                mix_ryb_g1 = self.Gradient_RYB(input_ryb_l1, input_ryb_r1)
-                self.mixer_ryb_g1.Colors(True, mix_ryb_g1)
-                self.mixer_ryb_g1.update()
-            else:
-                self.spacer_ryb_g1 = 0
-                self.mixer_ryb_g1.Colors(False, 0)
-                self.mixer_ryb_g1.update()
-            if (self.color_ryb_l2[0] == True or self.color_ryb_r2[0] == True):
-                input_ryb_l2 = [self.color_ryb_l2[1], self.color_ryb_l2[2], self.color_ryb_l2[3]]
-                input_ryb_r2 = [self.color_ryb_r2[1], self.color_ryb_r2[2], self.color_ryb_r2[3]]
-                mix_ryb_g2 = self.Gradient_RYB(input_ryb_l2, input_ryb_r2)
-                self.mixer_ryb_g2.Colors(True, mix_ryb_g2)
-                self.mixer_ryb_g2.update()
-            else:
-                self.spacer_ryb_g2 = 0
-                self.mixer_ryb_g2.Colors(False, 0)
-                self.mixer_ryb_g2.update()
-            if (self.color_ryb_l3[0] == True or self.color_ryb_r3[0] == True):
-                input_ryb_l3 = [self.color_ryb_l3[1], self.color_ryb_l3[2], self.color_ryb_l3[3]]
-                input_ryb_r3 = [self.color_ryb_r3[1], self.color_ryb_r3[2], self.color_ryb_r3[3]]
-                mix_ryb_g3 = self.Gradient_RYB(input_ryb_l3, input_ryb_r3)
-                self.mixer_ryb_g3.Colors(True, mix_ryb_g3)
-                self.mixer_ryb_g3.update()
-            else:
-                self.spacer_ryb_g3 = 0
-                self.mixer_ryb_g3.Colors(False, 0)
-                self.mixer_ryb_g3.update()
-        else:
-            self.layout.ryb_g1.setStyleSheet(self.bg_alpha)
-            self.layout.ryb_g2.setStyleSheet(self.bg_alpha)
-            self.layout.ryb_g3.setStyleSheet(self.bg_alpha)
-        # Mixer YUV
-        if (self.menu_mix == True and self.menu_mix_index == "YUV"):
-            if (self.color_yuv_l1[0] == True or self.color_yuv_r1[0] == True):
-                input_yuv_l1 = [self.color_yuv_l1[1], self.color_yuv_l1[2], self.color_yuv_l1[3]]
-                input_yuv_r1 = [self.color_yuv_r1[1], self.color_yuv_r1[2], self.color_yuv_r1[3]]
-                mix_yuv_g1 = self.Gradient_YUV(input_yuv_l1, input_yuv_r1)
-                self.mixer_yuv_g1.Colors(True, mix_yuv_g1)
-                self.mixer_yuv_g1.update()
-            else:
-                self.spacer_yuv_g1 = 0
-                self.mixer_yuv_g1.Colors(False, 0)
-                self.mixer_yuv_g1.update()
-            if (self.color_yuv_l2[0] == True or self.color_yuv_r2[0] == True):
-                input_yuv_l2 = [self.color_yuv_l2[1], self.color_yuv_l2[2], self.color_yuv_l2[3]]
-                input_yuv_r2 = [self.color_yuv_r2[1], self.color_yuv_r2[2], self.color_yuv_r2[3]]
-                mix_yuv_g2 = self.Gradient_YUV(input_yuv_l2, input_yuv_r2)
-                self.mixer_yuv_g2.Colors(True, mix_yuv_g2)
-                self.mixer_yuv_g2.update()
-            else:
-                self.spacer_yuv_g2 = 0
-                self.mixer_yuv_g2.Colors(False, 0)
-                self.mixer_yuv_g2.update()
-            if (self.color_yuv_l3[0] == True or self.color_yuv_r3[0] == True):
-                input_yuv_l3 = [self.color_yuv_l3[1], self.color_yuv_l3[2], self.color_yuv_l3[3]]
-                input_yuv_r3 = [self.color_yuv_r3[1], self.color_yuv_r3[2], self.color_yuv_r3[3]]
-                mix_yuv_g3 = self.Gradient_YUV(input_yuv_l3, input_yuv_r3)
-                self.mixer_yuv_g3.Colors(True, mix_yuv_g3)
-                self.mixer_yuv_g3.update()
-            else:
-                self.spacer_yuv_g3 = 0
-                self.mixer_yuv_g3.Colors(False, 0)
-                self.mixer_yuv_g3.update()
-        else:
-            self.layout.yuv_g1.setStyleSheet(self.bg_alpha)
-            self.layout.yuv_g2.setStyleSheet(self.bg_alpha)
-            self.layout.yuv_g3.setStyleSheet(self.bg_alpha)
-
-        # Mixer ARD
-        if (self.menu_mix == True and self.menu_mix_index == "ARD"):
-            if (self.color_ard_l1[0] == True or self.color_ard_r1[0] == True):
-                input_ard_l1 = [self.color_ard_l1[1], self.color_ard_l1[2], self.color_ard_l1[3]]
-                input_ard_r1 = [self.color_ard_r1[1], self.color_ard_r1[2], self.color_ard_r1[3]]
-                mix_ard_g1 = self.Gradient_Mix_ARD(input_ard_l1, input_ard_r1)
-                self.mixer_ard_g1.Colors(True, mix_ard_g1)
-                self.mixer_ard_g1.update()
-            else:
-                self.spacer_ard_g1 = 0
-                self.mixer_ard_g1.Colors(False, 0)
-                self.mixer_ard_g1.update()
-            if (self.color_ard_l2[0] == True or self.color_ard_r2[0] == True):
-                input_ard_l2 = [self.color_ard_l2[1], self.color_ard_l2[2], self.color_ard_l2[3]]
-                input_ard_r2 = [self.color_ard_r2[1], self.color_ard_r2[2], self.color_ard_r2[3]]
-                mix_ard_g2 = self.Gradient_Mix_ARD(input_ard_l2, input_ard_r2)
-                self.mixer_ard_g2.Colors(True, mix_ard_g2)
-                self.mixer_ard_g2.update()
-            else:
-                self.spacer_ard_g2 = 0
-                self.mixer_ard_g2.Colors(False, 0)
-                self.mixer_ard_g2.update()
-            if (self.color_ard_l3[0] == True or self.color_ard_r3[0] == True):
-                input_ard_l3 = [self.color_ard_l3[1], self.color_ard_l3[2], self.color_ard_l3[3]]
-                input_ard_r3 = [self.color_ard_r3[1], self.color_ard_r3[2], self.color_ard_r3[3]]
-                mix_ard_g3 = self.Gradient_Mix_ARD(input_ard_l3, input_ard_r3)
-                self.mixer_ard_g3.Colors(True, mix_ard_g3)
-                self.mixer_ard_g3.update()
-            else:
-                self.spacer_ard_g3 = 0
-                self.mixer_ard_g3.Colors(False, 0)
-                self.mixer_ard_g3.update()
-        else:
-            self.layout.ard_g1.setStyleSheet(self.bg_alpha)
-            self.layout.ard_g2.setStyleSheet(self.bg_alpha)
-            self.layout.ard_g3.setStyleSheet(self.bg_alpha)
-        # Mixer HSV
-        if (self.menu_mix == True and self.menu_mix_index == "HSV"):
-            if (self.color_hsv_l1[0] == True or self.color_hsv_r1[0] == True):
-                input_hsv_l1 = [self.color_hsv_l1[1], self.color_hsv_l1[2], self.color_hsv_l1[3]]
-                input_hsv_r1 = [self.color_hsv_r1[1], self.color_hsv_r1[2], self.color_hsv_r1[3]]
-                mix_hsv_g1 = self.Gradient_Mix_HSV(input_hsv_l1, input_hsv_r1)
-                self.mixer_hsv_g1.Colors(True, mix_hsv_g1)
-                self.mixer_hsv_g1.update()
-            else:
-                self.spacer_hsv_g1 = 0
-                self.mixer_hsv_g1.Colors(False, 0)
-                self.mixer_hsv_g1.update()
-            if (self.color_hsv_l2[0] == True or self.color_hsv_r2[0] == True):
-                input_hsv_l2 = [self.color_hsv_l2[1], self.color_hsv_l2[2], self.color_hsv_l2[3]]
-                input_hsv_r2 = [self.color_hsv_r2[1], self.color_hsv_r2[2], self.color_hsv_r2[3]]
-                mix_hsv_g2 = self.Gradient_Mix_HSV(input_hsv_l2, input_hsv_r2)
-                self.mixer_hsv_g2.Colors(True, mix_hsv_g2)
-                self.mixer_hsv_g2.update()
-            else:
-                self.spacer_hsv_g2 = 0
-                self.mixer_hsv_g2.Colors(False, 0)
-                self.mixer_hsv_g2.update()
-            if (self.color_hsv_l3[0] == True or self.color_hsv_r3[0] == True):
-                input_hsv_l3 = [self.color_hsv_l3[1], self.color_hsv_l3[2], self.color_hsv_l3[3]]
-                input_hsv_r3 = [self.color_hsv_r3[1], self.color_hsv_r3[2], self.color_hsv_r3[3]]
-                mix_hsv_g3 = self.Gradient_Mix_HSV(input_hsv_l3, input_hsv_r3)
-                self.mixer_hsv_g3.Colors(True, mix_hsv_g3)
-                self.mixer_hsv_g3.update()
-            else:
-                self.spacer_hsv_g3 = 0
-                self.mixer_hsv_g3.Colors(False, 0)
-                self.mixer_hsv_g3.update()
+        # Unblock Signals
+        self.Signal_Block(False)
+        # History
+        self.History_List(self.rgb_1, self.rgb_2, self.rgb_3)
+        # Label Clean
+        self.layout.label.setText("")
+    # Quality
+    def Quality_Update(self):
+        # Draft is cheaper to render and is used while dragging or when the user asks for it
+        if (self.performance_inaccurate == True or self.quality_drag == True):
+            self.quality = "DRAFT"
         else:
-            self.layout.hsv_g1.setStyleSheet(self.bg_alpha)
-            self.layout.hsv_g2.setStyleSheet(self.bg_alpha)
-            self.layout.hsv_g3.setStyleSheet(self.bg_alpha)
-        # Mixer HSL
-        if (self.menu_mix == True and self.menu_mix_index == "HSL"):
-            if (self.color_hsl_l1[0] == True or self.color_hsl_r1[0] == True):
-                input_hsl_l1 = [self.color_hsl_l1[1], self.color_hsl_l1[2], self.color_hsl_l1[3]]
-                input_hsl_r1 = [self.color_hsl_r1[1], self.color_hsl_r1[2], self.color_hsl_r1[3]]
-                mix_hsl_g1 = self.Gradient_Mix_HSL(input_hsl_l1, input_hsl_r1)
-                self.mixer_hsl_g1.Colors(True, mix_hsl_g1)
-                self.mixer_hsl_g1.update()
-            else:
-                self.spacer_hsl_g1 = 0
-                self.mixer_hsl_g1.Colors(False, 0)
-                self.mixer_hsl_g1.update()
-            if (self.color_hsl_l2[0] == True or self.color_hsl_r2[0] == True):
-                input_hsl_l2 = [self.color_hsl_l2[1], self.color_hsl_l2[2], self.color_hsl_l2[3]]
-                input_hsl_r2 = [self.color_hsl_r2[1], self.color_hsl_r2[2], self.color_hsl_r2[3]]
-                mix_hsl_g2 = self.Gradient_Mix_HSL(input_hsl_l2, input_hsl_r2)
-                self.mixer_hsl_g2.Colors(True, mix_hsl_g2)
-                self.mixer_hsl_g2.update()
-            else:
-                self.spacer_hsl_g2 = 0
-                self.mixer_hsl_g2.Colors(False, 0)
-                self.mixer_hsl_g2.update()
-            if (self.color_hsl_l3[0] == True or self.color_hsl_r3[0] == True):
-                input_hsl_l3 = [self.color_hsl_l3[1], self.color_hsl_l3[2], self.color_hsl_l3[3]]
-                input_hsl_r3 = [self.color_hsl_r3[1], self.color_hsl_r3[2], self.color_hsl_r3[3]]
-                mix_hsl_g3 = self.Gradient_Mix_HSL(input_hsl_l3, input_hsl_r3)
-                self.mixer_hsl_g3.Colors(True, mix_hsl_g3)
-                self.mixer_hsl_g3.update()
-            else:
-                self.spacer_hsl_g3 = 0
-                self.mixer_hsl_g3.Colors(False, 0)
-                self.mixer_hsl_g3.update()
+            self.quality = "FINE"
+        profiler.Set_Tier(self.quality)
+    def Quality_Drag(self):
+        if QtWidgets.QApplication.mouseButtons() == QtCore.Qt.NoButton:
+            return
+        if self.quality_drag == False:
+            self.quality_drag = True
+            self.Quality_Update()
+        self.quality_timer.start()
+    def Quality_Release(self):
+        # Render once at full accuracy after the drag
+        self.quality_timer.stop()
+        if self.quality_drag == True:
+            self.quality_drag = False
+            self.Quality_Update()
+            if self.quality == "FINE":
+                self.Pigment_Sync()
+                self.Pigment_Display()
+                self.Mixer_Display()
+    def Quality_Timeout(self):
+        # Drags that end without a release signal, like the spin boxes
+        if QtWidgets.QApplication.mouseButtons() == QtCore.Qt.NoButton:
+            self.Quality_Release()
         else:
-            self.layout.hsl_g1.setStyleSheet(self.bg_alpha)
-            self.layout.hsl_g2.setStyleSheet(self.bg_alpha)
-            self.layout.hsl_g3.setStyleSheet(self.bg_alpha)
-        # Mixer HCY
-        if (self.menu_mix == True and self.menu_mix_index == "HCY"):
-            if (self.color_hcy_l1[0] == True or self.color_hcy_r1[0] == True):
-                input_hcy_l1 = [self.color_hcy_l1[1], self.color_hcy_l1[2], self.color_hcy_l1[3]]
-                input_hcy_r1 = [self.color_hcy_r1[1], self.color_hcy_r1[2], self.color_hcy_r1[3]]
-                mix_hcy_g1 = self.Gradient_Mix_HCY(input_hcy_l1, input_hcy_r1)
-                self.mixer_hcy_g1.Colors(True, mix_hcy_g1)
-                self.mixer_hcy_g1.update()
-            else:
-                self.spacer_hcy_g1 = 0
-                self.mixer_hcy_g1.Colors(False, 0)
-                self.mixer_hcy_g1.update()
-            if (self.color_hcy_l2[0] == True or self.color_hcy_r2[0] == True):
-                input_hcy_l2 = [self.color_hcy_l2[1], self.color_hcy_l2[2], self.color_hcy_l2[3]]
-                input_hcy_r2 = [self.color_hcy_r2[1], self.color_hcy_r2[2], self.color_hcy_r2[3]]
-                mix_hcy_g2 = self.Gradient_Mix_HCY(input_hcy_l2, input_hcy_r2)
-                self.mixer_hcy_g2.Colors(True, mix_hcy_g2)
-                self.mixer_hcy_g2.update()
-            else:
-                self.spacer_hcy_g2 = 0
-                self.mixer_hcy_g2.Colors(False, 0)
-                self.mixer_hcy_g2.update()
-            if (self.color_hcy_l3[0] == True or self.color_hcy_r3[0] == True):
-                input_hcy_l3 = [self.color_hcy_l3[1], self.color_hcy_l3[2], self.color_hcy_l3[3]]
-                input_hcy_r3 = [self.color_hcy_r3[1], self.color_hcy_r3[2], self.color_hcy_r3[3]]
-                mix_hcy_g3 = self.Gradient_Mix_HCY(input_hcy_l3, input_hcy_r3)
-                self.mixer_hcy_g3.Colors(True, mix_hcy_g3)
-                self.mixer_hcy_g3.update()
-            else:
-                self.spacer_hcy_g3 = 0
-                self.mixer_hcy_g3.Colors(False, 0)
-                self.mixer_hcy_g3.update()
+            self.quality_timer.start()
+    @Profiled
+    def Mixer_Display(self):
+        # Update Variables
+        self.menu_mix = self.dialog.mix.isChecked()
+        self.menu_mix_index = self.dialog.mix_index.currentText()
+
+        # Mixer TTS
+        if (self.menu_mix == True and self.menu_mix_index == "TTS"):
+            if self.color_tts[0] == True:
+                input_tint = [self.color_tts[1], self.color_tts[2], self.color_tts[3]]
+                self.Mixer_Gradient("tint", self.Gradient_RGB, input_tint, self.color_white)
+                self.Mixer_Gradient("tone", self.Gradient_RGB, input_tint, self.gray_tts)
+                self.Mixer_Gradient("shade", self.Gradient_RGB, input_tint, self.color_black)
         else:
-            self.layout.hcy_g1.setStyleSheet(self.bg_alpha)
-            self.layout.hcy_g2.setStyleSheet(self.bg_alpha)
-            self.layout.hcy_g3.setStyleSheet(self.bg_alpha)
+            self.spacer_tint = 0
+            self.spacer_tone = 0
+            self.spacer_shade = 0
+            self.Mixer_Clear("tint", False)
+            self.Mixer_Clear("tone", False)
+            self.Mixer_Clear("shade", False)
+            self.layout.tint.setStyleSheet(self.bg_alpha)
+            self.layout.tone.setStyleSheet(self.bg_alpha)
+            self.layout.shade.setStyleSheet(self.bg_alpha)
+
+        # Mixer Spaces
+        mixers = [
+            ["RGB", "rgb", self.Gradient_RGB],
+            ["CMYK", "cmyk", self.Gradient_CMYK],
+            ["RYB", "ryb", self.Gradient_RYB],
+            ["YUV", "yuv", self.Gradient_YUV],
+            ["ARD", "ard", self.Gradient_Mix_ARD],
+            ["HSV", "hsv", self.Gradient_Mix_HSV],
+            ["HSL", "hsl", self.Gradient_Mix_HSL],
+            ["HCY", "hcy", self.Gradient_Mix_HCY],
+            ["OKLAB", "oklab", self.Gradient_OKLAB],
+            ["OKLCH", "oklch", self.Gradient_Mix_OKLCH],
+            ["OKHSV", "okhsv", self.Gradient_Mix_OKHSV],
+            ["OKHSL", "okhsl", self.Gradient_Mix_OKHSL],
+            ]
+        for index, space, gradient in mixers:
+            for i in ["1", "2", "3"]:
+                if (self.menu_mix == True and self.menu_mix_index == index):
+                    left = getattr(self, "color_" + space + "_l" + i)
+                    right = getattr(self, "color_" + space + "_r" + i)
+                    if (left[0] == True or right[0] == True):
+                        self.Mixer_Gradient(space + "_g" + i, gradient, left[1:], right[1:])
+                    else:
+                        setattr(self, "spacer_" + space + "_g" + i, 0)
+                        self.Mixer_Clear(space + "_g" + i, True)
+                else:
+                    getattr(self.layout, space + "_g" + i).setStyleSheet(self.bg_alpha)
+    def Mixer_Gradient(self, name, gradient, left, right):
+        # Gradients are only built when their endpoints or the document color changed
+        key = (gradient.__name__, tuple(left), tuple(right), self.d_cm, self.d_cd, self.d_cp, self.quality)
+        if self.mixer_shown.get(name) == key:
+            return
+        cache = self.mixer_cache.get(name)
+        if (cache is None or cache[0] != key):
+            cache = self.mixer_cache[name] = [key, gradient(left, right)]
+        mixer = getattr(self, "mixer_" + name)
+        mixer.Colors(True, cache[1])
+        mixer.update()
+        self.mixer_shown[name] = key
+    def Mixer_Reset(self):
+        # Luma and XYZ options change every gradient without touching their endpoints
+        self.mixer_cache.clear()
+        self.mixer_shown.clear()
+        self.Mixer_Display()
+    def Mixer_Clear(self, name, update):
+        if self.mixer_shown.get(name, "") is None:
+            return
+        mixer = getattr(self, "mixer_" + name)
+        mixer.Colors(False, 0)
+        if update == True:
+            mixer.update()
+        self.mixer_shown[name] = None
 
     # Aspect Ratio
     def Ratio(self):
@@ -14908,6 +12277,10 @@ class PigmentO_Docker(DockWidget):
                 self.Update_Panel_HSV()
             if self.panel_active == "HSL":
                 self.Update_Panel_HSL()
+            if self.panel_active == "OKHSV":
+                self.Update_Panel_OKHSV()
+            if self.panel_active == "OKHSL":
+                self.Update_Panel_OKHSL()
             if self.panel_active == "YUV":
                 self.Update_Panel_YUV()
             if self.panel_active == "HUE":
@@ -14992,6 +12365,22 @@ class PigmentO_Docker(DockWidget):
                 self.lab_1_slider.Update(self.lab_1, self.channel_width)
                 self.lab_2_slider.Update(self.lab_2, self.channel_width)
                 self.lab_3_slider.Update(self.lab_3, self.channel_width)
+            if self.chan_oklab == True:
+                self.oklab_1_slider.Update(self.oklab_1, self.channel_width)
+                self.oklab_2_slider.Update(self.oklab_2, self.channel_width)
+                self.oklab_3_slider.Update(self.oklab_3, self.channel_width)
+            if self.chan_oklch == True:
+                self.oklch_1_slider.Update(self.oklch_1, self.channel_width)
+                self.oklch_2_slider.Update(self.oklch_2, self.channel_width)
+                self.oklch_3_slider.Update(self.oklch_3, self.channel_width)
+            if self.chan_okhsv == True:
+                self.okhsv_1_slider.Update(self.okhsv_1, self.channel_width)
+                self.okhsv_2_slider.Update(self.okhsv_2, self.channel_width)
+                self.okhsv_3_slider.Update(self.okhsv_3, self.channel_width)
+            if self.chan_okhsl == True:
+                self.okhsl_1_slider.Update(self.okhsl_1, self.channel_width)
+                self.okhsl_2_slider.Update(self.okhsl_2, self.channel_width)
+                self.okhsl_3_slider.Update(self.okhsl_3, self.channel_width)
         except:
             pass
         # Mixers
@@ -15061,6 +12450,22 @@ class PigmentO_Docker(DockWidget):
                     self.mixer_lch_g1.Update(self.spacer_lch_g1, self.mixer_width)
                     self.mixer_lch_g2.Update(self.spacer_lch_g2, self.mixer_width)
                     self.mixer_lch_g3.Update(self.spacer_lch_g3, self.mixer_width)
+                if self.menu_mix_index == "OKLAB":
+                    self.mixer_oklab_g1.Update(self.spacer_oklab_g1, self.mixer_width)
+                    self.mixer_oklab_g2.Update(self.spacer_oklab_g2, self.mixer_width)
+                    self.mixer_oklab_g3.Update(self.spacer_oklab_g3, self.mixer_width)
+                if self.menu_mix_index == "OKLCH":
+                    self.mixer_oklch_g1.Update(self.spacer_oklch_g1, self.mixer_width)
+                    self.mixer_oklch_g2.Update(self.spacer_oklch_g2, self.mixer_width)
+                    self.mixer_oklch_g3.Update(self.spacer_oklch_g3, self.mixer_width)
+                if self.menu_mix_index == "OKHSV":
+                    self.mixer_okhsv_g1.Update(self.spacer_okhsv_g1, self.mixer_width)
+                    self.mixer_okhsv_g2.Update(self.spacer_okhsv_g2, self.mixer_width)
+                    self.mixer_okhsv_g3.Update(self.spacer_okhsv_g3, self.mixer_width)
+                if self.menu_mix_index == "OKHSL":
+                    self.mixer_okhsl_g1.Update(self.spacer_okhsl_g1, self.mixer_width)
+                    self.mixer_okhsl_g2.Update(self.spacer_okhsl_g2, self.mixer_width)
+                    self.mixer_okhsl_g3.Update(self.spacer_okhsl_g3, self.mixer_width)
         except:
             pass
         # Object
@@ -15211,6 +12616,10 @@ class PigmentO_Docker(DockWidget):
             self.Update_Panel_HSL()
         if self.panel_active == "HCY":
             self.Update_Panel_HCY()
+        if self.panel_active == "OKHSV":
+            self.Update_Panel_OKHSV()
+        if self.panel_active == "OKHSL":
+            self.Update_Panel_OKHSL()
         if self.panel_active == "HUE":
             self.Update_Panel_HUE()
         if self.panel_active == "GAM":
@@ -15468,8 +12877,8 @@ class PigmentO_Docker(DockWidget):
         elif (diagonal > 0 and diagonal <= 1):
             # Angles according to O45(RED) as Origin
             AR = 0 # RED
-            AG = self.Math_2D_Points_Lines_Angle(self.O23[0], self.O23[1], 0, 0, self.O45[0], self.O45[1]) # GREEN
-            AB = self.Math_2D_Points_Lines_Angle(self.O61[0], self.O61[1], 0, 0, self.O45[0], self.O45[1]) # BLUE
+            AG = self.hexagon_red["O23"] # GREEN
+            AB = self.hexagon_red["O61"] # BLUE
             # Certain
             if arc == AR:
                 inter = [self.O45[0], self.O45[1]]
@@ -15492,12 +12901,12 @@ class PigmentO_Docker(DockWidget):
                 total = self.Math_2D_Points_Distance(0, 0, inter[0], inter[1])
         elif (diagonal > 1 and diagonal < 2):
             # Angles according to O45(RED) as Origin
-            A1 = self.Math_2D_Points_Lines_Angle(self.O1[0], self.O1[1], 0, 0, self.O45[0], self.O45[1]) # O1
-            A2 = self.Math_2D_Points_Lines_Angle(self.O2[0], self.O2[1], 0, 0, self.O45[0], self.O45[1]) # O2
-            A3 = self.Math_2D_Points_Lines_Angle(self.O3[0], self.O3[1], 0, 0, self.O45[0], self.O45[1]) # O3
-            A4 = self.Math_2D_Points_Lines_Angle(self.O4[0], self.O4[1], 0, 0, self.O45[0], self.O45[1]) # O4
-            A5 = self.Math_2D_Points_Lines_Angle(self.O5[0], self.O5[1], 0, 0, self.O45[0], self.O45[1]) # O5
-            A6 = self.Math_2D_Points_Lines_Angle(self.O6[0], self.O6[1], 0, 0, self.O45[0], self.O45[1]) # O6
+            A1 = self.hexagon_red["O1"] # O1
+            A2 = self.hexagon_red["O2"] # O2
+            A3 = self.hexagon_red["O3"] # O3
+            A4 = self.hexagon_red["O4"] # O4
+            A5 = self.hexagon_red["O5"] # O5
+            A6 = self.hexagon_red["O6"] # O6
             # Certain
             if arc == A1:
                 inter = [self.O1[0], self.O1[1]]
@@ -15538,9 +12947,9 @@ class PigmentO_Docker(DockWidget):
                 total = self.Math_2D_Points_Distance(0, 0, inter[0], inter[1])
         elif (diagonal >= 2 and diagonal < 3):
             # Angles according to O45(RED) as Origin
-            AY = self.Math_2D_Points_Lines_Angle(self.O34[0], self.O34[1], 0, 0, self.O45[0], self.O45[1]) # YELLOW
-            AC = self.Math_2D_Points_Lines_Angle(self.O12[0], self.O12[1], 0, 0, self.O45[0], self.O45[1]) # CYAN
-            AM = self.Math_2D_Points_Lines_Angle(self.O56[0], self.O56[1], 0, 0, self.O45[0], self.O45[1]) # MAGENTA
+            AY = self.hexagon_red["O34"] # YELLOW
+            AC = self.hexagon_red["O12"] # CYAN
+            AM = self.hexagon_red["O56"] # MAGENTA
             # Certain
             if arc == AY:
                 inter = [self.O34[0], self.O34[1]]
@@ -15826,6 +13235,58 @@ class PigmentO_Docker(DockWidget):
         self.Color_HUE("LAB", self.lab_1, self.lab_2, self.lab_3, 0)
         self.Color_APPLY("LAB", self.lab_1, self.lab_2, self.lab_3, 0)
 
+    def Pigment_OKLAB_1_Half(self):
+        self.oklab_1 = half
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+    def Pigment_OKLAB_2_Half(self):
+        self.oklab_2 = half
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+    def Pigment_OKLAB_3_Half(self):
+        self.oklab_3 = half
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+
+    def Pigment_OKLCH_1_Half(self):
+        self.oklch_1 = half
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+    def Pigment_OKLCH_2_Half(self):
+        self.oklch_2 = half
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+    def Pigment_OKLCH_3_Half(self):
+        self.oklch_3 = half
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+
+    def Pigment_OKHSV_1_Half(self):
+        self.okhsv_1 = half
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+    def Pigment_OKHSV_2_Half(self):
+        self.okhsv_2 = half
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+    def Pigment_OKHSV_3_Half(self):
+        self.okhsv_3 = half
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+
+    def Pigment_OKHSL_1_Half(self):
+        self.okhsl_1 = half
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+    def Pigment_OKHSL_2_Half(self):
+        self.okhsl_2 = half
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+    def Pigment_OKHSL_3_Half(self):
+        self.okhsl_3 = half
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+
     #//
     #\\ Channels Minus #########################################################
     def Pigment_AAA_1_Minus(self):
@@ -16076,6 +13537,82 @@ class PigmentO_Docker(DockWidget):
         self.Color_HUE("LAB", self.lab_1, self.lab_2, self.lab_3, 0)
         self.Color_APPLY("LAB", self.lab_1, self.lab_2, self.lab_3, 0)
 
+    def Pigment_OKLAB_1_Minus(self):
+        self.oklab_1 = self.oklab_1 - u_LLL
+        if self.oklab_1 <= zero:
+            self.oklab_1 = zero
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+    def Pigment_OKLAB_2_Minus(self):
+        self.oklab_2 = self.oklab_2 - u_AB
+        if self.oklab_2 <= zero:
+            self.oklab_2 = zero
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+    def Pigment_OKLAB_3_Minus(self):
+        self.oklab_3 = self.oklab_3 - u_AB
+        if self.oklab_3 <= zero:
+            self.oklab_3 = zero
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+
+    def Pigment_OKLCH_1_Minus(self):
+        self.oklch_1 = self.oklch_1 - u_LLL
+        if self.oklch_1 <= zero:
+            self.oklch_1 = zero
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+    def Pigment_OKLCH_2_Minus(self):
+        self.oklch_2 = self.oklch_2 - u_SVL
+        if self.oklch_2 <= zero:
+            self.oklch_2 = zero
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+    def Pigment_OKLCH_3_Minus(self):
+        self.oklch_3 = self.oklch_3 - u_HUE
+        if self.oklch_3 < zero:
+            self.oklch_3 = unit
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+
+    def Pigment_OKHSV_1_Minus(self):
+        self.okhsv_1 = self.okhsv_1 - u_HUE
+        if self.okhsv_1 < zero:
+            self.okhsv_1 = unit
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+    def Pigment_OKHSV_2_Minus(self):
+        self.okhsv_2 = self.okhsv_2 - u_SVL
+        if self.okhsv_2 <= zero:
+            self.okhsv_2 = zero
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+    def Pigment_OKHSV_3_Minus(self):
+        self.okhsv_3 = self.okhsv_3 - u_SVL
+        if self.okhsv_3 <= zero:
+            self.okhsv_3 = zero
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+
+    def Pigment_OKHSL_1_Minus(self):
+        self.okhsl_1 = self.okhsl_1 - u_HUE
+        if self.okhsl_1 < zero:
+            self.okhsl_1 = unit
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+    def Pigment_OKHSL_2_Minus(self):
+        self.okhsl_2 = self.okhsl_2 - u_SVL
+        if self.okhsl_2 <= zero:
+            self.okhsl_2 = zero
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+    def Pigment_OKHSL_3_Minus(self):
+        self.okhsl_3 = self.okhsl_3 - u_SVL
+        if self.okhsl_3 <= zero:
+            self.okhsl_3 = zero
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+
     #//
     #\\ Channels Plus ##########################################################
     def Pigment_AAA_1_Plus(self):
@@ -16326,6 +13863,82 @@ class PigmentO_Docker(DockWidget):
         self.Color_HUE("LAB", self.lab_1, self.lab_2, self.lab_3, 0)
         self.Color_APPLY("LAB", self.lab_1, self.lab_2, self.lab_3, 0)
 
+    def Pigment_OKLAB_1_Plus(self):
+        self.oklab_1 = self.oklab_1 + u_LLL
+        if self.oklab_1 >= unit:
+            self.oklab_1 = unit
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+    def Pigment_OKLAB_2_Plus(self):
+        self.oklab_2 = self.oklab_2 + u_AB
+        if self.oklab_2 >= unit:
+            self.oklab_2 = unit
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+    def Pigment_OKLAB_3_Plus(self):
+        self.oklab_3 = self.oklab_3 + u_AB
+        if self.oklab_3 >= unit:
+            self.oklab_3 = unit
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+
+    def Pigment_OKLCH_1_Plus(self):
+        self.oklch_1 = self.oklch_1 + u_LLL
+        if self.oklch_1 >= unit:
+            self.oklch_1 = unit
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+    def Pigment_OKLCH_2_Plus(self):
+        self.oklch_2 = self.oklch_2 + u_SVL
+        if self.oklch_2 >= unit:
+            self.oklch_2 = unit
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+    def Pigment_OKLCH_3_Plus(self):
+        self.oklch_3 = self.oklch_3 + u_HUE
+        if self.oklch_3 > unit:
+            self.oklch_3 = zero
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+
+    def Pigment_OKHSV_1_Plus(self):
+        self.okhsv_1 = self.okhsv_1 + u_HUE
+        if self.okhsv_1 > unit:
+            self.okhsv_1 = zero
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+    def Pigment_OKHSV_2_Plus(self):
+        self.okhsv_2 = self.okhsv_2 + u_SVL
+        if self.okhsv_2 >= unit:
+            self.okhsv_2 = unit
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+    def Pigment_OKHSV_3_Plus(self):
+        self.okhsv_3 = self.okhsv_3 + u_SVL
+        if self.okhsv_3 >= unit:
+            self.okhsv_3 = unit
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+
+    def Pigment_OKHSL_1_Plus(self):
+        self.okhsl_1 = self.okhsl_1 + u_HUE
+        if self.okhsl_1 > unit:
+            self.okhsl_1 = zero
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+    def Pigment_OKHSL_2_Plus(self):
+        self.okhsl_2 = self.okhsl_2 + u_SVL
+        if self.okhsl_2 >= unit:
+            self.okhsl_2 = unit
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+    def Pigment_OKHSL_3_Plus(self):
+        self.okhsl_3 = self.okhsl_3 + u_SVL
+        if self.okhsl_3 >= unit:
+            self.okhsl_3 = unit
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+
     #//
     #\\ Channels Slider Modify #################################################
     def Pigment_AAA_1_Slider_Modify(self, SIGNAL_VALUE):
@@ -16538,6 +14151,70 @@ class PigmentO_Docker(DockWidget):
         self.Color_APPLY("LAB", self.lab_1, self.lab_2, self.lab_3, 0)
         self.layout.label.setText(str(round(SIGNAL_VALUE*100,2))+" %")
 
+    def Pigment_OKLAB_1_Slider_Modify(self, SIGNAL_VALUE):
+        self.oklab_1 = SIGNAL_VALUE
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.layout.label.setText(str(round(SIGNAL_VALUE*100,2))+" %")
+    def Pigment_OKLAB_2_Slider_Modify(self, SIGNAL_VALUE):
+        self.oklab_2 = SIGNAL_VALUE
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.layout.label.setText(str(round(SIGNAL_VALUE*100,2))+" %")
+    def Pigment_OKLAB_3_Slider_Modify(self, SIGNAL_VALUE):
+        self.oklab_3 = SIGNAL_VALUE
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.layout.label.setText(str(round(SIGNAL_VALUE*100,2))+" %")
+
+    def Pigment_OKLCH_1_Slider_Modify(self, SIGNAL_VALUE):
+        self.oklch_1 = SIGNAL_VALUE
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.layout.label.setText(str(round(SIGNAL_VALUE*100,2))+" %")
+    def Pigment_OKLCH_2_Slider_Modify(self, SIGNAL_VALUE):
+        self.oklch_2 = SIGNAL_VALUE
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.layout.label.setText(str(round(SIGNAL_VALUE*100,2))+" %")
+    def Pigment_OKLCH_3_Slider_Modify(self, SIGNAL_VALUE):
+        self.oklch_3 = SIGNAL_VALUE
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.layout.label.setText(str(round(SIGNAL_VALUE*360,2))+" º")
+
+    def Pigment_OKHSV_1_Slider_Modify(self, SIGNAL_VALUE):
+        self.okhsv_1 = SIGNAL_VALUE
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.layout.label.setText(str(round(SIGNAL_VALUE*360,2))+" º")
+    def Pigment_OKHSV_2_Slider_Modify(self, SIGNAL_VALUE):
+        self.okhsv_2 = SIGNAL_VALUE
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.layout.label.setText(str(round(SIGNAL_VALUE*100,2))+" %")
+    def Pigment_OKHSV_3_Slider_Modify(self, SIGNAL_VALUE):
+        self.okhsv_3 = SIGNAL_VALUE
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.layout.label.setText(str(round(SIGNAL_VALUE*100,2))+" %")
+
+    def Pigment_OKHSL_1_Slider_Modify(self, SIGNAL_VALUE):
+        self.okhsl_1 = SIGNAL_VALUE
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.layout.label.setText(str(round(SIGNAL_VALUE*360,2))+" º")
+    def Pigment_OKHSL_2_Slider_Modify(self, SIGNAL_VALUE):
+        self.okhsl_2 = SIGNAL_VALUE
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.layout.label.setText(str(round(SIGNAL_VALUE*100,2))+" %")
+    def Pigment_OKHSL_3_Slider_Modify(self, SIGNAL_VALUE):
+        self.okhsl_3 = SIGNAL_VALUE
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.layout.label.setText(str(round(SIGNAL_VALUE*100,2))+" %")
+
     #//
     #\\ Channels Slider Release ################################################
     def Pigment_AAA_1_Slider_Release(self, SIGNAL_RELEASE):
@@ -16710,6 +14387,58 @@ class PigmentO_Docker(DockWidget):
         self.Color_APPLY("LAB", self.lab_1, self.lab_2, self.lab_3, 0)
         self.Pigment_Release()
 
+    def Pigment_OKLAB_1_Slider_Release(self, SIGNAL_RELEASE):
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Pigment_Release()
+    def Pigment_OKLAB_2_Slider_Release(self, SIGNAL_RELEASE):
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Pigment_Release()
+    def Pigment_OKLAB_3_Slider_Release(self, SIGNAL_RELEASE):
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Pigment_Release()
+
+    def Pigment_OKLCH_1_Slider_Release(self, SIGNAL_RELEASE):
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Pigment_Release()
+    def Pigment_OKLCH_2_Slider_Release(self, SIGNAL_RELEASE):
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Pigment_Release()
+    def Pigment_OKLCH_3_Slider_Release(self, SIGNAL_RELEASE):
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Pigment_Release()
+
+    def Pigment_OKHSV_1_Slider_Release(self, SIGNAL_RELEASE):
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Pigment_Release()
+    def Pigment_OKHSV_2_Slider_Release(self, SIGNAL_RELEASE):
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Pigment_Release()
+    def Pigment_OKHSV_3_Slider_Release(self, SIGNAL_RELEASE):
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Pigment_Release()
+
+    def Pigment_OKHSL_1_Slider_Release(self, SIGNAL_RELEASE):
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Pigment_Release()
+    def Pigment_OKHSL_2_Slider_Release(self, SIGNAL_RELEASE):
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Pigment_Release()
+    def Pigment_OKHSL_3_Slider_Release(self, SIGNAL_RELEASE):
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Pigment_Release()
+
     #//
     #\\ Channels Values Modify #################################################
     def Pigment_AAA_1_Value_Modify(self):
@@ -16960,977 +14689,1661 @@ class PigmentO_Docker(DockWidget):
         self.Pigment_Release()
         self.layout.label.setText(str(round(self.lab_3*100,2))+" %")
 
+    def Pigment_OKLAB_1_Value_Modify(self):
+        self.oklab_1 = self.layout.oklab_1_value.value() / k_LLL
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Pigment_Release()
+        self.layout.label.setText(str(round(self.oklab_1*100,2))+" %")
+    def Pigment_OKLAB_2_Value_Modify(self):
+        self.oklab_2 = self.layout.oklab_2_value.value() / k_AB
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Pigment_Release()
+        self.layout.label.setText(str(round(self.oklab_2*100,2))+" %")
+    def Pigment_OKLAB_3_Value_Modify(self):
+        self.oklab_3 = self.layout.oklab_3_value.value() / k_AB
+        self.Color_HUE("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Color_APPLY("OKLAB", self.oklab_1, self.oklab_2, self.oklab_3, 0)
+        self.Pigment_Release()
+        self.layout.label.setText(str(round(self.oklab_3*100,2))+" %")
+
+    def Pigment_OKLCH_1_Value_Modify(self):
+        self.oklch_1 = self.layout.oklch_1_value.value() / k_LLL
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Pigment_Release()
+        self.layout.label.setText(str(round(self.oklch_1*100,2))+" %")
+    def Pigment_OKLCH_2_Value_Modify(self):
+        self.oklch_2 = self.layout.oklch_2_value.value() / k_SVL
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Pigment_Release()
+        self.layout.label.setText(str(round(self.oklch_2*100,2))+" %")
+    def Pigment_OKLCH_3_Value_Modify(self):
+        self.oklch_3 = self.layout.oklch_3_value.value() / k_HUE
+        self.Color_HUE("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Color_APPLY("OKLCH", self.oklch_1, self.oklch_2, self.oklch_3, 0)
+        self.Pigment_Release()
+        self.layout.label.setText(str(round(self.oklch_3*360,2))+" º")
+
+    def Pigment_OKHSV_1_Value_Modify(self):
+        self.okhsv_1 = self.layout.okhsv_1_value.value() / k_HUE
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Pigment_Release()
+        self.layout.label.setText(str(round(self.okhsv_1*360,2))+" º")
+    def Pigment_OKHSV_2_Value_Modify(self):
+        self.okhsv_2 = self.layout.okhsv_2_value.value() / k_SVL
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Pigment_Release()
+        self.layout.label.setText(str(round(self.okhsv_2*100,2))+" %")
+    def Pigment_OKHSV_3_Value_Modify(self):
+        self.okhsv_3 = self.layout.okhsv_3_value.value() / k_SVL
+        self.Color_HUE("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Color_APPLY("OKHSV", self.okhsv_1, self.okhsv_2, self.okhsv_3, 0)
+        self.Pigment_Release()
+        self.layout.label.setText(str(round(self.okhsv_3*100,2))+" %")
+
+    def Pigment_OKHSL_1_Value_Modify(self):
+        self.okhsl_1 = self.layout.okhsl_1_value.value() / k_HUE
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Pigment_Release()
+        self.layout.label.setText(str(round(self.okhsl_1*360,2))+" º")
+    def Pigment_OKHSL_2_Value_Modify(self):
+        self.okhsl_2 = self.layout.okhsl_2_value.value() / k_SVL
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Pigment_Release()
+        self.layout.label.setText(str(round(self.okhsl_2*100,2))+" %")
+    def Pigment_OKHSL_3_Value_Modify(self):
+        self.okhsl_3 = self.layout.okhsl_3_value.value() / k_SVL
+        self.Color_HUE("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Color_APPLY("OKHSL", self.okhsl_1, self.okhsl_2, self.okhsl_3, 0)
+        self.Pigment_Release()
+        self.layout.label.setText(str(round(self.okhsl_3*100,2))+" %")
+
     #//
     #\\ Channels Value Release #################################################
     def Pigment_AAA_1_Value_Release(self):
         self.layout.aaa_1_value.clearFocus()
 
-    def Pigment_RGB_1_Value_Release(self):
-        self.layout.rgb_1_value.clearFocus()
-    def Pigment_RGB_2_Value_Release(self):
-        self.layout.rgb_2_value.clearFocus()
-    def Pigment_RGB_3_Value_Release(self):
-        self.layout.rgb_3_value.clearFocus()
+    def Pigment_RGB_1_Value_Release(self):
+        self.layout.rgb_1_value.clearFocus()
+    def Pigment_RGB_2_Value_Release(self):
+        self.layout.rgb_2_value.clearFocus()
+    def Pigment_RGB_3_Value_Release(self):
+        self.layout.rgb_3_value.clearFocus()
+
+    def Pigment_CMY_1_Value_Release(self):
+        self.layout.cmy_1_value.clearFocus()
+    def Pigment_CMY_2_Value_Release(self):
+        self.layout.cmy_2_value.clearFocus()
+    def Pigment_CMY_3_Value_Release(self):
+        self.layout.cmy_3_value.clearFocus()
+
+    def Pigment_CMYK_1_Value_Release(self):
+        self.layout.cmyk_1_value.clearFocus()
+    def Pigment_CMYK_2_Value_Release(self):
+        self.layout.cmyk_2_value.clearFocus()
+    def Pigment_CMYK_3_Value_Release(self):
+        self.layout.cmyk_3_value.clearFocus()
+    def Pigment_CMYK_4_Value_Release(self):
+        self.layout.cmyk_4_value.clearFocus()
+
+    def Pigment_RYB_1_Value_Release(self):
+        self.layout.ryb_1_value.clearFocus()
+    def Pigment_RYB_2_Value_Release(self):
+        self.layout.ryb_2_value.clearFocus()
+    def Pigment_RYB_3_Value_Release(self):
+        self.layout.ryb_3_value.clearFocus()
+
+    def Pigment_YUV_1_Value_Release(self):
+        self.layout.yuv_1_value.clearFocus()
+    def Pigment_YUV_2_Value_Release(self):
+        self.layout.yuv_2_value.clearFocus()
+    def Pigment_YUV_3_Value_Release(self):
+        self.layout.yuv_3_value.clearFocus()
+
+    def Pigment_KKK_1_Value_Release(self):
+        self.layout.kkk_1_value.clearFocus()
+
+
+    def Pigment_ARD_1_Value_Release(self):
+        self.layout.ard_1_value.clearFocus()
+    def Pigment_ARD_2_Value_Release(self):
+        self.layout.ard_2_value.clearFocus()
+    def Pigment_ARD_3_Value_Release(self):
+        self.layout.ard_3_value.clearFocus()
+
+    def Pigment_HSV_1_Value_Release(self):
+        self.layout.hsv_1_value.clearFocus()
+    def Pigment_HSV_2_Value_Release(self):
+        self.layout.hsv_2_value.clearFocus()
+    def Pigment_HSV_3_Value_Release(self):
+        self.layout.hsv_3_value.clearFocus()
+
+    def Pigment_HSL_1_Value_Release(self):
+        self.layout.hsl_1_value.clearFocus()
+    def Pigment_HSL_2_Value_Release(self):
+        self.layout.hsl_2_value.clearFocus()
+    def Pigment_HSL_3_Value_Release(self):
+        self.layout.hsl_3_value.clearFocus()
+
+    def Pigment_HCY_1_Value_Release(self):
+        self.layout.hcy_1_value.clearFocus()
+    def Pigment_HCY_2_Value_Release(self):
+        self.layout.hcy_2_value.clearFocus()
+    def Pigment_HCY_3_Value_Release(self):
+        self.layout.hcy_3_value.clearFocus()
+
+
+    def Pigment_XYZ_1_Value_Release(self):
+        self.layout.xyz_1_value.clearFocus()
+    def Pigment_XYZ_2_Value_Release(self):
+        self.layout.xyz_2_value.clearFocus()
+    def Pigment_XYZ_3_Value_Release(self):
+        self.layout.xyz_3_value.clearFocus()
+
+    def Pigment_XYY_1_Value_Release(self):
+        self.layout.xyy_1_value.clearFocus()
+    def Pigment_XYY_2_Value_Release(self):
+        self.layout.xyy_2_value.clearFocus()
+    def Pigment_XYY_3_Value_Release(self):
+        self.layout.xyy_3_value.clearFocus()
+
+    def Pigment_LAB_1_Value_Release(self):
+        self.layout.lab_1_value.clearFocus()
+    def Pigment_LAB_2_Value_Release(self):
+        self.layout.lab_2_value.clearFocus()
+    def Pigment_LAB_3_Value_Release(self):
+        self.layout.lab_3_value.clearFocus()
+
+    def Pigment_OKLAB_1_Value_Release(self):
+        self.layout.oklab_1_value.clearFocus()
+    def Pigment_OKLAB_2_Value_Release(self):
+        self.layout.oklab_2_value.clearFocus()
+    def Pigment_OKLAB_3_Value_Release(self):
+        self.layout.oklab_3_value.clearFocus()
+
+    def Pigment_OKLCH_1_Value_Release(self):
+        self.layout.oklch_1_value.clearFocus()
+    def Pigment_OKLCH_2_Value_Release(self):
+        self.layout.oklch_2_value.clearFocus()
+    def Pigment_OKLCH_3_Value_Release(self):
+        self.layout.oklch_3_value.clearFocus()
+
+    def Pigment_OKHSV_1_Value_Release(self):
+        self.layout.okhsv_1_value.clearFocus()
+    def Pigment_OKHSV_2_Value_Release(self):
+        self.layout.okhsv_2_value.clearFocus()
+    def Pigment_OKHSV_3_Value_Release(self):
+        self.layout.okhsv_3_value.clearFocus()
+
+    def Pigment_OKHSL_1_Value_Release(self):
+        self.layout.okhsl_1_value.clearFocus()
+    def Pigment_OKHSL_2_Value_Release(self):
+        self.layout.okhsl_2_value.clearFocus()
+    def Pigment_OKHSL_3_Value_Release(self):
+        self.layout.okhsl_3_value.clearFocus()
+
+    #//
+    #\\ Palette ################################################################
+    def Cor_00_APPLY(self, SIGNAL_CLICKS):
+        if self.cor_00[0] == True:
+            self.Color_HUE("RGB", self.cor_00[1], self.cor_00[2], self.cor_00[3], 0)
+            self.Color_APPLY("RGB", self.cor_00[1], self.cor_00[2], self.cor_00[3], 0)
+            self.Pigment_Release()
+    def Cor_00_SAVE(self, SIGNAL_CLICKS):
+        self.cor_00 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_00[1]*255, self.cor_00[2]*255, self.cor_00[3]*255))
+        self.layout.cor_00.setStyleSheet(color)
+    def Cor_00_CLEAN(self, SIGNAL_CLICKS):
+        self.cor_00 = [False, 0, 0, 0]
+        self.layout.cor_00.setStyleSheet(self.bg_alpha)
+
+    def Cor_01_APPLY(self, SIGNAL_CLICKS):
+        if self.cor_01[0] == True:
+            self.Color_HUE("RGB", self.cor_01[1], self.cor_01[2], self.cor_01[3], 0)
+            self.Color_APPLY("RGB", self.cor_01[1], self.cor_01[2], self.cor_01[3], 0)
+            self.Pigment_Release()
+    def Cor_01_SAVE(self, SIGNAL_CLICKS):
+        self.cor_01 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_01[1]*255, self.cor_01[2]*255, self.cor_01[3]*255))
+        self.layout.cor_01.setStyleSheet(color)
+    def Cor_01_CLEAN(self, SIGNAL_CLICKS):
+        self.cor_01 = [False, 0, 0, 0]
+        self.layout.cor_01.setStyleSheet(self.bg_alpha)
+
+    def Cor_02_APPLY(self, SIGNAL_CLICKS):
+        if self.cor_02[0] == True:
+            self.Color_HUE("RGB", self.cor_02[1], self.cor_02[2], self.cor_02[3], 0)
+            self.Color_APPLY("RGB", self.cor_02[1], self.cor_02[2], self.cor_02[3], 0)
+            self.Pigment_Release()
+    def Cor_02_SAVE(self, SIGNAL_CLICKS):
+        self.cor_02 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_02[1]*255, self.cor_02[2]*255, self.cor_02[3]*255))
+        self.layout.cor_02.setStyleSheet(color)
+    def Cor_02_CLEAN(self, SIGNAL_CLICKS):
+        self.cor_02 = [False, 0, 0, 0]
+        self.layout.cor_02.setStyleSheet(self.bg_alpha)
+
+    def Cor_03_APPLY(self, SIGNAL_CLICKS):
+        if self.cor_03[0] == True:
+            self.Color_HUE("RGB", self.cor_03[1], self.cor_03[2], self.cor_03[3], 0)
+            self.Color_APPLY("RGB", self.cor_03[1], self.cor_03[2], self.cor_03[3], 0)
+            self.Pigment_Release()
+    def Cor_03_SAVE(self, SIGNAL_CLICKS):
+        self.cor_03 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_03[1]*255, self.cor_03[2]*255, self.cor_03[3]*255))
+        self.layout.cor_03.setStyleSheet(color)
+    def Cor_03_CLEAN(self, SIGNAL_CLICKS):
+        self.cor_03 = [False, 0, 0, 0]
+        self.layout.cor_03.setStyleSheet(self.bg_alpha)
+
+    def Cor_04_APPLY(self, SIGNAL_CLICKS):
+        if self.cor_04[0] == True:
+            self.Color_HUE("RGB", self.cor_04[1], self.cor_04[2], self.cor_04[3], 0)
+            self.Color_APPLY("RGB", self.cor_04[1], self.cor_04[2], self.cor_04[3], 0)
+            self.Pigment_Release()
+    def Cor_04_SAVE(self, SIGNAL_CLICKS):
+        self.cor_04 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_04[1]*255, self.cor_04[2]*255, self.cor_04[3]*255))
+        self.layout.cor_04.setStyleSheet(color)
+    def Cor_04_CLEAN(self, SIGNAL_CLICKS):
+        self.cor_04 = [False, 0, 0, 0]
+        self.layout.cor_04.setStyleSheet(self.bg_alpha)
+
+    def Cor_05_APPLY(self, SIGNAL_CLICKS):
+        if self.cor_05[0] == True:
+            self.Color_HUE("RGB", self.cor_05[1], self.cor_05[2], self.cor_05[3], 0)
+            self.Color_APPLY("RGB", self.cor_05[1], self.cor_05[2], self.cor_05[3], 0)
+            self.Pigment_Release()
+    def Cor_05_SAVE(self, SIGNAL_CLICKS):
+        self.cor_05 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_05[1]*255, self.cor_05[2]*255, self.cor_05[3]*255))
+        self.layout.cor_05.setStyleSheet(color)
+    def Cor_05_CLEAN(self, SIGNAL_CLICKS):
+        self.cor_05 = [False, 0, 0, 0]
+        self.layout.cor_05.setStyleSheet(self.bg_alpha)
+
+    def Cor_06_APPLY(self, SIGNAL_CLICKS):
+        if self.cor_06[0] == True:
+            self.Color_HUE("RGB", self.cor_06[1], self.cor_06[2], self.cor_06[3], 0)
+            self.Color_APPLY("RGB", self.cor_06[1], self.cor_06[2], self.cor_06[3], 0)
+            self.Pigment_Release()
+    def Cor_06_SAVE(self, SIGNAL_CLICKS):
+        self.cor_06 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_06[1]*255, self.cor_06[2]*255, self.cor_06[3]*255))
+        self.layout.cor_06.setStyleSheet(color)
+    def Cor_06_CLEAN(self, SIGNAL_CLICKS):
+        self.cor_06 = [False, 0, 0, 0]
+        self.layout.cor_06.setStyleSheet(self.bg_alpha)
 
-    def Pigment_CMY_1_Value_Release(self):
-        self.layout.cmy_1_value.clearFocus()
-    def Pigment_CMY_2_Value_Release(self):
-        self.layout.cmy_2_value.clearFocus()
-    def Pigment_CMY_3_Value_Release(self):
-        self.layout.cmy_3_value.clearFocus()
+    def Cor_07_APPLY(self, SIGNAL_CLICKS):
+        if self.cor_07[0] == True:
+            self.Color_HUE("RGB", self.cor_07[1], self.cor_07[2], self.cor_07[3], 0)
+            self.Color_APPLY("RGB", self.cor_07[1], self.cor_07[2], self.cor_07[3], 0)
+            self.Pigment_Release()
+    def Cor_07_SAVE(self, SIGNAL_CLICKS):
+        self.cor_07 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_07[1]*255, self.cor_07[2]*255, self.cor_07[3]*255))
+        self.layout.cor_07.setStyleSheet(color)
+    def Cor_07_CLEAN(self, SIGNAL_CLICKS):
+        self.cor_07 = [False, 0, 0, 0]
+        self.layout.cor_07.setStyleSheet(self.bg_alpha)
 
-    def Pigment_CMYK_1_Value_Release(self):
-        self.layout.cmyk_1_value.clearFocus()
-    def Pigment_CMYK_2_Value_Release(self):
-        self.layout.cmyk_2_value.clearFocus()
-    def Pigment_CMYK_3_Value_Release(self):
-        self.layout.cmyk_3_value.clearFocus()
-    def Pigment_CMYK_4_Value_Release(self):
-        self.layout.cmyk_4_value.clearFocus()
+    def Cor_08_APPLY(self, SIGNAL_CLICKS):
+        if self.cor_08[0] == True:
+            self.Color_HUE("RGB", self.cor_08[1], self.cor_08[2], self.cor_08[3], 0)
+            self.Color_APPLY("RGB", self.cor_08[1], self.cor_08[2], self.cor_08[3], 0)
+            self.Pigment_Release()
+    def Cor_08_SAVE(self, SIGNAL_CLICKS):
+        self.cor_08 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_08[1]*255, self.cor_08[2]*255, self.cor_08[3]*255))
+        self.layout.cor_08.setStyleSheet(color)
+    def Cor_08_CLEAN(self, SIGNAL_CLICKS):
+        self.cor_08 = [False, 0, 0, 0]
+        self.layout.cor_08.setStyleSheet(self.bg_alpha)
 
-    def Pigment_RYB_1_Value_Release(self):
-        self.layout.ryb_1_value.clearFocus()
-    def Pigment_RYB_2_Value_Release(self):
-        self.layout.ryb_2_value.clearFocus()
-    def Pigment_RYB_3_Value_Release(self):
-        self.layout.ryb_3_value.clearFocus()
+    def Cor_09_APPLY(self, SIGNAL_CLICKS):
+        if self.cor_09[0] == True:
+            self.Color_HUE("RGB", self.cor_09[1], self.cor_09[2], self.cor_09[3], 0)
+            self.Color_APPLY("RGB", self.cor_09[1], self.cor_09[2], self.cor_09[3], 0)
+            self.Pigment_Release()
+    def Cor_09_SAVE(self, SIGNAL_CLICKS):
+        self.cor_09 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_09[1]*255, self.cor_09[2]*255, self.cor_09[3]*255))
+        self.layout.cor_09.setStyleSheet(color)
+    def Cor_09_CLEAN(self, SIGNAL_CLICKS):
+        self.cor_09 = [False, 0, 0, 0]
+        self.layout.cor_09.setStyleSheet(self.bg_alpha)
 
-    def Pigment_YUV_1_Value_Release(self):
-        self.layout.yuv_1_value.clearFocus()
-    def Pigment_YUV_2_Value_Release(self):
-        self.layout.yuv_2_value.clearFocus()
-    def Pigment_YUV_3_Value_Release(self):
-        self.layout.yuv_3_value.clearFocus()
+    def Cor_10_APPLY(self, SIGNAL_CLICKS):
+        if self.cor_10[0] == True:
+            self.Color_HUE("RGB", self.cor_10[1], self.cor_10[2], self.cor_10[3], 0)
+            self.Color_APPLY("RGB", self.cor_10[1], self.cor_10[2], self.cor_10[3], 0)
+            self.Pigment_Release()
+    def Cor_10_SAVE(self, SIGNAL_CLICKS):
+        self.cor_10 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_10[1]*255, self.cor_10[2]*255, self.cor_10[3]*255))
+        self.layout.cor_10.setStyleSheet(color)
+    def Cor_10_CLEAN(self, SIGNAL_CLICKS):
+        self.cor_10 = [False, 0, 0, 0]
+        self.layout.cor_10.setStyleSheet(self.bg_alpha)
 
-    def Pigment_KKK_1_Value_Release(self):
-        self.layout.kkk_1_value.clearFocus()
+    #//
+    #\\ Mixer Boxes ############################################################
+    # TTS
+    def Mixer_TTS_APPLY(self, SIGNAL_APPLY):
+        if self.color_tts[0] == True:
+            self.Color_APPLY("RGB", self.color_tts[1], self.color_tts[2], self.color_tts[3], 0)
+            self.Pigment_Release()
+    def Mixer_TTS_SAVE(self, SIGNAL_SAVE):
+        # Color Math
+        self.color_tts = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        gray = self.rgb_to_aaa(self.rgb_1, self.rgb_2, self.rgb_3)
+        self.gray_tts = [gray[0], gray[0], gray[0]]
+        # Display
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ; " % (self.color_tts[1]*255, self.color_tts[2]*255, self.color_tts[3]*255))
+        bg_gray_tts = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ; " % (self.gray_tts[0]*255, self.gray_tts[1]*255, self.gray_tts[2]*255))
+        self.layout.tts_l1.setStyleSheet(color)
+        self.layout.white.setStyleSheet(self.bg_white)
+        self.layout.grey.setStyleSheet(bg_gray_tts)
+        self.layout.black.setStyleSheet(self.bg_black)
+        self.Mixer_Display()
+    def Mixer_TTS_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_tts = [False, 0, 0, 0]
+        self.gray_tts = self.color_grey
+        # Display
+        self.layout.tts_l1.setStyleSheet(self.bg_alpha)
+        self.layout.white.setStyleSheet(self.bg_alpha)
+        self.layout.grey.setStyleSheet(self.bg_alpha)
+        self.layout.black.setStyleSheet(self.bg_alpha)
+        self.layout.tint.setStyleSheet(self.bg_alpha)
+        self.layout.tone.setStyleSheet(self.bg_alpha)
+        self.layout.shade.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_tint = 0
+        self.spacer_tone = 0
+        self.spacer_shade = 0
+        self.Mixer_Clear("tint", False)
+        self.Mixer_Clear("tone", False)
+        self.Mixer_Clear("shade", False)
 
+    # RGB
+    def Mixer_RGB_L1_APPLY(self, SIGNAL_APPLY):
+        if self.color_rgb_l1[0] == True:
+            self.Color_APPLY("RGB", self.color_rgb_l1[1], self.color_rgb_l1[2], self.color_rgb_l1[3], 0)
+            self.Pigment_Release()
+    def Mixer_RGB_L1_SAVE(self, SIGNAL_SAVE):
+        # Color Math
+        self.color_rgb_l1 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        # Display
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.color_rgb_l1[1]*255, self.color_rgb_l1[2]*255, self.color_rgb_l1[3]*255))
+        self.layout.rgb_l1.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_RGB_L1_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_rgb_l1 = [False, 0, 0, 0]
+        # Display
+        self.layout.rgb_l1.setStyleSheet(self.bg_alpha)
+        self.layout.rgb_g1.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_rgb_g1 = 0
+        self.mixer_rgb_g1.Update(self.spacer_rgb_g1, self.mixer_width)
 
-    def Pigment_ARD_1_Value_Release(self):
-        self.layout.ard_1_value.clearFocus()
-    def Pigment_ARD_2_Value_Release(self):
-        self.layout.ard_2_value.clearFocus()
-    def Pigment_ARD_3_Value_Release(self):
-        self.layout.ard_3_value.clearFocus()
+    def Mixer_RGB_R1_APPLY(self, SIGNAL_APPLY):
+        if self.color_rgb_r1[0] == True:
+            self.Color_APPLY("RGB", self.color_rgb_r1[1], self.color_rgb_r1[2], self.color_rgb_r1[3], 0)
+            self.Pigment_Release()
+    def Mixer_RGB_R1_SAVE(self, SIGNAL_SAVE):
+        # Color Math
+        self.color_rgb_r1 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        # Display
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.color_rgb_r1[1]*255, self.color_rgb_r1[2]*255, self.color_rgb_r1[3]*255))
+        self.layout.rgb_r1.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_RGB_R1_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_rgb_r1 = [False, 0, 0, 0]
+        # Display
+        self.layout.rgb_r1.setStyleSheet(self.bg_alpha)
+        self.layout.rgb_g1.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_rgb_g1 = 0
+        self.mixer_rgb_g1.Update(self.spacer_rgb_g1, self.mixer_width)
 
-    def Pigment_HSV_1_Value_Release(self):
-        self.layout.hsv_1_value.clearFocus()
-    def Pigment_HSV_2_Value_Release(self):
-        self.layout.hsv_2_value.clearFocus()
-    def Pigment_HSV_3_Value_Release(self):
-        self.layout.hsv_3_value.clearFocus()
+    def Mixer_RGB_L2_APPLY(self, SIGNAL_APPLY):
+        if self.color_rgb_l2[0] == True:
+            self.Color_APPLY("RGB", self.color_rgb_l2[1], self.color_rgb_l2[2], self.color_rgb_l2[3], 0)
+            self.Pigment_Release()
+    def Mixer_RGB_L2_SAVE(self, SIGNAL_SAVE):
+        # Color Math
+        self.color_rgb_l2 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        # Display
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.color_rgb_l2[1]*255, self.color_rgb_l2[2]*255, self.color_rgb_l2[3]*255))
+        self.layout.rgb_l2.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_RGB_L2_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_rgb_l2 = [False, 0, 0, 0]
+        # Display
+        self.layout.rgb_l2.setStyleSheet(self.bg_alpha)
+        self.layout.rgb_g2.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_rgb_g2 = 0
+        self.mixer_rgb_g2.Update(self.spacer_rgb_g2, self.mixer_width)
 
-    def Pigment_HSL_1_Value_Release(self):
-        self.layout.hsl_1_value.clearFocus()
-    def Pigment_HSL_2_Value_Release(self):
-        self.layout.hsl_2_value.clearFocus()
-    def Pigment_HSL_3_Value_Release(self):
-        self.layout.hsl_3_value.clearFocus()
+    def Mixer_RGB_R2_APPLY(self, SIGNAL_APPLY):
+        if self.color_rgb_r2[0] == True:
+            self.Color_APPLY("RGB", self.color_rgb_r2[1], self.color_rgb_r2[2], self.color_rgb_r2[3], 0)
+            self.Pigment_Release()
+    def Mixer_RGB_R2_SAVE(self, SIGNAL_SAVE):
+        # Color Math
+        self.color_rgb_r2 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        # Display
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.color_rgb_r2[1]*255, self.color_rgb_r2[2]*255, self.color_rgb_r2[3]*255))
+        self.layout.rgb_r2.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_RGB_R2_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_rgb_r2 = [False, 0, 0, 0]
+        # Display
+        self.layout.rgb_r2.setStyleSheet(self.bg_alpha)
+        self.layout.rgb_g2.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_rgb_g2 = 0
+        self.mixer_rgb_g2.Update(self.spacer_rgb_g2, self.mixer_width)
 
-    def Pigment_HCY_1_Value_Release(self):
-        self.layout.hcy_1_value.clearFocus()
-    def Pigment_HCY_2_Value_Release(self):
-        self.layout.hcy_2_value.clearFocus()
-    def Pigment_HCY_3_Value_Release(self):
-        self.layout.hcy_3_value.clearFocus()
+    def Mixer_RGB_L3_APPLY(self, SIGNAL_APPLY):
+        if self.color_rgb_l3[0] == True:
+            self.Color_APPLY("RGB", self.color_rgb_l3[1], self.color_rgb_l3[2], self.color_rgb_l3[3], 0)
+            self.Pigment_Release()
+    def Mixer_RGB_L3_SAVE(self, SIGNAL_SAVE):
+        # Color Math
+        self.color_rgb_l3 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        # Display
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.color_rgb_l3[1]*255, self.color_rgb_l3[2]*255, self.color_rgb_l3[3]*255))
+        self.layout.rgb_l3.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_RGB_L3_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_rgb_l3 = [False, 0, 0, 0]
+        # Display
+        self.layout.rgb_l3.setStyleSheet(self.bg_alpha)
+        self.layout.rgb_g3.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_rgb_g3 = 0
+        self.mixer_rgb_g3.Update(self.spacer_rgb_g3, self.mixer_width)
 
+    def Mixer_RGB_R3_APPLY(self, SIGNAL_APPLY):
+        if self.color_rgb_r3[0] == True:
+            self.Color_APPLY("RGB", self.color_rgb_r3[1], self.color_rgb_r3[2], self.color_rgb_r3[3], 0)
+            self.Pigment_Release()
+    def Mixer_RGB_R3_SAVE(self, SIGNAL_SAVE):
+        # Color Math
+        self.color_rgb_r3 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        # Display
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.color_rgb_r3[1]*255, self.color_rgb_r3[2]*255, self.color_rgb_r3[3]*255))
+        self.layout.rgb_r3.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_RGB_R3_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_rgb_r3 = [False, 0, 0, 0]
+        # Display
+        self.layout.rgb_r3.setStyleSheet(self.bg_alpha)
+        self.layout.rgb_g3.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_rgb_g3 = 0
+        self.mixer_rgb_g3.Update(self.spacer_rgb_g3, self.mixer_width)
 
-    def Pigment_XYZ_1_Value_Release(self):
-        self.layout.xyz_1_value.clearFocus()
-    def Pigment_XYZ_2_Value_Release(self):
-        self.layout.xyz_2_value.clearFocus()
-    def Pigment_XYZ_3_Value_Release(self):
-        self.layout.xyz_3_value.clearFocus()
+    # ARD
+    def Mixer_ARD_L1_APPLY(self, SIGNAL_APPLY):
+        if self.color_ard_l1[0] == True:
+            self.Color_APPLY("ARD", self.color_ard_l1[1], self.color_ard_l1[2], self.color_ard_l1[3], 0)
+            self.Pigment_Release()
+    def Mixer_ARD_L1_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_ard_l1 = [True, self.ard_1, self.ard_2, self.ard_3]
+        # Display
+        rgb = self.ard_to_rgb(self.color_ard_l1[1], self.color_ard_l1[2], self.color_ard_l1[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.ard_l1.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_ARD_L1_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_ard_l1 = [False, 0, 0, 0, 0, 0, 0]
+        # Display
+        self.layout.ard_l1.setStyleSheet(self.bg_alpha)
+        self.layout.ard_g1.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_ard_g1 = 0
+        self.mixer_ard_g1.Update(self.spacer_ard_g1, self.mixer_width)
 
-    def Pigment_XYY_1_Value_Release(self):
-        self.layout.xyy_1_value.clearFocus()
-    def Pigment_XYY_2_Value_Release(self):
-        self.layout.xyy_2_value.clearFocus()
-    def Pigment_XYY_3_Value_Release(self):
-        self.layout.xyy_3_value.clearFocus()
+    def Mixer_ARD_R1_APPLY(self, SIGNAL_APPLY):
+        if self.color_ard_r1[0] == True:
+            self.Color_APPLY("ARD", self.color_ard_r1[1], self.color_ard_r1[2], self.color_ard_r1[3], 0)
+            self.Pigment_Release()
+    def Mixer_ARD_R1_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_ard_r1 = [True, self.ard_1, self.ard_2, self.ard_3]
+        # Display
+        rgb = self.ard_to_rgb(self.color_ard_r1[1], self.color_ard_r1[2], self.color_ard_r1[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.ard_r1.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_ARD_R1_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_ard_r1 = [False, 0, 0, 0, 0, 0, 0]
+        # Display
+        self.layout.ard_r1.setStyleSheet(self.bg_alpha)
+        self.layout.ard_g1.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_ard_g1 = 0
+        self.mixer_ard_g1.Update(self.spacer_ard_g1, self.mixer_width)
 
-    def Pigment_LAB_1_Value_Release(self):
-        self.layout.lab_1_value.clearFocus()
-    def Pigment_LAB_2_Value_Release(self):
-        self.layout.lab_2_value.clearFocus()
-    def Pigment_LAB_3_Value_Release(self):
-        self.layout.lab_3_value.clearFocus()
+    def Mixer_ARD_L2_APPLY(self, SIGNAL_APPLY):
+        if self.color_ard_l2[0] == True:
+            self.Color_APPLY("ARD", self.color_ard_l2[1], self.color_ard_l2[2], self.color_ard_l2[3], 0)
+            self.Pigment_Release()
+    def Mixer_ARD_L2_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_ard_l2 = [True, self.ard_1, self.ard_2, self.ard_3]
+        # Display
+        rgb = self.ard_to_rgb(self.color_ard_l2[1], self.color_ard_l2[2], self.color_ard_l2[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.ard_l2.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_ARD_L2_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_ard_l2 = [False, 0, 0, 0, 0, 0, 0]
+        # Display
+        self.layout.ard_l2.setStyleSheet(self.bg_alpha)
+        self.layout.ard_g2.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_ard_g2 = 0
+        self.mixer_ard_g2.Update(self.spacer_ard_g2, self.mixer_width)
 
-    #//
-    #\\ Palette ################################################################
-    def Cor_00_APPLY(self, SIGNAL_CLICKS):
-        if self.cor_00[0] == True:
-            self.Color_HUE("RGB", self.cor_00[1], self.cor_00[2], self.cor_00[3], 0)
-            self.Color_APPLY("RGB", self.cor_00[1], self.cor_00[2], self.cor_00[3], 0)
+    def Mixer_ARD_R2_APPLY(self, SIGNAL_APPLY):
+        if self.color_ard_r2[0] == True:
+            self.Color_APPLY("ARD", self.color_ard_r2[1], self.color_ard_r2[2], self.color_ard_r2[3], 0)
             self.Pigment_Release()
-    def Cor_00_SAVE(self, SIGNAL_CLICKS):
-        self.cor_00 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_00[1]*255, self.cor_00[2]*255, self.cor_00[3]*255))
-        self.layout.cor_00.setStyleSheet(color)
-    def Cor_00_CLEAN(self, SIGNAL_CLICKS):
-        self.cor_00 = [False, 0, 0, 0]
-        self.layout.cor_00.setStyleSheet(self.bg_alpha)
+    def Mixer_ARD_R2_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_ard_r2 = [True, self.ard_1, self.ard_2, self.ard_3]
+        # Display
+        rgb = self.ard_to_rgb(self.color_ard_r2[1], self.color_ard_r2[2], self.color_ard_r2[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.ard_r2.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_ARD_R2_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_ard_r2 = [False, 0, 0, 0, 0, 0, 0]
+        # Display
+        self.layout.ard_r2.setStyleSheet(self.bg_alpha)
+        self.layout.ard_g2.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_ard_g2 = 0
+        self.mixer_ard_g2.Update(self.spacer_ard_g2, self.mixer_width)
 
-    def Cor_01_APPLY(self, SIGNAL_CLICKS):
-        if self.cor_01[0] == True:
-            self.Color_HUE("RGB", self.cor_01[1], self.cor_01[2], self.cor_01[3], 0)
-            self.Color_APPLY("RGB", self.cor_01[1], self.cor_01[2], self.cor_01[3], 0)
+    def Mixer_ARD_L3_APPLY(self, SIGNAL_APPLY):
+        if self.color_ard_l3[0] == True:
+            self.Color_APPLY("ARD", self.color_ard_l3[1], self.color_ard_l3[2], self.color_ard_l3[3], 0)
             self.Pigment_Release()
-    def Cor_01_SAVE(self, SIGNAL_CLICKS):
-        self.cor_01 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_01[1]*255, self.cor_01[2]*255, self.cor_01[3]*255))
-        self.layout.cor_01.setStyleSheet(color)
-    def Cor_01_CLEAN(self, SIGNAL_CLICKS):
-        self.cor_01 = [False, 0, 0, 0]
-        self.layout.cor_01.setStyleSheet(self.bg_alpha)
+    def Mixer_ARD_L3_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_ard_l3 = [True, self.ard_1, self.ard_2, self.ard_3]
+        # Display
+        rgb = self.ard_to_rgb(self.color_ard_l3[1], self.color_ard_l3[2], self.color_ard_l3[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.ard_l3.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_ARD_L3_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_ard_l3 = [False, 0, 0, 0, 0, 0, 0]
+        # Display
+        self.layout.ard_l3.setStyleSheet(self.bg_alpha)
+        self.layout.ard_g3.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_ard_g3 = 0
+        self.mixer_ard_g3.Update(self.spacer_ard_g3, self.mixer_width)
 
-    def Cor_02_APPLY(self, SIGNAL_CLICKS):
-        if self.cor_02[0] == True:
-            self.Color_HUE("RGB", self.cor_02[1], self.cor_02[2], self.cor_02[3], 0)
-            self.Color_APPLY("RGB", self.cor_02[1], self.cor_02[2], self.cor_02[3], 0)
+    def Mixer_ARD_R3_APPLY(self, SIGNAL_APPLY):
+        if self.color_ard_r3[0] == True:
+            self.Color_APPLY("ARD", self.color_ard_r3[1], self.color_ard_r3[2], self.color_ard_r3[3], 0)
             self.Pigment_Release()
-    def Cor_02_SAVE(self, SIGNAL_CLICKS):
-        self.cor_02 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+    def Mixer_ARD_R3_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_ard_r3 = [True, self.ard_1, self.ard_2, self.ard_3]
+        # Display
+        rgb = self.ard_to_rgb(self.color_ard_r3[1], self.color_ard_r3[2], self.color_ard_r3[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.ard_r3.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_ARD_R3_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_ard_r3 = [False, 0, 0, 0, 0, 0, 0]
+        # Display
+        self.layout.ard_r3.setStyleSheet(self.bg_alpha)
+        self.layout.ard_g3.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_ard_g3 = 0
+        self.mixer_ard_g3.Update(self.spacer_ard_g3, self.mixer_width)
 
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_02[1]*255, self.cor_02[2]*255, self.cor_02[3]*255))
-        self.layout.cor_02.setStyleSheet(color)
-    def Cor_02_CLEAN(self, SIGNAL_CLICKS):
-        self.cor_02 = [False, 0, 0, 0]
-        self.layout.cor_02.setStyleSheet(self.bg_alpha)
+    # HSV
+    def Mixer_HSV_L1_APPLY(self, SIGNAL_APPLY):
+        if self.color_hsv_l1[0] == True:
+            self.Color_APPLY("HSV", self.color_hsv_l1[1], self.color_hsv_l1[2], self.color_hsv_l1[3], 0)
+            self.Pigment_Release()
+    def Mixer_HSV_L1_SAVE(self, SIGNAL_SAVE):
+        # color = [Bool, R, G, B, H, S, V]
+        self.color_hsv_l1 = [True, self.hsv_1, self.hsv_2, self.hsv_3]
+        # Display
+        rgb = self.hsv_to_rgb(self.color_hsv_l1[1], self.color_hsv_l1[2], self.color_hsv_l1[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hsv_l1.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_HSV_L1_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_hsv_l1 = [False, 0, 0, 0]
+        # Display
+        self.layout.hsv_l1.setStyleSheet(self.bg_alpha)
+        self.layout.hsv_g1.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_hsv_g1 = 0
+        self.mixer_hsv_g1.Update(self.spacer_hsv_g1, self.mixer_width)
 
-    def Cor_03_APPLY(self, SIGNAL_CLICKS):
-        if self.cor_03[0] == True:
-            self.Color_HUE("RGB", self.cor_03[1], self.cor_03[2], self.cor_03[3], 0)
-            self.Color_APPLY("RGB", self.cor_03[1], self.cor_03[2], self.cor_03[3], 0)
+    def Mixer_HSV_R1_APPLY(self, SIGNAL_APPLY):
+        if self.color_hsv_r1[0] == True:
+            self.Color_APPLY("HSV", self.color_hsv_r1[1], self.color_hsv_r1[2], self.color_hsv_r1[3], 0)
+            self.Pigment_Release()
+    def Mixer_HSV_R1_SAVE(self, SIGNAL_SAVE):
+        # color = [Bool, R, G, B, H, S, V]
+        self.color_hsv_r1 = [True, self.hsv_1, self.hsv_2, self.hsv_3]
+        # Display
+        rgb = self.hsv_to_rgb(self.color_hsv_r1[1], self.color_hsv_r1[2], self.color_hsv_r1[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hsv_r1.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_HSV_R1_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_hsv_r1 = [False, 0, 0, 0]
+        # Display
+        self.layout.hsv_r1.setStyleSheet(self.bg_alpha)
+        self.layout.hsv_g1.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_hsv_g1 = 0
+        self.mixer_hsv_g1.Update(self.spacer_hsv_g1, self.mixer_width)
+
+    def Mixer_HSV_L2_APPLY(self, SIGNAL_APPLY):
+        if self.color_hsv_l2[0] == True:
+            self.Color_APPLY("HSV", self.color_hsv_l2[1], self.color_hsv_l2[2], self.color_hsv_l2[3], 0)
             self.Pigment_Release()
-    def Cor_03_SAVE(self, SIGNAL_CLICKS):
-        self.cor_03 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_03[1]*255, self.cor_03[2]*255, self.cor_03[3]*255))
-        self.layout.cor_03.setStyleSheet(color)
-    def Cor_03_CLEAN(self, SIGNAL_CLICKS):
-        self.cor_03 = [False, 0, 0, 0]
-        self.layout.cor_03.setStyleSheet(self.bg_alpha)
+    def Mixer_HSV_L2_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hsv_l2 = [True, self.hsv_1, self.hsv_2, self.hsv_3]
+        # Display
+        rgb = self.hsv_to_rgb(self.color_hsv_l2[1], self.color_hsv_l2[2], self.color_hsv_l2[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hsv_l2.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_HSV_L2_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_hsv_l2 = [False, 0, 0, 0]
+        # Display
+        self.layout.hsv_l2.setStyleSheet(self.bg_alpha)
+        self.layout.hsv_g2.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_hsv_g2 = 0
+        self.mixer_hsv_g2.Update(self.spacer_hsv_g2, self.mixer_width)
 
-    def Cor_04_APPLY(self, SIGNAL_CLICKS):
-        if self.cor_04[0] == True:
-            self.Color_HUE("RGB", self.cor_04[1], self.cor_04[2], self.cor_04[3], 0)
-            self.Color_APPLY("RGB", self.cor_04[1], self.cor_04[2], self.cor_04[3], 0)
+    def Mixer_HSV_R2_APPLY(self, SIGNAL_APPLY):
+        if self.color_hsv_r2[0] == True:
+            self.Color_APPLY("HSV", self.color_hsv_r2[1], self.color_hsv_r2[2], self.color_hsv_r2[3], 0)
             self.Pigment_Release()
-    def Cor_04_SAVE(self, SIGNAL_CLICKS):
-        self.cor_04 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_04[1]*255, self.cor_04[2]*255, self.cor_04[3]*255))
-        self.layout.cor_04.setStyleSheet(color)
-    def Cor_04_CLEAN(self, SIGNAL_CLICKS):
-        self.cor_04 = [False, 0, 0, 0]
-        self.layout.cor_04.setStyleSheet(self.bg_alpha)
+    def Mixer_HSV_R2_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hsv_r2 = [True, self.hsv_1, self.hsv_2, self.hsv_3]
+        # Display
+        rgb = self.hsv_to_rgb(self.color_hsv_r2[1], self.color_hsv_r2[2], self.color_hsv_r2[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hsv_r2.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_HSV_R2_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_hsv_r2 = [False, 0, 0, 0]
+        # Display
+        self.layout.hsv_r2.setStyleSheet(self.bg_alpha)
+        self.layout.hsv_g2.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_hsv_g2 = 0
+        self.mixer_hsv_g2.Update(self.spacer_hsv_g2, self.mixer_width)
 
-    def Cor_05_APPLY(self, SIGNAL_CLICKS):
-        if self.cor_05[0] == True:
-            self.Color_HUE("RGB", self.cor_05[1], self.cor_05[2], self.cor_05[3], 0)
-            self.Color_APPLY("RGB", self.cor_05[1], self.cor_05[2], self.cor_05[3], 0)
+    def Mixer_HSV_L3_APPLY(self, SIGNAL_APPLY):
+        if self.color_hsv_l3[0] == True:
+            self.Color_APPLY("HSV", self.color_hsv_l3[1], self.color_hsv_l3[2], self.color_hsv_l3[3], 0)
             self.Pigment_Release()
-    def Cor_05_SAVE(self, SIGNAL_CLICKS):
-        self.cor_05 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_05[1]*255, self.cor_05[2]*255, self.cor_05[3]*255))
-        self.layout.cor_05.setStyleSheet(color)
-    def Cor_05_CLEAN(self, SIGNAL_CLICKS):
-        self.cor_05 = [False, 0, 0, 0]
-        self.layout.cor_05.setStyleSheet(self.bg_alpha)
+    def Mixer_HSV_L3_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hsv_l3 = [True, self.hsv_1, self.hsv_2, self.hsv_3]
+        # Display
+        rgb = self.hsv_to_rgb(self.color_hsv_l3[1], self.color_hsv_l3[2], self.color_hsv_l3[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hsv_l3.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_HSV_L3_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_hsv_l3 = [False, 0, 0, 0]
+        # Display
+        self.layout.hsv_l3.setStyleSheet(self.bg_alpha)
+        self.layout.hsv_g3.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_hsv_g3 = 0
+        self.mixer_hsv_g3.Update(self.spacer_hsv_g3, self.mixer_width)
 
-    def Cor_06_APPLY(self, SIGNAL_CLICKS):
-        if self.cor_06[0] == True:
-            self.Color_HUE("RGB", self.cor_06[1], self.cor_06[2], self.cor_06[3], 0)
-            self.Color_APPLY("RGB", self.cor_06[1], self.cor_06[2], self.cor_06[3], 0)
+    def Mixer_HSV_R3_APPLY(self, SIGNAL_APPLY):
+        if self.color_hsv_r3[0] == True:
+            self.Color_APPLY("HSV", self.color_hsv_r3[1], self.color_hsv_r3[2], self.color_hsv_r3[3], 0)
             self.Pigment_Release()
-    def Cor_06_SAVE(self, SIGNAL_CLICKS):
-        self.cor_06 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_06[1]*255, self.cor_06[2]*255, self.cor_06[3]*255))
-        self.layout.cor_06.setStyleSheet(color)
-    def Cor_06_CLEAN(self, SIGNAL_CLICKS):
-        self.cor_06 = [False, 0, 0, 0]
-        self.layout.cor_06.setStyleSheet(self.bg_alpha)
+    def Mixer_HSV_R3_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hsv_r3 = [True, self.hsv_1, self.hsv_2, self.hsv_3]
+        # Display
+        rgb = self.hsv_to_rgb(self.color_hsv_r3[1], self.color_hsv_r3[2], self.color_hsv_r3[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hsv_r3.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_HSV_R3_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_hsv_r3 = [False, 0, 0, 0]
+        # Display
+        self.layout.hsv_r3.setStyleSheet(self.bg_alpha)
+        self.layout.hsv_g3.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_hsv_g3 = 0
+        self.mixer_hsv_g3.Update(self.spacer_hsv_g3, self.mixer_width)
 
-    def Cor_07_APPLY(self, SIGNAL_CLICKS):
-        if self.cor_07[0] == True:
-            self.Color_HUE("RGB", self.cor_07[1], self.cor_07[2], self.cor_07[3], 0)
-            self.Color_APPLY("RGB", self.cor_07[1], self.cor_07[2], self.cor_07[3], 0)
+    # HSL
+    def Mixer_HSL_L1_APPLY(self, SIGNAL_APPLY):
+        if self.color_hsl_l1[0] == True:
+            self.Color_APPLY("HSL", self.color_hsl_l1[1], self.color_hsl_l1[2], self.color_hsl_l1[3], 0)
             self.Pigment_Release()
-    def Cor_07_SAVE(self, SIGNAL_CLICKS):
-        self.cor_07 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_07[1]*255, self.cor_07[2]*255, self.cor_07[3]*255))
-        self.layout.cor_07.setStyleSheet(color)
-    def Cor_07_CLEAN(self, SIGNAL_CLICKS):
-        self.cor_07 = [False, 0, 0, 0]
-        self.layout.cor_07.setStyleSheet(self.bg_alpha)
+    def Mixer_HSL_L1_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hsl_l1 = [True, self.hsl_1, self.hsl_2, self.hsl_3]
+        # Display
+        rgb = self.hsl_to_rgb(self.color_hsl_l1[1], self.color_hsl_l1[2], self.color_hsl_l1[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hsl_l1.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_HSL_L1_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_hsl_l1 = [False, 0, 0, 0]
+        # Display
+        self.layout.hsl_l1.setStyleSheet(self.bg_alpha)
+        self.layout.hsl_g1.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_hsl_g1 = 0
+        self.mixer_hsl_g1.Update(self.spacer_hsl_g1, self.mixer_width)
 
-    def Cor_08_APPLY(self, SIGNAL_CLICKS):
-        if self.cor_08[0] == True:
-            self.Color_HUE("RGB", self.cor_08[1], self.cor_08[2], self.cor_08[3], 0)
-            self.Color_APPLY("RGB", self.cor_08[1], self.cor_08[2], self.cor_08[3], 0)
+    def Mixer_HSL_R1_APPLY(self, SIGNAL_APPLY):
+        if self.color_hsl_r1[0] == True:
+            self.Color_APPLY("HSL", self.color_hsl_r1[1], self.color_hsl_r1[2], self.color_hsl_r1[3], 0)
             self.Pigment_Release()
-    def Cor_08_SAVE(self, SIGNAL_CLICKS):
-        self.cor_08 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_08[1]*255, self.cor_08[2]*255, self.cor_08[3]*255))
-        self.layout.cor_08.setStyleSheet(color)
-    def Cor_08_CLEAN(self, SIGNAL_CLICKS):
-        self.cor_08 = [False, 0, 0, 0]
-        self.layout.cor_08.setStyleSheet(self.bg_alpha)
+    def Mixer_HSL_R1_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hsl_r1 = [True, self.hsl_1, self.hsl_2, self.hsl_3]
+        # Display
+        rgb = self.hsl_to_rgb(self.color_hsl_r1[1], self.color_hsl_r1[2], self.color_hsl_r1[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hsl_r1.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_HSL_R1_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_hsl_r1 = [False, 0, 0, 0]
+        # Display
+        self.layout.hsl_r1.setStyleSheet(self.bg_alpha)
+        self.layout.hsl_g1.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_hsl_g1 = 0
+        self.mixer_hsl_g1.Update(self.spacer_hsl_g1, self.mixer_width)
 
-    def Cor_09_APPLY(self, SIGNAL_CLICKS):
-        if self.cor_09[0] == True:
-            self.Color_HUE("RGB", self.cor_09[1], self.cor_09[2], self.cor_09[3], 0)
-            self.Color_APPLY("RGB", self.cor_09[1], self.cor_09[2], self.cor_09[3], 0)
+    def Mixer_HSL_L2_APPLY(self, SIGNAL_APPLY):
+        if self.color_hsl_l2[0] == True:
+            self.Color_APPLY("HSL", self.color_hsl_l2[1], self.color_hsl_l2[2], self.color_hsl_l2[3], 0)
             self.Pigment_Release()
-    def Cor_09_SAVE(self, SIGNAL_CLICKS):
-        self.cor_09 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_09[1]*255, self.cor_09[2]*255, self.cor_09[3]*255))
-        self.layout.cor_09.setStyleSheet(color)
-    def Cor_09_CLEAN(self, SIGNAL_CLICKS):
-        self.cor_09 = [False, 0, 0, 0]
-        self.layout.cor_09.setStyleSheet(self.bg_alpha)
+    def Mixer_HSL_L2_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hsl_l2 = [True, self.hsl_1, self.hsl_2, self.hsl_3]
+        # Display
+        rgb = self.hsl_to_rgb(self.color_hsl_l2[1], self.color_hsl_l2[2], self.color_hsl_l2[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hsl_l2.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_HSL_L2_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_hsl_l2 = [False, 0, 0, 0]
+        # Display
+        self.layout.hsl_l2.setStyleSheet(self.bg_alpha)
+        self.layout.hsl_g2.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_hsl_g2 = 0
+        self.mixer_hsl_g2.Update(self.spacer_hsl_g2, self.mixer_width)
 
-    def Cor_10_APPLY(self, SIGNAL_CLICKS):
-        if self.cor_10[0] == True:
-            self.Color_HUE("RGB", self.cor_10[1], self.cor_10[2], self.cor_10[3], 0)
-            self.Color_APPLY("RGB", self.cor_10[1], self.cor_10[2], self.cor_10[3], 0)
+    def Mixer_HSL_R2_APPLY(self, SIGNAL_APPLY):
+        if self.color_hsl_r2[0] == True:
+            self.Color_APPLY("HSL", self.color_hsl_r2[1], self.color_hsl_r2[2], self.color_hsl_r2[3], 0)
             self.Pigment_Release()
-    def Cor_10_SAVE(self, SIGNAL_CLICKS):
-        self.cor_10 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_10[1]*255, self.cor_10[2]*255, self.cor_10[3]*255))
-        self.layout.cor_10.setStyleSheet(color)
-    def Cor_10_CLEAN(self, SIGNAL_CLICKS):
-        self.cor_10 = [False, 0, 0, 0]
-        self.layout.cor_10.setStyleSheet(self.bg_alpha)
+    def Mixer_HSL_R2_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hsl_r2 = [True, self.hsl_1, self.hsl_2, self.hsl_3]
+        # Display
+        rgb = self.hsl_to_rgb(self.color_hsl_r2[1], self.color_hsl_r2[2], self.color_hsl_r2[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hsl_r2.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_HSL_R2_CLEAN(self, SIGNAL_CLEAN):
+        # Color Math
+        self.color_hsl_r2 = [False, 0, 0, 0]
+        # Display
+        self.layout.hsl_r2.setStyleSheet(self.bg_alpha)
+        self.layout.hsl_g2.setStyleSheet(self.bg_alpha)
+        self.Mixer_Display()
+        # Correct Values
+        self.spacer_hsl_g2 = 0
+        self.mixer_hsl_g2.Update(self.spacer_hsl_g2, self.mixer_width)
 
-    #//
-    #\\ Mixer Boxes ############################################################
-    # TTS
-    def Mixer_TTS_APPLY(self, SIGNAL_APPLY):
-        if self.color_tts[0] == True:
-            self.Color_APPLY("RGB", self.color_tts[1], self.color_tts[2], self.color_tts[3], 0)
+    def Mixer_HSL_L3_APPLY(self, SIGNAL_APPLY):
+        if self.color_hsl_l3[0] == True:
+            self.Color_APPLY("HSL", self.color_hsl_l3[1], self.color_hsl_l3[2], self.color_hsl_l3[3], 0)
             self.Pigment_Release()
-    def Mixer_TTS_SAVE(self, SIGNAL_SAVE):
-        # Color Math
-        self.color_tts = [True, self.rgb_1, self.rgb_2, self.rgb_3]
-        gray = self.rgb_to_aaa(self.rgb_1, self.rgb_2, self.rgb_3)
-        self.gray_tts = [gray[0], gray[0], gray[0]]
+    def Mixer_HSL_L3_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hsl_l3 = [True, self.hsl_1, self.hsl_2, self.hsl_3]
         # Display
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ; " % (self.color_tts[1]*255, self.color_tts[2]*255, self.color_tts[3]*255))
-        bg_gray_tts = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ; " % (self.gray_tts[0]*255, self.gray_tts[1]*255, self.gray_tts[2]*255))
-        self.layout.tts_l1.setStyleSheet(color)
-        self.layout.white.setStyleSheet(self.bg_white)
-        self.layout.grey.setStyleSheet(bg_gray_tts)
-        self.layout.black.setStyleSheet(self.bg_black)
+        rgb = self.hsl_to_rgb(self.color_hsl_l3[1], self.color_hsl_l3[2], self.color_hsl_l3[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hsl_l3.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_TTS_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_HSL_L3_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_tts = [False, 0, 0, 0]
-        self.gray_tts = self.color_grey
+        self.color_hsl_l3 = [False, 0, 0, 0]
         # Display
-        self.layout.tts_l1.setStyleSheet(self.bg_alpha)
-        self.layout.white.setStyleSheet(self.bg_alpha)
-        self.layout.grey.setStyleSheet(self.bg_alpha)
-        self.layout.black.setStyleSheet(self.bg_alpha)
-        self.layout.tint.setStyleSheet(self.bg_alpha)
-        self.layout.tone.setStyleSheet(self.bg_alpha)
-        self.layout.shade.setStyleSheet(self.bg_alpha)
+        self.layout.hsl_l3.setStyleSheet(self.bg_alpha)
+        self.layout.hsl_g3.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_tint = 0
-        self.spacer_tone = 0
-        self.spacer_shade = 0
-        self.mixer_tint.Colors(False, 0)
-        self.mixer_tone.Colors(False, 0)
-        self.mixer_shade.Colors(False, 0)
+        self.spacer_hsl_g3 = 0
+        self.mixer_hsl_g3.Update(self.spacer_hsl_g3, self.mixer_width)
 
-    # RGB
-    def Mixer_RGB_L1_APPLY(self, SIGNAL_APPLY):
-        if self.color_rgb_l1[0] == True:
-            self.Color_APPLY("RGB", self.color_rgb_l1[1], self.color_rgb_l1[2], self.color_rgb_l1[3], 0)
+    def Mixer_HSL_R3_APPLY(self, SIGNAL_APPLY):
+        if self.color_hsl_r3[0] == True:
+            self.Color_APPLY("HSL", self.color_hsl_r3[1], self.color_hsl_r3[2], self.color_hsl_r3[3], 0)
             self.Pigment_Release()
-    def Mixer_RGB_L1_SAVE(self, SIGNAL_SAVE):
-        # Color Math
-        self.color_rgb_l1 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+    def Mixer_HSL_R3_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hsl_r3 = [True, self.hsl_1, self.hsl_2, self.hsl_3]
         # Display
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.color_rgb_l1[1]*255, self.color_rgb_l1[2]*255, self.color_rgb_l1[3]*255))
-        self.layout.rgb_l1.setStyleSheet(color)
+        rgb = self.hsl_to_rgb(self.color_hsl_r3[1], self.color_hsl_r3[2], self.color_hsl_r3[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hsl_r3.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_RGB_L1_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_HSL_R3_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_rgb_l1 = [False, 0, 0, 0]
+        self.color_hsl_r3 = [False, 0, 0, 0]
         # Display
-        self.layout.rgb_l1.setStyleSheet(self.bg_alpha)
-        self.layout.rgb_g1.setStyleSheet(self.bg_alpha)
+        self.layout.hsl_r3.setStyleSheet(self.bg_alpha)
+        self.layout.hsl_g3.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_rgb_g1 = 0
-        self.mixer_rgb_g1.Update(self.spacer_rgb_g1, self.mixer_width)
+        self.spacer_hsl_g3 = 0
+        self.mixer_hsl_g3.Update(self.spacer_hsl_g3, self.mixer_width)
 
-    def Mixer_RGB_R1_APPLY(self, SIGNAL_APPLY):
-        if self.color_rgb_r1[0] == True:
-            self.Color_APPLY("RGB", self.color_rgb_r1[1], self.color_rgb_r1[2], self.color_rgb_r1[3], 0)
+    # HCY
+    def Mixer_HCY_L1_APPLY(self, SIGNAL_APPLY):
+        if self.color_hcy_l1[0] == True:
+            self.Color_APPLY("HCY", self.color_hcy_l1[1], self.color_hcy_l1[2], self.color_hcy_l1[3], 0)
             self.Pigment_Release()
-    def Mixer_RGB_R1_SAVE(self, SIGNAL_SAVE):
-        # Color Math
-        self.color_rgb_r1 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+    def Mixer_HCY_L1_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hcy_l1 = [True, self.hcy_1, self.hcy_2, self.hcy_3]
         # Display
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.color_rgb_r1[1]*255, self.color_rgb_r1[2]*255, self.color_rgb_r1[3]*255))
-        self.layout.rgb_r1.setStyleSheet(color)
+        rgb = self.hcy_to_rgb(self.color_hcy_l1[1], self.color_hcy_l1[2], self.color_hcy_l1[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hcy_l1.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_RGB_R1_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_HCY_L1_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_rgb_r1 = [False, 0, 0, 0]
+        self.color_hcy_l1 = [False, 0, 0, 0]
         # Display
-        self.layout.rgb_r1.setStyleSheet(self.bg_alpha)
-        self.layout.rgb_g1.setStyleSheet(self.bg_alpha)
+        self.layout.hcy_l1.setStyleSheet(self.bg_alpha)
+        self.layout.hcy_g1.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_rgb_g1 = 0
-        self.mixer_rgb_g1.Update(self.spacer_rgb_g1, self.mixer_width)
+        self.spacer_hcy_g1 = 0
+        self.mixer_hcy_g1.Update(self.spacer_hcy_g1, self.mixer_width)
 
-    def Mixer_RGB_L2_APPLY(self, SIGNAL_APPLY):
-        if self.color_rgb_l2[0] == True:
-            self.Color_APPLY("RGB", self.color_rgb_l2[1], self.color_rgb_l2[2], self.color_rgb_l2[3], 0)
+    def Mixer_HCY_R1_APPLY(self, SIGNAL_APPLY):
+        if self.color_hcy_r1[0] == True:
+            self.Color_APPLY("HCY", self.color_hcy_r1[1], self.color_hcy_r1[2], self.color_hcy_r1[3], 0)
             self.Pigment_Release()
-    def Mixer_RGB_L2_SAVE(self, SIGNAL_SAVE):
-        # Color Math
-        self.color_rgb_l2 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+    def Mixer_HCY_R1_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hcy_r1 = [True, self.hcy_1, self.hcy_2, self.hcy_3]
         # Display
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.color_rgb_l2[1]*255, self.color_rgb_l2[2]*255, self.color_rgb_l2[3]*255))
-        self.layout.rgb_l2.setStyleSheet(color)
+        rgb = self.hcy_to_rgb(self.color_hcy_r1[1], self.color_hcy_r1[2], self.color_hcy_r1[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hcy_r1.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_RGB_L2_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_HCY_R1_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_rgb_l2 = [False, 0, 0, 0]
+        self.color_hcy_r1 = [False, 0, 0, 0]
         # Display
-        self.layout.rgb_l2.setStyleSheet(self.bg_alpha)
-        self.layout.rgb_g2.setStyleSheet(self.bg_alpha)
+        self.layout.hcy_r1.setStyleSheet(self.bg_alpha)
+        self.layout.hcy_g1.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_rgb_g2 = 0
-        self.mixer_rgb_g2.Update(self.spacer_rgb_g2, self.mixer_width)
+        self.spacer_hcy_g1 = 0
+        self.mixer_hcy_g1.Update(self.spacer_hcy_g1, self.mixer_width)
 
-    def Mixer_RGB_R2_APPLY(self, SIGNAL_APPLY):
-        if self.color_rgb_r2[0] == True:
-            self.Color_APPLY("RGB", self.color_rgb_r2[1], self.color_rgb_r2[2], self.color_rgb_r2[3], 0)
+    def Mixer_HCY_L2_APPLY(self, SIGNAL_APPLY):
+        if self.color_hcy_l2[0] == True:
+            self.Color_APPLY("HCY", self.color_hcy_l2[1], self.color_hcy_l2[2], self.color_hcy_l2[3], 0)
             self.Pigment_Release()
-    def Mixer_RGB_R2_SAVE(self, SIGNAL_SAVE):
-        # Color Math
-        self.color_rgb_r2 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+    def Mixer_HCY_L2_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hcy_l2 = [True, self.hcy_1, self.hcy_2, self.hcy_3]
         # Display
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.color_rgb_r2[1]*255, self.color_rgb_r2[2]*255, self.color_rgb_r2[3]*255))
-        self.layout.rgb_r2.setStyleSheet(color)
+        rgb = self.hcy_to_rgb(self.color_hcy_l2[1], self.color_hcy_l2[2], self.color_hcy_l2[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hcy_l2.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_RGB_R2_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_HCY_L2_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_rgb_r2 = [False, 0, 0, 0]
+        self.color_hcy_l2 = [False, 0, 0, 0]
         # Display
-        self.layout.rgb_r2.setStyleSheet(self.bg_alpha)
-        self.layout.rgb_g2.setStyleSheet(self.bg_alpha)
+        self.layout.hcy_l2.setStyleSheet(self.bg_alpha)
+        self.layout.hcy_g2.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_rgb_g2 = 0
-        self.mixer_rgb_g2.Update(self.spacer_rgb_g2, self.mixer_width)
+        self.spacer_hcy_g2 = 0
+        self.mixer_hcy_g2.Update(self.spacer_hcy_g2, self.mixer_width)
 
-    def Mixer_RGB_L3_APPLY(self, SIGNAL_APPLY):
-        if self.color_rgb_l3[0] == True:
-            self.Color_APPLY("RGB", self.color_rgb_l3[1], self.color_rgb_l3[2], self.color_rgb_l3[3], 0)
+    def Mixer_HCY_R2_APPLY(self, SIGNAL_APPLY):
+        if self.color_hcy_r2[0] == True:
+            self.Color_APPLY("HCY", self.color_hcy_r2[1], self.color_hcy_r2[2], self.color_hcy_r2[3], 0)
             self.Pigment_Release()
-    def Mixer_RGB_L3_SAVE(self, SIGNAL_SAVE):
-        # Color Math
-        self.color_rgb_l3 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+    def Mixer_HCY_R2_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hcy_r2 = [True, self.hcy_1, self.hcy_2, self.hcy_3]
         # Display
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.color_rgb_l3[1]*255, self.color_rgb_l3[2]*255, self.color_rgb_l3[3]*255))
-        self.layout.rgb_l3.setStyleSheet(color)
+        rgb = self.hcy_to_rgb(self.color_hcy_r2[1], self.color_hcy_r2[2], self.color_hcy_r2[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hcy_r2.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_RGB_L3_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_HCY_R2_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_rgb_l3 = [False, 0, 0, 0]
+        self.color_hcy_r2 = [False, 0, 0, 0]
         # Display
-        self.layout.rgb_l3.setStyleSheet(self.bg_alpha)
-        self.layout.rgb_g3.setStyleSheet(self.bg_alpha)
+        self.layout.hcy_r2.setStyleSheet(self.bg_alpha)
+        self.layout.hcy_g2.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_rgb_g3 = 0
-        self.mixer_rgb_g3.Update(self.spacer_rgb_g3, self.mixer_width)
+        self.spacer_hcy_g2 = 0
+        self.mixer_hcy_g2.Update(self.spacer_hcy_g2, self.mixer_width)
 
-    def Mixer_RGB_R3_APPLY(self, SIGNAL_APPLY):
-        if self.color_rgb_r3[0] == True:
-            self.Color_APPLY("RGB", self.color_rgb_r3[1], self.color_rgb_r3[2], self.color_rgb_r3[3], 0)
+    def Mixer_HCY_L3_APPLY(self, SIGNAL_APPLY):
+        if self.color_hcy_l3[0] == True:
+            self.Color_APPLY("HCY", self.color_hcy_l3[1], self.color_hcy_l3[2], self.color_hcy_l3[3], 0)
             self.Pigment_Release()
-    def Mixer_RGB_R3_SAVE(self, SIGNAL_SAVE):
+    def Mixer_HCY_L3_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hcy_l3 = [True, self.hcy_1, self.hcy_2, self.hcy_3]
+        # Display
+        rgb = self.hcy_to_rgb(self.color_hcy_l3[1], self.color_hcy_l3[2], self.color_hcy_l3[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hcy_l3.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_HCY_L3_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_rgb_r3 = [True, self.rgb_1, self.rgb_2, self.rgb_3]
+        self.color_hcy_l3 = [False, 0, 0, 0]
         # Display
-        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.color_rgb_r3[1]*255, self.color_rgb_r3[2]*255, self.color_rgb_r3[3]*255))
-        self.layout.rgb_r3.setStyleSheet(color)
+        self.layout.hcy_l3.setStyleSheet(self.bg_alpha)
+        self.layout.hcy_g3.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
-    def Mixer_RGB_R3_CLEAN(self, SIGNAL_CLEAN):
+        # Correct Values
+        self.spacer_hcy_g3 = 0
+        self.mixer_hcy_g3.Update(self.spacer_hcy_g3, self.mixer_width)
+
+    def Mixer_HCY_R3_APPLY(self, SIGNAL_APPLY):
+        if self.color_hcy_r3[0] == True:
+            self.Color_APPLY("HCY", self.color_hcy_r3[1], self.color_hcy_r3[2], self.color_hcy_r3[3], 0)
+            self.Pigment_Release()
+    def Mixer_HCY_R3_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_hcy_r3 = [True, self.hcy_1, self.hcy_2, self.hcy_3]
+        # Display
+        rgb = self.hcy_to_rgb(self.color_hcy_r3[1], self.color_hcy_r3[2], self.color_hcy_r3[3])
+        color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
+        self.layout.hcy_r3.setStyleSheet(color)
+        self.Mixer_Display()
+    def Mixer_HCY_R3_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_rgb_r3 = [False, 0, 0, 0]
+        self.color_hcy_r3 = [False, 0, 0, 0]
         # Display
-        self.layout.rgb_r3.setStyleSheet(self.bg_alpha)
-        self.layout.rgb_g3.setStyleSheet(self.bg_alpha)
+        self.layout.hcy_r3.setStyleSheet(self.bg_alpha)
+        self.layout.hcy_g3.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_rgb_g3 = 0
-        self.mixer_rgb_g3.Update(self.spacer_rgb_g3, self.mixer_width)
+        self.spacer_hcy_g3 = 0
+        self.mixer_hcy_g3.Update(self.spacer_hcy_g3, self.mixer_width)
 
-    # ARD
-    def Mixer_ARD_L1_APPLY(self, SIGNAL_APPLY):
-        if self.color_ard_l1[0] == True:
-            self.Color_APPLY("ARD", self.color_ard_l1[1], self.color_ard_l1[2], self.color_ard_l1[3], 0)
+    # OKLAB
+    def Mixer_OKLAB_L1_APPLY(self, SIGNAL_APPLY):
+        if self.color_oklab_l1[0] == True:
+            self.Color_HUE("OKLAB", self.color_oklab_l1[1], self.color_oklab_l1[2], self.color_oklab_l1[3], 0)
+            self.Color_APPLY("OKLAB", self.color_oklab_l1[1], self.color_oklab_l1[2], self.color_oklab_l1[3], 0)
             self.Pigment_Release()
-    def Mixer_ARD_L1_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKLAB_L1_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_ard_l1 = [True, self.ard_1, self.ard_2, self.ard_3]
+        self.color_oklab_l1 = [True, self.oklab_1, self.oklab_2, self.oklab_3]
         # Display
-        rgb = self.ard_to_rgb(self.color_ard_l1[1], self.color_ard_l1[2], self.color_ard_l1[3])
+        rgb = self.oklab_channels_to_rgb(self.color_oklab_l1[1], self.color_oklab_l1[2], self.color_oklab_l1[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.ard_l1.setStyleSheet(color)
+        self.layout.oklab_l1.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_ARD_L1_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKLAB_L1_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_ard_l1 = [False, 0, 0, 0, 0, 0, 0]
+        self.color_oklab_l1 = [False, 0, 0, 0]
         # Display
-        self.layout.ard_l1.setStyleSheet(self.bg_alpha)
-        self.layout.ard_g1.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_l1.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_g1.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_ard_g1 = 0
-        self.mixer_ard_g1.Update(self.spacer_ard_g1, self.mixer_width)
+        self.spacer_oklab_g1 = 0
+        self.mixer_oklab_g1.Update(self.spacer_oklab_g1, self.mixer_width)
 
-    def Mixer_ARD_R1_APPLY(self, SIGNAL_APPLY):
-        if self.color_ard_r1[0] == True:
-            self.Color_APPLY("ARD", self.color_ard_r1[1], self.color_ard_r1[2], self.color_ard_r1[3], 0)
+    def Mixer_OKLAB_R1_APPLY(self, SIGNAL_APPLY):
+        if self.color_oklab_r1[0] == True:
+            self.Color_HUE("OKLAB", self.color_oklab_r1[1], self.color_oklab_r1[2], self.color_oklab_r1[3], 0)
+            self.Color_APPLY("OKLAB", self.color_oklab_r1[1], self.color_oklab_r1[2], self.color_oklab_r1[3], 0)
             self.Pigment_Release()
-    def Mixer_ARD_R1_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKLAB_R1_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_ard_r1 = [True, self.ard_1, self.ard_2, self.ard_3]
+        self.color_oklab_r1 = [True, self.oklab_1, self.oklab_2, self.oklab_3]
         # Display
-        rgb = self.ard_to_rgb(self.color_ard_r1[1], self.color_ard_r1[2], self.color_ard_r1[3])
+        rgb = self.oklab_channels_to_rgb(self.color_oklab_r1[1], self.color_oklab_r1[2], self.color_oklab_r1[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.ard_r1.setStyleSheet(color)
+        self.layout.oklab_r1.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_ARD_R1_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKLAB_R1_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_ard_r1 = [False, 0, 0, 0, 0, 0, 0]
+        self.color_oklab_r1 = [False, 0, 0, 0]
         # Display
-        self.layout.ard_r1.setStyleSheet(self.bg_alpha)
-        self.layout.ard_g1.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_r1.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_g1.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_ard_g1 = 0
-        self.mixer_ard_g1.Update(self.spacer_ard_g1, self.mixer_width)
+        self.spacer_oklab_g1 = 0
+        self.mixer_oklab_g1.Update(self.spacer_oklab_g1, self.mixer_width)
 
-    def Mixer_ARD_L2_APPLY(self, SIGNAL_APPLY):
-        if self.color_ard_l2[0] == True:
-            self.Color_APPLY("ARD", self.color_ard_l2[1], self.color_ard_l2[2], self.color_ard_l2[3], 0)
+    def Mixer_OKLAB_L2_APPLY(self, SIGNAL_APPLY):
+        if self.color_oklab_l2[0] == True:
+            self.Color_HUE("OKLAB", self.color_oklab_l2[1], self.color_oklab_l2[2], self.color_oklab_l2[3], 0)
+            self.Color_APPLY("OKLAB", self.color_oklab_l2[1], self.color_oklab_l2[2], self.color_oklab_l2[3], 0)
             self.Pigment_Release()
-    def Mixer_ARD_L2_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKLAB_L2_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_ard_l2 = [True, self.ard_1, self.ard_2, self.ard_3]
+        self.color_oklab_l2 = [True, self.oklab_1, self.oklab_2, self.oklab_3]
         # Display
-        rgb = self.ard_to_rgb(self.color_ard_l2[1], self.color_ard_l2[2], self.color_ard_l2[3])
+        rgb = self.oklab_channels_to_rgb(self.color_oklab_l2[1], self.color_oklab_l2[2], self.color_oklab_l2[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.ard_l2.setStyleSheet(color)
+        self.layout.oklab_l2.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_ARD_L2_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKLAB_L2_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_ard_l2 = [False, 0, 0, 0, 0, 0, 0]
+        self.color_oklab_l2 = [False, 0, 0, 0]
         # Display
-        self.layout.ard_l2.setStyleSheet(self.bg_alpha)
-        self.layout.ard_g2.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_l2.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_g2.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_ard_g2 = 0
-        self.mixer_ard_g2.Update(self.spacer_ard_g2, self.mixer_width)
+        self.spacer_oklab_g2 = 0
+        self.mixer_oklab_g2.Update(self.spacer_oklab_g2, self.mixer_width)
 
-    def Mixer_ARD_R2_APPLY(self, SIGNAL_APPLY):
-        if self.color_ard_r2[0] == True:
-            self.Color_APPLY("ARD", self.color_ard_r2[1], self.color_ard_r2[2], self.color_ard_r2[3], 0)
+    def Mixer_OKLAB_R2_APPLY(self, SIGNAL_APPLY):
+        if self.color_oklab_r2[0] == True:
+            self.Color_HUE("OKLAB", self.color_oklab_r2[1], self.color_oklab_r2[2], self.color_oklab_r2[3], 0)
+            self.Color_APPLY("OKLAB", self.color_oklab_r2[1], self.color_oklab_r2[2], self.color_oklab_r2[3], 0)
             self.Pigment_Release()
-    def Mixer_ARD_R2_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKLAB_R2_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_ard_r2 = [True, self.ard_1, self.ard_2, self.ard_3]
+        self.color_oklab_r2 = [True, self.oklab_1, self.oklab_2, self.oklab_3]
         # Display
-        rgb = self.ard_to_rgb(self.color_ard_r2[1], self.color_ard_r2[2], self.color_ard_r2[3])
+        rgb = self.oklab_channels_to_rgb(self.color_oklab_r2[1], self.color_oklab_r2[2], self.color_oklab_r2[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.ard_r2.setStyleSheet(color)
+        self.layout.oklab_r2.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_ARD_R2_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKLAB_R2_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_ard_r2 = [False, 0, 0, 0, 0, 0, 0]
+        self.color_oklab_r2 = [False, 0, 0, 0]
         # Display
-        self.layout.ard_r2.setStyleSheet(self.bg_alpha)
-        self.layout.ard_g2.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_r2.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_g2.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_ard_g2 = 0
-        self.mixer_ard_g2.Update(self.spacer_ard_g2, self.mixer_width)
+        self.spacer_oklab_g2 = 0
+        self.mixer_oklab_g2.Update(self.spacer_oklab_g2, self.mixer_width)
 
-    def Mixer_ARD_L3_APPLY(self, SIGNAL_APPLY):
-        if self.color_ard_l3[0] == True:
-            self.Color_APPLY("ARD", self.color_ard_l3[1], self.color_ard_l3[2], self.color_ard_l3[3], 0)
+    def Mixer_OKLAB_L3_APPLY(self, SIGNAL_APPLY):
+        if self.color_oklab_l3[0] == True:
+            self.Color_HUE("OKLAB", self.color_oklab_l3[1], self.color_oklab_l3[2], self.color_oklab_l3[3], 0)
+            self.Color_APPLY("OKLAB", self.color_oklab_l3[1], self.color_oklab_l3[2], self.color_oklab_l3[3], 0)
             self.Pigment_Release()
-    def Mixer_ARD_L3_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKLAB_L3_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_ard_l3 = [True, self.ard_1, self.ard_2, self.ard_3]
+        self.color_oklab_l3 = [True, self.oklab_1, self.oklab_2, self.oklab_3]
         # Display
-        rgb = self.ard_to_rgb(self.color_ard_l3[1], self.color_ard_l3[2], self.color_ard_l3[3])
+        rgb = self.oklab_channels_to_rgb(self.color_oklab_l3[1], self.color_oklab_l3[2], self.color_oklab_l3[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.ard_l3.setStyleSheet(color)
+        self.layout.oklab_l3.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_ARD_L3_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKLAB_L3_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_ard_l3 = [False, 0, 0, 0, 0, 0, 0]
+        self.color_oklab_l3 = [False, 0, 0, 0]
         # Display
-        self.layout.ard_l3.setStyleSheet(self.bg_alpha)
-        self.layout.ard_g3.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_l3.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_g3.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_ard_g3 = 0
-        self.mixer_ard_g3.Update(self.spacer_ard_g3, self.mixer_width)
+        self.spacer_oklab_g3 = 0
+        self.mixer_oklab_g3.Update(self.spacer_oklab_g3, self.mixer_width)
 
-    def Mixer_ARD_R3_APPLY(self, SIGNAL_APPLY):
-        if self.color_ard_r3[0] == True:
-            self.Color_APPLY("ARD", self.color_ard_r3[1], self.color_ard_r3[2], self.color_ard_r3[3], 0)
+    def Mixer_OKLAB_R3_APPLY(self, SIGNAL_APPLY):
+        if self.color_oklab_r3[0] == True:
+            self.Color_HUE("OKLAB", self.color_oklab_r3[1], self.color_oklab_r3[2], self.color_oklab_r3[3], 0)
+            self.Color_APPLY("OKLAB", self.color_oklab_r3[1], self.color_oklab_r3[2], self.color_oklab_r3[3], 0)
             self.Pigment_Release()
-    def Mixer_ARD_R3_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKLAB_R3_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_ard_r3 = [True, self.ard_1, self.ard_2, self.ard_3]
+        self.color_oklab_r3 = [True, self.oklab_1, self.oklab_2, self.oklab_3]
         # Display
-        rgb = self.ard_to_rgb(self.color_ard_r3[1], self.color_ard_r3[2], self.color_ard_r3[3])
+        rgb = self.oklab_channels_to_rgb(self.color_oklab_r3[1], self.color_oklab_r3[2], self.color_oklab_r3[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.ard_r3.setStyleSheet(color)
+        self.layout.oklab_r3.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_ARD_R3_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKLAB_R3_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_ard_r3 = [False, 0, 0, 0, 0, 0, 0]
+        self.color_oklab_r3 = [False, 0, 0, 0]
         # Display
-        self.layout.ard_r3.setStyleSheet(self.bg_alpha)
-        self.layout.ard_g3.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_r3.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_g3.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_ard_g3 = 0
-        self.mixer_ard_g3.Update(self.spacer_ard_g3, self.mixer_width)
-
-    # HSV
-    def Mixer_HSV_L1_APPLY(self, SIGNAL_APPLY):
-        if self.color_hsv_l1[0] == True:
-            self.Color_APPLY("HSV", self.color_hsv_l1[1], self.color_hsv_l1[2], self.color_hsv_l1[3], 0)
+        self.spacer_oklab_g3 = 0
+        self.mixer_oklab_g3.Update(self.spacer_oklab_g3, self.mixer_width)
+
+    # OKLCH
+    def Mixer_OKLCH_L1_APPLY(self, SIGNAL_APPLY):
+        if self.color_oklch_l1[0] == True:
+            self.Color_HUE("OKLCH", self.color_oklch_l1[1], self.color_oklch_l1[2], self.color_oklch_l1[3], 0)
+            self.Color_APPLY("OKLCH", self.color_oklch_l1[1], self.color_oklch_l1[2], self.color_oklch_l1[3], 0)
             self.Pigment_Release()
-    def Mixer_HSV_L1_SAVE(self, SIGNAL_SAVE):
-        # color = [Bool, R, G, B, H, S, V]
-        self.color_hsv_l1 = [True, self.hsv_1, self.hsv_2, self.hsv_3]
+    def Mixer_OKLCH_L1_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_oklch_l1 = [True, self.oklch_1, self.oklch_2, self.oklch_3]
         # Display
-        rgb = self.hsv_to_rgb(self.color_hsv_l1[1], self.color_hsv_l1[2], self.color_hsv_l1[3])
+        rgb = self.oklch_channels_to_rgb(self.color_oklch_l1[1], self.color_oklch_l1[2], self.color_oklch_l1[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hsv_l1.setStyleSheet(color)
+        self.layout.oklch_l1.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HSV_L1_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKLCH_L1_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hsv_l1 = [False, 0, 0, 0]
+        self.color_oklch_l1 = [False, 0, 0, 0]
         # Display
-        self.layout.hsv_l1.setStyleSheet(self.bg_alpha)
-        self.layout.hsv_g1.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_l1.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_g1.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hsv_g1 = 0
-        self.mixer_hsv_g1.Update(self.spacer_hsv_g1, self.mixer_width)
+        self.spacer_oklch_g1 = 0
+        self.mixer_oklch_g1.Update(self.spacer_oklch_g1, self.mixer_width)
 
-    def Mixer_HSV_R1_APPLY(self, SIGNAL_APPLY):
-        if self.color_hsv_r1[0] == True:
-            self.Color_APPLY("HSV", self.color_hsv_r1[1], self.color_hsv_r1[2], self.color_hsv_r1[3], 0)
+    def Mixer_OKLCH_R1_APPLY(self, SIGNAL_APPLY):
+        if self.color_oklch_r1[0] == True:
+            self.Color_HUE("OKLCH", self.color_oklch_r1[1], self.color_oklch_r1[2], self.color_oklch_r1[3], 0)
+            self.Color_APPLY("OKLCH", self.color_oklch_r1[1], self.color_oklch_r1[2], self.color_oklch_r1[3], 0)
             self.Pigment_Release()
-    def Mixer_HSV_R1_SAVE(self, SIGNAL_SAVE):
-        # color = [Bool, R, G, B, H, S, V]
-        self.color_hsv_r1 = [True, self.hsv_1, self.hsv_2, self.hsv_3]
+    def Mixer_OKLCH_R1_SAVE(self, SIGNAL_SAVE):
+        # color
+        self.color_oklch_r1 = [True, self.oklch_1, self.oklch_2, self.oklch_3]
         # Display
-        rgb = self.hsv_to_rgb(self.color_hsv_r1[1], self.color_hsv_r1[2], self.color_hsv_r1[3])
+        rgb = self.oklch_channels_to_rgb(self.color_oklch_r1[1], self.color_oklch_r1[2], self.color_oklch_r1[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hsv_r1.setStyleSheet(color)
+        self.layout.oklch_r1.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HSV_R1_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKLCH_R1_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hsv_r1 = [False, 0, 0, 0]
+        self.color_oklch_r1 = [False, 0, 0, 0]
         # Display
-        self.layout.hsv_r1.setStyleSheet(self.bg_alpha)
-        self.layout.hsv_g1.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_r1.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_g1.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hsv_g1 = 0
-        self.mixer_hsv_g1.Update(self.spacer_hsv_g1, self.mixer_width)
+        self.spacer_oklch_g1 = 0
+        self.mixer_oklch_g1.Update(self.spacer_oklch_g1, self.mixer_width)
 
-    def Mixer_HSV_L2_APPLY(self, SIGNAL_APPLY):
-        if self.color_hsv_l2[0] == True:
-            self.Color_APPLY("HSV", self.color_hsv_l2[1], self.color_hsv_l2[2], self.color_hsv_l2[3], 0)
+    def Mixer_OKLCH_L2_APPLY(self, SIGNAL_APPLY):
+        if self.color_oklch_l2[0] == True:
+            self.Color_HUE("OKLCH", self.color_oklch_l2[1], self.color_oklch_l2[2], self.color_oklch_l2[3], 0)
+            self.Color_APPLY("OKLCH", self.color_oklch_l2[1], self.color_oklch_l2[2], self.color_oklch_l2[3], 0)
             self.Pigment_Release()
-    def Mixer_HSV_L2_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKLCH_L2_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hsv_l2 = [True, self.hsv_1, self.hsv_2, self.hsv_3]
+        self.color_oklch_l2 = [True, self.oklch_1, self.oklch_2, self.oklch_3]
         # Display
-        rgb = self.hsv_to_rgb(self.color_hsv_l2[1], self.color_hsv_l2[2], self.color_hsv_l2[3])
+        rgb = self.oklch_channels_to_rgb(self.color_oklch_l2[1], self.color_oklch_l2[2], self.color_oklch_l2[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hsv_l2.setStyleSheet(color)
+        self.layout.oklch_l2.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HSV_L2_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKLCH_L2_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hsv_l2 = [False, 0, 0, 0]
+        self.color_oklch_l2 = [False, 0, 0, 0]
         # Display
-        self.layout.hsv_l2.setStyleSheet(self.bg_alpha)
-        self.layout.hsv_g2.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_l2.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_g2.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hsv_g2 = 0
-        self.mixer_hsv_g2.Update(self.spacer_hsv_g2, self.mixer_width)
+        self.spacer_oklch_g2 = 0
+        self.mixer_oklch_g2.Update(self.spacer_oklch_g2, self.mixer_width)
 
-    def Mixer_HSV_R2_APPLY(self, SIGNAL_APPLY):
-        if self.color_hsv_r2[0] == True:
-            self.Color_APPLY("HSV", self.color_hsv_r2[1], self.color_hsv_r2[2], self.color_hsv_r2[3], 0)
+    def Mixer_OKLCH_R2_APPLY(self, SIGNAL_APPLY):
+        if self.color_oklch_r2[0] == True:
+            self.Color_HUE("OKLCH", self.color_oklch_r2[1], self.color_oklch_r2[2], self.color_oklch_r2[3], 0)
+            self.Color_APPLY("OKLCH", self.color_oklch_r2[1], self.color_oklch_r2[2], self.color_oklch_r2[3], 0)
             self.Pigment_Release()
-    def Mixer_HSV_R2_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKLCH_R2_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hsv_r2 = [True, self.hsv_1, self.hsv_2, self.hsv_3]
+        self.color_oklch_r2 = [True, self.oklch_1, self.oklch_2, self.oklch_3]
         # Display
-        rgb = self.hsv_to_rgb(self.color_hsv_r2[1], self.color_hsv_r2[2], self.color_hsv_r2[3])
+        rgb = self.oklch_channels_to_rgb(self.color_oklch_r2[1], self.color_oklch_r2[2], self.color_oklch_r2[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hsv_r2.setStyleSheet(color)
+        self.layout.oklch_r2.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HSV_R2_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKLCH_R2_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hsv_r2 = [False, 0, 0, 0]
+        self.color_oklch_r2 = [False, 0, 0, 0]
         # Display
-        self.layout.hsv_r2.setStyleSheet(self.bg_alpha)
-        self.layout.hsv_g2.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_r2.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_g2.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hsv_g2 = 0
-        self.mixer_hsv_g2.Update(self.spacer_hsv_g2, self.mixer_width)
+        self.spacer_oklch_g2 = 0
+        self.mixer_oklch_g2.Update(self.spacer_oklch_g2, self.mixer_width)
 
-    def Mixer_HSV_L3_APPLY(self, SIGNAL_APPLY):
-        if self.color_hsv_l3[0] == True:
-            self.Color_APPLY("HSV", self.color_hsv_l3[1], self.color_hsv_l3[2], self.color_hsv_l3[3], 0)
+    def Mixer_OKLCH_L3_APPLY(self, SIGNAL_APPLY):
+        if self.color_oklch_l3[0] == True:
+            self.Color_HUE("OKLCH", self.color_oklch_l3[1], self.color_oklch_l3[2], self.color_oklch_l3[3], 0)
+            self.Color_APPLY("OKLCH", self.color_oklch_l3[1], self.color_oklch_l3[2], self.color_oklch_l3[3], 0)
             self.Pigment_Release()
-    def Mixer_HSV_L3_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKLCH_L3_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hsv_l3 = [True, self.hsv_1, self.hsv_2, self.hsv_3]
+        self.color_oklch_l3 = [True, self.oklch_1, self.oklch_2, self.oklch_3]
         # Display
-        rgb = self.hsv_to_rgb(self.color_hsv_l3[1], self.color_hsv_l3[2], self.color_hsv_l3[3])
+        rgb = self.oklch_channels_to_rgb(self.color_oklch_l3[1], self.color_oklch_l3[2], self.color_oklch_l3[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hsv_l3.setStyleSheet(color)
+        self.layout.oklch_l3.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HSV_L3_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKLCH_L3_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hsv_l3 = [False, 0, 0, 0]
+        self.color_oklch_l3 = [False, 0, 0, 0]
         # Display
-        self.layout.hsv_l3.setStyleSheet(self.bg_alpha)
-        self.layout.hsv_g3.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_l3.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_g3.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hsv_g3 = 0
-        self.mixer_hsv_g3.Update(self.spacer_hsv_g3, self.mixer_width)
+        self.spacer_oklch_g3 = 0
+        self.mixer_oklch_g3.Update(self.spacer_oklch_g3, self.mixer_width)
 
-    def Mixer_HSV_R3_APPLY(self, SIGNAL_APPLY):
-        if self.color_hsv_r3[0] == True:
-            self.Color_APPLY("HSV", self.color_hsv_r3[1], self.color_hsv_r3[2], self.color_hsv_r3[3], 0)
+    def Mixer_OKLCH_R3_APPLY(self, SIGNAL_APPLY):
+        if self.color_oklch_r3[0] == True:
+            self.Color_HUE("OKLCH", self.color_oklch_r3[1], self.color_oklch_r3[2], self.color_oklch_r3[3], 0)
+            self.Color_APPLY("OKLCH", self.color_oklch_r3[1], self.color_oklch_r3[2], self.color_oklch_r3[3], 0)
             self.Pigment_Release()
-    def Mixer_HSV_R3_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKLCH_R3_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hsv_r3 = [True, self.hsv_1, self.hsv_2, self.hsv_3]
+        self.color_oklch_r3 = [True, self.oklch_1, self.oklch_2, self.oklch_3]
         # Display
-        rgb = self.hsv_to_rgb(self.color_hsv_r3[1], self.color_hsv_r3[2], self.color_hsv_r3[3])
+        rgb = self.oklch_channels_to_rgb(self.color_oklch_r3[1], self.color_oklch_r3[2], self.color_oklch_r3[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hsv_r3.setStyleSheet(color)
+        self.layout.oklch_r3.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HSV_R3_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKLCH_R3_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hsv_r3 = [False, 0, 0, 0]
+        self.color_oklch_r3 = [False, 0, 0, 0]
         # Display
-        self.layout.hsv_r3.setStyleSheet(self.bg_alpha)
-        self.layout.hsv_g3.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_r3.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_g3.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hsv_g3 = 0
-        self.mixer_hsv_g3.Update(self.spacer_hsv_g3, self.mixer_width)
-
-    # HSL
-    def Mixer_HSL_L1_APPLY(self, SIGNAL_APPLY):
-        if self.color_hsl_l1[0] == True:
-            self.Color_APPLY("HSL", self.color_hsl_l1[1], self.color_hsl_l1[2], self.color_hsl_l1[3], 0)
+        self.spacer_oklch_g3 = 0
+        self.mixer_oklch_g3.Update(self.spacer_oklch_g3, self.mixer_width)
+
+    # OKHSV
+    def Mixer_OKHSV_L1_APPLY(self, SIGNAL_APPLY):
+        if self.color_okhsv_l1[0] == True:
+            self.Color_HUE("OKHSV", self.color_okhsv_l1[1], self.color_okhsv_l1[2], self.color_okhsv_l1[3], 0)
+            self.Color_APPLY("OKHSV", self.color_okhsv_l1[1], self.color_okhsv_l1[2], self.color_okhsv_l1[3], 0)
             self.Pigment_Release()
-    def Mixer_HSL_L1_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKHSV_L1_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hsl_l1 = [True, self.hsl_1, self.hsl_2, self.hsl_3]
+        self.color_okhsv_l1 = [True, self.okhsv_1, self.okhsv_2, self.okhsv_3]
         # Display
-        rgb = self.hsl_to_rgb(self.color_hsl_l1[1], self.color_hsl_l1[2], self.color_hsl_l1[3])
+        rgb = self.okhsv_to_rgb(self.color_okhsv_l1[1], self.color_okhsv_l1[2], self.color_okhsv_l1[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hsl_l1.setStyleSheet(color)
+        self.layout.okhsv_l1.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HSL_L1_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKHSV_L1_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hsl_l1 = [False, 0, 0, 0]
+        self.color_okhsv_l1 = [False, 0, 0, 0]
         # Display
-        self.layout.hsl_l1.setStyleSheet(self.bg_alpha)
-        self.layout.hsl_g1.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_l1.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_g1.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hsl_g1 = 0
-        self.mixer_hsl_g1.Update(self.spacer_hsl_g1, self.mixer_width)
+        self.spacer_okhsv_g1 = 0
+        self.mixer_okhsv_g1.Update(self.spacer_okhsv_g1, self.mixer_width)
 
-    def Mixer_HSL_R1_APPLY(self, SIGNAL_APPLY):
-        if self.color_hsl_r1[0] == True:
-            self.Color_APPLY("HSL", self.color_hsl_r1[1], self.color_hsl_r1[2], self.color_hsl_r1[3], 0)
+    def Mixer_OKHSV_R1_APPLY(self, SIGNAL_APPLY):
+        if self.color_okhsv_r1[0] == True:
+            self.Color_HUE("OKHSV", self.color_okhsv_r1[1], self.color_okhsv_r1[2], self.color_okhsv_r1[3], 0)
+            self.Color_APPLY("OKHSV", self.color_okhsv_r1[1], self.color_okhsv_r1[2], self.color_okhsv_r1[3], 0)
             self.Pigment_Release()
-    def Mixer_HSL_R1_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKHSV_R1_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hsl_r1 = [True, self.hsl_1, self.hsl_2, self.hsl_3]
+        self.color_okhsv_r1 = [True, self.okhsv_1, self.okhsv_2, self.okhsv_3]
         # Display
-        rgb = self.hsl_to_rgb(self.color_hsl_r1[1], self.color_hsl_r1[2], self.color_hsl_r1[3])
+        rgb = self.okhsv_to_rgb(self.color_okhsv_r1[1], self.color_okhsv_r1[2], self.color_okhsv_r1[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hsl_r1.setStyleSheet(color)
+        self.layout.okhsv_r1.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HSL_R1_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKHSV_R1_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hsl_r1 = [False, 0, 0, 0]
+        self.color_okhsv_r1 = [False, 0, 0, 0]
         # Display
-        self.layout.hsl_r1.setStyleSheet(self.bg_alpha)
-        self.layout.hsl_g1.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_r1.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_g1.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hsl_g1 = 0
-        self.mixer_hsl_g1.Update(self.spacer_hsl_g1, self.mixer_width)
+        self.spacer_okhsv_g1 = 0
+        self.mixer_okhsv_g1.Update(self.spacer_okhsv_g1, self.mixer_width)
 
-    def Mixer_HSL_L2_APPLY(self, SIGNAL_APPLY):
-        if self.color_hsl_l2[0] == True:
-            self.Color_APPLY("HSL", self.color_hsl_l2[1], self.color_hsl_l2[2], self.color_hsl_l2[3], 0)
+    def Mixer_OKHSV_L2_APPLY(self, SIGNAL_APPLY):
+        if self.color_okhsv_l2[0] == True:
+            self.Color_HUE("OKHSV", self.color_okhsv_l2[1], self.color_okhsv_l2[2], self.color_okhsv_l2[3], 0)
+            self.Color_APPLY("OKHSV", self.color_okhsv_l2[1], self.color_okhsv_l2[2], self.color_okhsv_l2[3], 0)
             self.Pigment_Release()
-    def Mixer_HSL_L2_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKHSV_L2_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hsl_l2 = [True, self.hsl_1, self.hsl_2, self.hsl_3]
+        self.color_okhsv_l2 = [True, self.okhsv_1, self.okhsv_2, self.okhsv_3]
         # Display
-        rgb = self.hsl_to_rgb(self.color_hsl_l2[1], self.color_hsl_l2[2], self.color_hsl_l2[3])
+        rgb = self.okhsv_to_rgb(self.color_okhsv_l2[1], self.color_okhsv_l2[2], self.color_okhsv_l2[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hsl_l2.setStyleSheet(color)
+        self.layout.okhsv_l2.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HSL_L2_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKHSV_L2_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hsl_l2 = [False, 0, 0, 0]
+        self.color_okhsv_l2 = [False, 0, 0, 0]
         # Display
-        self.layout.hsl_l2.setStyleSheet(self.bg_alpha)
-        self.layout.hsl_g2.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_l2.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_g2.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hsl_g2 = 0
-        self.mixer_hsl_g2.Update(self.spacer_hsl_g2, self.mixer_width)
+        self.spacer_okhsv_g2 = 0
+        self.mixer_okhsv_g2.Update(self.spacer_okhsv_g2, self.mixer_width)
 
-    def Mixer_HSL_R2_APPLY(self, SIGNAL_APPLY):
-        if self.color_hsl_r2[0] == True:
-            self.Color_APPLY("HSL", self.color_hsl_r2[1], self.color_hsl_r2[2], self.color_hsl_r2[3], 0)
+    def Mixer_OKHSV_R2_APPLY(self, SIGNAL_APPLY):
+        if self.color_okhsv_r2[0] == True:
+            self.Color_HUE("OKHSV", self.color_okhsv_r2[1], self.color_okhsv_r2[2], self.color_okhsv_r2[3], 0)
+            self.Color_APPLY("OKHSV", self.color_okhsv_r2[1], self.color_okhsv_r2[2], self.color_okhsv_r2[3], 0)
             self.Pigment_Release()
-    def Mixer_HSL_R2_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKHSV_R2_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hsl_r2 = [True, self.hsl_1, self.hsl_2, self.hsl_3]
+        self.color_okhsv_r2 = [True, self.okhsv_1, self.okhsv_2, self.okhsv_3]
         # Display
-        rgb = self.hsl_to_rgb(self.color_hsl_r2[1], self.color_hsl_r2[2], self.color_hsl_r2[3])
+        rgb = self.okhsv_to_rgb(self.color_okhsv_r2[1], self.color_okhsv_r2[2], self.color_okhsv_r2[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hsl_r2.setStyleSheet(color)
+        self.layout.okhsv_r2.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HSL_R2_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKHSV_R2_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hsl_r2 = [False, 0, 0, 0]
+        self.color_okhsv_r2 = [False, 0, 0, 0]
         # Display
-        self.layout.hsl_r2.setStyleSheet(self.bg_alpha)
-        self.layout.hsl_g2.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_r2.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_g2.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hsl_g2 = 0
-        self.mixer_hsl_g2.Update(self.spacer_hsl_g2, self.mixer_width)
+        self.spacer_okhsv_g2 = 0
+        self.mixer_okhsv_g2.Update(self.spacer_okhsv_g2, self.mixer_width)
 
-    def Mixer_HSL_L3_APPLY(self, SIGNAL_APPLY):
-        if self.color_hsl_l3[0] == True:
-            self.Color_APPLY("HSL", self.color_hsl_l3[1], self.color_hsl_l3[2], self.color_hsl_l3[3], 0)
+    def Mixer_OKHSV_L3_APPLY(self, SIGNAL_APPLY):
+        if self.color_okhsv_l3[0] == True:
+            self.Color_HUE("OKHSV", self.color_okhsv_l3[1], self.color_okhsv_l3[2], self.color_okhsv_l3[3], 0)
+            self.Color_APPLY("OKHSV", self.color_okhsv_l3[1], self.color_okhsv_l3[2], self.color_okhsv_l3[3], 0)
             self.Pigment_Release()
-    def Mixer_HSL_L3_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKHSV_L3_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hsl_l3 = [True, self.hsl_1, self.hsl_2, self.hsl_3]
+        self.color_okhsv_l3 = [True, self.okhsv_1, self.okhsv_2, self.okhsv_3]
         # Display
-        rgb = self.hsl_to_rgb(self.color_hsl_l3[1], self.color_hsl_l3[2], self.color_hsl_l3[3])
+        rgb = self.okhsv_to_rgb(self.color_okhsv_l3[1], self.color_okhsv_l3[2], self.color_okhsv_l3[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hsl_l3.setStyleSheet(color)
+        self.layout.okhsv_l3.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HSL_L3_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKHSV_L3_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hsl_l3 = [False, 0, 0, 0]
+        self.color_okhsv_l3 = [False, 0, 0, 0]
         # Display
-        self.layout.hsl_l3.setStyleSheet(self.bg_alpha)
-        self.layout.hsl_g3.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_l3.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_g3.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hsl_g3 = 0
-        self.mixer_hsl_g3.Update(self.spacer_hsl_g3, self.mixer_width)
+        self.spacer_okhsv_g3 = 0
+        self.mixer_okhsv_g3.Update(self.spacer_okhsv_g3, self.mixer_width)
 
-    def Mixer_HSL_R3_APPLY(self, SIGNAL_APPLY):
-        if self.color_hsl_r3[0] == True:
-            self.Color_APPLY("HSL", self.color_hsl_r3[1], self.color_hsl_r3[2], self.color_hsl_r3[3], 0)
+    def Mixer_OKHSV_R3_APPLY(self, SIGNAL_APPLY):
+        if self.color_okhsv_r3[0] == True:
+            self.Color_HUE("OKHSV", self.color_okhsv_r3[1], self.color_okhsv_r3[2], self.color_okhsv_r3[3], 0)
+            self.Color_APPLY("OKHSV", self.color_okhsv_r3[1], self.color_okhsv_r3[2], self.color_okhsv_r3[3], 0)
             self.Pigment_Release()
-    def Mixer_HSL_R3_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKHSV_R3_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hsl_r3 = [True, self.hsl_1, self.hsl_2, self.hsl_3]
+        self.color_okhsv_r3 = [True, self.okhsv_1, self.okhsv_2, self.okhsv_3]
         # Display
-        rgb = self.hsl_to_rgb(self.color_hsl_r3[1], self.color_hsl_r3[2], self.color_hsl_r3[3])
+        rgb = self.okhsv_to_rgb(self.color_okhsv_r3[1], self.color_okhsv_r3[2], self.color_okhsv_r3[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hsl_r3.setStyleSheet(color)
+        self.layout.okhsv_r3.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HSL_R3_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKHSV_R3_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hsl_r3 = [False, 0, 0, 0]
+        self.color_okhsv_r3 = [False, 0, 0, 0]
         # Display
-        self.layout.hsl_r3.setStyleSheet(self.bg_alpha)
-        self.layout.hsl_g3.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_r3.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_g3.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hsl_g3 = 0
-        self.mixer_hsl_g3.Update(self.spacer_hsl_g3, self.mixer_width)
-
-    # HCY
-    def Mixer_HCY_L1_APPLY(self, SIGNAL_APPLY):
-        if self.color_hcy_l1[0] == True:
-            self.Color_APPLY("HCY", self.color_hcy_l1[1], self.color_hcy_l1[2], self.color_hcy_l1[3], 0)
+        self.spacer_okhsv_g3 = 0
+        self.mixer_okhsv_g3.Update(self.spacer_okhsv_g3, self.mixer_width)
+
+    # OKHSL
+    def Mixer_OKHSL_L1_APPLY(self, SIGNAL_APPLY):
+        if self.color_okhsl_l1[0] == True:
+            self.Color_HUE("OKHSL", self.color_okhsl_l1[1], self.color_okhsl_l1[2], self.color_okhsl_l1[3], 0)
+            self.Color_APPLY("OKHSL", self.color_okhsl_l1[1], self.color_okhsl_l1[2], self.color_okhsl_l1[3], 0)
             self.Pigment_Release()
-    def Mixer_HCY_L1_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKHSL_L1_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hcy_l1 = [True, self.hcy_1, self.hcy_2, self.hcy_3]
+        self.color_okhsl_l1 = [True, self.okhsl_1, self.okhsl_2, self.okhsl_3]
         # Display
-        rgb = self.hcy_to_rgb(self.color_hcy_l1[1], self.color_hcy_l1[2], self.color_hcy_l1[3])
+        rgb = self.okhsl_to_rgb(self.color_okhsl_l1[1], self.color_okhsl_l1[2], self.color_okhsl_l1[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hcy_l1.setStyleSheet(color)
+        self.layout.okhsl_l1.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HCY_L1_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKHSL_L1_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hcy_l1 = [False, 0, 0, 0]
+        self.color_okhsl_l1 = [False, 0, 0, 0]
         # Display
-        self.layout.hcy_l1.setStyleSheet(self.bg_alpha)
-        self.layout.hcy_g1.setStyleSheet(self.bg_alpha)
+        self.layout.okhsl_l1.setStyleSheet(self.bg_alpha)
+        self.layout.okhsl_g1.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hcy_g1 = 0
-        self.mixer_hcy_g1.Update(self.spacer_hcy_g1, self.mixer_width)
+        self.spacer_okhsl_g1 = 0
+        self.mixer_okhsl_g1.Update(self.spacer_okhsl_g1, self.mixer_width)
 
-    def Mixer_HCY_R1_APPLY(self, SIGNAL_APPLY):
-        if self.color_hcy_r1[0] == True:
-            self.Color_APPLY("HCY", self.color_hcy_r1[1], self.color_hcy_r1[2], self.color_hcy_r1[3], 0)
+    def Mixer_OKHSL_R1_APPLY(self, SIGNAL_APPLY):
+        if self.color_okhsl_r1[0] == True:
+            self.Color_HUE("OKHSL", self.color_okhsl_r1[1], self.color_okhsl_r1[2], self.color_okhsl_r1[3], 0)
+            self.Color_APPLY("OKHSL", self.color_okhsl_r1[1], self.color_okhsl_r1[2], self.color_okhsl_r1[3], 0)
             self.Pigment_Release()
-    def Mixer_HCY_R1_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKHSL_R1_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hcy_r1 = [True, self.hcy_1, self.hcy_2, self.hcy_3]
+        self.color_okhsl_r1 = [True, self.okhsl_1, self.okhsl_2, self.okhsl_3]
         # Display
-        rgb = self.hcy_to_rgb(self.color_hcy_r1[1], self.color_hcy_r1[2], self.color_hcy_r1[3])
+        rgb = self.okhsl_to_rgb(self.color_okhsl_r1[1], self.color_okhsl_r1[2], self.color_okhsl_r1[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hcy_r1.setStyleSheet(color)
+        self.layout.okhsl_r1.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HCY_R1_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKHSL_R1_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hcy_r1 = [False, 0, 0, 0]
-        # Display
-        self.layout.hcy_r1.setStyleSheet(self.bg_alpha)
-        self.layout.hcy_g1.setStyleSheet(self.bg_alpha)
+        self.color_okhsl_r1 = [False, 0, 0, 0]
+        # Display
+        self.layout.okhsl_r1.setStyleSheet(self.bg_alpha)
+        self.layout.okhsl_g1.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hcy_g1 = 0
-        self.mixer_hcy_g1.Update(self.spacer_hcy_g1, self.mixer_width)
+        self.spacer_okhsl_g1 = 0
+        self.mixer_okhsl_g1.Update(self.spacer_okhsl_g1, self.mixer_width)
 
-    def Mixer_HCY_L2_APPLY(self, SIGNAL_APPLY):
-        if self.color_hcy_l2[0] == True:
-            self.Color_APPLY("HCY", self.color_hcy_l2[1], self.color_hcy_l2[2], self.color_hcy_l2[3], 0)
+    def Mixer_OKHSL_L2_APPLY(self, SIGNAL_APPLY):
+        if self.color_okhsl_l2[0] == True:
+            self.Color_HUE("OKHSL", self.color_okhsl_l2[1], self.color_okhsl_l2[2], self.color_okhsl_l2[3], 0)
+            self.Color_APPLY("OKHSL", self.color_okhsl_l2[1], self.color_okhsl_l2[2], self.color_okhsl_l2[3], 0)
             self.Pigment_Release()
-    def Mixer_HCY_L2_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKHSL_L2_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hcy_l2 = [True, self.hcy_1, self.hcy_2, self.hcy_3]
+        self.color_okhsl_l2 = [True, self.okhsl_1, self.okhsl_2, self.okhsl_3]
         # Display
-        rgb = self.hcy_to_rgb(self.color_hcy_l2[1], self.color_hcy_l2[2], self.color_hcy_l2[3])
+        rgb = self.okhsl_to_rgb(self.color_okhsl_l2[1], self.color_okhsl_l2[2], self.color_okhsl_l2[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hcy_l2.setStyleSheet(color)
+        self.layout.okhsl_l2.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HCY_L2_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKHSL_L2_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hcy_l2 = [False, 0, 0, 0]
+        self.color_okhsl_l2 = [False, 0, 0, 0]
         # Display
-        self.layout.hcy_l2.setStyleSheet(self.bg_alpha)
-        self.layout.hcy_g2.setStyleSheet(self.bg_alpha)
+        self.layout.okhsl_l2.setStyleSheet(self.bg_alpha)
+        self.layout.okhsl_g2.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hcy_g2 = 0
-        self.mixer_hcy_g2.Update(self.spacer_hcy_g2, self.mixer_width)
+        self.spacer_okhsl_g2 = 0
+        self.mixer_okhsl_g2.Update(self.spacer_okhsl_g2, self.mixer_width)
 
-    def Mixer_HCY_R2_APPLY(self, SIGNAL_APPLY):
-        if self.color_hcy_r2[0] == True:
-            self.Color_APPLY("HCY", self.color_hcy_r2[1], self.color_hcy_r2[2], self.color_hcy_r2[3], 0)
+    def Mixer_OKHSL_R2_APPLY(self, SIGNAL_APPLY):
+        if self.color_okhsl_r2[0] == True:
+            self.Color_HUE("OKHSL", self.color_okhsl_r2[1], self.color_okhsl_r2[2], self.color_okhsl_r2[3], 0)
+            self.Color_APPLY("OKHSL", self.color_okhsl_r2[1], self.color_okhsl_r2[2], self.color_okhsl_r2[3], 0)
             self.Pigment_Release()
-    def Mixer_HCY_R2_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKHSL_R2_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hcy_r2 = [True, self.hcy_1, self.hcy_2, self.hcy_3]
+        self.color_okhsl_r2 = [True, self.okhsl_1, self.okhsl_2, self.okhsl_3]
         # Display
-        rgb = self.hcy_to_rgb(self.color_hcy_r2[1], self.color_hcy_r2[2], self.color_hcy_r2[3])
+        rgb = self.okhsl_to_rgb(self.color_okhsl_r2[1], self.color_okhsl_r2[2], self.color_okhsl_r2[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hcy_r2.setStyleSheet(color)
+        self.layout.okhsl_r2.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HCY_R2_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKHSL_R2_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hcy_r2 = [False, 0, 0, 0]
+        self.color_okhsl_r2 = [False, 0, 0, 0]
         # Display
-        self.layout.hcy_r2.setStyleSheet(self.bg_alpha)
-        self.layout.hcy_g2.setStyleSheet(self.bg_alpha)
+        self.layout.okhsl_r2.setStyleSheet(self.bg_alpha)
+        self.layout.okhsl_g2.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hcy_g2 = 0
-        self.mixer_hcy_g2.Update(self.spacer_hcy_g2, self.mixer_width)
+        self.spacer_okhsl_g2 = 0
+        self.mixer_okhsl_g2.Update(self.spacer_okhsl_g2, self.mixer_width)
 
-    def Mixer_HCY_L3_APPLY(self, SIGNAL_APPLY):
-        if self.color_hcy_l3[0] == True:
-            self.Color_APPLY("HCY", self.color_hcy_l3[1], self.color_hcy_l3[2], self.color_hcy_l3[3], 0)
+    def Mixer_OKHSL_L3_APPLY(self, SIGNAL_APPLY):
+        if self.color_okhsl_l3[0] == True:
+            self.Color_HUE("OKHSL", self.color_okhsl_l3[1], self.color_okhsl_l3[2], self.color_okhsl_l3[3], 0)
+            self.Color_APPLY("OKHSL", self.color_okhsl_l3[1], self.color_okhsl_l3[2], self.color_okhsl_l3[3], 0)
             self.Pigment_Release()
-    def Mixer_HCY_L3_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKHSL_L3_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hcy_l3 = [True, self.hcy_1, self.hcy_2, self.hcy_3]
+        self.color_okhsl_l3 = [True, self.okhsl_1, self.okhsl_2, self.okhsl_3]
         # Display
-        rgb = self.hcy_to_rgb(self.color_hcy_l3[1], self.color_hcy_l3[2], self.color_hcy_l3[3])
+        rgb = self.okhsl_to_rgb(self.color_okhsl_l3[1], self.color_okhsl_l3[2], self.color_okhsl_l3[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hcy_l3.setStyleSheet(color)
+        self.layout.okhsl_l3.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HCY_L3_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKHSL_L3_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hcy_l3 = [False, 0, 0, 0]
+        self.color_okhsl_l3 = [False, 0, 0, 0]
         # Display
-        self.layout.hcy_l3.setStyleSheet(self.bg_alpha)
-        self.layout.hcy_g3.setStyleSheet(self.bg_alpha)
+        self.layout.okhsl_l3.setStyleSheet(self.bg_alpha)
+        self.layout.okhsl_g3.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hcy_g3 = 0
-        self.mixer_hcy_g3.Update(self.spacer_hcy_g3, self.mixer_width)
+        self.spacer_okhsl_g3 = 0
+        self.mixer_okhsl_g3.Update(self.spacer_okhsl_g3, self.mixer_width)
 
-    def Mixer_HCY_R3_APPLY(self, SIGNAL_APPLY):
-        if self.color_hcy_r3[0] == True:
-            self.Color_APPLY("HCY", self.color_hcy_r3[1], self.color_hcy_r3[2], self.color_hcy_r3[3], 0)
+    def Mixer_OKHSL_R3_APPLY(self, SIGNAL_APPLY):
+        if self.color_okhsl_r3[0] == True:
+            self.Color_HUE("OKHSL", self.color_okhsl_r3[1], self.color_okhsl_r3[2], self.color_okhsl_r3[3], 0)
+            self.Color_APPLY("OKHSL", self.color_okhsl_r3[1], self.color_okhsl_r3[2], self.color_okhsl_r3[3], 0)
             self.Pigment_Release()
-    def Mixer_HCY_R3_SAVE(self, SIGNAL_SAVE):
+    def Mixer_OKHSL_R3_SAVE(self, SIGNAL_SAVE):
         # color
-        self.color_hcy_r3 = [True, self.hcy_1, self.hcy_2, self.hcy_3]
+        self.color_okhsl_r3 = [True, self.okhsl_1, self.okhsl_2, self.okhsl_3]
         # Display
-        rgb = self.hcy_to_rgb(self.color_hcy_r3[1], self.color_hcy_r3[2], self.color_hcy_r3[3])
+        rgb = self.okhsl_to_rgb(self.color_okhsl_r3[1], self.color_okhsl_r3[2], self.color_okhsl_r3[3])
         color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb[0]*255, rgb[1]*255, rgb[2]*255))
-        self.layout.hcy_r3.setStyleSheet(color)
+        self.layout.okhsl_r3.setStyleSheet(color)
         self.Mixer_Display()
-    def Mixer_HCY_R3_CLEAN(self, SIGNAL_CLEAN):
+    def Mixer_OKHSL_R3_CLEAN(self, SIGNAL_CLEAN):
         # Color Math
-        self.color_hcy_r3 = [False, 0, 0, 0]
+        self.color_okhsl_r3 = [False, 0, 0, 0]
         # Display
-        self.layout.hcy_r3.setStyleSheet(self.bg_alpha)
-        self.layout.hcy_g3.setStyleSheet(self.bg_alpha)
+        self.layout.okhsl_r3.setStyleSheet(self.bg_alpha)
+        self.layout.okhsl_g3.setStyleSheet(self.bg_alpha)
         self.Mixer_Display()
         # Correct Values
-        self.spacer_hcy_g3 = 0
-        self.mixer_hcy_g3.Update(self.spacer_hcy_g3, self.mixer_width)
+        self.spacer_okhsl_g3 = 0
+        self.mixer_okhsl_g3.Update(self.spacer_okhsl_g3, self.mixer_width)
 
     # YUV
     def Mixer_YUV_L1_APPLY(self, SIGNAL_APPLY):
@@ -18379,391 +16792,695 @@ class PigmentO_Docker(DockWidget):
         rgb2 = ((self.color_tts[2]) + (self.spacer_shade * (self.color_black[1] - self.color_tts[2])))
         rgb3 = ((self.color_tts[3]) + (self.spacer_shade * (self.color_black[2] - self.color_tts[3])))
         # Send Values
-        self.Color_HUE("RGB", rgb1, rgb2, rgb3, 0)
-        self.Color_APPLY("RGB", rgb1, rgb2, rgb3, 0)
+        self.Color_HUE("RGB", rgb1, rgb2, rgb3, 0)
+        self.Color_APPLY("RGB", rgb1, rgb2, rgb3, 0)
+
+    def Mixer_RGB_G1(self, SIGNAL_MIXER_VALUE):
+        # Percentage Value
+        self.spacer_rgb_g1 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        # Percentual Value added to Left Color Percentil
+        rgb1 = (self.color_rgb_l1[1] + (self.spacer_rgb_g1 * (self.color_rgb_r1[1] - self.color_rgb_l1[1])))
+        rgb2 = (self.color_rgb_l1[2] + (self.spacer_rgb_g1 * (self.color_rgb_r1[2] - self.color_rgb_l1[2])))
+        rgb3 = (self.color_rgb_l1[3] + (self.spacer_rgb_g1 * (self.color_rgb_r1[3] - self.color_rgb_l1[3])))
+        # Send Values
+        self.Color_HUE("RGB", rgb1, rgb2, rgb3, 0)
+        self.Color_APPLY("RGB", rgb1, rgb2, rgb3, 0)
+    def Mixer_RGB_G2(self, SIGNAL_MIXER_VALUE):
+        # Percentage Value
+        self.spacer_rgb_g2 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        # Percentual Value added to Left Color Percentil
+        rgb1 = (self.color_rgb_l2[1] + (self.spacer_rgb_g2 * (self.color_rgb_r2[1] - self.color_rgb_l2[1])))
+        rgb2 = (self.color_rgb_l2[2] + (self.spacer_rgb_g2 * (self.color_rgb_r2[2] - self.color_rgb_l2[2])))
+        rgb3 = (self.color_rgb_l2[3] + (self.spacer_rgb_g2 * (self.color_rgb_r2[3] - self.color_rgb_l2[3])))
+        # Send Values
+        self.Color_HUE("RGB", rgb1, rgb2, rgb3, 0)
+        self.Color_APPLY("RGB", rgb1, rgb2, rgb3, 0)
+    def Mixer_RGB_G3(self, SIGNAL_MIXER_VALUE):
+        # Percentage Value
+        self.spacer_rgb_g3 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        # Percentual Value added to Left Color Percentil
+        rgb1 = (self.color_rgb_l3[1] + (self.spacer_rgb_g3 * (self.color_rgb_r3[1] - self.color_rgb_l3[1])))
+        rgb2 = (self.color_rgb_l3[2] + (self.spacer_rgb_g3 * (self.color_rgb_r3[2] - self.color_rgb_l3[2])))
+        rgb3 = (self.color_rgb_l3[3] + (self.spacer_rgb_g3 * (self.color_rgb_r3[3] - self.color_rgb_l3[3])))
+        # Send Values
+        self.Color_HUE("RGB", rgb1, rgb2, rgb3, 0)
+        self.Color_APPLY("RGB", rgb1, rgb2, rgb3, 0)
+
+    def Mixer_ARD_G1(self, SIGNAL_MIXER_VALUE):
+        # Percentage Value
+        self.spacer_ard_g1 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_ard_l1[1] <= self.color_ard_r1[1]:
+            # Conditions
+            cond1 = self.color_ard_r1[1] - self.color_ard_l1[1]
+            cond2 = (self.color_ard_l1[1] + 1) - self.color_ard_r1[1]
+            if cond1 <= cond2:
+                ang = self.color_ard_l1[1] + (self.spacer_ard_g1 * cond1)
+            else:
+                ang = self.color_ard_l1[1] - (self.spacer_ard_g1 * cond2)
+        else:
+            # Conditions
+            cond1 = self.color_ard_l1[1] - self.color_ard_r1[1]
+            cond2 = (self.color_ard_r1[1] + 1) - self.color_ard_l1[1]
+            if cond1 <= cond2:
+                ang = self.color_ard_l1[1] - (self.spacer_ard_g1 * cond1)
+            else:
+                ang = self.color_ard_l1[1] + (self.spacer_ard_g1 * cond2)
+        # Correct Excess
+        if ang < 0:
+            ang = ang + 1
+        if ang > 1:
+            ang = ang - 1
+        ard1 = ang
+        ard2 = (self.color_ard_l1[2] + (self.spacer_ard_g1 * (self.color_ard_r1[2] - self.color_ard_l1[2])))
+        ard3 = (self.color_ard_l1[3] + (self.spacer_ard_g1 * (self.color_ard_r1[3] - self.color_ard_l1[3])))
+        # Send Values
+        self.Color_APPLY("ARD", ard1, ard2, ard3, 0)
+    def Mixer_ARD_G2(self, SIGNAL_MIXER_VALUE):
+        # Percentage Value
+        self.spacer_ard_g2 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_ard_l2[1] <= self.color_ard_r2[1]:
+            # Conditions
+            cond1 = self.color_ard_r2[1] - self.color_ard_l2[1]
+            cond2 = (self.color_ard_l2[1] + 1) - self.color_ard_r2[1]
+            if cond1 <= cond2:
+                ang = self.color_ard_l2[1] + (self.spacer_ard_g2 * cond1)
+            else:
+                ang = self.color_ard_l2[1] - (self.spacer_ard_g2 * cond2)
+        else:
+            # Conditions
+            cond1 = self.color_ard_l2[1] - self.color_ard_r2[1]
+            cond2 = (self.color_ard_r2[1] + 1) - self.color_ard_l2[1]
+            if cond1 <= cond2:
+                ang = self.color_ard_l2[1] - (self.spacer_ard_g2 * cond1)
+            else:
+                ang = self.color_ard_l2[1] + (self.spacer_ard_g2 * cond2)
+        # Correct Excess
+        if ang < 0:
+            ang = ang + 1
+        if ang > 1:
+            ang = ang - 1
+        ard1 = ang
+        ard2 = (self.color_ard_l2[2] + (self.spacer_ard_g2 * (self.color_ard_r2[2] - self.color_ard_l2[2])))
+        ard3 = (self.color_ard_l2[3] + (self.spacer_ard_g2 * (self.color_ard_r2[3] - self.color_ard_l2[3])))
+        # Send Values
+        self.Color_APPLY("ARD", ard1, ard2, ard3, 0)
+    def Mixer_ARD_G3(self, SIGNAL_MIXER_VALUE):
+        # Percentage Value
+        self.spacer_ard_g3 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_ard_l3[1] <= self.color_ard_r3[1]:
+            # Conditions
+            cond1 = self.color_ard_r3[1] - self.color_ard_l3[1]
+            cond2 = (self.color_ard_l3[1] + 1) - self.color_ard_r3[1]
+            if cond1 <= cond2:
+                ang = self.color_ard_l3[1] + (self.spacer_ard_g3 * cond1)
+            else:
+                ang = self.color_ard_l3[1] - (self.spacer_ard_g3 * cond2)
+        else:
+            # Conditions
+            cond1 = self.color_ard_l3[1] - self.color_ard_r3[1]
+            cond2 = (self.color_ard_r3[1] + 1) - self.color_ard_l3[1]
+            if cond1 <= cond2:
+                ang = self.color_ard_l3[1] - (self.spacer_ard_g3 * cond1)
+            else:
+                ang = self.color_ard_l3[1] + (self.spacer_ard_g3 * cond2)
+        # Correct Excess
+        if ang < 0:
+            ang = ang + 1
+        if ang > 1:
+            ang = ang - 1
+        ard1 = ang
+        ard2 = (self.color_ard_l3[2] + (self.spacer_ard_g3 * (self.color_ard_r3[2] - self.color_ard_l3[2])))
+        ard3 = (self.color_ard_l3[3] + (self.spacer_ard_g3 * (self.color_ard_r3[3] - self.color_ard_l3[3])))
+        # Send Values
+        self.Color_APPLY("ARD", ard1, ard2, ard3, 0)
+
+    def Mixer_HSV_G1(self, SIGNAL_MIXER_VALUE):
+        # Percentage Value
+        self.spacer_hsv_g1 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_hsv_l1[1] <= self.color_hsv_r1[1]:
+            # Conditions
+            cond1 = self.color_hsv_r1[1] - self.color_hsv_l1[1]
+            cond2 = (self.color_hsv_l1[1] + 1) - self.color_hsv_r1[1]
+            if cond1 <= cond2:
+                hue = self.color_hsv_l1[1] + (self.spacer_hsv_g1 * cond1)
+            else:
+                hue = self.color_hsv_l1[1] - (self.spacer_hsv_g1 * cond2)
+        else:
+            # Conditions
+            cond1 = self.color_hsv_l1[1] - self.color_hsv_r1[1]
+            cond2 = (self.color_hsv_r1[1] + 1) - self.color_hsv_l1[1]
+            if cond1 <= cond2:
+                hue = self.color_hsv_l1[1] - (self.spacer_hsv_g1 * cond1)
+            else:
+                hue = self.color_hsv_l1[1] + (self.spacer_hsv_g1 * cond2)
+        # Correct Excess
+        if hue < 0:
+            hue = hue + 1
+        if hue > 1:
+            hue = hue - 1
+        hsv1 = hue
+        hsv2 = (self.color_hsv_l1[2] + (self.spacer_hsv_g1 * (self.color_hsv_r1[2] - self.color_hsv_l1[2])))
+        hsv3 = (self.color_hsv_l1[3] + (self.spacer_hsv_g1 * (self.color_hsv_r1[3] - self.color_hsv_l1[3])))
+        # Send Values
+        self.Color_APPLY("HSV", hsv1, hsv2, hsv3, 0)
+    def Mixer_HSV_G2(self, SIGNAL_MIXER_VALUE):
+        # Percentage Value
+        self.spacer_hsv_g2 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_hsv_l2[1] <= self.color_hsv_r2[1]:
+            # Conditions
+            cond1 = self.color_hsv_r2[1] - self.color_hsv_l2[1]
+            cond2 = (self.color_hsv_l2[1] + 1) - self.color_hsv_r2[1]
+            if cond1 <= cond2:
+                hue = self.color_hsv_l2[1] + (self.spacer_hsv_g2 * cond1)
+            else:
+                hue = self.color_hsv_l2[1] - (self.spacer_hsv_g2 * cond2)
+        else:
+            # Conditions
+            cond1 = self.color_hsv_l2[1] - self.color_hsv_r2[1]
+            cond2 = (self.color_hsv_r2[1] + 1) - self.color_hsv_l2[1]
+            if cond1 <= cond2:
+                hue = self.color_hsv_l2[1] - (self.spacer_hsv_g2 * cond1)
+            else:
+                hue = self.color_hsv_l2[1] + (self.spacer_hsv_g2 * cond2)
+        # Correct Excess
+        if hue < 0:
+            hue = hue + 1
+        if hue > 1:
+            hue = hue - 1
+        hsv1 = hue
+        hsv2 = (self.color_hsv_l2[2] + (self.spacer_hsv_g2 * (self.color_hsv_r2[2] - self.color_hsv_l2[2])))
+        hsv3 = (self.color_hsv_l2[3] + (self.spacer_hsv_g2 * (self.color_hsv_r2[3] - self.color_hsv_l2[3])))
+        # Send Values
+        self.Color_APPLY("HSV", hsv1, hsv2, hsv3, 0)
+    def Mixer_HSV_G3(self, SIGNAL_MIXER_VALUE):
+        # Percentage Value
+        self.spacer_hsv_g3 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_hsv_l3[1] <= self.color_hsv_r3[1]:
+            # Conditions
+            cond1 = self.color_hsv_r3[1] - self.color_hsv_l3[1]
+            cond2 = (self.color_hsv_l3[1] + 1) - self.color_hsv_r3[1]
+            if cond1 <= cond2:
+                hue = self.color_hsv_l3[1] + (self.spacer_hsv_g3 * cond1)
+            else:
+                hue = self.color_hsv_l3[1] - (self.spacer_hsv_g3 * cond2)
+        else:
+            # Conditions
+            cond1 = self.color_hsv_l3[1] - self.color_hsv_r3[1]
+            cond2 = (self.color_hsv_r3[1] + 1) - self.color_hsv_l3[1]
+            if cond1 <= cond2:
+                hue = self.color_hsv_l3[1] - (self.spacer_hsv_g3 * cond1)
+            else:
+                hue = self.color_hsv_l3[1] + (self.spacer_hsv_g3 * cond2)
+        # Correct Excess
+        if hue < 0:
+            hue = hue + 1
+        if hue > 1:
+            hue = hue - 1
+        hsv1 = hue
+        hsv2 = (self.color_hsv_l3[2] + (self.spacer_hsv_g3 * (self.color_hsv_r3[2] - self.color_hsv_l3[2])))
+        hsv3 = (self.color_hsv_l3[3] + (self.spacer_hsv_g3 * (self.color_hsv_r3[3] - self.color_hsv_l3[3])))
+        # Send Values
+        self.Color_APPLY("HSV", hsv1, hsv2, hsv3, 0)
 
-    def Mixer_RGB_G1(self, SIGNAL_MIXER_VALUE):
+    def Mixer_HSL_G1(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_rgb_g1 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        # Percentual Value added to Left Color Percentil
-        rgb1 = (self.color_rgb_l1[1] + (self.spacer_rgb_g1 * (self.color_rgb_r1[1] - self.color_rgb_l1[1])))
-        rgb2 = (self.color_rgb_l1[2] + (self.spacer_rgb_g1 * (self.color_rgb_r1[2] - self.color_rgb_l1[2])))
-        rgb3 = (self.color_rgb_l1[3] + (self.spacer_rgb_g1 * (self.color_rgb_r1[3] - self.color_rgb_l1[3])))
+        self.spacer_hsl_g1 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_hsl_l1[1] <= self.color_hsl_r1[1]:
+            # Conditions
+            cond1 = self.color_hsl_r1[1] - self.color_hsl_l1[1]
+            cond2 = (self.color_hsl_l1[1] + 1) - self.color_hsl_r1[1]
+            if cond1 <= cond2:
+                hue = self.color_hsl_l1[1] + (self.spacer_hsl_g1 * cond1)
+            else:
+                hue = self.color_hsl_l1[1] - (self.spacer_hsl_g1 * cond2)
+        else:
+            # Conditions
+            cond1 = self.color_hsl_l1[1] - self.color_hsl_r1[1]
+            cond2 = (self.color_hsl_r1[1] + 1) - self.color_hsl_l1[1]
+            if cond1 <= cond2:
+                hue = self.color_hsl_l1[1] - (self.spacer_hsl_g1 * cond1)
+            else:
+                hue = self.color_hsl_l1[1] + (self.spacer_hsl_g1 * cond2)
+        # Correct Excess
+        if hue < 0:
+            hue = hue + 1
+        if hue > 1:
+            hue = hue - 1
+        hsl1 = hue
+        hsl2 = (self.color_hsl_l1[2] + (self.spacer_hsl_g1 * (self.color_hsl_r1[2] - self.color_hsl_l1[2])))
+        hsl3 = (self.color_hsl_l1[3] + (self.spacer_hsl_g1 * (self.color_hsl_r1[3] - self.color_hsl_l1[3])))
         # Send Values
-        self.Color_HUE("RGB", rgb1, rgb2, rgb3, 0)
-        self.Color_APPLY("RGB", rgb1, rgb2, rgb3, 0)
-    def Mixer_RGB_G2(self, SIGNAL_MIXER_VALUE):
+        self.Color_APPLY("HSL", hsl1, hsl2, hsl3, 0)
+    def Mixer_HSL_G2(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_rgb_g2 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        # Percentual Value added to Left Color Percentil
-        rgb1 = (self.color_rgb_l2[1] + (self.spacer_rgb_g2 * (self.color_rgb_r2[1] - self.color_rgb_l2[1])))
-        rgb2 = (self.color_rgb_l2[2] + (self.spacer_rgb_g2 * (self.color_rgb_r2[2] - self.color_rgb_l2[2])))
-        rgb3 = (self.color_rgb_l2[3] + (self.spacer_rgb_g2 * (self.color_rgb_r2[3] - self.color_rgb_l2[3])))
+        self.spacer_hsl_g2 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_hsl_l2[1] <= self.color_hsl_r2[1]:
+            # Conditions
+            cond1 = self.color_hsl_r2[1] - self.color_hsl_l2[1]
+            cond2 = (self.color_hsl_l2[1] + 1) - self.color_hsl_r2[1]
+            if cond1 <= cond2:
+                hue = self.color_hsl_l2[1] + (self.spacer_hsl_g2 * cond1)
+            else:
+                hue = self.color_hsl_l2[1] - (self.spacer_hsl_g2 * cond2)
+        else:
+            # Conditions
+            cond1 = self.color_hsl_l2[1] - self.color_hsl_r2[1]
+            cond2 = (self.color_hsl_r2[1] + 1) - self.color_hsl_l2[1]
+            if cond1 <= cond2:
+                hue = self.color_hsl_l2[1] - (self.spacer_hsl_g2 * cond1)
+            else:
+                hue = self.color_hsl_l2[1] + (self.spacer_hsl_g2 * cond2)
+        # Correct Excess
+        if hue < 0:
+            hue = hue + 1
+        if hue > 1:
+            hue = hue - 1
+        hsl1 = hue
+        hsl2 = (self.color_hsl_l2[2] + (self.spacer_hsl_g2 * (self.color_hsl_r2[2] - self.color_hsl_l2[2])))
+        hsl3 = (self.color_hsl_l2[3] + (self.spacer_hsl_g2 * (self.color_hsl_r2[3] - self.color_hsl_l2[3])))
         # Send Values
-        self.Color_HUE("RGB", rgb1, rgb2, rgb3, 0)
-        self.Color_APPLY("RGB", rgb1, rgb2, rgb3, 0)
-    def Mixer_RGB_G3(self, SIGNAL_MIXER_VALUE):
+        self.Color_APPLY("HSL", hsl1, hsl2, hsl3, 0)
+    def Mixer_HSL_G3(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_rgb_g3 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        # Percentual Value added to Left Color Percentil
-        rgb1 = (self.color_rgb_l3[1] + (self.spacer_rgb_g3 * (self.color_rgb_r3[1] - self.color_rgb_l3[1])))
-        rgb2 = (self.color_rgb_l3[2] + (self.spacer_rgb_g3 * (self.color_rgb_r3[2] - self.color_rgb_l3[2])))
-        rgb3 = (self.color_rgb_l3[3] + (self.spacer_rgb_g3 * (self.color_rgb_r3[3] - self.color_rgb_l3[3])))
+        self.spacer_hsl_g3 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_hsl_l3[1] <= self.color_hsl_r3[1]:
+            # Conditions
+            cond1 = self.color_hsl_r3[1] - self.color_hsl_l3[1]
+            cond2 = (self.color_hsl_l3[1] + 1) - self.color_hsl_r3[1]
+            if cond1 <= cond2:
+                hue = self.color_hsl_l3[1] + (self.spacer_hsl_g3 * cond1)
+            else:
+                hue = self.color_hsl_l3[1] - (self.spacer_hsl_g3 * cond2)
+        else:
+            # Conditions
+            cond1 = self.color_hsl_l3[1] - self.color_hsl_r3[1]
+            cond2 = (self.color_hsl_r3[1] + 1) - self.color_hsl_l3[1]
+            if cond1 <= cond2:
+                hue = self.color_hsl_l3[1] - (self.spacer_hsl_g3 * cond1)
+            else:
+                hue = self.color_hsl_l3[1] + (self.spacer_hsl_g3 * cond2)
+        # Correct Excess
+        if hue < 0:
+            hue = hue + 1
+        if hue > 1:
+            hue = hue - 1
+        hsl1 = hue
+        hsl2 = (self.color_hsl_l3[2] + (self.spacer_hsl_g3 * (self.color_hsl_r3[2] - self.color_hsl_l3[2])))
+        hsl3 = (self.color_hsl_l3[3] + (self.spacer_hsl_g3 * (self.color_hsl_r3[3] - self.color_hsl_l3[3])))
         # Send Values
-        self.Color_HUE("RGB", rgb1, rgb2, rgb3, 0)
-        self.Color_APPLY("RGB", rgb1, rgb2, rgb3, 0)
+        self.Color_APPLY("HSL", hsl1, hsl2, hsl3, 0)
 
-    def Mixer_ARD_G1(self, SIGNAL_MIXER_VALUE):
+    def Mixer_HCY_G1(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_ard_g1 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        if self.color_ard_l1[1] <= self.color_ard_r1[1]:
+        self.spacer_hcy_g1 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_hcy_l1[1] <= self.color_hcy_r1[1]:
             # Conditions
-            cond1 = self.color_ard_r1[1] - self.color_ard_l1[1]
-            cond2 = (self.color_ard_l1[1] + 1) - self.color_ard_r1[1]
+            cond1 = self.color_hcy_r1[1] - self.color_hcy_l1[1]
+            cond2 = (self.color_hcy_l1[1] + 1) - self.color_hcy_r1[1]
             if cond1 <= cond2:
-                ang = self.color_ard_l1[1] + (self.spacer_ard_g1 * cond1)
+                hue = self.color_hcy_l1[1] + (self.spacer_hcy_g1 * cond1)
             else:
-                ang = self.color_ard_l1[1] - (self.spacer_ard_g1 * cond2)
+                hue = self.color_hcy_l1[1] - (self.spacer_hcy_g1 * cond2)
         else:
             # Conditions
-            cond1 = self.color_ard_l1[1] - self.color_ard_r1[1]
-            cond2 = (self.color_ard_r1[1] + 1) - self.color_ard_l1[1]
+            cond1 = self.color_hcy_l1[1] - self.color_hcy_r1[1]
+            cond2 = (self.color_hcy_r1[1] + 1) - self.color_hcy_l1[1]
             if cond1 <= cond2:
-                ang = self.color_ard_l1[1] - (self.spacer_ard_g1 * cond1)
+                hue = self.color_hcy_l1[1] - (self.spacer_hcy_g1 * cond1)
             else:
-                ang = self.color_ard_l1[1] + (self.spacer_ard_g1 * cond2)
+                hue = self.color_hcy_l1[1] + (self.spacer_hcy_g1 * cond2)
         # Correct Excess
-        if ang < 0:
-            ang = ang + 1
-        if ang > 1:
-            ang = ang - 1
-        ard1 = ang
-        ard2 = (self.color_ard_l1[2] + (self.spacer_ard_g1 * (self.color_ard_r1[2] - self.color_ard_l1[2])))
-        ard3 = (self.color_ard_l1[3] + (self.spacer_ard_g1 * (self.color_ard_r1[3] - self.color_ard_l1[3])))
+        if hue < 0:
+            hue = hue + 1
+        if hue > 1:
+            hue = hue - 1
+        hcy1 = hue
+        hcy2 = (self.color_hcy_l1[2] + (self.spacer_hcy_g1 * (self.color_hcy_r1[2] - self.color_hcy_l1[2])))
+        hcy3 = (self.color_hcy_l1[3] + (self.spacer_hcy_g1 * (self.color_hcy_r1[3] - self.color_hcy_l1[3])))
         # Send Values
-        self.Color_APPLY("ARD", ard1, ard2, ard3, 0)
-    def Mixer_ARD_G2(self, SIGNAL_MIXER_VALUE):
+        self.Color_APPLY("HCY", hcy1, hcy2, hcy3, 0)
+    def Mixer_HCY_G2(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_ard_g2 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        if self.color_ard_l2[1] <= self.color_ard_r2[1]:
+        self.spacer_hcy_g2 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_hcy_l2[1] <= self.color_hcy_r2[1]:
             # Conditions
-            cond1 = self.color_ard_r2[1] - self.color_ard_l2[1]
-            cond2 = (self.color_ard_l2[1] + 1) - self.color_ard_r2[1]
+            cond1 = self.color_hcy_r2[1] - self.color_hcy_l2[1]
+            cond2 = (self.color_hcy_l2[1] + 1) - self.color_hcy_r2[1]
             if cond1 <= cond2:
-                ang = self.color_ard_l2[1] + (self.spacer_ard_g2 * cond1)
+                hue = self.color_hcy_l2[1] + (self.spacer_hcy_g2 * cond1)
             else:
-                ang = self.color_ard_l2[1] - (self.spacer_ard_g2 * cond2)
+                hue = self.color_hcy_l2[1] - (self.spacer_hcy_g2 * cond2)
         else:
             # Conditions
-            cond1 = self.color_ard_l2[1] - self.color_ard_r2[1]
-            cond2 = (self.color_ard_r2[1] + 1) - self.color_ard_l2[1]
+            cond1 = self.color_hcy_l2[1] - self.color_hcy_r2[1]
+            cond2 = (self.color_hcy_r2[1] + 1) - self.color_hcy_l2[1]
             if cond1 <= cond2:
-                ang = self.color_ard_l2[1] - (self.spacer_ard_g2 * cond1)
+                hue = self.color_hcy_l2[1] - (self.spacer_hcy_g2 * cond1)
             else:
-                ang = self.color_ard_l2[1] + (self.spacer_ard_g2 * cond2)
+                hue = self.color_hcy_l2[1] + (self.spacer_hcy_g2 * cond2)
         # Correct Excess
-        if ang < 0:
-            ang = ang + 1
-        if ang > 1:
-            ang = ang - 1
-        ard1 = ang
-        ard2 = (self.color_ard_l2[2] + (self.spacer_ard_g2 * (self.color_ard_r2[2] - self.color_ard_l2[2])))
-        ard3 = (self.color_ard_l2[3] + (self.spacer_ard_g2 * (self.color_ard_r2[3] - self.color_ard_l2[3])))
+        if hue < 0:
+            hue = hue + 1
+        if hue > 1:
+            hue = hue - 1
+        hcy1 = hue
+        hcy2 = (self.color_hcy_l2[2] + (self.spacer_hcy_g2 * (self.color_hcy_r2[2] - self.color_hcy_l2[2])))
+        hcy3 = (self.color_hcy_l2[3] + (self.spacer_hcy_g2 * (self.color_hcy_r2[3] - self.color_hcy_l2[3])))
         # Send Values
-        self.Color_APPLY("ARD", ard1, ard2, ard3, 0)
-    def Mixer_ARD_G3(self, SIGNAL_MIXER_VALUE):
+        self.Color_APPLY("HCY", hcy1, hcy2, hcy3, 0)
+    def Mixer_HCY_G3(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_ard_g3 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        if self.color_ard_l3[1] <= self.color_ard_r3[1]:
+        self.spacer_hcy_g3 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_hcy_l3[1] <= self.color_hcy_r3[1]:
             # Conditions
-            cond1 = self.color_ard_r3[1] - self.color_ard_l3[1]
-            cond2 = (self.color_ard_l3[1] + 1) - self.color_ard_r3[1]
+            cond1 = self.color_hcy_r3[1] - self.color_hcy_l3[1]
+            cond2 = (self.color_hcy_l3[1] + 1) - self.color_hcy_r3[1]
             if cond1 <= cond2:
-                ang = self.color_ard_l3[1] + (self.spacer_ard_g3 * cond1)
+                hue = self.color_hcy_l3[1] + (self.spacer_hcy_g3 * cond1)
             else:
-                ang = self.color_ard_l3[1] - (self.spacer_ard_g3 * cond2)
+                hue = self.color_hcy_l3[1] - (self.spacer_hcy_g3 * cond2)
         else:
             # Conditions
-            cond1 = self.color_ard_l3[1] - self.color_ard_r3[1]
-            cond2 = (self.color_ard_r3[1] + 1) - self.color_ard_l3[1]
+            cond1 = self.color_hcy_l3[1] - self.color_hcy_r3[1]
+            cond2 = (self.color_hcy_r3[1] + 1) - self.color_hcy_l3[1]
             if cond1 <= cond2:
-                ang = self.color_ard_l3[1] - (self.spacer_ard_g3 * cond1)
+                hue = self.color_hcy_l3[1] - (self.spacer_hcy_g3 * cond1)
             else:
-                ang = self.color_ard_l3[1] + (self.spacer_ard_g3 * cond2)
+                hue = self.color_hcy_l3[1] + (self.spacer_hcy_g3 * cond2)
         # Correct Excess
-        if ang < 0:
-            ang = ang + 1
-        if ang > 1:
-            ang = ang - 1
-        ard1 = ang
-        ard2 = (self.color_ard_l3[2] + (self.spacer_ard_g3 * (self.color_ard_r3[2] - self.color_ard_l3[2])))
-        ard3 = (self.color_ard_l3[3] + (self.spacer_ard_g3 * (self.color_ard_r3[3] - self.color_ard_l3[3])))
+        if hue < 0:
+            hue = hue + 1
+        if hue > 1:
+            hue = hue - 1
+        hcy1 = hue
+        hcy2 = (self.color_hcy_l3[2] + (self.spacer_hcy_g3 * (self.color_hcy_r3[2] - self.color_hcy_l3[2])))
+        hcy3 = (self.color_hcy_l3[3] + (self.spacer_hcy_g3 * (self.color_hcy_r3[3] - self.color_hcy_l3[3])))
         # Send Values
-        self.Color_APPLY("ARD", ard1, ard2, ard3, 0)
+        self.Color_APPLY("HCY", hcy1, hcy2, hcy3, 0)
 
-    def Mixer_HSV_G1(self, SIGNAL_MIXER_VALUE):
+    def Mixer_OKLAB_G1(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_hsv_g1 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        if self.color_hsv_l1[1] <= self.color_hsv_r1[1]:
+        self.spacer_oklab_g1 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        # Percentual Value added to Left Color Percentil
+        oklab1 = (self.color_oklab_l1[1] + (self.spacer_oklab_g1 * (self.color_oklab_r1[1] - self.color_oklab_l1[1])))
+        oklab2 = (self.color_oklab_l1[2] + (self.spacer_oklab_g1 * (self.color_oklab_r1[2] - self.color_oklab_l1[2])))
+        oklab3 = (self.color_oklab_l1[3] + (self.spacer_oklab_g1 * (self.color_oklab_r1[3] - self.color_oklab_l1[3])))
+        # Send Values
+        self.Color_HUE("OKLAB", oklab1, oklab2, oklab3, 0)
+        self.Color_APPLY("OKLAB", oklab1, oklab2, oklab3, 0)
+    def Mixer_OKLAB_G2(self, SIGNAL_MIXER_VALUE):
+        # Percentage Value
+        self.spacer_oklab_g2 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        # Percentual Value added to Left Color Percentil
+        oklab1 = (self.color_oklab_l2[1] + (self.spacer_oklab_g2 * (self.color_oklab_r2[1] - self.color_oklab_l2[1])))
+        oklab2 = (self.color_oklab_l2[2] + (self.spacer_oklab_g2 * (self.color_oklab_r2[2] - self.color_oklab_l2[2])))
+        oklab3 = (self.color_oklab_l2[3] + (self.spacer_oklab_g2 * (self.color_oklab_r2[3] - self.color_oklab_l2[3])))
+        # Send Values
+        self.Color_HUE("OKLAB", oklab1, oklab2, oklab3, 0)
+        self.Color_APPLY("OKLAB", oklab1, oklab2, oklab3, 0)
+    def Mixer_OKLAB_G3(self, SIGNAL_MIXER_VALUE):
+        # Percentage Value
+        self.spacer_oklab_g3 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        # Percentual Value added to Left Color Percentil
+        oklab1 = (self.color_oklab_l3[1] + (self.spacer_oklab_g3 * (self.color_oklab_r3[1] - self.color_oklab_l3[1])))
+        oklab2 = (self.color_oklab_l3[2] + (self.spacer_oklab_g3 * (self.color_oklab_r3[2] - self.color_oklab_l3[2])))
+        oklab3 = (self.color_oklab_l3[3] + (self.spacer_oklab_g3 * (self.color_oklab_r3[3] - self.color_oklab_l3[3])))
+        # Send Values
+        self.Color_HUE("OKLAB", oklab1, oklab2, oklab3, 0)
+        self.Color_APPLY("OKLAB", oklab1, oklab2, oklab3, 0)
+
+    def Mixer_OKLCH_G1(self, SIGNAL_MIXER_VALUE):
+        # Percentage Value
+        self.spacer_oklch_g1 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_oklch_l1[3] <= self.color_oklch_r1[3]:
             # Conditions
-            cond1 = self.color_hsv_r1[1] - self.color_hsv_l1[1]
-            cond2 = (self.color_hsv_l1[1] + 1) - self.color_hsv_r1[1]
+            cond1 = self.color_oklch_r1[3] - self.color_oklch_l1[3]
+            cond2 = (self.color_oklch_l1[3] + 1) - self.color_oklch_r1[3]
             if cond1 <= cond2:
-                hue = self.color_hsv_l1[1] + (self.spacer_hsv_g1 * cond1)
+                hue = self.color_oklch_l1[3] + (self.spacer_oklch_g1 * cond1)
             else:
-                hue = self.color_hsv_l1[1] - (self.spacer_hsv_g1 * cond2)
+                hue = self.color_oklch_l1[3] - (self.spacer_oklch_g1 * cond2)
         else:
             # Conditions
-            cond1 = self.color_hsv_l1[1] - self.color_hsv_r1[1]
-            cond2 = (self.color_hsv_r1[1] + 1) - self.color_hsv_l1[1]
+            cond1 = self.color_oklch_l1[3] - self.color_oklch_r1[3]
+            cond2 = (self.color_oklch_r1[3] + 1) - self.color_oklch_l1[3]
             if cond1 <= cond2:
-                hue = self.color_hsv_l1[1] - (self.spacer_hsv_g1 * cond1)
+                hue = self.color_oklch_l1[3] - (self.spacer_oklch_g1 * cond1)
             else:
-                hue = self.color_hsv_l1[1] + (self.spacer_hsv_g1 * cond2)
+                hue = self.color_oklch_l1[3] + (self.spacer_oklch_g1 * cond2)
         # Correct Excess
         if hue < 0:
             hue = hue + 1
         if hue > 1:
             hue = hue - 1
-        hsv1 = hue
-        hsv2 = (self.color_hsv_l1[2] + (self.spacer_hsv_g1 * (self.color_hsv_r1[2] - self.color_hsv_l1[2])))
-        hsv3 = (self.color_hsv_l1[3] + (self.spacer_hsv_g1 * (self.color_hsv_r1[3] - self.color_hsv_l1[3])))
-        # Send Values
-        self.Color_APPLY("HSV", hsv1, hsv2, hsv3, 0)
-    def Mixer_HSV_G2(self, SIGNAL_MIXER_VALUE):
+        oklch1 = (self.color_oklch_l1[1] + (self.spacer_oklch_g1 * (self.color_oklch_r1[1] - self.color_oklch_l1[1])))
+        oklch2 = (self.color_oklch_l1[2] + (self.spacer_oklch_g1 * (self.color_oklch_r1[2] - self.color_oklch_l1[2])))
+        oklch3 = hue
+        # Send Values
+        self.Color_HUE("OKLCH", oklch1, oklch2, oklch3, 0)
+        self.Color_APPLY("OKLCH", oklch1, oklch2, oklch3, 0)
+    def Mixer_OKLCH_G2(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_hsv_g2 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        if self.color_hsv_l2[1] <= self.color_hsv_r2[1]:
+        self.spacer_oklch_g2 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_oklch_l2[3] <= self.color_oklch_r2[3]:
             # Conditions
-            cond1 = self.color_hsv_r2[1] - self.color_hsv_l2[1]
-            cond2 = (self.color_hsv_l2[1] + 1) - self.color_hsv_r2[1]
+            cond1 = self.color_oklch_r2[3] - self.color_oklch_l2[3]
+            cond2 = (self.color_oklch_l2[3] + 1) - self.color_oklch_r2[3]
             if cond1 <= cond2:
-                hue = self.color_hsv_l2[1] + (self.spacer_hsv_g2 * cond1)
+                hue = self.color_oklch_l2[3] + (self.spacer_oklch_g2 * cond1)
             else:
-                hue = self.color_hsv_l2[1] - (self.spacer_hsv_g2 * cond2)
+                hue = self.color_oklch_l2[3] - (self.spacer_oklch_g2 * cond2)
         else:
             # Conditions
-            cond1 = self.color_hsv_l2[1] - self.color_hsv_r2[1]
-            cond2 = (self.color_hsv_r2[1] + 1) - self.color_hsv_l2[1]
+            cond1 = self.color_oklch_l2[3] - self.color_oklch_r2[3]
+            cond2 = (self.color_oklch_r2[3] + 1) - self.color_oklch_l2[3]
             if cond1 <= cond2:
-                hue = self.color_hsv_l2[1] - (self.spacer_hsv_g2 * cond1)
+                hue = self.color_oklch_l2[3] - (self.spacer_oklch_g2 * cond1)
             else:
-                hue = self.color_hsv_l2[1] + (self.spacer_hsv_g2 * cond2)
+                hue = self.color_oklch_l2[3] + (self.spacer_oklch_g2 * cond2)
         # Correct Excess
         if hue < 0:
             hue = hue + 1
         if hue > 1:
             hue = hue - 1
-        hsv1 = hue
-        hsv2 = (self.color_hsv_l2[2] + (self.spacer_hsv_g2 * (self.color_hsv_r2[2] - self.color_hsv_l2[2])))
-        hsv3 = (self.color_hsv_l2[3] + (self.spacer_hsv_g2 * (self.color_hsv_r2[3] - self.color_hsv_l2[3])))
+        oklch1 = (self.color_oklch_l2[1] + (self.spacer_oklch_g2 * (self.color_oklch_r2[1] - self.color_oklch_l2[1])))
+        oklch2 = (self.color_oklch_l2[2] + (self.spacer_oklch_g2 * (self.color_oklch_r2[2] - self.color_oklch_l2[2])))
+        oklch3 = hue
         # Send Values
-        self.Color_APPLY("HSV", hsv1, hsv2, hsv3, 0)
-    def Mixer_HSV_G3(self, SIGNAL_MIXER_VALUE):
+        self.Color_HUE("OKLCH", oklch1, oklch2, oklch3, 0)
+        self.Color_APPLY("OKLCH", oklch1, oklch2, oklch3, 0)
+    def Mixer_OKLCH_G3(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_hsv_g3 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        if self.color_hsv_l3[1] <= self.color_hsv_r3[1]:
+        self.spacer_oklch_g3 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_oklch_l3[3] <= self.color_oklch_r3[3]:
             # Conditions
-            cond1 = self.color_hsv_r3[1] - self.color_hsv_l3[1]
-            cond2 = (self.color_hsv_l3[1] + 1) - self.color_hsv_r3[1]
+            cond1 = self.color_oklch_r3[3] - self.color_oklch_l3[3]
+            cond2 = (self.color_oklch_l3[3] + 1) - self.color_oklch_r3[3]
             if cond1 <= cond2:
-                hue = self.color_hsv_l3[1] + (self.spacer_hsv_g3 * cond1)
+                hue = self.color_oklch_l3[3] + (self.spacer_oklch_g3 * cond1)
             else:
-                hue = self.color_hsv_l3[1] - (self.spacer_hsv_g3 * cond2)
+                hue = self.color_oklch_l3[3] - (self.spacer_oklch_g3 * cond2)
         else:
             # Conditions
-            cond1 = self.color_hsv_l3[1] - self.color_hsv_r3[1]
-            cond2 = (self.color_hsv_r3[1] + 1) - self.color_hsv_l3[1]
+            cond1 = self.color_oklch_l3[3] - self.color_oklch_r3[3]
+            cond2 = (self.color_oklch_r3[3] + 1) - self.color_oklch_l3[3]
             if cond1 <= cond2:
-                hue = self.color_hsv_l3[1] - (self.spacer_hsv_g3 * cond1)
+                hue = self.color_oklch_l3[3] - (self.spacer_oklch_g3 * cond1)
             else:
-                hue = self.color_hsv_l3[1] + (self.spacer_hsv_g3 * cond2)
+                hue = self.color_oklch_l3[3] + (self.spacer_oklch_g3 * cond2)
         # Correct Excess
         if hue < 0:
             hue = hue + 1
         if hue > 1:
             hue = hue - 1
-        hsv1 = hue
-        hsv2 = (self.color_hsv_l3[2] + (self.spacer_hsv_g3 * (self.color_hsv_r3[2] - self.color_hsv_l3[2])))
-        hsv3 = (self.color_hsv_l3[3] + (self.spacer_hsv_g3 * (self.color_hsv_r3[3] - self.color_hsv_l3[3])))
+        oklch1 = (self.color_oklch_l3[1] + (self.spacer_oklch_g3 * (self.color_oklch_r3[1] - self.color_oklch_l3[1])))
+        oklch2 = (self.color_oklch_l3[2] + (self.spacer_oklch_g3 * (self.color_oklch_r3[2] - self.color_oklch_l3[2])))
+        oklch3 = hue
         # Send Values
-        self.Color_APPLY("HSV", hsv1, hsv2, hsv3, 0)
+        self.Color_HUE("OKLCH", oklch1, oklch2, oklch3, 0)
+        self.Color_APPLY("OKLCH", oklch1, oklch2, oklch3, 0)
 
-    def Mixer_HSL_G1(self, SIGNAL_MIXER_VALUE):
+    def Mixer_OKHSV_G1(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_hsl_g1 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        if self.color_hsl_l1[1] <= self.color_hsl_r1[1]:
+        self.spacer_okhsv_g1 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_okhsv_l1[1] <= self.color_okhsv_r1[1]:
             # Conditions
-            cond1 = self.color_hsl_r1[1] - self.color_hsl_l1[1]
-            cond2 = (self.color_hsl_l1[1] + 1) - self.color_hsl_r1[1]
+            cond1 = self.color_okhsv_r1[1] - self.color_okhsv_l1[1]
+            cond2 = (self.color_okhsv_l1[1] + 1) - self.color_okhsv_r1[1]
             if cond1 <= cond2:
-                hue = self.color_hsl_l1[1] + (self.spacer_hsl_g1 * cond1)
+                hue = self.color_okhsv_l1[1] + (self.spacer_okhsv_g1 * cond1)
             else:
-                hue = self.color_hsl_l1[1] - (self.spacer_hsl_g1 * cond2)
+                hue = self.color_okhsv_l1[1] - (self.spacer_okhsv_g1 * cond2)
         else:
             # Conditions
-            cond1 = self.color_hsl_l1[1] - self.color_hsl_r1[1]
-            cond2 = (self.color_hsl_r1[1] + 1) - self.color_hsl_l1[1]
+            cond1 = self.color_okhsv_l1[1] - self.color_okhsv_r1[1]
+            cond2 = (self.color_okhsv_r1[1] + 1) - self.color_okhsv_l1[1]
             if cond1 <= cond2:
-                hue = self.color_hsl_l1[1] - (self.spacer_hsl_g1 * cond1)
+                hue = self.color_okhsv_l1[1] - (self.spacer_okhsv_g1 * cond1)
             else:
-                hue = self.color_hsl_l1[1] + (self.spacer_hsl_g1 * cond2)
+                hue = self.color_okhsv_l1[1] + (self.spacer_okhsv_g1 * cond2)
         # Correct Excess
         if hue < 0:
             hue = hue + 1
         if hue > 1:
             hue = hue - 1
-        hsl1 = hue
-        hsl2 = (self.color_hsl_l1[2] + (self.spacer_hsl_g1 * (self.color_hsl_r1[2] - self.color_hsl_l1[2])))
-        hsl3 = (self.color_hsl_l1[3] + (self.spacer_hsl_g1 * (self.color_hsl_r1[3] - self.color_hsl_l1[3])))
+        okhsv1 = hue
+        okhsv2 = (self.color_okhsv_l1[2] + (self.spacer_okhsv_g1 * (self.color_okhsv_r1[2] - self.color_okhsv_l1[2])))
+        okhsv3 = (self.color_okhsv_l1[3] + (self.spacer_okhsv_g1 * (self.color_okhsv_r1[3] - self.color_okhsv_l1[3])))
         # Send Values
-        self.Color_APPLY("HSL", hsl1, hsl2, hsl3, 0)
-    def Mixer_HSL_G2(self, SIGNAL_MIXER_VALUE):
+        self.Color_HUE("OKHSV", okhsv1, okhsv2, okhsv3, 0)
+        self.Color_APPLY("OKHSV", okhsv1, okhsv2, okhsv3, 0)
+    def Mixer_OKHSV_G2(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_hsl_g2 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        if self.color_hsl_l2[1] <= self.color_hsl_r2[1]:
+        self.spacer_okhsv_g2 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_okhsv_l2[1] <= self.color_okhsv_r2[1]:
             # Conditions
-            cond1 = self.color_hsl_r2[1] - self.color_hsl_l2[1]
-            cond2 = (self.color_hsl_l2[1] + 1) - self.color_hsl_r2[1]
+            cond1 = self.color_okhsv_r2[1] - self.color_okhsv_l2[1]
+            cond2 = (self.color_okhsv_l2[1] + 1) - self.color_okhsv_r2[1]
             if cond1 <= cond2:
-                hue = self.color_hsl_l2[1] + (self.spacer_hsl_g2 * cond1)
+                hue = self.color_okhsv_l2[1] + (self.spacer_okhsv_g2 * cond1)
             else:
-                hue = self.color_hsl_l2[1] - (self.spacer_hsl_g2 * cond2)
+                hue = self.color_okhsv_l2[1] - (self.spacer_okhsv_g2 * cond2)
         else:
             # Conditions
-            cond1 = self.color_hsl_l2[1] - self.color_hsl_r2[1]
-            cond2 = (self.color_hsl_r2[1] + 1) - self.color_hsl_l2[1]
+            cond1 = self.color_okhsv_l2[1] - self.color_okhsv_r2[1]
+            cond2 = (self.color_okhsv_r2[1] + 1) - self.color_okhsv_l2[1]
             if cond1 <= cond2:
-                hue = self.color_hsl_l2[1] - (self.spacer_hsl_g2 * cond1)
+                hue = self.color_okhsv_l2[1] - (self.spacer_okhsv_g2 * cond1)
             else:
-                hue = self.color_hsl_l2[1] + (self.spacer_hsl_g2 * cond2)
+                hue = self.color_okhsv_l2[1] + (self.spacer_okhsv_g2 * cond2)
         # Correct Excess
         if hue < 0:
             hue = hue + 1
         if hue > 1:
             hue = hue - 1
-        hsl1 = hue
-        hsl2 = (self.color_hsl_l2[2] + (self.spacer_hsl_g2 * (self.color_hsl_r2[2] - self.color_hsl_l2[2])))
-        hsl3 = (self.color_hsl_l2[3] + (self.spacer_hsl_g2 * (self.color_hsl_r2[3] - self.color_hsl_l2[3])))
+        okhsv1 = hue
+        okhsv2 = (self.color_okhsv_l2[2] + (self.spacer_okhsv_g2 * (self.color_okhsv_r2[2] - self.color_okhsv_l2[2])))
+        okhsv3 = (self.color_okhsv_l2[3] + (self.spacer_okhsv_g2 * (self.color_okhsv_r2[3] - self.color_okhsv_l2[3])))
         # Send Values
-        self.Color_APPLY("HSL", hsl1, hsl2, hsl3, 0)
-    def Mixer_HSL_G3(self, SIGNAL_MIXER_VALUE):
+        self.Color_HUE("OKHSV", okhsv1, okhsv2, okhsv3, 0)
+        self.Color_APPLY("OKHSV", okhsv1, okhsv2, okhsv3, 0)
+    def Mixer_OKHSV_G3(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_hsl_g3 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        if self.color_hsl_l3[1] <= self.color_hsl_r3[1]:
+        self.spacer_okhsv_g3 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_okhsv_l3[1] <= self.color_okhsv_r3[1]:
             # Conditions
-            cond1 = self.color_hsl_r3[1] - self.color_hsl_l3[1]
-            cond2 = (self.color_hsl_l3[1] + 1) - self.color_hsl_r3[1]
+            cond1 = self.color_okhsv_r3[1] - self.color_okhsv_l3[1]
+            cond2 = (self.color_okhsv_l3[1] + 1) - self.color_okhsv_r3[1]
             if cond1 <= cond2:
-                hue = self.color_hsl_l3[1] + (self.spacer_hsl_g3 * cond1)
+                hue = self.color_okhsv_l3[1] + (self.spacer_okhsv_g3 * cond1)
             else:
-                hue = self.color_hsl_l3[1] - (self.spacer_hsl_g3 * cond2)
+                hue = self.color_okhsv_l3[1] - (self.spacer_okhsv_g3 * cond2)
         else:
             # Conditions
-            cond1 = self.color_hsl_l3[1] - self.color_hsl_r3[1]
-            cond2 = (self.color_hsl_r3[1] + 1) - self.color_hsl_l3[1]
+            cond1 = self.color_okhsv_l3[1] - self.color_okhsv_r3[1]
+            cond2 = (self.color_okhsv_r3[1] + 1) - self.color_okhsv_l3[1]
             if cond1 <= cond2:
-                hue = self.color_hsl_l3[1] - (self.spacer_hsl_g3 * cond1)
+                hue = self.color_okhsv_l3[1] - (self.spacer_okhsv_g3 * cond1)
             else:
-                hue = self.color_hsl_l3[1] + (self.spacer_hsl_g3 * cond2)
+                hue = self.color_okhsv_l3[1] + (self.spacer_okhsv_g3 * cond2)
         # Correct Excess
         if hue < 0:
             hue = hue + 1
         if hue > 1:
             hue = hue - 1
-        hsl1 = hue
-        hsl2 = (self.color_hsl_l3[2] + (self.spacer_hsl_g3 * (self.color_hsl_r3[2] - self.color_hsl_l3[2])))
-        hsl3 = (self.color_hsl_l3[3] + (self.spacer_hsl_g3 * (self.color_hsl_r3[3] - self.color_hsl_l3[3])))
+        okhsv1 = hue
+        okhsv2 = (self.color_okhsv_l3[2] + (self.spacer_okhsv_g3 * (self.color_okhsv_r3[2] - self.color_okhsv_l3[2])))
+        okhsv3 = (self.color_okhsv_l3[3] + (self.spacer_okhsv_g3 * (self.color_okhsv_r3[3] - self.color_okhsv_l3[3])))
         # Send Values
-        self.Color_APPLY("HSL", hsl1, hsl2, hsl3, 0)
+        self.Color_HUE("OKHSV", okhsv1, okhsv2, okhsv3, 0)
+        self.Color_APPLY("OKHSV", okhsv1, okhsv2, okhsv3, 0)
 
-    def Mixer_HCY_G1(self, SIGNAL_MIXER_VALUE):
+    def Mixer_OKHSL_G1(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_hcy_g1 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        if self.color_hcy_l1[1] <= self.color_hcy_r1[1]:
+        self.spacer_okhsl_g1 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_okhsl_l1[1] <= self.color_okhsl_r1[1]:
             # Conditions
-            cond1 = self.color_hcy_r1[1] - self.color_hcy_l1[1]
-            cond2 = (self.color_hcy_l1[1] + 1) - self.color_hcy_r1[1]
+            cond1 = self.color_okhsl_r1[1] - self.color_okhsl_l1[1]
+            cond2 = (self.color_okhsl_l1[1] + 1) - self.color_okhsl_r1[1]
             if cond1 <= cond2:
-                hue = self.color_hcy_l1[1] + (self.spacer_hcy_g1 * cond1)
+                hue = self.color_okhsl_l1[1] + (self.spacer_okhsl_g1 * cond1)
             else:
-                hue = self.color_hcy_l1[1] - (self.spacer_hcy_g1 * cond2)
+                hue = self.color_okhsl_l1[1] - (self.spacer_okhsl_g1 * cond2)
         else:
             # Conditions
-            cond1 = self.color_hcy_l1[1] - self.color_hcy_r1[1]
-            cond2 = (self.color_hcy_r1[1] + 1) - self.color_hcy_l1[1]
+            cond1 = self.color_okhsl_l1[1] - self.color_okhsl_r1[1]
+            cond2 = (self.color_okhsl_r1[1] + 1) - self.color_okhsl_l1[1]
             if cond1 <= cond2:
-                hue = self.color_hcy_l1[1] - (self.spacer_hcy_g1 * cond1)
+                hue = self.color_okhsl_l1[1] - (self.spacer_okhsl_g1 * cond1)
             else:
-                hue = self.color_hcy_l1[1] + (self.spacer_hcy_g1 * cond2)
+                hue = self.color_okhsl_l1[1] + (self.spacer_okhsl_g1 * cond2)
         # Correct Excess
         if hue < 0:
             hue = hue + 1
         if hue > 1:
             hue = hue - 1
-        hcy1 = hue
-        hcy2 = (self.color_hcy_l1[2] + (self.spacer_hcy_g1 * (self.color_hcy_r1[2] - self.color_hcy_l1[2])))
-        hcy3 = (self.color_hcy_l1[3] + (self.spacer_hcy_g1 * (self.color_hcy_r1[3] - self.color_hcy_l1[3])))
+        okhsl1 = hue
+        okhsl2 = (self.color_okhsl_l1[2] + (self.spacer_okhsl_g1 * (self.color_okhsl_r1[2] - self.color_okhsl_l1[2])))
+        okhsl3 = (self.color_okhsl_l1[3] + (self.spacer_okhsl_g1 * (self.color_okhsl_r1[3] - self.color_okhsl_l1[3])))
         # Send Values
-        self.Color_APPLY("HCY", hcy1, hcy2, hcy3, 0)
-    def Mixer_HCY_G2(self, SIGNAL_MIXER_VALUE):
+        self.Color_HUE("OKHSL", okhsl1, okhsl2, okhsl3, 0)
+        self.Color_APPLY("OKHSL", okhsl1, okhsl2, okhsl3, 0)
+    def Mixer_OKHSL_G2(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_hcy_g2 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        if self.color_hcy_l2[1] <= self.color_hcy_r2[1]:
+        self.spacer_okhsl_g2 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_okhsl_l2[1] <= self.color_okhsl_r2[1]:
             # Conditions
-            cond1 = self.color_hcy_r2[1] - self.color_hcy_l2[1]
-            cond2 = (self.color_hcy_l2[1] + 1) - self.color_hcy_r2[1]
+            cond1 = self.color_okhsl_r2[1] - self.color_okhsl_l2[1]
+            cond2 = (self.color_okhsl_l2[1] + 1) - self.color_okhsl_r2[1]
             if cond1 <= cond2:
-                hue = self.color_hcy_l2[1] + (self.spacer_hcy_g2 * cond1)
+                hue = self.color_okhsl_l2[1] + (self.spacer_okhsl_g2 * cond1)
             else:
-                hue = self.color_hcy_l2[1] - (self.spacer_hcy_g2 * cond2)
+                hue = self.color_okhsl_l2[1] - (self.spacer_okhsl_g2 * cond2)
         else:
             # Conditions
-            cond1 = self.color_hcy_l2[1] - self.color_hcy_r2[1]
-            cond2 = (self.color_hcy_r2[1] + 1) - self.color_hcy_l2[1]
+            cond1 = self.color_okhsl_l2[1] - self.color_okhsl_r2[1]
+            cond2 = (self.color_okhsl_r2[1] + 1) - self.color_okhsl_l2[1]
             if cond1 <= cond2:
-                hue = self.color_hcy_l2[1] - (self.spacer_hcy_g2 * cond1)
+                hue = self.color_okhsl_l2[1] - (self.spacer_okhsl_g2 * cond1)
             else:
-                hue = self.color_hcy_l2[1] + (self.spacer_hcy_g2 * cond2)
+                hue = self.color_okhsl_l2[1] + (self.spacer_okhsl_g2 * cond2)
         # Correct Excess
         if hue < 0:
             hue = hue + 1
         if hue > 1:
             hue = hue - 1
-        hcy1 = hue
-        hcy2 = (self.color_hcy_l2[2] + (self.spacer_hcy_g2 * (self.color_hcy_r2[2] - self.color_hcy_l2[2])))
-        hcy3 = (self.color_hcy_l2[3] + (self.spacer_hcy_g2 * (self.color_hcy_r2[3] - self.color_hcy_l2[3])))
+        okhsl1 = hue
+        okhsl2 = (self.color_okhsl_l2[2] + (self.spacer_okhsl_g2 * (self.color_okhsl_r2[2] - self.color_okhsl_l2[2])))
+        okhsl3 = (self.color_okhsl_l2[3] + (self.spacer_okhsl_g2 * (self.color_okhsl_r2[3] - self.color_okhsl_l2[3])))
         # Send Values
-        self.Color_APPLY("HCY", hcy1, hcy2, hcy3, 0)
-    def Mixer_HCY_G3(self, SIGNAL_MIXER_VALUE):
+        self.Color_HUE("OKHSL", okhsl1, okhsl2, okhsl3, 0)
+        self.Color_APPLY("OKHSL", okhsl1, okhsl2, okhsl3, 0)
+    def Mixer_OKHSL_G3(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
-        self.spacer_hcy_g3 = SIGNAL_MIXER_VALUE / (self.mixer_width)
-        if self.color_hcy_l3[1] <= self.color_hcy_r3[1]:
+        self.spacer_okhsl_g3 = SIGNAL_MIXER_VALUE / (self.mixer_width)
+        if self.color_okhsl_l3[1] <= self.color_okhsl_r3[1]:
             # Conditions
-            cond1 = self.color_hcy_r3[1] - self.color_hcy_l3[1]
-            cond2 = (self.color_hcy_l3[1] + 1) - self.color_hcy_r3[1]
+            cond1 = self.color_okhsl_r3[1] - self.color_okhsl_l3[1]
+            cond2 = (self.color_okhsl_l3[1] + 1) - self.color_okhsl_r3[1]
             if cond1 <= cond2:
-                hue = self.color_hcy_l3[1] + (self.spacer_hcy_g3 * cond1)
+                hue = self.color_okhsl_l3[1] + (self.spacer_okhsl_g3 * cond1)
             else:
-                hue = self.color_hcy_l3[1] - (self.spacer_hcy_g3 * cond2)
+                hue = self.color_okhsl_l3[1] - (self.spacer_okhsl_g3 * cond2)
         else:
             # Conditions
-            cond1 = self.color_hcy_l3[1] - self.color_hcy_r3[1]
-            cond2 = (self.color_hcy_r3[1] + 1) - self.color_hcy_l3[1]
+            cond1 = self.color_okhsl_l3[1] - self.color_okhsl_r3[1]
+            cond2 = (self.color_okhsl_r3[1] + 1) - self.color_okhsl_l3[1]
             if cond1 <= cond2:
-                hue = self.color_hcy_l3[1] - (self.spacer_hcy_g3 * cond1)
+                hue = self.color_okhsl_l3[1] - (self.spacer_okhsl_g3 * cond1)
             else:
-                hue = self.color_hcy_l3[1] + (self.spacer_hcy_g3 * cond2)
+                hue = self.color_okhsl_l3[1] + (self.spacer_okhsl_g3 * cond2)
         # Correct Excess
         if hue < 0:
             hue = hue + 1
         if hue > 1:
             hue = hue - 1
-        hcy1 = hue
-        hcy2 = (self.color_hcy_l3[2] + (self.spacer_hcy_g3 * (self.color_hcy_r3[2] - self.color_hcy_l3[2])))
-        hcy3 = (self.color_hcy_l3[3] + (self.spacer_hcy_g3 * (self.color_hcy_r3[3] - self.color_hcy_l3[3])))
+        okhsl1 = hue
+        okhsl2 = (self.color_okhsl_l3[2] + (self.spacer_okhsl_g3 * (self.color_okhsl_r3[2] - self.color_okhsl_l3[2])))
+        okhsl3 = (self.color_okhsl_l3[3] + (self.spacer_okhsl_g3 * (self.color_okhsl_r3[3] - self.color_okhsl_l3[3])))
         # Send Values
-        self.Color_APPLY("HCY", hcy1, hcy2, hcy3, 0)
+        self.Color_HUE("OKHSL", okhsl1, okhsl2, okhsl3, 0)
+        self.Color_APPLY("OKHSL", okhsl1, okhsl2, okhsl3, 0)
 
     def Mixer_YUV_G1(self, SIGNAL_MIXER_VALUE):
         # Percentage Value
@@ -18983,6 +17700,124 @@ class PigmentO_Docker(DockWidget):
         self.harmony_span = SIGNAL_ACTIVE
 
 
+    #//
+    #\\ SWA ####################################################################
+    def SWA_COTD(self):
+        self.Color_ofthe_Day()
+        if self.swatch_mode == "COTD":
+            self.SWA_Update()
+    def SWA_Mode(self):
+        self.swatch_mode = self.dialog.swa_mode.currentText()
+        self.SWA_Update()
+    def SWA_Update(self):
+        self.SWA_Generate()
+        self.Update_Panel_SWA()
+        self.panel_swa.update()
+    @Profiled
+    def SWA_Generate(self):
+        # Palette of the current mode in RGB (0-1)
+        if self.swatch_mode == "COTD":
+            colors = [self.cotd_1, self.cotd_2, self.cotd_3, self.cotd_4, self.cotd_5]
+        elif self.swatch_mode == "HARMONY":
+            colors = self.SWA_Ramps([har[1:4] for har in (self.har_1, self.har_2, self.har_3, self.har_4, self.har_5)])
+        elif self.swatch_mode == "RAMP":
+            colors = self.SWA_Wheel()
+        elif self.swatch_mode == "GAMUT":
+            colors = self.SWA_Gamut()
+        elif self.swatch_mode == "IMAGE":
+            colors = self.SWA_Ramps(self.img_palette)
+        else:
+            colors = []
+        self.swatch_colors = colors[:swatch_limit]
+        self.swatch_serial += 1
+        self.swatch_dirty = False
+    def SWA_Dirty(self):
+        # Palettes following the color, the harmony or the gamut regenerate on their next display
+        if self.swatch_mode in ("HARMONY", "RAMP", "GAMUT"):
+            self.swatch_dirty = True
+            if self.panel_active == "SWA":
+                self.panel_swa.update()
+    def SWA_Ramps(self, colors):
+        # OKHSL lightness ramp of every color, keeping its hue and saturation inside the gamut
+        if len(colors) == 0:
+            return []
+        steps = max(2, swatch_limit // len(colors))
+        swatches = []
+        for r, g, b in colors:
+            h, s, l = self.rgb_to_okhsl(r, g, b)
+            if max(r, g, b) - min(r, g, b) < ok_gray:
+                s = 0 # Grays stay gray
+            for i in range(steps):
+                swatches.append(self.okhsl_to_rgb(h, s, (i + 0.5) / steps))
+        return swatches
+    def SWA_Wheel(self):
+        # OKHSL hues by lightness from the current color
+        h, s, l = self.rgb_to_okhsl(self.rgb_1, self.rgb_2, self.rgb_3)
+        if s <= 0:
+            s = 1
+        steps = max(2, swatch_limit // swatch_hues)
+        swatches = []
+        for i in range(swatch_hues):
+            hue = (h + i / swatch_hues) % 1
+            for j in range(steps):
+                swatches.append(self.okhsl_to_rgb(hue, s, (j + 0.5) / steps))
+        return swatches
+    def SWA_Gamut(self):
+        # Grid samples inside the Gamut mask at the value of the current color
+        to_rgb = getattr(self, self.gamut_space.lower() + "_to_rgb")
+        value = getattr(self, self.gamut_space.lower() + "_3")
+        swatches = []
+        for hue, radius in self.panel_gam_polygon.Mask_Samples(swatch_limit):
+            hue = self.Math_1D_Loop(hue)
+            if self.wheel == "RYB":
+                hue = self.Math_1D_Loop(self.hryb_to_hcmy(hue))
+            swatches.append(to_rgb(hue, min(radius, 1), value))
+        return swatches
+    def SWA_Apply(self, SIGNAL_APPLY):
+        index = SIGNAL_APPLY[0]
+        if index < len(self.swatch_colors):
+            r, g, b = self.swatch_colors[index]
+            self.Color_HUE("RGB", r, g, b, 0)
+            self.Color_APPLY("RGB", r, g, b, 0)
+            self.Pigment_Release()
+    def SWA_Export(self):
+        # Krita Palette written entry by entry into the archive
+        if len(self.swatch_colors) == 0:
+            return
+        path = QFileDialog.getSaveFileName(self, "Export Palette", os.path.join(QDir.homePath(), "pigment_o.kpl"), "Krita Palette (*.kpl)")[0]
+        if path == "":
+            return
+        name = os.path.splitext(os.path.basename(path))[0]
+        try:
+            with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr(zipfile.ZipInfo("mimetype"), "krita/x-colorset")
+                archive.writestr("profiles.xml", "<Profiles/>\n")
+                with archive.open("colorset.xml", "w") as file:
+                    for line in self.SWA_KPL_Lines(name):
+                        file.write(line.encode("utf-8"))
+        except (OSError, zipfile.BadZipFile):
+            QtCore.qWarning("Pigment.O - Export Error - SWA Palette")
+    def SWA_KPL_Lines(self, name):
+        count = len(self.swatch_colors)
+        rows = -(-count // swatch_columns)
+        yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+        yield '<ColorSet version="2.0" name=%s comment="Pigment.O %s" columns="%i" rows="%i" readonly="false">\n' % (
+            '"' + html.escape(name, quote=True) + '"', self.swatch_mode, swatch_columns, rows)
+        for i in range(count):
+            r, g, b = self.swatch_colors[i]
+            # Palette entries are in sRGB
+            if self.d_cd != "U8":
+                r, g, b = self.lrgb_to_srgb(r, g, b)
+            r = min(max(r, 0), 1)
+            g = min(max(g, 0), 1)
+            b = min(max(b, 0), 1)
+            hex = self.HEX_6string(r, g, b)
+            yield ' <ColorSetEntry name="%s" id="%i" spot="false" bitdepth="U8">\n' % (hex, i)
+            yield '  <RGB space="sRGB-elle-V2-srgbtrc.icc" r="%.6f" g="%.6f" b="%.6f"/>\n' % (r, g, b)
+            yield '  <Position row="%i" column="%i"/>\n' % (i // swatch_columns, i % swatch_columns)
+            yield ' </ColorSetEntry>\n'
+        yield '</ColorSet>\n'
+
     #//
     #\\ DOT ####################################################################
     def DOT_Interpolation(self):
@@ -19584,10 +18419,10 @@ class PigmentO_Docker(DockWidget):
     def IMG_File(self):
         path = QFileDialog.getOpenFileName(self, 'Open', '', 'All Files (*.*)')
         if QImageReader(path[0]).canRead() == True:
-            self.img_state = "SAVE"
-            QImage(path[0]).save(self.img_save)
+            # Decode and back up off the GUI thread, the loader reports the SAVE state
             self.Update_Panel_IMG()
-            self.panel_img.Set_QImage(path[0])
+            self.panel_img.Load_Start(path[0])
+            self.panel_img.Load(path[0], self.panel_img.load_size, self.img_save)
     def IMG_APPLY(self, path):
         self.Update_Panel_IMG()
         if self.img_state == "SAVE":
@@ -19602,24 +18437,29 @@ class PigmentO_Docker(DockWidget):
     #//
     #\\ History ################################################################
     def History_List(self, value1, value2, value3):
-        color = QColor(value1*k_RGB, value2*k_RGB, value3*k_RGB)
-        pixmap = QPixmap(15,30)
-        pixmap.fill(color)
-        item = QListWidgetItem()
-        item.setIcon(QIcon(pixmap))
-        item.setBackground(QBrush(color))
-        self.layout.color_history.insertItem(0, item)
-
-    def History_APPLY(self):
-        current = self.layout.color_history.currentItem()
-        color = current.background().color()
-        red = color.red() / k_RGB
-        green = color.green() / k_RGB
-        blue = color.blue() / k_RGB
+        red = min(max(round(value1 * k_RGB), 0), 255)
+        green = min(max(round(value2 * k_RGB), 0), 255)
+        blue = min(max(round(value3 * k_RGB), 0), 255)
+        self.history_model.Push((red << 16) | (green << 8) | blue)
+    def History_Load(self):
+        # Stored history is only read once the history is shown or saved
+        if self.history_loaded == False:
+            self.history_loaded = True
+            try:
+                self.history_model.Load(str(self.Settings_Read("history")))
+            except:
+                QtCore.qWarning("Pigment.O - Load Error - History")
+
+    def History_APPLY(self, index):
+        rgb = self.history_model.Color(index.row())
+        red = ((rgb >> 16) & 0xFF) / k_RGB
+        green = ((rgb >> 8) & 0xFF) / k_RGB
+        blue = (rgb & 0xFF) / k_RGB
         self.Color_HUE("RGB", red, green, blue, 0)
         self.Color_APPLY("RGB", red, green, blue, 0)
     def History_CLEAR(self):
-        self.layout.color_history.clear()
+        self.history_loaded = True
+        self.history_model.Clear()
 
     #//
     #\\ Key Shortcuts ##########################################################
@@ -19638,28 +18478,112 @@ class PigmentO_Docker(DockWidget):
         if ((self.canvas() is not None) and (self.canvas().view() is not None)):
             doc = Krita.instance().activeDocument()
             node = doc.activeNode()
-            selection = self.selectRGB(node, int(self.rgb_1*k_RGB), int(self.rgb_2*k_RGB), int(self.rgb_3*k_RGB), 255)
-            doc.setSelection(selection)
+            if self.selection_range == True:
+                self.Selection_RANGE(node, self.rgb_1, self.rgb_2, self.rgb_3, 255)
+            else:
+                selection = self.selectRGB(node, self.rgb_1, self.rgb_2, self.rgb_3, 255)
+                if selection is not None:
+                    doc.setSelection(selection)
+    def Selection_RANGE(self, node, red, green, blue, selectionLevel):
+        # Perceptual range around the color, graded by the fuzziness on a worker thread
+        if node.colorModel() != "RGBA":
+            return
+        self.Selection_Cancel()
+        left = node.bounds().left()
+        top = node.bounds().top()
+        width = node.bounds().width()
+        height = node.bounds().height()
+        bands = []
+        for band in range(0, height, selection_band):
+            rows = min(selection_band, height - band)
+            bands.append(node.projectionPixelData(left, top + band, width, rows).data())
+        self.selection_thread = Thread_Range()
+        self.selection_thread.Variables(bands, node.colorDepth(), red, green, blue, self.selection_fuzziness, selectionLevel, [left, top, width, height])
+        self.selection_thread.SIGNAL_RANGE.connect(self.Selection_Range_Done)
+        self.selection_thread.SIGNAL_RANGE_VAL.connect(self.Selection_Range_Value)
+        self.selection_thread.finished.connect(self.Selection_Range_Finished)
+        self.selection_thread.start()
+    def Selection_Range_Value(self, SIGNAL_VALUE):
+        self.layout.label.setText("SELECTION " + str(SIGNAL_VALUE) + " %")
+    def Selection_Range_Done(self, SIGNAL_RANGE):
+        self.layout.label.setText("")
+        if ((self.canvas() is not None) and (self.canvas().view() is not None) and self.layout.selection.isChecked() == True):
+            data, left, top, width, height = SIGNAL_RANGE
+            selection = Selection()
+            selection.setPixelData(QByteArray(data), left, top, width, height)
+            Krita.instance().activeDocument().setSelection(selection)
+    def Selection_Range_Finished(self):
+        # Reference kept until run() returns, a newer thread is still running
+        if (self.selection_thread is not None and self.selection_thread.isFinished() == True):
+            self.selection_thread = None
+    def Selection_Cancel(self):
+        if self.selection_thread is not None:
+            self.selection_thread.requestInterruption()
+            self.selection_thread.wait()
+            self.selection_thread = None
+            self.layout.label.setText("")
 
     def selectRGB(self, node, red, green, blue, selectionLevel):
-        pdata = node.projectionPixelData(node.bounds().left(), node.bounds().top(), node.bounds().width(), node.bounds().height())
-
-        bred = red.to_bytes(1, 'big')
-        bgreen = green.to_bytes(1, 'big')
-        bblue = blue.to_bytes(1, 'big')
-
-        selectionPixels = [0]*(node.bounds().width()*node.bounds().height())
-
-        offset=0
-        for index in range(len(selectionPixels)):
-            if (pdata[offset] == bblue and pdata[offset+1] == bgreen and pdata[offset+2] == bred):
-                selectionPixels[index] = min(selectionLevel, int.from_bytes(pdata[offset+3], 'big'))
-            offset+=4
+        # Exact match of the RGB channels, selected as much as the pixel alpha
+        layout = self.Selection_Layout(node.colorModel(), node.colorDepth(), red, green, blue)
+        if layout is None:
+            return None
+        size, color, alpha = layout
+        left = node.bounds().left()
+        top = node.bounds().top()
+        width = node.bounds().width()
+        height = node.bounds().height()
+        selectionPixels = bytearray(width * height)
+
+        # Bands of rows searched for the color bytes
+        for band in range(0, height, selection_band):
+            rows = min(selection_band, height - band)
+            pdata = node.projectionPixelData(left, top + band, width, rows).data()
+            offset = band * width
+            index = pdata.find(color)
+            while index >= 0:
+                if index % size == 0:
+                    # Run of identical pixels found by galloping over whole blocks
+                    pixel = pdata[index:index + size]
+                    end = index + size
+                    n = 1
+                    grow = True
+                    while n > 0:
+                        if pdata[end:end + size * n] == pixel * n:
+                            end += size * n
+                            if grow == True:
+                                n *= 2
+                        else:
+                            grow = False
+                            n //= 2
+                    start = offset + index // size
+                    count = (end - index) // size
+                    selectionPixels[start:start + count] = bytes([min(selectionLevel, alpha(pdata, index))]) * count
+                    index = pdata.find(color, end)
+                else:
+                    index = pdata.find(color, index + 1)
 
         returned = Selection()
-        returned.setPixelData(QByteArray(bytes(selectionPixels)), node.bounds().left(), node.bounds().top(), node.bounds().width(), node.bounds().height())
+        returned.setPixelData(QByteArray(bytes(selectionPixels)), left, top, width, height)
 
         return returned
+    def Selection_Layout(self, model, depth, red, green, blue):
+        # Pixel size, color channel bytes and alpha reader (0-255) of the RGBA depths
+        if model != "RGBA":
+            return None
+        if depth == "U8": # BGRA
+            color = bytes([round(blue*255), round(green*255), round(red*255)])
+            return 4, color, lambda data, i: data[i+3]
+        if depth == "U16": # BGRA
+            color = struct.pack("<HHH", round(blue*65535), round(green*65535), round(red*65535))
+            return 8, color, lambda data, i: data[i+7]
+        if depth == "F16": # RGBA
+            color = struct.pack("<eee", red, green, blue)
+            return 8, color, lambda data, i: min(max(round(struct.unpack_from("<e", data, i+6)[0]*255), 0), 255)
+        if depth == "F32": # RGBA
+            color = struct.pack("<fff", red, green, blue)
+            return 16, color, lambda data, i: min(max(round(struct.unpack_from("<f", data, i+12)[0]*255), 0), 255)
+        return None
 
     #//
     #\\ Module Signals #########################################################
@@ -19850,6 +18774,42 @@ class PigmentO_Docker(DockWidget):
             self.Color_APPLY("HCY", self.angle_live, self.hcy_2, self.hcy_3, 0)
         self.layout.label.setText("")
 
+    def Signal_OKHSV_4(self, SIGNAL_OKHSV_4_VALUE): # Solo e Hue
+        if SIGNAL_OKHSV_4_VALUE[0] == "H":
+            factor = 100
+            hue = self.okhsv_1 + (SIGNAL_OKHSV_4_VALUE[1]/factor)
+            if hue <= 0:
+                hue += 1
+            if hue >= 1:
+                hue -= 1
+            self.angle_ok = self.okhsv_1 = hue
+            self.Color_HUE("OKHSV", self.angle_ok, self.okhsv_2, self.okhsv_3, 0)
+            self.Color_APPLY("OKHSV", self.angle_ok, self.okhsv_2, self.okhsv_3, 0)
+        if SIGNAL_OKHSV_4_VALUE[0] == "CY":
+            self.okhsv_2 = round(SIGNAL_OKHSV_4_VALUE[2]*k_SVL, 2) / k_SVL
+            self.okhsv_3 = round(SIGNAL_OKHSV_4_VALUE[3]*k_SVL, 2) / k_SVL
+            self.Color_HUE("OKHSV", self.angle_ok, self.okhsv_2, self.okhsv_3, 0)
+            self.Color_APPLY("OKHSV", self.angle_ok, self.okhsv_2, self.okhsv_3, 0)
+        self.layout.label.setText("")
+
+    def Signal_OKHSL_4(self, SIGNAL_OKHSL_4_VALUE): # Solo e Hue
+        if SIGNAL_OKHSL_4_VALUE[0] == "H":
+            factor = 100
+            hue = self.okhsl_1 + (SIGNAL_OKHSL_4_VALUE[1]/factor)
+            if hue <= 0:
+                hue += 1
+            if hue >= 1:
+                hue -= 1
+            self.angle_ok = self.okhsl_1 = hue
+            self.Color_HUE("OKHSL", self.angle_ok, self.okhsl_2, self.okhsl_3, 0)
+            self.Color_APPLY("OKHSL", self.angle_ok, self.okhsl_2, self.okhsl_3, 0)
+        if SIGNAL_OKHSL_4_VALUE[0] == "CY":
+            self.okhsl_2 = round(SIGNAL_OKHSL_4_VALUE[2]*k_SVL, 2) / k_SVL
+            self.okhsl_3 = round(SIGNAL_OKHSL_4_VALUE[3]*k_SVL, 2) / k_SVL
+            self.Color_HUE("OKHSL", self.angle_ok, self.okhsl_2, self.okhsl_3, 0)
+            self.Color_APPLY("OKHSL", self.angle_ok, self.okhsl_2, self.okhsl_3, 0)
+        self.layout.label.setText("")
+
     def Signal_HUE_Circle(self, SIGNAL_HUE_C_VALUE):
         if self.harmony_space == "ARD":
             if self.wheel == "CMY":
@@ -20162,6 +19122,22 @@ class PigmentO_Docker(DockWidget):
         self.layout.scan_progress.setValue(SIGNAL_SCAN_VAL)
     def Pigment_Scan_Maximum(self, SIGNAL_SCAN_MAX):
         self.layout.scan_progress.setMaximum(SIGNAL_SCAN_MAX)
+    def Signal_IMG_Palette(self, SIGNAL_IMG_PALETTE):
+        # Image Swatches
+        self.img_palette = [cor[0:3] for cor in SIGNAL_IMG_PALETTE]
+        if self.swatch_mode == "IMAGE":
+            self.SWA_Update()
+        # Dominant Colors of the Image into the Palette slots
+        for i in range(0, 11):
+            name = "cor_" + str(i).zfill(2)
+            if i < len(SIGNAL_IMG_PALETTE):
+                cor = [True, SIGNAL_IMG_PALETTE[i][0], SIGNAL_IMG_PALETTE[i][1], SIGNAL_IMG_PALETTE[i][2]]
+                color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (cor[1]*255, cor[2]*255, cor[3]*255))
+            else:
+                cor = [False, 0, 0, 0]
+                color = self.bg_alpha
+            setattr(self, name, cor)
+            getattr(self.layout, name).setStyleSheet(color)
 
     def Signal_Panel_Zoom(self, SIGNAL_ZOOM):
         self.zoom = SIGNAL_ZOOM
@@ -20309,6 +19285,34 @@ class PigmentO_Docker(DockWidget):
                 self.Pigment_LCH_2_Minus()
             if self.key_1 == "LCH 3":
                 self.Pigment_LCH_3_Minus()
+            # OKLAB
+            if self.key_1 == "OKLAB 1":
+                self.Pigment_OKLAB_1_Minus()
+            if self.key_1 == "OKLAB 2":
+                self.Pigment_OKLAB_2_Minus()
+            if self.key_1 == "OKLAB 3":
+                self.Pigment_OKLAB_3_Minus()
+            # OKLCH
+            if self.key_1 == "OKLCH 1":
+                self.Pigment_OKLCH_1_Minus()
+            if self.key_1 == "OKLCH 2":
+                self.Pigment_OKLCH_2_Minus()
+            if self.key_1 == "OKLCH 3":
+                self.Pigment_OKLCH_3_Minus()
+            # OKHSV
+            if self.key_1 == "OKHSV 1":
+                self.Pigment_OKHSV_1_Minus()
+            if self.key_1 == "OKHSV 2":
+                self.Pigment_OKHSV_2_Minus()
+            if self.key_1 == "OKHSV 3":
+                self.Pigment_OKHSV_3_Minus()
+            # OKHSL
+            if self.key_1 == "OKHSL 1":
+                self.Pigment_OKHSL_1_Minus()
+            if self.key_1 == "OKHSL 2":
+                self.Pigment_OKHSL_2_Minus()
+            if self.key_1 == "OKHSL 3":
+                self.Pigment_OKHSL_3_Minus()
         if SIGNAL_KEY == "K1 Plus":
             # None
             if self.key_1 == "KEY 1":
@@ -20428,6 +19432,34 @@ class PigmentO_Docker(DockWidget):
                 self.Pigment_LCH_2_Plus()
             if self.key_1 == "LCH 3":
                 self.Pigment_LCH_3_Plus()
+            # OKLAB
+            if self.key_1 == "OKLAB 1":
+                self.Pigment_OKLAB_1_Plus()
+            if self.key_1 == "OKLAB 2":
+                self.Pigment_OKLAB_2_Plus()
+            if self.key_1 == "OKLAB 3":
+                self.Pigment_OKLAB_3_Plus()
+            # OKLCH
+            if self.key_1 == "OKLCH 1":
+                self.Pigment_OKLCH_1_Plus()
+            if self.key_1 == "OKLCH 2":
+                self.Pigment_OKLCH_2_Plus()
+            if self.key_1 == "OKLCH 3":
+                self.Pigment_OKLCH_3_Plus()
+            # OKHSV
+            if self.key_1 == "OKHSV 1":
+                self.Pigment_OKHSV_1_Plus()
+            if self.key_1 == "OKHSV 2":
+                self.Pigment_OKHSV_2_Plus()
+            if self.key_1 == "OKHSV 3":
+                self.Pigment_OKHSV_3_Plus()
+            # OKHSL
+            if self.key_1 == "OKHSL 1":
+                self.Pigment_OKHSL_1_Plus()
+            if self.key_1 == "OKHSL 2":
+                self.Pigment_OKHSL_2_Plus()
+            if self.key_1 == "OKHSL 3":
+                self.Pigment_OKHSL_3_Plus()
 
         if SIGNAL_KEY == "K2 Minus":
             # None
@@ -20548,6 +19580,34 @@ class PigmentO_Docker(DockWidget):
                 self.Pigment_LCH_2_Minus()
             if self.key_2 == "LCH 3":
                 self.Pigment_LCH_3_Minus()
+            # OKLAB
+            if self.key_2 == "OKLAB 1":
+                self.Pigment_OKLAB_1_Minus()
+            if self.key_2 == "OKLAB 2":
+                self.Pigment_OKLAB_2_Minus()
+            if self.key_2 == "OKLAB 3":
+                self.Pigment_OKLAB_3_Minus()
+            # OKLCH
+            if self.key_2 == "OKLCH 1":
+                self.Pigment_OKLCH_1_Minus()
+            if self.key_2 == "OKLCH 2":
+                self.Pigment_OKLCH_2_Minus()
+            if self.key_2 == "OKLCH 3":
+                self.Pigment_OKLCH_3_Minus()
+            # OKHSV
+            if self.key_2 == "OKHSV 1":
+                self.Pigment_OKHSV_1_Minus()
+            if self.key_2 == "OKHSV 2":
+                self.Pigment_OKHSV_2_Minus()
+            if self.key_2 == "OKHSV 3":
+                self.Pigment_OKHSV_3_Minus()
+            # OKHSL
+            if self.key_2 == "OKHSL 1":
+                self.Pigment_OKHSL_1_Minus()
+            if self.key_2 == "OKHSL 2":
+                self.Pigment_OKHSL_2_Minus()
+            if self.key_2 == "OKHSL 3":
+                self.Pigment_OKHSL_3_Minus()
         if SIGNAL_KEY == "K2 Plus":
             # None
             if self.key_2 == "KEY 2":
@@ -20667,6 +19727,34 @@ class PigmentO_Docker(DockWidget):
                 self.Pigment_LCH_2_Plus()
             if self.key_2 == "LCH 3":
                 self.Pigment_LCH_3_Plus()
+            # OKLAB
+            if self.key_2 == "OKLAB 1":
+                self.Pigment_OKLAB_1_Plus()
+            if self.key_2 == "OKLAB 2":
+                self.Pigment_OKLAB_2_Plus()
+            if self.key_2 == "OKLAB 3":
+                self.Pigment_OKLAB_3_Plus()
+            # OKLCH
+            if self.key_2 == "OKLCH 1":
+                self.Pigment_OKLCH_1_Plus()
+            if self.key_2 == "OKLCH 2":
+                self.Pigment_OKLCH_2_Plus()
+            if self.key_2 == "OKLCH 3":
+                self.Pigment_OKLCH_3_Plus()
+            # OKHSV
+            if self.key_2 == "OKHSV 1":
+                self.Pigment_OKHSV_1_Plus()
+            if self.key_2 == "OKHSV 2":
+                self.Pigment_OKHSV_2_Plus()
+            if self.key_2 == "OKHSV 3":
+                self.Pigment_OKHSV_3_Plus()
+            # OKHSL
+            if self.key_2 == "OKHSL 1":
+                self.Pigment_OKHSL_1_Plus()
+            if self.key_2 == "OKHSL 2":
+                self.Pigment_OKHSL_2_Plus()
+            if self.key_2 == "OKHSL 3":
+                self.Pigment_OKHSL_3_Plus()
 
         if SIGNAL_KEY == "K3 Minus":
             # None
@@ -20787,6 +19875,34 @@ class PigmentO_Docker(DockWidget):
                 self.Pigment_LCH_2_Minus()
             if self.key_3 == "LCH 3":
                 self.Pigment_LCH_3_Minus()
+            # OKLAB
+            if self.key_3 == "OKLAB 1":
+                self.Pigment_OKLAB_1_Minus()
+            if self.key_3 == "OKLAB 2":
+                self.Pigment_OKLAB_2_Minus()
+            if self.key_3 == "OKLAB 3":
+                self.Pigment_OKLAB_3_Minus()
+            # OKLCH
+            if self.key_3 == "OKLCH 1":
+                self.Pigment_OKLCH_1_Minus()
+            if self.key_3 == "OKLCH 2":
+                self.Pigment_OKLCH_2_Minus()
+            if self.key_3 == "OKLCH 3":
+                self.Pigment_OKLCH_3_Minus()
+            # OKHSV
+            if self.key_3 == "OKHSV 1":
+                self.Pigment_OKHSV_1_Minus()
+            if self.key_3 == "OKHSV 2":
+                self.Pigment_OKHSV_2_Minus()
+            if self.key_3 == "OKHSV 3":
+                self.Pigment_OKHSV_3_Minus()
+            # OKHSL
+            if self.key_3 == "OKHSL 1":
+                self.Pigment_OKHSL_1_Minus()
+            if self.key_3 == "OKHSL 2":
+                self.Pigment_OKHSL_2_Minus()
+            if self.key_3 == "OKHSL 3":
+                self.Pigment_OKHSL_3_Minus()
         if SIGNAL_KEY == "K3 Plus":
             # None
             if self.key_3 == "KEY 3":
@@ -20906,6 +20022,34 @@ class PigmentO_Docker(DockWidget):
                 self.Pigment_LCH_2_Plus()
             if self.key_3 == "LCH 3":
                 self.Pigment_LCH_3_Plus()
+            # OKLAB
+            if self.key_3 == "OKLAB 1":
+                self.Pigment_OKLAB_1_Plus()
+            if self.key_3 == "OKLAB 2":
+                self.Pigment_OKLAB_2_Plus()
+            if self.key_3 == "OKLAB 3":
+                self.Pigment_OKLAB_3_Plus()
+            # OKLCH
+            if self.key_3 == "OKLCH 1":
+                self.Pigment_OKLCH_1_Plus()
+            if self.key_3 == "OKLCH 2":
+                self.Pigment_OKLCH_2_Plus()
+            if self.key_3 == "OKLCH 3":
+                self.Pigment_OKLCH_3_Plus()
+            # OKHSV
+            if self.key_3 == "OKHSV 1":
+                self.Pigment_OKHSV_1_Plus()
+            if self.key_3 == "OKHSV 2":
+                self.Pigment_OKHSV_2_Plus()
+            if self.key_3 == "OKHSV 3":
+                self.Pigment_OKHSV_3_Plus()
+            # OKHSL
+            if self.key_3 == "OKHSL 1":
+                self.Pigment_OKHSL_1_Plus()
+            if self.key_3 == "OKHSL 2":
+                self.Pigment_OKHSL_2_Plus()
+            if self.key_3 == "OKHSL 3":
+                self.Pigment_OKHSL_3_Plus()
 
         if SIGNAL_KEY == "K4 Minus":
             # None
@@ -21026,6 +20170,34 @@ class PigmentO_Docker(DockWidget):
                 self.Pigment_LCH_2_Minus()
             if self.key_4 == "LCH 3":
                 self.Pigment_LCH_3_Minus()
+            # OKLAB
+            if self.key_4 == "OKLAB 1":
+                self.Pigment_OKLAB_1_Minus()
+            if self.key_4 == "OKLAB 2":
+                self.Pigment_OKLAB_2_Minus()
+            if self.key_4 == "OKLAB 3":
+                self.Pigment_OKLAB_3_Minus()
+            # OKLCH
+            if self.key_4 == "OKLCH 1":
+                self.Pigment_OKLCH_1_Minus()
+            if self.key_4 == "OKLCH 2":
+                self.Pigment_OKLCH_2_Minus()
+            if self.key_4 == "OKLCH 3":
+                self.Pigment_OKLCH_3_Minus()
+            # OKHSV
+            if self.key_4 == "OKHSV 1":
+                self.Pigment_OKHSV_1_Minus()
+            if self.key_4 == "OKHSV 2":
+                self.Pigment_OKHSV_2_Minus()
+            if self.key_4 == "OKHSV 3":
+                self.Pigment_OKHSV_3_Minus()
+            # OKHSL
+            if self.key_4 == "OKHSL 1":
+                self.Pigment_OKHSL_1_Minus()
+            if self.key_4 == "OKHSL 2":
+                self.Pigment_OKHSL_2_Minus()
+            if self.key_4 == "OKHSL 3":
+                self.Pigment_OKHSL_3_Minus()
         if SIGNAL_KEY == "K4 Plus":
             # None
             if self.key_4 == "KEY 4":
@@ -21145,6 +20317,34 @@ class PigmentO_Docker(DockWidget):
                 self.Pigment_LCH_2_Plus()
             if self.key_4 == "LCH 3":
                 self.Pigment_LCH_3_Plus()
+            # OKLAB
+            if self.key_4 == "OKLAB 1":
+                self.Pigment_OKLAB_1_Plus()
+            if self.key_4 == "OKLAB 2":
+                self.Pigment_OKLAB_2_Plus()
+            if self.key_4 == "OKLAB 3":
+                self.Pigment_OKLAB_3_Plus()
+            # OKLCH
+            if self.key_4 == "OKLCH 1":
+                self.Pigment_OKLCH_1_Plus()
+            if self.key_4 == "OKLCH 2":
+                self.Pigment_OKLCH_2_Plus()
+            if self.key_4 == "OKLCH 3":
+                self.Pigment_OKLCH_3_Plus()
+            # OKHSV
+            if self.key_4 == "OKHSV 1":
+                self.Pigment_OKHSV_1_Plus()
+            if self.key_4 == "OKHSV 2":
+                self.Pigment_OKHSV_2_Plus()
+            if self.key_4 == "OKHSV 3":
+                self.Pigment_OKHSV_3_Plus()
+            # OKHSL
+            if self.key_4 == "OKHSL 1":
+                self.Pigment_OKHSL_1_Plus()
+            if self.key_4 == "OKHSL 2":
+                self.Pigment_OKHSL_2_Plus()
+            if self.key_4 == "OKHSL 3":
+                self.Pigment_OKHSL_3_Plus()
     def Signal_Extension_LOK(self, SIGNAL_LOK):
         if SIGNAL_LOK == "CMYK":
             if self.layout.cmyk_4_lock.isChecked():
@@ -21352,7 +20552,205 @@ class PigmentO_Docker(DockWidget):
         s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
         sAA = [r1, r2, r3]
         # Convert to Document Display
-        src = "RGB"
+        src = "RGB"
+        s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
+        s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
+        s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
+        s15 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s15 )
+        s20 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s20 )
+        s25 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s25 )
+        s30 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s30 )
+        s35 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s35 )
+        s40 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s40 )
+        s45 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s45 )
+        s50 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s50 )
+        s55 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s55 )
+        s60 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s60 )
+        s65 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s65 )
+        s70 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s70 )
+        s75 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s75 )
+        s80 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s80 )
+        s85 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s85 )
+        s90 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s90 )
+        s95 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s95 )
+        sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
+        # Return
+        return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
+    def Gradient_CMY(self, left, right):
+        """ Input: 0-1 """
+        # Colors
+        left = [left[0], left[1], left[2]]
+        right = [right[0], right[1], right[2]]
+        # Convert Left
+        l1 = round(left[0],3)
+        l2 = round(left[1],3)
+        l3 = round(left[2],3)
+        # Convert Right
+        r1 = round(right[0],3)
+        r2 = round(right[1],3)
+        r3 = round(right[2],3)
+        # Difference
+        n = 20
+        dr = (r1 - l1) / n
+        dg = (r2 - l2) / n
+        db = (r3 - l3) / n
+        # Output
+        s00 = [l1, l2, l3]
+        s05 = [l1 + (dr * 1), l2 + (dg * 1), l3 + (db * 1)]
+        s10 = [l1 + (dr * 2), l2 + (dg * 2), l3 + (db * 2)]
+        s15 = [l1 + (dr * 3), l2 + (dg * 3), l3 + (db * 3)]
+        s20 = [l1 + (dr * 4), l2 + (dg * 4), l3 + (db * 4)]
+        s25 = [l1 + (dr * 5), l2 + (dg * 5), l3 + (db * 5)]
+        s30 = [l1 + (dr * 6), l2 + (dg * 6), l3 + (db * 6)]
+        s35 = [l1 + (dr * 7), l2 + (dg * 7), l3 + (db * 7)]
+        s40 = [l1 + (dr * 8), l2 + (dg * 8), l3 + (db * 8)]
+        s45 = [l1 + (dr * 9), l2 + (dg * 9), l3 + (db * 9)]
+        s50 = [l1 + (dr * 10), l2 + (dg * 10), l3 + (db * 10)]
+        s55 = [l1 + (dr * 11), l2 + (dg * 11), l3 + (db * 11)]
+        s60 = [l1 + (dr * 12), l2 + (dg * 12), l3 + (db * 12)]
+        s65 = [l1 + (dr * 13), l2 + (dg * 13), l3 + (db * 13)]
+        s70 = [l1 + (dr * 14), l2 + (dg * 14), l3 + (db * 14)]
+        s75 = [l1 + (dr * 15), l2 + (dg * 15), l3 + (db * 15)]
+        s80 = [l1 + (dr * 16), l2 + (dg * 16), l3 + (db * 16)]
+        s85 = [l1 + (dr * 17), l2 + (dg * 17), l3 + (db * 17)]
+        s90 = [l1 + (dr * 18), l2 + (dg * 18), l3 + (db * 18)]
+        s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
+        sAA = [r1, r2, r3]
+        # Convert to Document Display
+        src = "CMY"
+        s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
+        s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
+        s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
+        s15 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s15 )
+        s20 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s20 )
+        s25 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s25 )
+        s30 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s30 )
+        s35 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s35 )
+        s40 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s40 )
+        s45 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s45 )
+        s50 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s50 )
+        s55 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s55 )
+        s60 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s60 )
+        s65 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s65 )
+        s70 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s70 )
+        s75 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s75 )
+        s80 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s80 )
+        s85 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s85 )
+        s90 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s90 )
+        s95 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s95 )
+        sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
+        # Return
+        return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
+    def Gradient_CMYK(self, left, right):
+        """ Input: 0-1 """
+        # Colors
+        left = [left[0], left[1], left[2], left[3]]
+        right = [right[0], right[1], right[2], right[3]]
+        # Convert Left
+        l1 = round(left[0],3)
+        l2 = round(left[1],3)
+        l3 = round(left[2],3)
+        l4 = round(left[3],3)
+        # Convert Right
+        r1 = round(right[0],3)
+        r2 = round(right[1],3)
+        r3 = round(right[2],3)
+        r4 = round(right[3],3)
+        # Difference
+        n = 20
+        dc = (r1 - l1) / n
+        dm = (r2 - l2) / n
+        dy = (r3 - l3) / n
+        dk = (r4 - l4) / n
+        # Output
+        s00 = [l1, l2, l3, l4]
+        s05 = [l1 + (dc * 1), l2 + (dm * 1), l3 + (dy * 1), l4 + (dk * 1)]
+        s10 = [l1 + (dc * 2), l2 + (dm * 2), l3 + (dy * 2), l4 + (dk * 2)]
+        s15 = [l1 + (dc * 3), l2 + (dm * 3), l3 + (dy * 3), l4 + (dk * 3)]
+        s20 = [l1 + (dc * 4), l2 + (dm * 4), l3 + (dy * 4), l4 + (dk * 4)]
+        s25 = [l1 + (dc * 5), l2 + (dm * 5), l3 + (dy * 5), l4 + (dk * 5)]
+        s30 = [l1 + (dc * 6), l2 + (dm * 6), l3 + (dy * 6), l4 + (dk * 6)]
+        s35 = [l1 + (dc * 7), l2 + (dm * 7), l3 + (dy * 7), l4 + (dk * 7)]
+        s40 = [l1 + (dc * 8), l2 + (dm * 8), l3 + (dy * 8), l4 + (dk * 8)]
+        s45 = [l1 + (dc * 9), l2 + (dm * 9), l3 + (dy * 9), l4 + (dk * 9)]
+        s50 = [l1 + (dc * 10), l2 + (dm * 10), l3 + (dy * 10), l4 + (dk * 10)]
+        s55 = [l1 + (dc * 11), l2 + (dm * 11), l3 + (dy * 11), l4 + (dk * 11)]
+        s60 = [l1 + (dc * 12), l2 + (dm * 12), l3 + (dy * 12), l4 + (dk * 12)]
+        s65 = [l1 + (dc * 13), l2 + (dm * 13), l3 + (dy * 13), l4 + (dk * 13)]
+        s70 = [l1 + (dc * 14), l2 + (dm * 14), l3 + (dy * 14), l4 + (dk * 14)]
+        s75 = [l1 + (dc * 15), l2 + (dm * 15), l3 + (dy * 15), l4 + (dk * 15)]
+        s80 = [l1 + (dc * 16), l2 + (dm * 16), l3 + (dy * 16), l4 + (dk * 16)]
+        s85 = [l1 + (dc * 17), l2 + (dm * 17), l3 + (dy * 17), l4 + (dk * 17)]
+        s90 = [l1 + (dc * 18), l2 + (dm * 18), l3 + (dy * 18), l4 + (dk * 18)]
+        s95 = [l1 + (dc * 19), l2 + (dm * 19), l3 + (dy * 19), l4 + (dk * 19)]
+        sAA = [r1, r2, r3, r4]
+        # Convert to Document Display
+        src = "CMYK"
+        s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
+        s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
+        s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
+        s15 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s15 )
+        s20 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s20 )
+        s25 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s25 )
+        s30 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s30 )
+        s35 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s35 )
+        s40 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s40 )
+        s45 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s45 )
+        s50 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s50 )
+        s55 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s55 )
+        s60 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s60 )
+        s65 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s65 )
+        s70 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s70 )
+        s75 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s75 )
+        s80 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s80 )
+        s85 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s85 )
+        s90 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s90 )
+        s95 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s95 )
+        sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
+        # Return
+        return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
+    def Gradient_RYB(self, left, right):
+        """ Input: 0-1 """
+        # Colors
+        left = [left[0], left[1], left[2]]
+        right = [right[0], right[1], right[2]]
+        # Convert Left
+        l1 = round(left[0],3)
+        l2 = round(left[1],3)
+        l3 = round(left[2],3)
+        # Convert Right
+        r1 = round(right[0],3)
+        r2 = round(right[1],3)
+        r3 = round(right[2],3)
+        # Difference
+        n = 20
+        dr = (r1 - l1) / n
+        dg = (r2 - l2) / n
+        db = (r3 - l3) / n
+        # Output
+        s00 = [l1, l2, l3]
+        s05 = [l1 + (dr * 1), l2 + (dg * 1), l3 + (db * 1)]
+        s10 = [l1 + (dr * 2), l2 + (dg * 2), l3 + (db * 2)]
+        s15 = [l1 + (dr * 3), l2 + (dg * 3), l3 + (db * 3)]
+        s20 = [l1 + (dr * 4), l2 + (dg * 4), l3 + (db * 4)]
+        s25 = [l1 + (dr * 5), l2 + (dg * 5), l3 + (db * 5)]
+        s30 = [l1 + (dr * 6), l2 + (dg * 6), l3 + (db * 6)]
+        s35 = [l1 + (dr * 7), l2 + (dg * 7), l3 + (db * 7)]
+        s40 = [l1 + (dr * 8), l2 + (dg * 8), l3 + (db * 8)]
+        s45 = [l1 + (dr * 9), l2 + (dg * 9), l3 + (db * 9)]
+        s50 = [l1 + (dr * 10), l2 + (dg * 10), l3 + (db * 10)]
+        s55 = [l1 + (dr * 11), l2 + (dg * 11), l3 + (db * 11)]
+        s60 = [l1 + (dr * 12), l2 + (dg * 12), l3 + (db * 12)]
+        s65 = [l1 + (dr * 13), l2 + (dg * 13), l3 + (db * 13)]
+        s70 = [l1 + (dr * 14), l2 + (dg * 14), l3 + (db * 14)]
+        s75 = [l1 + (dr * 15), l2 + (dg * 15), l3 + (db * 15)]
+        s80 = [l1 + (dr * 16), l2 + (dg * 16), l3 + (db * 16)]
+        s85 = [l1 + (dr * 17), l2 + (dg * 17), l3 + (db * 17)]
+        s90 = [l1 + (dr * 18), l2 + (dg * 18), l3 + (db * 18)]
+        s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
+        sAA = [r1, r2, r3]
+        # Convert to Document Display
+        src = "RYB"
         s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
         s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
         s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
@@ -21376,7 +20774,7 @@ class PigmentO_Docker(DockWidget):
         sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
         # Return
         return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
-    def Gradient_CMY(self, left, right):
+    def Gradient_YUV(self, left, right):
         """ Input: 0-1 """
         # Colors
         left = [left[0], left[1], left[2]]
@@ -21417,7 +20815,7 @@ class PigmentO_Docker(DockWidget):
         s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
         sAA = [r1, r2, r3]
         # Convert to Document Display
-        src = "CMY"
+        src = "YUV"
         s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
         s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
         s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
@@ -21441,51 +20839,123 @@ class PigmentO_Docker(DockWidget):
         sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
         # Return
         return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
-    def Gradient_CMYK(self, left, right):
+    def Gradient_KKK(self, red, green, blue):
+        # Difference
+        n = 20
+        dk = k_KKKdelta / n
+        # Output
+        s00 = self.kkk_to_rgb(k_KKKmin)
+        s05 = self.kkk_to_rgb(k_KKKmin + dk * 1)
+        s10 = self.kkk_to_rgb(k_KKKmin + dk * 2)
+        s15 = self.kkk_to_rgb(k_KKKmin + dk * 3)
+        s20 = self.kkk_to_rgb(k_KKKmin + dk * 4)
+        s25 = self.kkk_to_rgb(k_KKKmin + dk * 5)
+        s30 = self.kkk_to_rgb(k_KKKmin + dk * 6)
+        s35 = self.kkk_to_rgb(k_KKKmin + dk * 7)
+        s40 = self.kkk_to_rgb(k_KKKmin + dk * 8)
+        s45 = self.kkk_to_rgb(k_KKKmin + dk * 9)
+        s50 = self.kkk_to_rgb(k_KKKmin + dk * 10)
+        s55 = self.kkk_to_rgb(k_KKKmin + dk * 11)
+        s60 = self.kkk_to_rgb(k_KKKmin + dk * 12)
+        s65 = self.kkk_to_rgb(k_KKKmin + dk * 13)
+        s70 = self.kkk_to_rgb(k_KKKmin + dk * 14)
+        s75 = self.kkk_to_rgb(k_KKKmin + dk * 15)
+        s80 = self.kkk_to_rgb(k_KKKmin + dk * 16)
+        s85 = self.kkk_to_rgb(k_KKKmin + dk * 17)
+        s90 = self.kkk_to_rgb(k_KKKmin + dk * 18)
+        s95 = self.kkk_to_rgb(k_KKKmin + dk * 19)
+        sAA = self.kkk_to_rgb(k_KKKmin + dk * 20)
+        # When Lock is active
+        if self.kkk_lock == True:
+            s00 = [s00[0] * self.rgb_1, s00[1] * self.rgb_2, s00[2] * self.rgb_3]
+            s05 = [s05[0] * self.rgb_1, s05[1] * self.rgb_2, s05[2] * self.rgb_3]
+            s10 = [s10[0] * self.rgb_1, s10[1] * self.rgb_2, s10[2] * self.rgb_3]
+            s15 = [s15[0] * self.rgb_1, s15[1] * self.rgb_2, s15[2] * self.rgb_3]
+            s20 = [s20[0] * self.rgb_1, s20[1] * self.rgb_2, s20[2] * self.rgb_3]
+            s25 = [s25[0] * self.rgb_1, s25[1] * self.rgb_2, s25[2] * self.rgb_3]
+            s30 = [s30[0] * self.rgb_1, s30[1] * self.rgb_2, s30[2] * self.rgb_3]
+            s35 = [s35[0] * self.rgb_1, s35[1] * self.rgb_2, s35[2] * self.rgb_3]
+            s40 = [s40[0] * self.rgb_1, s40[1] * self.rgb_2, s40[2] * self.rgb_3]
+            s45 = [s45[0] * self.rgb_1, s45[1] * self.rgb_2, s45[2] * self.rgb_3]
+            s50 = [s50[0] * self.rgb_1, s50[1] * self.rgb_2, s50[2] * self.rgb_3]
+            s55 = [s55[0] * self.rgb_1, s55[1] * self.rgb_2, s55[2] * self.rgb_3]
+            s60 = [s60[0] * self.rgb_1, s60[1] * self.rgb_2, s60[2] * self.rgb_3]
+            s65 = [s65[0] * self.rgb_1, s65[1] * self.rgb_2, s65[2] * self.rgb_3]
+            s70 = [s70[0] * self.rgb_1, s70[1] * self.rgb_2, s70[2] * self.rgb_3]
+            s75 = [s75[0] * self.rgb_1, s75[1] * self.rgb_2, s75[2] * self.rgb_3]
+            s80 = [s80[0] * self.rgb_1, s80[1] * self.rgb_2, s80[2] * self.rgb_3]
+            s85 = [s85[0] * self.rgb_1, s85[1] * self.rgb_2, s85[2] * self.rgb_3]
+            s90 = [s90[0] * self.rgb_1, s90[1] * self.rgb_2, s90[2] * self.rgb_3]
+            s95 = [s95[0] * self.rgb_1, s95[1] * self.rgb_2, s95[2] * self.rgb_3]
+            sAA = [sAA[0] * self.rgb_1, sAA[1] * self.rgb_2, sAA[2] * self.rgb_3]
+        # Convert to Document Display
+        src = "RGB"
+        s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
+        s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
+        s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
+        s15 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s15 )
+        s20 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s20 )
+        s25 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s25 )
+        s30 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s30 )
+        s35 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s35 )
+        s40 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s40 )
+        s45 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s45 )
+        s50 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s50 )
+        s55 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s55 )
+        s60 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s60 )
+        s65 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s65 )
+        s70 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s70 )
+        s75 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s75 )
+        s80 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s80 )
+        s85 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s85 )
+        s90 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s90 )
+        s95 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s95 )
+        sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
+        # Return
+        return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
+
+    def Gradient_ARD(self, left, right):
         """ Input: 0-1 """
         # Colors
-        left = [left[0], left[1], left[2], left[3]]
-        right = [right[0], right[1], right[2], right[3]]
+        left = [left[0], left[1], left[2]]
+        right = [right[0], right[1], right[2]]
         # Convert Left
         l1 = round(left[0],3)
         l2 = round(left[1],3)
         l3 = round(left[2],3)
-        l4 = round(left[3],3)
         # Convert Right
         r1 = round(right[0],3)
         r2 = round(right[1],3)
         r3 = round(right[2],3)
-        r4 = round(right[3],3)
         # Difference
         n = 20
-        dc = (r1 - l1) / n
-        dm = (r2 - l2) / n
-        dy = (r3 - l3) / n
-        dk = (r4 - l4) / n
+        dr = (r1 - l1) / n
+        dg = (r2 - l2) / n
+        db = (r3 - l3) / n
         # Output
-        s00 = [l1, l2, l3, l4]
-        s05 = [l1 + (dc * 1), l2 + (dm * 1), l3 + (dy * 1), l4 + (dk * 1)]
-        s10 = [l1 + (dc * 2), l2 + (dm * 2), l3 + (dy * 2), l4 + (dk * 2)]
-        s15 = [l1 + (dc * 3), l2 + (dm * 3), l3 + (dy * 3), l4 + (dk * 3)]
-        s20 = [l1 + (dc * 4), l2 + (dm * 4), l3 + (dy * 4), l4 + (dk * 4)]
-        s25 = [l1 + (dc * 5), l2 + (dm * 5), l3 + (dy * 5), l4 + (dk * 5)]
-        s30 = [l1 + (dc * 6), l2 + (dm * 6), l3 + (dy * 6), l4 + (dk * 6)]
-        s35 = [l1 + (dc * 7), l2 + (dm * 7), l3 + (dy * 7), l4 + (dk * 7)]
-        s40 = [l1 + (dc * 8), l2 + (dm * 8), l3 + (dy * 8), l4 + (dk * 8)]
-        s45 = [l1 + (dc * 9), l2 + (dm * 9), l3 + (dy * 9), l4 + (dk * 9)]
-        s50 = [l1 + (dc * 10), l2 + (dm * 10), l3 + (dy * 10), l4 + (dk * 10)]
-        s55 = [l1 + (dc * 11), l2 + (dm * 11), l3 + (dy * 11), l4 + (dk * 11)]
-        s60 = [l1 + (dc * 12), l2 + (dm * 12), l3 + (dy * 12), l4 + (dk * 12)]
-        s65 = [l1 + (dc * 13), l2 + (dm * 13), l3 + (dy * 13), l4 + (dk * 13)]
-        s70 = [l1 + (dc * 14), l2 + (dm * 14), l3 + (dy * 14), l4 + (dk * 14)]
-        s75 = [l1 + (dc * 15), l2 + (dm * 15), l3 + (dy * 15), l4 + (dk * 15)]
-        s80 = [l1 + (dc * 16), l2 + (dm * 16), l3 + (dy * 16), l4 + (dk * 16)]
-        s85 = [l1 + (dc * 17), l2 + (dm * 17), l3 + (dy * 17), l4 + (dk * 17)]
-        s90 = [l1 + (dc * 18), l2 + (dm * 18), l3 + (dy * 18), l4 + (dk * 18)]
-        s95 = [l1 + (dc * 19), l2 + (dm * 19), l3 + (dy * 19), l4 + (dk * 19)]
-        sAA = [r1, r2, r3, r4]
+        s00 = [l1, l2, l3]
+        s05 = [l1 + (dr * 1), l2 + (dg * 1), l3 + (db * 1)]
+        s10 = [l1 + (dr * 2), l2 + (dg * 2), l3 + (db * 2)]
+        s15 = [l1 + (dr * 3), l2 + (dg * 3), l3 + (db * 3)]
+        s20 = [l1 + (dr * 4), l2 + (dg * 4), l3 + (db * 4)]
+        s25 = [l1 + (dr * 5), l2 + (dg * 5), l3 + (db * 5)]
+        s30 = [l1 + (dr * 6), l2 + (dg * 6), l3 + (db * 6)]
+        s35 = [l1 + (dr * 7), l2 + (dg * 7), l3 + (db * 7)]
+        s40 = [l1 + (dr * 8), l2 + (dg * 8), l3 + (db * 8)]
+        s45 = [l1 + (dr * 9), l2 + (dg * 9), l3 + (db * 9)]
+        s50 = [l1 + (dr * 10), l2 + (dg * 10), l3 + (db * 10)]
+        s55 = [l1 + (dr * 11), l2 + (dg * 11), l3 + (db * 11)]
+        s60 = [l1 + (dr * 12), l2 + (dg * 12), l3 + (db * 12)]
+        s65 = [l1 + (dr * 13), l2 + (dg * 13), l3 + (db * 13)]
+        s70 = [l1 + (dr * 14), l2 + (dg * 14), l3 + (db * 14)]
+        s75 = [l1 + (dr * 15), l2 + (dg * 15), l3 + (db * 15)]
+        s80 = [l1 + (dr * 16), l2 + (dg * 16), l3 + (db * 16)]
+        s85 = [l1 + (dr * 17), l2 + (dg * 17), l3 + (db * 17)]
+        s90 = [l1 + (dr * 18), l2 + (dg * 18), l3 + (db * 18)]
+        s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
+        sAA = [r1, r2, r3]
         # Convert to Document Display
-        src = "CMYK"
+        src = "ARD"
         s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
         s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
         s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
@@ -21509,7 +20979,7 @@ class PigmentO_Docker(DockWidget):
         sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
         # Return
         return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
-    def Gradient_RYB(self, left, right):
+    def Gradient_HSV(self, left, right):
         """ Input: 0-1 """
         # Colors
         left = [left[0], left[1], left[2]]
@@ -21550,7 +21020,7 @@ class PigmentO_Docker(DockWidget):
         s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
         sAA = [r1, r2, r3]
         # Convert to Document Display
-        src = "RYB"
+        src = "HSV"
         s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
         s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
         s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
@@ -21574,7 +21044,7 @@ class PigmentO_Docker(DockWidget):
         sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
         # Return
         return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
-    def Gradient_YUV(self, left, right):
+    def Gradient_HSL(self, left, right):
         """ Input: 0-1 """
         # Colors
         left = [left[0], left[1], left[2]]
@@ -21615,7 +21085,7 @@ class PigmentO_Docker(DockWidget):
         s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
         sAA = [r1, r2, r3]
         # Convert to Document Display
-        src = "YUV"
+        src = "HSL"
         s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
         s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
         s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
@@ -21639,57 +21109,48 @@ class PigmentO_Docker(DockWidget):
         sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
         # Return
         return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
-    def Gradient_KKK(self, red, green, blue):
+    def Gradient_HCY(self, left, right):
+        """ Input: 0-1 """
+        # Colors
+        left = [left[0], left[1], left[2]]
+        right = [right[0], right[1], right[2]]
+        # Convert Left
+        l1 = round(left[0],3)
+        l2 = round(left[1],3)
+        l3 = round(left[2],3)
+        # Convert Right
+        r1 = round(right[0],3)
+        r2 = round(right[1],3)
+        r3 = round(right[2],3)
         # Difference
         n = 20
-        dk = k_KKKdelta / n
+        dr = (r1 - l1) / n
+        dg = (r2 - l2) / n
+        db = (r3 - l3) / n
         # Output
-        s00 = self.kkk_to_rgb(k_KKKmin)
-        s05 = self.kkk_to_rgb(k_KKKmin + dk * 1)
-        s10 = self.kkk_to_rgb(k_KKKmin + dk * 2)
-        s15 = self.kkk_to_rgb(k_KKKmin + dk * 3)
-        s20 = self.kkk_to_rgb(k_KKKmin + dk * 4)
-        s25 = self.kkk_to_rgb(k_KKKmin + dk * 5)
-        s30 = self.kkk_to_rgb(k_KKKmin + dk * 6)
-        s35 = self.kkk_to_rgb(k_KKKmin + dk * 7)
-        s40 = self.kkk_to_rgb(k_KKKmin + dk * 8)
-        s45 = self.kkk_to_rgb(k_KKKmin + dk * 9)
-        s50 = self.kkk_to_rgb(k_KKKmin + dk * 10)
-        s55 = self.kkk_to_rgb(k_KKKmin + dk * 11)
-        s60 = self.kkk_to_rgb(k_KKKmin + dk * 12)
-        s65 = self.kkk_to_rgb(k_KKKmin + dk * 13)
-        s70 = self.kkk_to_rgb(k_KKKmin + dk * 14)
-        s75 = self.kkk_to_rgb(k_KKKmin + dk * 15)
-        s80 = self.kkk_to_rgb(k_KKKmin + dk * 16)
-        s85 = self.kkk_to_rgb(k_KKKmin + dk * 17)
-        s90 = self.kkk_to_rgb(k_KKKmin + dk * 18)
-        s95 = self.kkk_to_rgb(k_KKKmin + dk * 19)
-        sAA = self.kkk_to_rgb(k_KKKmin + dk * 20)
-        # When Lock is active
-        if self.kkk_lock == True:
-            s00 = [s00[0] * self.rgb_1, s00[1] * self.rgb_2, s00[2] * self.rgb_3]
-            s05 = [s05[0] * self.rgb_1, s05[1] * self.rgb_2, s05[2] * self.rgb_3]
-            s10 = [s10[0] * self.rgb_1, s10[1] * self.rgb_2, s10[2] * self.rgb_3]
-            s15 = [s15[0] * self.rgb_1, s15[1] * self.rgb_2, s15[2] * self.rgb_3]
-            s20 = [s20[0] * self.rgb_1, s20[1] * self.rgb_2, s20[2] * self.rgb_3]
-            s25 = [s25[0] * self.rgb_1, s25[1] * self.rgb_2, s25[2] * self.rgb_3]
-            s30 = [s30[0] * self.rgb_1, s30[1] * self.rgb_2, s30[2] * self.rgb_3]
-            s35 = [s35[0] * self.rgb_1, s35[1] * self.rgb_2, s35[2] * self.rgb_3]
-            s40 = [s40[0] * self.rgb_1, s40[1] * self.rgb_2, s40[2] * self.rgb_3]
-            s45 = [s45[0] * self.rgb_1, s45[1] * self.rgb_2, s45[2] * self.rgb_3]
-            s50 = [s50[0] * self.rgb_1, s50[1] * self.rgb_2, s50[2] * self.rgb_3]
-            s55 = [s55[0] * self.rgb_1, s55[1] * self.rgb_2, s55[2] * self.rgb_3]
-            s60 = [s60[0] * self.rgb_1, s60[1] * self.rgb_2, s60[2] * self.rgb_3]
-            s65 = [s65[0] * self.rgb_1, s65[1] * self.rgb_2, s65[2] * self.rgb_3]
-            s70 = [s70[0] * self.rgb_1, s70[1] * self.rgb_2, s70[2] * self.rgb_3]
-            s75 = [s75[0] * self.rgb_1, s75[1] * self.rgb_2, s75[2] * self.rgb_3]
-            s80 = [s80[0] * self.rgb_1, s80[1] * self.rgb_2, s80[2] * self.rgb_3]
-            s85 = [s85[0] * self.rgb_1, s85[1] * self.rgb_2, s85[2] * self.rgb_3]
-            s90 = [s90[0] * self.rgb_1, s90[1] * self.rgb_2, s90[2] * self.rgb_3]
-            s95 = [s95[0] * self.rgb_1, s95[1] * self.rgb_2, s95[2] * self.rgb_3]
-            sAA = [sAA[0] * self.rgb_1, sAA[1] * self.rgb_2, sAA[2] * self.rgb_3]
+        s00 = [l1, l2, l3]
+        s05 = [l1 + (dr * 1), l2 + (dg * 1), l3 + (db * 1)]
+        s10 = [l1 + (dr * 2), l2 + (dg * 2), l3 + (db * 2)]
+        s15 = [l1 + (dr * 3), l2 + (dg * 3), l3 + (db * 3)]
+        s20 = [l1 + (dr * 4), l2 + (dg * 4), l3 + (db * 4)]
+        s25 = [l1 + (dr * 5), l2 + (dg * 5), l3 + (db * 5)]
+        s30 = [l1 + (dr * 6), l2 + (dg * 6), l3 + (db * 6)]
+        s35 = [l1 + (dr * 7), l2 + (dg * 7), l3 + (db * 7)]
+        s40 = [l1 + (dr * 8), l2 + (dg * 8), l3 + (db * 8)]
+        s45 = [l1 + (dr * 9), l2 + (dg * 9), l3 + (db * 9)]
+        s50 = [l1 + (dr * 10), l2 + (dg * 10), l3 + (db * 10)]
+        s55 = [l1 + (dr * 11), l2 + (dg * 11), l3 + (db * 11)]
+        s60 = [l1 + (dr * 12), l2 + (dg * 12), l3 + (db * 12)]
+        s65 = [l1 + (dr * 13), l2 + (dg * 13), l3 + (db * 13)]
+        s70 = [l1 + (dr * 14), l2 + (dg * 14), l3 + (db * 14)]
+        s75 = [l1 + (dr * 15), l2 + (dg * 15), l3 + (db * 15)]
+        s80 = [l1 + (dr * 16), l2 + (dg * 16), l3 + (db * 16)]
+        s85 = [l1 + (dr * 17), l2 + (dg * 17), l3 + (db * 17)]
+        s90 = [l1 + (dr * 18), l2 + (dg * 18), l3 + (db * 18)]
+        s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
+        sAA = [r1, r2, r3]
         # Convert to Document Display
-        src = "RGB"
+        src = "HCY"
         s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
         s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
         s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
@@ -21714,7 +21175,7 @@ class PigmentO_Docker(DockWidget):
         # Return
         return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
 
-    def Gradient_ARD(self, left, right):
+    def Gradient_XYZ(self, left, right):
         """ Input: 0-1 """
         # Colors
         left = [left[0], left[1], left[2]]
@@ -21755,7 +21216,7 @@ class PigmentO_Docker(DockWidget):
         s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
         sAA = [r1, r2, r3]
         # Convert to Document Display
-        src = "ARD"
+        src = "XYZ"
         s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
         s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
         s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
@@ -21779,7 +21240,7 @@ class PigmentO_Docker(DockWidget):
         sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
         # Return
         return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
-    def Gradient_HSV(self, left, right):
+    def Gradient_XYY(self, left, right):
         """ Input: 0-1 """
         # Colors
         left = [left[0], left[1], left[2]]
@@ -21820,7 +21281,7 @@ class PigmentO_Docker(DockWidget):
         s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
         sAA = [r1, r2, r3]
         # Convert to Document Display
-        src = "HSV"
+        src = "XYY"
         s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
         s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
         s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
@@ -21844,7 +21305,7 @@ class PigmentO_Docker(DockWidget):
         sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
         # Return
         return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
-    def Gradient_HSL(self, left, right):
+    def Gradient_LAB(self, left, right):
         """ Input: 0-1 """
         # Colors
         left = [left[0], left[1], left[2]]
@@ -21885,7 +21346,7 @@ class PigmentO_Docker(DockWidget):
         s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
         sAA = [r1, r2, r3]
         # Convert to Document Display
-        src = "HSL"
+        src = "LAB"
         s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
         s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
         s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
@@ -21909,7 +21370,7 @@ class PigmentO_Docker(DockWidget):
         sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
         # Return
         return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
-    def Gradient_HCY(self, left, right):
+    def Gradient_OKLAB(self, left, right):
         """ Input: 0-1 """
         # Colors
         left = [left[0], left[1], left[2]]
@@ -21950,7 +21411,7 @@ class PigmentO_Docker(DockWidget):
         s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
         sAA = [r1, r2, r3]
         # Convert to Document Display
-        src = "HCY"
+        src = "OKLAB"
         s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
         s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
         s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
@@ -21974,8 +21435,7 @@ class PigmentO_Docker(DockWidget):
         sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
         # Return
         return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
-
-    def Gradient_XYZ(self, left, right):
+    def Gradient_OKLCH(self, left, right):
         """ Input: 0-1 """
         # Colors
         left = [left[0], left[1], left[2]]
@@ -22016,7 +21476,7 @@ class PigmentO_Docker(DockWidget):
         s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
         sAA = [r1, r2, r3]
         # Convert to Document Display
-        src = "XYZ"
+        src = "OKLCH"
         s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
         s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
         s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
@@ -22040,7 +21500,7 @@ class PigmentO_Docker(DockWidget):
         sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
         # Return
         return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
-    def Gradient_XYY(self, left, right):
+    def Gradient_OKHSV(self, left, right):
         """ Input: 0-1 """
         # Colors
         left = [left[0], left[1], left[2]]
@@ -22081,7 +21541,7 @@ class PigmentO_Docker(DockWidget):
         s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
         sAA = [r1, r2, r3]
         # Convert to Document Display
-        src = "XYY"
+        src = "OKHSV"
         s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
         s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
         s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
@@ -22105,7 +21565,7 @@ class PigmentO_Docker(DockWidget):
         sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
         # Return
         return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
-    def Gradient_LAB(self, left, right):
+    def Gradient_OKHSL(self, left, right):
         """ Input: 0-1 """
         # Colors
         left = [left[0], left[1], left[2]]
@@ -22146,7 +21606,7 @@ class PigmentO_Docker(DockWidget):
         s95 = [l1 + (dr * 19), l2 + (dg * 19), l3 + (db * 19)]
         sAA = [r1, r2, r3]
         # Convert to Document Display
-        src = "LAB"
+        src = "OKHSL"
         s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
         s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
         s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
@@ -22393,6 +21853,139 @@ class PigmentO_Docker(DockWidget):
         # Return
         return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
     # Mixer Hue Linear Interpolation
+    def Gradient_Mix_OKLCH(self, left, right):
+        """ Input: 0-1 """
+        # Colors
+        left = [left[2], left[1], left[0]]
+        right = [right[2], right[1], right[0]]
+        # Difference
+        n = 20
+        d = 1 / n
+        # Interpolation
+        s00 = self.oklch_channels_to_rgb(left[2], left[1], left[0])
+        s05 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 1, left, right)[::-1])
+        s10 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 2, left, right)[::-1])
+        s15 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 3, left, right)[::-1])
+        s20 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 4, left, right)[::-1])
+        s25 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 5, left, right)[::-1])
+        s30 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 6, left, right)[::-1])
+        s35 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 7, left, right)[::-1])
+        s40 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 8, left, right)[::-1])
+        s45 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 9, left, right)[::-1])
+        s50 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 10, left, right)[::-1])
+        s55 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 11, left, right)[::-1])
+        s60 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 12, left, right)[::-1])
+        s65 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 13, left, right)[::-1])
+        s70 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 14, left, right)[::-1])
+        s75 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 15, left, right)[::-1])
+        s80 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 16, left, right)[::-1])
+        s85 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 17, left, right)[::-1])
+        s90 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 18, left, right)[::-1])
+        s95 = self.oklch_channels_to_rgb(*self.Mixer_Hue_Linear_Interpolation(d * 19, left, right)[::-1])
+        sAA = self.oklch_channels_to_rgb(right[2], right[1], right[0])
+        # Convert to Document Display
+        src = "RGB"
+        s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
+        s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
+        s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
+        s15 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s15 )
+        s20 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s20 )
+        s25 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s25 )
+        s30 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s30 )
+        s35 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s35 )
+        s40 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s40 )
+        s45 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s45 )
+        s50 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s50 )
+        s55 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s55 )
+        s60 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s60 )
+        s65 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s65 )
+        s70 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s70 )
+        s75 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s75 )
+        s80 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s80 )
+        s85 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s85 )
+        s90 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s90 )
+        s95 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s95 )
+        sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
+        # Return
+        return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
+    def Gradient_Mix_OKHSV(self, left, right):
+        """ Input: 0-1 """
+        # Colors
+        left = [left[0], left[1], left[2]]
+        right = [right[0], right[1], right[2]]
+        # Difference
+        n = 20
+        d = 1 / n
+        # Interpolation
+        samples = [left]
+        for i in range(1, n):
+            samples.append(self.Mixer_Hue_Linear_Interpolation(d * i, left, right))
+        samples.append(right)
+        s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA = self.okhsv_to_rgb_batch(samples)
+        # Convert to Document Display
+        src = "RGB"
+        s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
+        s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
+        s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
+        s15 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s15 )
+        s20 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s20 )
+        s25 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s25 )
+        s30 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s30 )
+        s35 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s35 )
+        s40 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s40 )
+        s45 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s45 )
+        s50 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s50 )
+        s55 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s55 )
+        s60 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s60 )
+        s65 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s65 )
+        s70 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s70 )
+        s75 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s75 )
+        s80 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s80 )
+        s85 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s85 )
+        s90 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s90 )
+        s95 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s95 )
+        sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
+        # Return
+        return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
+    def Gradient_Mix_OKHSL(self, left, right):
+        """ Input: 0-1 """
+        # Colors
+        left = [left[0], left[1], left[2]]
+        right = [right[0], right[1], right[2]]
+        # Difference
+        n = 20
+        d = 1 / n
+        # Interpolation
+        samples = [left]
+        for i in range(1, n):
+            samples.append(self.Mixer_Hue_Linear_Interpolation(d * i, left, right))
+        samples.append(right)
+        s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA = self.okhsl_to_rgb_batch(samples)
+        # Convert to Document Display
+        src = "RGB"
+        s00 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s00 )
+        s05 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s05 )
+        s10 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s10 )
+        s15 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s15 )
+        s20 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s20 )
+        s25 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s25 )
+        s30 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s30 )
+        s35 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s35 )
+        s40 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s40 )
+        s45 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s45 )
+        s50 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s50 )
+        s55 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s55 )
+        s60 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s60 )
+        s65 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s65 )
+        s70 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s70 )
+        s75 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s75 )
+        s80 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s80 )
+        s85 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s85 )
+        s90 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s90 )
+        s95 = self.convert(self.d_cm, self.d_cd, self.d_cp, src, s95 )
+        sAA = self.convert(self.d_cm, self.d_cd, self.d_cp, src, sAA )
+        # Return
+        return [s00, s05, s10, s15, s20, s25, s30, s35, s40, s45, s50, s55, s60, s65, s70, s75, s80, s85, s90, s95, sAA]
     def Mixer_Hue_Linear_Interpolation(self, factor, left, right):
         """ Input: 0-1 """
         # Colors
@@ -22547,8 +22140,8 @@ class PigmentO_Docker(DockWidget):
         # Start Asking Krita the Current Color
         if check_timer >= 1:
             self.timer.start()
-        # Save Settings
-        self.Default_Save()
+        # Save Settings once the docker settles
+        self.settings_timer.start()
     def resizeEvent(self, event):
         # Maintian Ratio
         self.Ratio()
@@ -22557,6 +22150,11 @@ class PigmentO_Docker(DockWidget):
         if check_timer >= 1:
             self.timer.stop()
         # Save Settings
+        self.settings_timer.stop()
+        self.Default_Save()
+    def Settings_Quit(self):
+        # Changes still waiting on the timer are written before Krita exits
+        self.settings_timer.stop()
         self.Default_Save()
 
     # Paint Events
@@ -22584,6 +22182,15 @@ class PigmentO_Docker(DockWidget):
     #//
     #\\ Settings ###############################################################
     def Version_Settings(self):
+        self.settings_timer = QtCore.QTimer(self)
+        self.settings_timer.setSingleShot(True)
+        self.settings_timer.setInterval(settings_delay)
+        self.settings_timer.timeout.connect(self.Default_Save)
+        # Krita does not always send the dockers a closeEvent when it quits
+        notifier = Krita.instance().notifier()
+        notifier.setActive(True)
+        notifier.applicationClosing.connect(self.Settings_Quit)
+        self.Settings_Open()
         self.Default_Boot()
         try:
             version = self.Settings_Load_Version()
@@ -22621,6 +22228,8 @@ class PigmentO_Docker(DockWidget):
         self.harmony_space = "HSV"
         self.harmony_edit = False
         self.harmony_delta = 30
+        self.harmony_key = None
+        self.harmony_styles = [None, None, None, None, None, None]
         self.harmony_span = 120
         self.har_1 = ["HSL", 0,0,0, 0,0,0]
         self.har_2 = ["HSL", 0,0,0, 0,0,0]
@@ -23061,6 +22670,102 @@ class PigmentO_Docker(DockWidget):
         self.spacer_hcy_g3 = 0
         self.mixer_hcy_g3.Update(self.spacer_hcy_g3, self.mixer_width)
 
+        #//
+        #\\ Mixer OKLAB ########################################################
+        # Mixer OKLAB 1
+        self.color_oklab_l1 = [False, 0, 0, 0]
+        self.color_oklab_r1 = [False, 0, 0, 0]
+        self.layout.oklab_l1.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_r1.setStyleSheet(self.bg_alpha)
+        self.spacer_oklab_g1 = 0
+        self.mixer_oklab_g1.Update(self.spacer_oklab_g1, self.mixer_width)
+        # Mixer OKLAB 2
+        self.color_oklab_l2 = [False, 0, 0, 0]
+        self.color_oklab_r2 = [False, 0, 0, 0]
+        self.layout.oklab_l2.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_r2.setStyleSheet(self.bg_alpha)
+        self.spacer_oklab_g2 = 0
+        self.mixer_oklab_g2.Update(self.spacer_oklab_g2, self.mixer_width)
+        # Mixer OKLAB 3
+        self.color_oklab_l3 = [False, 0, 0, 0]
+        self.color_oklab_r3 = [False, 0, 0, 0]
+        self.layout.oklab_l3.setStyleSheet(self.bg_alpha)
+        self.layout.oklab_r3.setStyleSheet(self.bg_alpha)
+        self.spacer_oklab_g3 = 0
+        self.mixer_oklab_g3.Update(self.spacer_oklab_g3, self.mixer_width)
+
+        #//
+        #\\ Mixer OKLCH ########################################################
+        # Mixer OKLCH 1
+        self.color_oklch_l1 = [False, 0, 0, 0]
+        self.color_oklch_r1 = [False, 0, 0, 0]
+        self.layout.oklch_l1.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_r1.setStyleSheet(self.bg_alpha)
+        self.spacer_oklch_g1 = 0
+        self.mixer_oklch_g1.Update(self.spacer_oklch_g1, self.mixer_width)
+        # Mixer OKLCH 2
+        self.color_oklch_l2 = [False, 0, 0, 0]
+        self.color_oklch_r2 = [False, 0, 0, 0]
+        self.layout.oklch_l2.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_r2.setStyleSheet(self.bg_alpha)
+        self.spacer_oklch_g2 = 0
+        self.mixer_oklch_g2.Update(self.spacer_oklch_g2, self.mixer_width)
+        # Mixer OKLCH 3
+        self.color_oklch_l3 = [False, 0, 0, 0]
+        self.color_oklch_r3 = [False, 0, 0, 0]
+        self.layout.oklch_l3.setStyleSheet(self.bg_alpha)
+        self.layout.oklch_r3.setStyleSheet(self.bg_alpha)
+        self.spacer_oklch_g3 = 0
+        self.mixer_oklch_g3.Update(self.spacer_oklch_g3, self.mixer_width)
+
+        #//
+        #\\ Mixer OKHSV ########################################################
+        # Mixer OKHSV 1
+        self.color_okhsv_l1 = [False, 0, 0, 0]
+        self.color_okhsv_r1 = [False, 0, 0, 0]
+        self.layout.okhsv_l1.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_r1.setStyleSheet(self.bg_alpha)
+        self.spacer_okhsv_g1 = 0
+        self.mixer_okhsv_g1.Update(self.spacer_okhsv_g1, self.mixer_width)
+        # Mixer OKHSV 2
+        self.color_okhsv_l2 = [False, 0, 0, 0]
+        self.color_okhsv_r2 = [False, 0, 0, 0]
+        self.layout.okhsv_l2.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_r2.setStyleSheet(self.bg_alpha)
+        self.spacer_okhsv_g2 = 0
+        self.mixer_okhsv_g2.Update(self.spacer_okhsv_g2, self.mixer_width)
+        # Mixer OKHSV 3
+        self.color_okhsv_l3 = [False, 0, 0, 0]
+        self.color_okhsv_r3 = [False, 0, 0, 0]
+        self.layout.okhsv_l3.setStyleSheet(self.bg_alpha)
+        self.layout.okhsv_r3.setStyleSheet(self.bg_alpha)
+        self.spacer_okhsv_g3 = 0
+        self.mixer_okhsv_g3.Update(self.spacer_okhsv_g3, self.mixer_width)
+
+        #//
+        #\\ Mixer OKHSL ########################################################
+        # Mixer OKHSL 1
+        self.color_okhsl_l1 = [False, 0, 0, 0]
+        self.color_okhsl_r1 = [False, 0, 0, 0]
+        self.layout.okhsl_l1.setStyleSheet(self.bg_alpha)
+        self.layout.okhsl_r1.setStyleSheet(self.bg_alpha)
+        self.spacer_okhsl_g1 = 0
+        self.mixer_okhsl_g1.Update(self.spacer_okhsl_g1, self.mixer_width)
+        # Mixer OKHSL 2
+        self.color_okhsl_l2 = [False, 0, 0, 0]
+        self.color_okhsl_r2 = [False, 0, 0, 0]
+        self.layout.okhsl_l2.setStyleSheet(self.bg_alpha)
+        self.layout.okhsl_r2.setStyleSheet(self.bg_alpha)
+        self.spacer_okhsl_g2 = 0
+        self.mixer_okhsl_g2.Update(self.spacer_okhsl_g2, self.mixer_width)
+        # Mixer OKHSL 3
+        self.color_okhsl_l3 = [False, 0, 0, 0]
+        self.color_okhsl_r3 = [False, 0, 0, 0]
+        self.layout.okhsl_l3.setStyleSheet(self.bg_alpha)
+        self.layout.okhsl_r3.setStyleSheet(self.bg_alpha)
+        self.spacer_okhsl_g3 = 0
+        self.mixer_okhsl_g3.Update(self.spacer_okhsl_g3, self.mixer_width)
+
         #//
         #\\ Mixer Gradient Display #############################################
         self.Mixer_Display()
@@ -23083,6 +22788,12 @@ class PigmentO_Docker(DockWidget):
         #\\ Performance ########################################################
         self.performance_release = False
         self.performance_inaccurate = False
+        self.quality = "FINE"
+        self.quality_drag = False
+        profiler.Set_Tier(self.quality)
+        self.selection_range = False
+        self.selection_fuzziness = 0.1
+        self.selection_thread = None
 
         #//
         #\\ Active Color #######################################################
@@ -23154,6 +22865,7 @@ class PigmentO_Docker(DockWidget):
         self.dialog.gam_space.setCurrentIndex(0)
         self.dialog.gam_shape.setCurrentIndex(0)
         # self.dialog.gam_reset.setChecked(0)
+        self.dialog.gam_ring.setValue(gam_ring_step)
         self.dialog.dot_interpolation.setCurrentIndex(0)
         self.dialog.dot_resolution.setCurrentIndex(4)
         self.dialog.dot_set.setChecked(False)
@@ -23181,6 +22893,10 @@ class PigmentO_Docker(DockWidget):
         self.dialog.hlab.setChecked(False)
         self.dialog.lab.setChecked(False)
         self.dialog.lch.setChecked(False)
+        self.dialog.oklab.setChecked(False)
+        self.dialog.oklch.setChecked(False)
+        self.dialog.okhsv.setChecked(False)
+        self.dialog.okhsl.setChecked(False)
         # D4
         self.dialog.display_values.setChecked(False)
         self.dialog.display_hex.setChecked(False)
@@ -23205,6 +22921,10 @@ class PigmentO_Docker(DockWidget):
         # D8
         self.dialog.release.setChecked(False)
         self.dialog.inaccurate.setChecked(False)
+        self.dialog.sel_range.setChecked(False)
+        self.dialog.sel_fuzziness.setValue(10)
+        self.dialog.profiler.setChecked(False)
+        self.dialog.profiler_record.setChecked(False)
 
         #//
     def Default_Save(self):
@@ -23213,24 +22933,61 @@ class PigmentO_Docker(DockWidget):
         self.Settings_Save_UI()
         self.Settings_Save_Version()
         self.Settings_Save_Annotations()
+        self.Settings_Flush()
+
+    def Settings_Open(self):
+        # Every setting lives in one versioned JSON blob read at once
+        self.settings_blob = {}
+        self.settings_text = ""
+        self.settings_migrate = True
+        try:
+            text = str(Krita.instance().readSetting("Pigment.O", "settings", ""))
+            if text != "":
+                blob = json.loads(text)
+                if (isinstance(blob, dict) and blob.get("format") == settings_format and isinstance(blob.get("values"), dict)):
+                    self.settings_blob = {str(key): str(value) for key, value in blob["values"].items()}
+                    self.settings_text = text
+                    self.settings_migrate = False
+        except:
+            QtCore.qWarning("Pigment.O - Load Error - Settings")
+    def Settings_Read(self, key):
+        if key in self.settings_blob:
+            return self.settings_blob[key]
+        # Keys of older versions are read once until the first blob is written
+        if self.settings_migrate == True:
+            value = str(Krita.instance().readSetting("Pigment.O", key, ""))
+            self.settings_blob[key] = value
+            return value
+        return ""
+    def Settings_Write(self, key, value):
+        self.settings_blob[key] = str(value)
+    def Settings_Value(self, text):
+        # Literals only, stored text is never executed
+        return ast.literal_eval(str(text).strip())
+    def Settings_Flush(self):
+        text = json.dumps({"format" : settings_format, "values" : self.settings_blob}, sort_keys=True, separators=(",", ":"))
+        if text != self.settings_text:
+            Krita.instance().writeSetting("Pigment.O", "settings", text)
+            self.settings_text = text
+        self.settings_migrate = False
 
     def Settings_Load_Version(self):
         try:
-            version = Krita.instance().readSetting("Pigment.O", "version", "")
+            version = self.Settings_Read("version")
         except:
             version = False
         return version
     def Settings_Save_Version(self):
-        Krita.instance().writeSetting("Pigment.O", "version", str(pigment_o_version))
+        self.Settings_Write("version", str(pigment_o_version))
 
     def Settings_Load_Misc(self):
         #\\ Panel GAM ##########################################################
         try:
-            gam_p1s1_string = Krita.instance().readSetting("Pigment.O", "gam_p1s1", "")
-            gam_p1s3_string = Krita.instance().readSetting("Pigment.O", "gam_p1s3", "")
-            gam_p1s4_string = Krita.instance().readSetting("Pigment.O", "gam_p1s4", "")
-            gam_p2s1_string = Krita.instance().readSetting("Pigment.O", "gam_p2s1", "")
-            gam_p3s3_string = Krita.instance().readSetting("Pigment.O", "gam_p3s3", "")
+            gam_p1s1_string = self.Settings_Read("gam_p1s1")
+            gam_p1s3_string = self.Settings_Read("gam_p1s3")
+            gam_p1s4_string = self.Settings_Read("gam_p1s4")
+            gam_p2s1_string = self.Settings_Read("gam_p2s1")
+            gam_p3s3_string = self.Settings_Read("gam_p3s3")
             p1s1s = gam_p1s1_string.split(",")
             p1s3s = gam_p1s3_string.split(",")
             p1s4s = gam_p1s4_string.split(",")
@@ -23238,40 +22995,40 @@ class PigmentO_Docker(DockWidget):
             p3s3s = gam_p3s3_string.split(",")
             # Update Variables
             self.P1_S1 = self.P1_S1_r = [
-                eval(p1s1s[0]), eval(p1s1s[1]),
-                eval(p1s1s[2]), eval(p1s1s[3]),
-                eval(p1s1s[4]), eval(p1s1s[5]),
-                eval(p1s1s[6]), eval(p1s1s[7]),
+                self.Settings_Value(p1s1s[0]), self.Settings_Value(p1s1s[1]),
+                self.Settings_Value(p1s1s[2]), self.Settings_Value(p1s1s[3]),
+                self.Settings_Value(p1s1s[4]), self.Settings_Value(p1s1s[5]),
+                self.Settings_Value(p1s1s[6]), self.Settings_Value(p1s1s[7]),
                 ]
             self.P1_S3 = self.P1_S3_r = [
-                eval(p1s3s[0]), eval(p1s3s[1]),
-                eval(p1s3s[2]), eval(p1s3s[3]),
-                eval(p1s3s[4]), eval(p1s3s[5]),
+                self.Settings_Value(p1s3s[0]), self.Settings_Value(p1s3s[1]),
+                self.Settings_Value(p1s3s[2]), self.Settings_Value(p1s3s[3]),
+                self.Settings_Value(p1s3s[4]), self.Settings_Value(p1s3s[5]),
                 ]
             self.P1_S4 = self.P1_S4_r = [
-                eval(p1s4s[0]), eval(p1s4s[1]),
-                eval(p1s4s[2]), eval(p1s4s[3]),
-                eval(p1s4s[4]), eval(p1s4s[5]),
-                eval(p1s4s[6]), eval(p1s4s[7]),
+                self.Settings_Value(p1s4s[0]), self.Settings_Value(p1s4s[1]),
+                self.Settings_Value(p1s4s[2]), self.Settings_Value(p1s4s[3]),
+                self.Settings_Value(p1s4s[4]), self.Settings_Value(p1s4s[5]),
+                self.Settings_Value(p1s4s[6]), self.Settings_Value(p1s4s[7]),
                 ]
             self.P2_S1 = self.P2_S1_r = [
-                eval(p2s1s[0]), eval(p2s1s[1]),
-                eval(p2s1s[2]), eval(p2s1s[3]),
-                eval(p2s1s[4]), eval(p2s1s[5]),
-                eval(p2s1s[6]), eval(p2s1s[7]),
-                eval(p2s1s[8]), eval(p2s1s[9]),
-                eval(p2s1s[10]), eval(p2s1s[11]),
-                eval(p2s1s[12]), eval(p2s1s[13]),
-                eval(p2s1s[14]), eval(p2s1s[15]),
+                self.Settings_Value(p2s1s[0]), self.Settings_Value(p2s1s[1]),
+                self.Settings_Value(p2s1s[2]), self.Settings_Value(p2s1s[3]),
+                self.Settings_Value(p2s1s[4]), self.Settings_Value(p2s1s[5]),
+                self.Settings_Value(p2s1s[6]), self.Settings_Value(p2s1s[7]),
+                self.Settings_Value(p2s1s[8]), self.Settings_Value(p2s1s[9]),
+                self.Settings_Value(p2s1s[10]), self.Settings_Value(p2s1s[11]),
+                self.Settings_Value(p2s1s[12]), self.Settings_Value(p2s1s[13]),
+                self.Settings_Value(p2s1s[14]), self.Settings_Value(p2s1s[15]),
                 ]
             self.P3_S3 = self.P3_S3_r = [
-                eval(p3s3s[0]), eval(p3s3s[1]),
-                eval(p3s3s[2]), eval(p3s3s[3]),
-                eval(p3s3s[4]), eval(p3s3s[5]),
-                eval(p3s3s[6]), eval(p3s3s[7]),
-                eval(p3s3s[8]), eval(p3s3s[9]),
-                eval(p3s3s[10]), eval(p3s3s[11]),
-                eval(p3s3s[12]), eval(p3s3s[13]),
+                self.Settings_Value(p3s3s[0]), self.Settings_Value(p3s3s[1]),
+                self.Settings_Value(p3s3s[2]), self.Settings_Value(p3s3s[3]),
+                self.Settings_Value(p3s3s[4]), self.Settings_Value(p3s3s[5]),
+                self.Settings_Value(p3s3s[6]), self.Settings_Value(p3s3s[7]),
+                self.Settings_Value(p3s3s[8]), self.Settings_Value(p3s3s[9]),
+                self.Settings_Value(p3s3s[10]), self.Settings_Value(p3s3s[11]),
+                self.Settings_Value(p3s3s[12]), self.Settings_Value(p3s3s[13]),
                 ]
             # Update widget with Variables
             self.Update_Panel_GAM_Polygon(self.P1_S1, self.P1_S3, self.P1_S4, self.P2_S1, self.P3_S3)
@@ -23280,18 +23037,18 @@ class PigmentO_Docker(DockWidget):
         #//
         #\\ Panel DOT ##########################################################
         try:
-            dot_01_string = Krita.instance().readSetting("Pigment.O", "dot_01", "")
-            dot_02_string = Krita.instance().readSetting("Pigment.O", "dot_02", "")
-            dot_03_string = Krita.instance().readSetting("Pigment.O", "dot_03", "")
-            dot_04_string = Krita.instance().readSetting("Pigment.O", "dot_04", "")
+            dot_01_string = self.Settings_Read("dot_01")
+            dot_02_string = self.Settings_Read("dot_02")
+            dot_03_string = self.Settings_Read("dot_03")
+            dot_04_string = self.Settings_Read("dot_04")
             dot_01_split = dot_01_string.split(",")
             dot_02_split = dot_02_string.split(",")
             dot_03_split = dot_03_string.split(",")
             dot_04_split = dot_04_string.split(",")
-            check1 = eval(dot_01_split[0])
-            check2 = eval(dot_02_split[0])
-            check3 = eval(dot_03_split[0])
-            check4 = eval(dot_04_split[0])
+            check1 = self.Settings_Value(dot_01_split[0])
+            check2 = self.Settings_Value(dot_02_split[0])
+            check3 = self.Settings_Value(dot_03_split[0])
+            check4 = self.Settings_Value(dot_04_split[0])
             if (check1 == True or check2 == True or check3 == True or check4 == True):
                 if check1 == True:
                     self.dot_1 = [True, float(dot_01_split[1]), float(dot_01_split[2]), float(dot_01_split[3]), float(dot_01_split[4]), float(dot_01_split[5]), float(dot_01_split[6])]
@@ -23328,47 +23085,47 @@ class PigmentO_Docker(DockWidget):
         #\\ Panel OBJ ##########################################################
         try:
             # Load from File
-            object_00_string = Krita.instance().readSetting("Pigment.O", "obj_00", "")
-            object_01_string = Krita.instance().readSetting("Pigment.O", "obj_01", "")
+            object_00_string = self.Settings_Read("obj_00")
+            object_01_string = self.Settings_Read("obj_01")
             obj00s = object_00_string.split(",")
             obj01s = object_01_string.split(",")
             # Assign Variables
             self.bg_1 = [
-                [eval(obj00s[0]), eval(obj00s[1]), eval(obj00s[2]), eval(obj00s[3]), eval(obj00s[4])],
-                [eval(obj01s[0]), eval(obj01s[1]), eval(obj01s[2]), eval(obj01s[3]), eval(obj01s[4])]]
+                [self.Settings_Value(obj00s[0]), self.Settings_Value(obj00s[1]), self.Settings_Value(obj00s[2]), self.Settings_Value(obj00s[3]), self.Settings_Value(obj00s[4])],
+                [self.Settings_Value(obj01s[0]), self.Settings_Value(obj01s[1]), self.Settings_Value(obj01s[2]), self.Settings_Value(obj01s[3]), self.Settings_Value(obj01s[4])]]
             self.bg_2 = [
-                [eval(obj00s[5]), eval(obj00s[6]), eval(obj00s[7]), eval(obj00s[8]), eval(obj00s[9])],
-                [eval(obj01s[5]), eval(obj01s[6]), eval(obj01s[7]), eval(obj01s[8]), eval(obj01s[9])]]
+                [self.Settings_Value(obj00s[5]), self.Settings_Value(obj00s[6]), self.Settings_Value(obj00s[7]), self.Settings_Value(obj00s[8]), self.Settings_Value(obj00s[9])],
+                [self.Settings_Value(obj01s[5]), self.Settings_Value(obj01s[6]), self.Settings_Value(obj01s[7]), self.Settings_Value(obj01s[8]), self.Settings_Value(obj01s[9])]]
             self.bg_3 = [
-                [eval(obj00s[10]), eval(obj00s[11]), eval(obj00s[12]), eval(obj00s[13]), eval(obj00s[14])],
-                [eval(obj01s[10]), eval(obj01s[11]), eval(obj01s[12]), eval(obj01s[13]), eval(obj01s[14])]]
+                [self.Settings_Value(obj00s[10]), self.Settings_Value(obj00s[11]), self.Settings_Value(obj00s[12]), self.Settings_Value(obj00s[13]), self.Settings_Value(obj00s[14])],
+                [self.Settings_Value(obj01s[10]), self.Settings_Value(obj01s[11]), self.Settings_Value(obj01s[12]), self.Settings_Value(obj01s[13]), self.Settings_Value(obj01s[14])]]
             self.dif_1 = [
-                [eval(obj00s[15]), eval(obj00s[16]), eval(obj00s[17]), eval(obj00s[18]), eval(obj00s[19])],
-                [eval(obj01s[15]), eval(obj01s[16]), eval(obj01s[17]), eval(obj01s[18]), eval(obj01s[19])]]
+                [self.Settings_Value(obj00s[15]), self.Settings_Value(obj00s[16]), self.Settings_Value(obj00s[17]), self.Settings_Value(obj00s[18]), self.Settings_Value(obj00s[19])],
+                [self.Settings_Value(obj01s[15]), self.Settings_Value(obj01s[16]), self.Settings_Value(obj01s[17]), self.Settings_Value(obj01s[18]), self.Settings_Value(obj01s[19])]]
             self.dif_2 = [
-                [eval(obj00s[20]), eval(obj00s[21]), eval(obj00s[22]), eval(obj00s[23]), eval(obj00s[24])],
-                [eval(obj01s[20]), eval(obj01s[21]), eval(obj01s[22]), eval(obj01s[23]), eval(obj01s[24])]]
+                [self.Settings_Value(obj00s[20]), self.Settings_Value(obj00s[21]), self.Settings_Value(obj00s[22]), self.Settings_Value(obj00s[23]), self.Settings_Value(obj00s[24])],
+                [self.Settings_Value(obj01s[20]), self.Settings_Value(obj01s[21]), self.Settings_Value(obj01s[22]), self.Settings_Value(obj01s[23]), self.Settings_Value(obj01s[24])]]
             self.dif_3 = [
-                [eval(obj00s[25]), eval(obj00s[26]), eval(obj00s[27]), eval(obj00s[28]), eval(obj00s[29])],
-                [eval(obj01s[25]), eval(obj01s[26]), eval(obj01s[27]), eval(obj01s[28]), eval(obj01s[29])]]
+                [self.Settings_Value(obj00s[25]), self.Settings_Value(obj00s[26]), self.Settings_Value(obj00s[27]), self.Settings_Value(obj00s[28]), self.Settings_Value(obj00s[29])],
+                [self.Settings_Value(obj01s[25]), self.Settings_Value(obj01s[26]), self.Settings_Value(obj01s[27]), self.Settings_Value(obj01s[28]), self.Settings_Value(obj01s[29])]]
             self.dif_4 = [
-                [eval(obj00s[30]), eval(obj00s[31]), eval(obj00s[32]), eval(obj00s[33]), eval(obj00s[34])],
-                [eval(obj01s[30]), eval(obj01s[31]), eval(obj01s[32]), eval(obj01s[33]), eval(obj01s[34])]]
+                [self.Settings_Value(obj00s[30]), self.Settings_Value(obj00s[31]), self.Settings_Value(obj00s[32]), self.Settings_Value(obj00s[33]), self.Settings_Value(obj00s[34])],
+                [self.Settings_Value(obj01s[30]), self.Settings_Value(obj01s[31]), self.Settings_Value(obj01s[32]), self.Settings_Value(obj01s[33]), self.Settings_Value(obj01s[34])]]
             self.dif_5 = [
-                [eval(obj00s[35]), eval(obj00s[36]), eval(obj00s[37]), eval(obj00s[38]), eval(obj00s[39])],
-                [eval(obj01s[35]), eval(obj01s[36]), eval(obj01s[37]), eval(obj01s[38]), eval(obj01s[39])]]
+                [self.Settings_Value(obj00s[35]), self.Settings_Value(obj00s[36]), self.Settings_Value(obj00s[37]), self.Settings_Value(obj00s[38]), self.Settings_Value(obj00s[39])],
+                [self.Settings_Value(obj01s[35]), self.Settings_Value(obj01s[36]), self.Settings_Value(obj01s[37]), self.Settings_Value(obj01s[38]), self.Settings_Value(obj01s[39])]]
             self.dif_6 = [
-                [eval(obj00s[40]), eval(obj00s[41]), eval(obj00s[42]), eval(obj00s[43]), eval(obj00s[44])],
-                [eval(obj01s[40]), eval(obj01s[41]), eval(obj01s[42]), eval(obj01s[43]), eval(obj01s[44])]]
+                [self.Settings_Value(obj00s[40]), self.Settings_Value(obj00s[41]), self.Settings_Value(obj00s[42]), self.Settings_Value(obj00s[43]), self.Settings_Value(obj00s[44])],
+                [self.Settings_Value(obj01s[40]), self.Settings_Value(obj01s[41]), self.Settings_Value(obj01s[42]), self.Settings_Value(obj01s[43]), self.Settings_Value(obj01s[44])]]
             self.fg_1 = [
-                [eval(obj00s[45]), eval(obj00s[46]), eval(obj00s[47]), eval(obj00s[48]), eval(obj00s[49])],
-                [eval(obj01s[45]), eval(obj01s[46]), eval(obj01s[47]), eval(obj01s[48]), eval(obj01s[49])]]
+                [self.Settings_Value(obj00s[45]), self.Settings_Value(obj00s[46]), self.Settings_Value(obj00s[47]), self.Settings_Value(obj00s[48]), self.Settings_Value(obj00s[49])],
+                [self.Settings_Value(obj01s[45]), self.Settings_Value(obj01s[46]), self.Settings_Value(obj01s[47]), self.Settings_Value(obj01s[48]), self.Settings_Value(obj01s[49])]]
             self.fg_2 = [
-                [eval(obj00s[50]), eval(obj00s[51]), eval(obj00s[52]), eval(obj00s[53]), eval(obj00s[54])],
-                [eval(obj01s[50]), eval(obj01s[51]), eval(obj01s[52]), eval(obj01s[53]), eval(obj01s[54])]]
+                [self.Settings_Value(obj00s[50]), self.Settings_Value(obj00s[51]), self.Settings_Value(obj00s[52]), self.Settings_Value(obj00s[53]), self.Settings_Value(obj00s[54])],
+                [self.Settings_Value(obj01s[50]), self.Settings_Value(obj01s[51]), self.Settings_Value(obj01s[52]), self.Settings_Value(obj01s[53]), self.Settings_Value(obj01s[54])]]
             self.fg_3 = [
-                [eval(obj00s[55]), eval(obj00s[56]), eval(obj00s[57]), eval(obj00s[58]), eval(obj00s[59])],
-                [eval(obj01s[55]), eval(obj01s[56]), eval(obj01s[57]), eval(obj01s[58]), eval(obj01s[59])]]
+                [self.Settings_Value(obj00s[55]), self.Settings_Value(obj00s[56]), self.Settings_Value(obj00s[57]), self.Settings_Value(obj00s[58]), self.Settings_Value(obj00s[59])],
+                [self.Settings_Value(obj01s[55]), self.Settings_Value(obj01s[56]), self.Settings_Value(obj01s[57]), self.Settings_Value(obj01s[58]), self.Settings_Value(obj01s[59])]]
             # Verify to RESET Colors
             if (
             self.bg_1[0][0] == False and
@@ -23428,7 +23185,7 @@ class PigmentO_Docker(DockWidget):
         #//
         #\\ Panel IMG ##########################################################
         try:
-            self.img_state = str(Krita.instance().readSetting("Pigment.O", "img_state", ""))
+            self.img_state = str(self.Settings_Read("img_state"))
             if (self.img_state == "SAVE" and QImageReader(self.img_save).canRead() == True):
                 self.IMG_APPLY(self.img_save)
             else:
@@ -23440,17 +23197,17 @@ class PigmentO_Docker(DockWidget):
         #//
         #\\ COR ################################################################
         try:
-            cor_00_string = Krita.instance().readSetting("Pigment.O", "cor_00", "")
-            cor_01_string = Krita.instance().readSetting("Pigment.O", "cor_01", "")
-            cor_02_string = Krita.instance().readSetting("Pigment.O", "cor_02", "")
-            cor_03_string = Krita.instance().readSetting("Pigment.O", "cor_03", "")
-            cor_04_string = Krita.instance().readSetting("Pigment.O", "cor_04", "")
-            cor_05_string = Krita.instance().readSetting("Pigment.O", "cor_05", "")
-            cor_06_string = Krita.instance().readSetting("Pigment.O", "cor_06", "")
-            cor_07_string = Krita.instance().readSetting("Pigment.O", "cor_07", "")
-            cor_08_string = Krita.instance().readSetting("Pigment.O", "cor_08", "")
-            cor_09_string = Krita.instance().readSetting("Pigment.O", "cor_09", "")
-            cor_10_string = Krita.instance().readSetting("Pigment.O", "cor_10", "")
+            cor_00_string = self.Settings_Read("cor_00")
+            cor_01_string = self.Settings_Read("cor_01")
+            cor_02_string = self.Settings_Read("cor_02")
+            cor_03_string = self.Settings_Read("cor_03")
+            cor_04_string = self.Settings_Read("cor_04")
+            cor_05_string = self.Settings_Read("cor_05")
+            cor_06_string = self.Settings_Read("cor_06")
+            cor_07_string = self.Settings_Read("cor_07")
+            cor_08_string = self.Settings_Read("cor_08")
+            cor_09_string = self.Settings_Read("cor_09")
+            cor_10_string = self.Settings_Read("cor_10")
             cor_00_split = cor_00_string.split(",")
             cor_01_split = cor_01_string.split(",")
             cor_02_split = cor_02_string.split(",")
@@ -23462,47 +23219,47 @@ class PigmentO_Docker(DockWidget):
             cor_08_split = cor_08_string.split(",")
             cor_09_split = cor_09_string.split(",")
             cor_10_split = cor_10_string.split(",")
-            if eval(cor_00_split[0]) == True:
+            if self.Settings_Value(cor_00_split[0]) == True:
                 self.cor_00 = [True, float(cor_00_split[1]), float(cor_00_split[2]), float(cor_00_split[3])]
                 color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_00[1]*255, self.cor_00[2]*255, self.cor_00[3]*255))
                 self.layout.cor_00.setStyleSheet(color)
-            if eval(cor_01_split[0]) == True:
+            if self.Settings_Value(cor_01_split[0]) == True:
                 self.cor_01 = [True, float(cor_01_split[1]), float(cor_01_split[2]), float(cor_01_split[3])]
                 color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_01[1]*255, self.cor_01[2]*255, self.cor_01[3]*255))
                 self.layout.cor_01.setStyleSheet(color)
-            if eval(cor_02_split[0]) == True:
+            if self.Settings_Value(cor_02_split[0]) == True:
                 self.cor_02 = [True, float(cor_02_split[1]), float(cor_02_split[2]), float(cor_02_split[3])]
                 color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_02[1]*255, self.cor_02[2]*255, self.cor_02[3]*255))
                 self.layout.cor_02.setStyleSheet(color)
-            if eval(cor_03_split[0]) == True:
+            if self.Settings_Value(cor_03_split[0]) == True:
                 self.cor_03 = [True, float(cor_03_split[1]), float(cor_03_split[2]), float(cor_03_split[3])]
                 color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_03[1]*255, self.cor_03[2]*255, self.cor_03[3]*255))
                 self.layout.cor_03.setStyleSheet(color)
-            if eval(cor_04_split[0]) == True:
+            if self.Settings_Value(cor_04_split[0]) == True:
                 self.cor_04 = [True, float(cor_04_split[1]), float(cor_04_split[2]), float(cor_04_split[3])]
                 color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_04[1]*255, self.cor_04[2]*255, self.cor_04[3]*255))
                 self.layout.cor_04.setStyleSheet(color)
-            if eval(cor_05_split[0]) == True:
+            if self.Settings_Value(cor_05_split[0]) == True:
                 self.cor_05 = [True, float(cor_05_split[1]), float(cor_05_split[2]), float(cor_05_split[3])]
                 color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_05[1]*255, self.cor_05[2]*255, self.cor_05[3]*255))
                 self.layout.cor_05.setStyleSheet(color)
-            if eval(cor_06_split[0]) == True:
+            if self.Settings_Value(cor_06_split[0]) == True:
                 self.cor_06 = [True, float(cor_06_split[1]), float(cor_06_split[2]), float(cor_06_split[3])]
                 color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_06[1]*255, self.cor_06[2]*255, self.cor_06[3]*255))
                 self.layout.cor_06.setStyleSheet(color)
-            if eval(cor_07_split[0]) == True:
+            if self.Settings_Value(cor_07_split[0]) == True:
                 self.cor_07 = [True, float(cor_07_split[1]), float(cor_07_split[2]), float(cor_07_split[3])]
                 color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_07[1]*255, self.cor_07[2]*255, self.cor_07[3]*255))
                 self.layout.cor_07.setStyleSheet(color)
-            if eval(cor_08_split[0]) == True:
+            if self.Settings_Value(cor_08_split[0]) == True:
                 self.cor_08 = [True, float(cor_08_split[1]), float(cor_08_split[2]), float(cor_08_split[3])]
                 color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_08[1]*255, self.cor_08[2]*255, self.cor_08[3]*255))
                 self.layout.cor_08.setStyleSheet(color)
-            if eval(cor_09_split[0]) == True:
+            if self.Settings_Value(cor_09_split[0]) == True:
                 self.cor_09 = [True, float(cor_09_split[1]), float(cor_09_split[2]), float(cor_09_split[3])]
                 color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_09[1]*255, self.cor_09[2]*255, self.cor_09[3]*255))
                 self.layout.cor_09.setStyleSheet(color)
-            if eval(cor_10_split[0]) == True:
+            if self.Settings_Value(cor_10_split[0]) == True:
                 self.cor_10 = [True, float(cor_10_split[1]), float(cor_10_split[2]), float(cor_10_split[3])]
                 color = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (self.cor_10[1]*255, self.cor_10[2]*255, self.cor_10[3]*255))
                 self.layout.cor_10.setStyleSheet(color)
@@ -23512,9 +23269,9 @@ class PigmentO_Docker(DockWidget):
         #//
         #\\ Mixer TTS ##########################################################
         try:
-            mixer_tts_string = Krita.instance().readSetting("Pigment.O", "mix_TTS", "")
+            mixer_tts_string = self.Settings_Read("mix_TTS")
             mixer_tts_split = mixer_tts_string.split(",")
-            if eval(mixer_tts_split[0]) == True:
+            if self.Settings_Value(mixer_tts_split[0]) == True:
                 self.color_tts = [True, float(mixer_tts_split[1]), float(mixer_tts_split[2]), float(mixer_tts_split[3])]
                 gray = self.rgb_to_aaa(self.color_tts[1], self.color_tts[2], self.color_tts[3])
                 self.gray_tts = [gray[0], gray[0], gray[0]]
@@ -23530,10 +23287,10 @@ class PigmentO_Docker(DockWidget):
         #\\ Mixer RGB ##########################################################
         try:
             # Mixer RGB 1
-            mixer_rgb_1_string = Krita.instance().readSetting("Pigment.O", "mix_RGB_1", "")
+            mixer_rgb_1_string = self.Settings_Read("mix_RGB_1")
             mixer_rgb_1_split = mixer_rgb_1_string.split(",")
-            mixer_rgb_1_left = eval(mixer_rgb_1_split[0])
-            mixer_rgb_1_right = eval(mixer_rgb_1_split[4])
+            mixer_rgb_1_left = self.Settings_Value(mixer_rgb_1_split[0])
+            mixer_rgb_1_right = self.Settings_Value(mixer_rgb_1_split[4])
             if (mixer_rgb_1_left == True and mixer_rgb_1_right == True):
                 # Gradient
                 self.color_rgb_l1 = [True, float(mixer_rgb_1_split[1]), float(mixer_rgb_1_split[2]), float(mixer_rgb_1_split[3])]
@@ -23557,10 +23314,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.rgb_l1.setStyleSheet(self.bg_alpha)
                 self.layout.rgb_r1.setStyleSheet(color_rgb_right_1)
             # Mixer RGB 2
-            mixer_rgb_2_string = Krita.instance().readSetting("Pigment.O", "mix_RGB_2", "")
+            mixer_rgb_2_string = self.Settings_Read("mix_RGB_2")
             mixer_rgb_2_split = mixer_rgb_2_string.split(",")
-            mixer_rgb_2_left = eval(mixer_rgb_2_split[0])
-            mixer_rgb_2_right = eval(mixer_rgb_2_split[4])
+            mixer_rgb_2_left = self.Settings_Value(mixer_rgb_2_split[0])
+            mixer_rgb_2_right = self.Settings_Value(mixer_rgb_2_split[4])
             if (mixer_rgb_2_left == True and mixer_rgb_2_right == True):
                 # Gradient
                 self.color_rgb_l2 = [True, float(mixer_rgb_2_split[1]), float(mixer_rgb_2_split[2]), float(mixer_rgb_2_split[3])]
@@ -23584,10 +23341,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.rgb_l2.setStyleSheet(self.bg_alpha)
                 self.layout.rgb_r2.setStyleSheet(color_rgb_right_2)
             # Mixer RGB 3
-            mixer_rgb_3_string = Krita.instance().readSetting("Pigment.O", "mix_RGB_3", "")
+            mixer_rgb_3_string = self.Settings_Read("mix_RGB_3")
             mixer_rgb_3_split = mixer_rgb_3_string.split(",")
-            mixer_rgb_3_left = eval(mixer_rgb_3_split[0])
-            mixer_rgb_3_right = eval(mixer_rgb_3_split[4])
+            mixer_rgb_3_left = self.Settings_Value(mixer_rgb_3_split[0])
+            mixer_rgb_3_right = self.Settings_Value(mixer_rgb_3_split[4])
             if (mixer_rgb_3_left == True and mixer_rgb_3_right == True):
                 # Gradient
                 self.color_rgb_l3 = [True, float(mixer_rgb_3_split[1]), float(mixer_rgb_3_split[2]), float(mixer_rgb_3_split[3])]
@@ -23616,10 +23373,10 @@ class PigmentO_Docker(DockWidget):
         #\\ Mixer CMYK #########################################################
         try:
             # Mixer CMYK 1
-            mixer_cmyk_1_string = Krita.instance().readSetting("Pigment.O", "mix_CMYK_1", "")
+            mixer_cmyk_1_string = self.Settings_Read("mix_CMYK_1")
             mixer_cmyk_1_split = mixer_cmyk_1_string.split(",")
-            mixer_cmyk_1_left = eval(mixer_cmyk_1_split[0])
-            mixer_cmyk_1_right = eval(mixer_cmyk_1_split[5])
+            mixer_cmyk_1_left = self.Settings_Value(mixer_cmyk_1_split[0])
+            mixer_cmyk_1_right = self.Settings_Value(mixer_cmyk_1_split[5])
             if (mixer_cmyk_1_left == True and mixer_cmyk_1_right == True):
                 # Gradient
                 self.color_cmyk_l1 = [True, float(mixer_cmyk_1_split[1]), float(mixer_cmyk_1_split[2]), float(mixer_cmyk_1_split[3]), float(mixer_cmyk_1_split[4])]
@@ -23647,10 +23404,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.cmyk_l1.setStyleSheet(self.bg_alpha)
                 self.layout.cmyk_r1.setStyleSheet(color_cmyk_right_1)
             # Mixer CMYK 2
-            mixer_cmyk_2_string = Krita.instance().readSetting("Pigment.O", "mix_CMYK_2", "")
+            mixer_cmyk_2_string = self.Settings_Read("mix_CMYK_2")
             mixer_cmyk_2_split = mixer_cmyk_2_string.split(",")
-            mixer_cmyk_2_left = eval(mixer_cmyk_2_split[0])
-            mixer_cmyk_2_right = eval(mixer_cmyk_2_split[5])
+            mixer_cmyk_2_left = self.Settings_Value(mixer_cmyk_2_split[0])
+            mixer_cmyk_2_right = self.Settings_Value(mixer_cmyk_2_split[5])
             if (mixer_cmyk_2_left == True and mixer_cmyk_2_right == True):
                 # Gradient
                 self.color_cmyk_l2 = [True, float(mixer_cmyk_2_split[1]), float(mixer_cmyk_2_split[2]), float(mixer_cmyk_2_split[3]), float(mixer_cmyk_2_split[4])]
@@ -23678,10 +23435,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.cmyk_l2.setStyleSheet(self.bg_alpha)
                 self.layout.cmyk_r2.setStyleSheet(color_cmyk_right_2)
             # Mixer CMYK 3
-            mixer_cmyk_3_string = Krita.instance().readSetting("Pigment.O", "mix_CMYK_3", "")
+            mixer_cmyk_3_string = self.Settings_Read("mix_CMYK_3")
             mixer_cmyk_3_split = mixer_cmyk_3_string.split(",")
-            mixer_cmyk_3_left = eval(mixer_cmyk_3_split[0])
-            mixer_cmyk_3_right = eval(mixer_cmyk_3_split[5])
+            mixer_cmyk_3_left = self.Settings_Value(mixer_cmyk_3_split[0])
+            mixer_cmyk_3_right = self.Settings_Value(mixer_cmyk_3_split[5])
             if (mixer_cmyk_3_left == True and mixer_cmyk_3_right == True):
                 # Gradient
                 self.color_cmyk_l3 = [True, float(mixer_cmyk_3_split[1]), float(mixer_cmyk_3_split[2]), float(mixer_cmyk_3_split[3]), float(mixer_cmyk_3_split[4])]
@@ -23714,10 +23471,10 @@ class PigmentO_Docker(DockWidget):
         #\\ Mixer RYB ##########################################################
         try:
             # Mixer RYB 1
-            mixer_ryb_1_string = Krita.instance().readSetting("Pigment.O", "mix_RYB_1", "")
+            mixer_ryb_1_string = self.Settings_Read("mix_RYB_1")
             mixer_ryb_1_split = mixer_ryb_1_string.split(",")
-            mixer_ryb_1_left = eval(mixer_ryb_1_split[0])
-            mixer_ryb_1_right = eval(mixer_ryb_1_split[4])
+            mixer_ryb_1_left = self.Settings_Value(mixer_ryb_1_split[0])
+            mixer_ryb_1_right = self.Settings_Value(mixer_ryb_1_split[4])
             if (mixer_ryb_1_left == True and mixer_ryb_1_right == True):
                 # Gradient
                 self.color_ryb_l1 = [True, float(mixer_ryb_1_split[1]), float(mixer_ryb_1_split[2]), float(mixer_ryb_1_split[3])]
@@ -23745,10 +23502,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.ryb_l1.setStyleSheet(self.bg_alpha)
                 self.layout.ryb_r1.setStyleSheet(color_ryb_right_1)
             # Mixer RYB 2
-            mixer_ryb_2_string = Krita.instance().readSetting("Pigment.O", "mix_RYB_2", "")
+            mixer_ryb_2_string = self.Settings_Read("mix_RYB_2")
             mixer_ryb_2_split = mixer_ryb_2_string.split(",")
-            mixer_ryb_2_left = eval(mixer_ryb_2_split[0])
-            mixer_ryb_2_right = eval(mixer_ryb_2_split[4])
+            mixer_ryb_2_left = self.Settings_Value(mixer_ryb_2_split[0])
+            mixer_ryb_2_right = self.Settings_Value(mixer_ryb_2_split[4])
             if (mixer_ryb_2_left == True and mixer_ryb_2_right == True):
                 # Gradient
                 self.color_ryb_l2 = [True, float(mixer_ryb_2_split[1]), float(mixer_ryb_2_split[2]), float(mixer_ryb_2_split[3])]
@@ -23776,10 +23533,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.ryb_l2.setStyleSheet(self.bg_alpha)
                 self.layout.ryb_r2.setStyleSheet(color_ryb_right_2)
             # Mixer RYB 3
-            mixer_ryb_3_string = Krita.instance().readSetting("Pigment.O", "mix_RYB_3", "")
+            mixer_ryb_3_string = self.Settings_Read("mix_RYB_3")
             mixer_ryb_3_split = mixer_ryb_3_string.split(",")
-            mixer_ryb_3_left = eval(mixer_ryb_3_split[0])
-            mixer_ryb_3_right = eval(mixer_ryb_3_split[4])
+            mixer_ryb_3_left = self.Settings_Value(mixer_ryb_3_split[0])
+            mixer_ryb_3_right = self.Settings_Value(mixer_ryb_3_split[4])
             if (mixer_ryb_3_left == True and mixer_ryb_3_right == True):
                 # Gradient
                 self.color_ryb_l3 = [True, float(mixer_ryb_3_split[1]), float(mixer_ryb_3_split[2]), float(mixer_ryb_3_split[3])]
@@ -23812,10 +23569,10 @@ class PigmentO_Docker(DockWidget):
         #\\ Mixer YUV ##########################################################
         try:
             # Mixer YUV 1
-            mixer_yuv_1_string = Krita.instance().readSetting("Pigment.O", "mix_YUV_1", "")
+            mixer_yuv_1_string = self.Settings_Read("mix_YUV_1")
             mixer_yuv_1_split = mixer_yuv_1_string.split(",")
-            mixer_yuv_1_left = eval(mixer_yuv_1_split[0])
-            mixer_yuv_1_right = eval(mixer_yuv_1_split[4])
+            mixer_yuv_1_left = self.Settings_Value(mixer_yuv_1_split[0])
+            mixer_yuv_1_right = self.Settings_Value(mixer_yuv_1_split[4])
             if (mixer_yuv_1_left == True and mixer_yuv_1_right == True):
                 # Gradient
                 self.color_yuv_l1 = [True, float(mixer_yuv_1_split[1]), float(mixer_yuv_1_split[2]), float(mixer_yuv_1_split[3])]
@@ -23843,10 +23600,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.yuv_l1.setStyleSheet(self.bg_alpha)
                 self.layout.yuv_r1.setStyleSheet(color_yuv_right_1)
             # Mixer YUV 2
-            mixer_yuv_2_string = Krita.instance().readSetting("Pigment.O", "mix_YUV_2", "")
+            mixer_yuv_2_string = self.Settings_Read("mix_YUV_2")
             mixer_yuv_2_split = mixer_yuv_2_string.split(",")
-            mixer_yuv_2_left = eval(mixer_yuv_2_split[0])
-            mixer_yuv_2_right = eval(mixer_yuv_2_split[4])
+            mixer_yuv_2_left = self.Settings_Value(mixer_yuv_2_split[0])
+            mixer_yuv_2_right = self.Settings_Value(mixer_yuv_2_split[4])
             if (mixer_yuv_2_left == True and mixer_yuv_2_right == True):
                 # Gradient
                 self.color_yuv_l2 = [True, float(mixer_yuv_2_split[1]), float(mixer_yuv_2_split[2]), float(mixer_yuv_2_split[3])]
@@ -23874,10 +23631,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.yuv_l2.setStyleSheet(self.bg_alpha)
                 self.layout.yuv_r2.setStyleSheet(color_yuv_right_2)
             # Mixer YUV 3
-            mixer_yuv_3_string = Krita.instance().readSetting("Pigment.O", "mix_YUV_3", "")
+            mixer_yuv_3_string = self.Settings_Read("mix_YUV_3")
             mixer_yuv_3_split = mixer_yuv_3_string.split(",")
-            mixer_yuv_3_left = eval(mixer_yuv_3_split[0])
-            mixer_yuv_3_right = eval(mixer_yuv_3_split[4])
+            mixer_yuv_3_left = self.Settings_Value(mixer_yuv_3_split[0])
+            mixer_yuv_3_right = self.Settings_Value(mixer_yuv_3_split[4])
             if (mixer_yuv_3_left == True and mixer_yuv_3_right == True):
                 # Gradient
                 self.color_yuv_l3 = [True, float(mixer_yuv_3_split[1]), float(mixer_yuv_3_split[2]), float(mixer_yuv_3_split[3])]
@@ -23910,10 +23667,10 @@ class PigmentO_Docker(DockWidget):
         #\\ Mixer ARD ##########################################################
         try:
             # Mixer ARD 1
-            mixer_ard_1_string = Krita.instance().readSetting("Pigment.O", "mix_ARD_1", "")
+            mixer_ard_1_string = self.Settings_Read("mix_ARD_1")
             mixer_ard_1_split = mixer_ard_1_string.split(",")
-            mixer_ard_1_left = eval(mixer_ard_1_split[0])
-            mixer_ard_1_right = eval(mixer_ard_1_split[4])
+            mixer_ard_1_left = self.Settings_Value(mixer_ard_1_split[0])
+            mixer_ard_1_right = self.Settings_Value(mixer_ard_1_split[4])
             if (mixer_ard_1_left == True and mixer_ard_1_right == True):
                 # Gradient
                 self.color_ard_l1 = [True, float(mixer_ard_1_split[1]), float(mixer_ard_1_split[2]), float(mixer_ard_1_split[3])]
@@ -23941,10 +23698,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.ard_l1.setStyleSheet(self.bg_alpha)
                 self.layout.ard_r1.setStyleSheet(color_ard_right_1)
             # Mixer ARD 2
-            mixer_ard_2_string = Krita.instance().readSetting("Pigment.O", "mix_ARD_2", "")
+            mixer_ard_2_string = self.Settings_Read("mix_ARD_2")
             mixer_ard_2_split = mixer_ard_2_string.split(",")
-            mixer_ard_2_left = eval(mixer_ard_2_split[0])
-            mixer_ard_2_right = eval(mixer_ard_2_split[4])
+            mixer_ard_2_left = self.Settings_Value(mixer_ard_2_split[0])
+            mixer_ard_2_right = self.Settings_Value(mixer_ard_2_split[4])
             if (mixer_ard_2_left == True and mixer_ard_2_right == True):
                 # Gradient
                 self.color_ard_l2 = [True, float(mixer_ard_2_split[1]), float(mixer_ard_2_split[2]), float(mixer_ard_2_split[3])]
@@ -23972,10 +23729,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.ard_l2.setStyleSheet(self.bg_alpha)
                 self.layout.ard_r2.setStyleSheet(color_ard_right_2)
             # Mixer ARD 3
-            mixer_ard_3_string = Krita.instance().readSetting("Pigment.O", "mix_ARD_3", "")
+            mixer_ard_3_string = self.Settings_Read("mix_ARD_3")
             mixer_ard_3_split = mixer_ard_3_string.split(",")
-            mixer_ard_3_left = eval(mixer_ard_3_split[0])
-            mixer_ard_3_right = eval(mixer_ard_3_split[4])
+            mixer_ard_3_left = self.Settings_Value(mixer_ard_3_split[0])
+            mixer_ard_3_right = self.Settings_Value(mixer_ard_3_split[4])
             if (mixer_ard_3_left == True and mixer_ard_3_right == True):
                 # Gradient
                 self.color_ard_l3 = [True, float(mixer_ard_3_split[1]), float(mixer_ard_3_split[2]), float(mixer_ard_3_split[3])]
@@ -24008,10 +23765,10 @@ class PigmentO_Docker(DockWidget):
         #\\ Mixer HSV ##########################################################
         try:
             # Mixer HSV 1
-            mixer_hsv_1_string = Krita.instance().readSetting("Pigment.O", "mix_HSV_1", "")
+            mixer_hsv_1_string = self.Settings_Read("mix_HSV_1")
             mixer_hsv_1_split = mixer_hsv_1_string.split(",")
-            mixer_hsv_1_left = eval(mixer_hsv_1_split[0])
-            mixer_hsv_1_right = eval(mixer_hsv_1_split[4])
+            mixer_hsv_1_left = self.Settings_Value(mixer_hsv_1_split[0])
+            mixer_hsv_1_right = self.Settings_Value(mixer_hsv_1_split[4])
             if (mixer_hsv_1_left == True and mixer_hsv_1_right == True):
                 # Gradient
                 self.color_hsv_l1 = [True, float(mixer_hsv_1_split[1]), float(mixer_hsv_1_split[2]), float(mixer_hsv_1_split[3])]
@@ -24039,10 +23796,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.hsv_l1.setStyleSheet(self.bg_alpha)
                 self.layout.hsv_r1.setStyleSheet(color_hsv_right_1)
             # Mixer HSV 2
-            mixer_hsv_2_string = Krita.instance().readSetting("Pigment.O", "mix_HSV_2", "")
+            mixer_hsv_2_string = self.Settings_Read("mix_HSV_2")
             mixer_hsv_2_split = mixer_hsv_2_string.split(",")
-            mixer_hsv_2_left = eval(mixer_hsv_2_split[0])
-            mixer_hsv_2_right = eval(mixer_hsv_2_split[4])
+            mixer_hsv_2_left = self.Settings_Value(mixer_hsv_2_split[0])
+            mixer_hsv_2_right = self.Settings_Value(mixer_hsv_2_split[4])
             if (mixer_hsv_2_left == True and mixer_hsv_2_right == True):
                 # Gradient
                 self.color_hsv_l2 = [True, float(mixer_hsv_2_split[1]), float(mixer_hsv_2_split[2]), float(mixer_hsv_2_split[3])]
@@ -24070,10 +23827,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.hsv_l2.setStyleSheet(self.bg_alpha)
                 self.layout.hsv_r2.setStyleSheet(color_hsv_right_2)
             # Mixer HSV 3
-            mixer_hsv_3_string = Krita.instance().readSetting("Pigment.O", "mix_HSV_3", "")
+            mixer_hsv_3_string = self.Settings_Read("mix_HSV_3")
             mixer_hsv_3_split = mixer_hsv_3_string.split(",")
-            mixer_hsv_3_left = eval(mixer_hsv_3_split[0])
-            mixer_hsv_3_right = eval(mixer_hsv_3_split[4])
+            mixer_hsv_3_left = self.Settings_Value(mixer_hsv_3_split[0])
+            mixer_hsv_3_right = self.Settings_Value(mixer_hsv_3_split[4])
             if (mixer_hsv_3_left == True and mixer_hsv_3_right == True):
                 # Gradient
                 self.color_hsv_l3 = [True, float(mixer_hsv_3_split[1]), float(mixer_hsv_3_split[2]), float(mixer_hsv_3_split[3])]
@@ -24106,10 +23863,10 @@ class PigmentO_Docker(DockWidget):
         #\\ Mixer HSL ##########################################################
         try:
             # Mixer HSL 1
-            mixer_hsl_1_string = Krita.instance().readSetting("Pigment.O", "mix_HSL_1", "")
+            mixer_hsl_1_string = self.Settings_Read("mix_HSL_1")
             mixer_hsl_1_split = mixer_hsl_1_string.split(",")
-            mixer_hsl_1_left = eval(mixer_hsl_1_split[0])
-            mixer_hsl_1_right = eval(mixer_hsl_1_split[4])
+            mixer_hsl_1_left = self.Settings_Value(mixer_hsl_1_split[0])
+            mixer_hsl_1_right = self.Settings_Value(mixer_hsl_1_split[4])
             if (mixer_hsl_1_left == True and mixer_hsl_1_right == True):
                 # Gradient
                 self.color_hsl_l1 = [True, float(mixer_hsl_1_split[1]), float(mixer_hsl_1_split[2]), float(mixer_hsl_1_split[3])]
@@ -24137,10 +23894,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.hsl_l1.setStyleSheet(self.bg_alpha)
                 self.layout.hsl_r1.setStyleSheet(color_hsl_right_1)
             # Mixer HSL 2
-            mixer_hsl_2_string = Krita.instance().readSetting("Pigment.O", "mix_HSL_2", "")
+            mixer_hsl_2_string = self.Settings_Read("mix_HSL_2")
             mixer_hsl_2_split = mixer_hsl_2_string.split(",")
-            mixer_hsl_2_left = eval(mixer_hsl_2_split[0])
-            mixer_hsl_2_right = eval(mixer_hsl_2_split[4])
+            mixer_hsl_2_left = self.Settings_Value(mixer_hsl_2_split[0])
+            mixer_hsl_2_right = self.Settings_Value(mixer_hsl_2_split[4])
             if (mixer_hsl_2_left == True and mixer_hsl_2_right == True):
                 # Gradient
                 self.color_hsl_l2 = [True, float(mixer_hsl_2_split[1]), float(mixer_hsl_2_split[2]), float(mixer_hsl_2_split[3])]
@@ -24168,10 +23925,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.hsl_l2.setStyleSheet(self.bg_alpha)
                 self.layout.hsl_r2.setStyleSheet(color_hsl_right_2)
             # Mixer HSL 3
-            mixer_hsl_3_string = Krita.instance().readSetting("Pigment.O", "mix_HSL_3", "")
+            mixer_hsl_3_string = self.Settings_Read("mix_HSL_3")
             mixer_hsl_3_split = mixer_hsl_3_string.split(",")
-            mixer_hsl_3_left = eval(mixer_hsl_3_split[0])
-            mixer_hsl_3_right = eval(mixer_hsl_3_split[4])
+            mixer_hsl_3_left = self.Settings_Value(mixer_hsl_3_split[0])
+            mixer_hsl_3_right = self.Settings_Value(mixer_hsl_3_split[4])
             if (mixer_hsl_3_left == True and mixer_hsl_3_right == True):
                 # Gradient
                 self.color_hsl_l3 = [True, float(mixer_hsl_3_split[1]), float(mixer_hsl_3_split[2]), float(mixer_hsl_3_split[3])]
@@ -24204,10 +23961,10 @@ class PigmentO_Docker(DockWidget):
         #\\ Mixer HCY ##########################################################
         try:
             # Mixer HCY 1
-            mixer_hcy_1_string = Krita.instance().readSetting("Pigment.O", "mix_HCY_1", "")
+            mixer_hcy_1_string = self.Settings_Read("mix_HCY_1")
             mixer_hcy_1_split = mixer_hcy_1_string.split(",")
-            mixer_hcy_1_left = eval(mixer_hcy_1_split[0])
-            mixer_hcy_1_right = eval(mixer_hcy_1_split[4])
+            mixer_hcy_1_left = self.Settings_Value(mixer_hcy_1_split[0])
+            mixer_hcy_1_right = self.Settings_Value(mixer_hcy_1_split[4])
             if (mixer_hcy_1_left == True and mixer_hcy_1_right == True):
                 # Gradient
                 self.color_hcy_l1 = [True, float(mixer_hcy_1_split[1]), float(mixer_hcy_1_split[2]), float(mixer_hcy_1_split[3])]
@@ -24235,10 +23992,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.hcy_l1.setStyleSheet(self.bg_alpha)
                 self.layout.hcy_r1.setStyleSheet(color_hcy_right_1)
             # Mixer HCY 2
-            mixer_hcy_2_string = Krita.instance().readSetting("Pigment.O", "mix_HCY_2", "")
+            mixer_hcy_2_string = self.Settings_Read("mix_HCY_2")
             mixer_hcy_2_split = mixer_hcy_2_string.split(",")
-            mixer_hcy_2_left = eval(mixer_hcy_2_split[0])
-            mixer_hcy_2_right = eval(mixer_hcy_2_split[4])
+            mixer_hcy_2_left = self.Settings_Value(mixer_hcy_2_split[0])
+            mixer_hcy_2_right = self.Settings_Value(mixer_hcy_2_split[4])
             if (mixer_hcy_2_left == True and mixer_hcy_2_right == True):
                 # Gradient
                 self.color_hcy_l2 = [True, float(mixer_hcy_2_split[1]), float(mixer_hcy_2_split[2]), float(mixer_hcy_2_split[3])]
@@ -24266,10 +24023,10 @@ class PigmentO_Docker(DockWidget):
                 self.layout.hcy_l2.setStyleSheet(self.bg_alpha)
                 self.layout.hcy_r2.setStyleSheet(color_hcy_right_2)
             # Mixer HCY 3
-            mixer_hcy_3_string = Krita.instance().readSetting("Pigment.O", "mix_HCY_3", "")
+            mixer_hcy_3_string = self.Settings_Read("mix_HCY_3")
             mixer_hcy_3_split = mixer_hcy_3_string.split(",")
-            mixer_hcy_3_left = eval(mixer_hcy_3_split[0])
-            mixer_hcy_3_right = eval(mixer_hcy_3_split[4])
+            mixer_hcy_3_left = self.Settings_Value(mixer_hcy_3_split[0])
+            mixer_hcy_3_right = self.Settings_Value(mixer_hcy_3_split[4])
             if (mixer_hcy_3_left == True and mixer_hcy_3_right == True):
                 # Gradient
                 self.color_hcy_l3 = [True, float(mixer_hcy_3_split[1]), float(mixer_hcy_3_split[2]), float(mixer_hcy_3_split[3])]
@@ -24299,6 +24056,398 @@ class PigmentO_Docker(DockWidget):
         except:
             QtCore.qWarning("Pigment.O - Load Error - Mixer HCY")
         #//
+        #\\ Mixer OKLAB ########################################################
+        try:
+            # Mixer OKLAB 1
+            mixer_oklab_1_string = self.Settings_Read("mix_OKLAB_1")
+            mixer_oklab_1_split = mixer_oklab_1_string.split(",")
+            mixer_oklab_1_left = self.Settings_Value(mixer_oklab_1_split[0])
+            mixer_oklab_1_right = self.Settings_Value(mixer_oklab_1_split[4])
+            if (mixer_oklab_1_left == True and mixer_oklab_1_right == True):
+                # Gradient
+                self.color_oklab_l1 = [True, float(mixer_oklab_1_split[1]), float(mixer_oklab_1_split[2]), float(mixer_oklab_1_split[3])]
+                self.color_oklab_r1 = [True, float(mixer_oklab_1_split[5]), float(mixer_oklab_1_split[6]), float(mixer_oklab_1_split[7])]
+                rgb_oklab_l1 = self.oklab_channels_to_rgb(self.color_oklab_l1[1], self.color_oklab_l1[2], self.color_oklab_l1[3])
+                rgb_oklab_r1 = self.oklab_channels_to_rgb(self.color_oklab_r1[1], self.color_oklab_r1[2], self.color_oklab_r1[3])
+                color_oklab_left_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklab_l1[0]*255, rgb_oklab_l1[1]*255, rgb_oklab_l1[2]*255))
+                color_oklab_right_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklab_r1[0]*255, rgb_oklab_r1[1]*255, rgb_oklab_r1[2]*255))
+                self.layout.oklab_l1.setStyleSheet(color_oklab_left_1)
+                self.layout.oklab_r1.setStyleSheet(color_oklab_right_1)
+            elif (mixer_oklab_1_left == True and mixer_oklab_1_right != True):
+                # Color Left
+                self.color_oklab_l1 = [True, float(mixer_oklab_1_split[1]), float(mixer_oklab_1_split[2]), float(mixer_oklab_1_split[3])]
+                self.color_oklab_r1 = [False, 0, 0, 0]
+                rgb_oklab_l1 = self.oklab_channels_to_rgb(self.color_oklab_l1[1], self.color_oklab_l1[2], self.color_oklab_l1[3])
+                color_oklab_left_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklab_l1[0]*255, rgb_oklab_l1[1]*255, rgb_oklab_l1[2]*255))
+                self.layout.oklab_l1.setStyleSheet(color_oklab_left_1)
+                self.layout.oklab_r1.setStyleSheet(self.bg_alpha)
+            elif (mixer_oklab_1_left != True and mixer_oklab_1_right == True):
+                # Color Right
+                self.color_oklab_l1 = [False, 0, 0, 0]
+                self.color_oklab_r1 = [True, float(mixer_oklab_1_split[5]), float(mixer_oklab_1_split[6]), float(mixer_oklab_1_split[7])]
+                rgb_oklab_r1 = self.oklab_channels_to_rgb(self.color_oklab_r1[1], self.color_oklab_r1[2], self.color_oklab_r1[3])
+                color_oklab_right_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklab_r1[0]*255, rgb_oklab_r1[1]*255, rgb_oklab_r1[2]*255))
+                self.layout.oklab_l1.setStyleSheet(self.bg_alpha)
+                self.layout.oklab_r1.setStyleSheet(color_oklab_right_1)
+            # Mixer OKLAB 2
+            mixer_oklab_2_string = self.Settings_Read("mix_OKLAB_2")
+            mixer_oklab_2_split = mixer_oklab_2_string.split(",")
+            mixer_oklab_2_left = self.Settings_Value(mixer_oklab_2_split[0])
+            mixer_oklab_2_right = self.Settings_Value(mixer_oklab_2_split[4])
+            if (mixer_oklab_2_left == True and mixer_oklab_2_right == True):
+                # Gradient
+                self.color_oklab_l2 = [True, float(mixer_oklab_2_split[1]), float(mixer_oklab_2_split[2]), float(mixer_oklab_2_split[3])]
+                self.color_oklab_r2 = [True, float(mixer_oklab_2_split[5]), float(mixer_oklab_2_split[6]), float(mixer_oklab_2_split[7])]
+                rgb_oklab_l2 = self.oklab_channels_to_rgb(self.color_oklab_l2[1], self.color_oklab_l2[2], self.color_oklab_l2[3])
+                rgb_oklab_r2 = self.oklab_channels_to_rgb(self.color_oklab_r2[1], self.color_oklab_r2[2], self.color_oklab_r2[3])
+                color_oklab_left_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklab_l2[0]*255, rgb_oklab_l2[1]*255, rgb_oklab_l2[2]*255))
+                color_oklab_right_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklab_r2[0]*255, rgb_oklab_r2[1]*255, rgb_oklab_r2[2]*255))
+                self.layout.oklab_l2.setStyleSheet(color_oklab_left_2)
+                self.layout.oklab_r2.setStyleSheet(color_oklab_right_2)
+            elif (mixer_oklab_2_left == True and mixer_oklab_2_right != True):
+                # Color Left
+                self.color_oklab_l2 = [True, float(mixer_oklab_2_split[1]), float(mixer_oklab_2_split[2]), float(mixer_oklab_2_split[3])]
+                self.color_oklab_r2 = [False, 0, 0, 0]
+                rgb_oklab_l2 = self.oklab_channels_to_rgb(self.color_oklab_l2[1], self.color_oklab_l2[2], self.color_oklab_l2[3])
+                color_oklab_left_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklab_l2[0]*255, rgb_oklab_l2[1]*255, rgb_oklab_l2[2]*255))
+                self.layout.oklab_l2.setStyleSheet(color_oklab_left_2)
+                self.layout.oklab_r2.setStyleSheet(self.bg_alpha)
+            elif (mixer_oklab_2_left != True and mixer_oklab_2_right == True):
+                # Color Right
+                self.color_oklab_l2 = [False, 0, 0, 0]
+                self.color_oklab_r2 = [True, float(mixer_oklab_2_split[5]), float(mixer_oklab_2_split[6]), float(mixer_oklab_2_split[7])]
+                rgb_oklab_r2 = self.oklab_channels_to_rgb(self.color_oklab_r2[1], self.color_oklab_r2[2], self.color_oklab_r2[3])
+                color_oklab_right_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklab_r2[0]*255, rgb_oklab_r2[1]*255, rgb_oklab_r2[2]*255))
+                self.layout.oklab_l2.setStyleSheet(self.bg_alpha)
+                self.layout.oklab_r2.setStyleSheet(color_oklab_right_2)
+            # Mixer OKLAB 3
+            mixer_oklab_3_string = self.Settings_Read("mix_OKLAB_3")
+            mixer_oklab_3_split = mixer_oklab_3_string.split(",")
+            mixer_oklab_3_left = self.Settings_Value(mixer_oklab_3_split[0])
+            mixer_oklab_3_right = self.Settings_Value(mixer_oklab_3_split[4])
+            if (mixer_oklab_3_left == True and mixer_oklab_3_right == True):
+                # Gradient
+                self.color_oklab_l3 = [True, float(mixer_oklab_3_split[1]), float(mixer_oklab_3_split[2]), float(mixer_oklab_3_split[3])]
+                self.color_oklab_r3 = [True, float(mixer_oklab_3_split[5]), float(mixer_oklab_3_split[6]), float(mixer_oklab_3_split[7])]
+                rgb_oklab_l3 = self.oklab_channels_to_rgb(self.color_oklab_l3[1], self.color_oklab_l3[2], self.color_oklab_l3[3])
+                rgb_oklab_r3 = self.oklab_channels_to_rgb(self.color_oklab_r3[1], self.color_oklab_r3[2], self.color_oklab_r3[3])
+                color_oklab_left_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklab_l3[0]*255, rgb_oklab_l3[1]*255, rgb_oklab_l3[2]*255))
+                color_oklab_right_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklab_r3[0]*255, rgb_oklab_r3[1]*255, rgb_oklab_r3[2]*255))
+                self.layout.oklab_l3.setStyleSheet(color_oklab_left_3)
+                self.layout.oklab_r3.setStyleSheet(color_oklab_right_3)
+            elif (mixer_oklab_3_left == True and mixer_oklab_3_right != True):
+                # Color Left
+                self.color_oklab_l3 = [True, float(mixer_oklab_3_split[1]), float(mixer_oklab_3_split[2]), float(mixer_oklab_3_split[3])]
+                self.color_oklab_r3 = [False, 0, 0, 0]
+                rgb_oklab_l3 = self.oklab_channels_to_rgb(self.color_oklab_l3[1], self.color_oklab_l3[2], self.color_oklab_l3[3])
+                color_oklab_left_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklab_l3[0]*255, rgb_oklab_l3[1]*255, rgb_oklab_l3[2]*255))
+                self.layout.oklab_l3.setStyleSheet(color_oklab_left_3)
+                self.layout.oklab_r3.setStyleSheet(self.bg_alpha)
+            elif (mixer_oklab_3_left != True and mixer_oklab_3_right == True):
+                # Color Right
+                self.color_oklab_l3 = [False, 0, 0, 0]
+                self.color_oklab_r3 = [True, float(mixer_oklab_3_split[5]), float(mixer_oklab_3_split[6]), float(mixer_oklab_3_split[7])]
+                rgb_oklab_r3 = self.oklab_channels_to_rgb(self.color_oklab_r3[1], self.color_oklab_r3[2], self.color_oklab_r3[3])
+                color_oklab_right_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklab_r3[0]*255, rgb_oklab_r3[1]*255, rgb_oklab_r3[2]*255))
+                self.layout.oklab_l3.setStyleSheet(self.bg_alpha)
+                self.layout.oklab_r3.setStyleSheet(color_oklab_right_3)
+        except:
+            QtCore.qWarning("Pigment.O - Load Error - Mixer OKLAB")
+        #//
+        #\\ Mixer OKLCH ########################################################
+        try:
+            # Mixer OKLCH 1
+            mixer_oklch_1_string = self.Settings_Read("mix_OKLCH_1")
+            mixer_oklch_1_split = mixer_oklch_1_string.split(",")
+            mixer_oklch_1_left = self.Settings_Value(mixer_oklch_1_split[0])
+            mixer_oklch_1_right = self.Settings_Value(mixer_oklch_1_split[4])
+            if (mixer_oklch_1_left == True and mixer_oklch_1_right == True):
+                # Gradient
+                self.color_oklch_l1 = [True, float(mixer_oklch_1_split[1]), float(mixer_oklch_1_split[2]), float(mixer_oklch_1_split[3])]
+                self.color_oklch_r1 = [True, float(mixer_oklch_1_split[5]), float(mixer_oklch_1_split[6]), float(mixer_oklch_1_split[7])]
+                rgb_oklch_l1 = self.oklch_channels_to_rgb(self.color_oklch_l1[1], self.color_oklch_l1[2], self.color_oklch_l1[3])
+                rgb_oklch_r1 = self.oklch_channels_to_rgb(self.color_oklch_r1[1], self.color_oklch_r1[2], self.color_oklch_r1[3])
+                color_oklch_left_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklch_l1[0]*255, rgb_oklch_l1[1]*255, rgb_oklch_l1[2]*255))
+                color_oklch_right_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklch_r1[0]*255, rgb_oklch_r1[1]*255, rgb_oklch_r1[2]*255))
+                self.layout.oklch_l1.setStyleSheet(color_oklch_left_1)
+                self.layout.oklch_r1.setStyleSheet(color_oklch_right_1)
+            elif (mixer_oklch_1_left == True and mixer_oklch_1_right != True):
+                # Color Left
+                self.color_oklch_l1 = [True, float(mixer_oklch_1_split[1]), float(mixer_oklch_1_split[2]), float(mixer_oklch_1_split[3])]
+                self.color_oklch_r1 = [False, 0, 0, 0]
+                rgb_oklch_l1 = self.oklch_channels_to_rgb(self.color_oklch_l1[1], self.color_oklch_l1[2], self.color_oklch_l1[3])
+                color_oklch_left_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklch_l1[0]*255, rgb_oklch_l1[1]*255, rgb_oklch_l1[2]*255))
+                self.layout.oklch_l1.setStyleSheet(color_oklch_left_1)
+                self.layout.oklch_r1.setStyleSheet(self.bg_alpha)
+            elif (mixer_oklch_1_left != True and mixer_oklch_1_right == True):
+                # Color Right
+                self.color_oklch_l1 = [False, 0, 0, 0]
+                self.color_oklch_r1 = [True, float(mixer_oklch_1_split[5]), float(mixer_oklch_1_split[6]), float(mixer_oklch_1_split[7])]
+                rgb_oklch_r1 = self.oklch_channels_to_rgb(self.color_oklch_r1[1], self.color_oklch_r1[2], self.color_oklch_r1[3])
+                color_oklch_right_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklch_r1[0]*255, rgb_oklch_r1[1]*255, rgb_oklch_r1[2]*255))
+                self.layout.oklch_l1.setStyleSheet(self.bg_alpha)
+                self.layout.oklch_r1.setStyleSheet(color_oklch_right_1)
+            # Mixer OKLCH 2
+            mixer_oklch_2_string = self.Settings_Read("mix_OKLCH_2")
+            mixer_oklch_2_split = mixer_oklch_2_string.split(",")
+            mixer_oklch_2_left = self.Settings_Value(mixer_oklch_2_split[0])
+            mixer_oklch_2_right = self.Settings_Value(mixer_oklch_2_split[4])
+            if (mixer_oklch_2_left == True and mixer_oklch_2_right == True):
+                # Gradient
+                self.color_oklch_l2 = [True, float(mixer_oklch_2_split[1]), float(mixer_oklch_2_split[2]), float(mixer_oklch_2_split[3])]
+                self.color_oklch_r2 = [True, float(mixer_oklch_2_split[5]), float(mixer_oklch_2_split[6]), float(mixer_oklch_2_split[7])]
+                rgb_oklch_l2 = self.oklch_channels_to_rgb(self.color_oklch_l2[1], self.color_oklch_l2[2], self.color_oklch_l2[3])
+                rgb_oklch_r2 = self.oklch_channels_to_rgb(self.color_oklch_r2[1], self.color_oklch_r2[2], self.color_oklch_r2[3])
+                color_oklch_left_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklch_l2[0]*255, rgb_oklch_l2[1]*255, rgb_oklch_l2[2]*255))
+                color_oklch_right_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklch_r2[0]*255, rgb_oklch_r2[1]*255, rgb_oklch_r2[2]*255))
+                self.layout.oklch_l2.setStyleSheet(color_oklch_left_2)
+                self.layout.oklch_r2.setStyleSheet(color_oklch_right_2)
+            elif (mixer_oklch_2_left == True and mixer_oklch_2_right != True):
+                # Color Left
+                self.color_oklch_l2 = [True, float(mixer_oklch_2_split[1]), float(mixer_oklch_2_split[2]), float(mixer_oklch_2_split[3])]
+                self.color_oklch_r2 = [False, 0, 0, 0]
+                rgb_oklch_l2 = self.oklch_channels_to_rgb(self.color_oklch_l2[1], self.color_oklch_l2[2], self.color_oklch_l2[3])
+                color_oklch_left_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklch_l2[0]*255, rgb_oklch_l2[1]*255, rgb_oklch_l2[2]*255))
+                self.layout.oklch_l2.setStyleSheet(color_oklch_left_2)
+                self.layout.oklch_r2.setStyleSheet(self.bg_alpha)
+            elif (mixer_oklch_2_left != True and mixer_oklch_2_right == True):
+                # Color Right
+                self.color_oklch_l2 = [False, 0, 0, 0]
+                self.color_oklch_r2 = [True, float(mixer_oklch_2_split[5]), float(mixer_oklch_2_split[6]), float(mixer_oklch_2_split[7])]
+                rgb_oklch_r2 = self.oklch_channels_to_rgb(self.color_oklch_r2[1], self.color_oklch_r2[2], self.color_oklch_r2[3])
+                color_oklch_right_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklch_r2[0]*255, rgb_oklch_r2[1]*255, rgb_oklch_r2[2]*255))
+                self.layout.oklch_l2.setStyleSheet(self.bg_alpha)
+                self.layout.oklch_r2.setStyleSheet(color_oklch_right_2)
+            # Mixer OKLCH 3
+            mixer_oklch_3_string = self.Settings_Read("mix_OKLCH_3")
+            mixer_oklch_3_split = mixer_oklch_3_string.split(",")
+            mixer_oklch_3_left = self.Settings_Value(mixer_oklch_3_split[0])
+            mixer_oklch_3_right = self.Settings_Value(mixer_oklch_3_split[4])
+            if (mixer_oklch_3_left == True and mixer_oklch_3_right == True):
+                # Gradient
+                self.color_oklch_l3 = [True, float(mixer_oklch_3_split[1]), float(mixer_oklch_3_split[2]), float(mixer_oklch_3_split[3])]
+                self.color_oklch_r3 = [True, float(mixer_oklch_3_split[5]), float(mixer_oklch_3_split[6]), float(mixer_oklch_3_split[7])]
+                rgb_oklch_l3 = self.oklch_channels_to_rgb(self.color_oklch_l3[1], self.color_oklch_l3[2], self.color_oklch_l3[3])
+                rgb_oklch_r3 = self.oklch_channels_to_rgb(self.color_oklch_r3[1], self.color_oklch_r3[2], self.color_oklch_r3[3])
+                color_oklch_left_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklch_l3[0]*255, rgb_oklch_l3[1]*255, rgb_oklch_l3[2]*255))
+                color_oklch_right_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklch_r3[0]*255, rgb_oklch_r3[1]*255, rgb_oklch_r3[2]*255))
+                self.layout.oklch_l3.setStyleSheet(color_oklch_left_3)
+                self.layout.oklch_r3.setStyleSheet(color_oklch_right_3)
+            elif (mixer_oklch_3_left == True and mixer_oklch_3_right != True):
+                # Color Left
+                self.color_oklch_l3 = [True, float(mixer_oklch_3_split[1]), float(mixer_oklch_3_split[2]), float(mixer_oklch_3_split[3])]
+                self.color_oklch_r3 = [False, 0, 0, 0]
+                rgb_oklch_l3 = self.oklch_channels_to_rgb(self.color_oklch_l3[1], self.color_oklch_l3[2], self.color_oklch_l3[3])
+                color_oklch_left_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklch_l3[0]*255, rgb_oklch_l3[1]*255, rgb_oklch_l3[2]*255))
+                self.layout.oklch_l3.setStyleSheet(color_oklch_left_3)
+                self.layout.oklch_r3.setStyleSheet(self.bg_alpha)
+            elif (mixer_oklch_3_left != True and mixer_oklch_3_right == True):
+                # Color Right
+                self.color_oklch_l3 = [False, 0, 0, 0]
+                self.color_oklch_r3 = [True, float(mixer_oklch_3_split[5]), float(mixer_oklch_3_split[6]), float(mixer_oklch_3_split[7])]
+                rgb_oklch_r3 = self.oklch_channels_to_rgb(self.color_oklch_r3[1], self.color_oklch_r3[2], self.color_oklch_r3[3])
+                color_oklch_right_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_oklch_r3[0]*255, rgb_oklch_r3[1]*255, rgb_oklch_r3[2]*255))
+                self.layout.oklch_l3.setStyleSheet(self.bg_alpha)
+                self.layout.oklch_r3.setStyleSheet(color_oklch_right_3)
+        except:
+            QtCore.qWarning("Pigment.O - Load Error - Mixer OKLCH")
+        #//
+        #\\ Mixer OKHSV ########################################################
+        try:
+            # Mixer OKHSV 1
+            mixer_okhsv_1_string = self.Settings_Read("mix_OKHSV_1")
+            mixer_okhsv_1_split = mixer_okhsv_1_string.split(",")
+            mixer_okhsv_1_left = self.Settings_Value(mixer_okhsv_1_split[0])
+            mixer_okhsv_1_right = self.Settings_Value(mixer_okhsv_1_split[4])
+            if (mixer_okhsv_1_left == True and mixer_okhsv_1_right == True):
+                # Gradient
+                self.color_okhsv_l1 = [True, float(mixer_okhsv_1_split[1]), float(mixer_okhsv_1_split[2]), float(mixer_okhsv_1_split[3])]
+                self.color_okhsv_r1 = [True, float(mixer_okhsv_1_split[5]), float(mixer_okhsv_1_split[6]), float(mixer_okhsv_1_split[7])]
+                rgb_okhsv_l1 = self.okhsv_to_rgb(self.color_okhsv_l1[1], self.color_okhsv_l1[2], self.color_okhsv_l1[3])
+                rgb_okhsv_r1 = self.okhsv_to_rgb(self.color_okhsv_r1[1], self.color_okhsv_r1[2], self.color_okhsv_r1[3])
+                color_okhsv_left_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsv_l1[0]*255, rgb_okhsv_l1[1]*255, rgb_okhsv_l1[2]*255))
+                color_okhsv_right_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsv_r1[0]*255, rgb_okhsv_r1[1]*255, rgb_okhsv_r1[2]*255))
+                self.layout.okhsv_l1.setStyleSheet(color_okhsv_left_1)
+                self.layout.okhsv_r1.setStyleSheet(color_okhsv_right_1)
+            elif (mixer_okhsv_1_left == True and mixer_okhsv_1_right != True):
+                # Color Left
+                self.color_okhsv_l1 = [True, float(mixer_okhsv_1_split[1]), float(mixer_okhsv_1_split[2]), float(mixer_okhsv_1_split[3])]
+                self.color_okhsv_r1 = [False, 0, 0, 0]
+                rgb_okhsv_l1 = self.okhsv_to_rgb(self.color_okhsv_l1[1], self.color_okhsv_l1[2], self.color_okhsv_l1[3])
+                color_okhsv_left_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsv_l1[0]*255, rgb_okhsv_l1[1]*255, rgb_okhsv_l1[2]*255))
+                self.layout.okhsv_l1.setStyleSheet(color_okhsv_left_1)
+                self.layout.okhsv_r1.setStyleSheet(self.bg_alpha)
+            elif (mixer_okhsv_1_left != True and mixer_okhsv_1_right == True):
+                # Color Right
+                self.color_okhsv_l1 = [False, 0, 0, 0]
+                self.color_okhsv_r1 = [True, float(mixer_okhsv_1_split[5]), float(mixer_okhsv_1_split[6]), float(mixer_okhsv_1_split[7])]
+                rgb_okhsv_r1 = self.okhsv_to_rgb(self.color_okhsv_r1[1], self.color_okhsv_r1[2], self.color_okhsv_r1[3])
+                color_okhsv_right_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsv_r1[0]*255, rgb_okhsv_r1[1]*255, rgb_okhsv_r1[2]*255))
+                self.layout.okhsv_l1.setStyleSheet(self.bg_alpha)
+                self.layout.okhsv_r1.setStyleSheet(color_okhsv_right_1)
+            # Mixer OKHSV 2
+            mixer_okhsv_2_string = self.Settings_Read("mix_OKHSV_2")
+            mixer_okhsv_2_split = mixer_okhsv_2_string.split(",")
+            mixer_okhsv_2_left = self.Settings_Value(mixer_okhsv_2_split[0])
+            mixer_okhsv_2_right = self.Settings_Value(mixer_okhsv_2_split[4])
+            if (mixer_okhsv_2_left == True and mixer_okhsv_2_right == True):
+                # Gradient
+                self.color_okhsv_l2 = [True, float(mixer_okhsv_2_split[1]), float(mixer_okhsv_2_split[2]), float(mixer_okhsv_2_split[3])]
+                self.color_okhsv_r2 = [True, float(mixer_okhsv_2_split[5]), float(mixer_okhsv_2_split[6]), float(mixer_okhsv_2_split[7])]
+                rgb_okhsv_l2 = self.okhsv_to_rgb(self.color_okhsv_l2[1], self.color_okhsv_l2[2], self.color_okhsv_l2[3])
+                rgb_okhsv_r2 = self.okhsv_to_rgb(self.color_okhsv_r2[1], self.color_okhsv_r2[2], self.color_okhsv_r2[3])
+                color_okhsv_left_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsv_l2[0]*255, rgb_okhsv_l2[1]*255, rgb_okhsv_l2[2]*255))
+                color_okhsv_right_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsv_r2[0]*255, rgb_okhsv_r2[1]*255, rgb_okhsv_r2[2]*255))
+                self.layout.okhsv_l2.setStyleSheet(color_okhsv_left_2)
+                self.layout.okhsv_r2.setStyleSheet(color_okhsv_right_2)
+            elif (mixer_okhsv_2_left == True and mixer_okhsv_2_right != True):
+                # Color Left
+                self.color_okhsv_l2 = [True, float(mixer_okhsv_2_split[1]), float(mixer_okhsv_2_split[2]), float(mixer_okhsv_2_split[3])]
+                self.color_okhsv_r2 = [False, 0, 0, 0]
+                rgb_okhsv_l2 = self.okhsv_to_rgb(self.color_okhsv_l2[1], self.color_okhsv_l2[2], self.color_okhsv_l2[3])
+                color_okhsv_left_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsv_l2[0]*255, rgb_okhsv_l2[1]*255, rgb_okhsv_l2[2]*255))
+                self.layout.okhsv_l2.setStyleSheet(color_okhsv_left_2)
+                self.layout.okhsv_r2.setStyleSheet(self.bg_alpha)
+            elif (mixer_okhsv_2_left != True and mixer_okhsv_2_right == True):
+                # Color Right
+                self.color_okhsv_l2 = [False, 0, 0, 0]
+                self.color_okhsv_r2 = [True, float(mixer_okhsv_2_split[5]), float(mixer_okhsv_2_split[6]), float(mixer_okhsv_2_split[7])]
+                rgb_okhsv_r2 = self.okhsv_to_rgb(self.color_okhsv_r2[1], self.color_okhsv_r2[2], self.color_okhsv_r2[3])
+                color_okhsv_right_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsv_r2[0]*255, rgb_okhsv_r2[1]*255, rgb_okhsv_r2[2]*255))
+                self.layout.okhsv_l2.setStyleSheet(self.bg_alpha)
+                self.layout.okhsv_r2.setStyleSheet(color_okhsv_right_2)
+            # Mixer OKHSV 3
+            mixer_okhsv_3_string = self.Settings_Read("mix_OKHSV_3")
+            mixer_okhsv_3_split = mixer_okhsv_3_string.split(",")
+            mixer_okhsv_3_left = self.Settings_Value(mixer_okhsv_3_split[0])
+            mixer_okhsv_3_right = self.Settings_Value(mixer_okhsv_3_split[4])
+            if (mixer_okhsv_3_left == True and mixer_okhsv_3_right == True):
+                # Gradient
+                self.color_okhsv_l3 = [True, float(mixer_okhsv_3_split[1]), float(mixer_okhsv_3_split[2]), float(mixer_okhsv_3_split[3])]
+                self.color_okhsv_r3 = [True, float(mixer_okhsv_3_split[5]), float(mixer_okhsv_3_split[6]), float(mixer_okhsv_3_split[7])]
+                rgb_okhsv_l3 = self.okhsv_to_rgb(self.color_okhsv_l3[1], self.color_okhsv_l3[2], self.color_okhsv_l3[3])
+                rgb_okhsv_r3 = self.okhsv_to_rgb(self.color_okhsv_r3[1], self.color_okhsv_r3[2], self.color_okhsv_r3[3])
+                color_okhsv_left_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsv_l3[0]*255, rgb_okhsv_l3[1]*255, rgb_okhsv_l3[2]*255))
+                color_okhsv_right_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsv_r3[0]*255, rgb_okhsv_r3[1]*255, rgb_okhsv_r3[2]*255))
+                self.layout.okhsv_l3.setStyleSheet(color_okhsv_left_3)
+                self.layout.okhsv_r3.setStyleSheet(color_okhsv_right_3)
+            elif (mixer_okhsv_3_left == True and mixer_okhsv_3_right != True):
+                # Color Left
+                self.color_okhsv_l3 = [True, float(mixer_okhsv_3_split[1]), float(mixer_okhsv_3_split[2]), float(mixer_okhsv_3_split[3])]
+                self.color_okhsv_r3 = [False, 0, 0, 0]
+                rgb_okhsv_l3 = self.okhsv_to_rgb(self.color_okhsv_l3[1], self.color_okhsv_l3[2], self.color_okhsv_l3[3])
+                color_okhsv_left_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsv_l3[0]*255, rgb_okhsv_l3[1]*255, rgb_okhsv_l3[2]*255))
+                self.layout.okhsv_l3.setStyleSheet(color_okhsv_left_3)
+                self.layout.okhsv_r3.setStyleSheet(self.bg_alpha)
+            elif (mixer_okhsv_3_left != True and mixer_okhsv_3_right == True):
+                # Color Right
+                self.color_okhsv_l3 = [False, 0, 0, 0]
+                self.color_okhsv_r3 = [True, float(mixer_okhsv_3_split[5]), float(mixer_okhsv_3_split[6]), float(mixer_okhsv_3_split[7])]
+                rgb_okhsv_r3 = self.okhsv_to_rgb(self.color_okhsv_r3[1], self.color_okhsv_r3[2], self.color_okhsv_r3[3])
+                color_okhsv_right_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsv_r3[0]*255, rgb_okhsv_r3[1]*255, rgb_okhsv_r3[2]*255))
+                self.layout.okhsv_l3.setStyleSheet(self.bg_alpha)
+                self.layout.okhsv_r3.setStyleSheet(color_okhsv_right_3)
+        except:
+            QtCore.qWarning("Pigment.O - Load Error - Mixer OKHSV")
+        #//
+        #\\ Mixer OKHSL ########################################################
+        try:
+            # Mixer OKHSL 1
+            mixer_okhsl_1_string = self.Settings_Read("mix_OKHSL_1")
+            mixer_okhsl_1_split = mixer_okhsl_1_string.split(",")
+            mixer_okhsl_1_left = self.Settings_Value(mixer_okhsl_1_split[0])
+            mixer_okhsl_1_right = self.Settings_Value(mixer_okhsl_1_split[4])
+            if (mixer_okhsl_1_left == True and mixer_okhsl_1_right == True):
+                # Gradient
+                self.color_okhsl_l1 = [True, float(mixer_okhsl_1_split[1]), float(mixer_okhsl_1_split[2]), float(mixer_okhsl_1_split[3])]
+                self.color_okhsl_r1 = [True, float(mixer_okhsl_1_split[5]), float(mixer_okhsl_1_split[6]), float(mixer_okhsl_1_split[7])]
+                rgb_okhsl_l1 = self.okhsl_to_rgb(self.color_okhsl_l1[1], self.color_okhsl_l1[2], self.color_okhsl_l1[3])
+                rgb_okhsl_r1 = self.okhsl_to_rgb(self.color_okhsl_r1[1], self.color_okhsl_r1[2], self.color_okhsl_r1[3])
+                color_okhsl_left_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsl_l1[0]*255, rgb_okhsl_l1[1]*255, rgb_okhsl_l1[2]*255))
+                color_okhsl_right_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsl_r1[0]*255, rgb_okhsl_r1[1]*255, rgb_okhsl_r1[2]*255))
+                self.layout.okhsl_l1.setStyleSheet(color_okhsl_left_1)
+                self.layout.okhsl_r1.setStyleSheet(color_okhsl_right_1)
+            elif (mixer_okhsl_1_left == True and mixer_okhsl_1_right != True):
+                # Color Left
+                self.color_okhsl_l1 = [True, float(mixer_okhsl_1_split[1]), float(mixer_okhsl_1_split[2]), float(mixer_okhsl_1_split[3])]
+                self.color_okhsl_r1 = [False, 0, 0, 0]
+                rgb_okhsl_l1 = self.okhsl_to_rgb(self.color_okhsl_l1[1], self.color_okhsl_l1[2], self.color_okhsl_l1[3])
+                color_okhsl_left_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsl_l1[0]*255, rgb_okhsl_l1[1]*255, rgb_okhsl_l1[2]*255))
+                self.layout.okhsl_l1.setStyleSheet(color_okhsl_left_1)
+                self.layout.okhsl_r1.setStyleSheet(self.bg_alpha)
+            elif (mixer_okhsl_1_left != True and mixer_okhsl_1_right == True):
+                # Color Right
+                self.color_okhsl_l1 = [False, 0, 0, 0]
+                self.color_okhsl_r1 = [True, float(mixer_okhsl_1_split[5]), float(mixer_okhsl_1_split[6]), float(mixer_okhsl_1_split[7])]
+                rgb_okhsl_r1 = self.okhsl_to_rgb(self.color_okhsl_r1[1], self.color_okhsl_r1[2], self.color_okhsl_r1[3])
+                color_okhsl_right_1 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsl_r1[0]*255, rgb_okhsl_r1[1]*255, rgb_okhsl_r1[2]*255))
+                self.layout.okhsl_l1.setStyleSheet(self.bg_alpha)
+                self.layout.okhsl_r1.setStyleSheet(color_okhsl_right_1)
+            # Mixer OKHSL 2
+            mixer_okhsl_2_string = self.Settings_Read("mix_OKHSL_2")
+            mixer_okhsl_2_split = mixer_okhsl_2_string.split(",")
+            mixer_okhsl_2_left = self.Settings_Value(mixer_okhsl_2_split[0])
+            mixer_okhsl_2_right = self.Settings_Value(mixer_okhsl_2_split[4])
+            if (mixer_okhsl_2_left == True and mixer_okhsl_2_right == True):
+                # Gradient
+                self.color_okhsl_l2 = [True, float(mixer_okhsl_2_split[1]), float(mixer_okhsl_2_split[2]), float(mixer_okhsl_2_split[3])]
+                self.color_okhsl_r2 = [True, float(mixer_okhsl_2_split[5]), float(mixer_okhsl_2_split[6]), float(mixer_okhsl_2_split[7])]
+                rgb_okhsl_l2 = self.okhsl_to_rgb(self.color_okhsl_l2[1], self.color_okhsl_l2[2], self.color_okhsl_l2[3])
+                rgb_okhsl_r2 = self.okhsl_to_rgb(self.color_okhsl_r2[1], self.color_okhsl_r2[2], self.color_okhsl_r2[3])
+                color_okhsl_left_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsl_l2[0]*255, rgb_okhsl_l2[1]*255, rgb_okhsl_l2[2]*255))
+                color_okhsl_right_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsl_r2[0]*255, rgb_okhsl_r2[1]*255, rgb_okhsl_r2[2]*255))
+                self.layout.okhsl_l2.setStyleSheet(color_okhsl_left_2)
+                self.layout.okhsl_r2.setStyleSheet(color_okhsl_right_2)
+            elif (mixer_okhsl_2_left == True and mixer_okhsl_2_right != True):
+                # Color Left
+                self.color_okhsl_l2 = [True, float(mixer_okhsl_2_split[1]), float(mixer_okhsl_2_split[2]), float(mixer_okhsl_2_split[3])]
+                self.color_okhsl_r2 = [False, 0, 0, 0]
+                rgb_okhsl_l2 = self.okhsl_to_rgb(self.color_okhsl_l2[1], self.color_okhsl_l2[2], self.color_okhsl_l2[3])
+                color_okhsl_left_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsl_l2[0]*255, rgb_okhsl_l2[1]*255, rgb_okhsl_l2[2]*255))
+                self.layout.okhsl_l2.setStyleSheet(color_okhsl_left_2)
+                self.layout.okhsl_r2.setStyleSheet(self.bg_alpha)
+            elif (mixer_okhsl_2_left != True and mixer_okhsl_2_right == True):
+                # Color Right
+                self.color_okhsl_l2 = [False, 0, 0, 0]
+                self.color_okhsl_r2 = [True, float(mixer_okhsl_2_split[5]), float(mixer_okhsl_2_split[6]), float(mixer_okhsl_2_split[7])]
+                rgb_okhsl_r2 = self.okhsl_to_rgb(self.color_okhsl_r2[1], self.color_okhsl_r2[2], self.color_okhsl_r2[3])
+                color_okhsl_right_2 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsl_r2[0]*255, rgb_okhsl_r2[1]*255, rgb_okhsl_r2[2]*255))
+                self.layout.okhsl_l2.setStyleSheet(self.bg_alpha)
+                self.layout.okhsl_r2.setStyleSheet(color_okhsl_right_2)
+            # Mixer OKHSL 3
+            mixer_okhsl_3_string = self.Settings_Read("mix_OKHSL_3")
+            mixer_okhsl_3_split = mixer_okhsl_3_string.split(",")
+            mixer_okhsl_3_left = self.Settings_Value(mixer_okhsl_3_split[0])
+            mixer_okhsl_3_right = self.Settings_Value(mixer_okhsl_3_split[4])
+            if (mixer_okhsl_3_left == True and mixer_okhsl_3_right == True):
+                # Gradient
+                self.color_okhsl_l3 = [True, float(mixer_okhsl_3_split[1]), float(mixer_okhsl_3_split[2]), float(mixer_okhsl_3_split[3])]
+                self.color_okhsl_r3 = [True, float(mixer_okhsl_3_split[5]), float(mixer_okhsl_3_split[6]), float(mixer_okhsl_3_split[7])]
+                rgb_okhsl_l3 = self.okhsl_to_rgb(self.color_okhsl_l3[1], self.color_okhsl_l3[2], self.color_okhsl_l3[3])
+                rgb_okhsl_r3 = self.okhsl_to_rgb(self.color_okhsl_r3[1], self.color_okhsl_r3[2], self.color_okhsl_r3[3])
+                color_okhsl_left_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsl_l3[0]*255, rgb_okhsl_l3[1]*255, rgb_okhsl_l3[2]*255))
+                color_okhsl_right_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsl_r3[0]*255, rgb_okhsl_r3[1]*255, rgb_okhsl_r3[2]*255))
+                self.layout.okhsl_l3.setStyleSheet(color_okhsl_left_3)
+                self.layout.okhsl_r3.setStyleSheet(color_okhsl_right_3)
+            elif (mixer_okhsl_3_left == True and mixer_okhsl_3_right != True):
+                # Color Left
+                self.color_okhsl_l3 = [True, float(mixer_okhsl_3_split[1]), float(mixer_okhsl_3_split[2]), float(mixer_okhsl_3_split[3])]
+                self.color_okhsl_r3 = [False, 0, 0, 0]
+                rgb_okhsl_l3 = self.okhsl_to_rgb(self.color_okhsl_l3[1], self.color_okhsl_l3[2], self.color_okhsl_l3[3])
+                color_okhsl_left_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsl_l3[0]*255, rgb_okhsl_l3[1]*255, rgb_okhsl_l3[2]*255))
+                self.layout.okhsl_l3.setStyleSheet(color_okhsl_left_3)
+                self.layout.okhsl_r3.setStyleSheet(self.bg_alpha)
+            elif (mixer_okhsl_3_left != True and mixer_okhsl_3_right == True):
+                # Color Right
+                self.color_okhsl_l3 = [False, 0, 0, 0]
+                self.color_okhsl_r3 = [True, float(mixer_okhsl_3_split[5]), float(mixer_okhsl_3_split[6]), float(mixer_okhsl_3_split[7])]
+                rgb_okhsl_r3 = self.okhsl_to_rgb(self.color_okhsl_r3[1], self.color_okhsl_r3[2], self.color_okhsl_r3[3])
+                color_okhsl_right_3 = str("background-color: rgb(%f, %f, %f); border: 1px solid rgba(56, 56, 56, 255) ;" % (rgb_okhsl_r3[0]*255, rgb_okhsl_r3[1]*255, rgb_okhsl_r3[2]*255))
+                self.layout.okhsl_l3.setStyleSheet(self.bg_alpha)
+                self.layout.okhsl_r3.setStyleSheet(color_okhsl_right_3)
+        except:
+            QtCore.qWarning("Pigment.O - Load Error - Mixer OKHSL")
+        #//
         #\\ Mixer Gradient Display #############################################
         self.Mixer_Display()
 
@@ -24346,11 +24495,11 @@ class PigmentO_Docker(DockWidget):
         gam_string_p1s4 = ','.join(gam_list_p1s4)
         gam_string_p2s1 = ','.join(gam_list_p2s1)
         gam_string_p3s3 = ','.join(gam_list_p3s3)
-        Krita.instance().writeSetting("Pigment.O", "gam_p1s1", gam_string_p1s1)
-        Krita.instance().writeSetting("Pigment.O", "gam_p1s3", gam_string_p1s3)
-        Krita.instance().writeSetting("Pigment.O", "gam_p1s4", gam_string_p1s4)
-        Krita.instance().writeSetting("Pigment.O", "gam_p2s1", gam_string_p2s1)
-        Krita.instance().writeSetting("Pigment.O", "gam_p3s3", gam_string_p3s3)
+        self.Settings_Write("gam_p1s1", gam_string_p1s1)
+        self.Settings_Write("gam_p1s3", gam_string_p1s3)
+        self.Settings_Write("gam_p1s4", gam_string_p1s4)
+        self.Settings_Write("gam_p2s1", gam_string_p2s1)
+        self.Settings_Write("gam_p3s3", gam_string_p3s3)
         #//
         #\\ Panel DOT ##########################################################
         dot_list_01 = ( str(self.dot_1[0]), str(self.dot_1[1]), str(self.dot_1[2]), str(self.dot_1[3]), str(self.dot_1[4]), str(self.dot_1[5]), str(self.dot_1[6]) )
@@ -24361,10 +24510,10 @@ class PigmentO_Docker(DockWidget):
         dot_string_02 = ','.join(dot_list_02)
         dot_string_03 = ','.join(dot_list_03)
         dot_string_04 = ','.join(dot_list_04)
-        Krita.instance().writeSetting("Pigment.O", "dot_01", dot_string_01)
-        Krita.instance().writeSetting("Pigment.O", "dot_02", dot_string_02)
-        Krita.instance().writeSetting("Pigment.O", "dot_03", dot_string_03)
-        Krita.instance().writeSetting("Pigment.O", "dot_04", dot_string_04)
+        self.Settings_Write("dot_01", dot_string_01)
+        self.Settings_Write("dot_02", dot_string_02)
+        self.Settings_Write("dot_03", dot_string_03)
+        self.Settings_Write("dot_04", dot_string_04)
         #//
         #\\ Panel OBJ ##########################################################
         object_00_list = (
@@ -24382,7 +24531,7 @@ class PigmentO_Docker(DockWidget):
         str(self.fg_3[0][0]), str(self.fg_3[0][1]), str(self.fg_3[0][2]), str(self.fg_3[0][3]), str(self.fg_3[0][4]),
         )
         object_00_string = ','.join(object_00_list)
-        Krita.instance().writeSetting("Pigment.O", "obj_00", object_00_string)
+        self.Settings_Write("obj_00", object_00_string)
 
         object_01_list = (
         str(self.bg_1[1][0]), str(self.bg_1[1][1]), str(self.bg_1[1][2]), str(self.bg_1[1][3]), str(self.bg_1[1][4]),
@@ -24399,10 +24548,15 @@ class PigmentO_Docker(DockWidget):
         str(self.fg_3[1][0]), str(self.fg_3[1][1]), str(self.fg_3[1][2]), str(self.fg_3[1][3]), str(self.fg_3[1][4]),
         )
         object_01_string = ','.join(object_01_list)
-        Krita.instance().writeSetting("Pigment.O", "obj_01", object_01_string)
+        self.Settings_Write("obj_01", object_01_string)
         #//
         #\\ Panel IMG ##########################################################
-        Krita.instance().writeSetting("Pigment.O", "img_state", self.img_state)
+        self.Settings_Write("img_state", self.img_state)
+
+        #//
+        #\\ History ############################################################
+        self.History_Load()
+        self.Settings_Write("history", self.history_model.Save())
 
         #//
         #\\ COR ################################################################
@@ -24428,17 +24582,17 @@ class PigmentO_Docker(DockWidget):
         cor_08_string = ','.join(cor_08_list)
         cor_09_string = ','.join(cor_09_list)
         cor_10_string = ','.join(cor_10_list)
-        Krita.instance().writeSetting("Pigment.O", "cor_00", cor_00_string)
-        Krita.instance().writeSetting("Pigment.O", "cor_01", cor_01_string)
-        Krita.instance().writeSetting("Pigment.O", "cor_02", cor_02_string)
-        Krita.instance().writeSetting("Pigment.O", "cor_03", cor_03_string)
-        Krita.instance().writeSetting("Pigment.O", "cor_04", cor_04_string)
-        Krita.instance().writeSetting("Pigment.O", "cor_05", cor_05_string)
-        Krita.instance().writeSetting("Pigment.O", "cor_06", cor_06_string)
-        Krita.instance().writeSetting("Pigment.O", "cor_07", cor_07_string)
-        Krita.instance().writeSetting("Pigment.O", "cor_08", cor_08_string)
-        Krita.instance().writeSetting("Pigment.O", "cor_09", cor_09_string)
-        Krita.instance().writeSetting("Pigment.O", "cor_10", cor_10_string)
+        self.Settings_Write("cor_00", cor_00_string)
+        self.Settings_Write("cor_01", cor_01_string)
+        self.Settings_Write("cor_02", cor_02_string)
+        self.Settings_Write("cor_03", cor_03_string)
+        self.Settings_Write("cor_04", cor_04_string)
+        self.Settings_Write("cor_05", cor_05_string)
+        self.Settings_Write("cor_06", cor_06_string)
+        self.Settings_Write("cor_07", cor_07_string)
+        self.Settings_Write("cor_08", cor_08_string)
+        self.Settings_Write("cor_09", cor_09_string)
+        self.Settings_Write("cor_10", cor_10_string)
         #//
         #\\ Mixer ##############################################################
         mixer_list_tts = (str(self.color_tts[0]), str(self.color_tts[1]), str(self.color_tts[2]), str(self.color_tts[3]))
@@ -24466,6 +24620,18 @@ class PigmentO_Docker(DockWidget):
         mixer_list_hcy_1 = (str(self.color_hcy_l1[0]), str(self.color_hcy_l1[1]), str(self.color_hcy_l1[2]), str(self.color_hcy_l1[3]), str(self.color_hcy_r1[0]),  str(self.color_hcy_r1[1]), str(self.color_hcy_r1[2]), str(self.color_hcy_r1[3]))
         mixer_list_hcy_2 = (str(self.color_hcy_l2[0]), str(self.color_hcy_l2[1]), str(self.color_hcy_l2[2]), str(self.color_hcy_l2[3]), str(self.color_hcy_r2[0]),  str(self.color_hcy_r2[1]), str(self.color_hcy_r2[2]), str(self.color_hcy_r2[3]))
         mixer_list_hcy_3 = (str(self.color_hcy_l3[0]), str(self.color_hcy_l3[1]), str(self.color_hcy_l3[2]), str(self.color_hcy_l3[3]), str(self.color_hcy_r3[0]),  str(self.color_hcy_r3[1]), str(self.color_hcy_r3[2]), str(self.color_hcy_r3[3]))
+        mixer_list_oklab_1 = (str(self.color_oklab_l1[0]), str(self.color_oklab_l1[1]), str(self.color_oklab_l1[2]), str(self.color_oklab_l1[3]), str(self.color_oklab_r1[0]),  str(self.color_oklab_r1[1]), str(self.color_oklab_r1[2]), str(self.color_oklab_r1[3]))
+        mixer_list_oklab_2 = (str(self.color_oklab_l2[0]), str(self.color_oklab_l2[1]), str(self.color_oklab_l2[2]), str(self.color_oklab_l2[3]), str(self.color_oklab_r2[0]),  str(self.color_oklab_r2[1]), str(self.color_oklab_r2[2]), str(self.color_oklab_r2[3]))
+        mixer_list_oklab_3 = (str(self.color_oklab_l3[0]), str(self.color_oklab_l3[1]), str(self.color_oklab_l3[2]), str(self.color_oklab_l3[3]), str(self.color_oklab_r3[0]),  str(self.color_oklab_r3[1]), str(self.color_oklab_r3[2]), str(self.color_oklab_r3[3]))
+        mixer_list_oklch_1 = (str(self.color_oklch_l1[0]), str(self.color_oklch_l1[1]), str(self.color_oklch_l1[2]), str(self.color_oklch_l1[3]), str(self.color_oklch_r1[0]),  str(self.color_oklch_r1[1]), str(self.color_oklch_r1[2]), str(self.color_oklch_r1[3]))
+        mixer_list_oklch_2 = (str(self.color_oklch_l2[0]), str(self.color_oklch_l2[1]), str(self.color_oklch_l2[2]), str(self.color_oklch_l2[3]), str(self.color_oklch_r2[0]),  str(self.color_oklch_r2[1]), str(self.color_oklch_r2[2]), str(self.color_oklch_r2[3]))
+        mixer_list_oklch_3 = (str(self.color_oklch_l3[0]), str(self.color_oklch_l3[1]), str(self.color_oklch_l3[2]), str(self.color_oklch_l3[3]), str(self.color_oklch_r3[0]),  str(self.color_oklch_r3[1]), str(self.color_oklch_r3[2]), str(self.color_oklch_r3[3]))
+        mixer_list_okhsv_1 = (str(self.color_okhsv_l1[0]), str(self.color_okhsv_l1[1]), str(self.color_okhsv_l1[2]), str(self.color_okhsv_l1[3]), str(self.color_okhsv_r1[0]),  str(self.color_okhsv_r1[1]), str(self.color_okhsv_r1[2]), str(self.color_okhsv_r1[3]))
+        mixer_list_okhsv_2 = (str(self.color_okhsv_l2[0]), str(self.color_okhsv_l2[1]), str(self.color_okhsv_l2[2]), str(self.color_okhsv_l2[3]), str(self.color_okhsv_r2[0]),  str(self.color_okhsv_r2[1]), str(self.color_okhsv_r2[2]), str(self.color_okhsv_r2[3]))
+        mixer_list_okhsv_3 = (str(self.color_okhsv_l3[0]), str(self.color_okhsv_l3[1]), str(self.color_okhsv_l3[2]), str(self.color_okhsv_l3[3]), str(self.color_okhsv_r3[0]),  str(self.color_okhsv_r3[1]), str(self.color_okhsv_r3[2]), str(self.color_okhsv_r3[3]))
+        mixer_list_okhsl_1 = (str(self.color_okhsl_l1[0]), str(self.color_okhsl_l1[1]), str(self.color_okhsl_l1[2]), str(self.color_okhsl_l1[3]), str(self.color_okhsl_r1[0]),  str(self.color_okhsl_r1[1]), str(self.color_okhsl_r1[2]), str(self.color_okhsl_r1[3]))
+        mixer_list_okhsl_2 = (str(self.color_okhsl_l2[0]), str(self.color_okhsl_l2[1]), str(self.color_okhsl_l2[2]), str(self.color_okhsl_l2[3]), str(self.color_okhsl_r2[0]),  str(self.color_okhsl_r2[1]), str(self.color_okhsl_r2[2]), str(self.color_okhsl_r2[3]))
+        mixer_list_okhsl_3 = (str(self.color_okhsl_l3[0]), str(self.color_okhsl_l3[1]), str(self.color_okhsl_l3[2]), str(self.color_okhsl_l3[3]), str(self.color_okhsl_r3[0]),  str(self.color_okhsl_r3[1]), str(self.color_okhsl_r3[2]), str(self.color_okhsl_r3[3]))
 
         mixer_string_tts = ','.join(mixer_list_tts)
         mixer_string_rgb_1 = ','.join(mixer_list_rgb_1)
@@ -24492,32 +24658,56 @@ class PigmentO_Docker(DockWidget):
         mixer_string_hcy_1 = ','.join(mixer_list_hcy_1)
         mixer_string_hcy_2 = ','.join(mixer_list_hcy_2)
         mixer_string_hcy_3 = ','.join(mixer_list_hcy_3)
-
-        Krita.instance().writeSetting("Pigment.O", "mix_TTS", mixer_string_tts)
-        Krita.instance().writeSetting("Pigment.O", "mix_RGB_1", mixer_string_rgb_1)
-        Krita.instance().writeSetting("Pigment.O", "mix_RGB_2", mixer_string_rgb_2)
-        Krita.instance().writeSetting("Pigment.O", "mix_RGB_3", mixer_string_rgb_3)
-        Krita.instance().writeSetting("Pigment.O", "mix_CMYK_1", mixer_string_cmyk_1)
-        Krita.instance().writeSetting("Pigment.O", "mix_CMYK_2", mixer_string_cmyk_2)
-        Krita.instance().writeSetting("Pigment.O", "mix_CMYK_3", mixer_string_cmyk_3)
-        Krita.instance().writeSetting("Pigment.O", "mix_RYB_1", mixer_string_ryb_1)
-        Krita.instance().writeSetting("Pigment.O", "mix_RYB_2", mixer_string_ryb_2)
-        Krita.instance().writeSetting("Pigment.O", "mix_RYB_3", mixer_string_ryb_3)
-        Krita.instance().writeSetting("Pigment.O", "mix_YUV_1", mixer_string_yuv_1)
-        Krita.instance().writeSetting("Pigment.O", "mix_YUV_2", mixer_string_yuv_2)
-        Krita.instance().writeSetting("Pigment.O", "mix_YUV_3", mixer_string_yuv_3)
-        Krita.instance().writeSetting("Pigment.O", "mix_ARD_1", mixer_string_ard_1)
-        Krita.instance().writeSetting("Pigment.O", "mix_ARD_2", mixer_string_ard_2)
-        Krita.instance().writeSetting("Pigment.O", "mix_ARD_3", mixer_string_ard_3)
-        Krita.instance().writeSetting("Pigment.O", "mix_HSV_1", mixer_string_hsv_1)
-        Krita.instance().writeSetting("Pigment.O", "mix_HSV_2", mixer_string_hsv_2)
-        Krita.instance().writeSetting("Pigment.O", "mix_HSV_3", mixer_string_hsv_3)
-        Krita.instance().writeSetting("Pigment.O", "mix_HSL_1", mixer_string_hsl_1)
-        Krita.instance().writeSetting("Pigment.O", "mix_HSL_2", mixer_string_hsl_2)
-        Krita.instance().writeSetting("Pigment.O", "mix_HSL_3", mixer_string_hsl_3)
-        Krita.instance().writeSetting("Pigment.O", "mix_HCY_1", mixer_string_hcy_1)
-        Krita.instance().writeSetting("Pigment.O", "mix_HCY_2", mixer_string_hcy_2)
-        Krita.instance().writeSetting("Pigment.O", "mix_HCY_3", mixer_string_hcy_3)
+        mixer_string_oklab_1 = ','.join(mixer_list_oklab_1)
+        mixer_string_oklab_2 = ','.join(mixer_list_oklab_2)
+        mixer_string_oklab_3 = ','.join(mixer_list_oklab_3)
+        mixer_string_oklch_1 = ','.join(mixer_list_oklch_1)
+        mixer_string_oklch_2 = ','.join(mixer_list_oklch_2)
+        mixer_string_oklch_3 = ','.join(mixer_list_oklch_3)
+        mixer_string_okhsv_1 = ','.join(mixer_list_okhsv_1)
+        mixer_string_okhsv_2 = ','.join(mixer_list_okhsv_2)
+        mixer_string_okhsv_3 = ','.join(mixer_list_okhsv_3)
+        mixer_string_okhsl_1 = ','.join(mixer_list_okhsl_1)
+        mixer_string_okhsl_2 = ','.join(mixer_list_okhsl_2)
+        mixer_string_okhsl_3 = ','.join(mixer_list_okhsl_3)
+
+        self.Settings_Write("mix_TTS", mixer_string_tts)
+        self.Settings_Write("mix_RGB_1", mixer_string_rgb_1)
+        self.Settings_Write("mix_RGB_2", mixer_string_rgb_2)
+        self.Settings_Write("mix_RGB_3", mixer_string_rgb_3)
+        self.Settings_Write("mix_CMYK_1", mixer_string_cmyk_1)
+        self.Settings_Write("mix_CMYK_2", mixer_string_cmyk_2)
+        self.Settings_Write("mix_CMYK_3", mixer_string_cmyk_3)
+        self.Settings_Write("mix_RYB_1", mixer_string_ryb_1)
+        self.Settings_Write("mix_RYB_2", mixer_string_ryb_2)
+        self.Settings_Write("mix_RYB_3", mixer_string_ryb_3)
+        self.Settings_Write("mix_YUV_1", mixer_string_yuv_1)
+        self.Settings_Write("mix_YUV_2", mixer_string_yuv_2)
+        self.Settings_Write("mix_YUV_3", mixer_string_yuv_3)
+        self.Settings_Write("mix_ARD_1", mixer_string_ard_1)
+        self.Settings_Write("mix_ARD_2", mixer_string_ard_2)
+        self.Settings_Write("mix_ARD_3", mixer_string_ard_3)
+        self.Settings_Write("mix_HSV_1", mixer_string_hsv_1)
+        self.Settings_Write("mix_HSV_2", mixer_string_hsv_2)
+        self.Settings_Write("mix_HSV_3", mixer_string_hsv_3)
+        self.Settings_Write("mix_HSL_1", mixer_string_hsl_1)
+        self.Settings_Write("mix_HSL_2", mixer_string_hsl_2)
+        self.Settings_Write("mix_HSL_3", mixer_string_hsl_3)
+        self.Settings_Write("mix_HCY_1", mixer_string_hcy_1)
+        self.Settings_Write("mix_HCY_2", mixer_string_hcy_2)
+        self.Settings_Write("mix_HCY_3", mixer_string_hcy_3)
+        self.Settings_Write("mix_OKLAB_1", mixer_string_oklab_1)
+        self.Settings_Write("mix_OKLAB_2", mixer_string_oklab_2)
+        self.Settings_Write("mix_OKLAB_3", mixer_string_oklab_3)
+        self.Settings_Write("mix_OKLCH_1", mixer_string_oklch_1)
+        self.Settings_Write("mix_OKLCH_2", mixer_string_oklch_2)
+        self.Settings_Write("mix_OKLCH_3", mixer_string_oklch_3)
+        self.Settings_Write("mix_OKHSV_1", mixer_string_okhsv_1)
+        self.Settings_Write("mix_OKHSV_2", mixer_string_okhsv_2)
+        self.Settings_Write("mix_OKHSV_3", mixer_string_okhsv_3)
+        self.Settings_Write("mix_OKHSL_1", mixer_string_okhsl_1)
+        self.Settings_Write("mix_OKHSL_2", mixer_string_okhsl_2)
+        self.Settings_Write("mix_OKHSL_3", mixer_string_okhsl_3)
 
         #//
 
@@ -24525,7 +24715,7 @@ class PigmentO_Docker(DockWidget):
         # Active Color
         try:
             # Active Color
-            active_color_string = Krita.instance().readSetting("Pigment.O", "active_color", "")
+            active_color_string = self.Settings_Read("active_color")
             active_color_split = active_color_string.split(",")
             self.rgb_1 = float(active_color_split[0])
             self.rgb_2 = float(active_color_split[1])
@@ -24548,12 +24738,12 @@ class PigmentO_Docker(DockWidget):
         # Harmony
         try:
             # Active Harmony Read
-            har_00_string = Krita.instance().readSetting("Pigment.O", "har_00", "")
-            har_01_string = Krita.instance().readSetting("Pigment.O", "har_01", "")
-            har_02_string = Krita.instance().readSetting("Pigment.O", "har_02", "")
-            har_03_string = Krita.instance().readSetting("Pigment.O", "har_03", "")
-            har_04_string = Krita.instance().readSetting("Pigment.O", "har_04", "")
-            har_05_string = Krita.instance().readSetting("Pigment.O", "har_05", "")
+            har_00_string = self.Settings_Read("har_00")
+            har_01_string = self.Settings_Read("har_01")
+            har_02_string = self.Settings_Read("har_02")
+            har_03_string = self.Settings_Read("har_03")
+            har_04_string = self.Settings_Read("har_04")
+            har_05_string = self.Settings_Read("har_05")
             # Active Harmony Split
             har_00_split = har_00_string.split(",")
             har_01_split = har_01_string.split(",")
@@ -24569,11 +24759,11 @@ class PigmentO_Docker(DockWidget):
             self.harmony_space = str(har_00_split[4])
             self.harmony_status = int(har_00_split[5])
             self.harmony_delta = float(har_00_split[6])
-            self.har_1 = [har_01_split[0], eval(har_01_split[1]),eval(har_01_split[2]),eval(har_01_split[3]), eval(har_01_split[4]),eval(har_01_split[5]),eval(har_01_split[6])]
-            self.har_2 = [har_02_split[0], eval(har_02_split[1]),eval(har_02_split[2]),eval(har_02_split[3]), eval(har_02_split[4]),eval(har_02_split[5]),eval(har_02_split[6])]
-            self.har_3 = [har_03_split[0], eval(har_03_split[1]),eval(har_03_split[2]),eval(har_03_split[3]), eval(har_03_split[4]),eval(har_03_split[5]),eval(har_03_split[6])]
-            self.har_4 = [har_04_split[0], eval(har_04_split[1]),eval(har_04_split[2]),eval(har_04_split[3]), eval(har_04_split[4]),eval(har_04_split[5]),eval(har_04_split[6])]
-            self.har_5 = [har_05_split[0], eval(har_05_split[1]),eval(har_05_split[2]),eval(har_05_split[3]), eval(har_05_split[4]),eval(har_05_split[5]),eval(har_05_split[6])]
+            self.har_1 = [har_01_split[0], self.Settings_Value(har_01_split[1]),self.Settings_Value(har_01_split[2]),self.Settings_Value(har_01_split[3]), self.Settings_Value(har_01_split[4]),self.Settings_Value(har_01_split[5]),self.Settings_Value(har_01_split[6])]
+            self.har_2 = [har_02_split[0], self.Settings_Value(har_02_split[1]),self.Settings_Value(har_02_split[2]),self.Settings_Value(har_02_split[3]), self.Settings_Value(har_02_split[4]),self.Settings_Value(har_02_split[5]),self.Settings_Value(har_02_split[6])]
+            self.har_3 = [har_03_split[0], self.Settings_Value(har_03_split[1]),self.Settings_Value(har_03_split[2]),self.Settings_Value(har_03_split[3]), self.Settings_Value(har_03_split[4]),self.Settings_Value(har_03_split[5]),self.Settings_Value(har_03_split[6])]
+            self.har_4 = [har_04_split[0], self.Settings_Value(har_04_split[1]),self.Settings_Value(har_04_split[2]),self.Settings_Value(har_04_split[3]), self.Settings_Value(har_04_split[4]),self.Settings_Value(har_04_split[5]),self.Settings_Value(har_04_split[6])]
+            self.har_5 = [har_05_split[0], self.Settings_Value(har_05_split[1]),self.Settings_Value(har_05_split[2]),self.Settings_Value(har_05_split[3]), self.Settings_Value(har_05_split[4]),self.Settings_Value(har_05_split[5]),self.Settings_Value(har_05_split[6])]
         except:
             QtCore.qWarning("Pigment.O - Load Error - Harmony Colors")
 
@@ -24604,7 +24794,7 @@ class PigmentO_Docker(DockWidget):
                 str(self.rgb_bg3),
                 )
             active_color_string = ','.join(active_color_list)
-            Krita.instance().writeSetting("Pigment.O", "active_color", active_color_string)
+            self.Settings_Write("active_color", active_color_string)
         except:
             QtCore.qWarning("Save Error - Active Color")
         # Harmony
@@ -24629,140 +24819,154 @@ class PigmentO_Docker(DockWidget):
             har_string_03 = ','.join(har_list_03)
             har_string_04 = ','.join(har_list_04)
             har_string_05 = ','.join(har_list_05)
-            Krita.instance().writeSetting("Pigment.O", "har_00", har_string_00)
-            Krita.instance().writeSetting("Pigment.O", "har_01", har_string_01)
-            Krita.instance().writeSetting("Pigment.O", "har_02", har_string_02)
-            Krita.instance().writeSetting("Pigment.O", "har_03", har_string_03)
-            Krita.instance().writeSetting("Pigment.O", "har_04", har_string_04)
-            Krita.instance().writeSetting("Pigment.O", "har_05", har_string_05)
+            self.Settings_Write("har_00", har_string_00)
+            self.Settings_Write("har_01", har_string_01)
+            self.Settings_Write("har_02", har_string_02)
+            self.Settings_Write("har_03", har_string_03)
+            self.Settings_Write("har_04", har_string_04)
+            self.Settings_Write("har_05", har_string_05)
         except:
             QtCore.qWarning("Save Error - Active Harmony")
 
     def Settings_Load_UI(self):
         try:
             # D1
-            self.dialog.har.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_har", "")) )
-            self.dialog.pan.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_pan", "")) )
-            self.dialog.cha.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_cha", "")) )
-            self.dialog.cor.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_cor", "")) )
-            self.dialog.mix.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_mix", "")) )
-            self.dialog.his.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_his", "")) )
+            self.dialog.har.setChecked( self.Settings_Value(self.Settings_Read("ui_har")) )
+            self.dialog.pan.setChecked( self.Settings_Value(self.Settings_Read("ui_pan")) )
+            self.dialog.cha.setChecked( self.Settings_Value(self.Settings_Read("ui_cha")) )
+            self.dialog.cor.setChecked( self.Settings_Value(self.Settings_Read("ui_cor")) )
+            self.dialog.mix.setChecked( self.Settings_Value(self.Settings_Read("ui_mix")) )
+            self.dialog.his.setChecked( self.Settings_Value(self.Settings_Read("ui_his")) )
             # D2
-            self.dialog.har_rule.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_har_rule", "")) )
-            self.dialog.har_edit.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_har_edit", "")) )
-            self.dialog.pan_index.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_pan_index", "")) )
-            self.dialog.hue_secondary.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_hue_secondary", "")) )
-            self.dialog.gam_space.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_gam_space", "")) )
-            self.dialog.gam_shape.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_gam_shape", "")) )
-            self.dialog.dot_interpolation.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_dot_interpolation", "")) )
-            self.dialog.dot_resolution.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_dot_resolution", "")) )
-            self.dialog.dot_set.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_dot_set", "")) )
-            self.dialog.obj_index.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_obj_index", "")) )
-            self.dialog.obj_set.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_obj_set", "")) )
-            self.dialog.img_grayscale.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_img_grayscale", "")) )
+            self.dialog.har_rule.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_har_rule")) )
+            self.dialog.har_edit.setChecked( self.Settings_Value(self.Settings_Read("ui_har_edit")) )
+            self.dialog.pan_index.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_pan_index")) )
+            self.dialog.hue_secondary.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_hue_secondary")) )
+            self.dialog.gam_space.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_gam_space")) )
+            self.dialog.gam_shape.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_gam_shape")) )
+            self.dialog.gam_ring.setValue( self.Settings_Value(self.Settings_Read("ui_gam_ring")) )
+            self.dialog.dot_interpolation.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_dot_interpolation")) )
+            self.dialog.dot_resolution.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_dot_resolution")) )
+            self.dialog.dot_set.setChecked( self.Settings_Value(self.Settings_Read("ui_dot_set")) )
+            self.dialog.obj_index.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_obj_index")) )
+            self.dialog.obj_set.setChecked( self.Settings_Value(self.Settings_Read("ui_obj_set")) )
+            self.dialog.img_grayscale.setChecked( self.Settings_Value(self.Settings_Read("ui_img_grayscale")) )
             # D3
-            self.dialog.aaa.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_aaa", "")) )
-            self.dialog.rgb.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_rgb", "")) )
-            self.dialog.cmy.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_cmy", "")) )
-            self.dialog.cmyk.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_cmyk", "")) )
-            self.dialog.ryb.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_ryb", "")) )
-            self.dialog.yuv.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_yuv", "")) )
-            self.dialog.kkk.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_kkk", "")) )
-            self.dialog.ard.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_ard", "")) )
-            self.dialog.hsv.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_hsv", "")) )
-            self.dialog.hsl.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_hsl", "")) )
-            self.dialog.hcy.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_hcy", "")) )
-            self.dialog.sel.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_sel", "")) )
-            self.dialog.xyz.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_xyz", "")) )
-            self.dialog.xyy.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_xyy", "")) )
-            self.dialog.luv.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_luv", "")) )
-            self.dialog.hlab.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_hlab", "")) )
-            self.dialog.lab.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_lab", "")) )
-            self.dialog.lch.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_lch", "")) )
+            self.dialog.aaa.setChecked( self.Settings_Value(self.Settings_Read("ui_aaa")) )
+            self.dialog.rgb.setChecked( self.Settings_Value(self.Settings_Read("ui_rgb")) )
+            self.dialog.cmy.setChecked( self.Settings_Value(self.Settings_Read("ui_cmy")) )
+            self.dialog.cmyk.setChecked( self.Settings_Value(self.Settings_Read("ui_cmyk")) )
+            self.dialog.ryb.setChecked( self.Settings_Value(self.Settings_Read("ui_ryb")) )
+            self.dialog.yuv.setChecked( self.Settings_Value(self.Settings_Read("ui_yuv")) )
+            self.dialog.kkk.setChecked( self.Settings_Value(self.Settings_Read("ui_kkk")) )
+            self.dialog.ard.setChecked( self.Settings_Value(self.Settings_Read("ui_ard")) )
+            self.dialog.hsv.setChecked( self.Settings_Value(self.Settings_Read("ui_hsv")) )
+            self.dialog.hsl.setChecked( self.Settings_Value(self.Settings_Read("ui_hsl")) )
+            self.dialog.hcy.setChecked( self.Settings_Value(self.Settings_Read("ui_hcy")) )
+            self.dialog.sel.setChecked( self.Settings_Value(self.Settings_Read("ui_sel")) )
+            self.dialog.xyz.setChecked( self.Settings_Value(self.Settings_Read("ui_xyz")) )
+            self.dialog.xyy.setChecked( self.Settings_Value(self.Settings_Read("ui_xyy")) )
+            self.dialog.luv.setChecked( self.Settings_Value(self.Settings_Read("ui_luv")) )
+            self.dialog.hlab.setChecked( self.Settings_Value(self.Settings_Read("ui_hlab")) )
+            self.dialog.lab.setChecked( self.Settings_Value(self.Settings_Read("ui_lab")) )
+            self.dialog.lch.setChecked( self.Settings_Value(self.Settings_Read("ui_lch")) )
+            self.dialog.oklab.setChecked( self.Settings_Value(self.Settings_Read("ui_oklab")) )
+            self.dialog.oklch.setChecked( self.Settings_Value(self.Settings_Read("ui_oklch")) )
+            self.dialog.okhsv.setChecked( self.Settings_Value(self.Settings_Read("ui_okhsv")) )
+            self.dialog.okhsl.setChecked( self.Settings_Value(self.Settings_Read("ui_okhsl")) )
             # D4
-            self.dialog.display_values.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_display_values", "")) )
-            self.dialog.display_hex.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_display_hex", "")) )
-            self.dialog.hex_copy_paste.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_hex_copy_paste", "")) )
-            self.dialog.hue_shine.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_hue_shine", "")) )
-            self.dialog.cursor.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_cursor", "")) )
+            self.dialog.display_values.setChecked( self.Settings_Value(self.Settings_Read("ui_display_values")) )
+            self.dialog.display_hex.setChecked( self.Settings_Value(self.Settings_Read("ui_display_hex")) )
+            self.dialog.hex_copy_paste.setChecked( self.Settings_Value(self.Settings_Read("ui_hex_copy_paste")) )
+            self.dialog.hue_shine.setChecked( self.Settings_Value(self.Settings_Read("ui_hue_shine")) )
+            self.dialog.cursor.setChecked( self.Settings_Value(self.Settings_Read("ui_cursor")) )
             # D5
-            self.dialog.mix_index.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_mix_index", "")) )
+            self.dialog.mix_index.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_mix_index")) )
             # D6
-            self.dialog.wheel_index.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_wheel_index", "")) )
-            self.dialog.wheel_space.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_wheel_space", "")) )
-            self.dialog.luminosity.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_luminosity", "")) )
-            self.dialog.xyz_matrix.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_xyz_matrix", "")) )
-            self.dialog.xyz_illuminant.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_xyz_illuminant", "")) )
-            self.dialog.key_1.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_key_1", "")) )
-            self.dialog.key_2.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_key_2", "")) )
-            self.dialog.key_3.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_key_3", "")) )
-            self.dialog.key_4.setCurrentIndex( eval(Krita.instance().readSetting("Pigment.O", "ui_key_4", "")) )
+            self.dialog.wheel_index.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_wheel_index")) )
+            self.dialog.wheel_space.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_wheel_space")) )
+            self.dialog.luminosity.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_luminosity")) )
+            self.dialog.xyz_matrix.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_xyz_matrix")) )
+            self.dialog.xyz_illuminant.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_xyz_illuminant")) )
+            self.dialog.key_1.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_key_1")) )
+            self.dialog.key_2.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_key_2")) )
+            self.dialog.key_3.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_key_3")) )
+            self.dialog.key_4.setCurrentIndex( self.Settings_Value(self.Settings_Read("ui_key_4")) )
             # D8
-            self.dialog.release.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_release", "")) )
-            self.dialog.inaccurate.setChecked( eval(Krita.instance().readSetting("Pigment.O", "ui_inaccurate", "")) )
+            self.dialog.release.setChecked( self.Settings_Value(self.Settings_Read("ui_release")) )
+            self.dialog.inaccurate.setChecked( self.Settings_Value(self.Settings_Read("ui_inaccurate")) )
+            self.dialog.sel_range.setChecked( self.Settings_Value(self.Settings_Read("ui_sel_range")) )
+            self.dialog.sel_fuzziness.setValue( self.Settings_Value(self.Settings_Read("ui_sel_fuzziness")) )
         except:
             QtCore.qWarning("Pigment.O - Load Error - UI")
     def Settings_Save_UI(self):
         # D1
-        Krita.instance().writeSetting("Pigment.O", "ui_har", str(self.dialog.har.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_pan", str(self.dialog.pan.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_cha", str(self.dialog.cha.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_cor", str(self.dialog.cor.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_mix", str(self.dialog.mix.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_his", str(self.dialog.his.isChecked()) )
+        self.Settings_Write("ui_har", str(self.dialog.har.isChecked()) )
+        self.Settings_Write("ui_pan", str(self.dialog.pan.isChecked()) )
+        self.Settings_Write("ui_cha", str(self.dialog.cha.isChecked()) )
+        self.Settings_Write("ui_cor", str(self.dialog.cor.isChecked()) )
+        self.Settings_Write("ui_mix", str(self.dialog.mix.isChecked()) )
+        self.Settings_Write("ui_his", str(self.dialog.his.isChecked()) )
         # D2
-        Krita.instance().writeSetting("Pigment.O", "ui_har_rule", str(self.dialog.har_rule.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_har_edit", str(self.dialog.har_edit.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_pan_index", str(self.dialog.pan_index.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_hue_secondary", str(self.dialog.hue_secondary.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_gam_space", str(self.dialog.gam_space.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_gam_shape", str(self.dialog.gam_shape.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_dot_interpolation", str(self.dialog.dot_interpolation.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_dot_resolution", str(self.dialog.dot_resolution.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_dot_set", str(self.dialog.dot_set.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_obj_index", str(self.dialog.obj_index.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_obj_set", str(self.dialog.obj_set.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_img_grayscale", str(self.dialog.img_grayscale.isChecked()) )
+        self.Settings_Write("ui_har_rule", str(self.dialog.har_rule.currentIndex()) )
+        self.Settings_Write("ui_har_edit", str(self.dialog.har_edit.isChecked()) )
+        self.Settings_Write("ui_pan_index", str(self.dialog.pan_index.currentIndex()) )
+        self.Settings_Write("ui_hue_secondary", str(self.dialog.hue_secondary.currentIndex()) )
+        self.Settings_Write("ui_gam_space", str(self.dialog.gam_space.currentIndex()) )
+        self.Settings_Write("ui_gam_shape", str(self.dialog.gam_shape.currentIndex()) )
+        self.Settings_Write("ui_gam_ring", str(self.dialog.gam_ring.value()) )
+        self.Settings_Write("ui_dot_interpolation", str(self.dialog.dot_interpolation.currentIndex()) )
+        self.Settings_Write("ui_dot_resolution", str(self.dialog.dot_resolution.currentIndex()) )
+        self.Settings_Write("ui_dot_set", str(self.dialog.dot_set.isChecked()) )
+        self.Settings_Write("ui_obj_index", str(self.dialog.obj_index.currentIndex()) )
+        self.Settings_Write("ui_obj_set", str(self.dialog.obj_set.isChecked()) )
+        self.Settings_Write("ui_img_grayscale", str(self.dialog.img_grayscale.isChecked()) )
         # D3
-        Krita.instance().writeSetting("Pigment.O", "ui_aaa", str(self.dialog.aaa.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_rgb", str(self.dialog.rgb.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_cmy", str(self.dialog.cmy.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_cmyk", str(self.dialog.cmyk.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_ryb", str(self.dialog.ryb.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_yuv", str(self.dialog.yuv.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_kkk", str(self.dialog.kkk.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_ard", str(self.dialog.ard.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_hsv", str(self.dialog.hsv.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_hsl", str(self.dialog.hsl.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_hcy", str(self.dialog.hcy.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_sel", str(self.dialog.sel.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_xyz", str(self.dialog.xyz.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_xyy", str(self.dialog.xyy.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_luv", str(self.dialog.luv.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_hlab", str(self.dialog.hlab.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_lab", str(self.dialog.lab.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_lch", str(self.dialog.lch.isChecked()) )
+        self.Settings_Write("ui_aaa", str(self.dialog.aaa.isChecked()) )
+        self.Settings_Write("ui_rgb", str(self.dialog.rgb.isChecked()) )
+        self.Settings_Write("ui_cmy", str(self.dialog.cmy.isChecked()) )
+        self.Settings_Write("ui_cmyk", str(self.dialog.cmyk.isChecked()) )
+        self.Settings_Write("ui_ryb", str(self.dialog.ryb.isChecked()) )
+        self.Settings_Write("ui_yuv", str(self.dialog.yuv.isChecked()) )
+        self.Settings_Write("ui_kkk", str(self.dialog.kkk.isChecked()) )
+        self.Settings_Write("ui_ard", str(self.dialog.ard.isChecked()) )
+        self.Settings_Write("ui_hsv", str(self.dialog.hsv.isChecked()) )
+        self.Settings_Write("ui_hsl", str(self.dialog.hsl.isChecked()) )
+        self.Settings_Write("ui_hcy", str(self.dialog.hcy.isChecked()) )
+        self.Settings_Write("ui_sel", str(self.dialog.sel.isChecked()) )
+        self.Settings_Write("ui_xyz", str(self.dialog.xyz.isChecked()) )
+        self.Settings_Write("ui_xyy", str(self.dialog.xyy.isChecked()) )
+        self.Settings_Write("ui_luv", str(self.dialog.luv.isChecked()) )
+        self.Settings_Write("ui_hlab", str(self.dialog.hlab.isChecked()) )
+        self.Settings_Write("ui_lab", str(self.dialog.lab.isChecked()) )
+        self.Settings_Write("ui_lch", str(self.dialog.lch.isChecked()) )
+        self.Settings_Write("ui_oklab", str(self.dialog.oklab.isChecked()) )
+        self.Settings_Write("ui_oklch", str(self.dialog.oklch.isChecked()) )
+        self.Settings_Write("ui_okhsv", str(self.dialog.okhsv.isChecked()) )
+        self.Settings_Write("ui_okhsl", str(self.dialog.okhsl.isChecked()) )
         # D4
-        Krita.instance().writeSetting("Pigment.O", "ui_display_values", str(self.dialog.display_values.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_display_hex", str(self.dialog.display_hex.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_hex_copy_paste", str(self.dialog.hex_copy_paste.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_hue_shine", str(self.dialog.hue_shine.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_cursor", str(self.dialog.cursor.isChecked()) )
+        self.Settings_Write("ui_display_values", str(self.dialog.display_values.isChecked()) )
+        self.Settings_Write("ui_display_hex", str(self.dialog.display_hex.isChecked()) )
+        self.Settings_Write("ui_hex_copy_paste", str(self.dialog.hex_copy_paste.isChecked()) )
+        self.Settings_Write("ui_hue_shine", str(self.dialog.hue_shine.isChecked()) )
+        self.Settings_Write("ui_cursor", str(self.dialog.cursor.isChecked()) )
         # D5
-        Krita.instance().writeSetting("Pigment.O", "ui_mix_index", str(self.dialog.mix_index.currentIndex()) )
+        self.Settings_Write("ui_mix_index", str(self.dialog.mix_index.currentIndex()) )
         # D6
-        Krita.instance().writeSetting("Pigment.O", "ui_wheel_index", str(self.dialog.wheel_index.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_wheel_space", str(self.dialog.wheel_space.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_luminosity", str(self.dialog.luminosity.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_xyz_matrix", str(self.dialog.xyz_matrix.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_xyz_illuminant", str(self.dialog.xyz_illuminant.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_key_1", str(self.dialog.key_1.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_key_2", str(self.dialog.key_2.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_key_3", str(self.dialog.key_3.currentIndex()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_key_4", str(self.dialog.key_4.currentIndex()) )
+        self.Settings_Write("ui_wheel_index", str(self.dialog.wheel_index.currentIndex()) )
+        self.Settings_Write("ui_wheel_space", str(self.dialog.wheel_space.currentIndex()) )
+        self.Settings_Write("ui_luminosity", str(self.dialog.luminosity.currentIndex()) )
+        self.Settings_Write("ui_xyz_matrix", str(self.dialog.xyz_matrix.currentIndex()) )
+        self.Settings_Write("ui_xyz_illuminant", str(self.dialog.xyz_illuminant.currentIndex()) )
+        self.Settings_Write("ui_key_1", str(self.dialog.key_1.currentIndex()) )
+        self.Settings_Write("ui_key_2", str(self.dialog.key_2.currentIndex()) )
+        self.Settings_Write("ui_key_3", str(self.dialog.key_3.currentIndex()) )
+        self.Settings_Write("ui_key_4", str(self.dialog.key_4.currentIndex()) )
         # D8
-        Krita.instance().writeSetting("Pigment.O", "ui_release", str(self.dialog.release.isChecked()) )
-        Krita.instance().writeSetting("Pigment.O", "ui_inaccurate", str(self.dialog.inaccurate.isChecked()) )
+        self.Settings_Write("ui_release", str(self.dialog.release.isChecked()) )
+        self.Settings_Write("ui_inaccurate", str(self.dialog.inaccurate.isChecked()) )
+        self.Settings_Write("ui_sel_range", str(self.dialog.sel_range.isChecked()) )
+        self.Settings_Write("ui_sel_fuzziness", str(self.dialog.sel_fuzziness.value()) )
 
     def Settings_Load_Annotations(self):
         if ((self.canvas() is not None) and (self.canvas().view() is not None)):
@@ -24787,11 +24991,11 @@ class PigmentO_Docker(DockWidget):
                 # Split values
                 notes_split = notes_string.split(",")
                 # Variables Placement
-                self.P1_S1 = self.P1_S1_r = [eval(notes_split[0]), eval(notes_split[1]), eval(notes_split[2]), eval(notes_split[3]), eval(notes_split[4]), eval(notes_split[5]), eval(notes_split[6]), eval(notes_split[7])]
-                self.P1_S3 = self.P1_S3_r = [eval(notes_split[8]), eval(notes_split[9]), eval(notes_split[10]), eval(notes_split[11]), eval(notes_split[12]), eval(notes_split[13])]
-                self.P1_S4 = self.P1_S4_r = [eval(notes_split[14]), eval(notes_split[15]), eval(notes_split[16]), eval(notes_split[17]), eval(notes_split[18]), eval(notes_split[19]), eval(notes_split[20]), eval(notes_split[21])]
-                self.P2_S1 = self.P2_S1_r = [eval(notes_split[22]), eval(notes_split[23]), eval(notes_split[24]), eval(notes_split[25]), eval(notes_split[26]), eval(notes_split[27]), eval(notes_split[28]), eval(notes_split[29]), eval(notes_split[30]), eval(notes_split[31]), eval(notes_split[32]), eval(notes_split[33]), eval(notes_split[34]), eval(notes_split[35]), eval(notes_split[36]), eval(notes_split[37])]
-                self.P3_S3 = self.P3_S3_r = [eval(notes_split[38]), eval(notes_split[39]), eval(notes_split[40]), eval(notes_split[41]), eval(notes_split[42]), eval(notes_split[43]), eval(notes_split[44]), eval(notes_split[45]), eval(notes_split[46]), eval(notes_split[47]), eval(notes_split[48]), eval(notes_split[49]), eval(notes_split[50]), eval(notes_split[51])]
+                self.P1_S1 = self.P1_S1_r = [self.Settings_Value(notes_split[0]), self.Settings_Value(notes_split[1]), self.Settings_Value(notes_split[2]), self.Settings_Value(notes_split[3]), self.Settings_Value(notes_split[4]), self.Settings_Value(notes_split[5]), self.Settings_Value(notes_split[6]), self.Settings_Value(notes_split[7])]
+                self.P1_S3 = self.P1_S3_r = [self.Settings_Value(notes_split[8]), self.Settings_Value(notes_split[9]), self.Settings_Value(notes_split[10]), self.Settings_Value(notes_split[11]), self.Settings_Value(notes_split[12]), self.Settings_Value(notes_split[13])]
+                self.P1_S4 = self.P1_S4_r = [self.Settings_Value(notes_split[14]), self.Settings_Value(notes_split[15]), self.Settings_Value(notes_split[16]), self.Settings_Value(notes_split[17]), self.Settings_Value(notes_split[18]), self.Settings_Value(notes_split[19]), self.Settings_Value(notes_split[20]), self.Settings_Value(notes_split[21])]
+                self.P2_S1 = self.P2_S1_r = [self.Settings_Value(notes_split[22]), self.Settings_Value(notes_split[23]), self.Settings_Value(notes_split[24]), self.Settings_Value(notes_split[25]), self.Settings_Value(notes_split[26]), self.Settings_Value(notes_split[27]), self.Settings_Value(notes_split[28]), self.Settings_Value(notes_split[29]), self.Settings_Value(notes_split[30]), self.Settings_Value(notes_split[31]), self.Settings_Value(notes_split[32]), self.Settings_Value(notes_split[33]), self.Settings_Value(notes_split[34]), self.Settings_Value(notes_split[35]), self.Settings_Value(notes_split[36]), self.Settings_Value(notes_split[37])]
+                self.P3_S3 = self.P3_S3_r = [self.Settings_Value(notes_split[38]), self.Settings_Value(notes_split[39]), self.Settings_Value(notes_split[40]), self.Settings_Value(notes_split[41]), self.Settings_Value(notes_split[42]), self.Settings_Value(notes_split[43]), self.Settings_Value(notes_split[44]), self.Settings_Value(notes_split[45]), self.Settings_Value(notes_split[46]), self.Settings_Value(notes_split[47]), self.Settings_Value(notes_split[48]), self.Settings_Value(notes_split[49]), self.Settings_Value(notes_split[50]), self.Settings_Value(notes_split[51])]
                 # Update widget with Variables
                 self.Update_Panel_GAM_Polygon(self.P1_S1, self.P1_S3, self.P1_S4, self.P2_S1, self.P3_S3)
                 self.layout.panel_gam_polygon.update()
@@ -24834,10 +25038,7 @@ class PigmentO_Docker(DockWidget):
 
 
     To Do:
-    - swatch panel. generates and generates from a set.
-    - Fix HCY panel. create matrix 255x255 to create a small gradient image and then you can just scale it up to the correct size
     - Panel HCY display and HUE+HCY
-    - OKhsv and OKhsl. needs alot of research.
     - import image into IMG to create a GAM pixel mask
     - color range selection
 
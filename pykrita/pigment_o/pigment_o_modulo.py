@@ -20,8 +20,15 @@ from krita import *
 from PyQt5 import Qt, QtWidgets, QtCore, QtGui, QtSvg, uic
 from PyQt5.Qt import Qt
 import math
+import re
+import struct
+import array
+import collections
 import time
+import zipfile
 import subprocess
+from xml.etree import ElementTree
+from .pigment_o_profiler import Profiled
 
 
 class Color_Header(QWidget):
@@ -225,6 +232,8 @@ class Apply_RGB(QWidget):
 
 class Panel_SWA(QWidget):
     SIGNAL_APPLY = QtCore.pyqtSignal(list)
+    cell = 20 # Swatch side in pixels when the palette does not fit as stripes
+    stripes = 5 # Swatches drawn as full width stripes with their hex codes
 
     # Init
     def __init__(self, parent):
@@ -236,38 +245,50 @@ class Panel_SWA(QWidget):
         # Widget
         self.widget_width = 1
         self.widget_height = 1
-        self.swatch_height = 0
-        # QColor
-        self.cor1 = QColor(0,0,0)
-        self.cor2 = QColor(0,0,0)
-        self.cor3 = QColor(0,0,0)
-        self.cor4 = QColor(0,0,0)
-        self.cor5 = QColor(0,0,0)
-        # Hex
-        self.hex1 = "#000000"
-        self.hex2 = "#000000"
-        self.hex3 = "#000000"
-        self.hex4 = "#000000"
-        self.hex5 = "#000000"
+        # Swatches
+        self.swatches = []
+        self.colors = []
+        self.page = 0
 
     # Relay
-    def Update_Panel(self, cor1, cor2, cor3, cor4, cor5, hex1, hex2, hex3, hex4, hex5, widget_width, widget_height):
-        # QColor
-        self.cor1 = QColor(cor1[0]*255, cor1[1]*255, cor1[2]*255)
-        self.cor2 = QColor(cor2[0]*255, cor2[1]*255, cor2[2]*255)
-        self.cor3 = QColor(cor3[0]*255, cor3[1]*255, cor3[2]*255)
-        self.cor4 = QColor(cor4[0]*255, cor4[1]*255, cor4[2]*255)
-        self.cor5 = QColor(cor5[0]*255, cor5[1]*255, cor5[2]*255)
-        # Hex
-        self.hex1 = hex1
-        self.hex2 = hex2
-        self.hex3 = hex3
-        self.hex4 = hex4
-        self.hex5 = hex5
+    def Update_Panel(self, swatches, widget_width, widget_height):
+        # QColors are only made again for a new Palette
+        if swatches is not self.swatches:
+            self.swatches = swatches
+            self.colors = [QColor(int(cor[0]*255), int(cor[1]*255), int(cor[2]*255)) for cor in swatches]
+            self.page = 0
         # Size
         self.widget_width = self.Math_1D_Limit(widget_width)
         self.widget_height = self.Math_1D_Limit(widget_height)
-        self.swatch_height = self.widget_height / 5
+        self.page = min(self.page, self.Pages() - 1)
+
+    # Pages
+    def Grid(self):
+        columns = max(1, int(self.widget_width // self.cell))
+        rows = max(1, int(self.widget_height // self.cell))
+        return columns, rows
+    def Pages(self):
+        if len(self.colors) <= self.stripes:
+            return 1
+        columns, rows = self.Grid()
+        return max(1, math.ceil(len(self.colors) / (columns * rows)))
+    def Index(self, x, y):
+        # Swatch under the position
+        count = len(self.colors)
+        if count == 0:
+            return -1
+        if count <= self.stripes:
+            index = int(y // (self.widget_height / count))
+        else:
+            columns, rows = self.Grid()
+            column = int(x // self.cell)
+            row = int(y // self.cell)
+            if (column >= columns or row >= rows):
+                return -1
+            index = (self.page * rows + row) * columns + column
+        if (index < 0 or index >= count):
+            return -1
+        return index
 
     # Mouse Interaction
     def mousePressEvent(self, event):
@@ -277,35 +298,52 @@ class Panel_SWA(QWidget):
     def mouseDoubleClickEvent(self, event):
         self.Mouse_Cursor(event)
     def mouseReleaseEvent(self, event):
-        self.Mouse_Cursor(event)
+        pass
 
     def Mouse_Cursor(self, event):
-        pass
+        if event.buttons() == QtCore.Qt.LeftButton:
+            index = self.Index(event.x(), event.y())
+            if index >= 0:
+                self.SIGNAL_APPLY.emit([index])
+
+    # Wheel
+    def wheelEvent(self, event):
+        delta = event.angleDelta()
+        if delta.y() > 20:
+            self.page -= 1
+        elif delta.y() < -20:
+            self.page += 1
+        self.page = min(max(self.page, 0), self.Pages() - 1)
+        self.update()
 
     # Paint
+    @Profiled
     def paintEvent(self, event):
         # Painter
         painter = QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-        # Squares
         painter.setPen(QtCore.Qt.NoPen)
-        painter.setBrush(QBrush(QColor(self.cor1)))
-        painter.drawRect(0,self.swatch_height*0,self.widget_width,self.swatch_height + 1)
-        painter.setBrush(QBrush(QColor(self.cor2)))
-        painter.drawRect(0,self.swatch_height*1,self.widget_width,self.swatch_height + 1)
-        painter.setBrush(QBrush(QColor(self.cor3)))
-        painter.drawRect(0,self.swatch_height*2,self.widget_width,self.swatch_height + 1)
-        painter.setBrush(QBrush(QColor(self.cor4)))
-        painter.drawRect(0,self.swatch_height*3,self.widget_width,self.swatch_height + 1)
-        painter.setBrush(QBrush(QColor(self.cor5)))
-        painter.drawRect(0,self.swatch_height*4,self.widget_width,self.swatch_height + 1)
-        # Text
-        painter.setPen(QPen(QColor(255,255,255), 1, Qt.SolidLine, Qt.SquareCap, Qt.MiterJoin))
-        painter.drawText(QRectF(20,self.swatch_height*0, 100,self.swatch_height), Qt.AlignLeft|Qt.AlignVCenter, self.hex1)
-        painter.drawText(QRectF(20,self.swatch_height*1, 100,self.swatch_height), Qt.AlignLeft|Qt.AlignVCenter, self.hex2)
-        painter.drawText(QRectF(20,self.swatch_height*2, 100,self.swatch_height), Qt.AlignLeft|Qt.AlignVCenter, self.hex3)
-        painter.drawText(QRectF(20,self.swatch_height*3, 100,self.swatch_height), Qt.AlignLeft|Qt.AlignVCenter, self.hex4)
-        painter.drawText(QRectF(20,self.swatch_height*4, 100,self.swatch_height), Qt.AlignLeft|Qt.AlignVCenter, self.hex5)
+        count = len(self.colors)
+        if count == 0:
+            return
+        if count <= self.stripes:
+            # Stripes
+            painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+            height = self.widget_height / count
+            for i in range(0, count):
+                painter.setBrush(QBrush(self.colors[i]))
+                painter.drawRect(QRectF(0, height*i, self.widget_width, height + 1))
+            # Text
+            painter.setPen(QPen(QColor(255,255,255), 1, Qt.SolidLine, Qt.SquareCap, Qt.MiterJoin))
+            for i in range(0, count):
+                painter.drawText(QRectF(20, height*i, 100, height), Qt.AlignLeft|Qt.AlignVCenter, self.colors[i].name())
+        else:
+            # Only the swatches of the current Page
+            columns, rows = self.Grid()
+            start = self.page * columns * rows
+            end = min(start + columns * rows, count)
+            for i in range(start, end):
+                row, column = divmod(i - start, columns)
+                painter.fillRect(column * self.cell, row * self.cell, self.cell, self.cell, self.colors[i])
 
     def Math_1D_Limit(self, var):
         if var <= 1:
@@ -343,25 +381,17 @@ class Panel_UVD(QWidget):
     def Cursor(self):
         # Variables
         self.hex = '#000000'
-        # Module Style
-        self.style = Style()
         # LMB SVG Cursor
-        self.cursor_lmb = QtSvg.QSvgWidget(self)
-        self.array_lmb = self.style.SVG_Cursor_LMB()
-        self.cursor_lmb.load(self.array_lmb)
+        self.cursor_lmb = Cursor_SVG(self, "LMB")
         # RMB SVG Cursor
-        self.cursor_rmb = QtSvg.QSvgWidget(self)
-        self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-        self.cursor_rmb.load(self.array_rmb)
+        self.cursor_rmb = Cursor_SVG(self, "RMB")
+        self.cursor_rmb.Color(self.hex)
         # Style SVG Cursors
         self.cursor_size = 20
         self.cursor_half = self.cursor_size / 2
-        self.cursor_lmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.resize(0, 0)
-        self.unseen = self.style.Transparent()
-        self.cursor_lmb.setStyleSheet(self.unseen)
-        self.cursor_rmb.setStyleSheet(self.unseen)
+        self.cursor_lmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Resize(0, 0)
         # Cursor Scale
         self.scale_factor = 180
 
@@ -397,11 +427,11 @@ class Panel_UVD(QWidget):
         self.P61 = p61
         # Move Cursor
         try:
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width()/2), self.value_y-(self.cursor_lmb.height()/2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width()/2), self.value_y-(self.cursor_rmb.height()/2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width()/2), self.value_y-(self.cursor_lmb.Height()/2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width()/2), self.value_y-(self.cursor_rmb.Height()/2))
         except:
-            self.cursor_lmb.move(self.panel_width / 2, self.panel_height / 2)
-            self.cursor_rmb.move(self.panel_width / 2, self.panel_height / 2)
+            self.cursor_lmb.Move(self.panel_width / 2, self.panel_height / 2)
+            self.cursor_rmb.Move(self.panel_width / 2, self.panel_height / 2)
         # Zoom
         self.cursorzoom(zoom)
 
@@ -509,11 +539,10 @@ class Panel_UVD(QWidget):
         # Correct Cursor
         if (event.buttons() == QtCore.Qt.LeftButton or event.buttons() == QtCore.Qt.MiddleButton):
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width()/2), self.value_y-(self.cursor_lmb.height()/2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width()/2), self.value_y-(self.cursor_rmb.height()/2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width()/2), self.value_y-(self.cursor_lmb.Height()/2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width()/2), self.value_y-(self.cursor_rmb.Height()/2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
         elif event.buttons() == QtCore.Qt.RightButton:
             self.cursorzoom(1)
         # Emit Values
@@ -527,16 +556,15 @@ class Panel_UVD(QWidget):
     def cursorzoom(self, zoom):
         if zoom == 1:
             # Scale Cursor for Display
-            self.cursor_rmb.resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
+            self.cursor_rmb.Resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width()/2), self.value_y-(self.cursor_lmb.height()/2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width()/2), self.value_y-(self.cursor_rmb.height()/2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width()/2), self.value_y-(self.cursor_lmb.Height()/2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width()/2), self.value_y-(self.cursor_rmb.Height()/2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
             self.SIGNAL_ZOOM.emit(1)
         else:
-            self.cursor_rmb.resize(0, 0)
+            self.cursor_rmb.Resize(0, 0)
             self.SIGNAL_ZOOM.emit(0)
     def mouseHue(self, event):
         # Delta
@@ -552,7 +580,15 @@ class Panel_UVD(QWidget):
         self.SIGNAL_UVD_VALUE.emit(values)
 
     # Paint
+    @Profiled
     def paintEvent(self, event):
+        self.Panel_Paint(event)
+        # Cursors over the Panel
+        painter = QPainter(self)
+        self.cursor_lmb.Paint(painter)
+        self.cursor_rmb.Paint(painter)
+        painter.end()
+    def Panel_Paint(self, event):
         # Painter
         painter = QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
@@ -734,25 +770,17 @@ class Panel_YUV(QWidget):
     def Cursor(self):
         # Variables
         self.hex = '#000000'
-        # Module Style
-        self.style = Style()
         # LMB SVG Cursor
-        self.cursor_lmb = QtSvg.QSvgWidget(self)
-        self.array_lmb = self.style.SVG_Cursor_LMB()
-        self.cursor_lmb.load(self.array_lmb)
+        self.cursor_lmb = Cursor_SVG(self, "LMB")
         # RMB SVG Cursor
-        self.cursor_rmb = QtSvg.QSvgWidget(self)
-        self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-        self.cursor_rmb.load(self.array_rmb)
+        self.cursor_rmb = Cursor_SVG(self, "RMB")
+        self.cursor_rmb.Color(self.hex)
         # Style SVG Cursors
         self.cursor_size = 20
         self.cursor_half = self.cursor_size / 2
-        self.cursor_lmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.resize(0, 0)
-        self.unseen = self.style.Transparent()
-        self.cursor_lmb.setStyleSheet(self.unseen)
-        self.cursor_rmb.setStyleSheet(self.unseen)
+        self.cursor_lmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Resize(0, 0)
         # Cursor Scale
         self.scale_factor = 180
 
@@ -773,8 +801,8 @@ class Panel_YUV(QWidget):
         self.value_x = self.yuv[1] * self.panel_width
         self.value_y = self.panel_height - (self.yuv[2] * self.panel_height)
         # Move Cursor
-        self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-        self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+        self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+        self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
 
         # Update the variables
         self.panel_width = width
@@ -824,11 +852,10 @@ class Panel_YUV(QWidget):
         # Correct Cursor
         if (event.buttons() == QtCore.Qt.LeftButton or event.buttons() == QtCore.Qt.MiddleButton):
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
         elif event.buttons() == QtCore.Qt.RightButton:
             self.cursorzoom(1)
         # Emit Values
@@ -840,16 +867,15 @@ class Panel_YUV(QWidget):
     def cursorzoom(self, zoom):
         if zoom == 1:
             # Scale Cursor for Display
-            self.cursor_rmb.resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
+            self.cursor_rmb.Resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
             self.SIGNAL_ZOOM.emit(1)
         else:
-            self.cursor_rmb.resize(0, 0)
+            self.cursor_rmb.Resize(0, 0)
             self.SIGNAL_ZOOM.emit(0)
     def mouseHue(self, event):
         # Delta
@@ -865,7 +891,15 @@ class Panel_YUV(QWidget):
         self.SIGNAL_YUV_VALUE.emit(list)
 
     # Paint
+    @Profiled
     def paintEvent(self, event):
+        self.Panel_Paint(event)
+        # Cursors over the Panel
+        painter = QPainter(self)
+        self.cursor_lmb.Paint(painter)
+        self.cursor_rmb.Paint(painter)
+        painter.end()
+    def Panel_Paint(self, event):
         # gradient on left side, color top to color bottom
         gradientL = QLinearGradient(0,0, 0,self.panel_height)
         gradientL.setColorAt(0, self.cor1)
@@ -964,25 +998,17 @@ class Panel_ARD(QWidget):
     def Cursor(self):
         # Variables
         self.hex = '#000000'
-        # Module Style
-        self.style = Style()
         # LMB SVG Cursor
-        self.cursor_lmb = QtSvg.QSvgWidget(self)
-        self.array_lmb = self.style.SVG_Cursor_LMB()
-        self.cursor_lmb.load(self.array_lmb)
+        self.cursor_lmb = Cursor_SVG(self, "LMB")
         # RMB SVG Cursor
-        self.cursor_rmb = QtSvg.QSvgWidget(self)
-        self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-        self.cursor_rmb.load(self.array_rmb)
+        self.cursor_rmb = Cursor_SVG(self, "RMB")
+        self.cursor_rmb.Color(self.hex)
         # Style SVG Cursors
         self.cursor_size = 20
         self.cursor_half = self.cursor_size / 2
-        self.cursor_lmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.resize(0, 0)
-        self.unseen = self.style.Transparent()
-        self.cursor_lmb.setStyleSheet(self.unseen)
-        self.cursor_rmb.setStyleSheet(self.unseen)
+        self.cursor_lmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Resize(0, 0)
         # Cursor Scale
         self.scale_factor = 180
 
@@ -1006,11 +1032,11 @@ class Panel_ARD(QWidget):
         self.cross_y = cross[1]
         # Move Cursor
         try:
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width()/2), self.value_y-(self.cursor_lmb.height()/2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width()/2), self.value_y-(self.cursor_rmb.height()/2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width()/2), self.value_y-(self.cursor_lmb.Height()/2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width()/2), self.value_y-(self.cursor_rmb.Height()/2))
         except:
-            self.cursor_lmb.move(0, self.panel_height)
-            self.cursor_rmb.move(0, self.panel_height)
+            self.cursor_lmb.Move(0, self.panel_height)
+            self.cursor_rmb.Move(0, self.panel_height)
         # Zoom
         self.cursorzoom(zoom)
 
@@ -1076,11 +1102,10 @@ class Panel_ARD(QWidget):
         # Correct Cursor
         if (event.buttons() == QtCore.Qt.LeftButton or event.buttons() == QtCore.Qt.MiddleButton or event.type() == QtCore.QEvent.MouseButtonDblClick):
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width()/2), self.value_y-(self.cursor_lmb.height()/2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width()/2), self.value_y-(self.cursor_rmb.height()/2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width()/2), self.value_y-(self.cursor_lmb.Height()/2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width()/2), self.value_y-(self.cursor_rmb.Height()/2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
         elif event.buttons() == QtCore.Qt.RightButton:
             self.cursorzoom(1)
         elif event.type() == QtCore.QEvent.MouseButtonRelease:
@@ -1095,16 +1120,15 @@ class Panel_ARD(QWidget):
     def cursorzoom(self, zoom):
         if zoom == 1:
             # Scale Cursor for Display
-            self.cursor_rmb.resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
+            self.cursor_rmb.Resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width()/2), self.value_y-(self.cursor_lmb.height()/2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width()/2), self.value_y-(self.cursor_rmb.height()/2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width()/2), self.value_y-(self.cursor_lmb.Height()/2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width()/2), self.value_y-(self.cursor_rmb.Height()/2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
             self.SIGNAL_ZOOM.emit(1)
         else:
-            self.cursor_rmb.resize(0, 0)
+            self.cursor_rmb.Resize(0, 0)
             self.SIGNAL_ZOOM.emit(0)
     def mouseHue(self, event):
         # Delta
@@ -1120,7 +1144,15 @@ class Panel_ARD(QWidget):
         self.SIGNAL_ARD_VALUE.emit(values)
 
     # Paint
+    @Profiled
     def paintEvent(self, event):
+        self.Panel_Paint(event)
+        # Cursors over the Panel
+        painter = QPainter(self)
+        self.cursor_lmb.Paint(painter)
+        self.cursor_rmb.Paint(painter)
+        painter.end()
+    def Panel_Paint(self, event):
         # Start Qpainter
         painter = QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
@@ -1194,25 +1226,17 @@ class Panel_HSV_4(QWidget):
     def Cursor(self):
         # Variables
         self.hex = '#000000'
-        # Module Style
-        self.style = Style()
         # LMB SVG Cursor
-        self.cursor_lmb = QtSvg.QSvgWidget(self)
-        self.array_lmb = self.style.SVG_Cursor_LMB()
-        self.cursor_lmb.load(self.array_lmb)
+        self.cursor_lmb = Cursor_SVG(self, "LMB")
         # RMB SVG Cursor
-        self.cursor_rmb = QtSvg.QSvgWidget(self)
-        self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-        self.cursor_rmb.load(self.array_rmb)
+        self.cursor_rmb = Cursor_SVG(self, "RMB")
+        self.cursor_rmb.Color(self.hex)
         # Style SVG Cursors
         self.cursor_size = 20
         self.cursor_half = self.cursor_size / 2
-        self.cursor_lmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.resize(0, 0)
-        self.unseen = self.style.Transparent()
-        self.cursor_lmb.setStyleSheet(self.unseen)
-        self.cursor_rmb.setStyleSheet(self.unseen)
+        self.cursor_lmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Resize(0, 0)
         # Cursor Scale
         self.scale_factor = 180
 
@@ -1225,8 +1249,8 @@ class Panel_HSV_4(QWidget):
         self.value_x = self.hsv[1] * self.panel_width
         self.value_y = self.panel_height - (self.hsv[2] * self.panel_height)
         # Move Cursor
-        self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-        self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+        self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+        self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
         # Harmony
         self.harmony_render = harmony_render
         self.harmony_edit = harmony_edit
@@ -1293,11 +1317,10 @@ class Panel_HSV_4(QWidget):
         # Correct Cursor
         if (event.buttons() == QtCore.Qt.LeftButton or event.buttons() == QtCore.Qt.MiddleButton):
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
         elif event.buttons() == QtCore.Qt.RightButton:
             self.cursorzoom(1)
         # Emit Values
@@ -1309,16 +1332,15 @@ class Panel_HSV_4(QWidget):
     def cursorzoom(self, zoom):
         if zoom == 1:
             # Scale Cursor for Display
-            self.cursor_rmb.resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
+            self.cursor_rmb.Resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
             self.SIGNAL_ZOOM.emit(1)
         else:
-            self.cursor_rmb.resize(0, 0)
+            self.cursor_rmb.Resize(0, 0)
             self.SIGNAL_ZOOM.emit(0)
     def mouseHue(self, event):
         # Delta
@@ -1343,7 +1365,15 @@ class Panel_HSV_4(QWidget):
             self.cursorzoom(0)
 
     # Paint
+    @Profiled
     def paintEvent(self, event):
+        self.Panel_Paint(event)
+        # Cursors over the Panel
+        painter = QPainter(self)
+        self.cursor_lmb.Paint(painter)
+        self.cursor_rmb.Paint(painter)
+        painter.end()
+    def Panel_Paint(self, event):
         if self.harmony_render == "COLOR":
             # Start Qpainter
             painter = QPainter(self)
@@ -1423,25 +1453,17 @@ class Panel_HSL_3(QWidget):
     def Cursor(self):
         # Variables
         self.hex = '#000000'
-        # Module Style
-        self.style = Style()
         # LMB SVG Cursor
-        self.cursor_lmb = QtSvg.QSvgWidget(self)
-        self.array_lmb = self.style.SVG_Cursor_LMB()
-        self.cursor_lmb.load(self.array_lmb)
+        self.cursor_lmb = Cursor_SVG(self, "LMB")
         # RMB SVG Cursor
-        self.cursor_rmb = QtSvg.QSvgWidget(self)
-        self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-        self.cursor_rmb.load(self.array_rmb)
+        self.cursor_rmb = Cursor_SVG(self, "RMB")
+        self.cursor_rmb.Color(self.hex)
         # Style SVG Cursors
         self.cursor_size = 20
         self.cursor_half = self.cursor_size / 2
-        self.cursor_lmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.resize(0, 0)
-        self.unseen = self.style.Transparent()
-        self.cursor_lmb.setStyleSheet(self.unseen)
-        self.cursor_rmb.setStyleSheet(self.unseen)
+        self.cursor_lmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Resize(0, 0)
         # Cursor Scale
         self.scale_factor = 180
 
@@ -1457,8 +1479,8 @@ class Panel_HSL_3(QWidget):
         self.value_y = self.panel_height - (self.hsl[2] * self.panel_height)
         self.value_x = self.Panel_Triangle(self.hsl[1], self.value_y)
         # Move Cursor
-        self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-        self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+        self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+        self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
         # Harmony
         self.harmony_render = harmony_render
         self.harmony_edit = harmony_edit
@@ -1569,11 +1591,10 @@ class Panel_HSL_3(QWidget):
         # Correct Cursor
         if (event.buttons() == QtCore.Qt.LeftButton or event.buttons() == QtCore.Qt.MiddleButton):
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
         if event.buttons() == QtCore.Qt.RightButton:
             self.cursorzoom(1)
         # Emit Values
@@ -1585,16 +1606,15 @@ class Panel_HSL_3(QWidget):
     def cursorzoom(self, zoom):
         if zoom == 1:
             # Scale Cursor for Display
-            self.cursor_rmb.resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
+            self.cursor_rmb.Resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
             self.SIGNAL_ZOOM.emit(1)
         else:
-            self.cursor_rmb.resize(0, 0)
+            self.cursor_rmb.Resize(0, 0)
             self.SIGNAL_ZOOM.emit(0)
     def mouseHue(self, event):
         # Delta
@@ -1610,7 +1630,15 @@ class Panel_HSL_3(QWidget):
         self.SIGNAL_HSL_3_VALUE.emit(list)
 
     # Paint
+    @Profiled
     def paintEvent(self, event):
+        self.Panel_Paint(event)
+        # Cursors over the Panel
+        painter = QPainter(self)
+        self.cursor_lmb.Paint(painter)
+        self.cursor_rmb.Paint(painter)
+        painter.end()
+    def Panel_Paint(self, event):
         if self.harmony_render == "COLOR":
             # Start Qpainter
             painter = QPainter(self)
@@ -1740,25 +1768,17 @@ class Panel_HSL_4(QWidget):
     def Cursor(self):
         # Variables
         self.hex = '#000000'
-        # Module Style
-        self.style = Style()
         # LMB SVG Cursor
-        self.cursor_lmb = QtSvg.QSvgWidget(self)
-        self.array_lmb = self.style.SVG_Cursor_LMB()
-        self.cursor_lmb.load(self.array_lmb)
+        self.cursor_lmb = Cursor_SVG(self, "LMB")
         # RMB SVG Cursor
-        self.cursor_rmb = QtSvg.QSvgWidget(self)
-        self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-        self.cursor_rmb.load(self.array_rmb)
+        self.cursor_rmb = Cursor_SVG(self, "RMB")
+        self.cursor_rmb.Color(self.hex)
         # Style SVG Cursors
         self.cursor_size = 20
         self.cursor_half = self.cursor_size / 2
-        self.cursor_lmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.resize(0, 0)
-        self.unseen = self.style.Transparent()
-        self.cursor_lmb.setStyleSheet(self.unseen)
-        self.cursor_rmb.setStyleSheet(self.unseen)
+        self.cursor_lmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Resize(0, 0)
         # Cursor Scale
         self.scale_factor = 180
 
@@ -1771,8 +1791,8 @@ class Panel_HSL_4(QWidget):
         self.value_x = self.hsl[1] * self.panel_width
         self.value_y = self.panel_height - (self.hsl[2] * self.panel_height)
         # Move Cursor
-        self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-        self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+        self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+        self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
         # Harmony
         self.harmony_render = harmony_render
         self.harmony_edit = harmony_edit
@@ -1839,11 +1859,10 @@ class Panel_HSL_4(QWidget):
         # Correct Cursor
         if (event.buttons() == QtCore.Qt.LeftButton or event.buttons() == QtCore.Qt.MiddleButton):
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
         if event.buttons() == QtCore.Qt.RightButton:
             self.cursorzoom(1)
         # Emit Values
@@ -1855,16 +1874,15 @@ class Panel_HSL_4(QWidget):
     def cursorzoom(self, zoom):
         if zoom == 1:
             # Scale Cursor for Display
-            self.cursor_rmb.resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
+            self.cursor_rmb.Resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
             self.SIGNAL_ZOOM.emit(1)
         else:
-            self.cursor_rmb.resize(0, 0)
+            self.cursor_rmb.Resize(0, 0)
             self.SIGNAL_ZOOM.emit(0)
     def mouseHue(self, event):
         # Delta
@@ -1880,7 +1898,15 @@ class Panel_HSL_4(QWidget):
         self.SIGNAL_HSL_4_VALUE.emit(list)
 
     # Paint
+    @Profiled
     def paintEvent(self, event):
+        self.Panel_Paint(event)
+        # Cursors over the Panel
+        painter = QPainter(self)
+        self.cursor_lmb.Paint(painter)
+        self.cursor_rmb.Paint(painter)
+        painter.end()
+    def Panel_Paint(self, event):
         if self.harmony_render == "COLOR":
             # Start Qpainter
             painter = QPainter(self)
@@ -1940,8 +1966,6 @@ class Panel_HSL_4D(QWidget):
     # Init
     def __init__(self, parent):
         super(Panel_HSL_4D, self).__init__(parent)
-        # Module Style
-        self.style = Style()
         # Start
         self.Variables()
         self.Cursor()
@@ -1960,25 +1984,17 @@ class Panel_HSL_4D(QWidget):
     def Cursor(self):
         # Variables
         self.hex = '#000000'
-        # Module Style
-        self.style = Style()
         # LMB SVG Cursor
-        self.cursor_lmb = QtSvg.QSvgWidget(self)
-        self.array_lmb = self.style.SVG_Cursor_LMB()
-        self.cursor_lmb.load(self.array_lmb)
+        self.cursor_lmb = Cursor_SVG(self, "LMB")
         # RMB SVG Cursor
-        self.cursor_rmb = QtSvg.QSvgWidget(self)
-        self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-        self.cursor_rmb.load(self.array_rmb)
+        self.cursor_rmb = Cursor_SVG(self, "RMB")
+        self.cursor_rmb.Color(self.hex)
         # Style SVG Cursors
         self.cursor_size = 20
         self.cursor_half = self.cursor_size / 2
-        self.cursor_lmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.resize(0, 0)
-        self.unseen = self.style.Transparent()
-        self.cursor_lmb.setStyleSheet(self.unseen)
-        self.cursor_rmb.setStyleSheet(self.unseen)
+        self.cursor_lmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Resize(0, 0)
         # Cursor Scale
         self.scale_factor = 180
 
@@ -1993,8 +2009,8 @@ class Panel_HSL_4D(QWidget):
         # Change value range to slider range
         self.value_x, self.value_y = self.Panel_Diamond(self.hsl[1], self.hsl[2])
         # Move Cursor
-        self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-        self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+        self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+        self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
         # Harmony
         self.harmony_render = harmony_render
         self.harmony_edit = harmony_edit
@@ -2106,11 +2122,10 @@ class Panel_HSL_4D(QWidget):
         # Correct Cursor
         if (event.buttons() == QtCore.Qt.LeftButton or event.buttons() == QtCore.Qt.MiddleButton):
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
         elif event.buttons() == QtCore.Qt.RightButton:
             self.cursorzoom(1)
         # Emit Values
@@ -2118,16 +2133,15 @@ class Panel_HSL_4D(QWidget):
     def cursorzoom(self, zoom):
         if zoom == 1:
             # Scale Cursor for Display
-            self.cursor_rmb.resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
+            self.cursor_rmb.Resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
             self.SIGNAL_ZOOM.emit(1)
         else:
-            self.cursor_rmb.resize(0, 0)
+            self.cursor_rmb.Resize(0, 0)
             self.SIGNAL_ZOOM.emit(0)
     def mouseHue(self, event):
         # Delta
@@ -2143,7 +2157,15 @@ class Panel_HSL_4D(QWidget):
         self.SIGNAL_HSL_4D_VALUE.emit(list)
 
     # Paint
+    @Profiled
     def paintEvent(self, event):
+        self.Panel_Paint(event)
+        # Cursors over the Panel
+        painter = QPainter(self)
+        self.cursor_lmb.Paint(painter)
+        self.cursor_rmb.Paint(painter)
+        painter.end()
+    def Panel_Paint(self, event):
         if self.harmony_render == "COLOR":
             # Start Qpainter
             painter = QPainter(self)
@@ -2270,89 +2292,41 @@ class Panel_HCY_4(QWidget):
         self.panel_height = 0
         self.color_dark = QColor('#383838')
         self.color_light = QColor('#d4d4d4')
+        # Field
+        self.field = None
+        self.field_key = None
+        self.field_pixmap = None
     def Cursor(self):
         # Variables
         self.hex = '#000000'
-        # Module Style
-        self.style = Style()
         # LMB SVG Cursor
-        self.cursor_lmb = QtSvg.QSvgWidget(self)
-        self.array_lmb = self.style.SVG_Cursor_LMB()
-        self.cursor_lmb.load(self.array_lmb)
+        self.cursor_lmb = Cursor_SVG(self, "LMB")
         # RMB SVG Cursor
-        self.cursor_rmb = QtSvg.QSvgWidget(self)
-        self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-        self.cursor_rmb.load(self.array_rmb)
+        self.cursor_rmb = Cursor_SVG(self, "RMB")
+        self.cursor_rmb.Color(self.hex)
         # Style SVG Cursors
         self.cursor_size = 20
         self.cursor_half = self.cursor_size / 2
-        self.cursor_lmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.resize(0, 0)
-        self.unseen = self.style.Transparent()
-        self.cursor_lmb.setStyleSheet(self.unseen)
-        self.cursor_rmb.setStyleSheet(self.unseen)
+        self.cursor_lmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Resize(0, 0)
         # Cursor Scale
         self.scale_factor = 180
 
     # Relay
-    def Update_Panel(self,
-    hcy,
-
-    cor_00,
-    cor_01,
-    cor_02,
-    cor_03,
-    cor_04,
-    cor_05,
-    cor_06,
-    cor_07,
-    cor_08,
-    cor_09,
-    cor_10,
-
-    harmony_render, harmony_edit,
-    #har_1, har_2, har_3, har_4, har_5,
-    width, height, hex, zoom):
+    def Update_Panel(self, hcy, field, harmony_render, harmony_edit, width, height, hex, zoom):
         # Colors
         self.hcy = [hcy[0], hcy[1], hcy[2]]
-
-        self.cor_00 = [cor_00[0], cor_00[1], cor_00[2]]
-        self.cor_01 = [cor_01[0], cor_01[1], cor_01[2]]
-        self.cor_02 = [cor_02[0], cor_02[1], cor_02[2]]
-        self.cor_03 = [cor_03[0], cor_03[1], cor_03[2]]
-        self.cor_04 = [cor_04[0], cor_04[1], cor_04[2]]
-        self.cor_05 = [cor_05[0], cor_05[1], cor_05[2]]
-        self.cor_06 = [cor_06[0], cor_06[1], cor_06[2]]
-        self.cor_07 = [cor_07[0], cor_07[1], cor_07[2]]
-        self.cor_08 = [cor_08[0], cor_08[1], cor_08[2]]
-        self.cor_09 = [cor_09[0], cor_09[1], cor_09[2]]
-        self.cor_10 = [cor_10[0], cor_10[1], cor_10[2]]
-
+        self.field = field
         # Change value range to slider range
         self.value_x = self.hcy[1] * self.panel_width
         self.value_y = self.panel_height - (self.hcy[2] * self.panel_height)
         # Move Cursor
-        self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-        self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
-        # # Harmony
+        self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+        self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
+        # Harmony
         self.harmony_render = harmony_render
         self.harmony_edit = harmony_edit
-        # self.har_1 = [har_1[0], har_1[1], har_1[2]]
-        # self.har_2 = [har_2[0], har_2[1], har_2[2]]
-        # self.har_3 = [har_3[0], har_3[1], har_3[2]]
-        # self.har_4 = [har_4[0], har_4[1], har_4[2]]
-        # self.har_5 = [har_5[0], har_5[1], har_5[2]]
-        # self.har_1x = self.har_1[1] * self.panel_width
-        # self.har_2x = self.har_2[1] * self.panel_width
-        # self.har_3x = self.har_3[1] * self.panel_width
-        # self.har_4x = self.har_4[1] * self.panel_width
-        # self.har_5x = self.har_5[1] * self.panel_width
-        # self.har_1y = self.panel_height - (self.har_1[2] * self.panel_height)
-        # self.har_2y = self.panel_height - (self.har_2[2] * self.panel_height)
-        # self.har_3y = self.panel_height - (self.har_3[2] * self.panel_height)
-        # self.har_4y = self.panel_height - (self.har_4[2] * self.panel_height)
-        # self.har_5y = self.panel_height - (self.har_5[2] * self.panel_height)
         # Update the variables
         self.panel_width = width
         self.panel_height = height
@@ -2401,11 +2375,10 @@ class Panel_HCY_4(QWidget):
         # Correct Cursor
         if (event.buttons() == QtCore.Qt.LeftButton or event.buttons() == QtCore.Qt.MiddleButton):
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
         elif event.buttons() == QtCore.Qt.RightButton:
             self.cursorzoom(1)
         # Emit Values
@@ -2417,16 +2390,15 @@ class Panel_HCY_4(QWidget):
     def cursorzoom(self, zoom):
         if zoom == 1:
             # Scale Cursor for Display
-            self.cursor_rmb.resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
+            self.cursor_rmb.Resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
             self.SIGNAL_ZOOM.emit(1)
         else:
-            self.cursor_rmb.resize(0, 0)
+            self.cursor_rmb.Resize(0, 0)
             self.SIGNAL_ZOOM.emit(0)
     def mouseHue(self, event):
         # Delta
@@ -2442,65 +2414,28 @@ class Panel_HCY_4(QWidget):
         self.SIGNAL_HCY_4_VALUE.emit(list)
 
     # Paint
+    def Field_Pixmap(self):
+        # Smooth scale the Field only when the Field or the Panel size changes
+        key = (self.field.cacheKey(), self.panel_width, self.panel_height)
+        if self.field_key != key:
+            self.field_key = key
+            self.field_pixmap = QPixmap.fromImage(self.field.scaled(self.panel_width, self.panel_height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation))
+        return self.field_pixmap
+    @Profiled
     def paintEvent(self, event):
+        self.Panel_Paint(event)
+        # Cursors over the Panel
+        painter = QPainter(self)
+        self.cursor_lmb.Paint(painter)
+        self.cursor_rmb.Paint(painter)
+        painter.end()
+    def Panel_Paint(self, event):
         if self.harmony_render == "COLOR":
-            # Start Qpainter
-            painter = QPainter(self)
-            painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-            painter.setPen(QtCore.Qt.NoPen)
-
-            # Gradient BW
-            bw1 = QLinearGradient(0, 0, 0, self.panel_height)
-            bw1.setColorAt(0.000, QColor(255, 255, 255)) # White
-            bw1.setColorAt(1.000, QColor(0, 0, 0)) # Black
-            painter.setBrush(QBrush(bw1))
-            painter.drawRect(0,0, self.panel_width,self.panel_height)
-            painter.end()
-
-
-            gradientTransparencyLR = QLinearGradient(0,0, self.panel_width,0)
-            gradientTransparencyLR.setColorAt(0, QColor(Qt.black))
-            gradientTransparencyLR.setColorAt(1, QColor(Qt.transparent))
-
-            pixmapLeft = QPixmap(self.panel_width, self.panel_height)
-            pixmapLeft.fill(Qt.transparent)
-            canvas1 = QPainter(self)
-            canvas1.begin(pixmapLeft)
-
-            canvas1.setPen(Qt.NoPen)
-            canvas1.setBrush(gradientTransparencyLR)
-            canvas1.drawRect(QRect(0,0, self.panel_width, self.panel_height))
-
-            canvas1.setCompositionMode(QPainter.CompositionMode_SourceIn)
-            # canvas1.setBrush(gradientL)
-            # canvas1.drawRect(QRect(0,0, self.panel_width, self.panel_height))
-            # canvas1.end()
-
-
-            # Gradient Color (Source)
-            cor = QLinearGradient(0, 0, 0, self.panel_height)
-            cor.setColorAt(0.000, QColor(self.cor_00[0]*255, self.cor_00[1]*255, self.cor_00[2]*255, 255))
-            cor.setColorAt(0.100, QColor(self.cor_01[0]*255, self.cor_01[1]*255, self.cor_01[2]*255, 255))
-            cor.setColorAt(0.200, QColor(self.cor_02[0]*255, self.cor_02[1]*255, self.cor_02[2]*255, 255))
-            cor.setColorAt(0.300, QColor(self.cor_03[0]*255, self.cor_03[1]*255, self.cor_03[2]*255, 255))
-            cor.setColorAt(0.400, QColor(self.cor_04[0]*255, self.cor_04[1]*255, self.cor_04[2]*255, 255))
-            cor.setColorAt(0.500, QColor(self.cor_05[0]*255, self.cor_05[1]*255, self.cor_05[2]*255, 255))
-            cor.setColorAt(0.600, QColor(self.cor_06[0]*255, self.cor_06[1]*255, self.cor_06[2]*255, 255))
-            cor.setColorAt(0.700, QColor(self.cor_07[0]*255, self.cor_07[1]*255, self.cor_07[2]*255, 255))
-            cor.setColorAt(0.800, QColor(self.cor_08[0]*255, self.cor_08[1]*255, self.cor_08[2]*255, 255))
-            cor.setColorAt(0.900, QColor(self.cor_09[0]*255, self.cor_09[1]*255, self.cor_09[2]*255, 255))
-            cor.setColorAt(1.000, QColor(self.cor_10[0]*255, self.cor_10[1]*255, self.cor_10[2]*255, 255))
-            canvas1.setBrush(QBrush(cor))
-            canvas1.drawRect(0,0, self.panel_width, self.panel_height)
-            canvas1.end()
-
-            # # Gradient BW (Destination)
-            # painter.setCompositionMode(QPainter.CompositionMode_Lighten)
-            # bw2 = QLinearGradient(0, 0, self.panel_width, 0)
-            # bw2.setColorAt(0.000, QColor(255, 255, 255, 0))
-            # bw2.setColorAt(1.000, QColor(0, 0, 0, 255))
-            # painter.setBrush(QBrush(bw2))
-            # painter.drawRect(0,0, self.panel_width,self.panel_height)
+            if (self.field is not None and self.panel_width > 0 and self.panel_height > 0):
+                # Start Qpainter
+                painter = QPainter(self)
+                painter.drawPixmap(0, 0, self.Field_Pixmap())
+                painter.end()
         if self.harmony_render == "HARMONY":
             pass
 
@@ -2513,8 +2448,6 @@ class Panel_HUE_Circle(QWidget):
     # Init
     def __init__(self, parent):
         super(Panel_HUE_Circle, self).__init__(parent)
-        # Module Style
-        self.style = Style()
         # Start
         self.Variables()
         # Size Hint Expand
@@ -2539,6 +2472,11 @@ class Panel_HUE_Circle(QWidget):
         self.color_gray = QColor('#666666')
         self.har_radius = 0.5
         self.har_radius_poly = 0.5 - ( 2 * 0.035 )
+        self.panel_width = 0
+        self.panel_height = 0
+        # Ring Cache
+        self.ring_key = None
+        self.ring_pixmap = None
 
         self.h1_angle = 0
         self.h2_angle = 0
@@ -2976,31 +2914,84 @@ class Panel_HUE_Circle(QWidget):
                         self.SIGNAL_HUE_C_HARMONY_ACTIVE.emit(3)
 
     # Paint
+    def Ring_Regions(self):
+        # Path Regions
+        outline0 = QPainterPath() # Everything
+        outline0.addEllipse(0,0, self.panel_width,self.panel_height)
+        value1a = 0.03
+        value1b = 1 - (2*value1a)
+        outline1 = QPainterPath() # Outter Most Region
+        outline1.addEllipse(self.panel_width*value1a,self.panel_height*value1a, self.panel_width*value1b,self.panel_height*value1b)
+        value2a = 0.068
+        value2b = 1 - (2*value2a)
+        outline2 = QPainterPath() # Inner Most Region
+        outline2.addEllipse(self.panel_width*value2a,self.panel_height*value2a, self.panel_width*value2b,self.panel_height*value2b)
+        value3a = 0.35
+        value3b = 1 - (2*value3a)
+        outline3 = QPainterPath() # Central Dot
+        outline3.addEllipse(self.panel_width*value3a,self.panel_height*value3a, self.panel_width*value3b,self.panel_height*value3b)
+        return outline0, outline1, outline2, outline3
+    def Ring_Pixmap(self):
+        # Rasterize the Ring only when its Geometry or Colors change
+        ratio = self.devicePixelRatioF()
+        key = (
+            self.wheel, self.panel_width, self.panel_height, ratio,
+            tuple(self.red), tuple(self.mag), tuple(self.blu), tuple(self.cya), tuple(self.gre), tuple(self.yel), tuple(self.ora),
+            self.gray_natural,
+            )
+        if self.ring_key == key:
+            return self.ring_pixmap
+        self.ring_key = key
+        # Device Pixels for HiDPI screens, drawn in logical coordinates
+        self.ring_pixmap = QPixmap(max(1, round(self.panel_width * ratio)), max(1, round(self.panel_height * ratio)))
+        self.ring_pixmap.setDevicePixelRatio(ratio)
+        self.ring_pixmap.fill(Qt.transparent)
+        # Start Qpainter
+        painter = QPainter(self.ring_pixmap)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        outline0, outline1, outline2, outline3 = self.Ring_Regions()
+        # Dark Border
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(QBrush(QColor(self.gray_natural)))
+        outline02 = outline0.subtracted(outline2)
+        painter.drawPath(outline02)
+        # Hue Gradient
+        if self.wheel == "CMY":
+            hue = QConicalGradient(QPoint(self.panel_width/2, self.panel_height/2), 180)
+            hue.setColorAt(0.000, QColor(self.red[0], self.red[1], self.red[2])) # RED
+            hue.setColorAt(0.166, QColor(self.mag[0], self.mag[1], self.mag[2])) # MAGENTA
+            hue.setColorAt(0.333, QColor(self.blu[0], self.blu[1], self.blu[2])) # BLUE
+            hue.setColorAt(0.500, QColor(self.cya[0], self.cya[1], self.cya[2])) # CYAN
+            hue.setColorAt(0.666, QColor(self.gre[0], self.gre[1], self.gre[2])) # GREEN
+            hue.setColorAt(0.833, QColor(self.yel[0], self.yel[1], self.yel[2])) # YELLOW
+            hue.setColorAt(1.000, QColor(self.red[0], self.red[1], self.red[2])) # RED
+        if self.wheel == "RYB":
+            hue = QConicalGradient(QPoint(self.panel_width/2, self.panel_height/2), 210)
+            hue.setColorAt(0.000, QColor(self.red[0], self.red[1], self.red[2])) # RED
+            hue.setColorAt(0.083, QColor(self.mag[0], self.mag[1], self.mag[2])) # MAGENTA
+            hue.setColorAt(0.236, QColor(self.blu[0], self.blu[1], self.blu[2])) # BLUE
+            hue.setColorAt(0.394, QColor(self.cya[0], self.cya[1], self.cya[2])) # CYAN
+            hue.setColorAt(0.541, QColor(self.gre[0], self.gre[1], self.gre[2])) # GREEN
+            hue.setColorAt(0.661, QColor(self.yel[0], self.yel[1], self.yel[2])) # YELLOW
+            hue.setColorAt(0.833, QColor(self.ora[0], self.ora[1], self.ora[2])) # ORANGE
+            hue.setColorAt(1.000, QColor(self.red[0], self.red[1], self.red[2])) # RED
+        painter.setBrush(QBrush(hue))
+        outline01 = outline0.subtracted(outline1)
+        painter.setClipPath(outline01)
+        painter.drawRect(0,0, self.panel_width,self.panel_height)
+        painter.end()
+        return self.ring_pixmap
+    @Profiled
     def paintEvent(self, event):
+        if (self.panel_width <= 0 or self.panel_height <= 0):
+            return
         if self.harmony_render == "COLOR":
             # Start Qpainter
             painter = QPainter(self)
             painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-            # Path Regions
-            outline0 = QPainterPath() # Everything
-            outline0.addEllipse(0,0, self.panel_width,self.panel_height)
-            value1a = 0.03
-            value1b = 1 - (2*value1a)
-            outline1 = QPainterPath() # Outter Most Region
-            outline1.addEllipse(self.panel_width*value1a,self.panel_height*value1a, self.panel_width*value1b,self.panel_height*value1b)
-            value2a = 0.068
-            value2b = 1 - (2*value2a)
-            outline2 = QPainterPath() # Inner Most Region
-            outline2.addEllipse(self.panel_width*value2a,self.panel_height*value2a, self.panel_width*value2b,self.panel_height*value2b)
-            value3a = 0.35
-            value3b = 1 - (2*value3a)
-            outline3 = QPainterPath() # Central Dot
-            outline3.addEllipse(self.panel_width*value3a,self.panel_height*value3a, self.panel_width*value3b,self.panel_height*value3b)
-            # Dark Border
-            painter.setPen(QtCore.Qt.NoPen)
-            painter.setBrush(QBrush(QColor(self.gray_natural)))
-            outline02 = outline0.subtracted(outline2)
-            painter.drawPath(outline02)
+            outline0, outline1, outline2, outline3 = self.Ring_Regions()
+            # Dark Border and Hue Gradient
+            painter.drawPixmap(0, 0, self.Ring_Pixmap())
             # Line Gray
             painter.setPen(QPen(QColor(self.gray_contrast), 5, Qt.SolidLine, Qt.SquareCap, Qt.MiterJoin))
             line_gray = QPainterPath()
@@ -3009,31 +3000,6 @@ class Panel_HUE_Circle(QWidget):
             outline13 = outline1.subtracted(outline3)
             painter.setClipPath(outline13)
             painter.drawPath(line_gray)
-            # Hue Gradient
-            painter.setPen(QtCore.Qt.NoPen)
-            if self.wheel == "CMY":
-                hue = QConicalGradient(QPoint(self.panel_width/2, self.panel_height/2), 180)
-                hue.setColorAt(0.000, QColor(self.red[0], self.red[1], self.red[2])) # RED
-                hue.setColorAt(0.166, QColor(self.mag[0], self.mag[1], self.mag[2])) # MAGENTA
-                hue.setColorAt(0.333, QColor(self.blu[0], self.blu[1], self.blu[2])) # BLUE
-                hue.setColorAt(0.500, QColor(self.cya[0], self.cya[1], self.cya[2])) # CYAN
-                hue.setColorAt(0.666, QColor(self.gre[0], self.gre[1], self.gre[2])) # GREEN
-                hue.setColorAt(0.833, QColor(self.yel[0], self.yel[1], self.yel[2])) # YELLOW
-                hue.setColorAt(1.000, QColor(self.red[0], self.red[1], self.red[2])) # RED
-            if self.wheel == "RYB":
-                hue = QConicalGradient(QPoint(self.panel_width/2, self.panel_height/2), 210)
-                hue.setColorAt(0.000, QColor(self.red[0], self.red[1], self.red[2])) # RED
-                hue.setColorAt(0.083, QColor(self.mag[0], self.mag[1], self.mag[2])) # MAGENTA
-                hue.setColorAt(0.236, QColor(self.blu[0], self.blu[1], self.blu[2])) # BLUE
-                hue.setColorAt(0.394, QColor(self.cya[0], self.cya[1], self.cya[2])) # CYAN
-                hue.setColorAt(0.541, QColor(self.gre[0], self.gre[1], self.gre[2])) # GREEN
-                hue.setColorAt(0.661, QColor(self.yel[0], self.yel[1], self.yel[2])) # YELLOW
-                hue.setColorAt(0.833, QColor(self.ora[0], self.ora[1], self.ora[2])) # ORANGE
-                hue.setColorAt(1.000, QColor(self.red[0], self.red[1], self.red[2])) # RED
-            painter.setBrush(QBrush(hue))
-            outline01 = outline0.subtracted(outline1)
-            painter.setClipPath(outline01)
-            painter.drawRect(0,0, self.panel_width,self.panel_height)
             # Line Dark over Hue
             painter.setPen(QPen(QColor(self.gray_natural), 5, Qt.SolidLine, Qt.SquareCap, Qt.MiterJoin))
             outline01 = outline0.subtracted(outline1)
@@ -3043,21 +3009,7 @@ class Panel_HUE_Circle(QWidget):
             # Start Qpainter
             painter = QPainter(self)
             painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-            # Path Regions
-            outline0 = QPainterPath() # Everything
-            outline0.addEllipse(0,0, self.panel_width,self.panel_height)
-            value1a = 0.03
-            value1b = 1 - (2*value1a)
-            outline1 = QPainterPath() # Outter Most Region
-            outline1.addEllipse(self.panel_width*value1a,self.panel_height*value1a, self.panel_width*value1b,self.panel_height*value1b)
-            value2a = 0.068
-            value2b = 1 - (2*value2a)
-            outline2 = QPainterPath() # Inner Most Region
-            outline2.addEllipse(self.panel_width*value2a,self.panel_height*value2a, self.panel_width*value2b,self.panel_height*value2b)
-            value3a = 0.35
-            value3b = 1 - (2*value3a)
-            outline3 = QPainterPath() # Central Dot
-            outline3.addEllipse(self.panel_width*value3a,self.panel_height*value3a, self.panel_width*value3b,self.panel_height*value3b)
+            outline0, outline1, outline2, outline3 = self.Ring_Regions()
             # Harmony Gray SPAN Area
             painter.setPen(QtCore.Qt.NoPen)
             painter.setBrush(QBrush(QColor(self.gray_natural)))
@@ -3076,13 +3028,6 @@ class Panel_HUE_Circle(QWidget):
                     span_angle = self.h5_angle - self.h1_angle
                 # Draw Pie Shape
                 painter.drawPie(0,0, self.panel_width,self.panel_height, pie_angle_5*16, span_angle*16)
-                # Polygon
-                polygon = QPolygon([
-                    QPoint(0, 0),
-                    QPoint(0, 0),
-                    QPoint(0, 0)
-                    ])
-                painter.drawPolygon(polygon)
             if self.harmony_rule == "Split Complemantary":
                 # Triangle
                 polygon = QPolygon([
@@ -3100,11 +3045,8 @@ class Panel_HUE_Circle(QWidget):
                     QPoint(self.h5p_circle_x, self.h5p_circle_y)
                     ])
                 painter.drawPolygon(polygon)
-            # Dark Border
-            painter.setPen(QtCore.Qt.NoPen)
-            painter.setBrush(QBrush(QColor(self.gray_natural)))
-            outline02 = outline0.subtracted(outline2)
-            painter.drawPath(outline02)
+            # Dark Border and Hue Gradient
+            painter.drawPixmap(0, 0, self.Ring_Pixmap())
             # Line Gray
             outline23 = outline2.subtracted(outline3)
             painter.setClipPath(outline23)
@@ -3124,31 +3066,6 @@ class Panel_HUE_Circle(QWidget):
             line_gray.moveTo(self.panel_width*0.5, self.panel_height*0.5)
             line_gray.lineTo(self.h3_circle_x,self.h3_circle_y)
             painter.drawPath(line_gray)
-            # Hue Gradient
-            painter.setPen(QtCore.Qt.NoPen)
-            if self.wheel == "CMY":
-                hue = QConicalGradient(QPoint(self.panel_width/2, self.panel_height/2), 180)
-                hue.setColorAt(0.000, QColor(self.red[0], self.red[1], self.red[2])) # RED
-                hue.setColorAt(0.166, QColor(self.mag[0], self.mag[1], self.mag[2])) # MAGENTA
-                hue.setColorAt(0.333, QColor(self.blu[0], self.blu[1], self.blu[2])) # BLUE
-                hue.setColorAt(0.500, QColor(self.cya[0], self.cya[1], self.cya[2])) # CYAN
-                hue.setColorAt(0.666, QColor(self.gre[0], self.gre[1], self.gre[2])) # GREEN
-                hue.setColorAt(0.833, QColor(self.yel[0], self.yel[1], self.yel[2])) # YELLOW
-                hue.setColorAt(1.000, QColor(self.red[0], self.red[1], self.red[2])) # RED
-            if self.wheel == "RYB":
-                hue = QConicalGradient(QPoint(self.panel_width/2, self.panel_height/2), 210)
-                hue.setColorAt(0.000, QColor(self.red[0], self.red[1], self.red[2])) # RED
-                hue.setColorAt(0.083, QColor(self.mag[0], self.mag[1], self.mag[2])) # MAGENTA
-                hue.setColorAt(0.236, QColor(self.blu[0], self.blu[1], self.blu[2])) # BLUE
-                hue.setColorAt(0.394, QColor(self.cya[0], self.cya[1], self.cya[2])) # CYAN
-                hue.setColorAt(0.541, QColor(self.gre[0], self.gre[1], self.gre[2])) # GREEN
-                hue.setColorAt(0.661, QColor(self.yel[0], self.yel[1], self.yel[2])) # YELLOW
-                hue.setColorAt(0.833, QColor(self.ora[0], self.ora[1], self.ora[2])) # ORANGE
-                hue.setColorAt(1.000, QColor(self.red[0], self.red[1], self.red[2])) # RED
-            painter.setBrush(QBrush(hue))
-            outline01 = outline0.subtracted(outline1)
-            painter.setClipPath(outline01)
-            painter.drawRect(0,0, self.panel_width,self.panel_height)
             # Line Dark over Hue
             outline01 = outline0.subtracted(outline1)
             painter.setClipPath(outline01)
@@ -3224,8 +3141,6 @@ class Panel_GAM_Circle(QWidget):
     # Init
     def __init__(self, parent):
         super(Panel_GAM_Circle, self).__init__(parent)
-        # Module Style
-        self.style = Style()
         # Start
         self.Variables()
         # Size Hint Expand
@@ -3442,6 +3357,7 @@ class Panel_GAM_Circle(QWidget):
             self.circle_y = 0
 
     # Paint
+    @Profiled
     def paintEvent(self, event):
         # Start Qpainter
         painter = QPainter(self)
@@ -3488,12 +3404,12 @@ class Panel_GAM_Polygon(QWidget):
     SIGNAL_GAM_P_RELEASE = QtCore.pyqtSignal(int)
     SIGNAL_GAM_P_COLORS = QtCore.pyqtSignal(list)
     SIGNAL_ZOOM = QtCore.pyqtSignal(int)
+    # Slice of each Gamut Shape in the points buffer
+    shapes = {"P1_S1" : (0, 8), "P1_S3" : (8, 14), "P1_S4" : (14, 22), "P2_S1" : (22, 38), "P3_S3" : (38, 52)}
 
     # Init
     def __init__(self, parent):
         super(Panel_GAM_Polygon, self).__init__(parent)
-        # Module Style
-        self.style = Style()
         # Start
         self.Cursor()
         self.Variables()
@@ -3507,54 +3423,30 @@ class Panel_GAM_Polygon(QWidget):
         self.circle = 5
         self.cmy_step = [0, 35/360, 60/360, 120/360, 180/360, 240/360, 300/360, 1]
         self.ryb_step = [0, 60/360, 122/360, 165/360, 218/360, 275/360, 330/360, 1]
-        # Colors
-        self.cgg = [0,0,0]
-        self.c00 = [0,0,0]
-        self.c01 = [0,0,0]
-        self.c02 = [0,0,0]
-        self.c03 = [0,0,0]
-        self.c04 = [0,0,0]
-        self.c05 = [0,0,0]
-        self.c06 = [0,0,0]
-        self.c07 = [0,0,0]
-        self.c08 = [0,0,0]
-        self.c09 = [0,0,0]
-        self.c10 = [0,0,0]
-        self.c11 = [0,0,0]
-        self.c12 = [0,0,0]
-        self.c13 = [0,0,0]
-        self.c14 = [0,0,0]
-        self.c15 = [0,0,0]
-        self.c16 = [0,0,0]
-        self.c17 = [0,0,0]
-        self.c18 = [0,0,0]
-        self.c19 = [0,0,0]
-        self.c20 = [0,0,0]
-        self.c21 = [0,0,0]
-        self.c22 = [0,0,0]
-        self.c23 = [0,0,0]
-        self.c24 = [0,0,0]
-        self.c25 = [0,0,0]
-        self.c26 = [0,0,0]
-        self.c27 = [0,0,0]
-        self.c28 = [0,0,0]
-        self.c29 = [0,0,0]
-        self.c30 = [0,0,0]
-        self.c31 = [0,0,0]
-        self.c32 = [0,0,0]
-        self.c33 = [0,0,0]
-        self.c34 = [0,0,0]
-        self.c35 = [0,0,0]
-        self.c36 = [0,0,0]
-        # Gamut Shape
+        # Colors (RGB 0-255, the Ring is flat from Red to Red)
+        self.cgg = array.array("d", [0,0,0])
+        self.ring = array.array("d", [0,0,0, 0,0,0])
+        # Gamut Shape (X,Y pairs in Panel pixels, each shape is a view of one buffer)
         self.gamut_shape = "None"
-        self.P1_S1 = [0,0, 0,0, 0,0, 0,0]
-        self.P1_S3 = [0,0, 0,0, 0,0]
-        self.P1_S4 = [0,0, 0,0, 0,0, 0,0]
-        self.P2_S1 = [0,0, 0,0, 0,0, 0,0, 0,0, 0,0, 0,0, 0,0,]
-        self.P3_S3 = [0,0, 0,0, 0,0, 0,0, 0,0, 0,0, 0,0,]
+        self.points = array.array("d", bytes(8 * self.shapes["P3_S3"][1]))
+        view = memoryview(self.points)
+        for shape, (start, end) in self.shapes.items():
+            setattr(self, shape, view[start:end])
         self.centroid_1 = [0, 0]
         self.centroid_2 = [0, 0]
+        # Krita Gamut Mask
+        self.kgm_file = ""
+        self.kgm_box = 144
+        self.kgm_paths = []
+        # Gamut Mask Cache
+        self.mask_key = None
+        self.mask_paths = []
+        self.mask_bits = None
+        self.mask_stride = 0
+        self.mask_width = 1
+        self.mask_height = 1
+        self.mask_field = None
+        self.mask_grid = 128 # Cells per side of the clamping field
         # Widget
         self.panel_width = 0
         self.panel_height = 0
@@ -3566,30 +3458,22 @@ class Panel_GAM_Polygon(QWidget):
     def Cursor(self):
         # Variables
         self.hex = '#000000'
-        # Module Style
-        self.style = Style()
         # LMB SVG Cursor
-        self.cursor_lmb = QtSvg.QSvgWidget(self)
-        self.array_lmb = self.style.SVG_Cursor_LMB()
-        self.cursor_lmb.load(self.array_lmb)
+        self.cursor_lmb = Cursor_SVG(self, "LMB")
         # RMB SVG Cursor
-        self.cursor_rmb = QtSvg.QSvgWidget(self)
-        self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-        self.cursor_rmb.load(self.array_rmb)
+        self.cursor_rmb = Cursor_SVG(self, "RMB")
+        self.cursor_rmb.Color(self.hex)
         # Style SVG Cursors
         self.cursor_size = 20
         self.cursor_half = self.cursor_size / 2
-        self.cursor_lmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_rmb.resize(0, 0)
-        self.unseen = self.style.Transparent()
-        self.cursor_lmb.setStyleSheet(self.unseen)
-        self.cursor_rmb.setStyleSheet(self.unseen)
+        self.cursor_lmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_rmb.Resize(0, 0)
         # Cursor Scale
         self.scale_factor = 180
 
     # Relay
-    def Update_Panel(self, angle, radius, wheel, cgg, c00, c01, c02, c03, c04, c05, c06, c07, c08, c09, c10, c11, c12, c13, c14, c15, c16, c17, c18, c19, c20, c21, c22, c23, c24, c25, c26, c27, c28, c29, c30, c31, c32, c33, c34, c35, c36, gamut_shape, P1_S1, P1_S3, P1_S4, P2_S1, P3_S3, panel_width, panel_height, gray_natural, gray_contrast, hex, zoom):
+    def Update_Panel(self, angle, radius, wheel, cgg, ring, gamut_shape, P1_S1, P1_S3, P1_S4, P2_S1, P3_S3, panel_width, panel_height, gray_natural, gray_contrast, hex, zoom):
         # Values
         self.angle = angle * 360
         self.radius = radius
@@ -3598,113 +3482,29 @@ class Panel_GAM_Polygon(QWidget):
         if self.wheel == "RYB":
             self.angle -= 30
         # Base Colors
-        self.cgg = [cgg[0]*255, cgg[1]*255, cgg[2]*255]
-        self.c00 = [c00[0]*255, c00[1]*255, c00[2]*255]
-        self.c01 = [c01[0]*255, c01[1]*255, c01[2]*255]
-        self.c02 = [c02[0]*255, c02[1]*255, c02[2]*255]
-        self.c03 = [c03[0]*255, c03[1]*255, c03[2]*255]
-        self.c04 = [c04[0]*255, c04[1]*255, c04[2]*255]
-        self.c05 = [c05[0]*255, c05[1]*255, c05[2]*255]
-        self.c06 = [c06[0]*255, c06[1]*255, c06[2]*255]
-        self.c07 = [c07[0]*255, c07[1]*255, c07[2]*255]
-        self.c08 = [c08[0]*255, c08[1]*255, c08[2]*255]
-        self.c09 = [c09[0]*255, c09[1]*255, c09[2]*255]
-        self.c10 = [c10[0]*255, c10[1]*255, c10[2]*255]
-        self.c11 = [c11[0]*255, c11[1]*255, c11[2]*255]
-        self.c12 = [c12[0]*255, c12[1]*255, c12[2]*255]
-        self.c13 = [c13[0]*255, c13[1]*255, c13[2]*255]
-        self.c14 = [c14[0]*255, c14[1]*255, c14[2]*255]
-        self.c15 = [c15[0]*255, c15[1]*255, c15[2]*255]
-        self.c16 = [c16[0]*255, c16[1]*255, c16[2]*255]
-        self.c17 = [c17[0]*255, c17[1]*255, c17[2]*255]
-        self.c18 = [c18[0]*255, c18[1]*255, c18[2]*255]
-        self.c19 = [c19[0]*255, c19[1]*255, c19[2]*255]
-        self.c20 = [c20[0]*255, c20[1]*255, c20[2]*255]
-        self.c21 = [c21[0]*255, c21[1]*255, c21[2]*255]
-        self.c22 = [c22[0]*255, c22[1]*255, c22[2]*255]
-        self.c23 = [c23[0]*255, c23[1]*255, c23[2]*255]
-        self.c24 = [c24[0]*255, c24[1]*255, c24[2]*255]
-        self.c25 = [c25[0]*255, c25[1]*255, c25[2]*255]
-        self.c26 = [c26[0]*255, c26[1]*255, c26[2]*255]
-        self.c27 = [c27[0]*255, c27[1]*255, c27[2]*255]
-        self.c28 = [c28[0]*255, c28[1]*255, c28[2]*255]
-        self.c29 = [c29[0]*255, c29[1]*255, c29[2]*255]
-        self.c30 = [c30[0]*255, c30[1]*255, c30[2]*255]
-        self.c31 = [c31[0]*255, c31[1]*255, c31[2]*255]
-        self.c32 = [c32[0]*255, c32[1]*255, c32[2]*255]
-        self.c33 = [c33[0]*255, c33[1]*255, c33[2]*255]
-        self.c34 = [c34[0]*255, c34[1]*255, c34[2]*255]
-        self.c35 = [c35[0]*255, c35[1]*255, c35[2]*255]
-        self.c36 = [c36[0]*255, c36[1]*255, c36[2]*255]
+        self.cgg[0:3] = array.array("d", [cgg[0]*255, cgg[1]*255, cgg[2]*255])
+        values = array.array("d", [v*255 for c in ring for v in c])
+        if len(values) == len(self.ring):
+            self.ring[0:len(values)] = values
+        else:
+            self.ring = values
         # Polygon
         self.gamut_shape = gamut_shape
-        if self.gamut_shape == "None":
-            pass
-        if self.gamut_shape == "P1_S1":
-            self.P1_S1 = [
-                P1_S1[0]*panel_width, P1_S1[1]*panel_height,
-                P1_S1[2]*panel_width, P1_S1[3]*panel_height,
-                P1_S1[4]*panel_width, P1_S1[5]*panel_height,
-                P1_S1[6]*panel_width, P1_S1[7]*panel_height]
-            self.centroid_1 = self.Math_2D_Centroid_Square(
-                P1_S1[0]*panel_width, P1_S1[1]*panel_height,
-                P1_S1[2]*panel_width, P1_S1[3]*panel_height,
-                P1_S1[4]*panel_width, P1_S1[5]*panel_height,
-                P1_S1[6]*panel_width, P1_S1[7]*panel_height)
-        if self.gamut_shape == "P1_S3":
-            self.P1_S3 = [
-                P1_S3[0]*panel_width, P1_S3[1]*panel_height,
-                P1_S3[2]*panel_width, P1_S3[3]*panel_height,
-                P1_S3[4]*panel_width, P1_S3[5]*panel_height]
-            self.centroid_1 = self.Math_2D_Centroid_Triangle(
-                P1_S3[0]*panel_width, P1_S3[1]*panel_height,
-                P1_S3[2]*panel_width, P1_S3[3]*panel_height,
-                P1_S3[4]*panel_width, P1_S3[5]*panel_height)
-        if self.gamut_shape == "P1_S4":
-            self.P1_S4 = [
-                P1_S4[0]*panel_width, P1_S4[1]*panel_height,
-                P1_S4[2]*panel_width, P1_S4[3]*panel_height,
-                P1_S4[4]*panel_width, P1_S4[5]*panel_height,
-                P1_S4[6]*panel_width, P1_S4[7]*panel_height]
-            self.centroid_1 = self.Math_2D_Centroid_Square(
-                P1_S4[0]*panel_width, P1_S4[1]*panel_height,
-                P1_S4[2]*panel_width, P1_S4[3]*panel_height,
-                P1_S4[4]*panel_width, P1_S4[5]*panel_height,
-                P1_S4[6]*panel_width, P1_S4[7]*panel_height)
-        if self.gamut_shape == "P2_S1":
-            self.P2_S1 = [
-                # 1
-                P2_S1[0]*panel_width, P2_S1[1]*panel_height,
-                P2_S1[2]*panel_width, P2_S1[3]*panel_height,
-                P2_S1[4]*panel_width, P2_S1[5]*panel_height,
-                P2_S1[6]*panel_width, P2_S1[7]*panel_height,
-                # 2
-                P2_S1[8]*panel_width, P2_S1[9]*panel_height,
-                P2_S1[10]*panel_width, P2_S1[11]*panel_height,
-                P2_S1[12]*panel_width, P2_S1[13]*panel_height,
-                P2_S1[14]*panel_width, P2_S1[15]*panel_height]
-            self.centroid_1 = self.Math_2D_Centroid_Square(
-                P2_S1[0]*panel_width, P2_S1[1]*panel_height,
-                P2_S1[2]*panel_width, P2_S1[3]*panel_height,
-                P2_S1[4]*panel_width, P2_S1[5]*panel_height,
-                P2_S1[6]*panel_width, P2_S1[7]*panel_height)
-            self.centroid_2 = self.Math_2D_Centroid_Square(
-                P2_S1[8]*panel_width, P2_S1[9]*panel_height,
-                P2_S1[10]*panel_width, P2_S1[11]*panel_height,
-                P2_S1[12]*panel_width, P2_S1[13]*panel_height,
-                P2_S1[14]*panel_width, P2_S1[15]*panel_height)
-        if self.gamut_shape == "P3_S3":
-            self.P3_S3 = [
-                # Center
-                P3_S3[0]*panel_width, P3_S3[1]*panel_height,
-                # Hexagon
-                P3_S3[2]*panel_width, P3_S3[3]*panel_height,
-                P3_S3[4]*panel_width, P3_S3[5]*panel_height,
-                P3_S3[6]*panel_width, P3_S3[7]*panel_height,
-                P3_S3[8]*panel_width, P3_S3[9]*panel_height,
-                P3_S3[10]*panel_width, P3_S3[11]*panel_height,
-                P3_S3[12]*panel_width, P3_S3[13]*panel_height]
-            self.centroid_1 = (P3_S3[0]*panel_width, P3_S3[1]*panel_height)
+        sources = {"P1_S1" : P1_S1, "P1_S3" : P1_S3, "P1_S4" : P1_S4, "P2_S1" : P2_S1, "P3_S3" : P3_S3}
+        if self.gamut_shape in sources:
+            # Scale into the Shape view in place
+            points = getattr(self, self.gamut_shape)
+            source = sources[self.gamut_shape]
+            points[0::2] = array.array("d", [x*panel_width for x in source[0:len(points):2]])
+            points[1::2] = array.array("d", [y*panel_height for y in source[1:len(points):2]])
+            if self.gamut_shape in ("P1_S1", "P1_S4", "P2_S1"):
+                self.centroid_1 = self.Math_2D_Centroid_Square(*points[0:8])
+            if self.gamut_shape == "P1_S3":
+                self.centroid_1 = self.Math_2D_Centroid_Triangle(*points[0:6])
+            if self.gamut_shape == "P2_S1":
+                self.centroid_2 = self.Math_2D_Centroid_Square(*points[8:16])
+            if self.gamut_shape == "P3_S3":
+                self.centroid_1 = (points[0], points[1])
         # Panel Geometry
         self.panel_width = panel_width
         self.panel_height = panel_height
@@ -3723,11 +3523,10 @@ class Panel_GAM_Polygon(QWidget):
             self.value_x = 0
             self.value_y = 0
         # Move Cursor
-        self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-        self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+        self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+        self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
         # Change Color
-        self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-        self.cursor_rmb.load(self.array_rmb)
+        self.cursor_rmb.Color(self.hex)
 
     # Mouse Interaction
     def mousePressEvent(self, event):
@@ -3780,6 +3579,9 @@ class Panel_GAM_Polygon(QWidget):
         # Mouse Position
         self.event_x = event.x()
         self.event_y = event.y()
+        # Gamut Clamp
+        if self.gamut_shape != "None":
+            self.event_x, self.event_y = self.Mask_Clamp(self.event_x, self.event_y)
         # Angle
         self.angle = self.Angulus(event, self.event_x, self.event_y)
         # Radius
@@ -3796,11 +3598,10 @@ class Panel_GAM_Polygon(QWidget):
         # Correct Cursor
         if (event.buttons() == QtCore.Qt.LeftButton or event.buttons() == QtCore.Qt.MiddleButton):
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() * 0.5), self.value_y-(self.cursor_lmb.height() * 0.5))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() * 0.5), self.value_y-(self.cursor_rmb.height() * 0.5))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() * 0.5), self.value_y-(self.cursor_lmb.Height() * 0.5))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() * 0.5), self.value_y-(self.cursor_rmb.Height() * 0.5))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
         elif event.buttons() == QtCore.Qt.RightButton:
             self.cursorzoom(1)
         # Emit Values
@@ -3824,16 +3625,15 @@ class Panel_GAM_Polygon(QWidget):
     def cursorzoom(self, zoom):
         if zoom == 1:
             # Scale Cursor for Display
-            self.cursor_rmb.resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
+            self.cursor_rmb.Resize(self.scale_factor, self.scale_factor) # 60 = max tilt value
             # Move Cursor
-            self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() / 2), self.value_y-(self.cursor_lmb.height() / 2))
-            self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() / 2), self.value_y-(self.cursor_rmb.height() / 2))
+            self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() / 2), self.value_y-(self.cursor_lmb.Height() / 2))
+            self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() / 2), self.value_y-(self.cursor_rmb.Height() / 2))
             # Change Color
-            self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-            self.cursor_rmb.load(self.array_rmb)
+            self.cursor_rmb.Color(self.hex)
             self.SIGNAL_ZOOM.emit(1)
         else:
-            self.cursor_rmb.resize(0, 0)
+            self.cursor_rmb.Resize(0, 0)
             self.SIGNAL_ZOOM.emit(0)
     def mouseHue(self, event):
         # Delta
@@ -4111,17 +3911,24 @@ class Panel_GAM_Polygon(QWidget):
         self.value_x = (self.panel_width*0.5) - ((self.panel_width*self.radius) * math.cos(math.radians(self.angle)))
         self.value_y = (self.panel_height*0.5) - ((self.panel_height*self.radius) * math.sin(math.radians(self.angle)))
         # Move Cursor
-        self.cursor_lmb.move(self.value_x-(self.cursor_lmb.width() * 0.5), self.value_y-(self.cursor_lmb.height() * 0.5))
-        self.cursor_rmb.move(self.value_x-(self.cursor_rmb.width() * 0.5), self.value_y-(self.cursor_rmb.height() * 0.5))
+        self.cursor_lmb.Move(self.value_x-(self.cursor_lmb.Width() * 0.5), self.value_y-(self.cursor_lmb.Height() * 0.5))
+        self.cursor_rmb.Move(self.value_x-(self.cursor_rmb.Width() * 0.5), self.value_y-(self.cursor_rmb.Height() * 0.5))
         # Change Color
-        self.array_rmb = self.style.SVG_Cursor_RMB(self.hex)
-        self.cursor_rmb.load(self.array_rmb)
+        self.cursor_rmb.Color(self.hex)
         # Emit Values
         list = ["12", self.angle/360, self.radius/(self.panel_width*0.5), 0]
         self.SIGNAL_GAM_P_VALUE.emit(list)
 
     # Paint
+    @Profiled
     def paintEvent(self, event):
+        self.Panel_Paint(event)
+        # Cursors over the Panel
+        painter = QPainter(self)
+        self.cursor_lmb.Paint(painter)
+        self.cursor_rmb.Paint(painter)
+        painter.end()
+    def Panel_Paint(self, event):
         # Start Qpainter
         painter = QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
@@ -4163,82 +3970,11 @@ class Panel_GAM_Polygon(QWidget):
         painter.setPen(QtCore.Qt.NoPen)
         if self.wheel == "CMY":
             hue = QConicalGradient(QPoint(self.panel_width/2, self.panel_height/2), 180)
-            hue.setColorAt(0.000, QColor(self.c36[0], self.c36[1], self.c36[2])) # RED
-            hue.setColorAt(0.027, QColor(self.c35[0], self.c35[1], self.c35[2]))
-            hue.setColorAt(0.055, QColor(self.c34[0], self.c34[1], self.c34[2]))
-            hue.setColorAt(0.083, QColor(self.c33[0], self.c33[1], self.c33[2]))
-            hue.setColorAt(0.111, QColor(self.c32[0], self.c32[1], self.c32[2]))
-            hue.setColorAt(0.138, QColor(self.c31[0], self.c31[1], self.c31[2]))
-            hue.setColorAt(0.166, QColor(self.c30[0], self.c30[1], self.c30[2])) # Magenta
-            hue.setColorAt(0.194, QColor(self.c29[0], self.c29[1], self.c29[2]))
-            hue.setColorAt(0.222, QColor(self.c28[0], self.c28[1], self.c28[2]))
-            hue.setColorAt(0.250, QColor(self.c27[0], self.c27[1], self.c27[2]))
-            hue.setColorAt(0.277, QColor(self.c26[0], self.c26[1], self.c26[2]))
-            hue.setColorAt(0.305, QColor(self.c25[0], self.c25[1], self.c25[2]))
-            hue.setColorAt(0.333, QColor(self.c24[0], self.c24[1], self.c24[2])) # Blue
-            hue.setColorAt(0.361, QColor(self.c23[0], self.c23[1], self.c23[2]))
-            hue.setColorAt(0.388, QColor(self.c22[0], self.c22[1], self.c22[2]))
-            hue.setColorAt(0.416, QColor(self.c21[0], self.c21[1], self.c21[2]))
-            hue.setColorAt(0.444, QColor(self.c20[0], self.c20[1], self.c20[2]))
-            hue.setColorAt(0.472, QColor(self.c19[0], self.c19[1], self.c19[2]))
-            hue.setColorAt(0.500, QColor(self.c18[0], self.c18[1], self.c18[2])) # Cyan
-            hue.setColorAt(0.527, QColor(self.c17[0], self.c17[1], self.c17[2]))
-            hue.setColorAt(0.555, QColor(self.c16[0], self.c16[1], self.c16[2]))
-            hue.setColorAt(0.583, QColor(self.c15[0], self.c15[1], self.c15[2]))
-            hue.setColorAt(0.611, QColor(self.c14[0], self.c14[1], self.c14[2]))
-            hue.setColorAt(0.638, QColor(self.c13[0], self.c13[1], self.c13[2]))
-            hue.setColorAt(0.666, QColor(self.c12[0], self.c12[1], self.c12[2])) # Green
-            hue.setColorAt(0.694, QColor(self.c11[0], self.c11[1], self.c11[2]))
-            hue.setColorAt(0.722, QColor(self.c10[0], self.c10[1], self.c10[2]))
-            hue.setColorAt(0.750, QColor(self.c09[0], self.c09[1], self.c09[2]))
-            hue.setColorAt(0.777, QColor(self.c08[0], self.c08[1], self.c08[2]))
-            hue.setColorAt(0.805, QColor(self.c07[0], self.c07[1], self.c07[2]))
-            hue.setColorAt(0.833, QColor(self.c06[0], self.c06[1], self.c06[2])) # Yellow
-            hue.setColorAt(0.861, QColor(self.c05[0], self.c05[1], self.c05[2]))
-            hue.setColorAt(0.888, QColor(self.c04[0], self.c04[1], self.c04[2]))
-            hue.setColorAt(0.916, QColor(self.c03[0], self.c03[1], self.c03[2]))
-            hue.setColorAt(0.944, QColor(self.c02[0], self.c02[1], self.c02[2]))
-            hue.setColorAt(0.972, QColor(self.c01[0], self.c01[1], self.c01[2]))
-            hue.setColorAt(1.000, QColor(self.c00[0], self.c00[1], self.c00[2])) # Red
         if self.wheel == "RYB":
             hue = QConicalGradient(QPoint(self.panel_width/2, self.panel_height/2), 210)
-            hue.setColorAt(0.000, QColor(self.c36[0], self.c36[1], self.c36[2])) # RED
-            hue.setColorAt(0.027, QColor(self.c35[0], self.c35[1], self.c35[2]))
-            hue.setColorAt(0.055, QColor(self.c34[0], self.c34[1], self.c34[2]))
-            hue.setColorAt(0.083, QColor(self.c33[0], self.c33[1], self.c33[2]))
-            hue.setColorAt(0.111, QColor(self.c32[0], self.c32[1], self.c32[2]))
-            hue.setColorAt(0.138, QColor(self.c31[0], self.c31[1], self.c31[2]))
-            hue.setColorAt(0.166, QColor(self.c30[0], self.c30[1], self.c30[2])) # Magenta
-            hue.setColorAt(0.194, QColor(self.c29[0], self.c29[1], self.c29[2]))
-            hue.setColorAt(0.222, QColor(self.c28[0], self.c28[1], self.c28[2]))
-            hue.setColorAt(0.250, QColor(self.c27[0], self.c27[1], self.c27[2]))
-            hue.setColorAt(0.277, QColor(self.c26[0], self.c26[1], self.c26[2]))
-            hue.setColorAt(0.305, QColor(self.c25[0], self.c25[1], self.c25[2]))
-            hue.setColorAt(0.333, QColor(self.c24[0], self.c24[1], self.c24[2])) # Blue
-            hue.setColorAt(0.361, QColor(self.c23[0], self.c23[1], self.c23[2]))
-            hue.setColorAt(0.388, QColor(self.c22[0], self.c22[1], self.c22[2]))
-            hue.setColorAt(0.416, QColor(self.c21[0], self.c21[1], self.c21[2]))
-            hue.setColorAt(0.444, QColor(self.c20[0], self.c20[1], self.c20[2]))
-            hue.setColorAt(0.472, QColor(self.c19[0], self.c19[1], self.c19[2]))
-            hue.setColorAt(0.500, QColor(self.c18[0], self.c18[1], self.c18[2])) # Cyan
-            hue.setColorAt(0.527, QColor(self.c17[0], self.c17[1], self.c17[2]))
-            hue.setColorAt(0.555, QColor(self.c16[0], self.c16[1], self.c16[2]))
-            hue.setColorAt(0.583, QColor(self.c15[0], self.c15[1], self.c15[2]))
-            hue.setColorAt(0.611, QColor(self.c14[0], self.c14[1], self.c14[2]))
-            hue.setColorAt(0.638, QColor(self.c13[0], self.c13[1], self.c13[2]))
-            hue.setColorAt(0.666, QColor(self.c12[0], self.c12[1], self.c12[2])) # Green
-            hue.setColorAt(0.694, QColor(self.c11[0], self.c11[1], self.c11[2]))
-            hue.setColorAt(0.722, QColor(self.c10[0], self.c10[1], self.c10[2]))
-            hue.setColorAt(0.750, QColor(self.c09[0], self.c09[1], self.c09[2]))
-            hue.setColorAt(0.777, QColor(self.c08[0], self.c08[1], self.c08[2]))
-            hue.setColorAt(0.805, QColor(self.c07[0], self.c07[1], self.c07[2]))
-            hue.setColorAt(0.833, QColor(self.c06[0], self.c06[1], self.c06[2])) # Yellow
-            hue.setColorAt(0.861, QColor(self.c05[0], self.c05[1], self.c05[2]))
-            hue.setColorAt(0.888, QColor(self.c04[0], self.c04[1], self.c04[2]))
-            hue.setColorAt(0.916, QColor(self.c03[0], self.c03[1], self.c03[2]))
-            hue.setColorAt(0.944, QColor(self.c02[0], self.c02[1], self.c02[2]))
-            hue.setColorAt(0.972, QColor(self.c01[0], self.c01[1], self.c01[2]))
-            hue.setColorAt(1.000, QColor(self.c00[0], self.c00[1], self.c00[2])) # Red
+        count = len(self.ring) // 3 - 1
+        for i in range(0, count + 1):
+            hue.setColorAt(1 - (i / count), QColor(self.ring[i*3], self.ring[i*3+1], self.ring[i*3+2]))
         painter.setBrush(QBrush(hue))
         # HUE Gradient Paint Colors
         if self.gamut_shape == "None":
@@ -4246,6 +3982,105 @@ class Panel_GAM_Polygon(QWidget):
             circle.addEllipse(1, 1, self.panel_width-1, self.panel_height-1)
             # painter.setClipPath(circle)
             painter.drawPath(circle)
+        paths = self.Mask_Paths()
+        for path in paths:
+            painter.drawPath(path)
+
+        # Inner Gray And Mask Primeries Colors
+        painter.setPen(QtCore.Qt.NoPen)
+        gray = QRadialGradient(QPointF(self.panel_width/2, self.panel_height/2), self.panel_width/2)
+        gray.setColorAt(0.000, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 255))
+
+        # gray.setColorAt(0.100, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 253))
+        # gray.setColorAt(0.200, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 247))
+        # gray.setColorAt(0.300, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 236))
+        # gray.setColorAt(0.400, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 221))
+        # gray.setColorAt(0.500, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 199))
+        # gray.setColorAt(0.600, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 172))
+        # gray.setColorAt(0.700, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 138))
+        # gray.setColorAt(0.800, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 98))
+        # gray.setColorAt(0.900, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 52))
+
+        gray.setColorAt(1.000, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 0))
+        painter.setBrush(QBrush(gray))
+
+        # Render new
+
+
+
+        # Gamut Shapes
+        if self.gamut_shape == "None":
+            mask = QPolygon([
+                QPoint(0, 0),
+                QPoint(self.panel_width, 0),
+                QPoint(self.panel_width, self.panel_height),
+                QPoint(0, self.panel_height)
+                ])
+            painter.drawPolygon(mask)
+        # Grey Polygon
+        for path in paths:
+            painter.drawPath(path)
+        if self.gamut_shape == "P1_S1":
+            # Display Subjective Primaries
+            painter.setPen(QtCore.Qt.NoPen)
+            painter.setBrush(QBrush(QColor(self.gray_natural)))
+            painter.drawEllipse(self.centroid_1[0]-self.circle, self.centroid_1[1]-self.circle, self.circle*2,self.circle*2)
+            painter.setBrush(QBrush(QColor(self.gray_contrast)))
+            painter.drawEllipse(self.P1_S1[0]-self.circle, self.P1_S1[1]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P1_S1[2]-self.circle, self.P1_S1[3]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P1_S1[4]-self.circle, self.P1_S1[5]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P1_S1[6]-self.circle, self.P1_S1[7]-self.circle, self.circle*2,self.circle*2)
+        if self.gamut_shape == "P1_S3":
+            # Display Subjective Primaries
+            painter.setPen(QtCore.Qt.NoPen)
+            painter.setBrush(QBrush(QColor(self.gray_natural)))
+            painter.drawEllipse(self.centroid_1[0]-self.circle, self.centroid_1[1]-self.circle, self.circle*2,self.circle*2)
+            painter.setBrush(QBrush(QColor(self.gray_contrast)))
+            painter.drawEllipse(self.P1_S3[0]-self.circle, self.P1_S3[1]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P1_S3[2]-self.circle, self.P1_S3[3]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P1_S3[4]-self.circle, self.P1_S3[5]-self.circle, self.circle*2,self.circle*2)
+        if self.gamut_shape == "P1_S4":
+            # Display Subjective Primaries
+            painter.setPen(QtCore.Qt.NoPen)
+            painter.setBrush(QBrush(QColor(self.gray_natural)))
+            painter.drawEllipse(self.centroid_1[0]-self.circle, self.centroid_1[1]-self.circle, self.circle*2,self.circle*2)
+            painter.setBrush(QBrush(QColor(self.gray_contrast)))
+            painter.drawEllipse(self.P1_S4[0]-self.circle, self.P1_S4[1]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P1_S4[2]-self.circle, self.P1_S4[3]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P1_S4[4]-self.circle, self.P1_S4[5]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P1_S4[6]-self.circle, self.P1_S4[7]-self.circle, self.circle*2,self.circle*2)
+        if self.gamut_shape == "P2_S1":
+            # Display Subjective Primaries
+            painter.setPen(QtCore.Qt.NoPen)
+            painter.setBrush(QBrush(QColor(self.gray_natural)))
+            painter.drawEllipse(self.centroid_1[0]-self.circle, self.centroid_1[1]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.centroid_2[0]-self.circle, self.centroid_2[1]-self.circle, self.circle*2,self.circle*2)
+            painter.setBrush(QBrush(QColor(self.gray_contrast)))
+            painter.drawEllipse(self.P2_S1[0]-self.circle, self.P2_S1[1]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P2_S1[2]-self.circle, self.P2_S1[3]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P2_S1[4]-self.circle, self.P2_S1[5]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P2_S1[6]-self.circle, self.P2_S1[7]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P2_S1[8]-self.circle, self.P2_S1[9]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P2_S1[10]-self.circle, self.P2_S1[11]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P2_S1[12]-self.circle, self.P2_S1[13]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P2_S1[14]-self.circle, self.P2_S1[15]-self.circle, self.circle*2,self.circle*2)
+        if self.gamut_shape == "P3_S3":
+            # Display Subjective Primaries Polygon 1
+            painter.setPen(QtCore.Qt.NoPen)
+            painter.setBrush(QBrush(QColor(self.gray_natural)))
+            painter.drawEllipse(self.P3_S3[0]-self.circle, self.P3_S3[1]-self.circle, self.circle*2,self.circle*2)
+            painter.setBrush(QBrush(QColor(self.gray_contrast)))
+            painter.drawEllipse(self.P3_S3[2]-self.circle, self.P3_S3[3]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P3_S3[4]-self.circle, self.P3_S3[5]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P3_S3[6]-self.circle, self.P3_S3[7]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P3_S3[8]-self.circle, self.P3_S3[9]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P3_S3[10]-self.circle, self.P3_S3[11]-self.circle, self.circle*2,self.circle*2)
+            painter.drawEllipse(self.P3_S3[12]-self.circle, self.P3_S3[13]-self.circle, self.circle*2,self.circle*2)
+
+    # Gamut Shape
+    def Gamut_Paths(self):
+        # Painter Paths of the Gamut Shape
+        paths = []
         if self.gamut_shape == "P1_S1":
             # Points from User
             P1 = [self.P1_S1[0], self.P1_S1[1]]
@@ -4404,14 +4239,17 @@ class Panel_GAM_Polygon(QWidget):
                 QPoint( self.Math_1D_Lerp(AO4[0],P41[0],a), self.Math_1D_Lerp(AO4[1],P41[1],a) ),
                 QPoint( self.Math_1D_Lerp(P41[0],AO1[0],b), self.Math_1D_Lerp(P41[1],AO1[1],b) ),
                 QPoint(AO1[0],AO1[1]))
-            painter.drawPath(path)
+            paths = [path]
         if self.gamut_shape == "P1_S3":
             poly = QPolygon([
                 QPoint(self.P1_S3[0],self.P1_S3[1]),
                 QPoint(self.P1_S3[2],self.P1_S3[3]),
                 QPoint(self.P1_S3[4],self.P1_S3[5])
                 ])
-            painter.drawPolygon(poly)
+            path = QPainterPath()
+            path.addPolygon(QPolygonF(poly))
+            path.closeSubpath()
+            paths = [path]
         if self.gamut_shape == "P1_S4":
             poly = QPolygon([
                 QPoint(self.P1_S4[0],self.P1_S4[1]),
@@ -4419,7 +4257,10 @@ class Panel_GAM_Polygon(QWidget):
                 QPoint(self.P1_S4[4],self.P1_S4[5]),
                 QPoint(self.P1_S4[6],self.P1_S4[7])
                 ])
-            painter.drawPolygon(poly)
+            path = QPainterPath()
+            path.addPolygon(QPolygonF(poly))
+            path.closeSubpath()
+            paths = [path]
         if self.gamut_shape == "P2_S1":
             # Polygon 1
             P1 = [self.P2_S1[0], self.P2_S1[1]]
@@ -4735,11 +4576,10 @@ class Panel_GAM_Polygon(QWidget):
                 QPoint( self.Math_1D_Lerp(AO8[0],P85[0],a), self.Math_1D_Lerp(AO8[1],P85[1],a) ),
                 QPoint( self.Math_1D_Lerp(P85[0],AO5[0],b), self.Math_1D_Lerp(P85[1],AO5[1],b) ),
                 QPoint(AO5[0],AO5[1]))
-            # Draw Paths
-            painter.drawPath(path_p1)
-            painter.drawPath(path_p2)
+            paths = [path_p1, path_p2]
         if self.gamut_shape == "P3_S3":
-            rect = QRect(0,0,self.panel_width,self.panel_height)
+            rect = QRectF(0,0,self.panel_width,self.panel_height)
+            center = QPointF(self.panel_width*0.5, self.panel_height*0.5)
             ang_a1 = 16 * self.Math_2D_Points_Lines_Angle(
                 self.P3_S3[2], self.P3_S3[3],
                 self.panel_width*0.5, self.panel_height*0.5,
@@ -4771,110 +4611,225 @@ class Panel_GAM_Polygon(QWidget):
                 self.P3_S3[12], self.P3_S3[13]
                 )
             # Pies
-            painter.drawPie(rect, ang_a1, ang_a2)
-            painter.drawPie(rect, ang_b1, ang_b2)
-            painter.drawPie(rect, ang_c1, ang_c2)
-
-        # Inner Gray And Mask Primeries Colors
+            for start, span in ((ang_a1, ang_a2), (ang_b1, ang_b2), (ang_c1, ang_c2)):
+                path = QPainterPath()
+                path.moveTo(center)
+                path.arcTo(rect, start / 16, span / 16)
+                path.closeSubpath()
+                paths.append(path)
+        if self.gamut_shape == "KGM":
+            scale = QTransform.fromScale(self.panel_width / self.kgm_box, self.panel_height / self.kgm_box)
+            paths = [scale.map(path) for path in self.kgm_paths]
+        return paths
+
+    # Gamut Mask
+    def Update_KGM(self, file):
+        # Krita Gamut Mask read once and kept in the SVG viewBox space
+        self.kgm_file = file
+        self.kgm_box, self.kgm_paths = self.KGM_Paths(file)
+    def KGM_Paths(self, file):
+        box = 144
+        paths = []
+        try:
+            with zipfile.ZipFile(file) as archive:
+                root = ElementTree.fromstring(archive.read("gamutmask.svg"))
+        except:
+            return box, paths
+        try:
+            box = float(root.get("viewBox", "0 0 144 144").replace(",", " ").split()[2])
+        except:
+            pass
+        for element in root.iter():
+            tag = element.tag.split("}")[-1]
+            if tag == "path":
+                path = self.SVG_Path(element.get("d", ""))
+            elif (tag == "circle" or tag == "ellipse"):
+                cx = float(element.get("cx", 0))
+                cy = float(element.get("cy", 0))
+                rx = float(element.get("rx", element.get("r", 0)))
+                ry = float(element.get("ry", element.get("r", 0)))
+                path = QPainterPath()
+                path.addEllipse(QPointF(cx, cy), rx, ry)
+            else:
+                continue
+            paths.append(self.SVG_Transform(element.get("transform", "")).map(path))
+        return box, paths
+    def SVG_Path(self, d):
+        # Absolute and Relative MoveTo, LineTo, Curves and Close
+        path = QPainterPath()
+        tokens = re.findall(r"[MmLlHhVvCcZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?", d)
+        sizes = {"M":2, "L":2, "H":1, "V":1, "C":6, "Z":0}
+        x = y = 0
+        command = "M"
+        i = 0
+        while i < len(tokens):
+            if tokens[i].isalpha():
+                command = tokens[i]
+                i += 1
+                if command.upper() == "Z":
+                    path.closeSubpath()
+                    x = path.currentPosition().x()
+                    y = path.currentPosition().y()
+                    continue
+            size = sizes[command.upper()]
+            v = [float(t) for t in tokens[i:i+size]]
+            i += size
+            if len(v) < size:
+                break
+            relative = command.islower()
+            ox = x if relative else 0
+            oy = y if relative else 0
+            key = command.upper()
+            if key == "M":
+                x, y = ox+v[0], oy+v[1]
+                path.moveTo(x, y)
+                command = "l" if relative else "L"
+            elif key == "L":
+                x, y = ox+v[0], oy+v[1]
+                path.lineTo(x, y)
+            elif key == "H":
+                x = ox+v[0]
+                path.lineTo(x, y)
+            elif key == "V":
+                y = oy+v[0]
+                path.lineTo(x, y)
+            elif key == "C":
+                path.cubicTo(ox+v[0], oy+v[1], ox+v[2], oy+v[3], ox+v[4], oy+v[5])
+                x, y = ox+v[4], oy+v[5]
+        return path
+    def SVG_Transform(self, transform):
+        # Compose the SVG transform list from left to right
+        matrix = QTransform()
+        for name, values in re.findall(r"(\w+)\s*\(([^)]*)\)", transform):
+            v = [float(t) for t in values.replace(",", " ").split()]
+            if (name == "matrix" and len(v) == 6):
+                step = QTransform(v[0], v[1], v[2], v[3], v[4], v[5])
+            elif (name == "translate" and len(v) >= 1):
+                step = QTransform.fromTranslate(v[0], v[1] if len(v) > 1 else 0)
+            elif (name == "scale" and len(v) >= 1):
+                step = QTransform.fromScale(v[0], v[1] if len(v) > 1 else v[0])
+            elif (name == "rotate" and len(v) >= 1):
+                step = QTransform().rotate(v[0])
+            else:
+                continue
+            matrix = step * matrix
+        return matrix
+    def Mask_Key(self):
+        if self.gamut_shape == "KGM":
+            shape = self.kgm_file
+        elif self.gamut_shape == "None":
+            shape = None
+        else:
+            shape = tuple(getattr(self, self.gamut_shape))
+        return (self.gamut_shape, shape, self.panel_width, self.panel_height)
+    def Mask_Paths(self):
+        # Paths are rebuilt only when the shape, its points or the panel size change
+        key = self.Mask_Key()
+        if key != self.mask_key:
+            self.mask_key = key
+            self.mask_paths = self.Gamut_Paths()
+            self.mask_bits = None
+            self.mask_field = None
+        return self.mask_paths
+    def Mask_Render(self):
+        # Rasterize the Gamut into a 8bit bitmap at Panel resolution
+        paths = self.Mask_Paths()
+        self.mask_width = max(1, int(self.panel_width))
+        self.mask_height = max(1, int(self.panel_height))
+        image = QImage(self.mask_width, self.mask_height, QImage.Format_Grayscale8)
+        image.fill(0)
+        painter = QPainter(image)
+        outline = QPainterPath()
+        outline.addEllipse(0, 0, self.panel_width, self.panel_height)
+        painter.setClipPath(outline)
         painter.setPen(QtCore.Qt.NoPen)
-        gray = QRadialGradient(QPointF(self.panel_width/2, self.panel_height/2), self.panel_width/2)
-        gray.setColorAt(0.000, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 255))
-
-        # gray.setColorAt(0.100, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 253))
-        # gray.setColorAt(0.200, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 247))
-        # gray.setColorAt(0.300, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 236))
-        # gray.setColorAt(0.400, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 221))
-        # gray.setColorAt(0.500, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 199))
-        # gray.setColorAt(0.600, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 172))
-        # gray.setColorAt(0.700, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 138))
-        # gray.setColorAt(0.800, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 98))
-        # gray.setColorAt(0.900, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 52))
-
-        gray.setColorAt(1.000, QColor(self.cgg[0], self.cgg[1], self.cgg[2], 0))
-        painter.setBrush(QBrush(gray))
-
-        # Render new
-
-
-
-        # Gamut Shapes
-        if self.gamut_shape == "None":
-            mask = QPolygon([
-                QPoint(0, 0),
-                QPoint(self.panel_width, 0),
-                QPoint(self.panel_width, self.panel_height),
-                QPoint(0, self.panel_height)
-                ])
-            painter.drawPolygon(mask)
-        if self.gamut_shape == "P1_S1":
-            # Grey Polygon
+        painter.setBrush(QBrush(QColor(255, 255, 255)))
+        for path in paths:
             painter.drawPath(path)
-            # Display Subjective Primaries
-            painter.setPen(QtCore.Qt.NoPen)
-            painter.setBrush(QBrush(QColor(self.gray_natural)))
-            painter.drawEllipse(self.centroid_1[0]-self.circle, self.centroid_1[1]-self.circle, self.circle*2,self.circle*2)
-            painter.setBrush(QBrush(QColor(self.gray_contrast)))
-            painter.drawEllipse(self.P1_S1[0]-self.circle, self.P1_S1[1]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P1_S1[2]-self.circle, self.P1_S1[3]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P1_S1[4]-self.circle, self.P1_S1[5]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P1_S1[6]-self.circle, self.P1_S1[7]-self.circle, self.circle*2,self.circle*2)
-        if self.gamut_shape == "P1_S3":
-            # Grey Polygon
-            painter.drawPolygon(poly)
-            # Display Subjective Primaries
-            painter.setPen(QtCore.Qt.NoPen)
-            painter.setBrush(QBrush(QColor(self.gray_natural)))
-            painter.drawEllipse(self.centroid_1[0]-self.circle, self.centroid_1[1]-self.circle, self.circle*2,self.circle*2)
-            painter.setBrush(QBrush(QColor(self.gray_contrast)))
-            painter.drawEllipse(self.P1_S3[0]-self.circle, self.P1_S3[1]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P1_S3[2]-self.circle, self.P1_S3[3]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P1_S3[4]-self.circle, self.P1_S3[5]-self.circle, self.circle*2,self.circle*2)
-        if self.gamut_shape == "P1_S4":
-            # Grey Polygon
-            painter.drawPolygon(poly)
-            # Display Subjective Primaries
-            painter.setPen(QtCore.Qt.NoPen)
-            painter.setBrush(QBrush(QColor(self.gray_natural)))
-            painter.drawEllipse(self.centroid_1[0]-self.circle, self.centroid_1[1]-self.circle, self.circle*2,self.circle*2)
-            painter.setBrush(QBrush(QColor(self.gray_contrast)))
-            painter.drawEllipse(self.P1_S4[0]-self.circle, self.P1_S4[1]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P1_S4[2]-self.circle, self.P1_S4[3]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P1_S4[4]-self.circle, self.P1_S4[5]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P1_S4[6]-self.circle, self.P1_S4[7]-self.circle, self.circle*2,self.circle*2)
-        if self.gamut_shape == "P2_S1":
-            # Grey Polygon
-            painter.drawPath(path_p1)
-            painter.drawPath(path_p2)
-            # Display Subjective Primaries
-            painter.setPen(QtCore.Qt.NoPen)
-            painter.setBrush(QBrush(QColor(self.gray_natural)))
-            painter.drawEllipse(self.centroid_1[0]-self.circle, self.centroid_1[1]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.centroid_2[0]-self.circle, self.centroid_2[1]-self.circle, self.circle*2,self.circle*2)
-            painter.setBrush(QBrush(QColor(self.gray_contrast)))
-            painter.drawEllipse(self.P2_S1[0]-self.circle, self.P2_S1[1]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P2_S1[2]-self.circle, self.P2_S1[3]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P2_S1[4]-self.circle, self.P2_S1[5]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P2_S1[6]-self.circle, self.P2_S1[7]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P2_S1[8]-self.circle, self.P2_S1[9]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P2_S1[10]-self.circle, self.P2_S1[11]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P2_S1[12]-self.circle, self.P2_S1[13]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P2_S1[14]-self.circle, self.P2_S1[15]-self.circle, self.circle*2,self.circle*2)
-        if self.gamut_shape == "P3_S3":
-            # Grey Polygon
-            painter.drawPie(rect, ang_a1, ang_a2)
-            painter.drawPie(rect, ang_b1, ang_b2)
-            painter.drawPie(rect, ang_c1, ang_c2)
-            # Display Subjective Primaries Polygon 1
-            painter.setPen(QtCore.Qt.NoPen)
-            painter.setBrush(QBrush(QColor(self.gray_natural)))
-            painter.drawEllipse(self.P3_S3[0]-self.circle, self.P3_S3[1]-self.circle, self.circle*2,self.circle*2)
-            painter.setBrush(QBrush(QColor(self.gray_contrast)))
-            painter.drawEllipse(self.P3_S3[2]-self.circle, self.P3_S3[3]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P3_S3[4]-self.circle, self.P3_S3[5]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P3_S3[6]-self.circle, self.P3_S3[7]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P3_S3[8]-self.circle, self.P3_S3[9]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P3_S3[10]-self.circle, self.P3_S3[11]-self.circle, self.circle*2,self.circle*2)
-            painter.drawEllipse(self.P3_S3[12]-self.circle, self.P3_S3[13]-self.circle, self.circle*2,self.circle*2)
+        painter.end()
+        bits = image.constBits()
+        bits.setsize(image.byteCount())
+        self.mask_bits = bytes(bits)
+        self.mask_stride = image.bytesPerLine()
+    def Mask_Inside(self, x, y):
+        # Point in Gamut
+        self.Mask_Paths()
+        if self.mask_bits is None:
+            self.Mask_Render()
+        x = int(x)
+        y = int(y)
+        if (x < 0 or y < 0 or x >= self.mask_width or y >= self.mask_height):
+            return False
+        return self.mask_bits[y * self.mask_stride + x] > 127
+    def Mask_Field(self):
+        # Nearest inside cell for every cell of a coarse grid (two pass propagation)
+        step = max(1, math.ceil(max(self.mask_width, self.mask_height) / self.mask_grid))
+        cols = math.ceil(self.mask_width / step)
+        rows = math.ceil(self.mask_height / step)
+        half = step // 2
+        bits = self.mask_bits
+        stride = self.mask_stride
+        count = cols * rows
+        near = [-1] * count
+        dist = [math.inf] * count
+        for r in range(rows):
+            y = min(r * step + half, self.mask_height - 1)
+            for c in range(cols):
+                x = min(c * step + half, self.mask_width - 1)
+                if bits[y * stride + x] > 127:
+                    near[r * cols + c] = r * cols + c
+                    dist[r * cols + c] = 0
+        forward = ((-1, 0), (-1, -1), (0, -1), (1, -1))
+        backward = ((1, 0), (1, 1), (0, 1), (-1, 1))
+        for offsets, row_range, col_range in (
+            (forward, range(rows), range(cols)),
+            (backward, range(rows - 1, -1, -1), range(cols - 1, -1, -1))):
+            for r in row_range:
+                for c in col_range:
+                    i = r * cols + c
+                    for dc, dr in offsets:
+                        nc = c + dc
+                        nr = r + dr
+                        if (nc < 0 or nr < 0 or nc >= cols or nr >= rows):
+                            continue
+                        j = near[nr * cols + nc]
+                        if j < 0:
+                            continue
+                        d = (c - j % cols) ** 2 + (r - j // cols) ** 2
+                        if d < dist[i]:
+                            dist[i] = d
+                            near[i] = j
+        self.mask_field = (step, cols, rows, near)
+    def Mask_Clamp(self, x, y):
+        # Closest in Gamut point
+        if self.Mask_Inside(x, y):
+            return x, y
+        if self.mask_field is None:
+            self.Mask_Field()
+        step, cols, rows, near = self.mask_field
+        c = min(max(int(x // step), 0), cols - 1)
+        r = min(max(int(y // step), 0), rows - 1)
+        j = near[r * cols + c]
+        if j < 0:
+            return x, y
+        return (j % cols) * step + step // 2, (j // cols) * step + step // 2
+    def Mask_Samples(self, number):
+        # Hue and radius of about number grid points inside the Gamut (the whole wheel without a shape)
+        half = self.panel_width * 0.5
+        if half <= 0:
+            return []
+        step = max(1, half * math.sqrt(math.pi / max(1, number)))
+        samples = []
+        y = step * 0.5
+        while y < self.panel_height:
+            x = step * 0.5
+            while x < self.panel_width:
+                radius = self.Math_2D_Points_Distance(x, y, half, self.panel_height*0.5)
+                if (radius < half and (self.gamut_shape == "None" or self.Mask_Inside(x, y))):
+                    samples.append([self.Angulus(None, x, y) / 360, radius / half])
+                x += step
+            y += step
+        return samples
 
     # Trignometry
     def Math_1D_Loop(self, var):
@@ -4940,15 +4895,10 @@ class Panel_DOT(QWidget):
         self.panel_height = 0
         self.cursor_size = 20
         # SVG Cursor
-        self.style = Style()
-        self.cursor_lmb = QtSvg.QSvgWidget(self)
-        self.array_lmb = self.style.SVG_Cursor_LMB()
-        self.cursor_lmb.load(self.array_lmb)
+        self.cursor_lmb = Cursor_SVG(self, "LMB")
         self.cursor_half = self.cursor_size / 2
-        self.cursor_lmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_lmb.resize(0, 0)
-        self.unseen = self.style.Transparent()
-        self.cursor_lmb.setStyleSheet(self.unseen)
+        self.cursor_lmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_lmb.Resize(0, 0)
         # Dots (10 x 10)
         self.size = 20
         self.margin = 5
@@ -4974,14 +4924,14 @@ class Panel_DOT(QWidget):
         self.panel_width = width
         self.panel_height = height
         # Move Cursor
-        self.cursor_lmb.move(self.value_x-(self.cursor_size / 2), self.value_y-(self.cursor_size / 2))
+        self.cursor_lmb.Move(self.value_x-(self.cursor_size / 2), self.value_y-(self.cursor_size / 2))
     def Update_Panel(self, colors, panel_width, panel_height):
         self.colors = colors
         self.panel_width = panel_width
         self.panel_height = panel_height
         self.update()
     def Reset(self):
-        self.cursor_lmb.resize(0, 0)
+        self.cursor_lmb.Resize(0, 0)
 
     # Mouse Interaction
     def mousePressEvent(self, event):
@@ -5003,14 +4953,21 @@ class Panel_DOT(QWidget):
         self.value_x = event.x()
         self.value_y = event.y()
         # Mouse Position
-        self.cursor_lmb.move(self.value_x-(self.cursor_size / 2), self.value_y-(self.cursor_size / 2))
-        self.cursor_lmb.resize(self.scale, self.scale)
+        self.cursor_lmb.Move(self.value_x-(self.cursor_size / 2), self.value_y-(self.cursor_size / 2))
+        self.cursor_lmb.Resize(self.scale, self.scale)
         # Emit values
         self.SIGNAL_DOT_COLOR.emit([self.value_x, self.value_y])
         self.SIGNAL_DOT_CURSOR.emit([self.value_x - (self.panel_width*0.5), self.value_y - (self.panel_height*0.5)])
 
     # Paint
+    @Profiled
     def paintEvent(self, event):
+        self.Panel_Paint(event)
+        # Cursors over the Panel
+        painter = QPainter(self)
+        self.cursor_lmb.Paint(painter)
+        painter.end()
+    def Panel_Paint(self, event):
         # Start Qpainter
         painter = QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
@@ -5058,15 +5015,10 @@ class Panel_OBJ(QWidget):
         self.panel_height = 0
         self.cursor_size = 20
         # SVG Cursor
-        self.style = Style()
-        self.cursor_lmb = QtSvg.QSvgWidget(self)
-        self.array_lmb = self.style.SVG_Cursor_LMB()
-        self.cursor_lmb.load(self.array_lmb)
+        self.cursor_lmb = Cursor_SVG(self, "LMB")
         self.cursor_half = self.cursor_size / 2
-        self.cursor_lmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_lmb.resize(0, 0)
-        self.unseen = self.style.Transparent()
-        self.cursor_lmb.setStyleSheet(self.unseen)
+        self.cursor_lmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_lmb.Resize(0, 0)
         # Images
         self.paths = [""*12]
         self.colors = [[0,0,0,0,0]*12]
@@ -5081,7 +5033,7 @@ class Panel_OBJ(QWidget):
         self.panel_width = width
         self.panel_height = height
         # Move Cursor
-        self.cursor_lmb.move(self.value_x-(self.cursor_size / 2), self.value_y-(self.cursor_size / 2))
+        self.cursor_lmb.Move(self.value_x-(self.cursor_size / 2), self.value_y-(self.cursor_size / 2))
     def Set_Path(self, path_bg_1, path_bg_2, path_bg_3, path_dif_1, path_dif_2, path_dif_3, path_dif_4, path_dif_5, path_dif_6, path_fg_1, path_fg_2, path_fg_3):
         self.paths = [
             path_bg_1,
@@ -5135,14 +5087,21 @@ class Panel_OBJ(QWidget):
         self.value_x = event.x()
         self.value_y = event.y()
         # Mouse Position
-        self.cursor_lmb.move(self.value_x-(self.cursor_size / 2), self.value_y-(self.cursor_size / 2))
-        self.cursor_lmb.resize(self.scale, self.scale)
+        self.cursor_lmb.Move(self.value_x-(self.cursor_size / 2), self.value_y-(self.cursor_size / 2))
+        self.cursor_lmb.Resize(self.scale, self.scale)
         # Emit values
         self.SIGNAL_OBJ_COLOR.emit([self.value_x, self.value_y])
         self.SIGNAL_OBJ_CURSOR.emit([self.value_x - (self.panel_width*0.5), self.value_y - (self.panel_height*0.5)])
 
     # Paint
+    @Profiled
     def paintEvent(self, event):
+        self.Panel_Paint(event)
+        # Cursors over the Panel
+        painter = QPainter(self)
+        self.cursor_lmb.Paint(painter)
+        painter.end()
+    def Panel_Paint(self, event):
         # Pre Compose pixmaps to display
         qpixmaps = []
         for i in range(0, len(self.paths)):
@@ -5184,14 +5143,15 @@ class Panel_IMG(QWidget):
     SIGNAL_IMG_RELEASE = QtCore.pyqtSignal(list)
     SIGNAL_SCAN_VAL = QtCore.pyqtSignal(int)
     SIGNAL_SCAN_MAX = QtCore.pyqtSignal(int)
+    SIGNAL_IMG_PALETTE = QtCore.pyqtSignal(list)
 
     # Init
     def __init__(self, parent):
         super(Panel_IMG, self).__init__(parent)
 
         # Start
-        self.Variables()
         self.Thread()
+        self.Variables()
         # Size Hint Expand
         self.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.MinimumExpanding)
         # Accept Drops
@@ -5209,15 +5169,10 @@ class Panel_IMG(QWidget):
         self.cursor_size = 20
         self.scale = 0
         # SVG Cursor
-        self.style = Style()
-        self.cursor_lmb = QtSvg.QSvgWidget(self)
-        self.array_lmb = self.style.SVG_Cursor_LMB()
-        self.cursor_lmb.load(self.array_lmb)
+        self.cursor_lmb = Cursor_SVG(self, "LMB")
         self.cursor_half = self.cursor_size / 2
-        self.cursor_lmb.setGeometry(QtCore.QRect(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size))
-        self.cursor_lmb.resize(0, 0)
-        self.unseen = self.style.Transparent()
-        self.cursor_lmb.setStyleSheet(self.unseen)
+        self.cursor_lmb.Geometry(-self.cursor_half, -self.cursor_half, self.cursor_size, self.cursor_size)
+        self.cursor_lmb.Resize(0, 0)
         # Display
         self.default = QImage()
         self.qimage = QImage()
@@ -5234,6 +5189,19 @@ class Panel_IMG(QWidget):
         self.analyze_values = []
         self.analyze_display = False
         self.analyze_text = ""
+        self.palette_number = 11
+        self.palette_height = 15
+        self.scan_pending = False
+        # Display Cache
+        self.mip_minimum = 64 # Smallest side of the last mip level
+        self.mip_levels = {}
+        self.display_limit = 8 # Cached display pixmaps
+        self.display_cache = {}
+        # Loading
+        self.load_size = 2048 # Longest side of the decoded working copy
+        self.load_pending = None
+        self.loading = False
+        self.qimage_full = None
     def Thread(self):
         self.thread = Thread_IMG()
         self.thread.SIGNAL_ANALYZE.connect(self.Thread_Analyze)
@@ -5241,13 +5209,17 @@ class Panel_IMG(QWidget):
         self.thread.SIGNAL_SCAN_VAL.connect(self.Thread_VAL)
         self.thread.SIGNAL_SCAN_MAX.connect(self.Thread_MAX)
         self.thread.SIGNAL_SCAN_TEXT.connect(self.Thread_TEXT)
+        self.thread.finished.connect(self.Scan_Next)
+        self.loader = Thread_Load()
+        self.loader.SIGNAL_LOAD.connect(self.Thread_Loaded)
+        self.loader.finished.connect(self.Load_Next)
 
     # Relay
     def Set_Cursor(self, grayscale, width, height):
         self.grayscale = grayscale
         if (self.panel_width != width or self.panel_height != height):
-            self.cursor_lmb.move(0, 0)
-            self.cursor_lmb.resize(0, 0)
+            self.cursor_lmb.Move(0, 0)
+            self.cursor_lmb.Resize(0, 0)
         self.panel_width = width
         self.panel_height = height
     def Set_Default(self, path):
@@ -5258,12 +5230,27 @@ class Panel_IMG(QWidget):
         self.default_h = self.default.height()
         self.update()
     def Set_QImage(self, path):
+        # Decode a display sized copy off the GUI thread
+        self.Load_Start(path)
+        self.Load(path, self.load_size)
+    def Load_Start(self, path):
+        # Placeholder shows until the Working Copy arrives
         self.Context_Frame()
-        self.qimage = QImage(path)
+        self.Thread_Cancel()
         self.path = path
-        self.qimage_w = int(self.qimage.width())
-        self.qimage_h = int(self.qimage.height())
+        self.qimage_full = None
+        self.loading = True
         self.update()
+    def Load(self, path, size, backup="", image=None):
+        self.load_pending = [path, size, backup, image]
+        if self.loader.isRunning() == False:
+            self.Load_Next()
+    def Load_Next(self):
+        if self.load_pending is not None:
+            path, size, backup, image = self.load_pending
+            self.load_pending = None
+            self.loader.Variables(path, size, backup, image)
+            self.loader.start()
     def Set_Save(self, save):
         self.save = save
 
@@ -5329,8 +5316,8 @@ class Panel_IMG(QWidget):
             self.Context_Reset()
 
         # Mouse Position
-        self.cursor_lmb.move(self.value_x-(self.cursor_size / 2), self.value_y-(self.cursor_size / 2))
-        self.cursor_lmb.resize(self.scale, self.scale)
+        self.cursor_lmb.Move(self.value_x-(self.cursor_size / 2), self.value_y-(self.cursor_size / 2))
+        self.cursor_lmb.Resize(self.scale, self.scale)
         self.update()
 
     # Drag and Drop Interaction
@@ -5355,23 +5342,22 @@ class Panel_IMG(QWidget):
     def dropEvent(self, event):
         if event.mimeData().hasImage:
             event.setDropAction(Qt.CopyAction)
-            self.path = event.mimeData().urls()[0].toLocalFile()
-            # MIME method gives size(zero,zero) when the source is the OS.
-            self.qimage = QImage(event.mimeData().imageData())
-            self.qimage_w = self.qimage.width()
-            self.qimage_h = self.qimage.height()
-            # Detect anormality of OS and reconstruct QImage with path
-            if (self.qimage_w == 0 or self.qimage_h == 0):
-                self.qimage = QImage(self.path)
-                self.qimage_w = self.qimage.width()
-                self.qimage_h = self.qimage.height()
-            # Case drag and drop from interbrowser do backup save to protected folder
-            self.qimage.save(self.save)
-            self.SIGNAL_IMG_STATE.emit("SAVE")
-            # Variables
+            urls = event.mimeData().urls()
+            path = ""
+            if len(urls) > 0:
+                path = urls[0].toLocalFile()
             self.drag_drop = "DROP"
             self.Context_Reset()
-            self.Context_Frame()
+            if (path != "" and QImageReader(path).canRead() == True):
+                # Files decode and back up to the protected folder off the GUI thread
+                self.Load_Start(path)
+                self.Load(path, self.load_size, self.save)
+            else:
+                # Case drag and drop from interbrowser only the decoded image is given
+                image = QImage(event.mimeData().imageData())
+                if image.isNull() == False:
+                    self.Load_Start(self.save)
+                    self.Load(self.save, self.load_size, self.save, image)
             event.accept()
         else:
             event.ignore()
@@ -5391,7 +5377,7 @@ class Panel_IMG(QWidget):
     # Context Menus
     def contextMenuEvent(self, event):
         if event.modifiers() == QtCore.Qt.NoModifier:
-            self.cursor_lmb.resize(0, 0)
+            self.cursor_lmb.Resize(0, 0)
             cmenu = QMenu(self)
             if self.display == True:
                 if self.frame == True:
@@ -5399,6 +5385,8 @@ class Panel_IMG(QWidget):
                 else:
                     cmenu_frame = cmenu.addAction("Frame")
                 cmenu_scan = cmenu.addAction("Scan")
+                if len(self.analyze_values) > 0:
+                    cmenu_palette = cmenu.addAction("Palette")
                 cmenu_clean = cmenu.addAction("Clean")
                 action = cmenu.exec_(self.mapToGlobal(event.pos()))
                 if self.frame == True:
@@ -5410,6 +5398,8 @@ class Panel_IMG(QWidget):
                         self.Context_Frame()
                 if action == cmenu_scan:
                     self.Context_Scan()
+                if (len(self.analyze_values) > 0 and action == cmenu_palette):
+                    self.SIGNAL_IMG_PALETTE.emit(self.analyze_values)
                 if action == cmenu_clean:
                     self.Context_Clean()
             else:
@@ -5436,21 +5426,36 @@ class Panel_IMG(QWidget):
         self.focus_x = 0.5
         self.focus_y = 0.5
     def Context_Scan(self):
-        height = self.qimage_h - 1
-        width = self.qimage_w - 1
-        self.thread.Variables(self.qimage)
-        self.thread.start()
+        # A running scan is interrupted and the new one starts once it has finished
+        self.Thread_Cancel()
+        self.scan_pending = True
+        if self.thread.isRunning() == False:
+            self.Scan_Next()
+    def Scan_Next(self):
+        if self.scan_pending == True:
+            self.scan_pending = False
+            self.thread.Variables(self.qimage, 0, self.palette_number)
+            self.thread.start()
     def Context_Clean(self):
+        self.Thread_Cancel()
         self.display = False
         self.frame = True
         self.qimage = self.default
         self.SIGNAL_IMG_STATE.emit("DEFAULT")
 
+    def Thread_Cancel(self):
+        # Stop a running scan and forget its palette
+        if self.thread.isRunning():
+            self.thread.requestInterruption()
+            self.analyze_display = False
+        self.analyze_values = []
+        self.scan_pending = False
     def Thread_Analyze(self, SIGNAL_ANALYZE):
         self.analyze_display = SIGNAL_ANALYZE
         self.update()
     def Thread_Colors(self, SIGNAL_COLORS):
         self.analyze_values = SIGNAL_COLORS
+        self.update()
     def Thread_VAL(self, SIGNAL_SCAN_VAL):
         self.SIGNAL_SCAN_VAL.emit(SIGNAL_SCAN_VAL)
     def Thread_MAX(self, SIGNAL_SCAN_MAX):
@@ -5458,9 +5463,82 @@ class Panel_IMG(QWidget):
     def Thread_TEXT(self, SIGNAL_SCAN_TEXT):
         self.analyze_text = SIGNAL_SCAN_TEXT
         self.update()
+    def Thread_Loaded(self, SIGNAL_LOAD):
+        path, size, qimage, width, height, backup = SIGNAL_LOAD
+        if path != self.path:
+            return
+        if size == 0: # Full Resolution for Zoom
+            self.qimage_full = qimage
+        elif self.loading == True: # Working Copy
+            self.loading = False
+            if qimage.isNull() == False:
+                self.qimage = qimage
+                self.qimage_w = width
+                self.qimage_h = height
+                if backup == True:
+                    self.SIGNAL_IMG_STATE.emit("SAVE")
+            else:
+                # Failed decode falls back to the placeholder
+                self.Context_Clean()
+        self.update()
+
+    # Display Cache
+    def Mip_Levels(self, image):
+        # Pyramid of the Source halved down to the minimum side
+        key = image.cacheKey()
+        levels = self.mip_levels.get(key)
+        if levels is None:
+            levels = [image]
+            while (levels[-1].width() >= self.mip_minimum * 2 and levels[-1].height() >= self.mip_minimum * 2):
+                last = levels[-1]
+                levels.append(last.scaled(last.width() // 2, last.height() // 2, Qt.IgnoreAspectRatio, Qt.SmoothTransformation))
+            if len(self.mip_levels) >= 2:
+                del self.mip_levels[next(iter(self.mip_levels))]
+            self.mip_levels[key] = levels
+        return levels
+    def Region_Pixmap(self, image, rect, zoom):
+        # Visible part of the full resolution Source at the zoom scale
+        key = (image.cacheKey(), rect.x(), rect.y(), rect.width(), rect.height(), zoom, self.grayscale)
+        pixmap = self.display_cache.get(key)
+        if pixmap is None:
+            source = image.copy(rect)
+            if self.grayscale == True:
+                source = source.convertToFormat(QImage.Format_Grayscale8)
+            pixmap = QPixmap.fromImage(source.scaled(max(1, int(rect.width() * zoom)), max(1, int(rect.height() * zoom)), Qt.IgnoreAspectRatio, Qt.SmoothTransformation))
+            if len(self.display_cache) >= self.display_limit:
+                del self.display_cache[next(iter(self.display_cache))]
+            self.display_cache[key] = pixmap
+        return pixmap
+    def Display_Pixmap(self, image, width, height):
+        # Smallest level still larger than the target, scaled once per size and color mode
+        width = max(1, int(width))
+        height = max(1, int(height))
+        levels = self.Mip_Levels(image)
+        level = 0
+        for i in range(0, len(levels)):
+            if (levels[i].width() >= width or levels[i].height() >= height):
+                level = i
+        key = (image.cacheKey(), level, width, height, self.grayscale)
+        pixmap = self.display_cache.get(key)
+        if pixmap is None:
+            source = levels[level]
+            if self.grayscale == True:
+                source = source.convertToFormat(QImage.Format_Grayscale8)
+            pixmap = QPixmap.fromImage(source.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            if len(self.display_cache) >= self.display_limit:
+                del self.display_cache[next(iter(self.display_cache))]
+            self.display_cache[key] = pixmap
+        return pixmap
 
     # Paint
+    @Profiled
     def paintEvent(self, event):
+        self.Panel_Paint(event)
+        # Cursors over the Panel
+        painter = QPainter(self)
+        self.cursor_lmb.Paint(painter)
+        painter.end()
+    def Panel_Paint(self, event):
         # Start Qpainter
         painter = QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
@@ -5473,16 +5551,8 @@ class Panel_IMG(QWidget):
             painter.setBrush(QBrush(QColor(0, 0, 0, 50)))
         painter.drawRect(0, 0, self.panel_width, self.panel_height)
 
-        # Image Colors or Greyscale
-        if self.grayscale == True:
-            qimage = self.qimage.convertToFormat(24)
-            default = self.default.convertToFormat(24)
-        else:
-            qimage = self.qimage
-            default = self.default
-
         # Render
-        if self.display == True:
+        if (self.display == True and self.loading == False):
             if self.frame == True: # Frame
                 try:
                     var_w = self.panel_width / self.qimage_w
@@ -5498,11 +5568,26 @@ class Panel_IMG(QWidget):
                 sh = self.qimage_h * size
                 ox = (self.panel_width * 0.5) - (sw * 0.5)
                 oy = (self.panel_height * 0.5) - (sh * 0.5)
-                painter.drawImage(ox, oy, qimage.scaled(self.panel_width, self.panel_height, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+                painter.drawPixmap(ox, oy, self.Display_Pixmap(self.qimage, self.panel_width, self.panel_height))
             else: # Adjust
                 ox = (self.panel_width * 0.5) - (self.qimage_w * self.focus_x * self.zoom)
                 oy = (self.panel_height * 0.5) - (self.qimage_h * self.focus_y * self.zoom)
-                painter.drawImage(ox, oy, qimage.scaled(self.qimage_w * self.zoom, self.qimage_h * self.zoom, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+                if (self.qimage_w * self.zoom <= self.qimage.width() or self.qimage.width() >= self.qimage_w): # Working Copy is enough
+                    painter.drawPixmap(ox, oy, self.Display_Pixmap(self.qimage, self.qimage_w * self.zoom, self.qimage_h * self.zoom))
+                else:
+                    if self.qimage_full is None:
+                        # Full Resolution loads once while the Working Copy stands in
+                        if self.load_pending is None and self.loader.isRunning() == False:
+                            self.Load(self.path, 0)
+                        painter.drawPixmap(ox, oy, self.Display_Pixmap(self.qimage, self.qimage_w * self.zoom, self.qimage_h * self.zoom))
+                    else:
+                        x0 = max(0, int(-ox / self.zoom))
+                        y0 = max(0, int(-oy / self.zoom))
+                        x1 = min(self.qimage_full.width(), int((self.panel_width - ox) / self.zoom) + 1)
+                        y1 = min(self.qimage_full.height(), int((self.panel_height - oy) / self.zoom) + 1)
+                        if (x1 > x0 and y1 > y0):
+                            rect = QRect(x0, y0, x1 - x0, y1 - y0)
+                            painter.drawPixmap(ox + x0 * self.zoom, oy + y0 * self.zoom, self.Region_Pixmap(self.qimage_full, rect, self.zoom))
         else: # Drop File Here
             try:
                 var_w = self.panel_width / self.default_w
@@ -5518,15 +5603,152 @@ class Panel_IMG(QWidget):
             sh = self.default_h * size
             ox = (self.panel_width * 0.5) - (sw * 0.5)
             oy = (self.panel_height * 0.5) - (sh * 0.5)
-            painter.drawImage(ox, oy, default.scaled(self.panel_width, self.panel_height, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        if self.analyze_display == True: # Text
+            painter.drawPixmap(ox, oy, self.Display_Pixmap(self.default, self.panel_width, self.panel_height))
+        if (self.display == True and len(self.analyze_values) > 0): # Palette
+            swatch = self.panel_width / len(self.analyze_values)
+            for i in range(0, len(self.analyze_values)):
+                color = self.analyze_values[i]
+                painter.setBrush(QBrush(QColor(color[0]*255, color[1]*255, color[2]*255)))
+                painter.drawRect(QRectF(i * swatch, self.panel_height - self.palette_height, swatch + 1, self.palette_height))
+        if (self.analyze_display == True or self.loading == True): # Text
             painter.setBrush(QBrush(QColor(0,0,0,100)))
             painter.drawRect(0, 0, self.panel_width, self.panel_height)
             painter.setPen(QColor("#d4d4d4"))
             font_type = 'Lucida'
             font_size = 10
             painter.setFont(QFont(font_type, font_size, QtGui.QFont.Bold))
-            painter.drawText(event.rect(), Qt.AlignHCenter|Qt.AlignVCenter, self.analyze_text)
+            if self.loading == True:
+                painter.drawText(event.rect(), Qt.AlignHCenter|Qt.AlignVCenter, "LOADING\nIMAGE")
+            else:
+                painter.drawText(event.rect(), Qt.AlignHCenter|Qt.AlignVCenter, self.analyze_text)
+class Thread_Load(QThread):
+    SIGNAL_LOAD = QtCore.pyqtSignal(list)
+
+    def __init__(self, parent = None):
+        QThread.__init__(self, parent)
+        self.path = ""
+        self.size = 0
+        self.backup = ""
+        self.image = None
+    def Variables(self, path, size, backup, image):
+        self.path = path
+        self.size = size # Longest side decoded, zero for full resolution
+        self.backup = backup # Copy of the dropped Source for the next session
+        self.image = image # Source already decoded by the drop
+    def run(self):
+        if self.image is None:
+            reader = QImageReader(self.path)
+            full = reader.size()
+            if (self.size > 0 and full.isValid() == True and max(full.width(), full.height()) > self.size):
+                reader.setScaledSize(full.scaled(self.size, self.size, Qt.KeepAspectRatio))
+            qimage = reader.read()
+            if full.isValid() == False:
+                full = qimage.size()
+            if (self.backup != "" and qimage.isNull() == False and self.backup != self.path):
+                QFile.remove(self.backup)
+                QFile.copy(self.path, self.backup)
+        else:
+            full = self.image.size()
+            qimage = self.image
+            if (self.size > 0 and max(full.width(), full.height()) > self.size):
+                qimage = self.image.scaled(self.size, self.size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            if self.backup != "":
+                self.image.save(self.backup)
+        self.image = None
+        self.SIGNAL_LOAD.emit([self.path, self.size, qimage, full.width(), full.height(), self.backup != ""])
+
+
+class Thread_Range(QThread):
+    SIGNAL_RANGE = QtCore.pyqtSignal(list)
+    SIGNAL_RANGE_VAL = QtCore.pyqtSignal(int)
+
+    def __init__(self, parent = None):
+        QThread.__init__(self, parent)
+        self.bands = []
+        self.depth = "U8"
+        self.target = [0, 0, 0]
+        self.fuzziness = 0.1
+        self.level = 255
+        self.geometry = [0, 0, 0, 0]
+    def Variables(self, bands, depth, red, green, blue, fuzziness, level, geometry):
+        self.bands = bands # Projection bytes of consecutive row bands
+        self.depth = depth
+        self.target = self.rgb_to_oklab(red, green, blue)
+        self.fuzziness = fuzziness # OKLab distance where the selection fades out
+        self.level = level
+        self.geometry = geometry
+
+    # Color
+    def srgb_to_linear(self, n):
+        if n <= 0.04045:
+            return n / 12.92
+        return ((n + 0.055) / 1.055) ** 2.4
+    def rgb_to_oklab(self, r, g, b):
+        r = self.srgb_to_linear(r)
+        g = self.srgb_to_linear(g)
+        b = self.srgb_to_linear(b)
+        l = (0.4122214708*r + 0.5363325363*g + 0.0514459929*b) ** (1/3)
+        m = (0.2119034982*r + 0.6806995451*g + 0.1073969566*b) ** (1/3)
+        s = (0.0883024619*r + 0.2817188376*g + 0.6299787005*b) ** (1/3)
+        return [
+            0.2104542553*l + 0.7936177850*m - 0.0040720468*s,
+            1.9779984951*l - 2.4285922050*m + 0.4505937099*s,
+            0.0259040371*l + 0.7827717662*m - 0.8086757660*s]
+    def Decode(self, key):
+        # Key of one pixel into RGBA from 0 to 1
+        if self.depth == "U8": # BGRA
+            return ((key >> 16) & 0xFF) / 255, ((key >> 8) & 0xFF) / 255, (key & 0xFF) / 255, (key >> 24) / 255
+        if self.depth == "U16": # BGRA
+            return ((key >> 32) & 0xFFFF) / 65535, ((key >> 16) & 0xFFFF) / 65535, (key & 0xFFFF) / 65535, (key >> 48) / 65535
+        if self.depth == "F16": # RGBA
+            return struct.unpack("<eeee", key.to_bytes(8, "little"))
+        return struct.unpack("<ffff", key) # F32 RGBA
+    def Keys(self, data):
+        # One hashable key per pixel, read at C speed where the pixel fits a machine word
+        if self.depth == "U8":
+            return memoryview(data).cast("I")
+        if (self.depth == "U16" or self.depth == "F16"):
+            return memoryview(data).cast("Q")
+        return [data[i:i+16] for i in range(0, len(data), 16)]
+    def Select(self, key):
+        # Smooth falloff of the OKLab distance weighted by the pixel alpha
+        r, g, b, a = self.Decode(key)
+        if a <= 0:
+            return 0
+        r = min(max(r, 0), 1)
+        g = min(max(g, 0), 1)
+        b = min(max(b, 0), 1)
+        lab = self.rgb_to_oklab(r, g, b)
+        delta = math.sqrt((lab[0]-self.target[0])**2 + (lab[1]-self.target[1])**2 + (lab[2]-self.target[2])**2)
+        t = delta / self.fuzziness
+        if t >= 1:
+            return 0
+        value = 1 - (t * t * (3 - 2 * t))
+        return round(min(a, 1) * value * self.level)
+
+    def run(self):
+        left, top, width, height = self.geometry
+        selection = bytearray(width * height)
+        table = {}
+        offset = 0
+        for i in range(0, len(self.bands)):
+            if self.isInterruptionRequested():
+                return
+            keys = self.Keys(self.bands[i])
+            # Distance only once per distinct pixel
+            for key in set(keys):
+                if key not in table:
+                    table[key] = self.Select(key)
+            count = len(keys)
+            selection[offset:offset + count] = bytes(map(table.__getitem__, keys))
+            offset += count
+            self.bands[i] = None
+            self.SIGNAL_RANGE_VAL.emit(int(100 * (i + 1) / len(self.bands)))
+        if self.isInterruptionRequested():
+            return
+        self.SIGNAL_RANGE.emit([bytes(selection), left, top, width, height])
+
+
 class Thread_IMG(QThread):
     SIGNAL_ANALYZE = QtCore.pyqtSignal(bool)
     SIGNAL_COLORS = QtCore.pyqtSignal(list)
@@ -5539,97 +5761,82 @@ class Thread_IMG(QThread):
         self.q_image = QImage()
         self.width = 1
         self.height = 1
-    def Variables(self, qimage):
+        self.steps = 100 # Progress updates per stage
+        self.size = 0 # Longest side analysed, zero for full resolution
+        self.number = 11 # Colors of the extracted palette
+    def Variables(self, qimage, size=0, number=11):
         self.qimage = qimage
-        self.qimage = qimage.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.width = self.qimage.width()
-        self.height = self.qimage.height()
-    def rgb_to_hue(self, r, g, b):
-        maxc = max(r, g, b)
-        minc = min(r, g, b)
-        if minc == maxc:
-            return "G"
-        rc = (maxc-r) / (maxc-minc)
-        gc = (maxc-g) / (maxc-minc)
-        bc = (maxc-b) / (maxc-minc)
-        if r == maxc:
-            h = bc-gc
-        elif g == maxc:
-            h = 2.0 + rc - bc
-        else:
-            h = 4.0 + gc - rc
-        h = int((( h / 6.0 ) % 1.0) * 360)
-        return h
-
+        self.size = size
+        self.number = number
+    def Pixels(self):
+        # Convert once and read the raw 32bit words (0xAARRGGBB) of the buffer
+        qimage = self.qimage
+        if (self.size > 0 and max(qimage.width(), qimage.height()) > self.size):
+            qimage = qimage.scaled(self.size, self.size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.argb = qimage.convertToFormat(QImage.Format_ARGB32)
+        self.width = self.argb.width()
+        self.height = self.argb.height()
+        self.stride = self.argb.bytesPerLine() // 4
+        bits = self.argb.constBits()
+        bits.setsize(self.argb.byteCount())
+        return memoryview(bits).cast("I")
     def run(self):
         # Time Watcher
         start = QtCore.QDateTime.currentDateTimeUtc()
 
+        sort = []
         try:
             self.SIGNAL_ANALYZE.emit(True)
             # Read Colors
+            words = self.Pixels()
             self.SIGNAL_SCAN_VAL.emit(0)
             self.SIGNAL_SCAN_MAX.emit(self.height)
             self.SIGNAL_SCAN_TEXT.emit("SCANNING\nIMAGE")
 
-            # List all Colors
-            cycle = 1
-            lista = []
-            for h in range(0, self.height-1, cycle):
+            # Count every ARGB word row by row
+            count = collections.Counter()
+            interval = max(1, self.height // self.steps)
+            for h in range(0, self.height):
                 # Progress bar
-                self.SIGNAL_SCAN_VAL.emit(h)
-                for w in range(0, self.width-1, cycle):
-                    # Pixel Information
-                    pixel = self.qimage.pixelColor(w, h)
-                    aaa = pixel.alpha()/255
-                    if aaa != 0:
-                        rrr = pixel.red()
-                        ggg = pixel.green()
-                        bbb = pixel.blue()
-                        hue = self.rgb_to_hue(rrr/255, ggg/255, bbb/255)
-                        rgb = [rrr, ggg, bbb]
-                        cor = [hue, aaa, rrr, ggg, bbb]
-                        lista.append(cor)
+                if h % interval == 0:
+                    if self.isInterruptionRequested():
+                        return
+                    self.SIGNAL_SCAN_VAL.emit(h)
+                row = h * self.stride
+                count.update(words[row:row + self.width])
             self.SIGNAL_SCAN_VAL.emit(self.height)
-
-            # Sort list
-            self.SIGNAL_SCAN_VAL.emit(0)
-            self.SIGNAL_SCAN_MAX.emit(len(lista))
+            words.release()
+
+            # Histogram of Colors by packed 24bit RGB key
+            histogram = {}
+            interval = max(1, len(count) // self.steps)
+            for index, (argb, number) in enumerate(count.items()):
+                if (index % interval == 0 and self.isInterruptionRequested()):
+                    return
+                aaa = argb >> 24
+                if aaa != 0:
+                    key = argb & 0xFFFFFF
+                    weight = number * aaa / 255
+                    cor = histogram.get(key)
+                    if cor is None:
+                        histogram[key] = [weight, key >> 16, (key >> 8) & 0xFF, key & 0xFF]
+                    else:
+                        cor[0] += weight
+
+            # Dominant Palette
             self.SIGNAL_SCAN_TEXT.emit("SORTING\nCOLORS")
-            sort = []
-            for l in range(0, len(lista)):
-                # Progress bar
-                self.SIGNAL_SCAN_VAL.emit(l)
-                add = True
-                lrgb = [lista[l][2], lista[l][3], lista[l][4]]
-                for s in range(0, len(sort)):
-                    srgb = [sort[s][2], sort[s][3], sort[s][4]]
-                    if lrgb == srgb:
-                        sort[s][1] += lista[l][1]
-                        add = False
-                        break
-                if add == True:
-                    sort.append(lista[l])
-            self.SIGNAL_SCAN_VAL.emit(len(lista))
-
-            # Display Colors
-            for i in range(0, len(sort)):
-                if sort[i][1] >= 10:
-                    QtCore.qDebug(str(i) + ": " + str(sort[i]) + "<------------------- ")
-                else:
-                    QtCore.qDebug(str(i) + ": " + str(sort[i]))
-            QtCore.qDebug(str(len(sort)))
+            sort = self.Median_Cut(list(histogram.values()), self.number)
 
         except:
             pass
 
+        if self.isInterruptionRequested():
+            return
         self.SIGNAL_COLORS.emit(sort)
         self.SIGNAL_ANALYZE.emit(False)
         self.SIGNAL_SCAN_VAL.emit(0)
         self.SIGNAL_SCAN_MAX.emit(1)
         self.SIGNAL_SCAN_TEXT.emit("FINISHED")
-        lista.clear()
-        sort.clear()
 
         # Time Watcher
         end = QtCore.QDateTime.currentDateTimeUtc()
@@ -5638,6 +5845,70 @@ class Thread_IMG(QThread):
         try:QtCore.qDebug("P " + str( time.toString('hh:mm:ss.zzz') ) )
         except:pass
 
+    # Palette
+    def Median_Cut(self, colors, number):
+        # Split the weighted histogram box with the widest channel until there are enough boxes
+        boxes = [self.Box(colors)]
+        target = 2
+        self.SIGNAL_SCAN_VAL.emit(0)
+        self.SIGNAL_SCAN_MAX.emit(number)
+        while len(boxes) < number:
+            if self.isInterruptionRequested():
+                break
+            index = max(range(len(boxes)), key=lambda i: boxes[i][0])
+            score, channel, box = boxes[index]
+            if score <= 0:
+                break
+            boxes.pop(index)
+            box.sort(key=lambda c: c[channel])
+            if self.isInterruptionRequested():
+                break
+            # Weighted Median
+            half = sum(c[0] for c in box) * 0.5
+            total = 0
+            cut = 1
+            for i in range(0, len(box)):
+                total += box[i][0]
+                if total >= half:
+                    cut = min(max(i + 1, 1), len(box) - 1)
+                    break
+            boxes.append(self.Box(box[:cut]))
+            boxes.append(self.Box(box[cut:]))
+            self.SIGNAL_SCAN_VAL.emit(len(boxes))
+            # Stream the refined Palette
+            if len(boxes) >= target:
+                target *= 2
+                if len(boxes) < number:
+                    self.SIGNAL_COLORS.emit(self.Palette(boxes))
+        return self.Palette(boxes)
+    def Box(self, colors):
+        # Score is the widest RGB range times the box weight
+        weight = 0
+        score = 0
+        channel = 1
+        if len(colors) > 1:
+            for c in (1, 2, 3):
+                values = [color[c] for color in colors]
+                extent = max(values) - min(values)
+                if extent > score:
+                    score = extent
+                    channel = c
+            weight = sum(color[0] for color in colors)
+        return [score * weight, channel, colors]
+    def Palette(self, boxes):
+        # Weighted mean of every box, heaviest first, RGB from 0 to 1
+        palette = []
+        for score, channel, colors in boxes:
+            weight = sum(color[0] for color in colors)
+            if weight <= 0:
+                continue
+            rrr = sum(color[0] * color[1] for color in colors) / weight
+            ggg = sum(color[0] * color[2] for color in colors) / weight
+            bbb = sum(color[0] * color[3] for color in colors) / weight
+            palette.append([weight, rrr / 255, ggg / 255, bbb / 255])
+        palette.sort(key=lambda c: c[0], reverse=True)
+        return [c[1:] for c in palette]
+
 
 class Channel_Linear(QWidget):
     SIGNAL_VALUE = QtCore.pyqtSignal(float)
@@ -6036,6 +6307,84 @@ class Channel_Interval(QWidget):
         # painter.drawPolygon(polygon)
 
 
+class History_Model(QtCore.QAbstractListModel):
+
+    # Init
+    def __init__(self, capacity, parent = None):
+        super(History_Model, self).__init__(parent)
+        # Ring buffer of 0xRRGGBB colors, row 0 is the newest
+        self.capacity = capacity
+        self.ring = [0] * capacity
+        self.head = 0
+        self.count = 0
+    def rowCount(self, parent = QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.count
+    def data(self, index, role = QtCore.Qt.DisplayRole):
+        if (index.isValid() == False or index.row() >= self.count):
+            return None
+        rgb = self.Color(index.row())
+        # The view paints a QColor decoration as a swatch of the icon size
+        if role == QtCore.Qt.DecorationRole:
+            return QColor(rgb)
+        if role == QtCore.Qt.BackgroundRole:
+            return QBrush(QColor(rgb))
+        if role == QtCore.Qt.ToolTipRole:
+            return "#%06x" % rgb
+        return None
+
+    # Ring
+    def Color(self, row):
+        return self.ring[(self.head - 1 - row) % self.capacity]
+    def Colors(self):
+        return [self.Color(row) for row in range(0, self.count)]
+    def Push(self, rgb):
+        # Consecutive repeats are not kept
+        if (self.count > 0 and self.Color(0) == rgb):
+            return False
+        if self.count == self.capacity:
+            self.beginRemoveRows(QtCore.QModelIndex(), self.count - 1, self.count - 1)
+            self.count -= 1
+            self.endRemoveRows()
+        self.beginInsertRows(QtCore.QModelIndex(), 0, 0)
+        self.ring[self.head] = rgb
+        self.head = (self.head + 1) % self.capacity
+        self.count += 1
+        self.endInsertRows()
+        return True
+    def Clear(self):
+        self.beginResetModel()
+        self.head = 0
+        self.count = 0
+        self.endResetModel()
+
+    # Storage
+    def Save(self):
+        # Six hex digits per color, newest first
+        return "".join(["%06x" % rgb for rgb in self.Colors()])
+    def Load(self, text):
+        # Stored colors go behind the ones picked before loading
+        stored = []
+        for i in range(0, len(text) - 5, 6):
+            try:
+                stored.append(int(text[i:i+6], 16))
+            except ValueError:
+                break
+        colors = self.Colors()
+        for rgb in stored:
+            if (len(colors) > 0 and colors[-1] == rgb):
+                continue
+            colors.append(rgb)
+        colors = colors[:self.capacity]
+        self.beginResetModel()
+        self.count = len(colors)
+        self.head = self.count % self.capacity
+        for row in range(0, self.count):
+            self.ring[self.count - 1 - row] = colors[row]
+        self.endResetModel()
+
+
 class Clicks(QWidget):
     SIGNAL_APPLY = QtCore.pyqtSignal(int)
     SIGNAL_SAVE = QtCore.pyqtSignal(int)
@@ -6271,6 +6620,89 @@ class Dialog_CR(QDialog):
         uic.loadUi(self.dir_name + '/pigment_o_copyright.ui', self)
 
 
+class Cursor_Cache():
+    # Parsed cursor SVGs and their prerendered pixmaps shared by every panel
+    limit = 64
+
+    def __init__(self):
+        self.style = None
+        self.renderers = collections.OrderedDict()
+        self.pixmaps = collections.OrderedDict()
+    def Renderer(self, shape, color):
+        key = (shape, color)
+        renderer = self.renderers.get(key)
+        if renderer is None:
+            if self.style is None:
+                self.style = Style()
+            if shape == "LMB":
+                svg = self.style.SVG_Cursor_LMB()
+            if shape == "RMB":
+                svg = self.style.SVG_Cursor_RMB(color)
+            renderer = self.renderers[key] = QtSvg.QSvgRenderer(QtCore.QByteArray(svg))
+            self.Evict(self.renderers)
+        return renderer
+    def Pixmap(self, shape, color, width, height, ratio):
+        key = (shape, color, width, height, ratio)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(max(1, round(width * ratio)), max(1, round(height * ratio)))
+            pixmap.fill(QtCore.Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+            self.Renderer(shape, color).render(painter)
+            painter.end()
+            pixmap.setDevicePixelRatio(ratio)
+            self.pixmaps[key] = pixmap
+            self.Evict(self.pixmaps)
+        return pixmap
+    def Evict(self, cache):
+        while len(cache) > self.limit:
+            cache.popitem(last=False)
+
+cursor_cache = Cursor_Cache()
+
+class Cursor_SVG():
+    # Cursor of a panel, drawn by the panel from the shared cursor cache
+    def __init__(self, parent, shape):
+        self.parent = parent
+        self.shape = shape
+        self.color = None
+        self.x = 0
+        self.y = 0
+        self.w = 0
+        self.h = 0
+
+    # Geometry
+    def Move(self, x, y):
+        self.Geometry(x, y, self.w, self.h)
+    def Resize(self, width, height):
+        self.Geometry(self.x, self.y, width, height)
+    def Geometry(self, x, y, width, height):
+        geometry = (int(x), int(y), int(width), int(height))
+        if geometry != (self.x, self.y, self.w, self.h):
+            self.Repaint()
+            self.x, self.y, self.w, self.h = geometry
+            self.Repaint()
+    def Width(self):
+        return self.w
+    def Height(self):
+        return self.h
+    def Color(self, color):
+        if color != self.color:
+            self.color = color
+            self.Repaint()
+
+    # Paint
+    def Repaint(self):
+        # Only the area under the cursor is repainted
+        if (self.w > 0 and self.h > 0):
+            self.parent.update(self.x, self.y, self.w, self.h)
+    def Paint(self, painter):
+        if (self.w > 0 and self.h > 0):
+            pixmap = cursor_cache.Pixmap(self.shape, self.color, self.w, self.h, self.parent.devicePixelRatioF())
+            painter.drawPixmap(self.x, self.y, pixmap)
+
+
 class Style(QWidget):
     def SVG_Cursor_LMB(self):
         string_cursor_lmb = str(
@@ -0,0 +1,100 @@
+# Pigment.O is a Krita plugin and it is a Color Picker and Color Mixer.
+# Copyright (C) 2020  Ricardo Jeremias.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+#\\ Imports ####################################################################
+import collections
+import cProfile
+import functools
+import time
+
+#//
+#\\ Global Variables ###########################################################
+profiler_samples = 512 # Timings kept per profiled function
+
+#//
+
+class Profiler():
+
+    #\\ Init ###################################################################
+    def __init__(self):
+        self.active = False
+        self.tier = ""
+        self.timings = {}
+        self.session = None
+
+    #//
+    #\\ Timers #################################################################
+    def Record(self, name, start, end):
+        # Timings are kept apart per render quality tier
+        key = (name, self.tier)
+        timing = self.timings.get(key)
+        if timing is None:
+            timing = self.timings[key] = collections.deque(maxlen=profiler_samples)
+        timing.append((end, end - start))
+    def Set_Tier(self, tier):
+        self.tier = tier
+    def Set_Active(self, active):
+        if active == True:
+            self.timings.clear()
+        self.active = active
+    def Statistics(self):
+        # Calls per second over the kept samples, mean, p95 and max in milliseconds
+        now = time.perf_counter()
+        lines = ["{:<30}{:<7}{:>8}{:>9}{:>9}{:>9}".format("FUNCTION", "TIER", "CALL/S", "MEAN", "P95", "MAX")]
+        for name, tier in sorted(self.timings.keys()):
+            timing = self.timings[(name, tier)]
+            count = len(timing)
+            if count == 0:
+                continue
+            durations = sorted([duration for end, duration in timing])
+            rate = count / max(now - timing[0][0], 0.001)
+            mean = sum(durations) / count
+            p95 = durations[min(count - 1, int(0.95 * count))]
+            lines.append("{:<30}{:<7}{:>8.1f}{:>9.3f}{:>9.3f}{:>9.3f}".format(name[:29], tier[:6], rate, mean * 1000, p95 * 1000, durations[-1] * 1000))
+        return "\n".join(lines)
+
+    #//
+    #\\ Session ################################################################
+    def Session_Start(self):
+        self.session = cProfile.Profile()
+        self.session.enable()
+    def Session_Stop(self, path):
+        # Writes the recorded session in the pstats format
+        if self.session is None:
+            return
+        self.session.disable()
+        if path != "":
+            self.session.dump_stats(path)
+        self.session = None
+
+    #//
+
+profiler = Profiler()
+
+def Profiled(function):
+    # Times the function only while the profiler is active
+    name = function.__qualname__
+    @functools.wraps(function)
+    def Wrapper(*args, **kwargs):
+        if profiler.active == False:
+            return function(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            profiler.Record(name, start, time.perf_counter())
+    return Wrapper
@@ -0,0 +1,145 @@
+"""
+Startup phase timing shared by the bundled plugins.
+
+Every plugin calls `mark(plugin)` before its first init step and
+`mark(plugin, phase)` after each step, which records the time and peak
+memory growth since the previous mark of that plugin. A few seconds after
+the last mark, the phases of the running Krita are written as one record
+to `startup_timing.json` in the Krita resource folder, keeping the last
+`KEEP` startups.
+
+Running this file with python prints a summary of that log, comparing the
+last startup against the average of the previous ones.
+"""
+
+import json
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+LOG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "startup_timing.json")
+KEEP = 20
+WRITE_DELAY = 5000
+
+_started = time.strftime("%Y-%m-%d %H:%M:%S")
+_records = []
+_last = {}
+_timer = None
+
+
+def _memory():
+    """Return the peak resident memory of Krita in KiB, if available."""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return usage // 1024
+    return usage
+
+
+def mark(plugin, phase=None):
+    """End the `phase` of `plugin` started at its previous mark."""
+    now = time.perf_counter()
+    memory = _memory()
+    if phase is not None and plugin in _last:
+        start, start_memory = _last[plugin]
+        _records.append({
+            "plugin": plugin,
+            "phase": phase,
+            "ms": round((now - start) * 1000, 3),
+            "memory_kib": None if memory is None else memory - start_memory,
+        })
+        _schedule()
+    _last[plugin] = (time.perf_counter(), memory)
+
+
+def _schedule():
+    """Write the log once the marks stop coming in."""
+    global _timer
+    try:
+        from PyQt5.QtCore import QTimer
+    except ImportError:
+        return
+    if _timer is None:
+        _timer = QTimer()
+        _timer.setSingleShot(True)
+        _timer.setInterval(WRITE_DELAY)
+        _timer.timeout.connect(write)
+    _timer.start()
+
+
+def load():
+    """Return the startups stored in the log, oldest first."""
+    try:
+        with open(LOG_PATH, "r", encoding="utf-8") as file:
+            log = json.load(file)
+    except (OSError, ValueError):
+        return []
+    if not isinstance(log, list):
+        return []
+    return log
+
+
+def write():
+    """Append the pending phases to the record of this startup."""
+    if not _records:
+        return
+    log = load()
+    if log and log[-1].get("started") == _started:
+        log[-1]["phases"].extend(_records)
+    else:
+        log.append({"started": _started, "phases": list(_records)})
+    del log[:-KEEP]
+    try:
+        with open(LOG_PATH, "w", encoding="utf-8") as file:
+            json.dump(log, file, indent=1)
+    except OSError:
+        return
+    _records.clear()
+
+
+def summary(log):
+    """Return a text table of the last startup against the previous ones."""
+    if not log:
+        return "No startup recorded in " + LOG_PATH
+    last = log[-1]
+    average = {}
+    for startup in log[:-1]:
+        for record in startup.get("phases", []):
+            key = (record["plugin"], record["phase"])
+            average.setdefault(key, []).append(record["ms"])
+
+    lines = [f"Startup {last['started']} ({len(log) - 1} previous)", ""]
+    lines.append(f"{'plugin':<16}{'phase':<24}{'ms':>10}{'avg ms':>10}"
+                 f"{'delta':>10}{'mem KiB':>10}")
+    totals = {}
+    phases = sorted(last.get("phases", []), key=lambda r: -r["ms"])
+    for record in phases:
+        key = (record["plugin"], record["phase"])
+        totals[record["plugin"]] = totals.get(record["plugin"], 0) + record["ms"]
+        if key in average:
+            mean = sum(average[key]) / len(average[key])
+            mean_text = f"{mean:.1f}"
+            delta_text = f"{record['ms'] - mean:+.1f}"
+        else:
+            mean_text = delta_text = "-"
+        memory = record.get("memory_kib")
+        lines.append(
+            f"{record['plugin']:<16}{record['phase']:<24}{record['ms']:>10.1f}"
+            f"{mean_text:>10}{delta_text:>10}"
+            f"{'-' if memory is None else memory:>10}")
+    lines.append("")
+    for plugin, total in sorted(totals.items(), key=lambda t: -t[1]):
+        lines.append(f"{plugin:<16}{'total':<24}{total:>10.1f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(summary(load()))
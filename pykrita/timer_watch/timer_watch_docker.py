@@ -29,6 +29,11 @@ from PyQt5 import QtWidgets, QtCore, QtGui, uic
 from PyQt5.QtCore import QUrl
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
 # Timer Watch Modules
+try:
+    from startup_timer import mark as Startup_Mark
+except ImportError:
+    def Startup_Mark(plugin, phase = None):
+        pass
 
 #endregion
 #region Global Variables ###########################################################
@@ -54,13 +59,21 @@ class TimerWatch_Docker(DockWidget):
         super(TimerWatch_Docker, self).__init__()
 
         # Construct
+        Startup_Mark("timer_watch")
         self.Variables()
+        Startup_Mark("timer_watch", "Variables")
         self.User_Interface()
+        Startup_Mark("timer_watch", "User_Interface")
         self.Connections()
+        Startup_Mark("timer_watch", "Connections")
         self.Modules()
+        Startup_Mark("timer_watch", "Modules")
         self.Style()
+        Startup_Mark("timer_watch", "Style")
         self.Timer()
+        Startup_Mark("timer_watch", "Timer")
         self.Settings()
+        Startup_Mark("timer_watch", "Settings")
 
     def Variables(self):
         # UI
@@ -11,6 +11,12 @@ from actions import create_actions
 from composer_utils import SettingsDialog
 from input_adapter import ActionManager
 
+try:
+    from startup_timer import mark as startup_mark
+except ImportError:
+    def startup_mark(plugin: str, phase: str = None) -> None:
+        """Startup timing is skipped without the shared module."""
+
 
 @dataclass
 class GarbageProtector:
@@ -51,14 +57,17 @@ class ShortcutComposer(Extension):
 
     def createActions(self, window) -> None:
         """Create window components. Called by krita for each new window."""
+        startup_mark("yuuki_helper")
         self._protectors.append(GarbageProtector(
             transform_modes=TransformModeActions(window),
             settings_dialog=(settings := SettingsDialog()),
             settings_action=self._create_settings_action(window, settings),
             action_manager=ActionManager(window),
             reload_action=self._create_reload_action(window)))
+        startup_mark("yuuki_helper", "createActions")
 
         self._reload_composer()
+        startup_mark("yuuki_helper", "reload_composer")
 
     def _create_reload_action(self, window) -> QWidgetAction:
         """Create krita action which reloads all core actions."""